@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+NFL Schedule Generation Benchmark
+
+Generates N consecutive seasons with NFLScheduleGenerator on a temporary
+database, validates every schedule and reports generation time and solver
+search effort.
+
+Usage:
+    python demos/benchmarking/benchmark_schedule_generation.py                 # Default 100 seasons
+    python demos/benchmarking/benchmark_schedule_generation.py --seasons 10    # Quick run
+    python demos/benchmarking/benchmark_schedule_generation.py --start-season 2030 --dynasty-id demo
+
+Each season is checked for 272 games, one bye per team inside the bye
+window, and exactly one game per team in every other week.
+"""
+
+import sys
+import os
+import argparse
+import contextlib
+import io
+import statistics
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add project paths
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+sys.path.insert(0, str(_PROJECT_ROOT / 'src'))
+
+from src.game_cycle.database.bye_week_api import ByeWeekAPI
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.services.nfl_schedule_generator import NFLScheduleGenerator
+
+
+def create_database(path: str, dynasty_id: str):
+    """Schema, 32 teams and the benchmark dynasty."""
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO teams (team_id, name, abbreviation, conference, division) VALUES (?, ?, ?, ?, 'East')",
+        [(t, f"Team {t}", f"T{t}", "AFC" if t <= 16 else "NFC") for t in range(1, 33)]
+    )
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Benchmark', 1)",
+        (dynasty_id,)
+    )
+    conn.commit()
+    db.close()
+
+
+def validate_season(events, byes):
+    """List of problems with one generated season (empty when valid)."""
+    problems = []
+    if len(events) != 272:
+        problems.append(f"{len(events)} games instead of 272")
+    if len(byes) != 32:
+        problems.append(f"{len(byes)} bye weeks instead of 32")
+
+    slots = Counter()
+    for event in events:
+        params = event["data"]["parameters"]
+        for team_id in (params["home_team_id"], params["away_team_id"]):
+            slots[(team_id, params["week"])] += 1
+    for team_id in range(1, 33):
+        bye = byes.get(team_id)
+        if bye is None or not (NFLScheduleGenerator.BYE_WEEK_START <= bye <= NFLScheduleGenerator.BYE_WEEK_END):
+            problems.append(f"team {team_id} bye week {bye}")
+        for week in range(1, NFLScheduleGenerator.TOTAL_WEEKS + 1):
+            expected = 0 if week == bye else 1
+            if slots[(team_id, week)] != expected:
+                problems.append(f"team {team_id} plays {slots[(team_id, week)]} games in week {week}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='NFL Schedule Generation Benchmark',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        '--seasons', '-n',
+        type=int,
+        default=100,
+        help='Number of consecutive seasons to generate (default: 100)'
+    )
+    parser.add_argument(
+        '--start-season',
+        type=int,
+        default=2025,
+        help='First season to generate (default: 2025)'
+    )
+    parser.add_argument(
+        '--dynasty-id',
+        type=str,
+        default='schedule_benchmark',
+        help='Dynasty ID (seeds the solver; default: schedule_benchmark)'
+    )
+    args = parser.parse_args()
+
+    fd, db_path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    create_database(db_path, args.dynasty_id)
+
+    print("=" * 80)
+    print(f"Generating {args.seasons} seasons from {args.start_season}")
+    print("=" * 80)
+
+    generator = NFLScheduleGenerator(db_path=db_path, dynasty_id=args.dynasty_id)
+    bye_api = ByeWeekAPI(GameCycleDatabase(db_path))
+    times = []
+    nodes = []
+    failures = 0
+
+    try:
+        for season in range(args.start_season, args.start_season + args.seasons):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                events = generator.generate_schedule(season)
+            times.append(time.perf_counter() - start)
+            nodes.append(generator._solver.nodes)
+
+            problems = validate_season(events, bye_api.get_all_bye_weeks(args.dynasty_id, season))
+            if problems:
+                failures += 1
+                print(f"Season {season}: INVALID ({len(problems)} problems, first: {problems[0]})")
+    finally:
+        generator.close()
+        try:
+            os.unlink(db_path)
+        except OSError:
+            pass
+
+    print(f"Seasons:       {len(times)}")
+    print(f"Total time:    {sum(times):.2f}s")
+    print(f"Mean / season: {statistics.mean(times) * 1000:.1f}ms")
+    print(f"Worst season:  {max(times) * 1000:.1f}ms")
+    print(f"Solver nodes:  mean {statistics.mean(nodes):.0f}, max {max(nodes)}")
+    print("=" * 80)
+    print("All seasons valid" if not failures else f"{failures} INVALID seasons")
+    print("=" * 80)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
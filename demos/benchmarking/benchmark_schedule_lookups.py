@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Schedule Lookup Benchmark
+
+Stores growing numbers of seasons of GAME events in a temporary database
+and times a week's schedule lookup through UnifiedDatabaseAPI
+(events_get_games_by_week, indexed schedule columns) against the previous
+json_extract scan of the dynasty's events.
+
+Usage:
+    python demos/benchmarking/benchmark_schedule_lookups.py                # Up to 40 seasons
+    python demos/benchmarking/benchmark_schedule_lookups.py --seasons 100
+    python demos/benchmarking/benchmark_schedule_lookups.py --repeats 20
+
+Each season has 18 weeks of 16 games; the lookup always reads the first
+season, so any growth in lookup time comes from the other seasons stored.
+"""
+
+import sys
+import os
+import argparse
+import json
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+# Add project paths
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+sys.path.insert(0, str(_PROJECT_ROOT / 'src'))
+
+from src.database.unified_api import UnifiedDatabaseAPI
+from src.game_cycle.database.connection import GameCycleDatabase
+
+START_SEASON = 2025
+WEEKS = 18
+GAMES_PER_WEEK = 16
+
+# Week lookup before the schedule columns were added
+JSON_SCAN_QUERY = """
+    SELECT event_id, game_id, data FROM events
+    WHERE dynasty_id = ? AND event_type = 'GAME'
+    AND CAST(json_extract(data, '$.parameters.season') AS INTEGER) = ?
+    AND CAST(json_extract(data, '$.parameters.week') AS INTEGER) = ?
+    AND json_extract(data, '$.parameters.season_type') = ?
+    ORDER BY json_extract(data, '$.parameters.game_date')
+"""
+
+
+def insert_season(conn: sqlite3.Connection, dynasty_id: str, season: int):
+    """One regular season of GAME events."""
+    rows = []
+    for week in range(1, WEEKS + 1):
+        for game in range(GAMES_PER_WEEK):
+            game_id = f"game_{season}_{week}_{game}"
+            data = {
+                "parameters": {
+                    "season": season, "week": week, "season_type": "regular_season",
+                    "home_team_id": game * 2 + 1, "away_team_id": game * 2 + 2,
+                    "game_date": f"{season}-09-{game + 1:02d}",
+                },
+                "results": None,
+                "metadata": {},
+            }
+            rows.append((f"event_{game_id}", "GAME", season * 1000 + week, game_id, dynasty_id, json.dumps(data)))
+    conn.executemany(
+        "INSERT INTO events (event_id, event_type, timestamp, game_id, dynasty_id, data) VALUES (?, ?, ?, ?, ?, ?)",
+        rows
+    )
+    conn.commit()
+
+
+def time_lookups(lookup, repeats: int) -> float:
+    """Mean milliseconds per week lookup (best of three rounds)."""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for week in range(1, WEEKS + 1):
+                lookup(week)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / (repeats * WEEKS) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Schedule Lookup Benchmark',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        '--seasons', '-n',
+        type=int,
+        default=40,
+        help='Largest number of stored seasons (default: 40)'
+    )
+    parser.add_argument(
+        '--repeats',
+        type=int,
+        default=5,
+        help='Lookups of every week per timing round (default: 5)'
+    )
+    args = parser.parse_args()
+
+    dynasty_id = 'schedule_lookup_benchmark'
+    fd, db_path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    checkpoints = sorted({s for s in (1, 5, 10, 20) if s < args.seasons} | {args.seasons})
+
+    print("=" * 80)
+    print(f"Week lookups with 1..{args.seasons} seasons stored ({WEEKS * GAMES_PER_WEEK} games per season)")
+    print("=" * 80)
+    print(f"{'Seasons':>8} {'Events':>8} {'Indexed (ms)':>14} {'json_extract (ms)':>18}")
+
+    try:
+        GameCycleDatabase(db_path).close()
+        api = UnifiedDatabaseAPI(db_path, dynasty_id)
+        conn = sqlite3.connect(db_path)
+
+        def scan(week):
+            return conn.execute(JSON_SCAN_QUERY, (dynasty_id, START_SEASON, week, 'regular_season')).fetchall()
+
+        stored = 0
+        for target in checkpoints:
+            while stored < target:
+                insert_season(conn, dynasty_id, START_SEASON + stored)
+                stored += 1
+
+            indexed_ms = time_lookups(lambda week: api.events_get_games_by_week(START_SEASON, week), args.repeats)
+            scan_ms = time_lookups(scan, args.repeats)
+            events = stored * WEEKS * GAMES_PER_WEEK
+            print(f"{stored:>8} {events:>8} {indexed_ms:>14.3f} {scan_ms:>18.3f}")
+
+        conn.close()
+    finally:
+        try:
+            os.unlink(db_path)
+        except OSError:
+            pass
+
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
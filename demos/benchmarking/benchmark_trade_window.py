@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Trade Window Benchmark
+
+Initializes a full dynasty in a temporary database and times
+TransactionAIManager.evaluate_daily_transactions() over several days of a
+trade window, first with the per-team roster scan (two contract queries per
+player in the league, for every evaluating team) and then with the league
+asset index built once by begin_trade_window().
+
+Usage:
+    python demos/benchmarking/benchmark_trade_window.py                 # 4 teams x 2 days
+    python demos/benchmarking/benchmark_trade_window.py --teams 32 --days 1
+    python demos/benchmarking/benchmark_trade_window.py --db data/database/game_cycle/game_cycle.db --dynasty my_dynasty
+
+Every team is forced to evaluate each day (evaluation probability raised),
+so the timings measure proposal generation rather than the daily dice roll.
+"""
+
+import sys
+import os
+import argparse
+import contextlib
+import io
+import random
+import tempfile
+import time
+from pathlib import Path
+
+# Add project paths
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+sys.path.insert(0, str(_PROJECT_ROOT / 'src'))
+
+from src.calendar.season_phase_tracker import SeasonPhase
+from transactions.transaction_ai_manager import TransactionAIManager
+
+SEASON = 2025
+TEAM_RECORD = {"wins": 2, "losses": 1, "ties": 0}
+
+
+def create_dynasty(db_path: str, dynasty_id: str):
+    """Full league (rosters, contracts) for one new dynasty."""
+    from game_cycle.services.initialization_service import GameCycleInitializer
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        GameCycleInitializer(db_path, dynasty_id, SEASON).initialize_dynasty(1)
+
+
+def run_window(db_path: str, dynasty_id: str, team_ids, days: int, use_index: bool):
+    """Evaluate every team on every day; returns (index build s, evaluation s, proposals)."""
+    random.seed(7)
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = TransactionAIManager(
+            db_path,
+            dynasty_id,
+            base_evaluation_probability=10.0,  # Always evaluate
+            debug_mode=True
+        )
+
+    build_time = 0.0
+    eval_time = 0.0
+    proposals = 0
+    for day in range(days):
+        current_date = f"{SEASON}-09-{10 + day:02d}"
+
+        start = time.perf_counter()
+        if use_index:
+            manager.begin_trade_window(SEASON)
+        build_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for team_id in team_ids:
+                day_proposals, _ = manager.evaluate_daily_transactions(
+                    team_id=team_id,
+                    current_date=current_date,
+                    season_phase=SeasonPhase.REGULAR_SEASON,
+                    team_record=TEAM_RECORD,
+                    current_week=2
+                )
+                proposals += len(day_proposals)
+        eval_time += time.perf_counter() - start
+
+    return build_time, eval_time, proposals
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Trade Window Benchmark',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        '--teams', '-t',
+        type=int,
+        default=4,
+        help='Teams evaluated per day (default: 4)'
+    )
+    parser.add_argument(
+        '--days', '-d',
+        type=int,
+        default=2,
+        help='Days in the trade window (default: 2)'
+    )
+    parser.add_argument(
+        '--db',
+        help='Existing database to use (default: new temporary dynasty)'
+    )
+    parser.add_argument(
+        '--dynasty',
+        default='trade_window_benchmark',
+        help='Dynasty ID (default: trade_window_benchmark)'
+    )
+    args = parser.parse_args()
+
+    team_ids = list(range(1, min(args.teams, 32) + 1))
+    db_path = args.db
+    temp_db = None
+    if db_path is None:
+        fd, temp_db = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        db_path = temp_db
+
+    print("=" * 80)
+    print(f"Trade window: {len(team_ids)} teams x {args.days} days")
+    print("=" * 80)
+
+    try:
+        if temp_db:
+            start = time.perf_counter()
+            create_dynasty(db_path, args.dynasty)
+            print(f"Dynasty initialized in {time.perf_counter() - start:.2f}s")
+
+        print(f"{'Mode':<14} {'Index build (s)':>16} {'Evaluation (s)':>16} {'Per team (ms)':>15} {'Proposals':>10}")
+        for label, use_index in (("roster scan", False), ("asset index", True)):
+            build_s, eval_s, proposals = run_window(db_path, args.dynasty, team_ids, args.days, use_index)
+            per_team_ms = eval_s / (len(team_ids) * args.days) * 1000
+            print(f"{label:<14} {build_s:>16.3f} {eval_s:>16.3f} {per_team_ms:>15.1f} {proposals:>10}")
+    finally:
+        if temp_db:
+            try:
+                os.unlink(temp_db)
+            except OSError:
+                pass
+
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -212,9 +212,14 @@ class GameCycleDynastyController:
                 row = cursor.fetchone()
                 stats['total_games'] = row[0] if row else 0
 
-                # Get current season from dynasty_state or events
+                # Get current season from dynasty_state or events. This runs
+                # before any GameCycleDatabase is opened, so add the schedule
+                # columns (Migration 14) to databases created before them.
+                from database.unified_api import ensure_schedule_columns
+                if ensure_schedule_columns(conn):
+                    conn.commit()
                 cursor.execute("""
-                    SELECT MAX(json_extract(data, '$.parameters.season')) as season
+                    SELECT MAX(game_season) as season
                     FROM events
                     WHERE dynasty_id = ? AND event_type = 'GAME'
                 """, (dynasty_id,))
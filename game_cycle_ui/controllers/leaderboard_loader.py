@@ -0,0 +1,135 @@
+"""
+Leaderboard Loader - Runs stats view queries off the Qt main thread.
+
+StatsView asks for the visible tab first and for its neighbours as
+prefetch; each finished query is emitted through `loaded` (queued to the
+main thread) and stays in the LeaderboardService cache, so switching to a
+prefetched tab needs no database access.
+
+The loader thread is a daemon thread started on the first request. It uses
+the service's per-thread UnifiedDatabaseAPI, closed when the loader stops.
+
+Usage:
+    loader = LeaderboardLoader(service)
+    loader.loaded.connect(on_loaded)        # (LeaderboardQuery, result)
+    loader.request(visible_query, urgent=True)
+    loader.request(adjacent_query)
+    ...
+    loader.stop()
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Deque, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from game_cycle.services.leaderboard_service import LeaderboardQuery, LeaderboardService
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderboardLoader(QObject):
+    """
+    Loads leaderboard queries one at a time on a background thread.
+
+    Signals:
+        loaded: Emitted with (LeaderboardQuery, result) for each loaded query
+        failed: Emitted with (LeaderboardQuery, exception) if a query raised
+    """
+
+    loaded = Signal(object, object)  # LeaderboardQuery, result
+    failed = Signal(object, object)  # LeaderboardQuery, Exception
+
+    def __init__(self, service: LeaderboardService, parent: Optional[QObject] = None):
+        """
+        Initialize the loader (the thread starts on the first request).
+
+        Args:
+            service: Cached leaderboard queries
+            parent: Optional QObject parent
+        """
+        super().__init__(parent)
+        self._service = service
+        self._pending: Deque[LeaderboardQuery] = deque()
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def service(self) -> LeaderboardService:
+        """The service queries are loaded through."""
+        return self._service
+
+    def request(self, query: LeaderboardQuery, urgent: bool = False) -> None:
+        """
+        Queue a query (no-op if it is already queued).
+
+        Args:
+            query: Leaderboard to load
+            urgent: Load before everything already queued (the visible tab)
+        """
+        with self._condition:
+            if query in self._pending:
+                if not urgent:
+                    return
+                self._pending.remove(query)
+            if urgent:
+                self._pending.appendleft(query)
+            else:
+                self._pending.append(query)
+            self._condition.notify()
+        self._ensure_started()
+
+    def cancel_pending(self) -> None:
+        """Drop queued queries (the one being loaded still finishes)."""
+        with self._condition:
+            self._pending.clear()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the thread after the query being loaded.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit (None = forever)
+        """
+        with self._condition:
+            self._stopping = True
+            self._pending.clear()
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if not self._thread.is_alive():
+                self._thread = None
+
+    def _ensure_started(self) -> None:
+        """Start the loader thread if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="leaderboard-loader", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Loader loop: load queued queries until stopped."""
+        try:
+            while True:
+                with self._condition:
+                    while not self._pending and not self._stopping:
+                        self._condition.wait()
+                    if self._stopping:
+                        return
+                    query = self._pending.popleft()
+
+                try:
+                    result = self._service.get(query)
+                except Exception as e:
+                    logger.error("Leaderboard query %s failed: %s", query, e)
+                    self.failed.emit(query, e)
+                    continue
+                self.loaded.emit(query, result)
+        finally:
+            self._service.close()
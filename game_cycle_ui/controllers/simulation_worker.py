@@ -0,0 +1,144 @@
+"""
+Simulation Worker - Runs game stages off the Qt main thread.
+
+Week and playoff simulation used to run on the main thread, kept alive by
+QApplication.processEvents() calls from the progress callback. The window
+still froze between callbacks, and multi-week simulations paid the event
+pump cost for every game.
+
+StageSimulationWorker is a QThread that builds its own backend
+StageController inside run(), so every SQLite connection it uses is created
+and used on the worker thread. Progress and per-stage results are streamed
+back through signals (queued to the main thread); the UI controller adopts
+the final stage into its own backend when the worker finishes.
+
+Cancellation is checked between stages. A stage that has started always
+finishes, because a week is persisted in one transaction.
+
+Multi-stage runs use deferred media: each week's headlines, social posts,
+rankings and popularity are queued for the background media job worker
+while the next week simulates, and the queue is drained before
+simulation_finished is emitted.
+
+Usage:
+    worker = StageSimulationWorker(db_path, dynasty_id, stage, "full",
+                                   continue_phase=SeasonPhase.REGULAR_SEASON)
+    worker.progress.connect(on_progress)
+    worker.simulation_finished.connect(on_finished)
+    worker.start()
+    ...
+    worker.cancel()  # Stop after the current week
+"""
+
+import logging
+from typing import Optional
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+from game_cycle import SeasonPhase, Stage
+from game_cycle.stage_controller import StageController as BackendStageController
+
+logger = logging.getLogger(__name__)
+
+
+class StageSimulationWorker(QThread):
+    """
+    Executes one stage, or consecutive stages of one phase, on a worker thread.
+
+    Signals:
+        stage_started: Emitted before each stage is executed (Stage)
+        progress: Game progress within the current stage (current, total, message)
+        stage_completed: Emitted after each stage with its StageResult
+        simulation_finished: Emitted once with (last StageResult or None,
+            final current Stage, cancelled)
+        simulation_failed: Emitted with the exception if execution raised
+    """
+
+    stage_started = Signal(object)  # Stage
+    progress = Signal(int, int, str)  # current, total, message
+    stage_completed = Signal(object)  # StageResult
+    simulation_finished = Signal(object, object, bool)  # last result, final stage, cancelled
+    simulation_failed = Signal(object)  # Exception
+
+    def __init__(
+        self,
+        db_path: str,
+        dynasty_id: str,
+        stage: Stage,
+        simulation_mode: str,
+        continue_phase: Optional[SeasonPhase] = None,
+        parent: Optional[QObject] = None
+    ):
+        """
+        Initialize the worker (nothing runs until start()).
+
+        Args:
+            db_path: Path to game_cycle.db database
+            dynasty_id: Dynasty identifier
+            stage: Current stage of the UI's backend controller
+            simulation_mode: "instant" or "full"
+            continue_phase: Keep executing and advancing while the current
+                stage is in this phase (None = execute a single stage)
+            parent: Optional QObject parent
+        """
+        super().__init__(parent)
+        self._db_path = db_path
+        self._dynasty_id = dynasty_id
+        self._stage = stage
+        self._simulation_mode = simulation_mode
+        self._continue_phase = continue_phase
+        self._cancel_requested = False
+
+    def cancel(self) -> None:
+        """Stop after the stage that is currently executing."""
+        self._cancel_requested = True
+
+    @property
+    def cancel_requested(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._cancel_requested
+
+    def run(self) -> None:
+        """Execute stages on the worker thread (called by QThread.start())."""
+        backend = None
+        try:
+            # Created here so its connections belong to this thread
+            backend = BackendStageController(
+                db_path=self._db_path,
+                dynasty_id=self._dynasty_id,
+                season=self._stage.season_year
+            )
+            backend.set_simulation_mode(self._simulation_mode)
+            if self._continue_phase is not None:
+                backend.set_media_mode("deferred")
+            backend.adopt_stage(self._stage)
+            backend.set_progress_callback(self.progress.emit)
+
+            last_result = None
+            while not self._cancel_requested:
+                stage = backend.current_stage
+                if last_result is not None and (
+                    stage is None or stage.phase != self._continue_phase
+                ):
+                    break
+
+                self.stage_started.emit(stage)
+                last_result = backend.execute_current_stage()
+                self.stage_completed.emit(last_result)
+
+                if self._continue_phase is None or not last_result.can_advance:
+                    break
+                backend.advance_to_next_stage()
+
+            if backend.media_mode == "deferred":
+                backend.drain_media_jobs()
+
+            self.simulation_finished.emit(last_result, backend.current_stage, self._cancel_requested)
+
+        except Exception as e:
+            logger.error("Stage simulation failed: %s", e, exc_info=True)
+            self.simulation_failed.emit(e)
+        finally:
+            if backend is not None:
+                backend.set_progress_callback(None)
+                backend.close()
@@ -16,6 +16,7 @@ from PySide6.QtWidgets import QApplication, QProgressDialog
 from game_cycle import Stage, StageType, SeasonPhase, ROSTER_LIMITS, INTERACTIVE_OFFSEASON_STAGES
 from game_cycle.stage_controller import StageController as BackendStageController
 from .draft_simulation_controller import DraftSimulationController
+from .simulation_worker import StageSimulationWorker
 
 
 class StageUIController(QObject):
@@ -100,6 +101,12 @@ class StageUIController(QObject):
         # Created lazily when entering draft stage
         self._draft_simulation_controller: Optional[DraftSimulationController] = None
 
+        # Off-main-thread week/playoff simulation (one at a time)
+        self._simulation_worker: Optional[StageSimulationWorker] = None
+        self._simulation_progress: Optional[QProgressDialog] = None
+        self._simulation_stage: Optional[Stage] = None
+        self._weeks_simulated = 0
+
     @property
     def dynasty_id(self) -> str:
         """Get current dynasty ID."""
@@ -296,7 +303,10 @@ class StageUIController(QObject):
             self._handle_execution_error(e)
 
     def _execute_with_progress(self, stage: Stage):
-        """Execute stage with progress dialog (runs in main thread with UI updates)."""
+        """Execute stage on a simulation worker thread with a progress dialog."""
+        if self.is_simulating:
+            return
+
         # SSOT check: if stage is completed, backend will auto-advance
         # Show the correct week that will actually be simulated
         if stage.completed:
@@ -316,51 +326,98 @@ class StageUIController(QObject):
         progress.setValue(0)
         progress.show()  # Explicitly show the dialog
         progress.raise_()  # Bring to front
-        QApplication.processEvents()  # Force initial render
-
-        # Set up progress callback that updates dialog and processes events
-        def on_progress(current: int, total: int, message: str):
-            """Called from backend as games complete."""
-            if total > 0:
-                percent = int((current / total) * 100)
-                progress.setValue(percent)
-                progress.setLabelText(f"{message}\n({current}/{total} games complete)")
-                # Process events to keep UI responsive
-                QApplication.processEvents()
 
         # Disable advance button during simulation
         if self._view:
             self._view.set_advance_enabled(False)
 
-        # Set callback on backend
-        self._backend.set_progress_callback(on_progress)
-
-        try:
-            # Execute stage in main thread (SQLite requires same-thread access)
-            result = self._backend.execute_current_stage()
+        self._simulation_progress = progress
+        self._simulation_stage = stage
+        worker = self._create_simulation_worker(stage)
+        worker.progress.connect(self._on_stage_game_progress)
+        worker.simulation_finished.connect(self._on_stage_simulation_finished)
+        worker.start()
 
-            # Close progress dialog
-            progress.close()
+    @property
+    def is_simulating(self) -> bool:
+        """Whether a simulation worker is currently running."""
+        return self._simulation_worker is not None
 
-            # Clear callback
-            self._backend.set_progress_callback(None)
+    def _create_simulation_worker(
+        self,
+        stage: Stage,
+        continue_phase: Optional[SeasonPhase] = None
+    ) -> StageSimulationWorker:
+        """
+        Create a StageSimulationWorker from the current backend stage.
 
-            # Re-enable advance button
-            if self._view:
-                self._view.set_advance_enabled(True)
+        The worker owns its own backend controller and database connections;
+        stages it reaches are adopted into this controller's backend.
 
-            # Handle result
-            self._handle_stage_result(result, stage)
+        Args:
+            stage: Current stage
+            continue_phase: Keep simulating while the stage is in this phase
 
-        except Exception as e:
-            # Close progress dialog
+        Returns:
+            The worker, not yet started (connect result slots, then start())
+        """
+        worker = StageSimulationWorker(
+            db_path=self._database_path,
+            dynasty_id=self._dynasty_id,
+            stage=stage,
+            simulation_mode=self._backend.simulation_mode,
+            continue_phase=continue_phase,
+            parent=self
+        )
+        worker.stage_started.connect(self._on_worker_stage_started)
+        worker.stage_completed.connect(self._on_worker_stage_completed)
+        worker.simulation_failed.connect(self._on_simulation_failed)
+        worker.finished.connect(worker.deleteLater)
+        self._simulation_worker = worker
+        return worker
+
+    def _on_worker_stage_started(self, stage: Stage):
+        """Follow the worker's current stage (it may auto-advance past completed stages)."""
+        if stage is not None:
+            self._backend.adopt_stage(stage)
+
+    def _on_worker_stage_completed(self, result):
+        """Keep the backend's cached stage (and completed flag) in sync with the worker."""
+        self._backend.adopt_stage(result.stage)
+
+    def _finish_simulation(self, final_stage: Optional[Stage]):
+        """Common cleanup when a simulation worker stops."""
+        if final_stage is not None:
+            self._backend.adopt_stage(final_stage)
+        progress, self._simulation_progress = self._simulation_progress, None
+        # Cleared before closing: QProgressDialog emits canceled on close, and
+        # the cancel handler only acts while a worker is set
+        self._simulation_worker = None
+        if progress is not None:
             progress.close()
+        if self._view:
+            self._view.set_advance_enabled(True)
 
-            # Clear callback
-            self._backend.set_progress_callback(None)
+    def _on_stage_game_progress(self, current: int, total: int, message: str):
+        """Update the single-stage progress dialog as games complete."""
+        progress = self._simulation_progress
+        if progress is not None and total > 0:
+            progress.setValue(int((current / total) * 100))
+            progress.setLabelText(f"{message}\n({current}/{total} games complete)")
+
+    def _on_stage_simulation_finished(self, result, final_stage: Optional[Stage], cancelled: bool):
+        """Handle a single-stage simulation result on the main thread."""
+        stage = self._simulation_stage
+        self._simulation_stage = None
+        self._finish_simulation(final_stage)
+        if result is not None:
+            self._handle_stage_result(result, stage)
 
-            # Handle error
-            self._handle_execution_error(e)
+    def _on_simulation_failed(self, error: Exception):
+        """Handle an exception raised on the simulation worker."""
+        self._simulation_stage = None
+        self._finish_simulation(None)
+        self._handle_execution_error(error)
 
     def _handle_stage_result(self, result, stage: Stage):
         """Common result handling logic for both sync and async execution."""
@@ -1084,7 +1141,10 @@ class StageUIController(QObject):
         return self._backend.get_stage_preview()
 
     def _on_skip_to_playoffs(self):
-        """Skip to playoffs by simulating remaining regular season with progress dialog."""
+        """Skip to playoffs by simulating remaining regular season on a worker thread."""
+        if self.is_simulating:
+            return
+
         # Count remaining weeks
         stage = self.current_stage
         if stage is None or stage.phase != SeasonPhase.REGULAR_SEASON:
@@ -1096,7 +1156,7 @@ class StageUIController(QObject):
         # Create progress dialog for multi-week simulation
         progress = QProgressDialog(
             f"Simulating to Playoffs...\n\nWeek {current_week} of 18",
-            None,  # No cancel button
+            "Stop After This Week",
             0, total_weeks,
             self._view if self._view else None
         )
@@ -1106,65 +1166,50 @@ class StageUIController(QObject):
         progress.setValue(0)
         progress.show()
         progress.raise_()
-        QApplication.processEvents()
-
-        # Set up game-level progress callback
-        def on_game_progress(current: int, total: int, message: str):
-            """Update with individual game progress."""
-            # Keep the week-level message but show game detail in status
-            if total > 0:
-                progress.setLabelText(
-                    f"Simulating to Playoffs...\n\n{message}\n({current}/{total} games this week)"
-                )
-                QApplication.processEvents()
 
         # Disable advance button
         if self._view:
             self._view.set_advance_enabled(False)
 
-        try:
-            weeks_simulated = 0
-            # Simulate all remaining regular season weeks
-            while True:
-                stage = self.current_stage
-                if stage is None or stage.phase != SeasonPhase.REGULAR_SEASON:
-                    break
-
-                # Update week-level progress
-                week_num = stage.week_number
-                weeks_simulated += 1
-                progress.setValue(weeks_simulated)
-                progress.setLabelText(f"Simulating to Playoffs...\n\nWeek {week_num} of 18")
-                QApplication.processEvents()
-
-                # Set callback for this week's games
-                self._backend.set_progress_callback(on_game_progress)
-
-                # Execute this week
-                result = self._backend.execute_current_stage()
-
-                # Clear callback
-                self._backend.set_progress_callback(None)
-
-                if result.can_advance:
-                    self._backend.advance_to_next_stage()
-                else:
-                    break
-
-            # Close progress dialog
-            progress.close()
+        self._simulation_progress = progress
+        self._weeks_simulated = 0
+        worker = self._create_simulation_worker(stage, continue_phase=SeasonPhase.REGULAR_SEASON)
+        worker.stage_started.connect(self._on_season_week_started)
+        worker.progress.connect(self._on_season_game_progress)
+        worker.simulation_finished.connect(self._on_season_simulation_finished)
+        progress.canceled.connect(self._on_season_simulation_cancel_requested)
+        worker.start()
+
+    def _on_season_week_started(self, stage: Stage):
+        """Update week-level progress for the sim-to-playoffs dialog."""
+        progress = self._simulation_progress
+        if progress is None or stage is None:
+            return
+        self._weeks_simulated += 1
+        progress.setValue(min(self._weeks_simulated, progress.maximum()))
+        progress.setLabelText(f"Simulating to Playoffs...\n\nWeek {stage.week_number} of 18")
+
+    def _on_season_game_progress(self, current: int, total: int, message: str):
+        """Show individual game progress in the sim-to-playoffs dialog."""
+        progress = self._simulation_progress
+        if progress is not None and total > 0:
+            progress.setLabelText(
+                f"Simulating to Playoffs...\n\n{message}\n({current}/{total} games this week)"
+            )
 
-            # Re-enable advance button
+    def _on_season_simulation_cancel_requested(self):
+        """Stop the sim-to-playoffs worker after the week in progress."""
+        if self._simulation_worker is not None:
+            self._simulation_worker.cancel()
             if self._view:
-                self._view.set_advance_enabled(True)
-
-            self.refresh()
+                self._view.set_status("Stopping after the current week...")
 
-        except Exception as e:
-            progress.close()
-            if self._view:
-                self._view.set_advance_enabled(True)
-            raise
+    def _on_season_simulation_finished(self, result, final_stage: Optional[Stage], cancelled: bool):
+        """Refresh the UI once the sim-to-playoffs worker stops."""
+        self._finish_simulation(final_stage)
+        self.refresh()
+        if self._view and result is not None and not result.success:
+            self._view.set_status(f"Simulation stopped: {'; '.join(result.errors)}", is_error=True)
 
     def _on_skip_to_offseason(self):
         """Skip directly to offseason without simulating games."""
@@ -5,5 +5,9 @@ Models for Game Cycle UI.
 from .staff_state import StaffState
 from .inbox_message import InboxMessage, MessageAction
 from .stage_data import ResigningStageData
+from .leaderboard_table_model import LeaderboardColumn, LeaderboardTableModel
 
-__all__ = ["StaffState", "InboxMessage", "MessageAction", "ResigningStageData"]
+__all__ = [
+    "StaffState", "InboxMessage", "MessageAction", "ResigningStageData",
+    "LeaderboardColumn", "LeaderboardTableModel",
+]
@@ -0,0 +1,163 @@
+"""
+Leaderboard table model for the stats view.
+
+Replaces a QTableWidgetItem per cell: rows stay as the dicts returned by
+the leaderboard queries and cells are formatted on demand from column specs.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QColor, QFont
+
+# Roles read by the stats view
+SORT_ROLE = Qt.UserRole  # Numeric (or text) value used for sorting
+RECORD_ROLE = Qt.UserRole + 1  # The row's dict
+
+HIGHLIGHT_COLOR = QColor("#2E7D32")
+MESSAGE_COLOR = QColor("#666")
+
+
+def _default_text(value: Any) -> str:
+    return str(value)
+
+
+@dataclass
+class LeaderboardColumn:
+    """
+    One column of a leaderboard table.
+
+    Attributes:
+        header: Header label
+        value: Returns the cell's value from the row dict (None = rank, the
+            row's position in the loaded order)
+        text: Formats the value for display
+        alignment: Cell alignment
+        highlight: Highlight the leader's (first loaded row's) cell
+    """
+    header: str
+    value: Optional[Callable[[Dict[str, Any]], Any]] = None
+    text: Callable[[Any], str] = _default_text
+    alignment: Qt.AlignmentFlag = Qt.AlignCenter
+    highlight: bool = False
+
+
+class LeaderboardTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of leaderboard rows.
+
+    Sorting is left to a QSortFilterProxyModel using SORT_ROLE; the rank
+    column and the leader highlight follow the order rows were loaded in.
+    """
+
+    def __init__(
+        self,
+        columns: List[LeaderboardColumn],
+        highlight_font: Optional[QFont] = None,
+        parent: Any = None
+    ):
+        """
+        Args:
+            columns: Column specs
+            highlight_font: Font for highlighted cells (None = default font)
+            parent: Optional QObject parent
+        """
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._highlight_font = highlight_font
+        self._rows: List[Dict[str, Any]] = []
+        self._message: Optional[str] = None
+
+    # -------------------- Data --------------------
+
+    def set_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Replace the table's rows."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._message = None
+        self.endResetModel()
+
+    def set_columns(self, columns: List[LeaderboardColumn], rows: List[Dict[str, Any]]) -> None:
+        """Replace the column specs and rows together."""
+        self.beginResetModel()
+        self._columns = list(columns)
+        self._rows = list(rows)
+        self._message = None
+        self.endResetModel()
+
+    def set_message(self, message: str) -> None:
+        """Show a single placeholder row (e.g. "Loading...") instead of data."""
+        self.beginResetModel()
+        self._rows = []
+        self._message = message
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.set_rows([])
+
+    def record(self, row: int) -> Optional[Dict[str, Any]]:
+        """Row dict at a (source) row, or None for placeholders."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    @property
+    def message(self) -> Optional[str]:
+        """Placeholder text being shown, if any."""
+        return self._message
+
+    # -------------------- QAbstractTableModel --------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return 1 if self._message is not None else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._columns)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._columns):
+            return self._columns[section].header
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if self._message is not None:
+            if col == min(1, len(self._columns) - 1):
+                if role == Qt.DisplayRole:
+                    return self._message
+                if role == Qt.ForegroundRole:
+                    return MESSAGE_COLOR
+            return None
+
+        column = self._columns[col]
+        record = self._rows[row]
+
+        if role == Qt.DisplayRole:
+            return column.text(self._value(column, row, record))
+        if role == SORT_ROLE:
+            return self._value(column, row, record)
+        if role == RECORD_ROLE:
+            return record
+        if role == Qt.TextAlignmentRole:
+            return column.alignment
+        if column.highlight and row == 0:
+            if role == Qt.ForegroundRole:
+                return HIGHLIGHT_COLOR
+            if role == Qt.FontRole and self._highlight_font is not None:
+                return self._highlight_font
+        return None
+
+    @staticmethod
+    def _value(column: LeaderboardColumn, row: int, record: Dict[str, Any]) -> Any:
+        if column.value is None:
+            return row + 1
+        return column.value(record)
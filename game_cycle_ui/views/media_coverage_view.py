@@ -770,9 +770,9 @@ class MediaCoverageView(QWidget):
                     """SELECT event_id, game_id, data
                        FROM events
                        WHERE dynasty_id = ?
-                         AND json_extract(data, '$.parameters.season') = ?
-                         AND json_extract(data, '$.parameters.week') = ?
-                         AND json_extract(data, '$.parameters.season_type') = 'regular_season'
+                         AND game_season = ?
+                         AND game_season_type = 'regular_season'
+                         AND game_week = ?
                          AND json_extract(data, '$.parameters.home_team_id') IS NOT NULL
                          AND json_extract(data, '$.parameters.away_team_id') IS NOT NULL
                        ORDER BY game_id""",
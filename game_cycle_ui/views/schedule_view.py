@@ -302,12 +302,12 @@ class ScheduleView(QWidget):
                 """SELECT event_id, game_id, data
                    FROM events
                    WHERE dynasty_id = ?
-                     AND json_extract(data, '$.parameters.season') = ?
-                     AND json_extract(data, '$.parameters.season_type') IN ('regular_season', 'preseason')
-                     AND json_extract(data, '$.parameters.week') IS NOT NULL
+                     AND game_season = ?
+                     AND game_season_type IN ('regular_season', 'preseason')
+                     AND game_week IS NOT NULL
                      AND json_extract(data, '$.parameters.home_team_id') IS NOT NULL
                      AND json_extract(data, '$.parameters.away_team_id') IS NOT NULL
-                   ORDER BY json_extract(data, '$.parameters.week'), game_id""",
+                   ORDER BY game_week, game_id""",
                 (self._dynasty_id, self._season)
             )
 
@@ -2,47 +2,73 @@
 Stats View - Shows league leaders by category.
 
 Displays league leaders for passing, rushing, receiving, defense, and kicking.
-Data is loaded from player_game_stats via UnifiedDatabaseAPI.
+Data is loaded from player_game_stats via UnifiedDatabaseAPI, through the
+cached LeaderboardService: only the visible tab is loaded (on a background
+thread), its neighbours are prefetched, and cached tabs are shown without
+touching the database until new games are persisted.
 """
 
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
-    QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
+    QTableView, QHeaderView, QComboBox,
     QTabWidget, QPushButton
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import Qt, Signal, QModelIndex, QSortFilterProxyModel
 
+from game_cycle.services.leaderboard_service import (
+    SUMMARY, TEAM_STATS, LeaderboardQuery, LeaderboardService
+)
 from game_cycle_ui.theme import (
     TAB_STYLE, PRIMARY_BUTTON_STYLE, SECONDARY_BUTTON_STYLE,
     DANGER_BUTTON_STYLE, WARNING_BUTTON_STYLE, NEUTRAL_BUTTON_STYLE,
     Typography, FontSizes, TextColors, apply_table_style
 )
 from game_cycle_ui.widgets import SummaryPanel
+from game_cycle_ui.controllers.leaderboard_loader import LeaderboardLoader
+from game_cycle_ui.models.leaderboard_table_model import (
+    LeaderboardColumn, LeaderboardTableModel, RECORD_ROLE, SORT_ROLE
+)
 from constants.position_abbreviations import get_position_abbreviation
 
+LEFT = Qt.AlignLeft | Qt.AlignVCenter
 
-class NumericTableWidgetItem(QTableWidgetItem):
-    """Custom QTableWidgetItem that sorts numerically instead of alphabetically."""
 
-    def __init__(self, value: Any, display_text: str = None):
-        """
-        Args:
-            value: The numeric value for sorting
-            display_text: The text to display (if different from value)
-        """
-        super().__init__(display_text if display_text else str(value))
-        self._sort_value = value
+def _stat(key: str):
+    """Column value: a stat from the row dict (missing/None = 0)."""
+    return lambda row: row.get(key, 0) or 0
+
+
+def _ratio(numerator: str, denominator: str, scale: float = 1.0):
+    """Column value: numerator / denominator (0.0 when the denominator is 0)."""
+    def value(row: Dict) -> float:
+        den = row.get(denominator, 0) or 0
+        return (row.get(numerator, 0) or 0) / den * scale if den > 0 else 0.0
+    return value
+
 
-    def __lt__(self, other):
-        if isinstance(other, NumericTableWidgetItem):
-            # Handle None/0 values
-            self_val = self._sort_value if self._sort_value is not None else 0
-            other_val = other._sort_value if other._sort_value is not None else 0
-            return self_val < other_val
-        return super().__lt__(other)
+def _one_decimal(value: Any) -> str:
+    return f"{value:.1f}"
+
+
+def _percent(value: Any) -> str:
+    return f"{value:.1f}%"
+
+
+def _decimal_if_float(value: Any) -> str:
+    return f"{value:.1f}" if isinstance(value, float) else str(value)
+
+
+@dataclass
+class _StatsTab:
+    """A leaderboard tab: its table, model and what it last showed."""
+    category: str
+    table: QTableView
+    model: LeaderboardTableModel
+    loaded_query: Optional[LeaderboardQuery] = None
+    result: Any = None
 
 
 class StatsView(QWidget):
@@ -66,9 +92,12 @@ class StatsView(QWidget):
         self._season: int = 2025
         self._dynasty_id: str = ""
         self._db_path: str = ""
-        self._unified_api = None
+        self._leaderboards: Optional[LeaderboardService] = None
+        self._loader: Optional[LeaderboardLoader] = None
         self._team_filter: Optional[int] = None  # None = All Teams
         self._defense_sort_by: str = 'tackles'  # Default sort for defense table
+        self._tabs: List[_StatsTab] = []
+        self._stale: Set[str] = set()  # Categories to reload when next shown
         self._setup_ui()
 
     def _setup_ui(self):
@@ -162,71 +191,75 @@ class StatsView(QWidget):
         self.category_tabs.setStyleSheet(TAB_STYLE)
 
         # Passing tab
-        self.passing_table = self._create_stats_table([
-            "#", "Player", "Pos", "Team", "CMP", "ATT", "CMP%", "YDS", "TD", "INT", "RTG"
-        ])
-        self.category_tabs.addTab(self.passing_table, "Passing")
+        self.passing_table, self.passing_model = self._add_category_tab(
+            "passing", "Passing", self._passing_columns()
+        )
 
         # Rushing tab - added SNAPS column
-        self.rushing_table = self._create_stats_table([
-            "#", "Player", "Pos", "Team", "ATT", "YDS", "AVG", "TD", "20+", "LNG", "FUM", "LST", "SNAPS"
-        ])
-        self.category_tabs.addTab(self.rushing_table, "Rushing")
+        self.rushing_table, self.rushing_model = self._add_category_tab(
+            "rushing", "Rushing", self._rushing_columns()
+        )
 
         # Receiving tab - added SNAPS column
-        self.receiving_table = self._create_stats_table([
-            "#", "Player", "Pos", "Team", "REC", "TGT", "YDS", "AVG", "TD", "LNG", "DRP", "SNAPS"
-        ])
-        self.category_tabs.addTab(self.receiving_table, "Receiving")
-
-        # Defense tab - uses server-side sorting
-        self.defense_table = self._create_stats_table([
-            "#", "Player", "Pos", "Team", "TKL", "SOLO", "AST", "SACK", "INT", "PD", "FF", "FR"
-        ])
-        # Disable client-side sorting for defense table - we use server-side sorting
-        self.defense_table.setSortingEnabled(False)
+        self.receiving_table, self.receiving_model = self._add_category_tab(
+            "receiving", "Receiving", self._receiving_columns()
+        )
+
+        # Defense tab - uses server-side sorting (no client-side sorting)
+        self.defense_table, self.defense_model = self._add_category_tab(
+            "defense", "Defense", self._defense_columns(), sortable=False
+        )
         # Connect header click for server-side sorting
         self.defense_table.horizontalHeader().sectionClicked.connect(
             self._on_defense_header_clicked
         )
-        self.category_tabs.addTab(self.defense_table, "Defense")
 
         # Kicking tab
-        self.kicking_table = self._create_stats_table([
-            "#", "Player", "Team", "FGM", "FGA", "FG%", "XPM", "XPA", "PTS"
-        ])
-        self.category_tabs.addTab(self.kicking_table, "Kicking")
+        self.kicking_table, self.kicking_model = self._add_category_tab(
+            "kicking", "Kicking", self._kicking_columns()
+        )
 
         # Punting tab
-        self.punting_table = self._create_stats_table([
-            "#", "Player", "Team", "PUNTS", "YDS", "AVG"
-        ])
-        self.category_tabs.addTab(self.punting_table, "Punting")
+        self.punting_table, self.punting_model = self._add_category_tab(
+            "punting", "Punting", self._punting_columns()
+        )
 
         # Blocking tab (O-Line)
-        self.blocking_table = self._create_stats_table([
-            "#", "Player", "Pos", "Team", "PB", "PKS", "SKA", "HUR", "PRES", "RBG", "PBE"
-        ])
-        self.category_tabs.addTab(self.blocking_table, "Blocking")
+        self.blocking_table, self.blocking_model = self._add_category_tab(
+            "blocking", "Blocking", self._blocking_columns()
+        )
 
         # Coverage tab (DBs/LBs)
-        self.coverage_table = self._create_stats_table([
-            "#", "Player", "Pos", "Team", "TGT", "CMP", "YDS", "CMP%", "PD", "INT", "SNAPS"
-        ])
-        self.category_tabs.addTab(self.coverage_table, "Coverage")
+        self.coverage_table, self.coverage_model = self._add_category_tab(
+            "coverage", "Coverage", self._coverage_columns()
+        )
 
         # Pass Rush tab (DL/EDGE)
-        self.pass_rush_table = self._create_stats_table([
-            "#", "Player", "Pos", "Team", "PR ATT", "PR WIN", "WIN%", "SACK", "DBL", "SNAPS"
-        ])
-        self.category_tabs.addTab(self.pass_rush_table, "Pass Rush")
+        self.pass_rush_table, self.pass_rush_model = self._add_category_tab(
+            "pass_rush", "Pass Rush", self._pass_rush_columns()
+        )
 
         # Team Stats tab (league-wide team rankings)
         team_stats_container = self._create_team_stats_tab()
         self.category_tabs.addTab(team_stats_container, "Team Stats")
+        self._tabs.append(_StatsTab(TEAM_STATS, self.team_stats_table, self.team_stats_model))
 
+        self.category_tabs.currentChanged.connect(self._on_tab_changed)
         parent_layout.addWidget(self.category_tabs, stretch=1)
 
+    def _add_category_tab(
+        self,
+        category: str,
+        label: str,
+        columns: List[LeaderboardColumn],
+        sortable: bool = True
+    ) -> Tuple[QTableView, LeaderboardTableModel]:
+        """Create a leaderboard table and add it as a tab."""
+        table, model = self._create_stats_table(columns, sortable=sortable)
+        self.category_tabs.addTab(table, label)
+        self._tabs.append(_StatsTab(category, table, model))
+        return table, model
+
     def _create_team_stats_tab(self) -> QWidget:
         """Create the Team Stats tab with toggle buttons and rankings table."""
         container = QWidget()
@@ -291,9 +324,9 @@ class StatsView(QWidget):
         layout.addLayout(toggle_row)
 
         # Team stats table
-        self.team_stats_table = self._create_stats_table([
-            "#", "Team", "GP", "Total YDS", "Pass YDS", "Rush YDS", "PTS", "PTS/G"
-        ])
+        self.team_stats_table, self.team_stats_model = self._create_stats_table(
+            self._team_stats_columns("offense")
+        )
         layout.addWidget(self.team_stats_table, stretch=1)
 
         return container
@@ -304,13 +337,28 @@ class StatsView(QWidget):
         for vt, btn in self.team_stats_buttons.items():
             btn.setChecked(vt == view_type)
         self._current_team_stats_view = view_type
-        self._load_team_stats()
 
-    def _create_stats_table(self, headers: List[str]) -> QTableWidget:
-        """Create a configured stats table with sorting enabled."""
-        table = QTableWidget()
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
+        tab = self._tab(TEAM_STATS)
+        if tab.result is not None:
+            self._populate_team_stats_table(tab.result, view_type)
+
+    def _create_stats_table(
+        self,
+        columns: List[LeaderboardColumn],
+        sortable: bool = True
+    ) -> Tuple[QTableView, LeaderboardTableModel]:
+        """Create a configured model-backed stats table with sorting enabled."""
+        model = LeaderboardTableModel(columns, highlight_font=Typography.SMALL_BOLD, parent=self)
+        table = QTableView()
+
+        if sortable:
+            # Sort on the numeric values, not the display text
+            proxy = QSortFilterProxyModel(table)
+            proxy.setSortRole(SORT_ROLE)
+            proxy.setSourceModel(model)
+            table.setModel(proxy)
+        else:
+            table.setModel(model)
 
         # Apply standard ESPN dark table styling
         apply_table_style(table)
@@ -319,16 +367,222 @@ class StatsView(QWidget):
         header = table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # Rank
         header.setSectionResizeMode(1, QHeaderView.Stretch)  # Player name
-        for i in range(2, len(headers)):
+        for i in range(2, len(columns)):
             header.setSectionResizeMode(i, QHeaderView.ResizeToContents)
 
-        # Enable sorting by clicking column headers
-        table.setSortingEnabled(True)
+        # Enable sorting by clicking column headers (loaded rank order first)
+        if sortable:
+            header.setSortIndicator(0, Qt.AscendingOrder)
+            table.setSortingEnabled(True)
 
         # Connect double-click to open player detail dialog
-        table.cellDoubleClicked.connect(self._on_stats_player_double_clicked)
+        table.doubleClicked.connect(self._on_stats_player_double_clicked)
+
+        return table, model
+
+    # === Column Definitions ===
+
+    def _player_columns(self, default_position: Optional[str]) -> List[LeaderboardColumn]:
+        """Rank, player, position (unless None) and team columns."""
+        columns = [
+            LeaderboardColumn("#"),
+            LeaderboardColumn("Player", lambda p: p.get("player_name", "Unknown"), alignment=LEFT),
+        ]
+        if default_position is not None:
+            columns.append(LeaderboardColumn(
+                "Pos", lambda p: self._get_position_abbr(p.get("position", default_position))
+            ))
+        columns.append(LeaderboardColumn("Team", lambda p: self._get_team_abbr(p.get("team_id", 0))))
+        return columns
+
+    def _passing_columns(self) -> List[LeaderboardColumn]:
+        """Passing: CMP, ATT, CMP%, YDS, TD, INT, RTG."""
+        def rating(p: Dict) -> float:
+            return self._calculate_passer_rating(
+                p.get("passing_completions", 0) or 0,
+                p.get("passing_attempts", 0) or 0,
+                p.get("passing_yards", 0) or 0,
+                p.get("passing_tds", 0) or 0,
+                p.get("passing_interceptions", 0) or 0,
+            )
 
-        return table
+        return self._player_columns("QB") + [
+            LeaderboardColumn("CMP", _stat("passing_completions")),
+            LeaderboardColumn("ATT", _stat("passing_attempts")),
+            LeaderboardColumn("CMP%", _ratio("passing_completions", "passing_attempts", 100), _percent),
+            LeaderboardColumn("YDS", _stat("passing_yards")),
+            LeaderboardColumn("TD", _stat("passing_tds"), highlight=True),
+            LeaderboardColumn("INT", _stat("passing_interceptions")),
+            LeaderboardColumn("RTG", rating, _one_decimal),
+        ]
+
+    def _rushing_columns(self) -> List[LeaderboardColumn]:
+        """Rushing: ATT, YDS, AVG, TD, 20+, LNG, FUM, LST, SNAPS."""
+        return self._player_columns("RB") + [
+            LeaderboardColumn("ATT", _stat("rushing_attempts")),
+            LeaderboardColumn("YDS", _stat("rushing_yards"), highlight=True),
+            LeaderboardColumn("AVG", _ratio("rushing_yards", "rushing_attempts"), _one_decimal),
+            LeaderboardColumn("TD", _stat("rushing_tds")),
+            LeaderboardColumn("20+", _stat("rushing_20_plus")),
+            LeaderboardColumn("LNG", _stat("rushing_long")),
+            LeaderboardColumn("FUM", _stat("rushing_fumbles")),
+            LeaderboardColumn("LST", _stat("fumbles_lost")),
+            LeaderboardColumn("SNAPS", _stat("snap_counts_offense")),
+        ]
+
+    def _receiving_columns(self) -> List[LeaderboardColumn]:
+        """Receiving: REC, TGT, YDS, AVG, TD, LNG, DRP, SNAPS."""
+        return self._player_columns("WR") + [
+            LeaderboardColumn("REC", _stat("receptions")),
+            LeaderboardColumn("TGT", _stat("targets")),
+            LeaderboardColumn("YDS", _stat("receiving_yards"), highlight=True),
+            LeaderboardColumn("AVG", _ratio("receiving_yards", "receptions"), _one_decimal),
+            LeaderboardColumn("TD", _stat("receiving_tds")),
+            LeaderboardColumn("LNG", _stat("receiving_long")),
+            LeaderboardColumn("DRP", _stat("receiving_drops")),
+            LeaderboardColumn("SNAPS", _stat("snap_counts_offense")),
+        ]
+
+    def _defense_columns(self) -> List[LeaderboardColumn]:
+        """Defense: TKL, SOLO, AST, SACK, INT, PD, FF, FR."""
+        return self._player_columns("LB") + [
+            LeaderboardColumn("TKL", _stat("tackles_total"), highlight=True),
+            LeaderboardColumn("SOLO", _stat("tackles_solo")),
+            LeaderboardColumn("AST", _stat("tackles_assist")),
+            LeaderboardColumn("SACK", _stat("sacks"), _decimal_if_float),
+            LeaderboardColumn("INT", _stat("interceptions")),
+            LeaderboardColumn("PD", _stat("passes_defended")),
+            LeaderboardColumn("FF", _stat("forced_fumbles")),
+            LeaderboardColumn("FR", _stat("fumbles_recovered")),
+        ]
+
+    def _kicking_columns(self) -> List[LeaderboardColumn]:
+        """Kicking: FGM, FGA, FG%, XPM, XPA, PTS."""
+        return self._player_columns(None) + [
+            LeaderboardColumn("FGM", _stat("field_goals_made"), highlight=True),
+            LeaderboardColumn("FGA", _stat("field_goals_attempted")),
+            LeaderboardColumn("FG%", _ratio("field_goals_made", "field_goals_attempted", 100), _percent),
+            LeaderboardColumn("XPM", _stat("extra_points_made")),
+            LeaderboardColumn("XPA", _stat("extra_points_attempted")),
+            LeaderboardColumn(
+                "PTS",
+                lambda p: (p.get("field_goals_made", 0) or 0) * 3 + (p.get("extra_points_made", 0) or 0)
+            ),
+        ]
+
+    def _punting_columns(self) -> List[LeaderboardColumn]:
+        """Punting: PUNTS, YDS, AVG."""
+        return self._player_columns(None) + [
+            LeaderboardColumn("PUNTS", _stat("punts"), highlight=True),
+            LeaderboardColumn("YDS", _stat("punt_yards")),
+            LeaderboardColumn("AVG", _ratio("punt_yards", "punts"), _one_decimal),
+        ]
+
+    def _blocking_columns(self) -> List[LeaderboardColumn]:
+        """
+        Blocking (O-Line).
+
+        PB = Pass Blocks, PKS = Pancakes, SKA = Sacks Allowed, HUR = Hurries Allowed
+        PRES = Pressures Allowed, RBG = Run Block Grade, PBE = Pass Block Eff
+        """
+        return self._player_columns("OL") + [
+            LeaderboardColumn("PB", _stat("pass_blocks"), highlight=True),
+            LeaderboardColumn("PKS", _stat("pancakes")),
+            LeaderboardColumn("SKA", _stat("sacks_allowed")),
+            LeaderboardColumn("HUR", _stat("hurries_allowed")),
+            LeaderboardColumn("PRES", _stat("pressures_allowed")),
+            LeaderboardColumn("RBG", _stat("run_blocking_grade"), _decimal_if_float),
+            LeaderboardColumn("PBE", _stat("pass_blocking_efficiency"), lambda v: f"{_decimal_if_float(v)}%"),
+        ]
+
+    def _coverage_columns(self) -> List[LeaderboardColumn]:
+        """
+        Coverage (DBs/LBs).
+
+        TGT = Coverage Targets, CMP = Completions Allowed, YDS = Yards Allowed
+        CMP% = Completion % allowed, PD = Passes Defended, INT = Interceptions
+        """
+        return self._player_columns("CB") + [
+            LeaderboardColumn("TGT", _stat("coverage_targets"), highlight=True),
+            LeaderboardColumn("CMP", _stat("coverage_completions")),
+            LeaderboardColumn("YDS", _stat("coverage_yards_allowed")),
+            LeaderboardColumn("CMP%", _ratio("coverage_completions", "coverage_targets", 100), _percent),
+            LeaderboardColumn("PD", _stat("passes_defended")),
+            LeaderboardColumn("INT", _stat("interceptions")),
+            LeaderboardColumn("SNAPS", _stat("snap_counts_defense")),
+        ]
+
+    def _pass_rush_columns(self) -> List[LeaderboardColumn]:
+        """
+        Pass Rush (DL/EDGE).
+
+        PR ATT = Pass Rush Attempts, PR WIN = Pass Rush Wins, WIN% = Win Rate
+        SACK = Sacks, DBL = Times Double Teamed
+        """
+        return self._player_columns("DE") + [
+            LeaderboardColumn("PR ATT", _stat("pass_rush_attempts"), highlight=True),
+            LeaderboardColumn("PR WIN", _stat("pass_rush_wins")),
+            LeaderboardColumn("WIN%", _ratio("pass_rush_wins", "pass_rush_attempts", 100), _percent),
+            LeaderboardColumn("SACK", _stat("sacks"), _decimal_if_float),
+            LeaderboardColumn("DBL", _stat("times_double_teamed")),
+            LeaderboardColumn("SNAPS", _stat("snap_counts_defense")),
+        ]
+
+    def _team_stats_columns(self, view_type: str) -> List[LeaderboardColumn]:
+        """Team stats columns for a view (offense/defense/special_teams/turnovers)."""
+        def team_abbr(stats: Dict) -> str:
+            from team_management.teams.team_loader import get_team_by_id
+            team_id = stats.get('team_id')
+            team = get_team_by_id(team_id) if team_id else None
+            return team.abbreviation if team else f"Team {team_id}"
+
+        def value(key: str):
+            return lambda stats: stats.get(key, 0)
+
+        def thousands(v: Any) -> str:
+            return f"{v:,}"
+
+        def signed(v: Any) -> str:
+            return f"+{v}" if v > 0 else str(v)
+
+        columns = [
+            LeaderboardColumn("#"),
+            LeaderboardColumn("Team", team_abbr, alignment=LEFT),
+            LeaderboardColumn("GP", value('games_played')),
+        ]
+        if view_type == "offense":
+            columns += [
+                LeaderboardColumn("Total YDS", value('total_yards'), thousands, LEFT),
+                LeaderboardColumn("Pass YDS", value('passing_yards'), thousands, LEFT),
+                LeaderboardColumn("Rush YDS", value('rushing_yards'), thousands, LEFT),
+                LeaderboardColumn("PTS", value('points_scored'), alignment=LEFT),
+                LeaderboardColumn("PTS/G", value('points_per_game'), _one_decimal, LEFT),
+            ]
+        elif view_type == "defense":
+            columns += [
+                LeaderboardColumn("YDS Allowed", value('yards_allowed'), thousands, LEFT),
+                LeaderboardColumn("Pass YDS", value('passing_yards_allowed'), thousands, LEFT),
+                LeaderboardColumn("Rush YDS", value('rushing_yards_allowed'), thousands, LEFT),
+                LeaderboardColumn("PTS Allowed", value('points_allowed'), alignment=LEFT),
+                LeaderboardColumn("PTS/G", value('points_allowed_per_game'), _one_decimal, LEFT),
+            ]
+        elif view_type == "special_teams":
+            columns += [
+                LeaderboardColumn("FG%", value('field_goal_percentage'), _percent, LEFT),
+                LeaderboardColumn("XP%", value('extra_point_percentage'), _percent, LEFT),
+                LeaderboardColumn("Punt Avg", value('punt_average'), _one_decimal, LEFT),
+                LeaderboardColumn("KR Avg", value('kick_return_average'), _one_decimal, LEFT),
+                LeaderboardColumn("PR Avg", value('punt_return_average'), _one_decimal, LEFT),
+            ]
+        else:  # turnovers
+            columns += [
+                LeaderboardColumn("Turnovers", value('turnovers'), alignment=LEFT),
+                LeaderboardColumn("TO Forced", value('turnovers_forced'), alignment=LEFT),
+                LeaderboardColumn("TO Margin", value('turnover_margin'), signed, LEFT),
+                LeaderboardColumn("INT", value('interceptions'), alignment=LEFT),
+                LeaderboardColumn("Sacks", value('sacks'), _one_decimal, LEFT),
+            ]
+        return columns
 
     # === Context and Data Methods ===
 
@@ -345,9 +599,14 @@ class StatsView(QWidget):
         self._db_path = db_path
         self._season = season
 
-        # Initialize UnifiedDatabaseAPI
-        from database.unified_api import UnifiedDatabaseAPI
-        self._unified_api = UnifiedDatabaseAPI(db_path, dynasty_id)
+        # Cached leaderboard queries, loaded on a background thread
+        if self._loader is not None:
+            self._loader.stop(timeout=1.0)
+        self._leaderboards = LeaderboardService(db_path, dynasty_id)
+        self._loader = LeaderboardLoader(self._leaderboards, parent=self)
+        self._loader.loaded.connect(self._on_leaderboard_loaded)
+        self._loader.failed.connect(self._on_leaderboard_failed)
+        self.clear()
 
         # Populate season combo
         self._populate_season_combo()
@@ -364,21 +623,23 @@ class StatsView(QWidget):
         self.season_combo.blockSignals(False)
 
     def refresh_stats(self):
-        """Refresh all stats tables from database."""
-        if not self._unified_api:
+        """
+        Refresh stats from the database.
+
+        Loads the visible tab and the summary, and prefetches the adjacent
+        tabs; other tabs reload when they are shown. Results that are still
+        cached (no games persisted since) are shown without a query.
+        """
+        if self._leaderboards is None:
             return
 
-        self._load_passing_leaders()
-        self._load_rushing_leaders()
-        self._load_receiving_leaders()
-        self._load_defense_leaders()
-        self._load_kicking_leaders()
-        self._load_punting_leaders()
-        self._load_blocking_leaders()
-        self._load_coverage_leaders()
-        self._load_pass_rush_leaders()
-        self._load_team_stats()
+        self._stale = {tab.category for tab in self._tabs}
+        self._loader.cancel_pending()
+
+        index = self.category_tabs.currentIndex()
+        self._load_tab(index, urgent=True)
         self._update_summary()
+        self._prefetch_adjacent(index)
 
     def _on_season_changed(self, index: int):
         """Handle season selection change."""
@@ -387,7 +648,9 @@ class StatsView(QWidget):
             self.refresh_stats()
 
     def _on_refresh_clicked(self):
-        """Handle refresh button click."""
+        """Handle refresh button click (always re-queries)."""
+        if self._leaderboards is not None:
+            self._leaderboards.invalidate()
         self.refresh_stats()
         self.refresh_requested.emit()
 
@@ -397,6 +660,13 @@ class StatsView(QWidget):
             self._team_filter = self.team_combo.itemData(index)
             self.refresh_stats()
 
+    def _on_tab_changed(self, index: int):
+        """Load a tab when it is first shown (or its data went stale)."""
+        if self._leaderboards is None or index < 0:
+            return
+        self._load_tab(index, urgent=True)
+        self._prefetch_adjacent(index)
+
     def _on_defense_header_clicked(self, column: int):
         """Handle defense table column header click for server-side sorting."""
         # Map column indices to sort_by values
@@ -412,186 +682,92 @@ class StatsView(QWidget):
             11: 'fumbles_recovered',  # FR column
         }
         sort_by = column_to_sort.get(column)
-        if sort_by:
+        if sort_by and self._leaderboards is not None:
             self._defense_sort_by = sort_by
-            self._load_defense_leaders()
+            self._load_tab(self._tabs.index(self._tab("defense")), urgent=True)
 
     # === Data Loading Methods ===
 
-    def _load_passing_leaders(self):
-        """Load passing leaders into table using category-specific method."""
-        try:
-            leaders = self._unified_api.stats_get_category_leaders_passing(
-                season=self._season,
-                limit=25,
-                team_id=self._team_filter
-            )
-            self._populate_passing_table(leaders)
-        except Exception as e:
-            print(f"[StatsView] Error loading passing leaders: {e}")
-            self.passing_table.setRowCount(0)
-
-    def _load_rushing_leaders(self):
-        """Load rushing leaders into table using category-specific method."""
-        try:
-            leaders = self._unified_api.stats_get_category_leaders_rushing(
-                season=self._season,
-                limit=25,
-                team_id=self._team_filter
-            )
-            self._populate_rushing_table(leaders)
-        except Exception as e:
-            print(f"[StatsView] Error loading rushing leaders: {e}")
-            self.rushing_table.setRowCount(0)
-
-    def _load_receiving_leaders(self):
-        """Load receiving leaders into table using category-specific method."""
-        try:
-            leaders = self._unified_api.stats_get_category_leaders_receiving(
-                season=self._season,
-                limit=25,
-                team_id=self._team_filter
-            )
-            # Debug: Check for duplicates
-            print(f"[StatsView] Received {len(leaders)} receiving leaders")
-            player_ids = [p.get('player_id') for p in leaders]
-            unique_ids = set(player_ids)
-            if len(player_ids) != len(unique_ids):
-                print(f"[StatsView] WARNING: Found duplicate player_ids! Total: {len(player_ids)}, Unique: {len(unique_ids)}")
-                # Show which players are duplicated
-                from collections import Counter
-                counts = Counter(player_ids)
-                duplicates = [pid for pid, count in counts.items() if count > 1]
-                for dup_id in duplicates:
-                    dup_players = [p for p in leaders if p.get('player_id') == dup_id]
-                    print(f"  Player ID {dup_id}: {dup_players[0].get('player_name')} appears {len(dup_players)} times")
-
-            self._populate_receiving_table(leaders)
-        except Exception as e:
-            print(f"[StatsView] Error loading receiving leaders: {e}")
-            self.receiving_table.setRowCount(0)
-
-    def _load_defense_leaders(self):
-        """Load defensive leaders into table using category-specific method."""
-        try:
-            leaders = self._unified_api.stats_get_category_leaders_defense(
-                season=self._season,
-                limit=25,
-                team_id=self._team_filter,
-                sort_by=self._defense_sort_by
-            )
-            self._populate_defense_table(leaders)
-        except Exception as e:
-            print(f"[StatsView] Error loading defense leaders: {e}")
-            self.defense_table.setRowCount(0)
-
-    def _load_kicking_leaders(self):
-        """Load kicking leaders into table using category-specific method."""
-        try:
-            leaders = self._unified_api.stats_get_category_leaders_kicking(
-                season=self._season,
-                limit=25,
-                team_id=self._team_filter
-            )
-            self._populate_kicking_table(leaders)
-        except Exception as e:
-            print(f"[StatsView] Error loading kicking leaders: {e}")
-            self.kicking_table.setRowCount(0)
-
-    def _load_punting_leaders(self):
-        """Load punting leaders into table using category-specific method."""
-        try:
-            leaders = self._unified_api.stats_get_category_leaders_punting(
-                season=self._season,
-                limit=25,
-                team_id=self._team_filter
-            )
-            self._populate_punting_table(leaders)
-        except Exception as e:
-            print(f"[StatsView] Error loading punting leaders: {e}")
-            self.punting_table.setRowCount(0)
-
-    def _load_blocking_leaders(self):
-        """Load blocking (O-Line) leaders into table using category-specific method."""
-        try:
-            leaders = self._unified_api.stats_get_category_leaders_blocking(
-                season=self._season,
-                limit=25,
-                team_id=self._team_filter
-            )
-            self._populate_blocking_table(leaders)
-        except Exception as e:
-            print(f"[StatsView] Error loading blocking leaders: {e}")
-            self.blocking_table.setRowCount(0)
-
-    def _load_coverage_leaders(self):
-        """Load coverage leaders (DBs/LBs) into table using category-specific method."""
-        try:
-            leaders = self._unified_api.stats_get_category_leaders_coverage(
-                season=self._season,
-                limit=25,
-                team_id=self._team_filter
-            )
-            self._populate_coverage_table(leaders)
-        except Exception as e:
-            print(f"[StatsView] Error loading coverage leaders: {e}")
-            self.coverage_table.setRowCount(0)
-
-    def _load_pass_rush_leaders(self):
-        """Load pass rush leaders (DL/EDGE) into table using category-specific method."""
-        try:
-            leaders = self._unified_api.stats_get_category_leaders_pass_rush(
-                season=self._season,
-                limit=25,
-                team_id=self._team_filter
-            )
-            self._populate_pass_rush_table(leaders)
-        except Exception as e:
-            print(f"[StatsView] Error loading pass rush leaders: {e}")
-            self.pass_rush_table.setRowCount(0)
-
-    def _load_team_stats(self):
-        """Load team statistics based on selected view (offense/defense/special_teams/turnovers)."""
-        try:
-            view_type = self._current_team_stats_view
-
-            # Get all teams' stats using the unified API
-            all_stats = self._unified_api.team_stats_get_all_teams(self._season)
+    def _query(self, category: str) -> LeaderboardQuery:
+        """LeaderboardQuery for a category under the current season and filters."""
+        if category in (TEAM_STATS, SUMMARY):
+            return LeaderboardQuery(season=self._season, category=category)
+        return LeaderboardQuery(
+            season=self._season,
+            category=category,
+            team_id=self._team_filter,
+            sort_by=self._defense_sort_by if category == "defense" else None,
+        )
 
-            if not all_stats:
-                self.team_stats_table.setRowCount(1)
-                msg_item = QTableWidgetItem("No team statistics available")
-                msg_item.setForeground(QColor("#666"))
-                self.team_stats_table.setItem(0, 1, msg_item)
-                return
+    def _tab(self, category: str) -> _StatsTab:
+        """Tab showing a category."""
+        return next(tab for tab in self._tabs if tab.category == category)
 
-            # Update table headers based on view
-            self._update_team_stats_headers(view_type)
+    def _load_tab(self, index: int, urgent: bool) -> None:
+        """
+        Show a tab's data: from the cache if possible, else queue a background load.
 
-            # Sort and populate based on view type
-            self._populate_team_stats_table(all_stats, view_type)
+        Args:
+            index: Tab index
+            urgent: Load ahead of queued prefetches (the visible tab)
+        """
+        if not 0 <= index < len(self._tabs):
+            return
+        tab = self._tabs[index]
+        query = self._query(tab.category)
+        if tab.loaded_query == query and tab.category not in self._stale:
+            return
 
-        except Exception as e:
-            print(f"[StatsView] Error loading team stats: {e}")
-            self.team_stats_table.setRowCount(0)
+        cached = self._leaderboards.peek(query)
+        if cached is not None:
+            self._show_result(tab, query, cached)
+            return
 
-    def _update_team_stats_headers(self, view_type: str):
-        """Update team stats table headers based on view type."""
-        if view_type == "offense":
-            headers = ["#", "Team", "GP", "Total YDS", "Pass YDS", "Rush YDS", "PTS", "PTS/G"]
-        elif view_type == "defense":
-            headers = ["#", "Team", "GP", "YDS Allowed", "Pass YDS", "Rush YDS", "PTS Allowed", "PTS/G"]
-        elif view_type == "special_teams":
-            headers = ["#", "Team", "GP", "FG%", "XP%", "Punt Avg", "KR Avg", "PR Avg"]
-        else:  # turnovers
-            headers = ["#", "Team", "GP", "Turnovers", "TO Forced", "TO Margin", "INT", "Sacks"]
+        # Keep showing the previous rows if only their freshness changed
+        if tab.loaded_query != query:
+            tab.model.set_message("Loading...")
+        self._loader.request(query, urgent=urgent)
+
+    def _prefetch_adjacent(self, index: int) -> None:
+        """Queue the tabs either side of the visible one."""
+        for neighbour in (index + 1, index - 1):
+            self._load_tab(neighbour, urgent=False)
+
+    def _on_leaderboard_loaded(self, query: LeaderboardQuery, result: Any) -> None:
+        """Show a background-loaded result if it still matches the filters."""
+        if query != self._query(query.category):
+            return  # Season/team/sort changed while loading (result stays cached)
+        if query.category == SUMMARY:
+            self._show_summary(result)
+            return
+        self._show_result(self._tab(query.category), query, result)
 
-        self.team_stats_table.setColumnCount(len(headers))
-        self.team_stats_table.setHorizontalHeaderLabels(headers)
+    def _on_leaderboard_failed(self, query: LeaderboardQuery, error: Exception) -> None:
+        """Clear a tab whose query failed."""
+        print(f"[StatsView] Error loading {query.category} stats: {error}")
+        if query.category == SUMMARY or query != self._query(query.category):
+            return
+        tab = self._tab(query.category)
+        tab.loaded_query = None
+        tab.result = None
+        tab.model.clear()
+
+    def _show_result(self, tab: _StatsTab, query: LeaderboardQuery, result: Any) -> None:
+        """Put a loaded result into its tab's model."""
+        tab.loaded_query = query
+        tab.result = result
+        self._stale.discard(tab.category)
+
+        if tab.category == TEAM_STATS:
+            self._populate_team_stats_table(result, self._current_team_stats_view)
+        else:
+            tab.model.set_rows(result)
 
     def _populate_team_stats_table(self, all_stats: List[Dict], view_type: str):
         """Populate team stats table based on view type."""
-        from team_management.teams.team_loader import get_team_by_id
+        if not all_stats:
+            self.team_stats_model.set_message("No team statistics available")
+            return
 
         # Sort based on view type
         if view_type == "offense":
@@ -604,607 +780,25 @@ class StatsView(QWidget):
         else:  # turnovers
             sorted_stats = sorted(all_stats, key=lambda x: x.get('turnover_margin', 0), reverse=True)
 
-        self.team_stats_table.setRowCount(len(sorted_stats))
-
-        for row, stats in enumerate(sorted_stats):
-            team_id = stats.get('team_id')
-            team = get_team_by_id(team_id) if team_id else None
-            team_abbr = team.abbreviation if team else f"Team {team_id}"
-            games_played = stats.get('games_played', 0)
-
-            # Rank
-            rank_item = NumericTableWidgetItem(row + 1, str(row + 1))
-            rank_item.setTextAlignment(Qt.AlignCenter)
-            self.team_stats_table.setItem(row, 0, rank_item)
-
-            # Team
-            self.team_stats_table.setItem(row, 1, QTableWidgetItem(team_abbr))
-
-            # Games Played
-            gp_item = NumericTableWidgetItem(games_played, str(games_played))
-            gp_item.setTextAlignment(Qt.AlignCenter)
-            self.team_stats_table.setItem(row, 2, gp_item)
-
-            if view_type == "offense":
-                # Total Yards
-                total_yds = stats.get('total_yards', 0)
-                self.team_stats_table.setItem(row, 3, NumericTableWidgetItem(total_yds, f"{total_yds:,}"))
-
-                # Pass Yards
-                pass_yds = stats.get('passing_yards', 0)
-                self.team_stats_table.setItem(row, 4, NumericTableWidgetItem(pass_yds, f"{pass_yds:,}"))
-
-                # Rush Yards
-                rush_yds = stats.get('rushing_yards', 0)
-                self.team_stats_table.setItem(row, 5, NumericTableWidgetItem(rush_yds, f"{rush_yds:,}"))
-
-                # Points
-                pts = stats.get('points_scored', 0)
-                self.team_stats_table.setItem(row, 6, NumericTableWidgetItem(pts, str(pts)))
-
-                # Points Per Game
-                ppg = stats.get('points_per_game', 0)
-                self.team_stats_table.setItem(row, 7, NumericTableWidgetItem(ppg, f"{ppg:.1f}"))
-
-            elif view_type == "defense":
-                # Yards Allowed
-                yds_allowed = stats.get('yards_allowed', 0)
-                self.team_stats_table.setItem(row, 3, NumericTableWidgetItem(yds_allowed, f"{yds_allowed:,}"))
-
-                # Pass Yards Allowed
-                pass_yds_allowed = stats.get('passing_yards_allowed', 0)
-                self.team_stats_table.setItem(row, 4, NumericTableWidgetItem(pass_yds_allowed, f"{pass_yds_allowed:,}"))
-
-                # Rush Yards Allowed
-                rush_yds_allowed = stats.get('rushing_yards_allowed', 0)
-                self.team_stats_table.setItem(row, 5, NumericTableWidgetItem(rush_yds_allowed, f"{rush_yds_allowed:,}"))
-
-                # Points Allowed
-                pts_allowed = stats.get('points_allowed', 0)
-                self.team_stats_table.setItem(row, 6, NumericTableWidgetItem(pts_allowed, str(pts_allowed)))
-
-                # Points Allowed Per Game
-                papg = stats.get('points_allowed_per_game', 0)
-                self.team_stats_table.setItem(row, 7, NumericTableWidgetItem(papg, f"{papg:.1f}"))
-
-            elif view_type == "special_teams":
-                # Field Goal Percentage
-                fg_pct = stats.get('field_goal_percentage', 0)
-                self.team_stats_table.setItem(row, 3, NumericTableWidgetItem(fg_pct, f"{fg_pct:.1f}%"))
-
-                # Extra Point Percentage
-                xp_pct = stats.get('extra_point_percentage', 0)
-                self.team_stats_table.setItem(row, 4, NumericTableWidgetItem(xp_pct, f"{xp_pct:.1f}%"))
-
-                # Punt Average
-                punt_avg = stats.get('punt_average', 0)
-                self.team_stats_table.setItem(row, 5, NumericTableWidgetItem(punt_avg, f"{punt_avg:.1f}"))
-
-                # Kick Return Average
-                kr_avg = stats.get('kick_return_average', 0)
-                self.team_stats_table.setItem(row, 6, NumericTableWidgetItem(kr_avg, f"{kr_avg:.1f}"))
-
-                # Punt Return Average
-                pr_avg = stats.get('punt_return_average', 0)
-                self.team_stats_table.setItem(row, 7, NumericTableWidgetItem(pr_avg, f"{pr_avg:.1f}"))
-
-            else:  # turnovers
-                # Turnovers
-                turnovers = stats.get('turnovers', 0)
-                self.team_stats_table.setItem(row, 3, NumericTableWidgetItem(turnovers, str(turnovers)))
-
-                # Turnovers Forced
-                to_forced = stats.get('turnovers_forced', 0)
-                self.team_stats_table.setItem(row, 4, NumericTableWidgetItem(to_forced, str(to_forced)))
-
-                # Turnover Margin
-                to_margin = stats.get('turnover_margin', 0)
-                margin_str = f"+{to_margin}" if to_margin > 0 else str(to_margin)
-                self.team_stats_table.setItem(row, 5, NumericTableWidgetItem(to_margin, margin_str))
-
-                # Interceptions
-                ints = stats.get('interceptions', 0)
-                self.team_stats_table.setItem(row, 6, NumericTableWidgetItem(ints, str(ints)))
-
-                # Sacks
-                sacks = stats.get('sacks', 0)
-                self.team_stats_table.setItem(row, 7, NumericTableWidgetItem(sacks, f"{sacks:.1f}"))
+        # Update headers and rows together
+        self.team_stats_model.set_columns(self._team_stats_columns(view_type), sorted_stats)
 
     def _update_summary(self):
-        """Update summary panel with aggregate stats."""
-        try:
-            # Get game count
-            games_count = self._unified_api.stats_get_game_count(self._season)
-            self.games_label.setText(str(games_count))
-
-            # Get player count
-            player_count = self._unified_api.stats_get_player_count(self._season)
-            self.players_label.setText(str(player_count))
-
-            # Get current week (max week with data)
-            current_week = self._unified_api.stats_get_current_week(self._season)
-            self.week_label.setText(str(current_week))
-        except Exception as e:
-            print(f"[StatsView] Error updating summary: {e}")
-
-    # === Table Population Methods ===
-
-    def _populate_passing_table(self, leaders: List[Dict]):
-        """Populate passing table with leader data."""
-        from team_management.teams.team_loader import get_team_by_id
-
-        self.passing_table.setRowCount(len(leaders))
-
-        for row, player in enumerate(leaders):
-            # Rank
-            rank_item = NumericTableWidgetItem(row + 1, str(row + 1))
-            rank_item.setTextAlignment(Qt.AlignCenter)
-            self.passing_table.setItem(row, 0, rank_item)
-
-            # Player name (store player data for double-click handler)
-            name = player.get("player_name", "Unknown")
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, player.get("player_id"))
-            name_item.setData(Qt.UserRole + 1, player)
-            self.passing_table.setItem(row, 1, name_item)
-
-            # Position
-            pos = self._get_position_abbr(player.get("position", "QB"))
-            pos_item = QTableWidgetItem(pos)
-            pos_item.setTextAlignment(Qt.AlignCenter)
-            self.passing_table.setItem(row, 2, pos_item)
-
-            # Team abbreviation
-            team_id = player.get("team_id", 0)
-            team_abbr = self._get_team_abbr(team_id)
-            team_item = QTableWidgetItem(team_abbr)
-            team_item.setTextAlignment(Qt.AlignCenter)
-            self.passing_table.setItem(row, 3, team_item)
-
-            # Stats columns
-            cmp = player.get("passing_completions", 0) or 0
-            att = player.get("passing_attempts", 0) or 0
-            yds = player.get("passing_yards", 0) or 0
-            td = player.get("passing_tds", 0) or 0
-            int_ = player.get("passing_interceptions", 0) or 0
-
-            # Completion percentage calculation
-            cmp_pct = (cmp / att * 100) if att > 0 else 0.0
-
-            # Passer rating calculation
-            rtg = self._calculate_passer_rating(cmp, att, yds, td, int_)
-
-            self._set_stat_cell(self.passing_table, row, 4, cmp)
-            self._set_stat_cell(self.passing_table, row, 5, att)
-            self._set_stat_cell(self.passing_table, row, 6, f"{cmp_pct:.1f}%")
-            self._set_stat_cell(self.passing_table, row, 7, yds)
-            self._set_stat_cell(self.passing_table, row, 8, td, highlight=row == 0)
-            self._set_stat_cell(self.passing_table, row, 9, int_)
-            self._set_stat_cell(self.passing_table, row, 10, f"{rtg:.1f}")
-
-    def _populate_rushing_table(self, leaders: List[Dict]):
-        """Populate rushing table with leader data."""
-        self.rushing_table.setRowCount(len(leaders))
-
-        for row, player in enumerate(leaders):
-            # Rank
-            rank_item = NumericTableWidgetItem(row + 1, str(row + 1))
-            rank_item.setTextAlignment(Qt.AlignCenter)
-            self.rushing_table.setItem(row, 0, rank_item)
-
-            # Player name (store player data for double-click handler)
-            name = player.get("player_name", "Unknown")
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, player.get("player_id"))
-            name_item.setData(Qt.UserRole + 1, player)
-            self.rushing_table.setItem(row, 1, name_item)
-
-            # Position
-            pos = self._get_position_abbr(player.get("position", "RB"))
-            pos_item = QTableWidgetItem(pos)
-            pos_item.setTextAlignment(Qt.AlignCenter)
-            self.rushing_table.setItem(row, 2, pos_item)
-
-            # Team abbreviation
-            team_id = player.get("team_id", 0)
-            team_abbr = self._get_team_abbr(team_id)
-            team_item = QTableWidgetItem(team_abbr)
-            team_item.setTextAlignment(Qt.AlignCenter)
-            self.rushing_table.setItem(row, 3, team_item)
-
-            # Stats columns
-            att = player.get("rushing_attempts", 0) or 0
-            yds = player.get("rushing_yards", 0) or 0
-            td = player.get("rushing_tds", 0) or 0
-            rushing_20_plus = player.get("rushing_20_plus", 0) or 0
-            lng = player.get("rushing_long", 0) or 0
-            fum = player.get("rushing_fumbles", 0) or 0
-            fumbles_lost = player.get("fumbles_lost", 0) or 0
-            snaps = player.get("snap_counts_offense", 0) or 0
-
-            # Calculate average
-            avg = yds / att if att > 0 else 0.0
-
-            self._set_stat_cell(self.rushing_table, row, 4, att)
-            self._set_stat_cell(self.rushing_table, row, 5, yds, highlight=row == 0)
-            self._set_stat_cell(self.rushing_table, row, 6, f"{avg:.1f}")
-            self._set_stat_cell(self.rushing_table, row, 7, td)
-            self._set_stat_cell(self.rushing_table, row, 8, rushing_20_plus)
-            self._set_stat_cell(self.rushing_table, row, 9, lng)
-            self._set_stat_cell(self.rushing_table, row, 10, fum)
-            self._set_stat_cell(self.rushing_table, row, 11, fumbles_lost)
-            self._set_stat_cell(self.rushing_table, row, 12, snaps)
-
-    def _populate_receiving_table(self, leaders: List[Dict]):
-        """Populate receiving table with leader data."""
-        self.receiving_table.setRowCount(len(leaders))
-
-        for row, player in enumerate(leaders):
-            # Rank
-            rank_item = NumericTableWidgetItem(row + 1, str(row + 1))
-            rank_item.setTextAlignment(Qt.AlignCenter)
-            self.receiving_table.setItem(row, 0, rank_item)
-
-            # Player name (store player data for double-click handler)
-            name = player.get("player_name", "Unknown")
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, player.get("player_id"))
-            name_item.setData(Qt.UserRole + 1, player)
-            self.receiving_table.setItem(row, 1, name_item)
-
-            # Position
-            pos = self._get_position_abbr(player.get("position", "WR"))
-            pos_item = QTableWidgetItem(pos)
-            pos_item.setTextAlignment(Qt.AlignCenter)
-            self.receiving_table.setItem(row, 2, pos_item)
-
-            # Team abbreviation
-            team_id = player.get("team_id", 0)
-            team_abbr = self._get_team_abbr(team_id)
-            team_item = QTableWidgetItem(team_abbr)
-            team_item.setTextAlignment(Qt.AlignCenter)
-            self.receiving_table.setItem(row, 3, team_item)
-
-            # Stats columns
-            rec = player.get("receptions", 0) or 0
-            tgt = player.get("targets", 0) or 0
-            yds = player.get("receiving_yards", 0) or 0
-            td = player.get("receiving_tds", 0) or 0
-            lng = player.get("receiving_long", 0) or 0
-            drp = player.get("receiving_drops", 0) or 0
-            snaps = player.get("snap_counts_offense", 0) or 0
-
-            # Calculate average
-            avg = yds / rec if rec > 0 else 0.0
-
-            self._set_stat_cell(self.receiving_table, row, 4, rec)
-            self._set_stat_cell(self.receiving_table, row, 5, tgt)
-            self._set_stat_cell(self.receiving_table, row, 6, yds, highlight=row == 0)
-            self._set_stat_cell(self.receiving_table, row, 7, f"{avg:.1f}")
-            self._set_stat_cell(self.receiving_table, row, 8, td)
-            self._set_stat_cell(self.receiving_table, row, 9, lng)
-            self._set_stat_cell(self.receiving_table, row, 10, drp)
-            self._set_stat_cell(self.receiving_table, row, 11, snaps)
-
-    def _populate_defense_table(self, leaders: List[Dict]):
-        """Populate defense table with leader data."""
-        self.defense_table.setRowCount(len(leaders))
-
-        for row, player in enumerate(leaders):
-            # Rank
-            rank_item = NumericTableWidgetItem(row + 1, str(row + 1))
-            rank_item.setTextAlignment(Qt.AlignCenter)
-            self.defense_table.setItem(row, 0, rank_item)
-
-            # Player name (store player data for double-click handler)
-            name = player.get("player_name", "Unknown")
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, player.get("player_id"))
-            name_item.setData(Qt.UserRole + 1, player)
-            self.defense_table.setItem(row, 1, name_item)
-
-            # Position
-            pos = self._get_position_abbr(player.get("position", "LB"))
-            pos_item = QTableWidgetItem(pos)
-            pos_item.setTextAlignment(Qt.AlignCenter)
-            self.defense_table.setItem(row, 2, pos_item)
-
-            # Team abbreviation
-            team_id = player.get("team_id", 0)
-            team_abbr = self._get_team_abbr(team_id)
-            team_item = QTableWidgetItem(team_abbr)
-            team_item.setTextAlignment(Qt.AlignCenter)
-            self.defense_table.setItem(row, 3, team_item)
-
-            # Stats columns - TKL, SOLO, AST, SACK, INT, PD, FF, FR
-            tkl = player.get("tackles_total", 0) or 0
-            solo = player.get("tackles_solo", 0) or 0
-            ast = player.get("tackles_assist", 0) or 0
-            sack = player.get("sacks", 0) or 0
-            int_ = player.get("interceptions", 0) or 0
-            pd = player.get("passes_defended", 0) or 0
-            ff = player.get("forced_fumbles", 0) or 0
-            fr = player.get("fumbles_recovered", 0) or 0
-
-            # Columns: #, Player, Pos, Team, TKL, SOLO, AST, SACK, INT, PD, FF, FR
-            self._set_stat_cell(self.defense_table, row, 4, tkl, highlight=row == 0)
-            self._set_stat_cell(self.defense_table, row, 5, solo)
-            self._set_stat_cell(self.defense_table, row, 6, ast)
-            self._set_stat_cell(self.defense_table, row, 7, f"{sack:.1f}" if isinstance(sack, float) else sack)
-            self._set_stat_cell(self.defense_table, row, 8, int_)
-            self._set_stat_cell(self.defense_table, row, 9, pd)
-            self._set_stat_cell(self.defense_table, row, 10, ff)
-            self._set_stat_cell(self.defense_table, row, 11, fr)
-
-    def _populate_kicking_table(self, leaders: List[Dict]):
-        """Populate kicking table with leader data."""
-        self.kicking_table.setRowCount(len(leaders))
-
-        for row, player in enumerate(leaders):
-            # Rank
-            rank_item = NumericTableWidgetItem(row + 1, str(row + 1))
-            rank_item.setTextAlignment(Qt.AlignCenter)
-            self.kicking_table.setItem(row, 0, rank_item)
-
-            # Player name (store player data for double-click handler)
-            name = player.get("player_name", "Unknown")
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, player.get("player_id"))
-            name_item.setData(Qt.UserRole + 1, player)
-            self.kicking_table.setItem(row, 1, name_item)
-
-            # Team abbreviation
-            team_id = player.get("team_id", 0)
-            team_abbr = self._get_team_abbr(team_id)
-            team_item = QTableWidgetItem(team_abbr)
-            team_item.setTextAlignment(Qt.AlignCenter)
-            self.kicking_table.setItem(row, 2, team_item)
-
-            # Stats columns
-            fgm = player.get("field_goals_made", 0) or 0
-            fga = player.get("field_goals_attempted", 0) or 0
-            xpm = player.get("extra_points_made", 0) or 0
-            xpa = player.get("extra_points_attempted", 0) or 0
-
-            # Calculate percentages
-            fg_pct = (fgm / fga * 100) if fga > 0 else 0.0
-
-            # Calculate total points
-            pts = (fgm * 3) + xpm
-
-            self._set_stat_cell(self.kicking_table, row, 3, fgm, highlight=row == 0)
-            self._set_stat_cell(self.kicking_table, row, 4, fga)
-            self._set_stat_cell(self.kicking_table, row, 5, f"{fg_pct:.1f}%")
-            self._set_stat_cell(self.kicking_table, row, 6, xpm)
-            self._set_stat_cell(self.kicking_table, row, 7, xpa)
-            self._set_stat_cell(self.kicking_table, row, 8, pts)
-
-    def _populate_punting_table(self, leaders: List[Dict]):
-        """Populate punting table with leader data."""
-        self.punting_table.setRowCount(len(leaders))
-
-        for row, player in enumerate(leaders):
-            # Rank
-            rank_item = NumericTableWidgetItem(row + 1, str(row + 1))
-            rank_item.setTextAlignment(Qt.AlignCenter)
-            self.punting_table.setItem(row, 0, rank_item)
-
-            # Player name (store player data for double-click handler)
-            name = player.get("player_name", "Unknown")
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, player.get("player_id"))
-            name_item.setData(Qt.UserRole + 1, player)
-            self.punting_table.setItem(row, 1, name_item)
-
-            # Team abbreviation
-            team_id = player.get("team_id", 0)
-            team_abbr = self._get_team_abbr(team_id)
-            team_item = QTableWidgetItem(team_abbr)
-            team_item.setTextAlignment(Qt.AlignCenter)
-            self.punting_table.setItem(row, 2, team_item)
-
-            # Stats columns
-            punts = player.get("punts", 0) or 0
-            yds = player.get("punt_yards", 0) or 0
-
-            # Calculate average
-            avg = yds / punts if punts > 0 else 0.0
-
-            self._set_stat_cell(self.punting_table, row, 3, punts, highlight=row == 0)
-            self._set_stat_cell(self.punting_table, row, 4, yds)
-            self._set_stat_cell(self.punting_table, row, 5, f"{avg:.1f}")
-
-    def _populate_blocking_table(self, leaders: List[Dict]):
-        """Populate blocking (O-Line) table with leader data."""
-        self.blocking_table.setRowCount(len(leaders))
-
-        for row, player in enumerate(leaders):
-            # Rank
-            rank_item = NumericTableWidgetItem(row + 1, str(row + 1))
-            rank_item.setTextAlignment(Qt.AlignCenter)
-            self.blocking_table.setItem(row, 0, rank_item)
-
-            # Player name (store player data for double-click handler)
-            name = player.get("player_name", "Unknown")
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, player.get("player_id"))
-            name_item.setData(Qt.UserRole + 1, player)
-            self.blocking_table.setItem(row, 1, name_item)
-
-            # Position
-            pos = self._get_position_abbr(player.get("position", "OL"))
-            pos_item = QTableWidgetItem(pos)
-            pos_item.setTextAlignment(Qt.AlignCenter)
-            self.blocking_table.setItem(row, 2, pos_item)
-
-            # Team abbreviation
-            team_id = player.get("team_id", 0)
-            team_abbr = self._get_team_abbr(team_id)
-            team_item = QTableWidgetItem(team_abbr)
-            team_item.setTextAlignment(Qt.AlignCenter)
-            self.blocking_table.setItem(row, 3, team_item)
-
-            # Stats columns
-            # PB = Pass Blocks, PKS = Pancakes, SKA = Sacks Allowed, HUR = Hurries Allowed
-            # PRES = Pressures Allowed, RBG = Run Block Grade, PBE = Pass Block Eff
-            pb = player.get("pass_blocks", 0) or 0
-            pks = player.get("pancakes", 0) or 0
-            ska = player.get("sacks_allowed", 0) or 0
-            hur = player.get("hurries_allowed", 0) or 0
-            pres = player.get("pressures_allowed", 0) or 0
-            rbg = player.get("run_blocking_grade", 0) or 0
-            pbe = player.get("pass_blocking_efficiency", 0) or 0
-
-            self._set_stat_cell(self.blocking_table, row, 4, pb, highlight=row == 0)
-            self._set_stat_cell(self.blocking_table, row, 5, pks)
-            self._set_stat_cell(self.blocking_table, row, 6, ska)
-            self._set_stat_cell(self.blocking_table, row, 7, hur)
-            self._set_stat_cell(self.blocking_table, row, 8, pres)
-            self._set_stat_cell(self.blocking_table, row, 9, f"{rbg:.1f}" if isinstance(rbg, float) else rbg)
-            self._set_stat_cell(self.blocking_table, row, 10, f"{pbe:.1f}%" if isinstance(pbe, float) else f"{pbe}%")
-
-    def _populate_coverage_table(self, leaders: List[Dict]):
-        """Populate coverage (DBs/LBs) table with leader data."""
-        self.coverage_table.setRowCount(len(leaders))
-
-        for row, player in enumerate(leaders):
-            # Rank
-            rank_item = NumericTableWidgetItem(row + 1, str(row + 1))
-            rank_item.setTextAlignment(Qt.AlignCenter)
-            self.coverage_table.setItem(row, 0, rank_item)
-
-            # Player name (store player data for double-click handler)
-            name = player.get("player_name", "Unknown")
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, player.get("player_id"))
-            name_item.setData(Qt.UserRole + 1, player)
-            self.coverage_table.setItem(row, 1, name_item)
-
-            # Position
-            pos = self._get_position_abbr(player.get("position", "CB"))
-            pos_item = QTableWidgetItem(pos)
-            pos_item.setTextAlignment(Qt.AlignCenter)
-            self.coverage_table.setItem(row, 2, pos_item)
-
-            # Team abbreviation
-            team_id = player.get("team_id", 0)
-            team_abbr = self._get_team_abbr(team_id)
-            team_item = QTableWidgetItem(team_abbr)
-            team_item.setTextAlignment(Qt.AlignCenter)
-            self.coverage_table.setItem(row, 3, team_item)
-
-            # Stats columns
-            # TGT = Coverage Targets, CMP = Completions Allowed, YDS = Yards Allowed
-            # CMP% = Completion % allowed, PD = Passes Defended, INT = Interceptions
-            tgt = player.get("coverage_targets", 0) or 0
-            cmp = player.get("coverage_completions", 0) or 0
-            yds = player.get("coverage_yards_allowed", 0) or 0
-            pd = player.get("passes_defended", 0) or 0
-            int_ = player.get("interceptions", 0) or 0
-            snaps = player.get("snap_counts_defense", 0) or 0
-
-            # Calculate completion percentage allowed
-            cmp_pct = (cmp / tgt * 100) if tgt > 0 else 0.0
-
-            self._set_stat_cell(self.coverage_table, row, 4, tgt, highlight=row == 0)
-            self._set_stat_cell(self.coverage_table, row, 5, cmp)
-            self._set_stat_cell(self.coverage_table, row, 6, yds)
-            self._set_stat_cell(self.coverage_table, row, 7, f"{cmp_pct:.1f}%")
-            self._set_stat_cell(self.coverage_table, row, 8, pd)
-            self._set_stat_cell(self.coverage_table, row, 9, int_)
-            self._set_stat_cell(self.coverage_table, row, 10, snaps)
-
-    def _populate_pass_rush_table(self, leaders: List[Dict]):
-        """Populate pass rush (DL/EDGE) table with leader data."""
-        self.pass_rush_table.setRowCount(len(leaders))
-
-        for row, player in enumerate(leaders):
-            # Rank
-            rank_item = NumericTableWidgetItem(row + 1, str(row + 1))
-            rank_item.setTextAlignment(Qt.AlignCenter)
-            self.pass_rush_table.setItem(row, 0, rank_item)
-
-            # Player name (store player data for double-click handler)
-            name = player.get("player_name", "Unknown")
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, player.get("player_id"))
-            name_item.setData(Qt.UserRole + 1, player)
-            self.pass_rush_table.setItem(row, 1, name_item)
-
-            # Position
-            pos = self._get_position_abbr(player.get("position", "DE"))
-            pos_item = QTableWidgetItem(pos)
-            pos_item.setTextAlignment(Qt.AlignCenter)
-            self.pass_rush_table.setItem(row, 2, pos_item)
-
-            # Team abbreviation
-            team_id = player.get("team_id", 0)
-            team_abbr = self._get_team_abbr(team_id)
-            team_item = QTableWidgetItem(team_abbr)
-            team_item.setTextAlignment(Qt.AlignCenter)
-            self.pass_rush_table.setItem(row, 3, team_item)
-
-            # Stats columns
-            # PR ATT = Pass Rush Attempts, PR WIN = Pass Rush Wins, WIN% = Win Rate
-            # SACK = Sacks, DBL = Times Double Teamed
-            pr_att = player.get("pass_rush_attempts", 0) or 0
-            pr_win = player.get("pass_rush_wins", 0) or 0
-            sack = player.get("sacks", 0) or 0
-            dbl = player.get("times_double_teamed", 0) or 0
-            snaps = player.get("snap_counts_defense", 0) or 0
-
-            # Calculate win percentage
-            win_pct = (pr_win / pr_att * 100) if pr_att > 0 else 0.0
-
-            self._set_stat_cell(self.pass_rush_table, row, 4, pr_att, highlight=row == 0)
-            self._set_stat_cell(self.pass_rush_table, row, 5, pr_win)
-            self._set_stat_cell(self.pass_rush_table, row, 6, f"{win_pct:.1f}%")
-            self._set_stat_cell(self.pass_rush_table, row, 7, f"{sack:.1f}" if isinstance(sack, float) else sack)
-            self._set_stat_cell(self.pass_rush_table, row, 8, dbl)
-            self._set_stat_cell(self.pass_rush_table, row, 9, snaps)
-
-    # === Helper Methods ===
-
-    def _set_stat_cell(
-        self,
-        table: QTableWidget,
-        row: int,
-        col: int,
-        value: Any,
-        highlight: bool = False
-    ):
-        """Set a stat cell with proper formatting and numeric sorting."""
-        # Parse numeric value for sorting
-        sort_value = value
-        display_text = str(value)
-
-        if isinstance(value, str):
-            # Handle percentage strings like "85.5%"
-            if value.endswith("%"):
-                try:
-                    sort_value = float(value[:-1])
-                except ValueError:
-                    sort_value = 0
-            else:
-                # Try to parse as float
-                try:
-                    sort_value = float(value)
-                except ValueError:
-                    sort_value = value  # Keep as string
-
-        # Use NumericTableWidgetItem for numeric values
-        if isinstance(sort_value, (int, float)):
-            item = NumericTableWidgetItem(sort_value, display_text)
+        """Update summary panel with aggregate stats (cached or loaded in the background)."""
+        query = self._query(SUMMARY)
+        cached = self._leaderboards.peek(query)
+        if cached is not None:
+            self._show_summary(cached)
         else:
-            item = QTableWidgetItem(display_text)
+            self._loader.request(query)
 
-        item.setTextAlignment(Qt.AlignCenter)
+    def _show_summary(self, summary: Dict[str, int]):
+        """Show summary counts (games, players, current week)."""
+        self.games_label.setText(str(summary.get("games", 0)))
+        self.players_label.setText(str(summary.get("players", 0)))
+        self.week_label.setText(str(summary.get("week", 0)))
 
-        if highlight:
-            item.setForeground(QColor("#2E7D32"))
-            item.setFont(Typography.SMALL_BOLD)
-
-        table.setItem(row, col, item)
+    # === Helper Methods ===
 
     def _get_team_abbr(self, team_id: int) -> str:
         """Get team abbreviation from team ID."""
@@ -1271,33 +865,25 @@ class StatsView(QWidget):
         self.players_label.setText("0")
         self.week_label.setText("0")
 
-        self.passing_table.setRowCount(0)
-        self.rushing_table.setRowCount(0)
-        self.receiving_table.setRowCount(0)
-        self.defense_table.setRowCount(0)
-        self.kicking_table.setRowCount(0)
-        self.punting_table.setRowCount(0)
-        self.blocking_table.setRowCount(0)
-        self.coverage_table.setRowCount(0)
-        self.pass_rush_table.setRowCount(0)
-
-    def _on_stats_player_double_clicked(self, row: int, column: int):
+        for tab in self._tabs:
+            tab.loaded_query = None
+            tab.result = None
+            tab.model.clear()
+
+    def _on_stats_player_double_clicked(self, index: QModelIndex):
         """Handle stats table double-click - open player detail dialog."""
-        table = self.sender()
-        if not table:
+        if not index.isValid():
             return
 
-        # Player name is in column 1 for most tables, column 1 for kicking/punting
-        name_col = 1
-        name_item = table.item(row, name_col)
-        if not name_item:
+        # Every cell carries its row's player dict
+        player_data = index.data(RECORD_ROLE)
+        if not player_data:
             return
 
-        player_id = name_item.data(Qt.UserRole)
-        player_data = name_item.data(Qt.UserRole + 1)
-        player_name = name_item.text()
+        player_id = player_data.get("player_id")
+        player_name = player_data.get("player_name", "Unknown")
 
-        if not player_id or not player_data:
+        if not player_id:
             return
 
         if not self._dynasty_id or not self._db_path:
@@ -553,9 +553,9 @@ class TeamView(QWidget):
                 """SELECT event_id, game_id, data
                    FROM events
                    WHERE dynasty_id = ?
-                     AND json_extract(data, '$.parameters.season') = ?
-                     AND json_extract(data, '$.parameters.season_type') = 'regular_season'
-                   ORDER BY json_extract(data, '$.parameters.week'), game_id""",
+                     AND game_season = ?
+                     AND game_season_type = 'regular_season'
+                   ORDER BY game_week, game_id""",
                 (self._dynasty_id, self._season)
             )
 
@@ -6,6 +6,10 @@ Supports multiple dynasties with complete data isolation.
 """
 
 from .connection import DatabaseConnection
+from .database_manager import DatabaseManager, DatabaseManagerStats, get_database_manager
 from .transaction_context import TransactionContext, TransactionState, transaction
 
-__all__ = ['DatabaseConnection', 'TransactionContext', 'TransactionState', 'transaction']
\ No newline at end of file
+__all__ = [
+    'DatabaseConnection', 'DatabaseManager', 'DatabaseManagerStats', 'get_database_manager',
+    'TransactionContext', 'TransactionState', 'transaction'
+]
\ No newline at end of file
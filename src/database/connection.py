@@ -13,6 +13,8 @@ import uuid
 from typing import Optional, Dict, Any
 import logging
 
+from .database_manager import get_database_manager, schema_fingerprint
+
 
 class DatabaseConnection:
     """
@@ -986,19 +988,34 @@ class DatabaseConnection:
             self.logger.error(f"Error initializing standings: {e}")
             # Don't raise - this is a best-effort initialization
 
+    # Name of this schema in schema_version (see DatabaseManager)
+    SCHEMA_FILE = "database/connection.py"
+    _schema_version: Optional[str] = None
+
+    @classmethod
+    def schema_version(cls) -> str:
+        """Version of the tables created by this module (changes when it is edited)."""
+        if cls._schema_version is None:
+            cls._schema_version = schema_fingerprint(Path(__file__).read_bytes())
+        return cls._schema_version
+
     def get_connection(self) -> sqlite3.Connection:
         """
         Get a database connection with schema initialized.
 
+        Tables are created once per database file and schema version; the
+        standings repair in _create_tables still runs on every connection.
+
         Returns:
             SQLite connection object with tables created
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        conn.execute("PRAGMA foreign_keys=ON")
+        manager = get_database_manager()
+        conn = manager.connect(self.db_path)  # Row factory, foreign keys, WAL
 
         # Ensure tables exist (idempotent - safe to call multiple times)
-        self._create_tables(conn)
+        created = manager.ensure_schema(conn, self.SCHEMA_FILE, self.schema_version(), self._create_tables)
+        if not created:
+            self._initialize_standings_if_empty(conn)
 
         return conn
     
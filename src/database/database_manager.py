@@ -0,0 +1,383 @@
+"""
+Database Manager
+
+Process-wide schema registry and connection manager for SQLite files.
+
+Schema setup used to run every time a database object was constructed:
+GameCycleDatabase applied all of schema.sql plus each migration check, and
+DatabaseConnection re-ran its CREATE TABLE statements on every
+get_connection(). The manager records the applied schema version of each
+schema file in a schema_version table inside the database itself, and skips
+the work while it is current.
+
+Key Features:
+- Schema-once registry: ensure_schema() runs a setup callable only when
+  the database's schema_version row for that file is missing or outdated
+- Thread-affine pooling: acquire()/release() reuse the calling thread's
+  idle connections to the same file (connections never cross threads)
+- Uniform pragmas: WAL, busy_timeout, foreign_keys, cache_size, mmap_size
+- Counters for connection opens/reuses, schema runs/skips and waits
+
+Usage:
+    manager = get_database_manager()
+
+    with manager.connection(db_path) as conn:
+        manager.ensure_schema(conn, "my_module/schema.sql", version, apply_schema)
+        conn.execute("SELECT ...")
+
+    print(manager.get_stats())
+
+Thread Safety:
+    All public methods can be called from any thread. Pooled connections are
+    only handed back to the thread that opened them.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+# Applied schema version per schema file (one row per file)
+SCHEMA_VERSION_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        schema_file TEXT PRIMARY KEY,
+        version TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+@dataclass
+class DatabaseManagerStats:
+    """Counters for database manager monitoring."""
+
+    opens: int = 0           # New sqlite3 connections
+    reuses: int = 0          # Connections handed out from a thread's idle pool
+    schema_runs: int = 0     # Schema setups executed
+    schema_skips: int = 0    # Schema checks satisfied by schema_version
+    pool_waits: int = 0      # Schema checks that waited for another thread's setup
+    wait_time_total: float = 0.0
+
+
+def schema_fingerprint(*parts: Union[str, bytes]) -> str:
+    """
+    Version string for a schema built from the given sources.
+
+    Args:
+        parts: Schema SQL / source text the schema depends on
+
+    Returns:
+        Short hex digest that changes whenever any part changes
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8') if isinstance(part, str) else part)
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
+
+class DatabaseManager:
+    """
+    Schema registry and thread-affine connection pool shared by the process.
+
+    Use get_database_manager() rather than creating instances, so every
+    database object shares the same pools and counters.
+    """
+
+    PRAGMAS = (
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA busy_timeout = 30000",     # ms
+        "PRAGMA foreign_keys = ON",
+        "PRAGMA cache_size = -16000",      # 16 MB page cache
+        "PRAGMA mmap_size = 268435456",    # 256 MB memory-mapped reads
+    )
+
+    # Idle connections kept per thread and file
+    MAX_IDLE_PER_FILE = 4
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._file_locks: Dict[str, threading.Lock] = {}
+        self._stats = DatabaseManagerStats()
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def connect(self, db_path: str) -> sqlite3.Connection:
+        """
+        Open a new (unpooled) connection with the standard pragmas.
+
+        The caller owns the connection and closes it.
+
+        Args:
+            db_path: Path to SQLite database (or ":memory:")
+
+        Returns:
+            Connection with sqlite3.Row row factory
+        """
+        conn = sqlite3.connect(db_path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        with self._lock:
+            self._stats.opens += 1
+        return conn
+
+    def acquire(self, db_path: str) -> sqlite3.Connection:
+        """
+        Get a connection for the calling thread, reusing an idle one if possible.
+
+        Pass it back with release() instead of closing it.
+
+        Args:
+            db_path: Path to SQLite database (or ":memory:", never pooled)
+
+        Returns:
+            Connection with sqlite3.Row row factory and the standard pragmas
+        """
+        key = self._key(db_path)
+        idle = self._idle().get(key)
+
+        while idle:
+            conn, identity = idle.pop()
+            if identity == self._file_identity(key) and self._usable(conn):
+                conn.execute("PRAGMA foreign_keys = ON")  # In case a caller turned it off
+                with self._lock:
+                    self._stats.reuses += 1
+                return conn
+            # File replaced/deleted since release, or connection closed by its user
+            self._close_quietly(conn)
+
+        return self.connect(db_path)
+
+    def release(self, conn: sqlite3.Connection, db_path: str) -> None:
+        """
+        Return a connection from acquire() to the calling thread's idle pool.
+
+        Uncommitted changes are rolled back, as closing the connection would.
+
+        Args:
+            conn: Connection to return
+            db_path: Path it was acquired for
+        """
+        key = self._key(db_path)
+        if not self._usable(conn):
+            self._close_quietly(conn)
+            return
+
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = sqlite3.Row
+            conn.isolation_level = ""
+        except sqlite3.Error:
+            self._close_quietly(conn)
+            return
+
+        idle = self._idle().setdefault(key, [])
+        identity = self._file_identity(key)
+        if key == ":memory:" or identity is None or len(idle) >= self.MAX_IDLE_PER_FILE:
+            # In-memory databases live and die with their connection
+            self._close_quietly(conn)
+            return
+        idle.append((conn, identity))
+
+    @contextmanager
+    def connection(self, db_path: str) -> Iterator[sqlite3.Connection]:
+        """
+        Pooled connection for a with block (released on exit, not committed).
+
+        Args:
+            db_path: Path to SQLite database
+
+        Yields:
+            Connection from acquire()
+        """
+        conn = self.acquire(db_path)
+        try:
+            yield conn
+        finally:
+            self.release(conn, db_path)
+
+    def close_idle(self) -> None:
+        """Close the calling thread's idle connections."""
+        idle = self._idle()
+        for connections in idle.values():
+            for conn, _ in connections:
+                self._close_quietly(conn)
+        idle.clear()
+
+    # ------------------------------------------------------------------
+    # Schema registry
+    # ------------------------------------------------------------------
+
+    def ensure_schema(
+        self,
+        conn: sqlite3.Connection,
+        schema_file: str,
+        version: str,
+        apply: Callable[[sqlite3.Connection], None]
+    ) -> bool:
+        """
+        Run a schema setup unless the database already records this version.
+
+        Setups of the same file are serialized across threads; a thread that
+        waited re-checks the version before running the setup itself.
+
+        Args:
+            conn: Connection to the database
+            schema_file: Name identifying the schema (e.g. "game_cycle/schema.sql")
+            version: Current version (see schema_fingerprint())
+            apply: Idempotent setup, called with conn; must leave no open
+                transaction the manager should not commit
+
+        Returns:
+            True if the setup ran, False if the schema was current
+        """
+        if self._recorded_version(conn, schema_file) == version:
+            with self._lock:
+                self._stats.schema_skips += 1
+            return False
+
+        file_lock = self._file_lock(self._key(self._database_file(conn)))
+        if not file_lock.acquire(blocking=False):
+            start = time.perf_counter()
+            file_lock.acquire()
+            with self._lock:
+                self._stats.pool_waits += 1
+                self._stats.wait_time_total += time.perf_counter() - start
+
+        try:
+            if self._recorded_version(conn, schema_file) == version:
+                with self._lock:
+                    self._stats.schema_skips += 1
+                return False
+
+            apply(conn)
+            conn.execute(SCHEMA_VERSION_TABLE_SQL)
+            conn.execute(
+                "INSERT OR REPLACE INTO schema_version (schema_file, version, applied_at) "
+                "VALUES (?, ?, CURRENT_TIMESTAMP)",
+                (schema_file, version)
+            )
+            conn.commit()
+            with self._lock:
+                self._stats.schema_runs += 1
+            logger.debug(f"Applied {schema_file} version {version}")
+            return True
+        finally:
+            file_lock.release()
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> DatabaseManagerStats:
+        """Snapshot of the manager's counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    def reset_stats(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self._stats = DatabaseManagerStats()
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(db_path: str) -> str:
+        """Pool/lock key for a database path."""
+        if db_path == ":memory:" or db_path.startswith("file:"):
+            return db_path
+        return os.path.abspath(db_path)
+
+    @staticmethod
+    def _file_identity(key: str) -> Optional[Tuple[int, int, int]]:
+        """
+        (device, inode, ctime) of a database file, or None if it does not exist.
+
+        Inodes are reused as soon as a file is deleted, so a database deleted
+        and recreated at the same path is told apart by its ctime. In WAL mode
+        the main file only changes at checkpoints, which at worst costs a
+        reconnect.
+        """
+        if key == ":memory:":
+            return None
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return None
+        return (stat.st_dev, stat.st_ino, stat.st_ctime_ns)
+
+    @staticmethod
+    def _database_file(conn: sqlite3.Connection) -> str:
+        """File of a connection's main database ("" for in-memory)."""
+        for _, name, filename in conn.execute("PRAGMA database_list"):
+            if name == "main":
+                return filename or ":memory:"
+        return ":memory:"
+
+    @staticmethod
+    def _recorded_version(conn: sqlite3.Connection, schema_file: str) -> Optional[str]:
+        """Version recorded for a schema file, or None."""
+        try:
+            row = conn.execute(
+                "SELECT version FROM schema_version WHERE schema_file = ?",
+                (schema_file,)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None  # No schema_version table yet
+        return row[0] if row else None
+
+    @staticmethod
+    def _usable(conn: sqlite3.Connection) -> bool:
+        """Whether a connection is still open."""
+        try:
+            conn.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _idle(self) -> Dict[str, List[Tuple[sqlite3.Connection, Tuple[int, int, int]]]]:
+        """The calling thread's idle connections by file."""
+        idle = getattr(self._local, "idle", None)
+        if idle is None:
+            idle = self._local.idle = {}
+        return idle
+
+    def _file_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._file_locks.setdefault(key, threading.Lock())
+
+
+_manager: Optional[DatabaseManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_database_manager() -> DatabaseManager:
+    """The process-wide DatabaseManager."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = DatabaseManager()
+    return _manager
@@ -383,6 +383,10 @@ class DynastyDatabaseAPI:
                 ("players", "DELETE FROM players WHERE dynasty_id = ?"),
                 ("box_scores", "DELETE FROM box_scores WHERE dynasty_id = ?"),
                 ("player_game_stats", "DELETE FROM player_game_stats WHERE dynasty_id = ?"),
+                ("season_player_stat_ranks", "DELETE FROM season_player_stat_ranks WHERE dynasty_id = ?"),
+                ("season_player_stat_totals", "DELETE FROM season_player_stat_totals WHERE dynasty_id = ?"),
+                ("season_team_stat_totals", "DELETE FROM season_team_stat_totals WHERE dynasty_id = ?"),
+                ("season_stat_aggregate_games", "DELETE FROM season_stat_aggregate_games WHERE dynasty_id = ?"),
                 ("games", "DELETE FROM games WHERE dynasty_id = ?"),
                 ("standings", "DELETE FROM standings WHERE dynasty_id = ?"),
                 ("schedules", "DELETE FROM schedules WHERE dynasty_id = ?"),
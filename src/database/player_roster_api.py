@@ -12,6 +12,7 @@ Architecture:
 
 from typing import List, Dict, Any, Optional
 from database.connection import DatabaseConnection
+from team_management.team_data_cache import invalidate_team_data
 import sqlite3
 import json
 import logging
@@ -307,6 +308,51 @@ class PlayerRosterAPI:
 
         return roster  # Already converted to dicts by execute_query()
 
+    def get_all_team_rosters(self, dynasty_id: str) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Load the active rosters of every team in one query.
+
+        Same rows and ordering as get_team_roster(), grouped by team. Teams
+        without active players are missing from the result.
+
+        Args:
+            dynasty_id: Dynasty context
+
+        Returns:
+            Dict mapping team_id to list of player dictionaries
+        """
+        query = """
+            SELECT
+                p.player_id,
+                p.first_name,
+                p.last_name,
+                p.number,
+                p.team_id,
+                p.positions,
+                p.attributes,
+                p.status,
+                p.years_pro,
+                p.birthdate,
+                tr.depth_chart_order,
+                tr.roster_status
+            FROM players p
+            JOIN team_rosters tr
+                ON p.dynasty_id = tr.dynasty_id
+                AND p.player_id = tr.player_id
+            WHERE p.dynasty_id = ?
+                AND p.team_id BETWEEN 1 AND 32
+                AND tr.roster_status = 'active'
+            ORDER BY p.team_id,
+                     tr.depth_chart_order,
+                     json_extract(p.attributes, '$.overall') DESC,
+                     p.number
+        """
+
+        rosters: Dict[int, List[Dict[str, Any]]] = {}
+        for player in self.db_connection.execute_query(query, (dynasty_id,)):
+            rosters.setdefault(player['team_id'], []).append(player)
+        return rosters
+
     def get_full_roster(self, dynasty_id: str, team_id: int) -> List[Dict[str, Any]]:
         """
         Load FULL team roster (active + inactive players).
@@ -490,6 +536,8 @@ class PlayerRosterAPI:
                            VALUES (?, ?, ?, 'active', 99)""",
                         (dynasty_id, new_team_id, player_id)
                     )
+            # Previous team is not known here, so drop the whole dynasty
+            invalidate_team_data(dynasty_id)
             return  # Don't commit - caller manages transaction
 
         # Fallback to db_connection for non-transaction mode
@@ -533,6 +581,9 @@ class PlayerRosterAPI:
                     (dynasty_id, new_team_id, player_id)
                 )
 
+        # Previous team is not known here, so drop the whole dynasty
+        invalidate_team_data(dynasty_id)
+
     def update_player_contract_id(self, dynasty_id: str, player_id: int, contract_id: int) -> None:
         """
         Update player's contract_id reference (after signing new contract).
@@ -548,6 +599,11 @@ class PlayerRosterAPI:
             WHERE dynasty_id = ? AND player_id = ?
         """
 
+        # Use shared connection if available (for transaction mode)
+        if self.shared_conn:
+            self.shared_conn.execute(update_query, (contract_id, dynasty_id, player_id))
+            return  # Don't commit - caller manages transaction
+
         self.db_connection.execute_update(
             update_query,
             (contract_id, dynasty_id, player_id)
@@ -600,6 +656,7 @@ class PlayerRosterAPI:
         # Add to roster if on a team
         if team_id > 0:
             self._add_to_roster(dynasty_id, team_id, new_player_id)
+            invalidate_team_data(dynasty_id, team_id)
 
         return new_player_id
 
@@ -175,6 +175,274 @@ class TransactionContext:
         self.connection.rollback()
 
 
+GAME_RESULT_INSERT_SQL = """
+    INSERT OR REPLACE INTO games (
+        dynasty_id, game_id, season, week, season_type, game_type,
+        game_date, home_team_id, away_team_id, home_score, away_score,
+        total_plays, game_duration_minutes, overtime_periods
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def game_result_values(dynasty_id: str, game_result: Dict[str, Any]) -> Tuple:
+    """
+    Build the GAME_RESULT_INSERT_SQL parameters for one game.
+
+    Args:
+        dynasty_id: Dynasty identifier
+        game_result: Game result dictionary (see games_insert_result)
+
+    Returns:
+        Parameter tuple in column order
+    """
+    return (
+        dynasty_id,
+        game_result.get('game_id'),
+        game_result.get('season'),
+        game_result.get('week'),
+        game_result.get('season_type', 'regular_season'),
+        game_result.get('game_type', 'regular'),
+        game_result.get('game_date'),
+        game_result.get('home_team_id'),
+        game_result.get('away_team_id'),
+        game_result.get('home_score'),
+        game_result.get('away_score'),
+        game_result.get('total_plays'),
+        game_result.get('game_duration_minutes'),
+        game_result.get('overtime_periods', 0)
+    )
+
+
+# Column list shared by stats_insert_game_stats() and batched week persistence
+# IMPORTANT: All columns must match the schema in connection.py
+# Including PFF-critical stats for accurate position grading
+PLAYER_GAME_STATS_INSERT_SQL = """
+    INSERT OR REPLACE INTO player_game_stats (
+        dynasty_id, game_id, season_type, player_id, player_name,
+        team_id, position,
+        passing_yards, passing_tds, passing_attempts, passing_completions,
+        passing_interceptions, passing_sacks, passing_sack_yards, passing_rating, air_yards,
+        rushing_yards, rushing_tds, rushing_attempts, rushing_long, rushing_20_plus, rushing_fumbles, fumbles_lost,
+        receiving_yards, receiving_tds, receptions, targets, receiving_long, receiving_drops, yards_after_catch,
+        tackles_total, tackles_solo, tackles_assist, sacks, interceptions,
+        forced_fumbles, fumbles_recovered, passes_defended, tackles_for_loss, qb_hits, qb_pressures,
+        field_goals_made, field_goals_attempted, extra_points_made, extra_points_attempted,
+        punts, punt_yards,
+        pancakes, sacks_allowed, hurries_allowed, pressures_allowed, pass_blocks,
+        run_blocking_grade, pass_blocking_efficiency, missed_assignments,
+        holding_penalties, false_start_penalties, downfield_blocks,
+        double_team_blocks, chip_blocks,
+        snap_counts_offense, snap_counts_defense, snap_counts_special_teams,
+        fantasy_points,
+        coverage_targets, coverage_completions, coverage_yards_allowed,
+        pass_rush_wins, pass_rush_attempts, times_double_teamed, blocking_encounters,
+        broken_tackles, tackles_faced, yards_after_contact,
+        pressures_faced, time_to_throw_total, throw_count,
+        missed_tackles
+    ) VALUES (
+        ?, ?, ?, ?, ?,
+        ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?,
+        ?, ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?,
+        ?, ?,
+        ?, ?, ?,
+        ?,
+        ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?,
+        ?
+    )
+"""
+
+
+def player_game_stats_values(
+    dynasty_id: str,
+    game_id: str,
+    season_type: str,
+    stats: Dict[str, Any]
+) -> Tuple:
+    """
+    Build the PLAYER_GAME_STATS_INSERT_SQL parameters for one player.
+
+    Args:
+        dynasty_id: Dynasty identifier
+        game_id: Game identifier
+        season_type: 'regular_season' or 'playoffs'
+        stats: Player stat dictionary (missing stats default to 0)
+
+    Returns:
+        Parameter tuple in column order
+    """
+    return (
+        dynasty_id,
+        game_id,
+        season_type,
+        stats.get('player_id'),
+        stats.get('player_name', ''),
+        stats.get('team_id'),
+        stats.get('position', ''),
+        # Passing stats
+        stats.get('passing_yards', 0),
+        stats.get('passing_tds', 0),
+        stats.get('passing_attempts', 0),
+        stats.get('passing_completions', 0),
+        stats.get('passing_interceptions', 0),
+        stats.get('passing_sacks', 0),
+        stats.get('passing_sack_yards', 0),
+        stats.get('passing_rating', 0.0),
+        stats.get('air_yards', 0),
+        # Rushing stats
+        stats.get('rushing_yards', 0),
+        stats.get('rushing_tds', 0),
+        stats.get('rushing_attempts', 0),
+        stats.get('rushing_long', 0),
+        stats.get('rushing_20_plus', 0),
+        stats.get('rushing_fumbles', 0),
+        stats.get('fumbles_lost', 0),
+        # Receiving stats
+        stats.get('receiving_yards', 0),
+        stats.get('receiving_tds', 0),
+        stats.get('receptions', 0),
+        stats.get('targets', 0),
+        stats.get('receiving_long', 0),
+        stats.get('receiving_drops', 0),
+        stats.get('yards_after_catch', 0),
+        # Defensive stats
+        stats.get('tackles_total', 0),
+        stats.get('tackles_solo', 0),
+        stats.get('tackles_assist', 0),
+        stats.get('sacks', 0.0),
+        stats.get('interceptions', 0),
+        stats.get('forced_fumbles', 0),
+        stats.get('fumbles_recovered', 0),
+        stats.get('passes_defended', 0),
+        stats.get('tackles_for_loss', 0),
+        stats.get('qb_hits', 0),
+        stats.get('qb_pressures', 0),
+        # Special teams stats
+        stats.get('field_goals_made', 0),
+        stats.get('field_goals_attempted', 0),
+        stats.get('extra_points_made', 0),
+        stats.get('extra_points_attempted', 0),
+        stats.get('punts', 0),
+        stats.get('punt_yards', 0),
+        # O-Line stats
+        stats.get('pancakes', 0),
+        stats.get('sacks_allowed', 0),
+        stats.get('hurries_allowed', 0),
+        stats.get('pressures_allowed', 0),
+        stats.get('pass_blocks', 0),
+        stats.get('run_blocking_grade', 0.0),
+        stats.get('pass_blocking_efficiency', 0.0),
+        stats.get('missed_assignments', 0),
+        stats.get('holding_penalties', 0),
+        stats.get('false_start_penalties', 0),
+        stats.get('downfield_blocks', 0),
+        stats.get('double_team_blocks', 0),
+        stats.get('chip_blocks', 0),
+        # Snap counts
+        stats.get('snap_counts_offense', 0),
+        stats.get('snap_counts_defense', 0),
+        stats.get('snap_counts_special_teams', 0),
+        # Fantasy
+        stats.get('fantasy_points', 0.0),
+        # PFF-critical stats for position grading
+        # Coverage stats (DB/LB grading)
+        stats.get('coverage_targets', 0),
+        stats.get('coverage_completions', 0),
+        stats.get('coverage_yards_allowed', 0),
+        # Pass rush stats (DL grading)
+        stats.get('pass_rush_wins', 0),
+        stats.get('pass_rush_attempts', 0),
+        stats.get('times_double_teamed', 0),
+        stats.get('blocking_encounters', 0),
+        # Ball carrier stats (RB/WR grading)
+        stats.get('broken_tackles', 0),
+        stats.get('tackles_faced', 0),
+        stats.get('yards_after_contact', 0),
+        # QB advanced stats
+        stats.get('pressures_faced', 0),
+        stats.get('time_to_throw_total', 0.0),
+        stats.get('throw_count', 0),
+        # Tackling
+        stats.get('missed_tackles', 0),
+    )
+
+
+# Typed schedule columns on the events table, derived from GAME event
+# parameters. They are VIRTUAL (no extra storage, always in sync with
+# `data` whichever writer changed it); idx_events_schedule turns week and
+# season schedule lookups into an index search instead of a json_extract
+# scan over every event of the dynasty.
+SCHEDULE_COLUMNS = (
+    ("game_season", "INTEGER", "CAST(json_extract(data, '$.parameters.season') AS INTEGER)"),
+    ("game_week", "INTEGER", "CAST(json_extract(data, '$.parameters.week') AS INTEGER)"),
+    ("game_season_type", "TEXT", "json_extract(data, '$.parameters.season_type')"),
+)
+
+SCHEDULE_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_events_schedule
+    ON events(dynasty_id, game_season, game_season_type, game_week)
+"""
+
+
+def ensure_schedule_columns(conn: sqlite3.Connection) -> int:
+    """
+    Add the schedule columns and idx_events_schedule to the events table.
+
+    Safe to call on every open: existing columns are skipped and building
+    the index backfills it for events already stored. Does not commit.
+
+    Args:
+        conn: Connection to a database with an events table
+
+    Returns:
+        Number of columns added (0 if up to date or there is no events table)
+    """
+    # table_xinfo (unlike table_info) lists generated columns
+    existing = {row[1] for row in conn.execute("PRAGMA table_xinfo(events)")}
+    if not existing:
+        return 0
+
+    added = 0
+    for name, col_type, expression in SCHEDULE_COLUMNS:
+        if name not in existing:
+            conn.execute(
+                f"ALTER TABLE events ADD COLUMN {name} {col_type} "
+                f"GENERATED ALWAYS AS ({expression}) VIRTUAL"
+            )
+            added += 1
+    conn.execute(SCHEDULE_INDEX_SQL)
+    return added
+
+
+def dedupe_player_game_stats(player_stats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Keep the last stat entry for each (player_id, team_id).
+
+    Args:
+        player_stats: Player stat dictionaries for one game
+
+    Returns:
+        Deduplicated list (most recent/final stats win)
+    """
+    seen_players = {}
+    for stats in player_stats:
+        player_key = (stats.get('player_id'), stats.get('team_id'))
+        seen_players[player_key] = stats  # Overwrites duplicates
+    return list(seen_players.values())
+
+
 class UnifiedDatabaseAPI:
     """
     Unified database API providing single entry point for all database operations.
@@ -344,6 +612,10 @@ class UnifiedDatabaseAPI:
             conn.commit()
             self.logger.info("Events table created successfully")
 
+        if ensure_schedule_columns(conn):
+            self.logger.info("Added schedule columns to events table")
+        conn.commit()
+
     def _get_connection(self) -> sqlite3.Connection:
         """
         Get database connection from pool or active transaction.
@@ -920,7 +1192,8 @@ class UnifiedDatabaseAPI:
         Get scheduled games from events table for a specific week.
 
         The schedule is stored as GAME events in the events table with
-        game parameters in the JSON data field.
+        game parameters in the JSON data field; the lookup uses the
+        indexed schedule columns (see SCHEDULE_COLUMNS).
 
         Args:
             season: Season year (e.g., 2025)
@@ -940,10 +1213,9 @@ class UnifiedDatabaseAPI:
         """
         query = """
             SELECT event_id, game_id, data FROM events
-            WHERE dynasty_id = ? AND event_type = 'GAME'
-            AND CAST(json_extract(data, '$.parameters.season') AS INTEGER) = ?
-            AND CAST(json_extract(data, '$.parameters.week') AS INTEGER) = ?
-            AND json_extract(data, '$.parameters.season_type') = ?
+            WHERE dynasty_id = ? AND game_season = ?
+            AND game_week = ? AND game_season_type = ?
+            AND event_type = 'GAME'
             ORDER BY json_extract(data, '$.parameters.game_date')
         """
         results = self._execute_query(query, (self.dynasty_id, season, week, season_type))
@@ -989,10 +1261,9 @@ class UnifiedDatabaseAPI:
         """
         query = """
             SELECT event_id, game_id, data FROM events
-            WHERE dynasty_id = ? AND event_type = 'GAME'
-            AND json_extract(data, '$.parameters.season') = ?
-            AND json_extract(data, '$.parameters.season_type') = ?
-            ORDER BY json_extract(data, '$.parameters.week'), game_id
+            WHERE dynasty_id = ? AND game_season = ?
+            AND game_season_type = ? AND event_type = 'GAME'
+            ORDER BY game_week, game_id
         """
         results = self._execute_query(query, (self.dynasty_id, season, season_type))
 
@@ -1792,6 +2063,7 @@ class UnifiedDatabaseAPI:
             conn.execute('CREATE INDEX IF NOT EXISTS idx_event_type ON events(event_type)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_events_dynasty_timestamp ON events(dynasty_id, timestamp)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_events_dynasty_type ON events(dynasty_id, event_type)')
+            ensure_schedule_columns(conn)
 
             # Only commit if not in active transaction
             if self._active_transaction is None:
@@ -2764,32 +3036,9 @@ class UnifiedDatabaseAPI:
             True if successful, False otherwise
         """
         try:
-            query = '''
-                INSERT OR REPLACE INTO games (
-                    dynasty_id, game_id, season, week, season_type, game_type,
-                    game_date, home_team_id, away_team_id, home_score, away_score,
-                    total_plays, game_duration_minutes, overtime_periods
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            '''
-
             self._execute_update(
-                query,
-                (
-                    self.dynasty_id,
-                    game_result.get('game_id'),
-                    game_result.get('season'),
-                    game_result.get('week'),
-                    game_result.get('season_type', 'regular_season'),
-                    game_result.get('game_type', 'regular'),
-                    game_result.get('game_date'),
-                    game_result.get('home_team_id'),
-                    game_result.get('away_team_id'),
-                    game_result.get('home_score'),
-                    game_result.get('away_score'),
-                    game_result.get('total_plays'),
-                    game_result.get('game_duration_minutes'),
-                    game_result.get('overtime_periods', 0)
-                )
+                GAME_RESULT_INSERT_SQL,
+                game_result_values(self.dynasty_id, game_result)
             )
             return True
 
@@ -3398,12 +3647,7 @@ class UnifiedDatabaseAPI:
 
         # ✅ FIX 3: Deduplicate player_stats list before insertion
         # Keep the last occurrence of each player (most recent/final stats)
-        seen_players = {}
-        for stats in player_stats:
-            player_key = (stats.get('player_id'), stats.get('team_id'))
-            seen_players[player_key] = stats  # Overwrites duplicates
-
-        deduplicated_stats = list(seen_players.values())
+        deduplicated_stats = dedupe_player_game_stats(player_stats)
 
         # ✅ FIX 3: Log if duplicates were found
         if len(deduplicated_stats) < len(player_stats):
@@ -3442,159 +3686,15 @@ class UnifiedDatabaseAPI:
                     self.logger.warning(f"Skipping stats entry missing player_id or team_id: {stats}")
                     continue
 
-                # Build the INSERT OR REPLACE query
-                # IMPORTANT: All columns must match the schema in connection.py
-                # Including PFF-critical stats for accurate position grading
-                query = '''
-                    INSERT OR REPLACE INTO player_game_stats (
-                        dynasty_id, game_id, season_type, player_id, player_name,
-                        team_id, position,
-                        passing_yards, passing_tds, passing_attempts, passing_completions,
-                        passing_interceptions, passing_sacks, passing_sack_yards, passing_rating, air_yards,
-                        rushing_yards, rushing_tds, rushing_attempts, rushing_long, rushing_20_plus, rushing_fumbles, fumbles_lost,
-                        receiving_yards, receiving_tds, receptions, targets, receiving_long, receiving_drops, yards_after_catch,
-                        tackles_total, tackles_solo, tackles_assist, sacks, interceptions,
-                        forced_fumbles, fumbles_recovered, passes_defended, tackles_for_loss, qb_hits, qb_pressures,
-                        field_goals_made, field_goals_attempted, extra_points_made, extra_points_attempted,
-                        punts, punt_yards,
-                        pancakes, sacks_allowed, hurries_allowed, pressures_allowed, pass_blocks,
-                        run_blocking_grade, pass_blocking_efficiency, missed_assignments,
-                        holding_penalties, false_start_penalties, downfield_blocks,
-                        double_team_blocks, chip_blocks,
-                        snap_counts_offense, snap_counts_defense, snap_counts_special_teams,
-                        fantasy_points,
-                        coverage_targets, coverage_completions, coverage_yards_allowed,
-                        pass_rush_wins, pass_rush_attempts, times_double_teamed, blocking_encounters,
-                        broken_tackles, tackles_faced, yards_after_contact,
-                        pressures_faced, time_to_throw_total, throw_count,
-                        missed_tackles
-                    ) VALUES (
-                        ?, ?, ?, ?, ?,
-                        ?, ?,
-                        ?, ?, ?, ?,
-                        ?, ?, ?, ?, ?,
-                        ?, ?, ?, ?, ?, ?, ?,
-                        ?, ?, ?, ?, ?, ?, ?,
-                        ?, ?, ?, ?, ?,
-                        ?, ?, ?, ?, ?, ?,
-                        ?, ?, ?, ?,
-                        ?, ?,
-                        ?, ?, ?, ?, ?,
-                        ?, ?, ?,
-                        ?, ?, ?,
-                        ?, ?,
-                        ?, ?, ?,
-                        ?,
-                        ?, ?, ?,
-                        ?, ?, ?, ?,
-                        ?, ?, ?,
-                        ?, ?, ?,
-                        ?
-                    )
-                '''
-
-                values = (
-                    self.dynasty_id,
-                    game_id,
-                    season_type,
-                    stats.get('player_id'),
-                    stats.get('player_name', ''),
-                    stats.get('team_id'),
-                    stats.get('position', ''),
-                    # Passing stats
-                    stats.get('passing_yards', 0),
-                    stats.get('passing_tds', 0),
-                    stats.get('passing_attempts', 0),
-                    stats.get('passing_completions', 0),
-                    stats.get('passing_interceptions', 0),
-                    stats.get('passing_sacks', 0),
-                    stats.get('passing_sack_yards', 0),
-                    stats.get('passing_rating', 0.0),
-                    stats.get('air_yards', 0),
-                    # Rushing stats
-                    stats.get('rushing_yards', 0),
-                    stats.get('rushing_tds', 0),
-                    stats.get('rushing_attempts', 0),
-                    stats.get('rushing_long', 0),
-                    stats.get('rushing_20_plus', 0),
-                    stats.get('rushing_fumbles', 0),
-                    stats.get('fumbles_lost', 0),
-                    # Receiving stats
-                    stats.get('receiving_yards', 0),
-                    stats.get('receiving_tds', 0),
-                    stats.get('receptions', 0),
-                    stats.get('targets', 0),
-                    stats.get('receiving_long', 0),
-                    stats.get('receiving_drops', 0),
-                    stats.get('yards_after_catch', 0),
-                    # Defensive stats
-                    stats.get('tackles_total', 0),
-                    stats.get('tackles_solo', 0),
-                    stats.get('tackles_assist', 0),
-                    stats.get('sacks', 0.0),
-                    stats.get('interceptions', 0),
-                    stats.get('forced_fumbles', 0),
-                    stats.get('fumbles_recovered', 0),
-                    stats.get('passes_defended', 0),
-                    stats.get('tackles_for_loss', 0),
-                    stats.get('qb_hits', 0),
-                    stats.get('qb_pressures', 0),
-                    # Special teams stats
-                    stats.get('field_goals_made', 0),
-                    stats.get('field_goals_attempted', 0),
-                    stats.get('extra_points_made', 0),
-                    stats.get('extra_points_attempted', 0),
-                    stats.get('punts', 0),
-                    stats.get('punt_yards', 0),
-                    # O-Line stats
-                    stats.get('pancakes', 0),
-                    stats.get('sacks_allowed', 0),
-                    stats.get('hurries_allowed', 0),
-                    stats.get('pressures_allowed', 0),
-                    stats.get('pass_blocks', 0),
-                    stats.get('run_blocking_grade', 0.0),
-                    stats.get('pass_blocking_efficiency', 0.0),
-                    stats.get('missed_assignments', 0),
-                    stats.get('holding_penalties', 0),
-                    stats.get('false_start_penalties', 0),
-                    stats.get('downfield_blocks', 0),
-                    stats.get('double_team_blocks', 0),
-                    stats.get('chip_blocks', 0),
-                    # Snap counts
-                    stats.get('snap_counts_offense', 0),
-                    stats.get('snap_counts_defense', 0),
-                    stats.get('snap_counts_special_teams', 0),
-                    # Fantasy
-                    stats.get('fantasy_points', 0.0),
-                    # PFF-critical stats for position grading
-                    # Coverage stats (DB/LB grading)
-                    stats.get('coverage_targets', 0),
-                    stats.get('coverage_completions', 0),
-                    stats.get('coverage_yards_allowed', 0),
-                    # Pass rush stats (DL grading)
-                    stats.get('pass_rush_wins', 0),
-                    stats.get('pass_rush_attempts', 0),
-                    stats.get('times_double_teamed', 0),
-                    stats.get('blocking_encounters', 0),
-                    # Ball carrier stats (RB/WR grading)
-                    stats.get('broken_tackles', 0),
-                    stats.get('tackles_faced', 0),
-                    stats.get('yards_after_contact', 0),
-                    # QB advanced stats
-                    stats.get('pressures_faced', 0),
-                    stats.get('time_to_throw_total', 0.0),
-                    stats.get('throw_count', 0),
-                    # Tackling
-                    stats.get('missed_tackles', 0),
-                )
-
-                self._execute_update(query, values)
+                values = player_game_stats_values(self.dynasty_id, game_id, season_type, stats)
+                self._execute_update(PLAYER_GAME_STATS_INSERT_SQL, values)
                 rows_inserted += 1
 
             self.logger.info(
                 f"Inserted {rows_inserted} player game stats for game {game_id} "
                 f"(dynasty={self.dynasty_id}, season={season}, week={week})"
             )
+            self._apply_season_stat_aggregates(game_id, season, season_type)
             return rows_inserted
 
         except Exception as e:
@@ -3605,6 +3705,34 @@ class UnifiedDatabaseAPI:
             raise
 
 
+    def _apply_season_stat_aggregates(self, game_id: str, season: int, season_type: str) -> None:
+        """
+        Add a game's freshly written stats to the season stat aggregates.
+
+        Failures are logged, not raised: the stats rows are already written
+        and databases without the aggregate tables have nothing to update.
+
+        Args:
+            game_id: Game identifier
+            season: Season year
+            season_type: 'regular_season' or 'playoffs'
+        """
+        from statistics.season_stat_aggregates import SeasonStatAggregates
+
+        conn = self._get_connection()
+        try:
+            conn.execute("SAVEPOINT season_stat_aggregates")
+            try:
+                SeasonStatAggregates(self.dynasty_id).apply_games(conn, season, season_type, [game_id])
+            except sqlite3.Error as e:
+                conn.execute("ROLLBACK TO SAVEPOINT season_stat_aggregates")
+                self.logger.warning(f"Failed to update season stat aggregates for game {game_id}: {e}")
+            conn.execute("RELEASE SAVEPOINT season_stat_aggregates")
+            if self._active_transaction is None:
+                conn.commit()
+        finally:
+            self._return_connection(conn)
+
     def stats_get_game_stats(
         self,
         game_id: str
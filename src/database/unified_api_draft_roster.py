@@ -568,6 +568,10 @@ def roster_update_player_team(self, player_id: int, new_team_id: int, season: in
         if rows_affected == 0:
             self._roster_add_to_roster(new_team_id, player_id)
 
+    # Previous team is not known here, so drop the whole dynasty
+    from team_management.team_data_cache import invalidate_team_data
+    invalidate_team_data(self.dynasty_id)
+
 
 def roster_add_generated_player(self, player_data: Dict[str, Any], team_id: int) -> int:
     """
@@ -614,6 +618,9 @@ def roster_add_generated_player(self, player_data: Dict[str, Any], team_id: int)
     if team_id > 0:
         self._roster_add_to_roster(team_id, new_player_id)
 
+        from team_management.team_data_cache import invalidate_team_data
+        invalidate_team_data(self.dynasty_id, team_id)
+
     return new_player_id
 
 
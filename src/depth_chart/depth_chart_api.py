@@ -9,6 +9,7 @@ from typing import List, Dict, Any, Optional
 import sqlite3
 import json
 from database.connection import DatabaseConnection
+from team_management.team_data_cache import invalidate_team_data
 from depth_chart.depth_chart_manager import DepthChartManager
 from depth_chart.depth_chart_validator import DepthChartValidator
 from depth_chart.depth_chart_types import UNASSIGNED_DEPTH_ORDER, POSITION_REQUIREMENTS
@@ -330,6 +331,7 @@ class DepthChartAPI:
             ''', (dynasty_id, team_id, player_id))
 
             conn.commit()
+            invalidate_team_data(dynasty_id, team_id)
             print(f"✅ Set player {player_id} as starter for {position}")
             return True
 
@@ -399,6 +401,7 @@ class DepthChartAPI:
             ''', (backup_order, dynasty_id, team_id, player_id))
 
             conn.commit()
+            invalidate_team_data(dynasty_id, team_id)
             print(f"✅ Set player {player_id} as backup #{backup_order} for {position}")
             return True
 
@@ -473,6 +476,7 @@ class DepthChartAPI:
             ''', (player2_order, dynasty_id, team_id, player1_id))
 
             conn.commit()
+            invalidate_team_data(dynasty_id, team_id)
             print(f"✅ Swapped depth positions: {player1_id} ↔ {player2_id}")
             return True
 
@@ -526,6 +530,7 @@ class DepthChartAPI:
                 ''', (depth_order, dynasty_id, team_id, player_id))
 
             conn.commit()
+            invalidate_team_data(dynasty_id, team_id)
             print(f"✅ Reordered {position} depth chart: {len(ordered_player_ids)} players")
             return True
 
@@ -567,6 +572,7 @@ class DepthChartAPI:
             ''', (UNASSIGNED_DEPTH_ORDER, dynasty_id, team_id, player_id))
 
             conn.commit()
+            invalidate_team_data(dynasty_id, team_id)
             print(f"✅ Removed player {player_id} from depth chart")
             return True
 
@@ -673,6 +679,7 @@ class DepthChartAPI:
             # Only commit if we created the connection
             if owns_connection:
                 conn.commit()
+            invalidate_team_data(dynasty_id, team_id)
             print(f"✅ Auto-generated depth chart for team {team_id}")
             return True
 
@@ -747,6 +754,7 @@ class DepthChartAPI:
 
             rows_affected = cursor.rowcount
             conn.commit()
+            invalidate_team_data(dynasty_id, team_id)
             print(f"✅ Cleared depth chart for team {team_id} ({rows_affected} players)")
             return True
 
@@ -13,6 +13,7 @@ import sqlite3
 from datetime import datetime
 from pathlib import Path
 import logging
+from database.unified_api import ensure_schedule_columns
 from events.base_event import BaseEvent
 
 
@@ -93,6 +94,9 @@ class EventDatabaseAPI:
             conn.execute('CREATE INDEX IF NOT EXISTS idx_events_dynasty_timestamp ON events(dynasty_id, timestamp)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_events_dynasty_type ON events(dynasty_id, event_type)')
 
+            # Typed season/week/season_type columns for schedule lookups
+            ensure_schedule_columns(conn)
+
             conn.commit()
             self.logger.debug("Events table and indexes created successfully")
 
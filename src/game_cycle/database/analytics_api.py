@@ -171,6 +171,36 @@ class AnalyticsAPI:
         finally:
             conn.close()
 
+    def get_game_grades_for_games(
+        self, dynasty_id: str, game_ids: List[str]
+    ) -> Dict[str, List[GameGrade]]:
+        """Get player grades for several games in one query, keyed by game_id."""
+        if not game_ids:
+            return {}
+        placeholders = ",".join("?" * len(game_ids))
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(
+                f"""
+                SELECT player_id, game_id, season, week, position, team_id,
+                       overall_grade, passing_grade, rushing_grade, receiving_grade,
+                       pass_blocking_grade, run_blocking_grade, pass_rush_grade,
+                       run_defense_grade, coverage_grade, tackling_grade,
+                       offensive_snaps, defensive_snaps, special_teams_snaps,
+                       epa_total, success_rate, play_count, positive_plays, negative_plays
+                FROM player_game_grades
+                WHERE dynasty_id = ? AND game_id IN ({placeholders})
+                ORDER BY game_id, overall_grade DESC
+                """,
+                (dynasty_id, *game_ids),
+            )
+            by_game: Dict[str, List[GameGrade]] = {}
+            for row in cursor.fetchall():
+                by_game.setdefault(row["game_id"], []).append(self._row_to_game_grade(row))
+            return by_game
+        finally:
+            conn.close()
+
     def get_player_game_grades(
         self, dynasty_id: str, player_id: int, season: Optional[int] = None, limit: int = 20
     ) -> List[GameGrade]:
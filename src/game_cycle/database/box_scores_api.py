@@ -118,6 +118,19 @@ class BoxScoresAPI:
     - Aggregating player stats into team box scores
     """
 
+    INSERT_SQL = """
+        INSERT OR REPLACE INTO box_scores (
+            dynasty_id, game_id, team_id,
+            q1_score, q2_score, q3_score, q4_score, ot_score,
+            first_downs, third_down_att, third_down_conv,
+            fourth_down_att, fourth_down_conv,
+            total_yards, passing_yards, rushing_yards,
+            turnovers, penalties, penalty_yards,
+            time_of_possession,
+            team_timeouts_remaining, team_timeouts_used_h1, team_timeouts_used_h2
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str):
         """
         Initialize with database path.
@@ -165,19 +178,20 @@ class BoxScoresAPI:
         Returns:
             True if successful
         """
-        sql = """
-            INSERT OR REPLACE INTO box_scores (
-                dynasty_id, game_id, team_id,
-                q1_score, q2_score, q3_score, q4_score, ot_score,
-                first_downs, third_down_att, third_down_conv,
-                fourth_down_att, fourth_down_conv,
-                total_yards, passing_yards, rushing_yards,
-                turnovers, penalties, penalty_yards,
-                time_of_possession,
-                team_timeouts_remaining, team_timeouts_used_h1, team_timeouts_used_h2
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        self._execute(self.INSERT_SQL, self.box_score_values(box_score))
+        return True
+
+    def box_score_values(self, box_score: BoxScore) -> tuple:
+        """
+        Build the INSERT_SQL parameters for a box score.
+
+        Args:
+            box_score: BoxScore dataclass instance
+
+        Returns:
+            Parameter tuple in column order
         """
-        self._execute(sql, (
+        return (
             box_score.dynasty_id,
             box_score.game_id,
             box_score.team_id,
@@ -201,8 +215,40 @@ class BoxScoresAPI:
             box_score.team_timeouts_remaining,
             box_score.team_timeouts_used_h1,
             box_score.team_timeouts_used_h2,
-        ))
-        return True
+        )
+
+    def game_box_scores(
+        self,
+        dynasty_id: str,
+        game_id: str,
+        home_team_id: int,
+        away_team_id: int,
+        home_box: Dict[str, Any],
+        away_box: Dict[str, Any]
+    ) -> List[BoxScore]:
+        """
+        Build the home and away BoxScore records for a game.
+
+        Args:
+            dynasty_id: Dynasty identifier
+            game_id: Game identifier
+            home_team_id: Home team ID
+            away_team_id: Away team ID
+            home_box: Dict with home team stats
+            away_box: Dict with away team stats
+
+        Returns:
+            [home BoxScore, away BoxScore]
+        """
+        return [
+            BoxScore(
+                game_id=game_id,
+                team_id=team_id,
+                dynasty_id=dynasty_id,
+                **self._normalize_box_dict(box_dict)
+            )
+            for team_id, box_dict in ((home_team_id, home_box), (away_team_id, away_box))
+        ]
 
     def insert_game_box_scores(
         self,
@@ -229,21 +275,10 @@ class BoxScoresAPI:
         Returns:
             True if both inserts successful
         """
-        home_score = BoxScore(
-            game_id=game_id,
-            team_id=home_team_id,
-            dynasty_id=dynasty_id,
-            **self._normalize_box_dict(home_box)
-        )
-        away_score = BoxScore(
-            game_id=game_id,
-            team_id=away_team_id,
-            dynasty_id=dynasty_id,
-            **self._normalize_box_dict(away_box)
-        )
-
-        self.insert_box_score(home_score)
-        self.insert_box_score(away_score)
+        for box_score in self.game_box_scores(
+            dynasty_id, game_id, home_team_id, away_team_id, home_box, away_box
+        ):
+            self.insert_box_score(box_score)
         return True
 
     def _normalize_box_dict(self, box_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -341,6 +376,44 @@ class BoxScoresAPI:
         )
         return [self._row_to_box_score(row) for row in rows]
 
+    def get_box_scores_for_games(
+        self,
+        dynasty_id: str,
+        game_ids: List[str]
+    ) -> Dict[str, List[BoxScore]]:
+        """
+        Get box scores for several games in one query.
+
+        Args:
+            dynasty_id: Dynasty identifier
+            game_ids: Game identifiers
+
+        Returns:
+            Dict mapping game_id -> list of BoxScore (games without box
+            scores are omitted)
+        """
+        if not game_ids:
+            return {}
+        placeholders = ",".join("?" * len(game_ids))
+        rows = self._query_all(
+            f"""
+            SELECT game_id, team_id, dynasty_id,
+                   q1_score, q2_score, q3_score, q4_score, ot_score,
+                   first_downs, third_down_att, third_down_conv,
+                   fourth_down_att, fourth_down_conv,
+                   total_yards, passing_yards, rushing_yards,
+                   turnovers, penalties, penalty_yards,
+                   time_of_possession
+            FROM box_scores
+            WHERE dynasty_id = ? AND game_id IN ({placeholders})
+            """,
+            (dynasty_id, *game_ids)
+        )
+        by_game: Dict[str, List[BoxScore]] = {}
+        for row in rows:
+            by_game.setdefault(row["game_id"], []).append(self._row_to_box_score(row))
+        return by_game
+
     def get_team_box_scores(
         self,
         dynasty_id: str,
@@ -2,12 +2,21 @@
 Database connection for game_cycle.
 
 Provides a lightweight SQLite connection with schema management.
+
+Connections and schema setup go through the process-wide DatabaseManager:
+schema.sql and the migrations run once per database file and version (recorded
+in its schema_version table), and closed connections return to a per-thread
+pool for the next GameCycleDatabase on the same file.
 """
 
 import os
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Iterator, Optional, List, Dict, Any
+
+from database.database_manager import get_database_manager, schema_fingerprint
+from database.unified_api import SCHEDULE_COLUMNS, SCHEDULE_INDEX_SQL, ensure_schedule_columns
 
 
 class GameCycleDatabase:
@@ -21,6 +30,11 @@ class GameCycleDatabase:
     """
 
     DEFAULT_PATH = "data/database/game_cycle/game_cycle.db"
+    SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+
+    # Name of this schema in schema_version; version from schema_version()
+    SCHEMA_FILE = "game_cycle/schema.sql"
+    _schema_version: Optional[str] = None
 
     def __init__(self, db_path: Optional[str] = None):
         """
@@ -31,7 +45,10 @@ class GameCycleDatabase:
         """
         self.db_path = db_path or self.DEFAULT_PATH
         self._ensure_directory()
+        self._manager = get_database_manager()
         self._connection: Optional[sqlite3.Connection] = None
+        # > 0 while inside transaction(); execute()/executemany() defer commits
+        self._transaction_depth = 0
         self._ensure_schema()
 
     def _ensure_directory(self) -> None:
@@ -40,14 +57,37 @@ class GameCycleDatabase:
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
 
-    def _ensure_schema(self) -> None:
-        """Apply database schema if tables don't exist."""
-        schema_path = Path(__file__).parent / "schema.sql"
+    @classmethod
+    def schema_version(cls) -> str:
+        """
+        Version of schema.sql plus the migrations in this module.
 
-        if not schema_path.exists():
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
+        Editing either file changes the version, so every database re-runs
+        the schema setup once on next open.
+        """
+        if cls._schema_version is None:
+            if not cls.SCHEMA_PATH.exists():
+                raise FileNotFoundError(f"Schema file not found: {cls.SCHEMA_PATH}")
+            cls._schema_version = schema_fingerprint(
+                cls.SCHEMA_PATH.read_bytes(),
+                Path(__file__).read_bytes(),
+                repr(SCHEDULE_COLUMNS),
+                SCHEDULE_INDEX_SQL,
+            )
+        return cls._schema_version
+
+    def _ensure_schema(self) -> None:
+        """Apply database schema and migrations unless already current."""
+        self._manager.ensure_schema(
+            self.get_connection(),
+            self.SCHEMA_FILE,
+            self.schema_version(),
+            lambda conn: self._apply_schema()
+        )
 
-        with open(schema_path, 'r') as f:
+    def _apply_schema(self) -> None:
+        """Apply schema.sql and run all migrations."""
+        with open(self.SCHEMA_PATH, 'r') as f:
             schema_sql = f.read()
 
         conn = self.get_connection()
@@ -110,6 +150,24 @@ class GameCycleDatabase:
         except sqlite3.OperationalError:
             pass  # Table doesn't exist yet (new database)
 
+        # Pre-migration 4: Season stat aggregates ledger without stats versions
+        # The ledger could not tell replaced stats apart; the aggregates are
+        # derived data, so drop them for schema.sql to recreate and Migration 15
+        # to rebuild
+        try:
+            cursor = conn.execute("PRAGMA table_info(season_stat_aggregate_games)")
+            columns = [row[1] for row in cursor.fetchall()]
+            if columns and 'stats_version' not in columns:
+                for table in (
+                    "season_player_stat_ranks", "season_player_stat_totals",
+                    "season_team_stat_totals", "season_stat_aggregate_games"
+                ):
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.commit()
+                print("[GameCycleDatabase] Dropped season stat aggregates for rebuild with stats versions")
+        except sqlite3.OperationalError:
+            pass  # Table doesn't exist yet (new database)
+
     def _run_migrations(self) -> None:
         """Run database migrations for existing databases (post-schema)."""
         conn = self.get_connection()
@@ -528,6 +586,36 @@ class GameCycleDatabase:
         except sqlite3.OperationalError:
             pass  # Ignore errors during migration
 
+        # Migration 14: Typed schedule columns + index on events
+        # Week/season schedule lookups use these instead of json_extract scans;
+        # building the index backfills it for existing dynasties' events
+        try:
+            added = ensure_schedule_columns(conn)
+            conn.commit()
+            if added:
+                print(f"[Migration 14] Added {added} schedule columns to events")
+        except sqlite3.OperationalError:
+            pass  # Ignore errors during migration
+
+        # Migration 15: Backfill season stat aggregates
+        # Seasons played before the tables existed (or dropped by pre-migration 4)
+        # are aggregated once here; afterwards only the persistence paths update them
+        try:
+            from statistics.season_stat_aggregates import SeasonStatAggregates
+
+            seasons = conn.execute(
+                "SELECT DISTINCT dynasty_id, season, season_type FROM games"
+            ).fetchall()
+            added = sum(
+                SeasonStatAggregates(dynasty_id).refresh(conn, season, season_type)
+                for dynasty_id, season, season_type in seasons
+            )
+            conn.commit()
+            if added:
+                print(f"[Migration 15] Added {added} games to season stat aggregates")
+        except sqlite3.OperationalError:
+            pass  # Ignore errors during migration
+
     def _migrate_pass_blocks_column(self, conn: sqlite3.Connection) -> None:
         """Add pass_blocks column to player_game_stats if missing."""
         try:
@@ -678,18 +766,14 @@ class GameCycleDatabase:
             SQLite connection with row factory set.
         """
         if self._connection is None:
-            self._connection = sqlite3.connect(self.db_path)
-            self._connection.row_factory = sqlite3.Row
-            # Enable foreign keys
-            self._connection.execute("PRAGMA foreign_keys = ON")
-            # Enable WAL mode for better concurrency (multiple readers, one writer)
-            self._connection.execute("PRAGMA journal_mode = WAL")
+            # Pooled per thread; WAL, foreign keys, busy timeout etc. set by the manager
+            self._connection = self._manager.acquire(self.db_path)
         return self._connection
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connection (returned to the pool; uncommitted changes are discarded)."""
         if self._connection:
-            self._connection.close()
+            self._manager.release(self._connection, self.db_path)
             self._connection = None
 
     def execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
@@ -705,7 +789,8 @@ class GameCycleDatabase:
         """
         conn = self.get_connection()
         cursor = conn.execute(sql, params)
-        conn.commit()
+        if not self._transaction_depth:
+            conn.commit()
         return cursor
 
     def executemany(self, sql: str, params_list: List[tuple]) -> sqlite3.Cursor:
@@ -721,9 +806,49 @@ class GameCycleDatabase:
         """
         conn = self.get_connection()
         cursor = conn.executemany(sql, params_list)
-        conn.commit()
+        if not self._transaction_depth:
+            conn.commit()
         return cursor
 
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Group writes into a single transaction.
+
+        execute(), executemany() and commit() do not commit while the block
+        runs; everything is committed once on exit, or rolled back if the
+        block raises. Nested blocks join the outermost transaction.
+
+        Yields:
+            The shared connection
+
+        Example:
+            with db.transaction():
+                db.executemany(insert_sql, rows)
+                StandingsAPI(db).update_from_game(...)
+        """
+        conn = self.get_connection()
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield conn
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        self._transaction_depth = 1
+        try:
+            yield conn
+        except BaseException:
+            self._transaction_depth = 0
+            conn.rollback()
+            raise
+        self._transaction_depth = 0
+        conn.commit()
+
     def query_one(self, sql: str, params: tuple = ()) -> Optional[sqlite3.Row]:
         """
         Execute query and return single row.
@@ -797,8 +922,8 @@ class GameCycleDatabase:
         return False
 
     def commit(self) -> None:
-        """Commit pending changes."""
-        if self._connection:
+        """Commit pending changes (deferred inside transaction())."""
+        if self._connection and not self._transaction_depth:
             self._connection.commit()
 
     def reset(self) -> None:
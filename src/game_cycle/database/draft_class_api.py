@@ -54,7 +54,8 @@ class DraftClassAPI:
     def get_prospect_by_id(
         self,
         prospect_id: int,
-        dynasty_id: str
+        dynasty_id: str,
+        conn: Optional[sqlite3.Connection] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Get single prospect by prospect ID.
@@ -62,6 +63,7 @@ class DraftClassAPI:
         Args:
             prospect_id: Prospect ID (from draft_prospects.prospect_id)
             dynasty_id: Dynasty identifier
+            conn: Optional existing connection (sees uncommitted writes of its transaction)
 
         Returns:
             Prospect dict or None if not found
@@ -72,9 +74,14 @@ class DraftClassAPI:
             >>> if prospect:
             ...     print(f"{prospect['first_name']} {prospect['last_name']}")
         """
-        with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('''
+        should_close = conn is None
+        if should_close:
+            conn = self._get_connection()
+
+        try:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute('''
                 SELECT * FROM draft_prospects
                 WHERE prospect_id = ? AND dynasty_id = ?
             ''', (prospect_id, dynasty_id))
@@ -91,6 +98,9 @@ class DraftClassAPI:
                 return prospect
 
             return None
+        finally:
+            if should_close:
+                conn.close()
 
     def mark_prospect_drafted(
         self,
@@ -98,7 +108,8 @@ class DraftClassAPI:
         team_id: int,
         actual_round: int,
         actual_pick: int,
-        dynasty_id: str
+        dynasty_id: str,
+        conn: Optional[sqlite3.Connection] = None
     ) -> None:
         """
         Mark prospect as drafted.
@@ -112,6 +123,7 @@ class DraftClassAPI:
             actual_round: Actual draft round (1-7)
             actual_pick: Actual pick number within round (1-32)
             dynasty_id: Dynasty identifier
+            conn: Optional existing connection (transaction mode, caller commits)
 
         Examples:
             >>> api = DraftClassAPI("data/database/game_cycle/game_cycle.db")
@@ -123,7 +135,11 @@ class DraftClassAPI:
             ...     dynasty_id="my_dynasty"
             ... )
         """
-        with self._get_connection() as conn:
+        should_close = conn is None
+        if should_close:
+            conn = self._get_connection()
+
+        try:
             # Calculate overall pick number
             overall_pick = (actual_round - 1) * 32 + actual_pick
 
@@ -138,19 +154,25 @@ class DraftClassAPI:
                     draft_overall_pick = ?
                 WHERE prospect_id = ? AND dynasty_id = ?
             ''', (team_id, actual_round, actual_pick, overall_pick, player_id, dynasty_id))
-            conn.commit()
 
-            self.logger.info(
-                f"Marked prospect {player_id} as drafted by team {team_id} "
-                f"(Round {actual_round}, Pick {actual_pick}, Overall {overall_pick})"
-            )
+            if should_close:
+                conn.commit()
+        finally:
+            if should_close:
+                conn.close()
+
+        self.logger.info(
+            f"Marked prospect {player_id} as drafted by team {team_id} "
+            f"(Round {actual_round}, Pick {actual_pick}, Overall {overall_pick})"
+        )
 
     def convert_prospect_to_player(
         self,
         player_id: int,  # Note: This is prospect_id, but parameter name kept for compatibility
         team_id: int,
         dynasty_id: str,
-        jersey_number: Optional[int] = None
+        jersey_number: Optional[int] = None,
+        conn: Optional[sqlite3.Connection] = None
     ) -> int:
         """
         Convert drafted prospect to active player on team roster.
@@ -163,6 +185,7 @@ class DraftClassAPI:
             team_id: Team that drafted the prospect (1-32)
             dynasty_id: Dynasty identifier
             jersey_number: Optional jersey number (auto-assigned if None)
+            conn: Optional existing connection (transaction mode, caller commits)
 
         Returns:
             int: NEW player_id assigned from players table (different from prospect_id)
@@ -180,7 +203,7 @@ class DraftClassAPI:
             >>> print(f"Prospect 12345 is now player {new_player_id}")
         """
         # Get prospect data
-        prospect = self.get_prospect_by_id(player_id, dynasty_id)
+        prospect = self.get_prospect_by_id(player_id, dynasty_id, conn=conn)
 
         if not prospect:
             raise ValueError(f"Prospect {player_id} not found in dynasty '{dynasty_id}'")
@@ -190,7 +213,7 @@ class DraftClassAPI:
 
         # Generate NEW player_id from players table sequence
         # This prevents ID collisions with existing roster players
-        new_player_id = self._get_next_player_id(dynasty_id)
+        new_player_id = self._get_next_player_id(dynasty_id, conn=conn)
 
         self.logger.info(
             f"Converting prospect {player_id} → new player {new_player_id} "
@@ -235,7 +258,11 @@ class DraftClassAPI:
         attributes_json = json.dumps(full_attributes)
 
         # Insert into players table with game_cycle schema
-        with self._get_connection() as conn:
+        should_close = conn is None
+        if should_close:
+            conn = self._get_connection()
+
+        try:
             conn.execute('''
                 INSERT INTO players (
                     dynasty_id, player_id, source_player_id,
@@ -274,7 +301,11 @@ class DraftClassAPI:
                 WHERE prospect_id = ? AND dynasty_id = ?
             ''', (new_player_id, new_player_id, player_id, dynasty_id))
 
-            conn.commit()
+            if should_close:
+                conn.commit()
+        finally:
+            if should_close:
+                conn.close()
 
         self.logger.info(
             f"Added player {new_player_id} ({prospect['first_name']} {prospect['last_name']}) "
@@ -283,17 +314,26 @@ class DraftClassAPI:
 
         return new_player_id
 
-    def _get_next_player_id(self, dynasty_id: str) -> int:
+    def _get_next_player_id(
+        self,
+        dynasty_id: str,
+        conn: Optional[sqlite3.Connection] = None
+    ) -> int:
         """
         Generate next available player_id for a dynasty.
 
         Args:
             dynasty_id: Dynasty identifier
+            conn: Optional existing connection
 
         Returns:
             Next available player_id
         """
-        with self._get_connection() as conn:
+        should_close = conn is None
+        if should_close:
+            conn = self._get_connection()
+
+        try:
             cursor = conn.execute('''
                 SELECT COALESCE(MAX(player_id), 0) + 1 AS next_id
                 FROM players
@@ -301,6 +341,9 @@ class DraftClassAPI:
             ''', (dynasty_id,))
             row = cursor.fetchone()
             return row[0] if row else 1
+        finally:
+            if should_close:
+                conn.close()
 
     def _auto_assign_jersey(self, position: str) -> int:
         """
@@ -0,0 +1,272 @@
+"""
+Media Jobs API - Database operations for the deferred media job queue.
+
+Jobs are derived-data work (headlines, social posts, power rankings,
+popularity, ...) queued after a week's game results are committed and run
+later by MediaJobWorker. Each job is unique per
+(dynasty_id, season, week, job_type, job_key), so enqueueing is idempotent
+and a re-simulated or resumed week never produces duplicate content.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .connection import GameCycleDatabase
+
+
+@dataclass
+class MediaJob:
+    """A queued media job."""
+    job_id: int
+    dynasty_id: str
+    season: int
+    week: int
+    job_type: str
+    job_key: str = ""
+    payload: Dict[str, Any] = field(default_factory=dict)
+    status: str = "pending"
+    attempts: int = 0
+    error: Optional[str] = None
+
+
+class MediaJobsAPI:
+    """
+    API for media job queue operations.
+
+    Jobs move pending -> running -> done | failed. Claiming a job is a
+    conditional UPDATE, so two connections never run the same job.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+
+    def __init__(self, db: GameCycleDatabase):
+        """
+        Initialize with database connection.
+
+        Args:
+            db: GameCycleDatabase instance
+        """
+        self.db = db
+        self._logger = logging.getLogger(__name__)
+
+    # -------------------- Enqueue Methods --------------------
+
+    def enqueue(
+        self,
+        dynasty_id: str,
+        season: int,
+        week: int,
+        job_type: str,
+        job_key: str = "",
+        payload: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Queue a job unless the same job already exists.
+
+        Args:
+            dynasty_id: Dynasty identifier
+            season: Season year
+            week: Week number
+            job_type: Registered job type
+            job_key: Distinguishes jobs of one type in a week (e.g. game_id)
+            payload: JSON-serializable job arguments
+
+        Returns:
+            True if the job was queued, False if it already existed
+        """
+        return self.enqueue_many(
+            dynasty_id, season, [(week, job_type, job_key, payload)]
+        ) == 1
+
+    def enqueue_many(
+        self,
+        dynasty_id: str,
+        season: int,
+        jobs: Iterable[Tuple[int, str, str, Optional[Dict[str, Any]]]]
+    ) -> int:
+        """
+        Queue several jobs in one transaction, in order.
+
+        Args:
+            dynasty_id: Dynasty identifier
+            season: Season year
+            jobs: (week, job_type, job_key, payload) tuples
+
+        Returns:
+            Number of jobs queued (existing jobs are skipped)
+        """
+        rows = [
+            (dynasty_id, season, week, job_type, job_key or "",
+             json.dumps(payload) if payload is not None else None)
+            for week, job_type, job_key, payload in jobs
+        ]
+        if not rows:
+            return 0
+
+        queued = 0
+        with self.db.transaction() as conn:
+            for row in rows:
+                cursor = conn.execute(
+                    """INSERT OR IGNORE INTO media_jobs
+                       (dynasty_id, season, week, job_type, job_key, payload)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    row
+                )
+                queued += cursor.rowcount
+        return queued
+
+    # -------------------- Worker Methods --------------------
+
+    def claim_next(self) -> Optional[MediaJob]:
+        """
+        Claim the oldest pending job and mark it running.
+
+        Returns:
+            The claimed job, or None if nothing is pending
+        """
+        while True:
+            row = self.db.query_one(
+                """SELECT * FROM media_jobs
+                   WHERE status = 'pending'
+                   ORDER BY job_id
+                   LIMIT 1"""
+            )
+            if row is None:
+                return None
+
+            cursor = self.db.execute(
+                """UPDATE media_jobs
+                   SET status = 'running', attempts = attempts + 1
+                   WHERE job_id = ? AND status = 'pending'""",
+                (row['job_id'],)
+            )
+            if cursor.rowcount == 1:
+                job = self._row_to_job(row)
+                job.status = self.STATUS_RUNNING
+                job.attempts += 1
+                return job
+            # Another connection claimed it first; try the next one
+
+    def mark_done(self, job_id: int) -> None:
+        """Mark a job as completed."""
+        self.db.execute(
+            """UPDATE media_jobs
+               SET status = 'done', error = NULL, completed_at = CURRENT_TIMESTAMP
+               WHERE job_id = ?""",
+            (job_id,)
+        )
+
+    def mark_failed(self, job_id: int, error: str) -> None:
+        """Mark a job as failed with its error message."""
+        self.db.execute(
+            """UPDATE media_jobs
+               SET status = 'failed', error = ?, completed_at = CURRENT_TIMESTAMP
+               WHERE job_id = ?""",
+            (error, job_id)
+        )
+
+    def requeue_running(self) -> int:
+        """
+        Return jobs left running by an interrupted worker to the queue.
+
+        Returns:
+            Number of jobs requeued
+        """
+        cursor = self.db.execute(
+            "UPDATE media_jobs SET status = 'pending' WHERE status = 'running'"
+        )
+        return cursor.rowcount
+
+    def retry_failed(self, dynasty_id: str) -> int:
+        """
+        Queue a dynasty's failed jobs again.
+
+        Args:
+            dynasty_id: Dynasty identifier
+
+        Returns:
+            Number of jobs requeued
+        """
+        cursor = self.db.execute(
+            """UPDATE media_jobs SET status = 'pending', error = NULL
+               WHERE dynasty_id = ? AND status = 'failed'""",
+            (dynasty_id,)
+        )
+        return cursor.rowcount
+
+    # -------------------- Query Methods --------------------
+
+    def count_jobs(self, status: Optional[str] = None, dynasty_id: Optional[str] = None) -> int:
+        """
+        Count jobs, optionally by status and dynasty.
+
+        Args:
+            status: Job status filter
+            dynasty_id: Dynasty filter
+
+        Returns:
+            Number of matching jobs
+        """
+        conditions, params = [], []
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        if dynasty_id is not None:
+            conditions.append("dynasty_id = ?")
+            params.append(dynasty_id)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        row = self.db.query_one(f"SELECT COUNT(*) AS n FROM media_jobs {where}", tuple(params))
+        return row['n'] if row else 0
+
+    def get_jobs(
+        self,
+        dynasty_id: str,
+        season: int,
+        week: Optional[int] = None,
+        job_type: Optional[str] = None
+    ) -> List[MediaJob]:
+        """
+        Get a dynasty's jobs for a season in queue order.
+
+        Args:
+            dynasty_id: Dynasty identifier
+            season: Season year
+            week: Optional week filter
+            job_type: Optional job type filter
+
+        Returns:
+            List of MediaJob
+        """
+        sql = "SELECT * FROM media_jobs WHERE dynasty_id = ? AND season = ?"
+        params: List[Any] = [dynasty_id, season]
+        if week is not None:
+            sql += " AND week = ?"
+            params.append(week)
+        if job_type is not None:
+            sql += " AND job_type = ?"
+            params.append(job_type)
+        rows = self.db.query_all(sql + " ORDER BY job_id", tuple(params))
+        return [self._row_to_job(row) for row in rows]
+
+    # -------------------- Helper Methods --------------------
+
+    @staticmethod
+    def _row_to_job(row: Any) -> MediaJob:
+        """Convert a media_jobs row to a MediaJob."""
+        return MediaJob(
+            job_id=row['job_id'],
+            dynasty_id=row['dynasty_id'],
+            season=row['season'],
+            week=row['week'],
+            job_type=row['job_type'],
+            job_key=row['job_key'] or "",
+            payload=json.loads(row['payload']) if row['payload'] else {},
+            status=row['status'],
+            attempts=row['attempts'],
+            error=row['error'],
+        )
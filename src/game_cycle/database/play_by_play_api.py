@@ -18,6 +18,29 @@ logger = logging.getLogger(__name__)
 class PlayByPlayAPI:
     """API for play-by-play database operations."""
 
+    INSERT_DRIVE_SQL = """
+        INSERT OR REPLACE INTO game_drives
+        (dynasty_id, game_id, drive_number, possession_team_id,
+         quarter_started, starting_clock_seconds, starting_field_position,
+         starting_down, starting_distance,
+         ending_field_position, drive_outcome, points_scored,
+         total_plays, total_yards, time_elapsed)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    INSERT_PLAY_SQL = """
+        INSERT OR REPLACE INTO game_plays
+        (dynasty_id, game_id, play_number, drive_number, drive_play_number,
+         quarter, game_clock_seconds, down, distance, yard_line,
+         possession_team_id, home_score, away_score,
+         play_type, play_description, yards_gained, outcome,
+         is_scoring_play, is_turnover, turnover_type, is_first_down,
+         is_penalty, penalty_type, penalty_yards, penalty_team_id,
+         points_scored, down_after, distance_after, field_position_after,
+         time_elapsed_seconds)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str):
         self._db_path = db_path
 
@@ -45,50 +68,10 @@ class PlayByPlayAPI:
 
         conn = self._get_connection()
         try:
-            count = 0
-            for drive_num, drive in enumerate(drives, 1):
-                # Extract drive outcome name
-                outcome = "unknown"
-                if hasattr(drive, 'drive_outcome'):
-                    if hasattr(drive.drive_outcome, 'name'):
-                        outcome = drive.drive_outcome.name.lower()
-                    elif hasattr(drive.drive_outcome, 'value'):
-                        outcome = str(drive.drive_outcome.value).lower()
-                    else:
-                        outcome = str(drive.drive_outcome).lower()
-
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO game_drives
-                    (dynasty_id, game_id, drive_number, possession_team_id,
-                     quarter_started, starting_clock_seconds, starting_field_position,
-                     starting_down, starting_distance,
-                     ending_field_position, drive_outcome, points_scored,
-                     total_plays, total_yards, time_elapsed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        dynasty_id,
-                        game_id,
-                        drive_num,
-                        getattr(drive, 'possessing_team_id', 0),
-                        getattr(drive, 'quarter_started', 1),
-                        getattr(drive, 'starting_clock_seconds', 900),
-                        getattr(drive, 'starting_field_position', 25),
-                        getattr(drive, 'starting_down', 1),
-                        getattr(drive, 'starting_distance', 10),
-                        getattr(drive, 'ending_field_position', 0),
-                        outcome,
-                        getattr(drive, 'points_scored', 0),
-                        getattr(drive, 'total_plays', len(getattr(drive, 'plays', []))),
-                        getattr(drive, 'total_yards', 0),
-                        getattr(drive, 'time_elapsed', 0),
-                    ),
-                )
-                count += 1
-
+            rows = self.drive_rows(dynasty_id, game_id, drives)
+            conn.executemany(self.INSERT_DRIVE_SQL, rows)
             conn.commit()
-            return count
+            return len(rows)
         except Exception as e:
             logger.warning("Failed to insert drives for game %s: %s", game_id, e)
             conn.rollback()
@@ -118,125 +101,10 @@ class PlayByPlayAPI:
 
         conn = self._get_connection()
         try:
-            play_number = 0  # Global play number
-            count = 0
-            home_score = 0
-            away_score = 0
-
-            for drive_num, drive in enumerate(drives, 1):
-                plays = getattr(drive, 'plays', [])
-                possession_team_id = getattr(drive, 'possessing_team_id', 0)
-                quarter = getattr(drive, 'quarter_started', 1)
-
-                # Track clock and field position through the drive
-                clock_seconds = getattr(drive, 'starting_clock_seconds', 900)
-                yard_line = getattr(drive, 'starting_field_position', 25)
-                down = getattr(drive, 'starting_down', 1)
-                distance = getattr(drive, 'starting_distance', 10)
-
-                for drive_play_num, play in enumerate(plays, 1):
-                    play_number += 1
-
-                    # Determine play type from outcome
-                    outcome = getattr(play, 'outcome', 'unknown')
-                    play_type = self._classify_play_type(outcome)
-
-                    # Generate play description
-                    play_description = self._generate_play_description(play, play_type)
-
-                    # Get yards
-                    yards = getattr(play, 'yards', 0)
-
-                    # Get scoring info
-                    is_scoring = 1 if getattr(play, 'is_scoring_play', False) else 0
-                    points = getattr(play, 'points', 0)
-
-                    # Update score tracking
-                    if points > 0:
-                        if possession_team_id == home_team_id:
-                            home_score += points
-                        elif possession_team_id == away_team_id:
-                            away_score += points
-
-                    # Get turnover info
-                    is_turnover = 1 if getattr(play, 'is_turnover', False) else 0
-                    turnover_type = getattr(play, 'turnover_type', None)
-
-                    # Get first down
-                    is_first_down = 1 if getattr(play, 'achieved_first_down', False) else 0
-
-                    # Get penalty info
-                    is_penalty = 1 if getattr(play, 'penalty_occurred', False) else 0
-                    penalty_yards = getattr(play, 'penalty_yards', 0) if is_penalty else None
-                    penalty_type = None  # Would need to extract from enforcement_result
-
-                    # Get time elapsed
-                    time_elapsed = getattr(play, 'time_elapsed', 0)
-
-                    # Get post-play state
-                    down_after = getattr(play, 'down_after_play', None)
-                    distance_after = getattr(play, 'distance_after_play', None)
-                    field_position_after = getattr(play, 'field_position_after_play', None)
-
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO game_plays
-                        (dynasty_id, game_id, play_number, drive_number, drive_play_number,
-                         quarter, game_clock_seconds, down, distance, yard_line,
-                         possession_team_id, home_score, away_score,
-                         play_type, play_description, yards_gained, outcome,
-                         is_scoring_play, is_turnover, turnover_type, is_first_down,
-                         is_penalty, penalty_type, penalty_yards, penalty_team_id,
-                         points_scored, down_after, distance_after, field_position_after,
-                         time_elapsed_seconds)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            dynasty_id,
-                            game_id,
-                            play_number,
-                            drive_num,
-                            drive_play_num,
-                            quarter,
-                            int(clock_seconds),
-                            down,
-                            distance,
-                            yard_line,
-                            possession_team_id,
-                            home_score,
-                            away_score,
-                            play_type,
-                            play_description,
-                            yards,
-                            outcome,
-                            is_scoring,
-                            is_turnover,
-                            turnover_type,
-                            is_first_down,
-                            is_penalty,
-                            penalty_type,
-                            penalty_yards,
-                            None,  # penalty_team_id
-                            points,
-                            down_after,
-                            distance_after,
-                            field_position_after,
-                            time_elapsed,
-                        ),
-                    )
-                    count += 1
-
-                    # Update tracking for next play
-                    clock_seconds -= time_elapsed
-                    if down_after is not None:
-                        down = down_after
-                    if distance_after is not None:
-                        distance = distance_after
-                    if field_position_after is not None:
-                        yard_line = field_position_after
-
+            rows = self.play_rows(dynasty_id, game_id, drives, home_team_id, away_team_id)
+            conn.executemany(self.INSERT_PLAY_SQL, rows)
             conn.commit()
-            return count
+            return len(rows)
         except Exception as e:
             logger.warning("Failed to insert plays for game %s: %s", game_id, e)
             conn.rollback()
@@ -244,6 +112,170 @@ class PlayByPlayAPI:
         finally:
             conn.close()
 
+    def drive_rows(self, dynasty_id: str, game_id: str, drives: List[Any]) -> List[tuple]:
+        """
+        Build INSERT_DRIVE_SQL parameters for every drive of a game.
+
+        Args:
+            dynasty_id: Dynasty identifier
+            game_id: Game identifier
+            drives: List of DriveResult objects
+
+        Returns:
+            One parameter tuple per drive
+        """
+        rows = []
+        for drive_num, drive in enumerate(drives, 1):
+            # Extract drive outcome name
+            outcome = "unknown"
+            if hasattr(drive, 'drive_outcome'):
+                if hasattr(drive.drive_outcome, 'name'):
+                    outcome = drive.drive_outcome.name.lower()
+                elif hasattr(drive.drive_outcome, 'value'):
+                    outcome = str(drive.drive_outcome.value).lower()
+                else:
+                    outcome = str(drive.drive_outcome).lower()
+
+            rows.append((
+                dynasty_id,
+                game_id,
+                drive_num,
+                getattr(drive, 'possessing_team_id', 0),
+                getattr(drive, 'quarter_started', 1),
+                getattr(drive, 'starting_clock_seconds', 900),
+                getattr(drive, 'starting_field_position', 25),
+                getattr(drive, 'starting_down', 1),
+                getattr(drive, 'starting_distance', 10),
+                getattr(drive, 'ending_field_position', 0),
+                outcome,
+                getattr(drive, 'points_scored', 0),
+                getattr(drive, 'total_plays', len(getattr(drive, 'plays', []))),
+                getattr(drive, 'total_yards', 0),
+                getattr(drive, 'time_elapsed', 0),
+            ))
+        return rows
+
+    def play_rows(
+        self, dynasty_id: str, game_id: str, drives: List[Any],
+        home_team_id: Optional[int] = None, away_team_id: Optional[int] = None
+    ) -> List[tuple]:
+        """
+        Build INSERT_PLAY_SQL parameters for every play of a game.
+
+        Args:
+            dynasty_id: Dynasty identifier
+            game_id: Game identifier
+            drives: List of DriveResult objects containing plays
+            home_team_id: Home team ID (for score tracking)
+            away_team_id: Away team ID (for score tracking)
+
+        Returns:
+            One parameter tuple per play, in game order
+        """
+        rows = []
+        play_number = 0  # Global play number
+        home_score = 0
+        away_score = 0
+
+        for drive_num, drive in enumerate(drives, 1):
+            plays = getattr(drive, 'plays', [])
+            possession_team_id = getattr(drive, 'possessing_team_id', 0)
+            quarter = getattr(drive, 'quarter_started', 1)
+
+            # Track clock and field position through the drive
+            clock_seconds = getattr(drive, 'starting_clock_seconds', 900)
+            yard_line = getattr(drive, 'starting_field_position', 25)
+            down = getattr(drive, 'starting_down', 1)
+            distance = getattr(drive, 'starting_distance', 10)
+
+            for drive_play_num, play in enumerate(plays, 1):
+                play_number += 1
+
+                # Determine play type from outcome
+                outcome = getattr(play, 'outcome', 'unknown')
+                play_type = self._classify_play_type(outcome)
+
+                # Generate play description
+                play_description = self._generate_play_description(play, play_type)
+
+                # Get yards
+                yards = getattr(play, 'yards', 0)
+
+                # Get scoring info
+                is_scoring = 1 if getattr(play, 'is_scoring_play', False) else 0
+                points = getattr(play, 'points', 0)
+
+                # Update score tracking
+                if points > 0:
+                    if possession_team_id == home_team_id:
+                        home_score += points
+                    elif possession_team_id == away_team_id:
+                        away_score += points
+
+                # Get turnover info
+                is_turnover = 1 if getattr(play, 'is_turnover', False) else 0
+                turnover_type = getattr(play, 'turnover_type', None)
+
+                # Get first down
+                is_first_down = 1 if getattr(play, 'achieved_first_down', False) else 0
+
+                # Get penalty info
+                is_penalty = 1 if getattr(play, 'penalty_occurred', False) else 0
+                penalty_yards = getattr(play, 'penalty_yards', 0) if is_penalty else None
+                penalty_type = None  # Would need to extract from enforcement_result
+
+                # Get time elapsed
+                time_elapsed = getattr(play, 'time_elapsed', 0)
+
+                # Get post-play state
+                down_after = getattr(play, 'down_after_play', None)
+                distance_after = getattr(play, 'distance_after_play', None)
+                field_position_after = getattr(play, 'field_position_after_play', None)
+
+                rows.append((
+                    dynasty_id,
+                    game_id,
+                    play_number,
+                    drive_num,
+                    drive_play_num,
+                    quarter,
+                    int(clock_seconds),
+                    down,
+                    distance,
+                    yard_line,
+                    possession_team_id,
+                    home_score,
+                    away_score,
+                    play_type,
+                    play_description,
+                    yards,
+                    outcome,
+                    is_scoring,
+                    is_turnover,
+                    turnover_type,
+                    is_first_down,
+                    is_penalty,
+                    penalty_type,
+                    penalty_yards,
+                    None,  # penalty_team_id
+                    points,
+                    down_after,
+                    distance_after,
+                    field_position_after,
+                    time_elapsed,
+                ))
+
+                # Update tracking for next play
+                clock_seconds -= time_elapsed
+                if down_after is not None:
+                    down = down_after
+                if distance_after is not None:
+                    distance = distance_after
+                if field_position_after is not None:
+                    yard_line = field_position_after
+
+        return rows
+
     def _classify_play_type(self, outcome: str) -> str:
         """Classify play type from outcome string."""
         outcome_lower = outcome.lower()
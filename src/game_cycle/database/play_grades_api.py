@@ -196,6 +196,36 @@ class PlayGradesAPI:
         finally:
             conn.close()
 
+    def get_play_grades_for_games(
+        self, dynasty_id: str, game_ids: List[str]
+    ) -> Dict[str, List[PlayGrade]]:
+        """Get play grades for several games in one query, keyed by game_id."""
+        if not game_ids:
+            return {}
+        placeholders = ",".join("?" * len(game_ids))
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(
+                f"""
+                SELECT game_id, play_number, player_id, team_id, position,
+                       quarter, down, distance, yard_line, game_clock,
+                       score_differential, play_type, is_offense,
+                       play_grade, grade_component_1, grade_component_2, grade_component_3,
+                       was_positive_play, epa_contribution
+                FROM player_play_grades
+                WHERE dynasty_id = ? AND game_id IN ({placeholders})
+                ORDER BY game_id, play_number, player_id
+                """,
+                (dynasty_id, *game_ids),
+            )
+            by_game: Dict[str, List[PlayGrade]] = {}
+            for row in cursor.fetchall():
+                game_id = row["game_id"]
+                by_game.setdefault(game_id, []).append(self._row_to_play_grade(row, game_id))
+            return by_game
+        finally:
+            conn.close()
+
     def get_player_play_grades(
         self, dynasty_id: str, player_id: int, game_id: str
     ) -> List[PlayGrade]:
@@ -199,15 +199,9 @@ class PopularityAPI:
         Raises:
             ValueError: If scores are out of valid range
         """
-        # Validate ranges
-        if not (0 <= popularity_score <= 100):
-            raise ValueError(f"popularity_score must be 0-100, got {popularity_score}")
-        if not (0 <= performance_score <= 100):
-            raise ValueError(f"performance_score must be 0-100, got {performance_score}")
-        if not (0.5 <= visibility_multiplier <= 3.0):
-            raise ValueError(f"visibility_multiplier must be 0.5-3.0, got {visibility_multiplier}")
-        if not (0.8 <= market_multiplier <= 2.0):
-            raise ValueError(f"market_multiplier must be 0.8-2.0, got {market_multiplier}")
+        self._validate_score_ranges(
+            popularity_score, performance_score, visibility_multiplier, market_multiplier
+        )
 
         # Auto-calculate tier if not provided
         if tier is None:
@@ -232,6 +226,50 @@ class PopularityAPI:
         )
         return cursor.lastrowid
 
+    def save_popularity_scores(self, scores: List[Dict[str, Any]]) -> int:
+        """
+        Insert or update many popularity scores in one statement.
+
+        Args:
+            scores: Dicts with the save_popularity_score() keyword arguments
+
+        Returns:
+            Number of scores saved
+
+        Raises:
+            ValueError: If any score is out of valid range (nothing is saved)
+        """
+        rows = []
+        for score in scores:
+            self._validate_score_ranges(
+                score['popularity_score'], score['performance_score'],
+                score['visibility_multiplier'], score['market_multiplier']
+            )
+            tier = score.get('tier')
+            if tier is None:
+                tier = PopularityTier.from_score(score['popularity_score']).value
+            rows.append((
+                score['dynasty_id'], score['player_id'], score['season'], score['week'],
+                score['popularity_score'], score['performance_score'],
+                score['visibility_multiplier'], score['market_multiplier'],
+                score.get('week_change'), score.get('trend'), tier
+            ))
+
+        if not rows:
+            return 0
+
+        logger.debug(f"Saving {len(rows)} popularity scores")
+
+        self.db.executemany(
+            """INSERT OR REPLACE INTO player_popularity
+               (dynasty_id, player_id, season, week, popularity_score,
+                performance_score, visibility_multiplier, market_multiplier,
+                week_change, trend, tier)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            rows
+        )
+        return len(rows)
+
     def get_popularity_score(
         self,
         dynasty_id: str,
@@ -574,6 +612,23 @@ class PopularityAPI:
     # PRIVATE HELPER METHODS
     # ==========================================
 
+    @staticmethod
+    def _validate_score_ranges(
+        popularity_score: float,
+        performance_score: float,
+        visibility_multiplier: float,
+        market_multiplier: float
+    ) -> None:
+        """Raise ValueError if any score component is out of its valid range."""
+        if not (0 <= popularity_score <= 100):
+            raise ValueError(f"popularity_score must be 0-100, got {popularity_score}")
+        if not (0 <= performance_score <= 100):
+            raise ValueError(f"performance_score must be 0-100, got {performance_score}")
+        if not (0.5 <= visibility_multiplier <= 3.0):
+            raise ValueError(f"visibility_multiplier must be 0.5-3.0, got {visibility_multiplier}")
+        if not (0.8 <= market_multiplier <= 2.0):
+            raise ValueError(f"market_multiplier must be 0.8-2.0, got {market_multiplier}")
+
     def _row_to_popularity_score(self, row) -> PopularityScore:
         """Convert database row to PopularityScore dataclass."""
         return PopularityScore(
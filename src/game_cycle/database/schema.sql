@@ -2028,3 +2028,149 @@ CREATE TABLE IF NOT EXISTS player_popularity_events (
 CREATE INDEX IF NOT EXISTS idx_popularity_events_dynasty ON player_popularity_events(dynasty_id);
 CREATE INDEX IF NOT EXISTS idx_popularity_events_player ON player_popularity_events(dynasty_id, player_id, season, week);
 CREATE INDEX IF NOT EXISTS idx_popularity_events_type ON player_popularity_events(event_type);
+
+-- ============================================
+-- Deferred media / derived-data jobs
+-- ============================================
+
+-- Work queued by the regular season handler after a week is committed
+-- (game headlines, social posts, previews, power rankings, popularity, ...)
+-- One row per (dynasty, season, week, job_type, job_key): enqueueing twice is a no-op
+CREATE TABLE IF NOT EXISTS media_jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dynasty_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    job_type TEXT NOT NULL,  -- 'game_headline', 'social_posts', 'power_rankings', ...
+    job_key TEXT NOT NULL DEFAULT '',  -- game_id for per-game jobs, '' for per-week jobs
+    payload TEXT,  -- JSON arguments captured at enqueue time
+    status TEXT NOT NULL DEFAULT 'pending' CHECK(status IN ('pending', 'running', 'done', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP,
+
+    FOREIGN KEY (dynasty_id) REFERENCES dynasties(dynasty_id) ON DELETE CASCADE,
+    UNIQUE(dynasty_id, season, week, job_type, job_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_media_jobs_status ON media_jobs(status, job_id);
+
+-- ============================================
+-- Season stat aggregates (statistics.season_stat_aggregates)
+-- ============================================
+
+-- Season totals per player/team/position, updated as each week is persisted
+CREATE TABLE IF NOT EXISTS season_player_stat_totals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dynasty_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    season_type TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    player_name TEXT NOT NULL DEFAULT '',
+    team_id INTEGER NOT NULL,
+    position TEXT NOT NULL DEFAULT '',
+    conference TEXT,
+    division TEXT,
+    games INTEGER NOT NULL DEFAULT 0,
+    passing_yards INTEGER NOT NULL DEFAULT 0,
+    passing_touchdowns INTEGER NOT NULL DEFAULT 0,
+    passing_completions INTEGER NOT NULL DEFAULT 0,
+    passing_attempts INTEGER NOT NULL DEFAULT 0,
+    passing_interceptions INTEGER NOT NULL DEFAULT 0,
+    rushing_yards INTEGER NOT NULL DEFAULT 0,
+    rushing_touchdowns INTEGER NOT NULL DEFAULT 0,
+    rushing_attempts INTEGER NOT NULL DEFAULT 0,
+    receiving_yards INTEGER NOT NULL DEFAULT 0,
+    receiving_touchdowns INTEGER NOT NULL DEFAULT 0,
+    receptions INTEGER NOT NULL DEFAULT 0,
+    targets INTEGER NOT NULL DEFAULT 0,
+    tackles_total INTEGER NOT NULL DEFAULT 0,
+    sacks REAL NOT NULL DEFAULT 0,
+    interceptions INTEGER NOT NULL DEFAULT 0,
+    field_goals_made INTEGER NOT NULL DEFAULT 0,
+    field_goals_attempted INTEGER NOT NULL DEFAULT 0,
+    extra_points_made INTEGER NOT NULL DEFAULT 0,
+    extra_points_attempted INTEGER NOT NULL DEFAULT 0,
+    UNIQUE(dynasty_id, season, season_type, player_id, player_name, team_id, position)
+);
+
+CREATE INDEX IF NOT EXISTS idx_season_totals_player
+    ON season_player_stat_totals(dynasty_id, season, season_type, player_id);
+
+-- League/conference/division rank and percentile per ranked stat category
+CREATE TABLE IF NOT EXISTS season_player_stat_ranks (
+    totals_id INTEGER NOT NULL,
+    dynasty_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    season_type TEXT NOT NULL,
+    stat_category TEXT NOT NULL,
+    stat_value NUMERIC NOT NULL DEFAULT 0,
+    league_rank INTEGER,
+    conference_rank INTEGER,
+    division_rank INTEGER,
+    percentile REAL,
+    PRIMARY KEY (totals_id, stat_category)
+);
+
+CREATE INDEX IF NOT EXISTS idx_season_ranks_season
+    ON season_player_stat_ranks(dynasty_id, season, season_type, stat_category, league_rank);
+
+-- Team totals and ranks for teams 1-32
+CREATE TABLE IF NOT EXISTS season_team_stat_totals (
+    dynasty_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    season_type TEXT NOT NULL,
+    team_id INTEGER NOT NULL,
+    total_passing_yards INTEGER NOT NULL DEFAULT 0,
+    total_passing_tds INTEGER NOT NULL DEFAULT 0,
+    total_rushing_yards INTEGER NOT NULL DEFAULT 0,
+    total_rushing_tds INTEGER NOT NULL DEFAULT 0,
+    total_receiving_yards INTEGER NOT NULL DEFAULT 0,
+    total_receiving_tds INTEGER NOT NULL DEFAULT 0,
+    total_points_scored INTEGER NOT NULL DEFAULT 0,
+    player_count INTEGER NOT NULL DEFAULT 0,
+    games INTEGER NOT NULL DEFAULT 0,
+    passing_rank INTEGER,
+    rushing_rank INTEGER,
+    offensive_rank INTEGER,
+    PRIMARY KEY (dynasty_id, season, season_type, team_id)
+);
+
+-- Games already in the totals with the stats version they were added at
+-- (stat rows and newest player_game_stats id); a changed version rebuilds the season
+CREATE TABLE IF NOT EXISTS season_stat_aggregate_games (
+    dynasty_id TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    season_type TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    stats_rows INTEGER NOT NULL DEFAULT 0,
+    stats_version INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (dynasty_id, game_id, season_type)
+);
+
+CREATE INDEX IF NOT EXISTS idx_season_aggregate_games_season
+    ON season_stat_aggregate_games(dynasty_id, season, season_type);
+
+-- ============================================
+-- INSTANT score model calibrations
+-- ============================================
+
+-- Points model fitted to FULL simulation games (InstantScoreModel)
+-- One row per (dynasty, season); recalibrating a season replaces it
+CREATE TABLE IF NOT EXISTS score_model_calibrations (
+    dynasty_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    league_points REAL NOT NULL,
+    home_field REAL NOT NULL,
+    offense_weight REAL NOT NULL,
+    defense_weight REAL NOT NULL,
+    rating_baseline REAL NOT NULL,
+    stdev REAL NOT NULL,
+    correlation REAL NOT NULL,
+    games INTEGER NOT NULL DEFAULT 0,  -- FULL games fitted
+    calibrated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (dynasty_id, season),
+    FOREIGN KEY (dynasty_id) REFERENCES dynasties(dynasty_id) ON DELETE CASCADE
+);
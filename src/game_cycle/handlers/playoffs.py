@@ -151,7 +151,7 @@ class PlayoffHandler:
                 context, super_bowl_game
             )
             events_processed.append("Super Bowl MVP calculated")
-            events_processed.append(f"Super Bowl MVP: {super_bowl_result.get('mvp', {}).get('player_name', 'Unknown')}")
+            events_processed.append(f"Super Bowl MVP: {(super_bowl_result.get('mvp') or {}).get('player_name', 'Unknown')}")
 
         return {
             "games_played": games_played,
@@ -801,7 +801,7 @@ class PlayoffHandler:
         if dynasty_id:
             from ..database.connection import GameCycleDatabase
             from ..database.head_to_head_api import HeadToHeadAPI
-            gc_db = GameCycleDatabase()
+            gc_db = GameCycleDatabase(db_path)
             h2h_api = HeadToHeadAPI(gc_db)
             h2h_api.update_after_game(
                 dynasty_id=dynasty_id,
@@ -1634,7 +1634,7 @@ class PlayoffHandler:
         dynasty_id = context["dynasty_id"]
         season = context["season"]
 
-        db = GameCycleDatabase()  # Uses default game_cycle.db
+        db = GameCycleDatabase(context.get("db_path") or context["unified_api"].database_path)
         api = PlayoffBracketAPI(db)
 
         matchup = api.insert_matchup(
@@ -1674,7 +1674,7 @@ class PlayoffHandler:
         dynasty_id = context["dynasty_id"]
         season = context["season"]
 
-        db = GameCycleDatabase()  # Uses default game_cycle.db
+        db = GameCycleDatabase(context.get("db_path") or context["unified_api"].database_path)
         api = PlayoffBracketAPI(db)
 
         matchups = api.get_matchups_for_round(dynasty_id, season, round_name)
@@ -1703,7 +1703,7 @@ class PlayoffHandler:
         dynasty_id = context["dynasty_id"]
         season = context["season"]
 
-        db = GameCycleDatabase()  # Uses default game_cycle.db
+        db = GameCycleDatabase(context.get("db_path") or context["unified_api"].database_path)
         api = PlayoffBracketAPI(db)
 
         winners = api.get_round_winners(dynasty_id, season, round_name, conference)
@@ -1737,7 +1737,7 @@ class PlayoffHandler:
         dynasty_id = context["dynasty_id"]
         season = context["season"]
 
-        db = GameCycleDatabase()  # Uses default game_cycle.db
+        db = GameCycleDatabase(context.get("db_path") or context["unified_api"].database_path)
         api = PlayoffBracketAPI(db)
 
         api.update_result(
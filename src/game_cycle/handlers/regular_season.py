@@ -7,14 +7,32 @@ Dynasty-First Architecture:
 - No constructor injection of database/API objects
 
 Performance Optimization:
-- Game simulations run in parallel using ThreadPoolExecutor
-- Database writes remain sequential (SQLite single-writer limitation)
+- Game simulations run in parallel: worker processes for FULL mode
+  (CPU-bound play engine), ThreadPoolExecutor for INSTANT mode
+- Database writes for the whole week are batched into one transaction
+  (WeekPersistenceBatch; SQLite single-writer limitation)
 - Achieves 4-6x speedup for weekly game execution
+
+Context options for the parallel phase:
+- simulation_executor: "process" or "thread" (default: process for FULL,
+  thread for INSTANT)
+- simulation_workers: Worker count (default: CPU count - 1 for processes,
+  4 for threads); worker processes are kept for every week of the season
+- profile_plays: Time the phases of every FULL-mode play; the week's
+  aggregated PlayPhaseReport is logged and returned as play_phase_profile
+
+Context option for media and derived data:
+- media_mode: "inline" (default) generates social posts, headlines,
+  previews, power rankings, season grades and popularity before execute()
+  returns. "deferred" queues them as media jobs (services.media_job_queue)
+  run by a background worker; the next week's results are committed only
+  after the queue drains, so standings-based content stays week-accurate.
 """
 
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import time
 import logging
 import random
@@ -22,11 +40,31 @@ import random
 from ..stage_definitions import Stage, StageType
 from ..game_result_generator import generate_instant_result
 from ..services.game_simulator_service import GameSimulatorService, SimulationMode
+from ..services.game_simulation_pool import (
+    GameSimulationRequest,
+    get_season_pool,
+    resolve_worker_count,
+    shutdown_season_pool,
+)
+from ..services.media_job_queue import (
+    drain_media_jobs,
+    get_media_worker,
+    register_media_job,
+)
 from constants.position_abbreviations import get_position_abbreviation
 from src.utils.player_stat_formatter import format_player_stats, StatFormatStyle, CaseStyle
 
 logger = logging.getLogger(__name__)
 
+# Media job types queued when media_mode is "deferred"
+MEDIA_JOB_SOCIAL_POSTS = "social_posts"
+MEDIA_JOB_GAME_HEADLINE = "game_headline"
+MEDIA_JOB_PREVIEW_HEADLINES = "preview_headlines"
+MEDIA_JOB_AWARD_RACE = "award_race"
+MEDIA_JOB_POWER_RANKINGS = "power_rankings"
+MEDIA_JOB_SEASON_GRADES = "season_grades"
+MEDIA_JOB_POPULARITY = "popularity"
+
 
 @dataclass
 class GameSimContext:
@@ -43,6 +81,7 @@ class GameSimContext:
     event_id: Optional[str]   # Event ID for updating events table
     season: int
     week: int
+    instant_scores: Optional[Tuple[int, int]] = None  # INSTANT mode, generated per week
 
 
 class RegularSeasonHandler:
@@ -142,58 +181,162 @@ class RegularSeasonHandler:
             mode=simulation_mode,
             season=ctx.season,
             week=ctx.week,
-            is_playoff=False
+            is_playoff=False,
+            instant_scores=ctx.instant_scores
         )
         return (ctx, sim_result)
 
-    def _persist_game_result(
+    def _simulate_games_in_threads(
+        self,
+        games_to_simulate: List[GameSimContext],
+        game_simulator: GameSimulatorService,
+        simulation_mode: SimulationMode,
+        max_workers: int
+    ) -> List[Tuple[GameSimContext, Any]]:
+        """
+        Simulate games on a ThreadPoolExecutor sharing one simulator instance.
+
+        Threads avoid process startup and pickle overhead, which suits INSTANT
+        mode (mostly DB reads for mock stats). FULL mode is CPU-bound and
+        gains little from threads because of the GIL.
+
+        Args:
+            games_to_simulate: Games to simulate
+            game_simulator: Shared simulator service instance
+            simulation_mode: INSTANT or FULL simulation mode
+            max_workers: Number of worker threads
+
+        Returns:
+            List of (context, simulation_result) tuples in completion order
+        """
+        sim_results: List[Tuple[GameSimContext, Any]] = []
+
+        # Single game - run directly without thread overhead
+        if len(games_to_simulate) == 1:
+            ctx = games_to_simulate[0]
+            sim_results.append(self._simulate_single_game(ctx, game_simulator, simulation_mode))
+            return sim_results
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._simulate_single_game, ctx, game_simulator, simulation_mode
+                )
+                for ctx in games_to_simulate
+            ]
+            # Collect results as they complete
+            for future in as_completed(futures):
+                try:
+                    sim_results.append(future.result())
+                except Exception as e:
+                    logger.error("Game simulation failed: %s", e)
+
+        return sim_results
+
+    def _simulate_games_in_processes(
         self,
+        games_to_simulate: List[GameSimContext],
+        game_simulator: GameSimulatorService,
+        simulation_mode: SimulationMode,
+        db_path: str,
+        dynasty_id: str,
+        requested_workers: Optional[int],
+        profile_plays: bool = False
+    ) -> List[Tuple[GameSimContext, Any]]:
+        """
+        Simulate games across worker processes (GameSimulationPool).
+
+        The season's pool is reused from week to week (get_season_pool), so
+        worker startup is paid once per season. Each worker loads rosters and
+        coaching staff once and returns compact GameSimulationResult payloads.
+        If the pool breaks (e.g. a worker is killed), it is shut down and the
+        games without results are simulated in threads instead.
+
+        Args:
+            games_to_simulate: Games to simulate
+            game_simulator: Simulator used for the thread fallback
+            simulation_mode: INSTANT or FULL simulation mode
+            db_path: Database path for worker processes
+            dynasty_id: Dynasty identifier for worker processes
+            requested_workers: Explicit worker count (None = CPU count - 1)
+            profile_plays: Profile play phases in the worker processes
+
+        Returns:
+            List of (context, simulation_result) tuples in completion order
+        """
+        ctx_by_game_id = {ctx.game_id_for_db: ctx for ctx in games_to_simulate}
+        requests = [
+            GameSimulationRequest(
+                game_id=ctx.game_id_for_db,
+                home_team_id=ctx.home_team_id,
+                away_team_id=ctx.away_team_id,
+                season=ctx.season,
+                week=ctx.week,
+                is_playoff=False
+            )
+            for ctx in games_to_simulate
+        ]
+        max_workers = resolve_worker_count(requested_workers, len(requests))
+
+        sim_results: List[Tuple[GameSimContext, Any]] = []
+        try:
+            pool = get_season_pool(
+                db_path, dynasty_id, games_to_simulate[0].season, max_workers,
+                profile_plays=profile_plays
+            )
+            for request, sim_result in pool.simulate(requests, simulation_mode):
+                sim_results.append((ctx_by_game_id[request.game_id], sim_result))
+        except (BrokenProcessPool, OSError) as e:
+            shutdown_season_pool()
+            completed = {ctx.game_id_for_db for ctx, _ in sim_results}
+            remaining = [ctx for ctx in games_to_simulate if ctx.game_id_for_db not in completed]
+            logger.warning(
+                "Process pool failed (%s) - simulating %d remaining games in threads",
+                e, len(remaining)
+            )
+            sim_results.extend(self._simulate_games_in_threads(
+                remaining, game_simulator, simulation_mode, max_workers=4
+            ))
+
+        return sim_results
+
+    def _queue_game_result(
+        self,
+        batch: Any,
         ctx: GameSimContext,
         sim_result: Any,
-        unified_api: Any,
         simulation_mode: SimulationMode,
         dynasty_id: str,
-        db_path: str,
-        gc_db: Any,
-        headline_generator: Any,
-        game_number: int = 0,
-        total_games: int = 0,
-        progress_callback: callable = None
-    ) -> Dict[str, Any]:
+        gc_db: Any
+    ) -> List[Dict[str, Any]]:
         """
-        Persist a single game result to database.
+        Queue a single game's database writes on the week's batch.
 
-        This method handles all sequential database writes for a game:
-        - Game result insertion
-        - Player stats persistence
-        - Box score persistence
+        Queues (written later in one transaction by batch.flush()):
+        - Game result
+        - Player stats
+        - Play-by-play (FULL mode)
+        - Box scores
         - Event update
-        - Injury recording
-        - Standings updates
-        - Headline generation
+        - Injuries
+        - Standings, head-to-head and rivalry updates
 
         Args:
+            batch: WeekPersistenceBatch for the week
             ctx: Game context
             sim_result: Simulation result to persist
-            unified_api: Database API instance
             simulation_mode: For logging purposes
             dynasty_id: Dynasty identifier
-            db_path: Database path for services
             gc_db: Shared GameCycleDatabase connection for the week
-            headline_generator: Shared HeadlineGenerator instance for the week
-            game_number: Current game number (for progress)
-            total_games: Total games to simulate (for progress)
-            progress_callback: Optional callback(current, total, message) for UI updates
 
         Returns:
-            Dictionary with game result info for return to caller
+            Injury summaries for the game
         """
         home_score = sim_result.home_score
         away_score = sim_result.away_score
 
-        # Record result using UnifiedDatabaseAPI (games table for results)
-        # MUST insert game FIRST because player_game_stats has FK to games
-        unified_api.games_insert_result({
+        # games row is written before player_game_stats (FK to games)
+        batch.add_game_result({
             "game_id": ctx.game_id_for_db,
             "season": ctx.season,
             "week": ctx.week,
@@ -209,7 +352,7 @@ class RegularSeasonHandler:
             "overtime_periods": sim_result.overtime_periods,
         })
 
-        # Persist player stats from simulation
+        # Player stats from simulation
         try:
             if sim_result.player_stats is not None:
                 if len(sim_result.player_stats) == 0:
@@ -219,33 +362,23 @@ class RegularSeasonHandler:
                         ctx.game_id_for_db
                     )
                 else:
-                    stats_count = unified_api.stats_insert_game_stats(
-                        game_id=ctx.game_id_for_db,
-                        season=ctx.season,
-                        week=ctx.week,
-                        season_type="regular_season",
-                        player_stats=sim_result.player_stats
-                    )
+                    stats_count = batch.add_player_stats(ctx.game_id_for_db, sim_result.player_stats)
                     mode_label = "full sim" if simulation_mode == SimulationMode.FULL else "instant"
-                    logger.debug("Inserted %d player stats (%s) for game %s", stats_count, mode_label, ctx.game_id_for_db)
+                    logger.debug("Queued %d player stats (%s) for game %s", stats_count, mode_label, ctx.game_id_for_db)
         except Exception as e:
             logger.warning("Failed to persist stats for game %s: %s", ctx.game_id_for_db, e)
 
-        # Persist play-by-play data (if drives available from FULL simulation)
+        # Play-by-play data (if drives available from FULL simulation)
         if hasattr(sim_result, 'drives') and sim_result.drives:
             try:
-                from ..database.play_by_play_api import PlayByPlayAPI
-                pbp_api = PlayByPlayAPI(db_path)
-                drive_count = pbp_api.insert_drives_batch(dynasty_id, ctx.game_id_for_db, sim_result.drives)
-                play_count = pbp_api.insert_plays_batch(
-                    dynasty_id, ctx.game_id_for_db, sim_result.drives,
+                batch.add_play_by_play(
+                    ctx.game_id_for_db, sim_result.drives,
                     home_team_id=ctx.home_team_id, away_team_id=ctx.away_team_id
                 )
-                logger.debug("Persisted %d drives, %d plays for game %s", drive_count, play_count, ctx.game_id_for_db)
             except Exception as e:
                 logger.warning("Failed to persist play-by-play for game %s: %s", ctx.game_id_for_db, e)
 
-        # Persist box scores
+        # Box scores
         try:
             home_box = self._build_box_score_dict(
                 sim_result.home_team_stats,
@@ -257,51 +390,25 @@ class RegularSeasonHandler:
                 sim_result.player_stats,
                 ctx.away_team_id
             )
-            unified_api.box_scores_insert(
+            batch.add_box_scores(
                 game_id=ctx.game_id_for_db,
                 home_team_id=ctx.home_team_id,
                 away_team_id=ctx.away_team_id,
                 home_box=home_box,
                 away_box=away_box
             )
-            logger.debug("Inserted box scores for game %s", ctx.game_id_for_db)
         except Exception as e:
             logger.warning("Failed to persist box scores for game %s: %s", ctx.game_id_for_db, e)
 
-        # Generate social media posts for game result (Milestone 14)
-        logger.info(f"[SOCIAL] About to generate posts for game {ctx.game_id_for_db}")
-        try:
-            self._generate_game_social_posts(
-                gc_db=gc_db,
-                db_path=db_path,
-                dynasty_id=dynasty_id,
-                season=ctx.season,
-                week=ctx.week,
-                game_id=ctx.game_id_for_db,
-                home_team_id=ctx.home_team_id,
-                away_team_id=ctx.away_team_id,
-                home_score=home_score,
-                away_score=away_score,
-                sim_result=sim_result
-            )
-        except Exception as e:
-            logger.error("SOCIAL POST GENERATION FAILED for game %s: %s", ctx.game_id_for_db, e, exc_info=True)
-            # Don't fail the whole simulation, but log full traceback
-
         # Update event in events table (optional - legacy feature)
         if ctx.event_id:
-            try:
-                unified_api.events_update_game_result(ctx.event_id, home_score, away_score)
-            except Exception as e:
-                logger.debug(f"Could not update event {ctx.event_id}: {e} (events table optional)")
+            batch.add_event_result(ctx.event_id, home_score, away_score)
 
-        # Record injuries
+        # Injuries
         game_injuries = []
         if sim_result.injuries:
-            from ..services.injury_service import InjuryService
-            injury_service = InjuryService(db_path, dynasty_id, ctx.season)
+            batch.add_injuries(sim_result.injuries)
             for injury in sim_result.injuries:
-                injury_service.record_injury(injury)
                 game_injuries.append({
                     'player_id': injury.player_id,
                     'player_name': injury.player_name,
@@ -310,11 +417,10 @@ class RegularSeasonHandler:
                     'weeks_out': injury.weeks_out,
                     'severity': injury.severity.value
                 })
-            if game_injuries:
-                logger.debug("Recorded %d injuries for game %s", len(game_injuries), ctx.game_id_for_db)
 
-        # Update standings
-        self._update_standings_for_game(
+        # Standings
+        batch.defer(
+            self._update_standings_for_game,
             gc_db=gc_db,
             dynasty_id=dynasty_id,
             season=ctx.season,
@@ -325,21 +431,59 @@ class RegularSeasonHandler:
             overtime_periods=sim_result.overtime_periods
         )
 
-        # Generate headline
-        self._generate_game_headline(
-            gc_db=gc_db,
-            headline_generator=headline_generator,
-            db_path=db_path,
-            dynasty_id=dynasty_id,
-            season=ctx.season,
-            week=ctx.week,
-            game_id=ctx.game_id_for_db,
-            home_team_id=ctx.home_team_id,
-            away_team_id=ctx.away_team_id,
-            home_score=home_score,
-            away_score=away_score,
-            sim_result=sim_result
-        )
+        return game_injuries
+
+    def _publish_game_result(
+        self,
+        ctx: GameSimContext,
+        sim_result: Any,
+        simulation_mode: SimulationMode,
+        dynasty_id: str,
+        db_path: str,
+        gc_db: Any,
+        headline_generator: Any,
+        game_injuries: List[Dict[str, Any]],
+        game_number: int = 0,
+        total_games: int = 0,
+        progress_callback: callable = None,
+        defer_media: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Generate media for a persisted game and report progress.
+
+        Runs after the week's batch is committed: social posts and headlines
+        read the game's stats, standings and injuries back from the database.
+        With defer_media they are left to the week's queued media jobs.
+
+        Args:
+            ctx: Game context
+            sim_result: Simulation result
+            simulation_mode: Determines whether the full result is returned
+            dynasty_id: Dynasty identifier
+            db_path: Database path for services
+            gc_db: Shared GameCycleDatabase connection for the week
+            headline_generator: Shared HeadlineGenerator instance for the week
+            game_injuries: Injury summaries from _queue_game_result()
+            game_number: Current game number (for progress)
+            total_games: Total games to simulate (for progress)
+            progress_callback: Optional callback(current, total, message) for UI updates
+            defer_media: Skip social posts and headline (queued as media jobs)
+
+        Returns:
+            Dictionary with game result info for return to caller
+        """
+        home_score = sim_result.home_score
+        away_score = sim_result.away_score
+
+        if not defer_media:
+            self._generate_game_media(
+                ctx=ctx,
+                sim_result=sim_result,
+                dynasty_id=dynasty_id,
+                db_path=db_path,
+                gc_db=gc_db,
+                headline_generator=headline_generator
+            )
 
         # Build result for return
         game_result_to_include = sim_result if simulation_mode == SimulationMode.FULL else None
@@ -367,6 +511,65 @@ class RegularSeasonHandler:
             "game_result": game_result_to_include,
         }
 
+    def _generate_game_media(
+        self,
+        ctx: GameSimContext,
+        sim_result: Any,
+        dynasty_id: str,
+        db_path: str,
+        gc_db: Any,
+        headline_generator: Any
+    ) -> None:
+        """
+        Generate social posts and the headline for a persisted game.
+
+        Args:
+            ctx: Game context
+            sim_result: Simulation result
+            dynasty_id: Dynasty identifier
+            db_path: Database path for services
+            gc_db: Shared GameCycleDatabase connection for the week
+            headline_generator: Shared HeadlineGenerator instance for the week
+        """
+        home_score = sim_result.home_score
+        away_score = sim_result.away_score
+
+        # Generate social media posts for game result (Milestone 14)
+        logger.info(f"[SOCIAL] About to generate posts for game {ctx.game_id_for_db}")
+        try:
+            self._generate_game_social_posts(
+                gc_db=gc_db,
+                db_path=db_path,
+                dynasty_id=dynasty_id,
+                season=ctx.season,
+                week=ctx.week,
+                game_id=ctx.game_id_for_db,
+                home_team_id=ctx.home_team_id,
+                away_team_id=ctx.away_team_id,
+                home_score=home_score,
+                away_score=away_score,
+                sim_result=sim_result
+            )
+        except Exception as e:
+            logger.error("SOCIAL POST GENERATION FAILED for game %s: %s", ctx.game_id_for_db, e, exc_info=True)
+            # Don't fail the whole simulation, but log full traceback
+
+        # Generate headline
+        self._generate_game_headline(
+            gc_db=gc_db,
+            headline_generator=headline_generator,
+            db_path=db_path,
+            dynasty_id=dynasty_id,
+            season=ctx.season,
+            week=ctx.week,
+            game_id=ctx.game_id_for_db,
+            home_team_id=ctx.home_team_id,
+            away_team_id=ctx.away_team_id,
+            home_score=home_score,
+            away_score=away_score,
+            sim_result=sim_result
+        )
+
     def execute(self, stage: Stage, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute all games for the week.
@@ -391,22 +594,35 @@ class RegularSeasonHandler:
         db_path = self._get_db_path(context)
 
         # Initialize unified game simulator
-        game_simulator = GameSimulatorService(db_path, dynasty_id)
+        game_simulator = GameSimulatorService(
+            db_path, dynasty_id, profile_plays=bool(context.get("profile_plays"))
+        )
 
         # Get simulation mode from context (default: INSTANT for backwards compatibility)
         mode_str = context.get("simulation_mode", "instant")
         simulation_mode = SimulationMode.FULL if mode_str == "full" else SimulationMode.INSTANT
 
+        # Deferred media: content and derived data are queued as media jobs
+        defer_media = bool(db_path) and context.get("media_mode", "inline") == "deferred"
+
         # Create HeadlineGenerator once for entire week (reused across all games)
-        from ..services.headline_generator import HeadlineGenerator
-        headline_generator = HeadlineGenerator(db_path, dynasty_id, season)
+        headline_generator = None
+        if not defer_media:
+            from ..services.headline_generator import HeadlineGenerator
+            headline_generator = HeadlineGenerator(db_path, dynasty_id, season)
 
         # WEEK 1 HOOK: Generate draft class and free agents at season start
         if week_number == 1:
             self._trigger_season_start_generation(context)
 
         # Generate preview headlines for notable upcoming games (rivalries, divisional, etc.)
-        if db_path:
+        # (deferred: usually already queued by last week; runs while this week simulates)
+        if defer_media:
+            self._queue_media_jobs(
+                db_path, dynasty_id, season,
+                [(week_number, MEDIA_JOB_PREVIEW_HEADLINES, "", None)]
+            )
+        elif db_path:
             self._generate_preview_headlines(
                 headline_generator=headline_generator,
                 db_path=db_path,
@@ -506,79 +722,125 @@ class RegularSeasonHandler:
                 "week": week_number,
             }
 
+        # INSTANT scores for the whole week come from one model call
+        if simulation_mode == SimulationMode.INSTANT:
+            week_scores = game_simulator.generate_instant_scores(
+                [(ctx.home_team_id, ctx.away_team_id) for ctx in games_to_simulate], season
+            )
+            for ctx, scores in zip(games_to_simulate, week_scores):
+                ctx.instant_scores = scores
+
         # ============================================================
         # PHASE 2: Parallel simulation (CPU-bound computation)
         # ============================================================
-        # ThreadPoolExecutor is used because:
-        # - Game simulation reads JSON files (I/O bound)
-        # - Avoids pickle overhead of ProcessPoolExecutor
-        # - Shared game_simulator instance across threads
-        # - 4 workers = good balance for 16 games
         sim_start = time.time()
-        sim_results: List[Tuple[GameSimContext, Any]] = []
+        executor_kind = context.get(
+            "simulation_executor",
+            "process" if simulation_mode == SimulationMode.FULL else "thread"
+        )
+        requested_workers = context.get("simulation_workers")
 
-        # Use parallel execution for multiple games, sequential for single game
-        if len(games_to_simulate) > 1:
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = [
-                    executor.submit(
-                        self._simulate_single_game, ctx, game_simulator, simulation_mode
-                    )
-                    for ctx in games_to_simulate
-                ]
-                # Collect results as they complete
-                for future in as_completed(futures):
-                    try:
-                        result = future.result()
-                        sim_results.append(result)
-                    except Exception as e:
-                        logger.error("Game simulation failed: %s", e)
+        if executor_kind == "process" and len(games_to_simulate) > 1:
+            sim_results = self._simulate_games_in_processes(
+                games_to_simulate, game_simulator, simulation_mode,
+                db_path, dynasty_id, requested_workers,
+                profile_plays=game_simulator.profile_plays
+            )
         else:
-            # Single game - run directly without thread overhead
-            for ctx in games_to_simulate:
-                result = self._simulate_single_game(ctx, game_simulator, simulation_mode)
-                sim_results.append(result)
+            sim_results = self._simulate_games_in_threads(
+                games_to_simulate, game_simulator, simulation_mode,
+                requested_workers or 4
+            )
 
         sim_elapsed = time.time() - sim_start
-        logger.info("Simulated %d games in %.2f seconds (parallel)",
-                   len(sim_results), sim_elapsed)
+        logger.info("Simulated %d games in %.2f seconds (parallel, %s)",
+                   len(sim_results), sim_elapsed, executor_kind)
+
+        # The season's worker processes are not needed after the last week
+        if stage.stage_type == StageType.REGULAR_WEEK_18:
+            shutdown_season_pool()
+
+        week_phase_profile = None
+        if game_simulator.profile_plays and simulation_mode == SimulationMode.FULL:
+            from game_management.play_phase_profiler import PlayPhaseReport
+            week_profile = PlayPhaseReport.combine(
+                getattr(sim_result, "play_phase_profile", None) for _, sim_result in sim_results
+            )
+            logger.info("Week %d play phases: %s", week_number, week_profile.format_table())
+            week_phase_profile = week_profile.to_dict()
 
         # ============================================================
-        # PHASE 3: Sequential database writes (SQLite single-writer)
+        # PHASE 3: Batched database writes (SQLite single-writer)
         # ============================================================
-        # Database writes MUST be sequential due to:
-        # - SQLite allows only ONE writer at a time
-        # - Foreign key constraints (games → player_game_stats → box_scores)
-        # - Standings updates modify shared table rows
+        # Every game's rows are queued on a WeekPersistenceBatch and written
+        # with executemany in ONE transaction on one connection (games before
+        # player_game_stats for the FK, standings on the same connection), so
+        # commits are paid once per week. Social posts and headlines read the
+        # persisted rows back, so they run after the commit.
+        if defer_media:
+            # Last week's media jobs read the cumulative standings, so they
+            # finish before this week's results change them
+            if not drain_media_jobs(db_path):
+                events_processed.append(
+                    f"Week {week_number}: earlier media jobs failed (content missing until retried)"
+                )
+
         persist_start = time.time()
         total_games = len(sim_results)
         progress_callback = context.get("progress_callback")
 
-        # Create shared database connection for all game persistence operations
-        # (reduces 64 connections/week to 1)
         from ..database.connection import GameCycleDatabase
+        from ..services.week_persistence_batch import WeekPersistenceBatch
         gc_db = GameCycleDatabase(db_path)
         try:
-            for game_num, (ctx, sim_result) in enumerate(sim_results, start=1):
-                game_result = self._persist_game_result(
+            batch = WeekPersistenceBatch(gc_db, dynasty_id, season)
+            injuries_by_game = [
+                self._queue_game_result(
+                    batch=batch,
+                    ctx=ctx,
+                    sim_result=sim_result,
+                    simulation_mode=simulation_mode,
+                    dynasty_id=dynasty_id,
+                    gc_db=gc_db
+                )
+                for ctx, sim_result in sim_results
+            ]
+            counts = batch.flush()
+            logger.debug("Week %s persisted in one transaction: %s", week_number, counts)
+
+            # Headlines for the week read stats, box scores and standings
+            # from one bulk load instead of per-game queries
+            if headline_generator is not None:
+                try:
+                    headline_generator.preload_week([ctx.game_id_for_db for ctx, _ in sim_results])
+                except Exception as e:
+                    logger.warning("Could not preload headline data for week %s: %s", week_number, e)
+
+            for game_num, ((ctx, sim_result), game_injuries) in enumerate(
+                zip(sim_results, injuries_by_game), start=1
+            ):
+                game_result = self._publish_game_result(
                     ctx=ctx,
                     sim_result=sim_result,
-                    unified_api=unified_api,
                     simulation_mode=simulation_mode,
                     dynasty_id=dynasty_id,
                     db_path=db_path,
                     gc_db=gc_db,
                     headline_generator=headline_generator,
+                    game_injuries=game_injuries,
                     game_number=game_num,
                     total_games=total_games,
-                    progress_callback=progress_callback
+                    progress_callback=progress_callback,
+                    defer_media=defer_media
                 )
                 games_played.append(game_result)
         finally:
+            if headline_generator is not None:
+                headline_generator.clear_week_data()
             gc_db.close()
 
         persist_elapsed = time.time() - persist_start
-        logger.info("Persisted %d game results in %.2f seconds (sequential)",
+        logger.info("Persisted %d game results in %.2f seconds (one transaction)",
                    len(games_played), persist_elapsed)
 
         events_processed.append(f"Week {week_number}: {len(games_played)} games simulated")
@@ -588,37 +850,47 @@ class RegularSeasonHandler:
         for game in games_played:
             all_injuries.extend(game.get("injuries", []))
 
-        # Update award race tracking (week 10+)
-        award_race_tracked = self._update_award_race_tracking(db_path, dynasty_id, season, week_number)
+        award_race_tracked = power_rankings_count = None
+        season_grades_updated = popularity_players_updated = None
+        media_jobs_queued = 0
+        if defer_media:
+            # Flex scheduling changes upcoming games, so it stays inline
+            flex_results = self._evaluate_flex_scheduling(context, week_number, season)
+            media_jobs_queued = self._queue_week_media(
+                db_path, dynasty_id, season, week_number, sim_results
+            )
+        else:
+            # Update award race tracking (week 10+)
+            award_race_tracked = self._update_award_race_tracking(db_path, dynasty_id, season, week_number)
 
-        # Evaluate flex scheduling (weeks 10-15 flex weeks 12-17)
-        flex_results = self._evaluate_flex_scheduling(context, week_number, season)
+            # Evaluate flex scheduling (weeks 10-15 flex weeks 12-17)
+            flex_results = self._evaluate_flex_scheduling(context, week_number, season)
 
-        # Generate power rankings for the week (Media Coverage - Milestone 12)
-        power_rankings_count = self._generate_power_rankings(db_path, dynasty_id, season, week_number)
+            # Generate power rankings for the week (Media Coverage - Milestone 12)
+            power_rankings_count = self._generate_power_rankings(db_path, dynasty_id, season, week_number)
 
-        # Generate previews for NEXT week's games after this week's simulation
-        # So when stage advances, previews already exist for sidebar display
-        # Week 17 is the last regular season week (17-week schedule), no week 18 previews needed
-        if db_path and week_number < 17:
-            self._generate_preview_headlines(
-                headline_generator=headline_generator,
-                db_path=db_path,
-                dynasty_id=dynasty_id,
-                season=season,
-                week=week_number + 1
-            )
+            # Generate previews for NEXT week's games after this week's simulation
+            # So when stage advances, previews already exist for sidebar display
+            # Week 17 is the last regular season week (17-week schedule), no week 18 previews needed
+            if db_path and week_number < 17:
+                self._generate_preview_headlines(
+                    headline_generator=headline_generator,
+                    db_path=db_path,
+                    dynasty_id=dynasty_id,
+                    season=season,
+                    week=week_number + 1
+                )
 
-        # Aggregate game grades into season grades before popularity calculation
-        # This ensures popularity has access to updated performance data
-        season_grades_updated = self._aggregate_season_grades(
-            db_path, dynasty_id, season
-        )
+            # Aggregate game grades into season grades before popularity calculation
+            # This ensures popularity has access to updated performance data
+            season_grades_updated = self._aggregate_season_grades(
+                db_path, dynasty_id, season
+            )
 
-        # Update player popularity after all games/stats/media are finalized (Milestone 16)
-        popularity_players_updated = self._update_player_popularity(
-            db_path, dynasty_id, season, week_number
-        )
+            # Update player popularity after all games/stats/media are finalized (Milestone 16)
+            popularity_players_updated = self._update_player_popularity(
+                db_path, dynasty_id, season, week_number
+            )
 
         return {
             "games_played": games_played,
@@ -632,6 +904,8 @@ class RegularSeasonHandler:
             "power_rankings_updated": power_rankings_count,
             "season_grades_updated": season_grades_updated,
             "popularity_players_updated": popularity_players_updated,
+            "media_jobs_queued": media_jobs_queued,
+            "play_phase_profile": week_phase_profile,
         }
 
     def _update_standings_for_game(
@@ -1899,7 +2173,8 @@ class RegularSeasonHandler:
         away_team_id: int,
         home_score: int,
         away_score: int,
-        sim_result
+        sim_result=None,
+        overtime_periods: Optional[int] = None
     ) -> None:
         """
         Generate and persist headline for completed game.
@@ -1923,10 +2198,14 @@ class RegularSeasonHandler:
             home_score: Home team final score
             away_score: Away team final score
             sim_result: SimulationResult with game details
+            overtime_periods: Overtime periods when no sim_result is available
         """
         try:
             from ..database.media_coverage_api import MediaCoverageAPI
 
+            if overtime_periods is None:
+                overtime_periods = getattr(sim_result, 'overtime_periods', 0)
+
             # Determine winner/loser
             if home_score > away_score:
                 winner_id, loser_id = home_team_id, away_team_id
@@ -1946,7 +2225,7 @@ class RegularSeasonHandler:
                 "home_team_id": home_team_id,
                 "away_team_id": away_team_id,
                 "is_playoff": False,
-                "overtime_periods": getattr(sim_result, 'overtime_periods', 0),
+                "overtime_periods": overtime_periods,
             }
 
             # Generate headline using shared generator
@@ -2131,7 +2410,8 @@ class RegularSeasonHandler:
         away_team_id: int,
         home_score: int,
         away_score: int,
-        sim_result
+        sim_result=None,
+        star_players: Optional[Dict[int, str]] = None
     ) -> int:
         """
         Generate and persist social media posts for a completed game.
@@ -2153,6 +2433,7 @@ class RegularSeasonHandler:
             home_score: Home team final score
             away_score: Away team final score
             sim_result: SimulationResult with game details
+            star_players: Top performer name per team when no sim_result is available
 
         Returns:
             Number of posts generated (0 on failure)
@@ -2176,25 +2457,11 @@ class RegularSeasonHandler:
             # Calculate game characteristics
             score_margin = abs(home_score - away_score)
             is_blowout = score_margin >= 21
-            is_upset = self._is_upset(dynasty_id, season, winner_id, loser_id)
+            is_upset = self._is_upset(db_path, dynasty_id, season, winner_id, loser_id)
 
             # Extract star players from sim result (if available)
-            star_players = {}
-            if hasattr(sim_result, 'player_stats') and sim_result.player_stats:
-                # Find top performer for each team (highest offensive yards)
-                for team_id in [home_team_id, away_team_id]:
-                    team_stats = [p for p in sim_result.player_stats if p.get('team_id') == team_id]
-                    if team_stats:
-                        # Sort by total offense (passing + rushing + receiving yards)
-                        def get_total_yards(p):
-                            return (
-                                (p.get('passing_yards') or 0) +
-                                (p.get('rushing_yards') or 0) +
-                                (p.get('receiving_yards') or 0)
-                            )
-                        top_player = max(team_stats, key=get_total_yards, default=None)
-                        if top_player:
-                            star_players[team_id] = top_player.get('player_name', 'Unknown')
+            if star_players is None:
+                star_players = self._find_star_players(sim_result, home_team_id, away_team_id)
 
             # Check personalities exist using shared connection
             pers_api = SocialPersonalityAPI(gc_db)
@@ -2234,7 +2501,170 @@ class RegularSeasonHandler:
             logger.warning("Failed to generate social posts for game %s: %s", game_id, e)
             return 0
 
-    def _is_upset(self, dynasty_id: str, season: int, winner_id: int, loser_id: int) -> bool:
+    @staticmethod
+    def _find_star_players(sim_result: Any, home_team_id: int, away_team_id: int) -> Dict[int, str]:
+        """Top performer name per team (highest offensive yards) from a sim result."""
+        star_players = {}
+        if hasattr(sim_result, 'player_stats') and sim_result.player_stats:
+            # Find top performer for each team (highest offensive yards)
+            for team_id in [home_team_id, away_team_id]:
+                team_stats = [p for p in sim_result.player_stats if p.get('team_id') == team_id]
+                if team_stats:
+                    # Sort by total offense (passing + rushing + receiving yards)
+                    def get_total_yards(p):
+                        return (
+                            (p.get('passing_yards') or 0) +
+                            (p.get('rushing_yards') or 0) +
+                            (p.get('receiving_yards') or 0)
+                        )
+                    top_player = max(team_stats, key=get_total_yards, default=None)
+                    if top_player:
+                        star_players[team_id] = top_player.get('player_name', 'Unknown')
+        return star_players
+
+    # -------------------- Deferred Media Jobs --------------------
+
+    def _queue_media_jobs(
+        self,
+        db_path: str,
+        dynasty_id: str,
+        season: int,
+        jobs: List[Tuple[int, str, str, Optional[Dict[str, Any]]]]
+    ) -> int:
+        """
+        Queue media jobs and wake the background worker.
+
+        Args:
+            db_path: Database path
+            dynasty_id: Dynasty identifier
+            season: Season year
+            jobs: (week, job_type, job_key, payload) tuples in run order
+
+        Returns:
+            Number of jobs queued (already queued jobs are skipped)
+        """
+        from ..database.connection import GameCycleDatabase
+        from ..database.media_jobs_api import MediaJobsAPI
+
+        gc_db = GameCycleDatabase(db_path)
+        try:
+            queued = MediaJobsAPI(gc_db).enqueue_many(dynasty_id, season, jobs)
+        finally:
+            gc_db.close()
+        get_media_worker(db_path).notify()
+        return queued
+
+    def _queue_week_media(
+        self,
+        db_path: str,
+        dynasty_id: str,
+        season: int,
+        week: int,
+        sim_results: List[Tuple[GameSimContext, Any]]
+    ) -> int:
+        """
+        Queue everything a simulated week generates, in the inline order.
+
+        Per game: social posts, then the headline. Then award race tracking,
+        power rankings, next week's previews, season grades and popularity.
+        Payloads carry what the jobs cannot read back from the database.
+
+        Args:
+            db_path: Database path
+            dynasty_id: Dynasty identifier
+            season: Season year
+            week: Week number
+            sim_results: (context, result) pairs for the week's games
+
+        Returns:
+            Number of jobs queued
+        """
+        jobs = []
+        for ctx, sim_result in sim_results:
+            game = {
+                "home_team_id": ctx.home_team_id,
+                "away_team_id": ctx.away_team_id,
+                "home_score": sim_result.home_score,
+                "away_score": sim_result.away_score,
+            }
+            star_players = self._find_star_players(sim_result, ctx.home_team_id, ctx.away_team_id)
+            jobs.append((week, MEDIA_JOB_SOCIAL_POSTS, ctx.game_id_for_db, {
+                **game, "star_players": {str(t): name for t, name in star_players.items()},
+            }))
+            jobs.append((week, MEDIA_JOB_GAME_HEADLINE, ctx.game_id_for_db, {
+                **game, "overtime_periods": getattr(sim_result, 'overtime_periods', 0) or 0,
+            }))
+
+        jobs.append((week, MEDIA_JOB_AWARD_RACE, "", None))
+        jobs.append((week, MEDIA_JOB_POWER_RANKINGS, "", None))
+        # Week 17 is the last regular season week (17-week schedule)
+        if week < 17:
+            jobs.append((week + 1, MEDIA_JOB_PREVIEW_HEADLINES, "", None))
+        jobs.append((week, MEDIA_JOB_SEASON_GRADES, "", None))
+        jobs.append((week, MEDIA_JOB_POPULARITY, "", None))
+
+        queued = self._queue_media_jobs(db_path, dynasty_id, season, jobs)
+        logger.info("Queued %d media jobs for week %d", queued, week)
+        return queued
+
+    def _run_media_job(self, job: Any, context: Any) -> None:
+        """
+        Run one queued media job (registered with the media job queue).
+
+        Args:
+            job: MediaJob
+            context: MediaJobContext with the worker's connection
+        """
+        payload = job.payload
+        if job.job_type == MEDIA_JOB_SOCIAL_POSTS:
+            self._generate_game_social_posts(
+                gc_db=context.db,
+                db_path=context.db_path,
+                dynasty_id=job.dynasty_id,
+                season=job.season,
+                week=job.week,
+                game_id=job.job_key,
+                home_team_id=payload["home_team_id"],
+                away_team_id=payload["away_team_id"],
+                home_score=payload["home_score"],
+                away_score=payload["away_score"],
+                star_players={int(t): name for t, name in payload.get("star_players", {}).items()}
+            )
+        elif job.job_type == MEDIA_JOB_GAME_HEADLINE:
+            self._generate_game_headline(
+                gc_db=context.db,
+                headline_generator=context.headline_generator(job),
+                db_path=context.db_path,
+                dynasty_id=job.dynasty_id,
+                season=job.season,
+                week=job.week,
+                game_id=job.job_key,
+                home_team_id=payload["home_team_id"],
+                away_team_id=payload["away_team_id"],
+                home_score=payload["home_score"],
+                away_score=payload["away_score"],
+                overtime_periods=payload.get("overtime_periods", 0)
+            )
+        elif job.job_type == MEDIA_JOB_PREVIEW_HEADLINES:
+            self._generate_preview_headlines(
+                headline_generator=context.headline_generator(job),
+                db_path=context.db_path,
+                dynasty_id=job.dynasty_id,
+                season=job.season,
+                week=job.week
+            )
+        elif job.job_type == MEDIA_JOB_AWARD_RACE:
+            self._update_award_race_tracking(context.db_path, job.dynasty_id, job.season, job.week)
+        elif job.job_type == MEDIA_JOB_POWER_RANKINGS:
+            self._generate_power_rankings(context.db_path, job.dynasty_id, job.season, job.week)
+        elif job.job_type == MEDIA_JOB_SEASON_GRADES:
+            self._aggregate_season_grades(context.db_path, job.dynasty_id, job.season)
+        elif job.job_type == MEDIA_JOB_POPULARITY:
+            self._update_player_popularity(context.db_path, job.dynasty_id, job.season, job.week)
+        else:
+            raise ValueError(f"Unknown media job type: {job.job_type}")
+
+    def _is_upset(self, db_path: str, dynasty_id: str, season: int, winner_id: int, loser_id: int) -> bool:
         """
         Determine if a game result is an upset based on team records.
 
@@ -2242,6 +2672,7 @@ class RegularSeasonHandler:
         than the losing team (margin of at least 2 games difference in wins).
 
         Args:
+            db_path: Database path
             dynasty_id: Dynasty identifier
             season: Season year
             winner_id: Winning team ID
@@ -2254,7 +2685,7 @@ class RegularSeasonHandler:
             from ..database.connection import GameCycleDatabase
             from ..database.standings_api import StandingsAPI
 
-            gc_db = GameCycleDatabase()
+            gc_db = GameCycleDatabase(db_path)
             standings_api = StandingsAPI(gc_db)
             try:
                 standings = standings_api.get_standings(dynasty_id, season)
@@ -2386,4 +2817,22 @@ class RegularSeasonHandler:
                 "Failed to update player popularity for week %d (dynasty=%s, season=%d): %s",
                 week, dynasty_id, season, e, exc_info=True
             )
-            return 0
\ No newline at end of file
+            return 0
+
+
+def _register_media_jobs() -> None:
+    """Register the regular season's media job types with the job queue."""
+    handler = RegularSeasonHandler()
+    for job_type in (
+        MEDIA_JOB_SOCIAL_POSTS,
+        MEDIA_JOB_GAME_HEADLINE,
+        MEDIA_JOB_PREVIEW_HEADLINES,
+        MEDIA_JOB_AWARD_RACE,
+        MEDIA_JOB_POWER_RANKINGS,
+        MEDIA_JOB_SEASON_GRADES,
+        MEDIA_JOB_POPULARITY,
+    ):
+        register_media_job(job_type, handler._run_media_job)
+
+
+_register_media_jobs()
@@ -0,0 +1,679 @@
+"""
+Headless Runner - Multi-season batch simulation without the UI.
+
+StageController.execute_current_stage() / advance_to_next_stage() were only
+driven from the PySide6 UI, so a long dynasty could not be soak-tested or
+profiled. HeadlessRunner advances through every stage of N seasons on its
+own:
+
+- Deterministic auto-decisions for the user team where the UI would wait for
+  the owner (re-signing, free agency waves, draft, final roster cuts)
+- One JSON line per stage: wall time, SQL statements, rows written and peak
+  RSS (SQLiteActivityMonitor counts every sqlite3 connection opened while
+  the run is active)
+- A checkpoint file rewritten after every stage, so an interrupted run
+  continues where it stopped (--resume)
+- --profile-plays adds each FULL-mode week's play phase timings
+  (game_management.play_phase_profiler) to its report line
+- --calibrate-instant N fits each INSTANT season's score model to N FULL
+  games at Week 1 (skipped for seasons already calibrated)
+
+A season is every stage with the same season year: Week 1 through the
+following summer's waiver wire. The run stops when the dynasty reaches
+Week 1 of the season after the last one.
+
+Usage (from the project root like main.py, since config paths such as
+src/config/archetypes are relative to it):
+    PYTHONPATH=src python -m game_cycle.runner --db data/soak.db --dynasty soak --seasons 30 --mode instant
+    PYTHONPATH=src python -m game_cycle.runner --db data/soak.db --dynasty soak --resume
+
+A dynasty that does not exist yet is created first (--team, --start-season).
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+import weakref
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .stage_definitions import Stage, StageType, SeasonPhase
+from .stage_controller import StageController, StageResult
+
+logger = logging.getLogger(__name__)
+
+
+class RunnerError(RuntimeError):
+    """A stage failed or could not be completed."""
+
+
+# ============================================================================
+# Measurements
+# ============================================================================
+
+class SQLiteActivityMonitor:
+    """
+    Counts SQL statements and rows written on every sqlite3 connection.
+
+    While installed, sqlite3.connect() returns connections that report each
+    statement through a trace callback; rows written are read from the
+    connection's total_changes as statements run and when it is closed.
+    Connections opened before install() are not counted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statements = 0
+        self._rows_written = 0
+        self._connections: "weakref.WeakSet[sqlite3.Connection]" = weakref.WeakSet()
+        self._original_connect = None
+
+    def install(self) -> None:
+        """Start counting connections opened from now on."""
+        if self._original_connect is not None:
+            return
+        monitor = self
+
+        class TracedConnection(sqlite3.Connection):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self._changes_seen = 0
+                ref = weakref.ref(self)  # No cycle: connections still close when dropped
+                self.set_trace_callback(lambda statement: monitor._on_statement(ref()))
+                monitor._connections.add(self)
+
+            def close(self):
+                monitor._collect_changes(self)
+                super().close()
+
+        original = self._original_connect = sqlite3.connect
+
+        def connect(*args, **kwargs):
+            kwargs.setdefault("factory", TracedConnection)
+            return original(*args, **kwargs)
+
+        sqlite3.connect = connect
+
+    def uninstall(self) -> None:
+        """Restore sqlite3.connect."""
+        if self._original_connect is not None:
+            sqlite3.connect = self._original_connect
+            self._original_connect = None
+
+    def snapshot(self) -> Dict[str, int]:
+        """Totals so far (statements, rows_written)."""
+        for conn in list(self._connections):
+            self._collect_changes(conn)
+        with self._lock:
+            return {"statements": self._statements, "rows_written": self._rows_written}
+
+    def _on_statement(self, conn: Optional[sqlite3.Connection]) -> None:
+        with self._lock:
+            self._statements += 1
+        if conn is not None:
+            self._collect_changes(conn)
+
+    def _collect_changes(self, conn: sqlite3.Connection) -> None:
+        try:
+            total = conn.total_changes
+        except sqlite3.Error:
+            return  # Closed, or owned by another thread
+        delta = total - conn._changes_seen
+        if delta > 0:
+            conn._changes_seen = total
+            with self._lock:
+                self._rows_written += delta
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak /= 1024  # Bytes on macOS, KB elsewhere
+    return round(peak / 1024, 1)
+
+
+@dataclass
+class StageTiming:
+    """One line of the timing report."""
+    season: int
+    stage: str
+    phase: str
+    executions: int
+    wall_time_s: float
+    advance_time_s: float
+    db_statements: int
+    rows_written: int
+    peak_rss_mb: Optional[float]
+    games_played: int
+    errors: List[str] = field(default_factory=list)
+    play_phases: Optional[Dict[str, Any]] = None  # Week's PlayPhaseReport.to_dict()
+
+
+# ============================================================================
+# Checkpoints
+# ============================================================================
+
+@dataclass
+class RunCheckpoint:
+    """
+    Progress of a run, rewritten after every stage.
+
+    The stage is stored here rather than re-read from dynasty_state, which
+    does not distinguish the offseason stages.
+    """
+    db_path: str
+    dynasty_id: str
+    mode: str
+    final_season: int
+    season: int
+    stage: str
+    completed: bool
+    stages_run: int = 0
+    seed: Optional[int] = None
+    updated_at: str = ""
+
+    @classmethod
+    def load(cls, path: str) -> Optional["RunCheckpoint"]:
+        """Read a checkpoint file (None if missing)."""
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(**json.load(f))
+
+    def save(self, path: str) -> None:
+        """Write atomically, so an interrupted write keeps the previous checkpoint."""
+        self.updated_at = datetime.now().isoformat(timespec="seconds")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, indent=2)
+        os.replace(tmp_path, path)
+
+    def to_stage(self) -> Stage:
+        return Stage(StageType[self.stage], self.season, completed=self.completed)
+
+
+# ============================================================================
+# User team decisions
+# ============================================================================
+
+class AutoDecisions:
+    """
+    Deterministic owner decisions for the user team.
+
+    Stages that wait for the owner in the UI get the extra context (or
+    roster moves) the UI would have produced:
+
+    - Re-signing: keep expiring players rated RESIGN_MIN_OVERALL+ and no
+      older than RESIGN_MAX_AGE, release the rest
+    - Free agency: process each wave (no user offers), until the stage
+      completes or wave 3 is done and the draft is next, like the UI
+    - Draft: auto-complete with the owner's draft directives
+    - Roster cuts: cut the roster cuts service's suggestions down to 53
+
+    GM proposals are neither approved nor rejected; they expire as they
+    would for an owner who ignores them.
+    """
+
+    RESIGN_MIN_OVERALL = 70
+    RESIGN_MAX_AGE = 31
+    ROSTER_LIMIT = 53
+
+    def __init__(self, db_path: str, dynasty_id: str):
+        self._db_path = db_path
+        self._dynasty_id = dynasty_id
+
+    def user_team_id(self) -> int:
+        """User team of the dynasty (same fallback as StageController)."""
+        from database.dynasty_database_api import DynastyDatabaseAPI
+
+        dynasty = DynastyDatabaseAPI(self._db_path).get_dynasty_by_id(self._dynasty_id)
+        return (dynasty.get('team_id') or 1) if dynasty else 1
+
+    def prepare(self, stage: Stage) -> Dict[str, Any]:
+        """
+        Make roster moves due before the stage and build its extra context.
+
+        Args:
+            stage: Stage about to be executed
+
+        Returns:
+            extra_context for execute_current_stage()
+        """
+        stage_type = stage.stage_type
+        if stage_type == StageType.OFFSEASON_RESIGNING:
+            return {"user_decisions": self._resigning_decisions(stage.season_year)}
+        if stage_type == StageType.OFFSEASON_FREE_AGENCY:
+            return {"wave_control": {"advance_wave": True}}
+        if stage_type == StageType.OFFSEASON_DRAFT:
+            return {"auto_complete": True}
+        if stage_type == StageType.OFFSEASON_ROSTER_CUTS:
+            self._cut_to_roster_limit(stage.season_year)
+        return {}
+
+    @staticmethod
+    def is_finished(result: StageResult) -> bool:
+        """Whether the runner may advance after this execution."""
+        if result.can_advance:
+            return True
+        if result.stage.stage_type == StageType.OFFSEASON_FREE_AGENCY:
+            # Wave 4 opens after the draft; the UI moves on once wave 3 is done
+            wave_state = result.handler_data.get("wave_state", {})
+            return wave_state.get("wave") == 3 and bool(wave_state.get("wave_complete"))
+        return False
+
+    def _resigning_decisions(self, season: int) -> Dict[int, str]:
+        from .services.resigning_service import ResigningService
+
+        service = ResigningService(self._db_path, self._dynasty_id, season)
+        decisions = {}
+        for player in service.get_expiring_contracts(self.user_team_id()):
+            keep = (
+                player.get("overall", 0) >= self.RESIGN_MIN_OVERALL and
+                player.get("age", 0) <= self.RESIGN_MAX_AGE
+            )
+            decisions[player["player_id"]] = "resign" if keep else "release"
+        return decisions
+
+    def _cut_to_roster_limit(self, season: int) -> None:
+        from .services.roster_cuts_service import RosterCutsService
+
+        team_id = self.user_team_id()
+        service = RosterCutsService(self._db_path, self._dynasty_id, season)
+        for player in service.get_ai_cut_suggestions(team_id, target_size=self.ROSTER_LIMIT):
+            service.cut_player(player["player_id"], team_id, add_to_waivers=True)
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+class HeadlessRunner:
+    """
+    Runs a dynasty through whole seasons with a StageController.
+
+    Usage:
+        runner = HeadlessRunner(db_path, dynasty_id, "instant",
+                                report_path="soak.jsonl",
+                                checkpoint_path="soak.jsonl.checkpoint")
+        runner.run(seasons=30)
+    """
+
+    # Executions of one stage before the run is considered stuck
+    MAX_EXECUTIONS_PER_STAGE = 25
+
+    def __init__(
+        self,
+        db_path: str,
+        dynasty_id: str,
+        mode: str = "instant",
+        report_path: Optional[str] = None,
+        checkpoint_path: Optional[str] = None,
+        media_mode: str = "inline",
+        seed: Optional[int] = None,
+        verbose: bool = False,
+        profile_plays: bool = False,
+        calibrate_instant: int = 0
+    ):
+        """
+        Initialize the runner (nothing runs until run()).
+
+        Args:
+            db_path: Path to game_cycle.db database
+            dynasty_id: Dynasty identifier
+            mode: Simulation mode, "instant" or "full"
+            report_path: JSON-lines timing report (None = no report)
+            checkpoint_path: Checkpoint file (None = no checkpoints)
+            media_mode: "inline" or "deferred" regular season media
+            seed: Seed for each stage's random state (None = unseeded)
+            verbose: Show handler output instead of discarding it
+            profile_plays: Profile the play phases of FULL-mode weeks
+            calibrate_instant: FULL games to calibrate each INSTANT season's
+                score model with at Week 1 (0 = keep the stored or default model)
+        """
+        self._db_path = db_path
+        self._dynasty_id = dynasty_id
+        self._mode = mode
+        self._report_path = report_path
+        self._checkpoint_path = checkpoint_path
+        self._media_mode = media_mode
+        self._seed = seed
+        self._verbose = verbose
+        self._profile_plays = profile_plays
+        self._calibrate_instant = calibrate_instant
+        self._decisions = AutoDecisions(db_path, dynasty_id)
+        self._monitor = SQLiteActivityMonitor()
+
+    def run(
+        self,
+        seasons: int = 1,
+        resume: bool = False,
+        team_id: int = 1,
+        start_season: int = 2025
+    ) -> List[StageTiming]:
+        """
+        Advance the dynasty through whole seasons.
+
+        Args:
+            seasons: Seasons to play, counting the dynasty's current one
+            resume: Continue from the checkpoint file (its season target,
+                mode and seed replace the arguments)
+            team_id: User team if the dynasty has to be created
+            start_season: First season if the dynasty has to be created
+
+        Returns:
+            Timing of every stage run
+
+        Raises:
+            RunnerError: If a stage fails or never completes
+        """
+        checkpoint = self._load_checkpoint() if resume else None
+
+        self._monitor.install()
+        controller = None
+        timings: List[StageTiming] = []
+        try:
+            with self._quiet():
+                if checkpoint is None:
+                    self._ensure_dynasty(team_id, start_season)
+                controller = self._create_controller(checkpoint, start_season)
+
+            if checkpoint is None:
+                checkpoint = RunCheckpoint(
+                    db_path=self._db_path,
+                    dynasty_id=self._dynasty_id,
+                    mode=self._mode,
+                    final_season=controller.current_stage.season_year + seasons - 1,
+                    season=controller.current_stage.season_year,
+                    stage=controller.current_stage.stage_type.name,
+                    completed=controller.current_stage.completed,
+                    seed=self._seed
+                )
+                self._start_report()
+
+            while controller.current_stage.season_year <= checkpoint.final_season:
+                timing = self._run_stage(controller, checkpoint)
+                timings.append(timing)
+                self._write_report(timing)
+                print(
+                    f"{timing.season} {timing.stage:<28} {timing.wall_time_s:8.2f}s "
+                    f"{timing.db_statements:>9} stmts {timing.rows_written:>8} rows",
+                    flush=True
+                )
+        finally:
+            if controller is not None:
+                controller.drain_media_jobs()
+                controller.close()
+            self._monitor.uninstall()
+
+        return timings
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def _run_stage(self, controller: StageController, checkpoint: RunCheckpoint) -> StageTiming:
+        """Execute the current stage until it completes, then advance."""
+        stage = controller.current_stage
+        if not stage.completed and stage.stage_type == StageType.REGULAR_WEEK_1:
+            self._calibrate_season(stage.season_year)
+        before = self._monitor.snapshot()
+        start = time.perf_counter()
+        executions = 0
+        games = 0
+        result = None
+
+        if not stage.completed:
+            if stage.phase == SeasonPhase.OFFSEASON:
+                # Entering an offseason stage loads its preview, which does the
+                # stage's entry work (training camp initializes the next season)
+                with self._quiet():
+                    controller.get_stage_preview()
+            while True:
+                executions += 1
+                if self._seed is not None:
+                    random.seed(f"{self._seed}:{stage.season_year}:{stage.stage_type.name}:{executions}")
+                with self._quiet():
+                    extra_context = self._decisions.prepare(stage)
+                    if self._profile_plays:
+                        extra_context = {**extra_context, "profile_plays": True}
+                    result = controller.execute_current_stage(extra_context=extra_context, auto_advance=False)
+                games += len(result.games_played)
+
+                if not result.success:
+                    raise RunnerError(
+                        f"{stage.display_name} ({stage.season_year}) failed: {'; '.join(result.errors)}"
+                    )
+                if self._decisions.is_finished(result):
+                    break
+                if executions >= self.MAX_EXECUTIONS_PER_STAGE:
+                    raise RunnerError(
+                        f"{stage.display_name} ({stage.season_year}) not complete after {executions} executions"
+                    )
+
+            stage.completed = True
+            self._save_checkpoint(checkpoint, stage)
+        wall_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with self._quiet():
+            next_stage = controller.advance_to_next_stage()
+        if next_stage is None:
+            raise RunnerError(f"Cannot advance past {stage.display_name} ({stage.season_year})")
+        advance_time = time.perf_counter() - start
+        checkpoint.stages_run += 1
+        self._save_checkpoint(checkpoint, next_stage)
+
+        after = self._monitor.snapshot()
+        return StageTiming(
+            season=stage.season_year,
+            stage=stage.stage_type.name,
+            phase=stage.phase.name,
+            executions=executions,
+            wall_time_s=round(wall_time, 4),
+            advance_time_s=round(advance_time, 4),
+            db_statements=after["statements"] - before["statements"],
+            rows_written=after["rows_written"] - before["rows_written"],
+            peak_rss_mb=peak_rss_mb(),
+            games_played=games,
+            errors=list(result.errors) if result else [],
+            play_phases=result.handler_data.get("play_phase_profile") if result else None
+        )
+
+    def _calibrate_season(self, season: int) -> None:
+        """Fit the season's INSTANT score model to FULL games unless already stored."""
+        from .services.instant_score_model import calibrate_score_model, get_score_model_calibration
+
+        if self._mode != "instant" or self._calibrate_instant <= 0:
+            return
+        if get_score_model_calibration(self._db_path, self._dynasty_id, season) is not None:
+            return
+
+        seed = None
+        if self._seed is not None:
+            random.seed(f"{self._seed}:{season}:calibration")
+            seed = random.getrandbits(64)
+        start = time.perf_counter()
+        with self._quiet():
+            parameters = calibrate_score_model(
+                self._db_path, self._dynasty_id, season, games=self._calibrate_instant, seed=seed
+            )
+        print(
+            f"{season} INSTANT score model calibrated from {parameters.games} FULL games "
+            f"in {time.perf_counter() - start:.1f}s",
+            flush=True
+        )
+
+    # ------------------------------------------------------------------
+    # Setup
+    # ------------------------------------------------------------------
+
+    def _ensure_dynasty(self, team_id: int, start_season: int) -> None:
+        """Create the dynasty if the database does not have it yet."""
+        from database.dynasty_database_api import DynastyDatabaseAPI
+        from .services.initialization_service import GameCycleInitializer
+
+        if os.path.exists(self._db_path) and DynastyDatabaseAPI(self._db_path).get_dynasty_by_id(self._dynasty_id):
+            return
+        logger.info(f"Creating dynasty '{self._dynasty_id}' (team {team_id}, {start_season})")
+        GameCycleInitializer(self._db_path, self._dynasty_id, start_season).initialize_dynasty(team_id)
+
+    def _create_controller(self, checkpoint: Optional[RunCheckpoint], start_season: int) -> StageController:
+        """StageController at the checkpoint's stage, or the dynasty's saved stage."""
+        controller = StageController(self._db_path, self._dynasty_id, start_season)
+        controller.set_simulation_mode(self._mode)
+        controller.set_media_mode(self._media_mode)
+
+        if not controller.is_initialized():
+            # New dynasty: start with preseason, as the UI does
+            controller.initialize(season_year=start_season, skip_preseason=False)
+        elif checkpoint is not None:
+            if checkpoint.season == controller.current_stage.season_year:
+                controller.adopt_stage(checkpoint.to_stage())
+            else:
+                logger.warning(
+                    f"Checkpoint season {checkpoint.season} does not match the dynasty "
+                    f"({controller.current_stage.season_year}); continuing from the dynasty's stage"
+                )
+        return controller
+
+    def _load_checkpoint(self) -> RunCheckpoint:
+        checkpoint = RunCheckpoint.load(self._checkpoint_path) if self._checkpoint_path else None
+        if checkpoint is None:
+            raise RunnerError(f"No checkpoint to resume at {self._checkpoint_path}")
+        if checkpoint.dynasty_id != self._dynasty_id:
+            raise RunnerError(
+                f"Checkpoint is for dynasty '{checkpoint.dynasty_id}', not '{self._dynasty_id}'"
+            )
+        self._mode = checkpoint.mode
+        self._seed = checkpoint.seed
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint: RunCheckpoint, stage: Stage) -> None:
+        checkpoint.season = stage.season_year
+        checkpoint.stage = stage.stage_type.name
+        checkpoint.completed = stage.completed
+        if self._checkpoint_path:
+            checkpoint.save(self._checkpoint_path)
+
+    # ------------------------------------------------------------------
+    # Report
+    # ------------------------------------------------------------------
+
+    def _start_report(self) -> None:
+        if self._report_path:
+            open(self._report_path, "w", encoding="utf-8").close()
+
+    def _write_report(self, timing: StageTiming) -> None:
+        if self._report_path:
+            with open(self._report_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(timing)) + "\n")
+
+    @contextlib.contextmanager
+    def _quiet(self):
+        """Discard the handlers' console output unless verbose."""
+        if self._verbose:
+            yield
+            return
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            yield
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m game_cycle.runner",
+        description="Headless multi-season game cycle runner",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--db', required=True, help='Path to game_cycle database')
+    parser.add_argument('--dynasty', required=True, help='Dynasty ID (created if missing)')
+    parser.add_argument('--seasons', type=int, default=1, help='Seasons to play (default: 1)')
+    parser.add_argument(
+        '--mode',
+        choices=['instant', 'full'],
+        default='instant',
+        help='Game simulation mode (default: instant)'
+    )
+    parser.add_argument(
+        '--media-mode',
+        choices=['inline', 'deferred'],
+        default='inline',
+        help='Regular season media generation (default: inline)'
+    )
+    parser.add_argument('--report', help='JSON-lines timing report (default: <dynasty>_timing.jsonl)')
+    parser.add_argument('--checkpoint', help='Checkpoint file (default: <report>.checkpoint)')
+    parser.add_argument('--resume', action='store_true', help='Continue from the checkpoint')
+    parser.add_argument('--seed', type=int, help='Seed random state per stage')
+    parser.add_argument('--team', type=int, default=1, help='User team for a new dynasty (default: 1)')
+    parser.add_argument('--start-season', type=int, default=2025, help='First season of a new dynasty (default: 2025)')
+    parser.add_argument('--profile-plays', action='store_true', help='Report play phase timings of FULL-mode weeks')
+    parser.add_argument(
+        '--calibrate-instant',
+        type=int,
+        default=0,
+        metavar='GAMES',
+        help='Calibrate each INSTANT season against GAMES FULL games at Week 1 (default: off)'
+    )
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show handler output and INFO logs')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    report_path = args.report or f"{args.dynasty}_timing.jsonl"
+    runner = HeadlessRunner(
+        args.db,
+        args.dynasty,
+        mode=args.mode,
+        report_path=report_path,
+        checkpoint_path=args.checkpoint or f"{report_path}.checkpoint",
+        media_mode=args.media_mode,
+        seed=args.seed,
+        verbose=args.verbose,
+        profile_plays=args.profile_plays,
+        calibrate_instant=args.calibrate_instant
+    )
+
+    print("=" * 80)
+    print(f"Headless run: dynasty '{args.dynasty}' ({args.db}), report {report_path}")
+    print("=" * 80)
+    start = time.perf_counter()
+    try:
+        timings = runner.run(
+            seasons=args.seasons,
+            resume=args.resume,
+            team_id=args.team,
+            start_season=args.start_season
+        )
+    except RunnerError as e:
+        print(f"Run stopped: {e}")
+        return 1
+    except KeyboardInterrupt:
+        print("Interrupted - continue with --resume")
+        return 130
+
+    print("=" * 80)
+    print(f"{len(timings)} stages in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
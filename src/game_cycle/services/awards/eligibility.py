@@ -7,10 +7,15 @@ Determines player eligibility for awards based on:
 - Position group (offense/defense)
 - Rookie status (years_pro == 0)
 
+For the end-of-season honors, load_season_frame() reads the season's
+player info, grades, stats and standings in a handful of queries so every
+later check and candidate lookup is answered from memory.
+
 Part of Milestone 10: Awards System, Tollgate 2.
 """
 
 import logging
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
 from .models import (
@@ -88,6 +93,21 @@ MIN_TACKLES_S = 30             # S: ~2 per game
 MIN_INTERCEPTIONS_S = 1        # S alternative
 
 
+@dataclass
+class SeasonAwardFrame:
+    """
+    Season-wide award data, keyed for in-memory lookups.
+
+    Loaded once by EligibilityChecker.load_season_frame().
+    """
+    players: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    grades: Dict[int, Any] = field(default_factory=dict)
+    previous_grades: Dict[int, Any] = field(default_factory=dict)
+    all_grades: List[Any] = field(default_factory=list)
+    season_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    top_candidates: Optional[List[Dict[str, Any]]] = None
+
+
 class EligibilityChecker:
     """
     Checks player eligibility for awards and populates candidate data.
@@ -119,6 +139,7 @@ class EligibilityChecker:
         # Cached data
         self._standings_cache: Dict[int, Any] = {}
         self._conference_champions: Optional[List[int]] = None
+        self._frame: Optional[SeasonAwardFrame] = None
 
     # ============================================
     # Properties (Lazy Loading)
@@ -164,6 +185,76 @@ class EligibilityChecker:
             self._playoff_api = PlayoffBracketAPI(self.db)
         return self._playoff_api
 
+    # ============================================
+    # Season Frame
+    # ============================================
+
+    def load_season_frame(self) -> bool:
+        """
+        Load the season's award data so later calls run without queries.
+
+        Reads player info, current and previous season grades, season stats,
+        standings, conference champions and the fast candidate list once.
+        Until clear_season_frame() is called, eligibility checks and
+        candidate lookups use this snapshot instead of per-player queries.
+
+        Returns:
+            True if the frame was loaded, False if it failed (per-player
+            queries are used instead)
+        """
+        try:
+            frame = SeasonAwardFrame()
+
+            rows = self.db.query_all(
+                """SELECT player_id, first_name, last_name, positions, team_id, years_pro, status, birthdate
+                   FROM players
+                   WHERE dynasty_id = ?""",
+                (self._dynasty_id,)
+            )
+            frame.players = {row['player_id']: self._player_info_from_row(row) for row in rows}
+
+            frame.all_grades = self.analytics_api.get_all_season_grades(
+                self._dynasty_id, self._season
+            )
+            for grade in frame.all_grades:
+                frame.grades.setdefault(grade.player_id, grade)
+            for grade in self.analytics_api.get_all_season_grades(
+                self._dynasty_id, self._season - 1
+            ):
+                frame.previous_grades.setdefault(grade.player_id, grade)
+
+            frame.season_stats = self.stats_api.get_all_player_season_stats(self._season)
+
+            for standing in self.standings_api.get_standings(self._dynasty_id, self._season):
+                self._standings_cache[standing.team_id] = self._standing_to_dict(standing)
+            self._get_conference_champions()
+
+            frame.top_candidates = self.analytics_api.get_top_candidates_by_position(
+                dynasty_id=self._dynasty_id,
+                season=self._season,
+                min_games=MINIMUM_GAMES,
+                min_snaps=MINIMUM_SNAPS,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load season frame for {self._season}: {e}")
+            return False
+
+        self._frame = frame
+        logger.info(
+            f"Loaded season frame: {len(frame.players)} players, {len(frame.grades)} grades, "
+            f"{len(frame.top_candidates)} candidates"
+        )
+        return True
+
+    def clear_season_frame(self) -> None:
+        """Drop the loaded season frame and go back to per-player queries."""
+        self._frame = None
+
+    @property
+    def has_season_frame(self) -> bool:
+        """Whether a season frame is loaded."""
+        return self._frame is not None
+
     # ============================================
     # Public Methods
     # ============================================
@@ -325,13 +416,16 @@ class EligibilityChecker:
 
         # Use optimized SQL query that does filtering at database level
         try:
-            top_candidates = self.analytics_api.get_top_candidates_by_position(
-                dynasty_id=self._dynasty_id,
-                season=self._season,
-                min_games=MINIMUM_GAMES,
-                min_snaps=MINIMUM_SNAPS,
-                per_position_limit=per_position_limit,
-            )
+            if self._frame is not None:
+                top_candidates = self._frame.top_candidates
+            else:
+                top_candidates = self.analytics_api.get_top_candidates_by_position(
+                    dynasty_id=self._dynasty_id,
+                    season=self._season,
+                    min_games=MINIMUM_GAMES,
+                    min_snaps=MINIMUM_SNAPS,
+                    per_position_limit=per_position_limit,
+                )
         except Exception as e:
             logger.warning(f"Fast candidate retrieval failed: {e}")
             # Fall back to standard method
@@ -508,6 +602,9 @@ class EligibilityChecker:
 
     def _get_player_info(self, player_id: int) -> Optional[Dict[str, Any]]:
         """Get player info from players table."""
+        if self._frame is not None:
+            return self._frame.players.get(player_id)
+
         row = self.db.query_one(
             """SELECT player_id, first_name, last_name, positions, team_id, years_pro, status, birthdate
                FROM players
@@ -517,6 +614,10 @@ class EligibilityChecker:
         if not row:
             return None
 
+        return self._player_info_from_row(row)
+
+    def _player_info_from_row(self, row) -> Dict[str, Any]:
+        """Convert a players row to a player info dict."""
         result = dict(row)
 
         # Calculate years_pro from birthdate if not set (years_pro == 0 and birthdate exists)
@@ -558,7 +659,7 @@ class EligibilityChecker:
 
         # Fall back to stats API for individual player lookups
         try:
-            stats = self.stats_api.get_player_season_stats(str(player_id), self._season)
+            stats = self._get_player_season_stats(player_id)
             games_played = stats.get('games_played', 0) if stats else 0
         except Exception as e:
             logger.warning(f"Error getting stats for player {player_id}: {e}")
@@ -569,9 +670,7 @@ class EligibilityChecker:
     def _get_player_grades(self, player_id: int) -> Optional[Dict[str, Any]]:
         """Get player season grades from AnalyticsAPI."""
         try:
-            grade = self.analytics_api.get_season_grade(
-                self._dynasty_id, player_id, self._season
-            )
+            grade = self._get_season_grade(player_id, self._season)
             if grade:
                 # Convert dataclass to dict if needed
                 if hasattr(grade, 'overall_grade'):
@@ -593,8 +692,24 @@ class EligibilityChecker:
             logger.warning(f"Error getting grades for player {player_id}: {e}")
         return None
 
+    def _get_season_grade(self, player_id: int, season: int) -> Optional[Any]:
+        """Get a player's SeasonGrade for the season or the one before it."""
+        if self._frame is not None and season in (self._season, self._season - 1):
+            if season == self._season:
+                return self._frame.grades.get(player_id)
+            return self._frame.previous_grades.get(player_id)
+        return self.analytics_api.get_season_grade(self._dynasty_id, player_id, season)
+
+    def _get_player_season_stats(self, player_id: int) -> Dict[str, Any]:
+        """Get a player's season stats from StatsAPI."""
+        if self._frame is not None:
+            return self._frame.season_stats.get(str(player_id), {})
+        return self.stats_api.get_player_season_stats(str(player_id), self._season)
+
     def _get_all_season_grades(self) -> List[Any]:
         """Get all player season grades for the season."""
+        if self._frame is not None:
+            return self._frame.all_grades
         try:
             return self.analytics_api.get_all_season_grades(
                 self._dynasty_id, self._season
@@ -607,24 +722,16 @@ class EligibilityChecker:
         """Get team standing with caching."""
         if team_id in self._standings_cache:
             return self._standings_cache[team_id]
+        if self._frame is not None:
+            # All of the season's standings were loaded with the frame
+            return None
 
         try:
             standing = self.standings_api.get_team_standing(
                 self._dynasty_id, self._season, team_id
             )
             if standing:
-                # Convert dataclass to dict if needed
-                if hasattr(standing, 'wins'):
-                    result = {
-                        'wins': standing.wins,
-                        'losses': standing.losses,
-                        'ties': getattr(standing, 'ties', 0),
-                        'playoff_seed': standing.playoff_seed,
-                        'division_wins': getattr(standing, 'division_wins', 0),
-                        'conference_wins': getattr(standing, 'conference_wins', 0),
-                    }
-                else:
-                    result = standing
+                result = self._standing_to_dict(standing)
                 self._standings_cache[team_id] = result
                 return result
         except Exception as e:
@@ -632,6 +739,19 @@ class EligibilityChecker:
 
         return None
 
+    def _standing_to_dict(self, standing: Any) -> Dict[str, Any]:
+        """Convert a TeamStanding dataclass to a dict if needed."""
+        if hasattr(standing, 'wins'):
+            return {
+                'wins': standing.wins,
+                'losses': standing.losses,
+                'ties': getattr(standing, 'ties', 0),
+                'playoff_seed': standing.playoff_seed,
+                'division_wins': getattr(standing, 'division_wins', 0),
+                'conference_wins': getattr(standing, 'conference_wins', 0),
+            }
+        return standing
+
     def _get_conference_champions(self) -> List[int]:
         """Get list of conference champion team IDs."""
         if self._conference_champions is not None:
@@ -689,12 +809,8 @@ class EligibilityChecker:
 
         # Get previous season grade
         try:
-            prev_grade = self.analytics_api.get_season_grade(
-                self._dynasty_id, player_id, self._season - 1
-            )
-            current_grade = self.analytics_api.get_season_grade(
-                self._dynasty_id, player_id, self._season
-            )
+            prev_grade = self._get_season_grade(player_id, self._season - 1)
+            current_grade = self._get_season_grade(player_id, self._season)
 
             if not prev_grade or not current_grade:
                 # If no previous season data, allow for injury comeback narrative
@@ -735,7 +851,7 @@ class EligibilityChecker:
         """
         # Get player stats
         try:
-            stats = self.stats_api.get_player_season_stats(str(player_id), self._season) or {}
+            stats = self._get_player_season_stats(player_id) or {}
         except Exception as e:
             logger.warning(f"Error getting stats for All-Pro check {player_id}: {e}")
             # Allow through if we can't verify
@@ -866,7 +982,7 @@ class EligibilityChecker:
         # Get stats
         stats = {}
         try:
-            stats = self.stats_api.get_player_season_stats(str(player_id), self._season) or {}
+            stats = self._get_player_season_stats(player_id) or {}
         except Exception as e:
             logger.warning(f"Error getting stats for player {player_id}: {e}")
 
@@ -911,9 +1027,7 @@ class EligibilityChecker:
         games_missed_prev = 0
         if years_pro > 0:
             try:
-                prev = self.analytics_api.get_season_grade(
-                    self._dynasty_id, player_id, self._season - 1
-                )
+                prev = self._get_season_grade(player_id, self._season - 1)
                 if prev:
                     previous_grade = getattr(prev, 'overall_grade', None)
                     games_prev = getattr(prev, 'games_graded', FULL_SEASON_GAMES)
@@ -259,6 +259,16 @@ class AwardsService:
             )
         return self._eligibility_checker
 
+    def _ensure_season_frame(self) -> None:
+        """
+        Load the eligibility checker's season frame if it isn't loaded yet.
+
+        Awards, All-Pro and Pro Bowl selection then evaluate every candidate
+        from memory instead of issuing queries per player.
+        """
+        if not self.eligibility_checker.has_season_frame:
+            self.eligibility_checker.load_season_frame()
+
     @property
     def voting_engine(self):
         """Lazy-load VotingEngine (new instance each time for fresh randomness)."""
@@ -349,6 +359,7 @@ class AwardsService:
             Dict mapping award_id to AwardResult
         """
         self._logger.info(f"Calculating all awards for {self._season}...")
+        self._ensure_season_frame()
 
         results = {
             'mvp': self.calculate_mvp(),
@@ -970,6 +981,7 @@ class AwardsService:
         self._logger.info(f"Selecting All-Pro teams for {self._season}...")
 
         try:
+            self._ensure_season_frame()
             first_team: Dict[str, List[AllProSelection]] = {}
             second_team: Dict[str, List[AllProSelection]] = {}
             total_selections = 0
@@ -1221,6 +1233,7 @@ class AwardsService:
         self._logger.info(f"Selecting Pro Bowl rosters for {self._season}...")
 
         try:
+            self._ensure_season_frame()
             afc_roster: Dict[str, List[ProBowlSelection]] = {}
             nfc_roster: Dict[str, List[ProBowlSelection]] = {}
             total_selections = 0
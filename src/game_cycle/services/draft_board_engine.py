@@ -0,0 +1,414 @@
+"""
+Draft Board Engine - In-memory draft board for simulated draft picks.
+
+DraftService.auto_complete_draft() and sim_to_user_pick() used to run
+process_ai_pick() for every pick: analyze the picking team's needs,
+re-query every available prospect, score all of them and write the pick
+through make_draft_pick() (eight connections and commits per pick).
+
+DraftBoardEngine loads the draft once:
+
+- the available prospects, in get_available_prospects() order
+- each team's needs, on the team's first pick (drafted rookies join the
+  roster at depth chart order 99, so they never change a team's needs)
+- a per-team heap of prospect scores, scored once without the reach
+  penalty, the only pick-dependent part of an evaluation
+
+Each pick pops the team's heap best-first, skips prospects already taken
+(lazy deletion) and re-evaluates only the candidates whose upper-bound
+score can still beat the best exact score, so it selects the same
+prospect as process_ai_pick(). The picks are then committed in one
+transaction: drafted prospects, new players and roster rows, rookie
+contracts, completed draft order picks and DRAFT transaction log rows.
+
+Usage:
+    engine = DraftBoardEngine(db_path, dynasty_id, season, draft_service)
+    picks = engine.run(user_team_id, draft_direction=direction)
+    picks = engine.run(user_team_id, stop_at_user_pick=True)
+"""
+
+import bisect
+import heapq
+import logging
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.game_cycle.models import DraftDirection, DraftDirectionResult
+
+logger = logging.getLogger(__name__)
+
+# process_ai_pick() only considers this many available prospects
+PROSPECT_WINDOW = 224
+
+# Evaluated as a pick this late, a prospect never gets the reach penalty
+NO_REACH_PICK = sys.maxsize
+
+
+@dataclass
+class TeamBoard:
+    """One team's prospect scores as a heap of (-upper_score, board_index)."""
+
+    team_needs: List[Dict[str, Any]]
+    direction: Optional[DraftDirection]
+    heap: List[Tuple[float, int]] = field(default_factory=list)
+
+
+class DraftBoardEngine:
+    """
+    Selects draft picks from per-team score heaps and commits them once.
+
+    Selection follows process_ai_pick(): the highest adjusted score among
+    the first PROSPECT_WINDOW available prospects, the earliest prospect in
+    board order winning ties. Scores may only drop for earlier picks (the
+    Balanced reach penalty), which makes the no-reach score an upper bound.
+    """
+
+    def __init__(self, db_path: str, dynasty_id: str, season: int, service):
+        """
+        Initialize the engine (nothing is loaded until run()).
+
+        Args:
+            db_path: Path to the database
+            dynasty_id: Dynasty identifier
+            season: Draft year
+            service: DraftService providing needs analysis and evaluation
+        """
+        self._db_path = db_path
+        self._dynasty_id = dynasty_id
+        self._season = season
+        self._service = service
+
+        self._prospects: List[Dict[str, Any]] = []
+        self._index_by_id: Dict[int, int] = {}
+        self._available: List[int] = []
+        self._taken: Set[int] = set()
+        self._boards: Dict[int, TeamBoard] = {}
+
+    # -------------------- Board --------------------
+
+    def load_prospects(self) -> None:
+        """Load the available prospects and drop every team board."""
+        self._prospects = self._service.get_available_prospects(limit=None)
+        self._index_by_id = {
+            prospect["prospect_id"]: index for index, prospect in enumerate(self._prospects)
+        }
+        self._available = list(range(len(self._prospects)))
+        self._taken = set()
+        self._boards = {}
+
+    def invalidate_team(self, team_id: int) -> None:
+        """
+        Drop a team's needs and scores, rebuilt on its next pick.
+
+        Call after a roster change that alters the team's needs
+        (e.g. a trade during the draft).
+
+        Args:
+            team_id: Team whose board is stale
+        """
+        self._boards.pop(team_id, None)
+
+    def _get_board(self, team_id: int, direction: Optional[DraftDirection]) -> TeamBoard:
+        """Team board for a direction, built on first use."""
+        board = self._boards.get(team_id)
+        if board is not None and board.direction is direction:
+            return board
+
+        team_needs = (
+            board.team_needs if board is not None
+            else self._service.analyze_team_needs(team_id)
+        )
+        heap = []
+        for index in self._available:
+            result = self._service._evaluate_prospect_with_direction(
+                prospect=self._prospects[index],
+                team_needs=team_needs,
+                pick_position=NO_REACH_PICK,
+                direction=direction
+            )
+            heap.append((-result.adjusted_score, index))
+        heapq.heapify(heap)
+
+        board = TeamBoard(team_needs=team_needs, direction=direction, heap=heap)
+        self._boards[team_id] = board
+        return board
+
+    def select(
+        self,
+        team_id: int,
+        pick_position: int,
+        direction: Optional[DraftDirection] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[DraftDirectionResult]]:
+        """
+        Best available prospect for a team's pick.
+
+        Args:
+            team_id: Team making the pick
+            pick_position: Overall pick number
+            direction: Draft direction (None = Balanced)
+
+        Returns:
+            (prospect, evaluation result), or (None, None) if none are available
+        """
+        board = self._get_board(team_id, direction)
+        heap = board.heap
+
+        # Last board index inside the window of available prospects
+        if len(self._available) > PROSPECT_WINDOW:
+            window_end = self._available[PROSPECT_WINDOW - 1]
+        else:
+            window_end = len(self._prospects)
+
+        best_index = None
+        best_score = -999
+        best_result = None
+        popped = []
+
+        while heap:
+            neg_upper, index = heap[0]
+            if index in self._taken:
+                heapq.heappop(heap)
+                continue
+
+            # Remaining candidates cannot beat (or tie earlier than) the best
+            upper = -neg_upper
+            if upper < best_score or (
+                upper == best_score and best_index is not None and index > best_index
+            ):
+                break
+
+            popped.append(heapq.heappop(heap))
+            if index > window_end:
+                continue
+
+            result = self._service._evaluate_prospect_with_direction(
+                prospect=self._prospects[index],
+                team_needs=board.team_needs,
+                pick_position=pick_position,
+                direction=direction
+            )
+            score = result.adjusted_score
+            if score > best_score or (
+                score == best_score and best_index is not None and index < best_index
+            ):
+                best_index = index
+                best_score = score
+                best_result = result
+
+        for entry in popped:
+            heapq.heappush(heap, entry)
+
+        if best_index is None:
+            return None, None
+        return self._prospects[best_index], best_result
+
+    def take(self, prospect: Dict[str, Any]) -> None:
+        """
+        Remove a prospect from every board.
+
+        Args:
+            prospect: Prospect returned by select()
+        """
+        index = self._index_by_id[prospect["prospect_id"]]
+        self._taken.add(index)
+        position = bisect.bisect_left(self._available, index)
+        if position < len(self._available) and self._available[position] == index:
+            del self._available[position]
+
+    # -------------------- Draft --------------------
+
+    def run(
+        self,
+        user_team_id: int,
+        draft_direction: Optional[DraftDirection] = None,
+        stop_at_user_pick: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Make the remaining picks and commit them.
+
+        Args:
+            user_team_id: User's team ID
+            draft_direction: Strategy for the user's team (AI teams use default)
+            stop_at_user_pick: Stop before the user's next pick
+
+        Returns:
+            make_draft_pick()-style results of the picks made, in pick order
+        """
+        order_api = self._service._get_draft_order_api()
+        remaining = [
+            pick for pick in order_api.get_draft_order(self._dynasty_id, self._season)
+            if not pick.is_completed
+        ]
+
+        self.load_prospects()
+        selections = []
+
+        for pick in remaining:
+            team_id = pick.team_id
+            if stop_at_user_pick and team_id == user_team_id:
+                break
+
+            # Use direction only for user's team
+            direction = draft_direction if team_id == user_team_id else None
+
+            prospect, result = self.select(team_id, pick.overall_pick, direction)
+            if prospect is None:
+                logger.error(f"Pick {pick.overall_pick} failed: No prospects available")
+                break
+
+            logger.debug(f"Pick #{pick.overall_pick}: {result.reason}")
+            self.take(prospect)
+            selections.append((pick, prospect))
+
+        return self._commit(selections)
+
+    # -------------------- Commit --------------------
+
+    def _commit(self, selections: List[Tuple[Any, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Write every selection in one transaction, as make_draft_pick() would.
+
+        Args:
+            selections: (DraftPick, prospect) pairs in pick order
+
+        Returns:
+            make_draft_pick()-style results
+
+        Raises:
+            sqlite3.Error: If the transaction fails (nothing is committed)
+        """
+        from database.player_roster_api import PlayerRosterAPI
+        from salary_cap.contract_manager import ContractManager
+        from src.persistence.transaction_logger import TransactionLogger
+
+        if not selections:
+            return []
+
+        draft_api = self._service._get_draft_class_api()
+        order_api = self._service._get_draft_order_api()
+        salary_cap = self._service._get_cap_helper().DEFAULT_CAP_LIMIT
+
+        results = []
+        conn = sqlite3.connect(self._db_path, timeout=30.0)
+        try:
+            conn.execute("PRAGMA foreign_keys = ON")
+            roster_api = PlayerRosterAPI(self._db_path, connection=conn)
+            transaction_logger = TransactionLogger(self._db_path, connection=conn)
+            contract_manager = ContractManager(self._db_path, connection=conn)
+
+            for pick, prospect in selections:
+                prospect_id = prospect["prospect_id"]
+                team_id = pick.team_id
+
+                draft_api.mark_prospect_drafted(
+                    player_id=prospect_id,
+                    team_id=team_id,
+                    actual_round=pick.round_number,
+                    actual_pick=pick.pick_in_round,
+                    dynasty_id=self._dynasty_id,
+                    conn=conn
+                )
+                new_player_id = draft_api.convert_prospect_to_player(
+                    player_id=prospect_id,
+                    team_id=team_id,
+                    dynasty_id=self._dynasty_id,
+                    conn=conn
+                )
+
+                contract_id = self._insert_rookie_contract(
+                    contract_manager, new_player_id, team_id, pick.overall_pick, salary_cap
+                )
+                if contract_id is not None:
+                    roster_api.update_player_contract_id(
+                        dynasty_id=self._dynasty_id,
+                        player_id=new_player_id,
+                        contract_id=contract_id
+                    )
+
+                order_api.mark_pick_completed(
+                    pick_id=pick.id,
+                    prospect_id=prospect_id,
+                    conn=conn
+                )
+
+                player_name = f"{prospect['first_name']} {prospect['last_name']}"
+                transaction_logger.log_transaction(
+                    dynasty_id=self._dynasty_id,
+                    season=self._season + 1,  # Draft is for next season
+                    transaction_type="DRAFT",
+                    player_id=new_player_id,
+                    player_name=player_name,
+                    position=prospect["position"],
+                    from_team_id=None,  # From draft pool
+                    to_team_id=team_id,
+                    transaction_date=date(self._season + 1, 4, 24),  # Draft date (next year)
+                    details={
+                        "round": pick.round_number,
+                        "pick": pick.pick_in_round,
+                        "overall_pick": pick.overall_pick,
+                        "overall": prospect["overall"],
+                        "college": prospect.get("college", ""),
+                    }
+                )
+
+                results.append({
+                    "success": True,
+                    "player_id": new_player_id,
+                    "prospect_id": prospect_id,
+                    "player_name": player_name,
+                    "position": prospect["position"],
+                    "overall": prospect["overall"],
+                    "college": prospect.get("college", ""),
+                    "round": pick.round_number,
+                    "pick": pick.pick_in_round,
+                    "overall_pick": pick.overall_pick,
+                    "team_id": team_id,
+                })
+
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+        logger.info(f"Draft picks committed: {len(results)}")
+        return results
+
+    def _insert_rookie_contract(
+        self,
+        contract_manager,
+        player_id: int,
+        team_id: int,
+        draft_pick: int,
+        salary_cap: int
+    ) -> Optional[int]:
+        """
+        Create a ROOKIE contract in the draft transaction.
+
+        Args:
+            contract_manager: ContractManager on the draft transaction's connection
+            player_id: Drafted player's new player_id
+            team_id: Drafting team
+            draft_pick: Overall pick number (scales the contract)
+            salary_cap: Salary cap for rookie scale scaling
+
+        Returns:
+            contract_id, or None if the pick has no rookie scale (logged,
+            the pick stands without a contract as in make_draft_pick())
+        """
+        try:
+            return contract_manager.create_rookie_contract(
+                player_id=player_id,
+                team_id=team_id,
+                dynasty_id=self._dynasty_id,
+                draft_pick=draft_pick,
+                salary_cap=salary_cap,
+                season=self._season  # Rookie contracts start this season (active immediately)
+            )
+        except ValueError as e:
+            logger.error(f"Failed to create rookie contract for player {player_id}: {e}")
+            return None
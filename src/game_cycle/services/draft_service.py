@@ -434,14 +434,14 @@ class DraftService:
     def get_available_prospects(
         self,
         position_filter: Optional[str] = None,
-        limit: int = 100
+        limit: Optional[int] = 100
     ) -> List[Dict[str, Any]]:
         """
         Get available (undrafted) prospects from the draft class.
 
         Args:
             position_filter: Optional position to filter (QB, RB, WR, etc.)
-            limit: Maximum prospects to return
+            limit: Maximum prospects to return (None for all)
 
         Returns:
             List of prospect dicts sorted by overall rating (descending)
@@ -1301,6 +1301,9 @@ class DraftService:
         """
         Simulate AI picks until it's the user's turn.
 
+        Picks are selected by DraftBoardEngine (same choices as
+        process_ai_pick) and committed in one transaction.
+
         Args:
             user_team_id: User's team ID
             draft_direction: Strategy for user's team (AI teams use default)
@@ -1308,33 +1311,14 @@ class DraftService:
         Returns:
             List of picks made
         """
-        picks_made = []
-
-        while True:
-            current_pick = self.get_current_pick()
-            if current_pick is None:
-                break  # Draft complete
-
-            # Stop if it's user's pick
-            if current_pick["current_team_id"] == user_team_id:
-                break
-
-            # AI pick - only use direction if it's the user's team (shouldn't happen here but safety check)
-            direction = draft_direction if current_pick["current_team_id"] == user_team_id else None
-
-            result = self.process_ai_pick(
-                team_id=current_pick["current_team_id"],
-                pick_info=current_pick,
-                draft_direction=direction
-            )
-
-            if result["success"]:
-                picks_made.append(result)
-            else:
-                self._logger.error(f"AI pick failed: {result.get('error')}")
-                break
+        from .draft_board_engine import DraftBoardEngine
 
-        return picks_made
+        engine = DraftBoardEngine(self._db_path, self._dynasty_id, self._season, self)
+        return engine.run(
+            user_team_id,
+            draft_direction=draft_direction,
+            stop_at_user_pick=True
+        )
 
     def auto_complete_draft(
         self,
@@ -1347,6 +1331,9 @@ class DraftService:
         For user's team, uses owner directives (draft_direction) if provided.
         For AI teams, uses needs-based selection.
 
+        All teams use AI pick logic (process_ai_pick choices), resolved by
+        DraftBoardEngine in memory and committed in one transaction.
+
         Args:
             user_team_id: User's team ID
             draft_direction: Optional owner directives for user's team picks
@@ -1354,32 +1341,10 @@ class DraftService:
         Returns:
             List of all picks made
         """
-        picks_made = []
-
-        while True:
-            current_pick = self.get_current_pick()
-            if current_pick is None:
-                break  # Draft complete
-
-            team_id = current_pick["current_team_id"]
-
-            # Use direction only for user's team
-            direction = draft_direction if team_id == user_team_id else None
-
-            # All teams use AI pick logic in auto-complete mode
-            result = self.process_ai_pick(
-                team_id=team_id,
-                pick_info=current_pick,
-                draft_direction=direction
-            )
-
-            if result["success"]:
-                picks_made.append(result)
-            else:
-                self._logger.error(f"Pick {current_pick['overall_pick']} failed: {result.get('error')}")
-                break
+        from .draft_board_engine import DraftBoardEngine
 
-        return picks_made
+        engine = DraftBoardEngine(self._db_path, self._dynasty_id, self._season, self)
+        return engine.run(user_team_id, draft_direction=draft_direction)
 
     def process_single_ai_pick(
         self,
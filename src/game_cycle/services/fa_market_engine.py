@@ -0,0 +1,502 @@
+"""
+FA Market Engine - In-memory free agent market for AI team signings.
+
+FreeAgencyService.process_ai_signings() used to scan a copy of the whole
+free agent list for every positional need of every AI team, and every
+attempt went through evaluate_player_interest() and sign_free_agent(),
+each reloading the player, persona, team attractiveness and cap space and
+committing its contract, roster move and transaction log separately.
+
+FAMarketEngine loads the market once:
+
+- the free agent pool, indexed by position in overall order (signed
+  players are skipped through a set instead of list.remove())
+- every AI team's cap space (one vw_team_cap_summary query) and positional
+  needs (one roster query for the whole league)
+- all player personas, plus each team's attractiveness on first use
+
+Interest, offers and acceptance are then resolved in memory with the same
+rules as sign_free_agent(use_valuation_engine=True), and the accepted
+signings are committed in one transaction: contracts, contract years, cap
+transactions, roster moves and UFA_SIGNING transaction log rows.
+
+Usage:
+    engine = FAMarketEngine(db_path, dynasty_id, season, free_agency_service)
+    result = engine.run(user_team_id, max_signings_per_team=3)
+    result["signings"], result["events"], result["rejections"]
+"""
+
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MarketPlayer:
+    """A free agent in the market with values parsed once."""
+
+    player_info: Dict[str, Any]
+    listing: Dict[str, Any]  # get_available_free_agents() entry
+    position: str
+    overall: int
+    age: int
+    years_pro: int
+    market_value: Dict[str, Any]  # At market value, for interest scoring
+
+    @property
+    def player_id(self) -> int:
+        return self.listing["player_id"]
+
+
+class FAMarketEngine:
+    """
+    Resolves AI team free agent signings in memory and commits them once.
+
+    Decisions follow process_ai_signings(): teams in TeamDataLoader order,
+    needs in priority order, candidates by overall rating, the loop budget
+    reduced by each signing's estimated AAV.
+    """
+
+    def __init__(self, db_path: str, dynasty_id: str, season: int, service):
+        """
+        Initialize the engine (nothing is loaded until run()).
+
+        Args:
+            db_path: Path to the database
+            dynasty_id: Dynasty identifier
+            season: Current season year (contracts start season + 1)
+            service: FreeAgencyService providing offer and preference rules
+        """
+        self._db_path = db_path
+        self._dynasty_id = dynasty_id
+        self._season = season
+        self._service = service
+
+        self._pool: Dict[str, List[MarketPlayer]] = {}
+        self._signed: Set[int] = set()
+        self._personas: Dict[int, Any] = {}
+        self._new_personas: List[Any] = []
+        self._attractiveness: Dict[int, Any] = {}
+
+    # -------------------- Loading --------------------
+
+    def _load_pool(self) -> None:
+        """Index the free agent pool by position, highest overall first."""
+        from database.player_roster_api import PlayerRosterAPI
+        from offseason.market_value_calculator import MarketValueCalculator
+
+        market_calculator = MarketValueCalculator()
+        players = []
+        for player_info in PlayerRosterAPI(self._db_path).get_free_agents(self._dynasty_id):
+            listing = self._service._build_free_agent_entry(player_info, market_calculator)
+
+            # Signing and interest use sign_free_agent() defaults
+            attributes = player_info.get("attributes", {})
+            if isinstance(attributes, str):
+                attributes = json.loads(attributes)
+            overall = attributes.get("overall", 70)
+            age = self._service._calculate_age(player_info.get("birthdate"))
+            years_pro = player_info.get("years_pro", 3)
+
+            players.append(MarketPlayer(
+                player_info=player_info,
+                listing=listing,
+                position=listing["position"],
+                overall=overall,
+                age=age,
+                years_pro=years_pro,
+                market_value=market_calculator.calculate_player_value(
+                    position=listing["position"],
+                    overall=overall,
+                    age=age,
+                    years_pro=years_pro
+                ),
+            ))
+
+        # Same order as get_available_free_agents()
+        players.sort(key=lambda p: p.listing.get("overall", 0), reverse=True)
+
+        self._pool = {}
+        for player in players:
+            self._pool.setdefault(player.position.lower(), []).append(player)
+        self._signed = set()
+
+    def _load_team_needs(self) -> Dict[int, List[str]]:
+        """Positional needs of every team from one roster query."""
+        from database.player_roster_api import PlayerRosterAPI
+
+        rosters = PlayerRosterAPI(self._db_path).get_all_team_rosters(self._dynasty_id)
+        return {
+            team_id: self._service._positional_needs_from_roster(roster)
+            for team_id, roster in rosters.items()
+        }
+
+    def _get_persona(self, player: MarketPlayer):
+        """Loaded persona, or a newly generated one saved at commit."""
+        persona = self._personas.get(player.player_id)
+        if persona is None:
+            persona = self._service._get_persona_service().generate_persona(
+                player_id=player.player_id,
+                age=player.age,
+                overall=player.overall,
+                position=player.position,
+                team_id=0,
+            )
+            self._personas[player.player_id] = persona
+            self._new_personas.append(persona)
+        return persona
+
+    def _get_attractiveness(self, team_id: int):
+        """Team attractiveness, built once per team."""
+        if team_id not in self._attractiveness:
+            service = self._service._get_attractiveness_service()
+            self._attractiveness[team_id] = service.get_team_attractiveness(team_id)
+        return self._attractiveness[team_id]
+
+    # -------------------- Resolution --------------------
+
+    def run(
+        self,
+        user_team_id: int,
+        max_signings_per_team: int = 3,
+        max_attempts_per_signing: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Resolve AI team signings and commit the accepted ones.
+
+        Args:
+            user_team_id: User's team ID (to skip)
+            max_signings_per_team: Maximum signings per AI team
+            max_attempts_per_signing: Max players to try per position need
+
+        Returns:
+            Dict with signings, events and rejections
+            (see FreeAgencyService.process_ai_signings)
+        """
+        from team_management.teams.team_loader import TeamDataLoader
+        from salary_cap.cap_calculator import CapCalculator
+
+        ai_teams = [
+            team for team in TeamDataLoader().get_all_teams()
+            if team.team_id != user_team_id
+        ]
+
+        self._load_pool()
+        self._personas = self._service._get_persona_service().get_all_personas()
+        self._new_personas = []
+        self._attractiveness = {}
+
+        # Cap space for NEXT season (offseason signings). Contracts created
+        # here do not change it until the cap summary is recalculated.
+        cap_space = CapCalculator(self._db_path).calculate_all_team_cap_space(
+            [team.team_id for team in ai_teams],
+            season=self._season + 1,
+            dynasty_id=self._dynasty_id
+        )
+        team_needs = self._load_team_needs()
+
+        signings = []
+        events = []
+        rejections = []
+        accepted = []
+
+        for team in ai_teams:
+            team_id = team.team_id
+            budget = cap_space[team_id]
+
+            # Skip teams with no cap space
+            if budget <= 0:
+                continue
+
+            signings_made = 0
+            for need_position in team_needs.get(team_id, []):
+                if signings_made >= max_signings_per_team:
+                    break
+
+                attempts = 0
+                for player in self._pool.get(need_position.lower(), []):
+                    if attempts >= max_attempts_per_signing:
+                        break
+
+                    if player.player_id in self._signed:
+                        continue
+
+                    if player.listing["estimated_aav"] > budget:
+                        continue
+
+                    # Skip if interest is low and we've tried others
+                    interest = self._evaluate_interest(player, team_id)
+                    if interest["interest_level"] == "low" and attempts > 0:
+                        continue
+
+                    attempts += 1
+
+                    result = self._make_offer(player, team_id, cap_space[team_id])
+                    if result["success"]:
+                        accepted.append(result)
+                        signings.append({
+                            "player_id": player.player_id,
+                            "player_name": result["player_name"],
+                            "team_id": team_id,
+                            "team_name": team.full_name,
+                            "contract_details": result["contract_details"],
+                        })
+                        events.append(
+                            f"{team.abbreviation} signed FA {result['player_name']}"
+                        )
+
+                        budget -= player.listing["estimated_aav"]
+                        signings_made += 1
+                        self._signed.add(player.player_id)
+                        break
+
+                    rejections.append({
+                        "player_id": player.player_id,
+                        "player_name": player.listing["name"],
+                        "team_id": team_id,
+                        "team_name": team.full_name,
+                        "reason": result.get("rejection_reason"),
+                        "concerns": result.get("concerns", [])
+                    })
+
+        self._commit(accepted)
+
+        logger.info(
+            f"AI FA signings complete: {len(signings)} signed, {len(rejections)} rejected"
+        )
+
+        return {
+            "signings": signings,
+            "events": events,
+            "rejections": rejections,
+        }
+
+    def _evaluate_interest(self, player: MarketPlayer, team_id: int) -> Dict[str, Any]:
+        """In-memory evaluate_player_interest()."""
+        try:
+            return self._service._score_interest(
+                persona=self._get_persona(player),
+                team_attractiveness=self._get_attractiveness(team_id),
+                team_id=team_id,
+                position=player.position,
+                overall=player.overall,
+                market_value=player.market_value
+            )
+        except Exception as e:
+            logger.error(f"Interest evaluation failed for player {player.player_id}: {e}")
+            return {"interest_level": "unknown"}
+
+    def _make_offer(self, player: MarketPlayer, team_id: int, cap_space: int) -> Dict[str, Any]:
+        """
+        In-memory sign_free_agent(use_valuation_engine=True).
+
+        Args:
+            player: Free agent receiving the offer
+            team_id: Team making the offer
+            cap_space: Team's cap space for next season
+
+        Returns:
+            sign_free_agent()-style result; successful results also carry the
+            contract schedule for _commit()
+        """
+        try:
+            offer = self._service._calculate_npc_contract_offer(
+                player_info=player.player_info,
+                team_id=team_id,
+                position=player.position,
+                overall=player.overall,
+                age=player.age,
+                years_pro=player.years_pro
+            )
+            player_name = player.listing["name"]
+
+            acceptance = self._check_acceptance(player, team_id, offer)
+            if not acceptance["accepted"]:
+                logger.info(
+                    f"FA {player_name} declined offer from team {team_id}: "
+                    f"{acceptance['concerns']}"
+                )
+                return {
+                    "success": False,
+                    "error_message": "Player declined offer",
+                    "player_name": player_name,
+                    "rejection_reason": "Player declined based on preferences",
+                    "concerns": acceptance["concerns"],
+                    "acceptance_probability": acceptance["probability"],
+                    "interest_level": acceptance["interest_level"],
+                }
+
+            if offer["aav"] > cap_space:
+                return {
+                    "success": False,
+                    "error_message": (
+                        f"Insufficient cap space. Need ${offer['aav']:,}, have ${cap_space:,}"
+                    ),
+                }
+
+            base_salaries, guaranteed_amounts, year1_cap_hit = self._service._build_contract_schedule(
+                total_value=offer["total_value"],
+                signing_bonus=offer["signing_bonus"],
+                guaranteed=offer["guaranteed"],
+                years=offer["years"]
+            )
+
+            return {
+                "success": True,
+                "player_id": player.player_id,
+                "team_id": team_id,
+                "player_name": player_name,
+                "base_salaries": base_salaries,
+                "guaranteed_amounts": guaranteed_amounts,
+                "contract_details": {
+                    "years": offer["years"],
+                    "total_value": offer["total_value"],
+                    "aav": offer["aav"],
+                    "guaranteed": offer["guaranteed"],
+                    "signing_bonus": offer["signing_bonus"],
+                    "year1_cap_hit": year1_cap_hit,
+                    "position": player.position,
+                    "overall": player.overall,
+                    "age": player.age,
+                },
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to sign free agent {player.player_id}: {e}")
+            return {
+                "success": False,
+                "error_message": str(e),
+            }
+
+    def _check_acceptance(
+        self,
+        player: MarketPlayer,
+        team_id: int,
+        offer: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """In-memory _check_player_acceptance()."""
+        try:
+            return self._service._evaluate_offer(
+                persona=self._get_persona(player),
+                team_attractiveness=self._get_attractiveness(team_id),
+                team_id=team_id,
+                aav=offer["aav"],
+                total_value=offer["total_value"],
+                years=offer["years"],
+                guaranteed=offer["guaranteed"],
+                signing_bonus=offer["signing_bonus"],
+                position=player.position,
+                overall=player.overall
+            )
+        except Exception as e:
+            logger.error(f"Preference check failed for player {player.player_id}: {e}")
+            # Fallback: Accept the offer (don't block signing due to preference system errors)
+            return {
+                "accepted": True,
+                "probability": 0.50,
+                "concerns": [],
+                "interest_level": "medium"
+            }
+
+    # -------------------- Commit --------------------
+
+    def _commit(self, accepted: List[Dict[str, Any]]) -> None:
+        """
+        Write generated personas, then every accepted signing in one transaction.
+
+        Args:
+            accepted: Successful _make_offer() results
+
+        Raises:
+            sqlite3.Error: If the signing transaction fails (nothing is committed)
+        """
+        from database.player_roster_api import PlayerRosterAPI
+        from salary_cap.contract_manager import ContractManager
+        from src.persistence.transaction_logger import TransactionLogger
+
+        if self._new_personas:
+            self._service._get_persona_service().save_personas(self._new_personas)
+            self._new_personas = []
+
+        if not accepted:
+            return
+
+        conn = sqlite3.connect(self._db_path, timeout=30.0)
+        try:
+            conn.execute("PRAGMA foreign_keys = ON")
+            roster_api = PlayerRosterAPI(self._db_path, connection=conn)
+            transaction_logger = TransactionLogger(self._db_path, connection=conn)
+            contract_manager = ContractManager(self._db_path, connection=conn)
+
+            for signing in accepted:
+                details = signing["contract_details"]
+                contract_id = self._insert_contract(contract_manager, signing)
+
+                roster_api.update_player_team(
+                    dynasty_id=self._dynasty_id,
+                    player_id=signing["player_id"],
+                    new_team_id=signing["team_id"]
+                )
+                roster_api.update_player_contract_id(
+                    dynasty_id=self._dynasty_id,
+                    player_id=signing["player_id"],
+                    contract_id=contract_id
+                )
+                transaction_logger.log_transaction(
+                    dynasty_id=self._dynasty_id,
+                    season=self._season + 1,  # Contract is for next season
+                    transaction_type="UFA_SIGNING",
+                    player_id=signing["player_id"],
+                    player_name=signing["player_name"],
+                    position=details["position"],
+                    from_team_id=None,  # From free agency
+                    to_team_id=signing["team_id"],
+                    transaction_date=date(self._season + 1, 3, 15),  # FA period date (next year)
+                    details={
+                        "contract_years": details["years"],
+                        "contract_value": details["total_value"],
+                        "guaranteed": details["guaranteed"],
+                    }
+                )
+
+                logger.info(
+                    f"Signed FA {signing['player_name']} ({details['position']}) to team "
+                    f"{signing['team_id']}: {details['years']} years, ${details['total_value']:,}"
+                )
+
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _insert_contract(self, contract_manager, signing: Dict[str, Any]) -> int:
+        """
+        Create a VETERAN contract in the signing transaction.
+
+        Args:
+            contract_manager: ContractManager on the signing transaction's connection
+            signing: Successful _make_offer() result
+
+        Returns:
+            contract_id of the new contract
+        """
+        details = signing["contract_details"]
+        return contract_manager.create_contract(
+            player_id=signing["player_id"],
+            team_id=signing["team_id"],
+            dynasty_id=self._dynasty_id,
+            contract_years=details["years"],
+            total_value=details["total_value"],
+            signing_bonus=details["signing_bonus"],
+            base_salaries=signing["base_salaries"],
+            guaranteed_amounts=signing["guaranteed_amounts"],
+            contract_type="VETERAN",
+            season=self._season + 1  # Contract starts NEXT league year
+        )
@@ -6,7 +6,7 @@ Implements flex scheduling for weeks 12-17 based on playoff implications.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from enum import Enum
 
 from src.game_cycle.database.connection import GameCycleDatabase
@@ -15,6 +15,9 @@ from src.game_cycle.database.rivalry_api import RivalryAPI, Rivalry
 from src.game_cycle.models.game_slot import GameSlot, PrimetimeAssignment, get_market_score
 from team_management.teams.team_loader import get_team_by_id
 
+if TYPE_CHECKING:
+    from src.game_cycle.services.playoff_odds_engine import PlayoffOdds
+
 
 # Flex scheduling constants
 FLEX_THRESHOLD = 15  # Minimum appeal delta to trigger flex
@@ -135,13 +138,16 @@ class FlexScheduler:
         rivalries = self._rivalry_api.get_all_rivalries(self._dynasty_id)
         rivalry_map = self._build_rivalry_map(rivalries)
 
+        # Simulate the rest of the season once for clinch/elimination stakes
+        playoff_odds = self.simulate_playoff_odds(season, current_week, standings)
+
         # Calculate appeal for all games
         game_appeals: Dict[str, int] = {}
         for game in week_games:
             appeal = self.calculate_game_flex_appeal(
                 season, target_week,
                 game['home_team_id'], game['away_team_id'],
-                standings, rivalry_map
+                standings, rivalry_map, playoff_odds
             )
             game_appeals[game['game_id']] = appeal
 
@@ -172,7 +178,7 @@ class FlexScheduler:
                 if appeal_delta >= FLEX_THRESHOLD:
                     reason = self._determine_flex_reason(
                         game['home_team_id'], game['away_team_id'],
-                        standings, rivalry_map
+                        standings, rivalry_map, target_week, playoff_odds
                     )
 
                     recommendations.append(FlexRecommendation(
@@ -255,6 +261,7 @@ class FlexScheduler:
         away_team_id: int,
         standings: Optional[List[TeamStanding]] = None,
         rivalry_map: Optional[Dict[Tuple[int, int], Rivalry]] = None,
+        playoff_odds: Optional["PlayoffOdds"] = None,
     ) -> int:
         """
         Calculate flex appeal score (0-100) using CURRENT standings.
@@ -274,6 +281,7 @@ class FlexScheduler:
             away_team_id: Away team ID
             standings: Optional pre-loaded standings (for efficiency)
             rivalry_map: Optional pre-loaded rivalry map
+            playoff_odds: Optional simulated odds (see simulate_playoff_odds)
 
         Returns:
             Appeal score 0-100
@@ -291,10 +299,10 @@ class FlexScheduler:
 
         # 1. Playoff implications (0-40)
         home_implications = self.calculate_playoff_implications(
-            season, week, home_team_id, away_team_id, standings
+            season, week, home_team_id, away_team_id, standings, playoff_odds
         )
         away_implications = self.calculate_playoff_implications(
-            season, week, away_team_id, home_team_id, standings
+            season, week, away_team_id, home_team_id, standings, playoff_odds
         )
         implications_appeal = min(
             home_implications.implication_score + away_implications.implication_score,
@@ -327,16 +335,22 @@ class FlexScheduler:
         team_id: int,
         opponent_id: int,
         standings: Optional[List[TeamStanding]] = None,
+        playoff_odds: Optional["PlayoffOdds"] = None,
     ) -> PlayoffImplications:
         """
         Calculate what's at stake for a team in upcoming games.
 
+        With playoff_odds, clinch and elimination flags come from the
+        simulated seasons (a win clinches if the team made it in every
+        season where it won this game); otherwise from standings heuristics.
+
         Args:
             season: Season year
             week: Week number
             team_id: Team to evaluate
             opponent_id: Opponent team ID
             standings: Optional pre-loaded standings
+            playoff_odds: Optional simulated odds (see simulate_playoff_odds)
 
         Returns:
             PlayoffImplications for the team
@@ -380,23 +394,27 @@ class FlexScheduler:
         games_played = team_standing.wins + team_standing.losses + team_standing.ties
         remaining_games = 17 - games_played
 
-        # Check clinching scenarios
-        implications.can_clinch_playoff = self._can_clinch_playoff(
-            team_standing, conference_standings, conference_rank, remaining_games
-        )
+        if playoff_odds is not None:
+            # Clinching and elimination from the simulated seasons
+            self._apply_playoff_odds(implications, week, opponent_id, playoff_odds)
+        else:
+            # Check clinching scenarios
+            implications.can_clinch_playoff = self._can_clinch_playoff(
+                team_standing, conference_standings, conference_rank, remaining_games
+            )
 
-        implications.can_clinch_division = self._can_clinch_division(
-            team_id, team_standing, standings, remaining_games
-        )
+            implications.can_clinch_division = self._can_clinch_division(
+                team_id, team_standing, standings, remaining_games
+            )
 
-        implications.can_clinch_bye = self._can_clinch_bye(
-            team_standing, conference_standings, conference_rank, remaining_games
-        )
+            implications.can_clinch_bye = self._can_clinch_bye(
+                team_standing, conference_standings, conference_rank, remaining_games
+            )
 
-        # Check elimination scenario
-        implications.elimination_game = self._is_elimination_game(
-            team_standing, conference_standings, conference_rank, remaining_games
-        )
+            # Check elimination scenario
+            implications.elimination_game = self._is_elimination_game(
+                team_standing, conference_standings, conference_rank, remaining_games
+            )
 
         # Check wild card race
         implications.wild_card_race = self._in_wild_card_race(
@@ -411,6 +429,44 @@ class FlexScheduler:
 
         return implications
 
+    def simulate_playoff_odds(
+        self,
+        season: int,
+        current_week: int,
+        standings: Optional[List[TeamStanding]] = None,
+        iterations: Optional[int] = None,
+    ) -> Optional["PlayoffOdds"]:
+        """
+        Simulate the games after current_week for playoff probabilities.
+
+        Seeded by season and week, so re-evaluating a week gives the same odds.
+
+        Args:
+            season: Season year
+            current_week: Last completed week
+            standings: Optional pre-loaded standings
+            iterations: Simulated seasons (engine default if None)
+
+        Returns:
+            PlayoffOdds, or None if no games remain in game_slots
+        """
+        from src.game_cycle.services.playoff_odds_engine import (
+            DEFAULT_ITERATIONS,
+            PlayoffOddsEngine,
+        )
+
+        if standings is None:
+            standings = self._standings_api.get_standings(self._dynasty_id, season)
+
+        remaining_games = self._get_remaining_games(season, current_week)
+        if not remaining_games:
+            return None
+
+        engine = PlayoffOddsEngine(
+            standings, remaining_games, seed=season * 100 + current_week
+        )
+        return engine.run(iterations or DEFAULT_ITERATIONS)
+
     # -------------------- Private Helper Methods --------------------
 
     def _get_flexable_slots(self, week: int) -> List[GameSlot]:
@@ -435,6 +491,19 @@ class FlexScheduler:
         )
         return [dict(row) for row in rows] if rows else []
 
+    def _get_remaining_games(
+        self, season: int, after_week: int
+    ) -> List[Tuple[int, int, int]]:
+        """Get (week, home_team_id, away_team_id) for regular season games after a week."""
+        rows = self._db.query_all(
+            """SELECT week, home_team_id, away_team_id
+               FROM game_slots
+               WHERE dynasty_id = ? AND season = ? AND week > ? AND week <= 18
+               ORDER BY week, game_id""",
+            (self._dynasty_id, season, after_week)
+        )
+        return [(row['week'], row['home_team_id'], row['away_team_id']) for row in rows]
+
     def _get_game_in_slot(
         self, season: int, week: int, slot: GameSlot
     ) -> Optional[Dict]:
@@ -542,6 +611,31 @@ class FlexScheduler:
 
     # -------------------- Clinching/Elimination Logic --------------------
 
+    def _apply_playoff_odds(
+        self,
+        implications: PlayoffImplications,
+        week: int,
+        opponent_id: int,
+        playoff_odds: "PlayoffOdds",
+    ) -> None:
+        """
+        Set clinch/elimination flags from simulated seasons.
+
+        - Clinch: not yet certain, but certain in every season the team won this game
+        - Elimination: still possible, but never in a season the team lost this game
+        """
+        current = playoff_odds.get(implications.team_id)
+        if_win = playoff_odds.if_result(implications.team_id, opponent_id, won=True, week=week)
+        if_loss = playoff_odds.if_result(implications.team_id, opponent_id, won=False, week=week)
+
+        if if_win is not None:
+            implications.can_clinch_playoff = current.playoffs < 1.0 and if_win.playoffs == 1.0
+            implications.can_clinch_division = current.division < 1.0 and if_win.division == 1.0
+            implications.can_clinch_bye = current.bye < 1.0 and if_win.bye == 1.0
+
+        if if_loss is not None:
+            implications.elimination_game = current.playoffs > 0.0 and if_loss.playoffs == 0.0
+
     def _can_clinch_playoff(
         self,
         team_standing: TeamStanding,
@@ -728,14 +822,16 @@ class FlexScheduler:
         away_team_id: int,
         standings: List[TeamStanding],
         rivalry_map: Dict[Tuple[int, int], Rivalry],
+        week: int = 0,
+        playoff_odds: Optional["PlayoffOdds"] = None,
     ) -> str:
         """Determine primary reason for flexing this game."""
         # Check playoff implications first
         home_impl = self.calculate_playoff_implications(
-            0, 0, home_team_id, away_team_id, standings
+            0, week, home_team_id, away_team_id, standings, playoff_odds
         )
         away_impl = self.calculate_playoff_implications(
-            0, 0, away_team_id, home_team_id, standings
+            0, week, away_team_id, home_team_id, standings, playoff_odds
         )
 
         if home_impl.division_title_game or away_impl.division_title_game:
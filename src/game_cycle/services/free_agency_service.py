@@ -6,7 +6,7 @@ Uses MarketValueCalculator to generate realistic contract offers.
 """
 
 from datetime import date
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 import logging
 import json
 
@@ -303,8 +303,6 @@ class FreeAgencyService:
                 - interest_level: str ("low", "medium", "high")
         """
         try:
-            from src.player_management.preference_engine import ContractOffer
-
             # Get or generate player persona
             persona_service = self._get_persona_service()
             persona = persona_service.get_persona(player_id)
@@ -325,43 +323,19 @@ class FreeAgencyService:
             attractiveness_service = self._get_attractiveness_service()
             team_attractiveness = attractiveness_service.get_team_attractiveness(team_id)
 
-            # Build contract offer
-            offer = ContractOffer(
+            return self._evaluate_offer(
+                persona=persona,
+                team_attractiveness=team_attractiveness,
                 team_id=team_id,
                 aav=aav,
                 total_value=total_value,
                 years=years,
                 guaranteed=guaranteed,
                 signing_bonus=signing_bonus,
-                market_aav=aav,  # At market value for FA signings
-                role=self._estimate_role(team_id, position, overall)
-            )
-
-            # Evaluate offer
-            preference_engine = self._get_preference_engine()
-            accepted, probability, concerns = preference_engine.should_accept_offer(
-                persona=persona,
-                team=team_attractiveness,
-                offer=offer,
-                is_current_team=False,  # FA is not on any team
-                is_drafting_team=(team_id == persona.drafting_team_id)
+                position=position,
+                overall=overall
             )
 
-            # Determine interest level
-            if probability >= 0.75:
-                interest_level = "high"
-            elif probability >= 0.45:
-                interest_level = "medium"
-            else:
-                interest_level = "low"
-
-            return {
-                "accepted": accepted,
-                "probability": probability,
-                "concerns": concerns,
-                "interest_level": interest_level
-            }
-
         except Exception as e:
             self._logger.error(f"Preference check failed for player {player_id}: {e}")
             # Fallback: Accept the offer (don't block signing due to preference system errors)
@@ -372,6 +346,76 @@ class FreeAgencyService:
                 "interest_level": "medium"
             }
 
+    def _evaluate_offer(
+        self,
+        persona,
+        team_attractiveness,
+        team_id: int,
+        aav: int,
+        total_value: int,
+        years: int,
+        guaranteed: int,
+        signing_bonus: int,
+        position: str,
+        overall: int
+    ) -> Dict[str, Any]:
+        """Evaluate an offer against an already loaded persona and team.
+
+        Args:
+            persona: PlayerPersona of the free agent
+            team_attractiveness: TeamAttractiveness of the offering team
+            team_id: Team ID making the offer
+            aav: Average annual value in dollars
+            total_value: Total contract value in dollars
+            years: Contract length
+            guaranteed: Guaranteed money in dollars
+            signing_bonus: Signing bonus in dollars
+            position: Player position
+            overall: Player overall rating
+
+        Returns:
+            Dict with accepted, probability, concerns, interest_level
+            (see _check_player_acceptance)
+        """
+        from src.player_management.preference_engine import ContractOffer
+
+        # Build contract offer
+        offer = ContractOffer(
+            team_id=team_id,
+            aav=aav,
+            total_value=total_value,
+            years=years,
+            guaranteed=guaranteed,
+            signing_bonus=signing_bonus,
+            market_aav=aav,  # At market value for FA signings
+            role=self._estimate_role(team_id, position, overall)
+        )
+
+        # Evaluate offer
+        preference_engine = self._get_preference_engine()
+        accepted, probability, concerns = preference_engine.should_accept_offer(
+            persona=persona,
+            team=team_attractiveness,
+            offer=offer,
+            is_current_team=False,  # FA is not on any team
+            is_drafting_team=(team_id == persona.drafting_team_id)
+        )
+
+        # Determine interest level
+        if probability >= 0.75:
+            interest_level = "high"
+        elif probability >= 0.45:
+            interest_level = "medium"
+        else:
+            interest_level = "low"
+
+        return {
+            "accepted": accepted,
+            "probability": probability,
+            "concerns": concerns,
+            "interest_level": interest_level
+        }
+
     def get_cap_summary(self, team_id: int) -> Dict[str, Any]:
         """
         Get salary cap summary for a team.
@@ -411,76 +455,102 @@ class FreeAgencyService:
 
         result = []
         for player in free_agents:
-            player_id = player.get("player_id")
+            entry = self._build_free_agent_entry(
+                player, market_calculator, position_filter, min_overall
+            )
+            if entry is not None:
+                result.append(entry)
 
-            # Extract position from JSON array
-            positions = player.get("positions", [])
-            if isinstance(positions, str):
-                positions = json.loads(positions)
-            position = positions[0] if positions else ""
+        # Sort by overall rating (highest first)
+        result.sort(key=lambda x: x.get("overall", 0), reverse=True)
 
-            # Apply position filter if specified
-            if position_filter and position.lower() != position_filter.lower():
-                continue
+        return result
 
-            # Extract overall and potential from JSON attributes
-            attributes = player.get("attributes", {})
-            if isinstance(attributes, str):
-                attributes = json.loads(attributes)
-            overall = attributes.get("overall", 0)
-            potential = attributes.get("potential", 0)
+    def _build_free_agent_entry(
+        self,
+        player: Dict[str, Any],
+        market_calculator,
+        position_filter: Optional[str] = None,
+        min_overall: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the free agent listing for one player row.
 
-            # Apply min overall filter if specified
-            if min_overall and overall < min_overall:
-                continue
+        Args:
+            player: Player row from PlayerRosterAPI.get_free_agents()
+            market_calculator: MarketValueCalculator instance
+            position_filter: Optional position to filter by
+            min_overall: Optional minimum overall rating
 
-            # Calculate age from birthdate
-            age = 0
-            birthdate = player.get("birthdate")
-            if birthdate:
-                try:
-                    birth_year = int(birthdate.split("-")[0])
-                    age = self._season - birth_year
-                except (ValueError, IndexError):
-                    pass
+        Returns:
+            Player dictionary with estimated contract values, or None if
+            the player is filtered out
+        """
+        player_id = player.get("player_id")
 
-            years_pro = player.get("years_pro", 0)
+        # Extract position from JSON array
+        positions = player.get("positions", [])
+        if isinstance(positions, str):
+            positions = json.loads(positions)
+        position = positions[0] if positions else ""
 
-            # Get development type from archetype
-            archetype_id = player.get("archetype_id")
-            dev_type = self._get_dev_type(archetype_id)
+        # Apply position filter if specified
+        if position_filter and position.lower() != position_filter.lower():
+            return None
 
-            # Calculate market value for contract estimate
-            market_value = market_calculator.calculate_player_value(
-                position=position,
-                overall=overall,
-                age=age,
-                years_pro=years_pro
-            )
+        # Extract overall and potential from JSON attributes
+        attributes = player.get("attributes", {})
+        if isinstance(attributes, str):
+            attributes = json.loads(attributes)
+        overall = attributes.get("overall", 0)
+        potential = attributes.get("potential", 0)
 
-            # Convert to dollars
-            estimated_aav = int(market_value["aav"] * 1_000_000)
-            estimated_years = market_value["years"]
-            estimated_total = int(market_value["total_value"] * 1_000_000)
-
-            result.append({
-                "player_id": player_id,
-                "name": f"{player.get('first_name', '')} {player.get('last_name', '')}".strip(),
-                "position": position,
-                "age": age,
-                "overall": overall,
-                "potential": potential,
-                "dev_type": dev_type,
-                "years_pro": years_pro,
-                "estimated_aav": estimated_aav,
-                "estimated_years": estimated_years,
-                "estimated_total": estimated_total,
-            })
+        # Apply min overall filter if specified
+        if min_overall and overall < min_overall:
+            return None
 
-        # Sort by overall rating (highest first)
-        result.sort(key=lambda x: x.get("overall", 0), reverse=True)
+        # Calculate age from birthdate
+        age = 0
+        birthdate = player.get("birthdate")
+        if birthdate:
+            try:
+                birth_year = int(birthdate.split("-")[0])
+                age = self._season - birth_year
+            except (ValueError, IndexError):
+                pass
 
-        return result
+        years_pro = player.get("years_pro", 0)
+
+        # Get development type from archetype
+        archetype_id = player.get("archetype_id")
+        dev_type = self._get_dev_type(archetype_id)
+
+        # Calculate market value for contract estimate
+        market_value = market_calculator.calculate_player_value(
+            position=position,
+            overall=overall,
+            age=age,
+            years_pro=years_pro
+        )
+
+        # Convert to dollars
+        estimated_aav = int(market_value["aav"] * 1_000_000)
+        estimated_years = market_value["years"]
+        estimated_total = int(market_value["total_value"] * 1_000_000)
+
+        return {
+            "player_id": player_id,
+            "name": f"{player.get('first_name', '')} {player.get('last_name', '')}".strip(),
+            "position": position,
+            "age": age,
+            "overall": overall,
+            "potential": potential,
+            "dev_type": dev_type,
+            "years_pro": years_pro,
+            "estimated_aav": estimated_aav,
+            "estimated_years": estimated_years,
+            "estimated_total": estimated_total,
+        }
 
     def sign_free_agent(
         self,
@@ -698,24 +768,12 @@ class FreeAgencyService:
                     "error_message": f"Insufficient cap space. Need ${aav:,}, have ${cap_space:,}",
                 }
 
-            # Generate year-by-year base salaries
-            base_salaries = []
-            remaining_after_bonus = total_value - signing_bonus
-            for i in range(years):
-                year_weight = 1.0 + (i * 0.05)
-                total_weight = sum(1.0 + (j * 0.05) for j in range(years))
-                year_salary = int((remaining_after_bonus * year_weight) / total_weight)
-                base_salaries.append(year_salary)
-
-            # Generate guaranteed amounts (front-loaded)
-            guaranteed_amounts = []
-            remaining_guarantee = guaranteed - signing_bonus
-            for i in range(years):
-                if i < years // 2 + 1:
-                    year_guarantee = remaining_guarantee // (years // 2 + 1)
-                    guaranteed_amounts.append(year_guarantee)
-                else:
-                    guaranteed_amounts.append(0)
+            base_salaries, guaranteed_amounts, year1_cap_hit = self._build_contract_schedule(
+                total_value=total_value,
+                signing_bonus=signing_bonus,
+                guaranteed=guaranteed,
+                years=years
+            )
 
             # Create new contract (starts NEXT season during offseason)
             new_contract_id = contract_manager.create_contract(
@@ -731,12 +789,6 @@ class FreeAgencyService:
                 season=self._season + 1  # Contract starts NEXT league year
             )
 
-            # Calculate Year-1 cap hit (SSOT for cap projections)
-            # Matches contract_manager.create_contract() calculation
-            proration_years = min(years, 5)
-            year1_bonus_proration = signing_bonus // proration_years if proration_years > 0 else 0
-            year1_cap_hit = base_salaries[0] + year1_bonus_proration
-
             # Update player's team_id
             roster_api.update_player_team(
                 dynasty_id=self._dynasty_id,
@@ -798,6 +850,52 @@ class FreeAgencyService:
                 "error_message": str(e),
             }
 
+    def _build_contract_schedule(
+        self,
+        total_value: int,
+        signing_bonus: int,
+        guaranteed: int,
+        years: int
+    ) -> Tuple[List[int], List[int], int]:
+        """
+        Split a contract into year-by-year base salaries and guarantees.
+
+        Args:
+            total_value: Total contract value in dollars
+            signing_bonus: Signing bonus in dollars
+            guaranteed: Guaranteed money in dollars
+            years: Contract length
+
+        Returns:
+            Tuple of (base_salaries, guaranteed_amounts, year1_cap_hit)
+        """
+        # Generate year-by-year base salaries
+        base_salaries = []
+        remaining_after_bonus = total_value - signing_bonus
+        for i in range(years):
+            year_weight = 1.0 + (i * 0.05)
+            total_weight = sum(1.0 + (j * 0.05) for j in range(years))
+            year_salary = int((remaining_after_bonus * year_weight) / total_weight)
+            base_salaries.append(year_salary)
+
+        # Generate guaranteed amounts (front-loaded)
+        guaranteed_amounts = []
+        remaining_guarantee = guaranteed - signing_bonus
+        for i in range(years):
+            if i < years // 2 + 1:
+                year_guarantee = remaining_guarantee // (years // 2 + 1)
+                guaranteed_amounts.append(year_guarantee)
+            else:
+                guaranteed_amounts.append(0)
+
+        # Calculate Year-1 cap hit (SSOT for cap projections)
+        # Matches contract_manager.create_contract() calculation
+        proration_years = min(years, 5)
+        year1_bonus_proration = signing_bonus // proration_years if proration_years > 0 else 0
+        year1_cap_hit = base_salaries[0] + year1_bonus_proration
+
+        return base_salaries, guaranteed_amounts, year1_cap_hit
+
     def evaluate_player_interest(
         self,
         player_id: int,
@@ -827,7 +925,6 @@ class FreeAgencyService:
         try:
             from database.player_roster_api import PlayerRosterAPI
             from offseason.market_value_calculator import MarketValueCalculator
-            from src.player_management.preference_engine import ContractOffer
 
             roster_api = PlayerRosterAPI(self._db_path)
             market_calculator = MarketValueCalculator()
@@ -866,11 +963,6 @@ class FreeAgencyService:
                 age=age,
                 years_pro=years_pro
             )
-            aav = int(market_value["aav"] * 1_000_000)
-            total_value = int(market_value["total_value"] * 1_000_000)
-            guaranteed = int(market_value["guaranteed"] * 1_000_000)
-            years = market_value["years"]
-            signing_bonus = int(market_value["signing_bonus"] * 1_000_000)
 
             # Get or generate persona
             persona_service = self._get_persona_service()
@@ -890,61 +982,14 @@ class FreeAgencyService:
             attractiveness_service = self._get_attractiveness_service()
             team_attractiveness = attractiveness_service.get_team_attractiveness(team_id)
 
-            # Build hypothetical offer at market value
-            offer = ContractOffer(
-                team_id=team_id,
-                aav=aav,
-                total_value=total_value,
-                years=years,
-                guaranteed=guaranteed,
-                signing_bonus=signing_bonus,
-                market_aav=aav,
-                role=self._estimate_role(team_id, position, overall)
-            )
-
-            # Get preference engine evaluation
-            preference_engine = self._get_preference_engine()
-            team_score = preference_engine.calculate_team_score(
-                persona=persona,
-                team=team_attractiveness,
-                offer=offer,
-                is_current_team=False,
-                is_drafting_team=(team_id == persona.drafting_team_id)
-            )
-            probability = preference_engine.calculate_acceptance_probability(
+            return self._score_interest(
                 persona=persona,
-                team_score=team_score,
-                offer_vs_market=1.0  # At market value
+                team_attractiveness=team_attractiveness,
+                team_id=team_id,
+                position=position,
+                overall=overall,
+                market_value=market_value
             )
-            concerns = preference_engine.get_concerns(persona, team_attractiveness, offer)
-
-            # Determine interest level based on team_score (0-100)
-            # Color bands: Green (80+), Blue (65-79), Gray (50-64), Orange (35-49), Red (<35)
-            if team_score >= 80:
-                interest_level = "very_high"
-                suggested_premium = 0.95  # Can even get discount
-            elif team_score >= 65:
-                interest_level = "high"
-                suggested_premium = 1.0  # No premium needed
-            elif team_score >= 50:
-                interest_level = "medium"
-                suggested_premium = 1.10  # 10% above market
-            elif team_score >= 35:
-                interest_level = "low"
-                suggested_premium = 1.20  # 20% above market
-            else:
-                interest_level = "very_low"
-                suggested_premium = 1.30  # 30% above market (if even possible)
-
-            return {
-                "interest_score": team_score,  # Normalized 0-100 for UI
-                "interest_level": interest_level,
-                "acceptance_probability": probability,
-                "concerns": concerns,
-                "suggested_premium": suggested_premium,
-                "team_score": team_score,  # Backwards compatibility
-                "persona_type": persona.persona_type.value  # For UI hints
-            }
 
         except Exception as e:
             self._logger.error(f"Interest evaluation failed for player {player_id}: {e}")
@@ -958,6 +1003,92 @@ class FreeAgencyService:
                 "persona_type": "unknown"
             }
 
+    def _score_interest(
+        self,
+        persona,
+        team_attractiveness,
+        team_id: int,
+        position: str,
+        overall: int,
+        market_value: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Score a player's interest in a team at market value.
+
+        Args:
+            persona: PlayerPersona of the player
+            team_attractiveness: TeamAttractiveness of the team
+            team_id: Team ID
+            position: Player position
+            overall: Player overall rating
+            market_value: MarketValueCalculator result (values in millions)
+
+        Returns:
+            Dict with interest fields (see evaluate_player_interest)
+        """
+        from src.player_management.preference_engine import ContractOffer
+
+        aav = int(market_value["aav"] * 1_000_000)
+        total_value = int(market_value["total_value"] * 1_000_000)
+        guaranteed = int(market_value["guaranteed"] * 1_000_000)
+        years = market_value["years"]
+        signing_bonus = int(market_value["signing_bonus"] * 1_000_000)
+
+        # Build hypothetical offer at market value
+        offer = ContractOffer(
+            team_id=team_id,
+            aav=aav,
+            total_value=total_value,
+            years=years,
+            guaranteed=guaranteed,
+            signing_bonus=signing_bonus,
+            market_aav=aav,
+            role=self._estimate_role(team_id, position, overall)
+        )
+
+        # Get preference engine evaluation
+        preference_engine = self._get_preference_engine()
+        team_score = preference_engine.calculate_team_score(
+            persona=persona,
+            team=team_attractiveness,
+            offer=offer,
+            is_current_team=False,
+            is_drafting_team=(team_id == persona.drafting_team_id)
+        )
+        probability = preference_engine.calculate_acceptance_probability(
+            persona=persona,
+            team_score=team_score,
+            offer_vs_market=1.0  # At market value
+        )
+        concerns = preference_engine.get_concerns(persona, team_attractiveness, offer)
+
+        # Determine interest level based on team_score (0-100)
+        # Color bands: Green (80+), Blue (65-79), Gray (50-64), Orange (35-49), Red (<35)
+        if team_score >= 80:
+            interest_level = "very_high"
+            suggested_premium = 0.95  # Can even get discount
+        elif team_score >= 65:
+            interest_level = "high"
+            suggested_premium = 1.0  # No premium needed
+        elif team_score >= 50:
+            interest_level = "medium"
+            suggested_premium = 1.10  # 10% above market
+        elif team_score >= 35:
+            interest_level = "low"
+            suggested_premium = 1.20  # 20% above market
+        else:
+            interest_level = "very_low"
+            suggested_premium = 1.30  # 30% above market (if even possible)
+
+        return {
+            "interest_score": team_score,  # Normalized 0-100 for UI
+            "interest_level": interest_level,
+            "acceptance_probability": probability,
+            "concerns": concerns,
+            "suggested_premium": suggested_premium,
+            "team_score": team_score,  # Backwards compatibility
+            "persona_type": persona.persona_type.value  # For UI hints
+        }
+
     def get_player_persona_data(self, player_id: int) -> Dict[str, Any]:
         """Get full persona data for signing dialog.
 
@@ -1022,6 +1153,9 @@ class FreeAgencyService:
         3. Sign if cap space allows and player accepts
         4. Handle rejections and try other players
 
+        The market is resolved in memory by FAMarketEngine and accepted
+        signings are committed in one transaction.
+
         Args:
             user_team_id: User's team ID (to skip)
             max_signings_per_team: Maximum signings per AI team
@@ -1033,123 +1167,15 @@ class FreeAgencyService:
                 - events: List of event strings for UI
                 - rejections: List of rejection info dicts
         """
-        from team_management.teams.team_loader import TeamDataLoader
-        from database.player_roster_api import PlayerRosterAPI
-        from salary_cap.cap_calculator import CapCalculator
-
-        team_loader = TeamDataLoader()
-        all_teams = team_loader.get_all_teams()
-        roster_api = PlayerRosterAPI(self._db_path)
-        cap_calculator = CapCalculator(self._db_path)
-
-        signings = []
-        events = []
-        rejections = []
-
-        # Get current free agent pool
-        available_fas = self.get_available_free_agents()
-
-        for team in all_teams:
-            team_id = team.team_id
-
-            # Skip user's team
-            if team_id == user_team_id:
-                continue
-
-            # Get team's cap space for NEXT season (offseason signings)
-            cap_space = cap_calculator.calculate_team_cap_space(
-                team_id=team_id,
-                season=self._season + 1,  # Cap space for next league year
-                dynasty_id=self._dynasty_id
-            )
-
-            # Skip teams with no cap space
-            if cap_space <= 0:
-                continue
-
-            # Get team's positional needs (simple approach: look at roster gaps)
-            team_needs = self._get_team_positional_needs(team_id, roster_api)
-
-            signings_made = 0
-
-            # Try to fill needs with available FAs
-            for need_position in team_needs:
-                if signings_made >= max_signings_per_team:
-                    break
-
-                # Try multiple players at this position
-                attempts = 0
-                signed = False
-
-                for fa in available_fas[:]:  # Iterate over copy
-                    if signed or attempts >= max_attempts_per_signing:
-                        break
+        from .fa_market_engine import FAMarketEngine
 
-                    if fa["position"].lower() != need_position.lower():
-                        continue
-
-                    if fa["estimated_aav"] > cap_space:
-                        continue
-
-                    # Evaluate player interest first
-                    interest = self.evaluate_player_interest(
-                        fa["player_id"], team_id, None
-                    )
-
-                    # Skip if interest is very low and we've tried others
-                    if interest["interest_level"] == "low" and attempts > 0:
-                        continue
-
-                    attempts += 1
-
-                    # Try to sign (will check preferences internally)
-                    # Use valuation engine if available, otherwise fallback to legacy calculator
-                    result = self.sign_free_agent(
-                        fa["player_id"], team_id, None,
-                        skip_preference_check=False,  # Check preferences
-                        use_valuation_engine=True  # Enable valuation engine for NPC teams
-                    )
-
-                    if result["success"]:
-                        signings.append({
-                            "player_id": fa["player_id"],
-                            "player_name": result["player_name"],
-                            "team_id": team_id,
-                            "team_name": team.full_name,
-                            "contract_details": result.get("contract_details", {}),
-                        })
-                        events.append(
-                            f"{team.abbreviation} signed FA {result['player_name']}"
-                        )
-
-                        # Update cap space
-                        cap_space -= fa["estimated_aav"]
-                        signings_made += 1
-
-                        # Remove from available pool
-                        available_fas.remove(fa)
-                        signed = True
-                    else:
-                        # Player rejected - log it
-                        rejections.append({
-                            "player_id": fa["player_id"],
-                            "player_name": fa["name"],
-                            "team_id": team_id,
-                            "team_name": team.full_name,
-                            "reason": result.get("rejection_reason"),
-                            "concerns": result.get("concerns", [])
-                        })
-
-        self._logger.info(
-            f"AI FA signings complete: {len(signings)} signed, {len(rejections)} rejected"
+        engine = FAMarketEngine(self._db_path, self._dynasty_id, self._season, self)
+        return engine.run(
+            user_team_id,
+            max_signings_per_team=max_signings_per_team,
+            max_attempts_per_signing=max_attempts_per_signing
         )
 
-        return {
-            "signings": signings,
-            "events": events,
-            "rejections": rejections,
-        }
-
     def _get_team_positional_needs(
         self,
         team_id: int,
@@ -1164,6 +1190,21 @@ class FreeAgencyService:
             team_id: Team ID
             roster_api: PlayerRosterAPI instance
 
+        Returns:
+            List of position strings that need filling
+        """
+        # Get team roster
+        roster = roster_api.get_team_roster(self._dynasty_id, team_id)
+
+        return self._positional_needs_from_roster(roster)
+
+    def _positional_needs_from_roster(self, roster: List[Dict[str, Any]]) -> List[str]:
+        """
+        Find positional needs in an already loaded roster.
+
+        Args:
+            roster: Player dictionaries (PlayerRosterAPI roster rows)
+
         Returns:
             List of position strings that need filling
         """
@@ -1175,9 +1216,6 @@ class FreeAgencyService:
             "cornerback", "safety"
         ]
 
-        # Get team roster
-        roster = roster_api.get_team_roster(self._dynasty_id, team_id)
-
         # Count players at each position
         position_counts = {}
         for player in roster:
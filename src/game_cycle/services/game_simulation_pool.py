@@ -0,0 +1,341 @@
+"""
+Game Simulation Pool - Process-based parallel game simulation.
+
+FullGameSimulator and the play engine are pure-Python CPU work, so running
+games on a ThreadPoolExecutor serializes on the GIL. This module runs games
+in worker processes instead, one game per task.
+
+Each worker process builds a single GameSimulatorService when it starts;
+rosters and coaching staff configs come from the process's TeamDataCache, so
+they are loaded at most once per team per process. Results are shrunk to compact,
+picklable payloads before crossing the process boundary: play-by-play drives
+keep only the fields that PlayByPlayAPI persists.
+
+Starting the spawn workers costs seconds, so the week handler keeps one pool
+for the whole season (get_season_pool). Roster writes in the parent process
+are passed on with every game as the TeamDataCache generation; a worker that
+sees a new generation drops its cached rosters before simulating.
+
+Usage:
+    requests = [GameSimulationRequest(game_id, home_id, away_id, season=2025, week=1)]
+    pool = get_season_pool(db_path, dynasty_id, season=2025, max_workers=8)
+    for request, result in pool.simulate(requests, SimulationMode.FULL):
+        ...
+    shutdown_season_pool()  # After the last week
+
+Database writes are NOT done here - callers persist results sequentially.
+"""
+
+import atexit
+import logging
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple
+
+from team_management.team_data_cache import invalidate_team_data, team_data_generation
+
+from .game_simulator_service import GameSimulationResult, GameSimulatorService, SimulationMode
+
+logger = logging.getLogger(__name__)
+
+
+# Per-process simulator, created by _init_worker when a worker process starts
+_worker_simulator: Optional[GameSimulatorService] = None
+
+# Parent's TeamDataCache generation the worker's cached rosters belong to
+_worker_team_data_generation: Optional[int] = None
+
+# Pool shared by the weeks of a season (see get_season_pool)
+_season_pool: Optional["GameSimulationPool"] = None
+_season_pool_key: Optional[Tuple[str, str, int, bool]] = None
+_season_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class GameSimulationRequest:
+    """Picklable description of one game to simulate in a worker process."""
+    game_id: str
+    home_team_id: int
+    away_team_id: int
+    season: int
+    week: int
+    is_playoff: bool = False
+
+
+@dataclass(slots=True)
+class CompactPlay:
+    """Play-by-play fields persisted by PlayByPlayAPI.insert_plays_batch()."""
+    outcome: str
+    yards: int
+    is_scoring_play: bool
+    points: int
+    is_turnover: bool
+    turnover_type: Optional[str]
+    achieved_first_down: bool
+    penalty_occurred: bool
+    penalty_yards: int
+    time_elapsed: float
+    down_after_play: Optional[int]
+    distance_after_play: Optional[int]
+    field_position_after_play: Optional[int]
+    punt_distance: Optional[int]
+
+
+@dataclass(slots=True)
+class CompactDrive:
+    """Drive fields persisted by PlayByPlayAPI.insert_drives_batch()."""
+    possessing_team_id: int
+    quarter_started: int
+    starting_clock_seconds: int
+    starting_field_position: int
+    starting_down: int
+    starting_distance: int
+    ending_field_position: int
+    drive_outcome: Any
+    points_scored: int
+    total_plays: int
+    total_yards: int
+    time_elapsed: int
+    plays: List[CompactPlay] = field(default_factory=list)
+
+
+def _compact_play(play: Any) -> CompactPlay:
+    """Copy the persisted play-by-play fields from a PlayResult."""
+    yards = getattr(play, 'yards', 0)
+    return CompactPlay(
+        outcome=getattr(play, 'outcome', 'unknown'),
+        yards=yards,
+        is_scoring_play=getattr(play, 'is_scoring_play', False),
+        points=getattr(play, 'points', 0),
+        is_turnover=getattr(play, 'is_turnover', False),
+        turnover_type=getattr(play, 'turnover_type', None),
+        achieved_first_down=getattr(play, 'achieved_first_down', False),
+        penalty_occurred=getattr(play, 'penalty_occurred', False),
+        penalty_yards=getattr(play, 'penalty_yards', 0),
+        time_elapsed=getattr(play, 'time_elapsed', 0),
+        down_after_play=getattr(play, 'down_after_play', None),
+        distance_after_play=getattr(play, 'distance_after_play', None),
+        field_position_after_play=getattr(play, 'field_position_after_play', None),
+        punt_distance=getattr(play, 'punt_distance', yards),
+    )
+
+
+def _compact_drive(drive: Any) -> CompactDrive:
+    """Copy the persisted drive fields (and compacted plays) from a DriveResult."""
+    plays = getattr(drive, 'plays', []) or []
+    return CompactDrive(
+        possessing_team_id=getattr(drive, 'possessing_team_id', 0),
+        quarter_started=getattr(drive, 'quarter_started', 1),
+        starting_clock_seconds=getattr(drive, 'starting_clock_seconds', 900),
+        starting_field_position=getattr(drive, 'starting_field_position', 25),
+        starting_down=getattr(drive, 'starting_down', 1),
+        starting_distance=getattr(drive, 'starting_distance', 10),
+        ending_field_position=getattr(drive, 'ending_field_position', 0),
+        drive_outcome=getattr(drive, 'drive_outcome', 'unknown'),
+        points_scored=getattr(drive, 'points_scored', 0),
+        total_plays=getattr(drive, 'total_plays', len(plays)),
+        total_yards=getattr(drive, 'total_yards', 0),
+        time_elapsed=getattr(drive, 'time_elapsed', 0),
+        plays=[_compact_play(play) for play in plays],
+    )
+
+
+def compact_simulation_result(result: GameSimulationResult) -> GameSimulationResult:
+    """
+    Shrink a GameSimulationResult for transfer between processes.
+
+    Full DriveResult/PlayResult objects carry player references, stat
+    summaries and penalty details (~2MB pickled per FULL game). Only the
+    fields used for play-by-play persistence are kept.
+
+    Args:
+        result: Result produced by GameSimulatorService.simulate_game()
+
+    Returns:
+        The same result with drives replaced by CompactDrive records
+    """
+    if result.drives:
+        result.drives = [_compact_drive(drive) for drive in result.drives]
+    return result
+
+
+def resolve_worker_count(requested: Optional[int], num_games: int) -> int:
+    """
+    Determine how many worker processes to start.
+
+    Args:
+        requested: Explicit worker count (None = one less than the CPU count)
+        num_games: Number of games to simulate
+
+    Returns:
+        Worker count between 1 and num_games
+    """
+    if requested is None:
+        requested = max(1, (os.cpu_count() or 2) - 1)
+    return max(1, min(int(requested), num_games))
+
+
+def _init_worker(db_path: str, dynasty_id: str, profile_plays: bool = False) -> None:
+    """Create the per-process simulator (runs once in each worker process)."""
+    global _worker_simulator
+    _worker_simulator = GameSimulatorService(db_path, dynasty_id, profile_plays=profile_plays)
+
+
+def _simulate_in_worker(
+    request: GameSimulationRequest,
+    mode_value: str,
+    generation: int
+) -> GameSimulationResult:
+    """
+    Simulate one game inside a worker process.
+
+    IMPORTANT: Must be module-level function for multiprocessing pickle.
+    """
+    global _worker_team_data_generation
+    if generation != _worker_team_data_generation:
+        # Rosters changed in the parent since this worker's last game
+        invalidate_team_data()
+        _worker_team_data_generation = generation
+
+    result = _worker_simulator.simulate_game(
+        game_id=request.game_id,
+        home_team_id=request.home_team_id,
+        away_team_id=request.away_team_id,
+        mode=SimulationMode(mode_value),
+        season=request.season,
+        week=request.week,
+        is_playoff=request.is_playoff
+    )
+    return compact_simulation_result(result)
+
+
+class GameSimulationPool:
+    """
+    Runs game simulations across worker processes.
+
+    Use as a context manager, or get_season_pool() to reuse one pool for
+    every week of a season. Workers are started with the "spawn" method so
+    the pool is safe to create from the Qt UI process.
+    """
+
+    def __init__(self, db_path: str, dynasty_id: str, max_workers: int, profile_plays: bool = False):
+        """
+        Initialize the pool (worker processes start lazily on first submit).
+
+        Args:
+            db_path: Path to game cycle database
+            dynasty_id: Dynasty context for roster lookups
+            max_workers: Number of worker processes
+            profile_plays: Profile play phases in FULL-mode games
+        """
+        self.max_workers = max_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(db_path, dynasty_id, profile_plays)
+        )
+
+    def __enter__(self) -> "GameSimulationPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop all worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def simulate(
+        self,
+        requests: List[GameSimulationRequest],
+        mode: SimulationMode
+    ) -> Iterator[Tuple[GameSimulationRequest, GameSimulationResult]]:
+        """
+        Simulate games in parallel, yielding results as they complete.
+
+        Games whose simulation raises are logged and skipped, matching the
+        thread-based path in RegularSeasonHandler.
+
+        Args:
+            requests: Games to simulate
+            mode: INSTANT or FULL simulation mode
+
+        Yields:
+            (request, result) tuples in completion order
+
+        Raises:
+            concurrent.futures.process.BrokenProcessPool: If a worker process
+                dies (callers may fall back to in-process simulation)
+        """
+        generation = team_data_generation()
+        futures = {
+            self._executor.submit(_simulate_in_worker, request, mode.value, generation): request
+            for request in requests
+        }
+        for future in as_completed(futures):
+            request = futures[future]
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                logger.error("Game simulation failed for %s: %s", request.game_id, e)
+                continue
+            yield request, result
+
+
+def get_season_pool(
+    db_path: str,
+    dynasty_id: str,
+    season: int,
+    max_workers: int,
+    profile_plays: bool = False
+) -> GameSimulationPool:
+    """
+    Get the pool for a season's weeks, starting it on first use.
+
+    The running pool is reused while the database, dynasty, season and
+    profiling stay the same and it has at least max_workers workers;
+    otherwise it is shut down and replaced.
+
+    Args:
+        db_path: Path to game cycle database
+        dynasty_id: Dynasty context for roster lookups
+        season: Season being simulated
+        max_workers: Number of worker processes needed
+        profile_plays: Profile play phases in FULL-mode games
+
+    Returns:
+        Running GameSimulationPool (do not shut it down directly; use
+        shutdown_season_pool())
+    """
+    global _season_pool, _season_pool_key
+
+    key = (db_path, dynasty_id, season, profile_plays)
+    with _season_pool_lock:
+        pool = _season_pool
+        if pool is not None and _season_pool_key == key and pool.max_workers >= max_workers:
+            return pool
+        if pool is not None:
+            pool.shutdown()
+        _season_pool = GameSimulationPool(db_path, dynasty_id, max_workers, profile_plays=profile_plays)
+        _season_pool_key = key
+        return _season_pool
+
+
+def shutdown_season_pool() -> None:
+    """Stop the season's worker processes (end of season, broken pool, exit)."""
+    global _season_pool, _season_pool_key
+
+    with _season_pool_lock:
+        pool, _season_pool, _season_pool_key = _season_pool, None, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_season_pool)
@@ -7,9 +7,12 @@ Ensures output format is consistent regardless of simulation mode for Stats tab
 Usage:
     service = GameSimulatorService(db_path, dynasty_id)
 
-    # Instant mode (fast, mock stats)
+    # Instant mode (fast, rating-aware scores and mock stats)
     result = service.simulate_game(game_id, home_id, away_id, mode=SimulationMode.INSTANT)
 
+    # Instant scores for a whole week in one call
+    scores = service.generate_instant_scores([(home_id, away_id), ...], season=2025)
+
     # Full mode (realistic play-by-play)
     result = service.simulate_game(game_id, home_id, away_id, mode=SimulationMode.FULL)
 
@@ -18,7 +21,7 @@ Usage:
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.game_cycle.models.injury_models import Injury
@@ -52,6 +55,8 @@ class GameSimulationResult:
     # Team-level stats for box scores (first_downs, 3rd/4th down, TOP, penalties)
     home_team_stats: Dict[str, Any] = field(default_factory=dict)
     away_team_stats: Dict[str, Any] = field(default_factory=dict)
+    # Per-play phase timings (FULL mode with profile_plays only)
+    play_phase_profile: Optional[Any] = None  # PlayPhaseReport
 
 
 class GameSimulatorService:
@@ -66,16 +71,29 @@ class GameSimulatorService:
         dynasty_id: Current dynasty identifier for roster lookups
     """
 
-    def __init__(self, db_path: str, dynasty_id: str):
+    def __init__(self, db_path: str, dynasty_id: str, profile_plays: bool = False):
         """
         Initialize game simulator service.
 
+        FULL-mode rosters and coaching staff configs come from the shared,
+        season-scoped TeamDataCache, so every service instance for the same
+        dynasty loads each team at most once until a roster transaction or
+        injury invalidates it.
+
         Args:
             db_path: Path to game cycle database
             dynasty_id: Dynasty context for roster lookups
+            profile_plays: Time the phases of every FULL-mode play (results
+                carry a PlayPhaseReport in play_phase_profile)
         """
         self._db_path = db_path
         self._dynasty_id = dynasty_id
+        self._profile_plays = profile_plays
+
+    @property
+    def profile_plays(self) -> bool:
+        """Whether FULL-mode games are profiled per play phase."""
+        return self._profile_plays
 
     def simulate_game(
         self,
@@ -85,7 +103,8 @@ class GameSimulatorService:
         mode: SimulationMode = SimulationMode.INSTANT,
         season: int = 2025,
         week: int = 1,
-        is_playoff: bool = False
+        is_playoff: bool = False,
+        instant_scores: Optional[Tuple[int, int]] = None
     ) -> GameSimulationResult:
         """
         Simulate a game using the specified mode.
@@ -98,6 +117,8 @@ class GameSimulatorService:
             season: Season year
             week: Week number
             is_playoff: Whether this is a playoff game
+            instant_scores: Pre-generated (home, away) score for INSTANT mode,
+                from generate_instant_scores()
 
         Returns:
             GameSimulationResult with scores and player stats
@@ -110,9 +131,39 @@ class GameSimulatorService:
         else:
             return self._simulate_instant(
                 game_id, home_team_id, away_team_id,
-                season, week, is_playoff
+                season, week, is_playoff, instant_scores
             )
 
+    def generate_instant_scores(
+        self,
+        matchups: Sequence[Tuple[int, int]],
+        season: int,
+        is_playoff: bool = False
+    ) -> List[Tuple[int, int]]:
+        """
+        Generate INSTANT-mode scores for a batch of games in one call.
+
+        Scores come from the season's InstantScoreModel, so they follow
+        roster ratings (and the FULL-mode calibration, when one exists).
+
+        Args:
+            matchups: (home_team_id, away_team_id) per game
+            season: Season year
+            is_playoff: Whether these are playoff games (no ties)
+
+        Returns:
+            (home_score, away_score) per game, in matchup order
+        """
+        from src.game_cycle.services.instant_score_model import get_score_model
+
+        if not matchups:
+            return []
+        model = get_score_model(self._db_path, self._dynasty_id, season)
+        home_scores, away_scores = model.generate(
+            [home for home, _ in matchups], [away for _, away in matchups], is_playoff
+        )
+        return [(int(home), int(away)) for home, away in zip(home_scores, away_scores)]
+
     def _simulate_instant(
         self,
         game_id: str,
@@ -120,14 +171,16 @@ class GameSimulatorService:
         away_team_id: int,
         season: int,
         week: int,
-        is_playoff: bool
+        is_playoff: bool,
+        instant_scores: Optional[Tuple[int, int]] = None
     ) -> GameSimulationResult:
         """
         Fast mock simulation using existing generators.
 
-        Uses score decomposition and rating-weighted stat allocation
-        for quick, realistic-looking results. Also generates injuries
-        based on player participation.
+        Scores come from the rating-aware InstantScoreModel; score
+        decomposition and rating-weighted stat allocation fill in
+        realistic-looking player stats. Also generates injuries based on
+        player participation.
 
         Args:
             game_id: Unique game identifier
@@ -136,17 +189,19 @@ class GameSimulatorService:
             season: Season year
             week: Week number
             is_playoff: Whether this is a playoff game
+            instant_scores: Pre-generated (home, away) score, if any
 
         Returns:
             GameSimulationResult with mock stats and injuries
         """
-        from src.game_cycle.game_result_generator import generate_instant_result
         from src.game_cycle.services.mock_stats_generator import MockStatsGenerator
 
         # Generate score
-        home_score, away_score = generate_instant_result(
-            home_team_id, away_team_id, is_playoff
-        )
+        if instant_scores is None:
+            instant_scores = self.generate_instant_scores(
+                [(home_team_id, away_team_id)], season, is_playoff
+            )[0]
+        home_score, away_score = instant_scores
 
         # Generate mock player stats, team stats, and injuries
         stats_gen = MockStatsGenerator(self._db_path, self._dynasty_id, season)
@@ -182,7 +237,9 @@ class GameSimulatorService:
         Full play-by-play simulation using FullGameSimulator.
 
         Runs complete game simulation with realistic play calling,
-        formations, and detailed statistics tracking.
+        formations, and detailed statistics tracking. Randomness is seeded
+        from (dynasty, season, week, game_id), so re-simulating a game with
+        the same rosters replays it exactly.
 
         Args:
             game_id: Unique game identifier
@@ -196,19 +253,29 @@ class GameSimulatorService:
             GameSimulationResult with detailed play-by-play stats
         """
         from game_management.full_game_simulator import FullGameSimulator
+        from play_engine.core.rng import GameRNG
+        from team_management.team_data_cache import get_team_data_cache
 
         # Determine overtime type
         overtime_type = "playoffs" if is_playoff else "regular_season"
         season_type = "playoffs" if is_playoff else "regular_season"
 
-        # Create and run simulator
+        # Create and run simulator (team data from the shared season cache)
+        team_data = get_team_data_cache(self._db_path, self._dynasty_id)
+
         simulator = FullGameSimulator(
             away_team_id=away_team_id,
             home_team_id=home_team_id,
             dynasty_id=self._dynasty_id,
             db_path=self._db_path,
             overtime_type=overtime_type,
-            season_type=season_type
+            season_type=season_type,
+            rng=GameRNG.for_game(self._dynasty_id, season, week, game_id),
+            away_roster=team_data.get_roster(away_team_id, season),
+            home_roster=team_data.get_roster(home_team_id, season),
+            away_coaching_staff=team_data.get_coaching_staff(away_team_id, season),
+            home_coaching_staff=team_data.get_coaching_staff(home_team_id, season),
+            profile_plays=self._profile_plays
         )
 
         game_result = simulator.simulate_game()
@@ -269,7 +336,8 @@ class GameSimulatorService:
             injuries=injuries,
             drives=game_result.drives if hasattr(game_result, 'drives') else [],  # Include for play-by-play
             home_team_stats=home_team_stats,
-            away_team_stats=away_team_stats
+            away_team_stats=away_team_stats,
+            play_phase_profile=getattr(game_result, 'play_phase_profile', None)
         )
 
     def _convert_player_stats(
@@ -309,8 +377,11 @@ class GameSimulatorService:
             if isinstance(player_stat, dict):
                 stat = player_stat
             else:
-                # Convert dataclass/object to dict
-                stat = vars(player_stat) if hasattr(player_stat, '__dict__') else {}
+                # Convert dataclass/object to dict (PlayerStats is slotted)
+                if hasattr(player_stat, 'to_dict'):
+                    stat = player_stat.to_dict()
+                else:
+                    stat = vars(player_stat) if hasattr(player_stat, '__dict__') else {}
 
             # Extract base info
             player_name = stat.get('player_name', 'Unknown')
@@ -32,6 +32,8 @@ from src.game_cycle.database.analytics_api import AnalyticsAPI
 from src.game_cycle.database.play_grades_api import PlayGradesAPI
 from src.game_cycle.database.schedule_api import ScheduleAPI
 from src.game_cycle.database.head_to_head_api import HeadToHeadAPI
+from src.game_cycle.services.headline_template_index import TemplateIndex
+from src.game_cycle.services.headline_week_data import HeadlineWeekData, TOP_PLAYER_STAT_COLUMNS
 
 
 class HeadlineType(str, Enum):
@@ -142,6 +144,13 @@ DEFENSIVE_POSITIONS = {
     "CB", "FS", "SS", "S"
 }
 
+# Positions _get_top_defensive_player ranks (as stored in player_game_stats)
+TOP_DEFENDER_POSITIONS = (
+    "LB", "MLB", "OLB", "LOLB", "ROLB",
+    "DE", "DT", "LE", "RE", "EDGE",
+    "CB", "FS", "SS", "S", "DB",
+)
+
 
 # =============================================================================
 # PLAYER IMPACT WEIGHTS (for star player identification)
@@ -2786,6 +2795,9 @@ class HeadlineGenerator:
         # Cache for player names (loaded on demand)
         self._player_names_cache: Dict[int, str] = {}
 
+        # Bulk-loaded recap data for the current week (see preload_week)
+        self._week_data: Optional[HeadlineWeekData] = None
+
         # Template pools by type
         self._templates = {
             HeadlineType.GAME_RECAP: GAME_RECAP_TEMPLATES,
@@ -2808,6 +2820,13 @@ class HeadlineGenerator:
             HeadlineType.PREVIEW: PREVIEW_TEMPLATES,
         }
 
+        # Compile condition indexes (shared across generators, built once)
+        for pool in self._templates.values():
+            TemplateIndex.for_pool(pool)
+        for round_pools in PLAYOFF_TEMPLATES.values():
+            for pool in round_pools.values():
+                TemplateIndex.for_pool(pool)
+
     def _load_teams_data(self) -> Dict[int, Dict[str, Any]]:
         """Load team information from JSON."""
         teams_file = Path(__file__).parent.parent.parent / "data" / "teams.json"
@@ -2900,6 +2919,54 @@ class HeadlineGenerator:
         # Default = rebuilding
         return TeamStatus.REBUILDING
 
+    # =========================================================================
+    # Week Data
+    # =========================================================================
+
+    def preload_week(self, game_ids: List[str]) -> HeadlineWeekData:
+        """
+        Bulk-load recap data for a week's completed games.
+
+        Call after the games are persisted. Headlines for these games are
+        then generated from memory instead of per-game queries; other games
+        still query the database.
+
+        Args:
+            game_ids: The week's game IDs
+
+        Returns:
+            The loaded HeadlineWeekData
+        """
+        self._week_data = HeadlineWeekData.load(
+            self._db,
+            self._dynasty_id,
+            self._season,
+            game_ids,
+            box_scores_api=self._box_scores_api,
+            analytics_api=self._analytics_api,
+            play_grades_api=self._play_grades_api,
+            standings_api=self._standings_api,
+            rivalry_api=self._rivalry_api,
+        )
+        self._player_names_cache.update(self._week_data.player_names)
+        return self._week_data
+
+    def clear_week_data(self) -> None:
+        """Drop preloaded week data (e.g. before more games are played)."""
+        self._week_data = None
+
+    def close(self) -> None:
+        """Close the generator's database connection."""
+        self._week_data = None
+        self._db.close()
+
+    def _week_data_for(self, game_id: Optional[str]) -> Optional[HeadlineWeekData]:
+        """Preloaded data covering a game, if any."""
+        week_data = self._week_data
+        if week_data is not None and game_id in week_data.game_ids:
+            return week_data
+        return None
+
     # =========================================================================
     # Main Generation Methods
     # =========================================================================
@@ -3101,10 +3168,7 @@ class HeadlineGenerator:
             playoff_template_pool = PLAYOFF_TEMPLATES[playoff_round].get(event_type, [])
 
             # Filter by conditions
-            matching = []
-            for template in playoff_template_pool:
-                if self._template_matches(template, event_data):
-                    matching.append(template)
+            matching = TemplateIndex.for_pool(playoff_template_pool).match(event_data)
 
             # If we found playoff templates, use those exclusively
             if matching:
@@ -3116,20 +3180,19 @@ class HeadlineGenerator:
 
         # Get base templates for this headline type (regular season)
         all_templates = self._templates.get(event_type, [])
-        matching = []
-
-        for template in all_templates:
-            if self._template_matches(template, event_data):
-                matching.append(template)
-
-        return matching
+        return TemplateIndex.for_pool(all_templates).match(event_data)
 
     def _template_matches(
         self,
         template: HeadlineTemplate,
         event_data: Dict[str, Any]
     ) -> bool:
-        """Check if event data matches template conditions."""
+        """
+        Check if event data matches template conditions.
+
+        Reference semantics for TemplateIndex, which _get_matching_templates
+        uses to match whole pools at once.
+        """
         if not template.conditions:
             return True  # No conditions = always matches
 
@@ -3413,37 +3476,16 @@ class HeadlineGenerator:
         enriched["team_ids"] = team_ids
 
         # Add team records from standings (for subheadlines)
-        try:
-            from ..database.standings_api import StandingsAPI
-            from ..database.connection import GameCycleDatabase
-
-            gc_db = GameCycleDatabase(self._db_path)
-            try:
-                standings_api = StandingsAPI(gc_db)
-
-                if winner_id:
-                    winner_standing = standings_api.get_team_standing(
-                        self._dynasty_id, self._season, winner_id
+        week_data = self._week_data_for(game_data.get("game_id"))
+        if week_data is not None and week_data.standings is not None:
+            for prefix, team_id, default in (("winner", winner_id, "1-0"), ("loser", loser_id, "0-1")):
+                if team_id:
+                    standing = week_data.standing(team_id)
+                    enriched[f"{prefix}_record"] = (
+                        f"{standing.wins}-{standing.losses}" if standing else default
                     )
-                    if winner_standing:
-                        enriched["winner_record"] = f"{winner_standing.wins}-{winner_standing.losses}"
-                    else:
-                        enriched["winner_record"] = "1-0"
-
-                if loser_id:
-                    loser_standing = standings_api.get_team_standing(
-                        self._dynasty_id, self._season, loser_id
-                    )
-                    if loser_standing:
-                        enriched["loser_record"] = f"{loser_standing.wins}-{loser_standing.losses}"
-                    else:
-                        enriched["loser_record"] = "0-1"
-            finally:
-                gc_db.close()
-        except Exception as e:
-            self._logger.warning(f"Could not fetch standings for records: {e}")
-            enriched["winner_record"] = "N/A"
-            enriched["loser_record"] = "N/A"
+        else:
+            self._add_team_records(enriched, winner_id, loser_id)
 
         # Add player data for player-focused headlines
         game_id = game_data.get("game_id")
@@ -3583,6 +3625,45 @@ class HeadlineGenerator:
 
         return enriched
 
+    def _add_team_records(
+        self,
+        enriched: Dict[str, Any],
+        winner_id: Optional[int],
+        loser_id: Optional[int]
+    ) -> None:
+        """Add winner/loser records by querying standings (no preloaded week)."""
+        try:
+            from ..database.standings_api import StandingsAPI
+            from ..database.connection import GameCycleDatabase
+
+            gc_db = GameCycleDatabase(self._db_path)
+            try:
+                standings_api = StandingsAPI(gc_db)
+
+                if winner_id:
+                    winner_standing = standings_api.get_team_standing(
+                        self._dynasty_id, self._season, winner_id
+                    )
+                    if winner_standing:
+                        enriched["winner_record"] = f"{winner_standing.wins}-{winner_standing.losses}"
+                    else:
+                        enriched["winner_record"] = "1-0"
+
+                if loser_id:
+                    loser_standing = standings_api.get_team_standing(
+                        self._dynasty_id, self._season, loser_id
+                    )
+                    if loser_standing:
+                        enriched["loser_record"] = f"{loser_standing.wins}-{loser_standing.losses}"
+                    else:
+                        enriched["loser_record"] = "0-1"
+            finally:
+                gc_db.close()
+        except Exception as e:
+            self._logger.warning(f"Could not fetch standings for records: {e}")
+            enriched["winner_record"] = "N/A"
+            enriched["loser_record"] = "N/A"
+
     # =========================================================================
     # Priority Calculation
     # =========================================================================
@@ -3681,6 +3762,8 @@ class HeadlineGenerator:
         2. Partial data (Quick sim with box): No PlayGrades
         3. Minimal data (Quick sim basic): Only basic game info
 
+        Reads preloaded week data when the game is covered by preload_week().
+
         Args:
             game_id: Game identifier
             winner_id: Winning team ID
@@ -3700,12 +3783,16 @@ class HeadlineGenerator:
             "loser_standing": None,
             "rivalry": None,
         }
+        week_data = self._week_data_for(game_id)
 
         # Try to get box scores
         try:
-            box_scores = self._box_scores_api.get_game_box_scores(
-                self._dynasty_id, game_id
-            )
+            if week_data is not None and week_data.box_scores is not None:
+                box_scores = week_data.box_scores.get(game_id, [])
+            else:
+                box_scores = self._box_scores_api.get_game_box_scores(
+                    self._dynasty_id, game_id
+                )
             if box_scores:
                 recap_data["box_scores"] = box_scores
                 recap_data["has_box_scores"] = True
@@ -3720,9 +3807,12 @@ class HeadlineGenerator:
 
         # Try to get game grades (player performance)
         try:
-            game_grades = self._analytics_api.get_game_grades(
-                self._dynasty_id, game_id
-            )
+            if week_data is not None and week_data.game_grades is not None:
+                game_grades = week_data.game_grades.get(game_id, [])
+            else:
+                game_grades = self._analytics_api.get_game_grades(
+                    self._dynasty_id, game_id
+                )
             if game_grades:
                 recap_data["game_grades"] = game_grades
                 recap_data["has_game_grades"] = True
@@ -3738,9 +3828,12 @@ class HeadlineGenerator:
 
         # Try to get play grades (for turning point)
         try:
-            play_grades = self._play_grades_api.get_game_play_grades(
-                self._dynasty_id, game_id
-            )
+            if week_data is not None and week_data.play_grades is not None:
+                play_grades = week_data.play_grades.get(game_id, [])
+            else:
+                play_grades = self._play_grades_api.get_game_play_grades(
+                    self._dynasty_id, game_id
+                )
             if play_grades:
                 recap_data["play_grades"] = play_grades
                 recap_data["has_play_grades"] = True
@@ -3749,12 +3842,16 @@ class HeadlineGenerator:
 
         # Get standings for playoff implications
         try:
-            winner_standing = self._standings_api.get_team_standing(
-                self._dynasty_id, self._season, winner_id
-            )
-            loser_standing = self._standings_api.get_team_standing(
-                self._dynasty_id, self._season, loser_id
-            )
+            if week_data is not None and week_data.standings is not None:
+                winner_standing = week_data.standing(winner_id)
+                loser_standing = week_data.standing(loser_id)
+            else:
+                winner_standing = self._standings_api.get_team_standing(
+                    self._dynasty_id, self._season, winner_id
+                )
+                loser_standing = self._standings_api.get_team_standing(
+                    self._dynasty_id, self._season, loser_id
+                )
             recap_data["winner_standing"] = winner_standing
             recap_data["loser_standing"] = loser_standing
         except Exception as e:
@@ -3762,9 +3859,12 @@ class HeadlineGenerator:
 
         # Check for rivalry
         try:
-            rivalry = self._rivalry_api.get_rivalry_between_teams(
-                self._dynasty_id, winner_id, loser_id
-            )
+            if week_data is not None and week_data.rivalries is not None:
+                rivalry = week_data.rivalry(winner_id, loser_id)
+            else:
+                rivalry = self._rivalry_api.get_rivalry_between_teams(
+                    self._dynasty_id, winner_id, loser_id
+                )
             recap_data["rivalry"] = rivalry
         except Exception as e:
             self._logger.debug(f"Could not get rivalry info: {e}")
@@ -3951,68 +4051,35 @@ class HeadlineGenerator:
             List of player dicts with name, position, and stats
         """
         try:
-            conn = self._db.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT
-                    player_id,
-                    player_name,
-                    position,
-                    passing_yards,
-                    passing_tds,
-                    passing_completions,
-                    passing_attempts,
-                    passing_interceptions,
-                    rushing_yards,
-                    rushing_tds,
-                    rushing_attempts,
-                    receiving_yards,
-                    receiving_tds,
-                    receptions,
-                    targets,
-                    tackles_total,
-                    tackles_for_loss,
-                    sacks,
-                    interceptions,
-                    forced_fumbles,
-                    passes_defended
-                FROM player_game_stats
-                WHERE dynasty_id = ? AND game_id = ? AND team_id = ?
-            """, (self._dynasty_id, game_id, team_id))
+            week_data = self._week_data_for(game_id)
+            if week_data is not None and week_data.player_stats is not None:
+                rows = week_data.player_rows(game_id, team_id)
+            else:
+                conn = self._db.get_connection()
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    SELECT player_id, player_name, position, {", ".join(TOP_PLAYER_STAT_COLUMNS)}
+                    FROM player_game_stats
+                    WHERE dynasty_id = ? AND game_id = ? AND team_id = ?
+                """, (self._dynasty_id, game_id, team_id))
+                columns = [d[0] for d in cursor.description]
+                rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
 
-            rows = cursor.fetchall()
             players = []
 
             for row in rows:
-                player_id = row[0]
-                player_name = row[1] or self._get_player_name(int(player_id) if player_id else 0)
-                position = row[2] or "Unknown"
+                player_id = row["player_id"]
+                player_name = row["player_name"] or self._get_player_name(int(player_id) if player_id else 0)
+                position = row["position"] or "Unknown"
 
                 # Build stats dict for impact calculation and output
                 player_stats = {
                     "player_id": player_id,
                     "player_name": player_name,
                     "position": position,
-                    "passing_yards": row[3] or 0,
-                    "passing_tds": row[4] or 0,
-                    "passing_completions": row[5] or 0,
-                    "passing_attempts": row[6] or 0,
-                    "passing_interceptions": row[7] or 0,
-                    "rushing_yards": row[8] or 0,
-                    "rushing_tds": row[9] or 0,
-                    "rushing_attempts": row[10] or 0,
-                    "receiving_yards": row[11] or 0,
-                    "receiving_tds": row[12] or 0,
-                    "receptions": row[13] or 0,
-                    "targets": row[14] or 0,
-                    "tackles_total": row[15] or 0,
-                    "tackles_for_loss": row[16] or 0,
-                    "sacks": row[17] or 0,
-                    "interceptions": row[18] or 0,
-                    "forced_fumbles": row[19] or 0,
-                    "passes_defended": row[20] or 0,
                 }
+                for column in TOP_PLAYER_STAT_COLUMNS:
+                    player_stats[column] = row[column] or 0
 
                 # Calculate impact using configurable weights
                 impact = self._calculate_player_impact(player_stats)
@@ -4048,10 +4115,15 @@ class HeadlineGenerator:
             Dict with player name, position, and defensive stats, or None
         """
         try:
+            week_data = self._week_data_for(game_id)
+            if week_data is not None and week_data.player_stats is not None:
+                return self._top_defender_from_rows(week_data.player_rows(game_id, team_id))
+
             conn = self._db.get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
+            positions = ", ".join(f"'{p}'" for p in TOP_DEFENDER_POSITIONS)
+            cursor.execute(f"""
                 SELECT
                     player_id,
                     player_name,
@@ -4065,9 +4137,7 @@ class HeadlineGenerator:
                     qb_hits
                 FROM player_game_stats
                 WHERE dynasty_id = ? AND game_id = ? AND team_id = ?
-                  AND position IN ('LB', 'MLB', 'OLB', 'LOLB', 'ROLB',
-                                   'DE', 'DT', 'LE', 'RE', 'EDGE',
-                                   'CB', 'FS', 'SS', 'S', 'DB')
+                  AND position IN ({positions})
                 ORDER BY
                     (COALESCE(interceptions, 0) * 5) +
                     (COALESCE(sacks, 0) * 3) +
@@ -4096,6 +4166,36 @@ class HeadlineGenerator:
             self._logger.warning(f"Error getting top defender: {e}")
             return None
 
+    @staticmethod
+    def _top_defender_from_rows(rows: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """In-memory version of _get_top_defensive_player's ranking query."""
+        best, best_score = None, None
+        for row in rows:
+            if row["position"] not in TOP_DEFENDER_POSITIONS:
+                continue
+            score = (
+                (row["interceptions"] or 0) * 5
+                + (row["sacks"] or 0) * 3
+                + (row["forced_fumbles"] or 0) * 3
+                + (row["tackles_total"] or 0) * 0.5
+                + (row["passes_defended"] or 0) * 1
+            )
+            if best_score is None or score > best_score:
+                best, best_score = row, score
+        if best is None:
+            return None
+        return {
+            "player_name": best["player_name"] or f"Player #{best['player_id']}",
+            "position": best["position"] or "DEF",
+            "tackles_total": best["tackles_total"] or 0,
+            "sacks": best["sacks"] or 0,
+            "interceptions": best["interceptions"] or 0,
+            "forced_fumbles": best["forced_fumbles"] or 0,
+            "passes_defended": best["passes_defended"] or 0,
+            "tackles_for_loss": best["tackles_for_loss"] or 0,
+            "qb_hits": best["qb_hits"] or 0,
+        }
+
     def _format_player_stat_line(self, player: Dict[str, Any]) -> str:
         """
         Format a player's stats into a readable stat line.
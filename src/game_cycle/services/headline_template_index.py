@@ -0,0 +1,216 @@
+"""
+Headline Template Index - Precompiled condition matching for headline templates.
+
+HeadlineGenerator._get_matching_templates used to walk every template of a
+headline type and evaluate its conditions dict through _template_matches,
+re-parsing "_min"/"_max" key suffixes for every template, every game and
+every headline type.
+
+TemplateIndex compiles a template pool once:
+
+- conditions are split into exact, minimum and maximum checks per field
+- exact checks become value -> bitset of templates requiring that value
+- range checks become sorted thresholds with cumulative bitsets, so one
+  bisect per field gives every template whose threshold is satisfied
+- templates without a check on a field are in that field's "free" bitset
+
+Matching intersects one bitset per constrained field and returns the
+surviving templates in pool order, exactly the list the linear scan would
+build.
+
+Usage:
+    index = TemplateIndex.for_pool(BLOWOUT_TEMPLATES)
+    matching = index.match(event_data)
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_EXACT = "exact"
+_MIN = "min"
+_MAX = "max"
+
+# id(pool) -> (pool, index); the pool reference keeps its id from being reused
+_INDEX_CACHE: Dict[int, Tuple[Sequence[Any], "TemplateIndex"]] = {}
+
+
+def _parse_condition(key: str) -> Tuple[str, str]:
+    """Split a condition key into (field, kind) the way _template_matches does."""
+    if key.endswith("_min"):
+        return key[:-4], _MIN
+    if key.endswith("_max"):
+        return key[:-4], _MAX
+    return key, _EXACT
+
+
+def condition_holds(kind: str, expected: Any, actual: Any) -> bool:
+    """Single condition check with HeadlineGenerator._template_matches semantics."""
+    if kind == _MIN:
+        return actual is not None and not actual < expected
+    if kind == _MAX:
+        return actual is not None and not actual > expected
+    return actual == expected
+
+
+class _FieldCheck:
+    """Compiled checks of one kind on one event field."""
+
+    def __init__(self, field_name: str, kind: str, all_bits: int):
+        self.field = field_name
+        self.kind = kind
+        self.free = all_bits  # Templates without this check
+        self.required: List[Tuple[int, Any]] = []  # (template position, expected)
+
+        self._values: Dict[Any, int] = {}
+        self._thresholds: List[Any] = []
+        self._cumulative: List[int] = []
+        self._linear = False
+
+    def add(self, position: int, expected: Any) -> None:
+        self.free &= ~(1 << position)
+        self.required.append((position, expected))
+
+    def compile(self) -> None:
+        if self.kind == _EXACT:
+            try:
+                for position, expected in self.required:
+                    self._values[expected] = self._values.get(expected, 0) | (1 << position)
+            except TypeError:  # Unhashable expected value
+                self._linear = True
+            return
+
+        by_threshold: Dict[Any, int] = {}
+        try:
+            for position, expected in self.required:
+                by_threshold[expected] = by_threshold.get(expected, 0) | (1 << position)
+            thresholds = sorted(by_threshold)
+        except TypeError:  # Unhashable or mutually incomparable thresholds
+            self._linear = True
+            return
+
+        # Minimums accumulate upwards (value >= threshold), maximums downwards
+        ordered = thresholds if self.kind == _MIN else thresholds[::-1]
+        cumulative, bits = [], 0
+        for threshold in ordered:
+            bits |= by_threshold[threshold]
+            cumulative.append(bits)
+        self._thresholds = thresholds
+        self._cumulative = cumulative if self.kind == _MIN else cumulative[::-1]
+
+    def passing(self, event_data: Dict[str, Any]) -> int:
+        """Bitset of templates this field's checks allow."""
+        actual = event_data.get(self.field)
+        if self._linear:
+            return self._passing_linear(actual)
+
+        if self.kind == _EXACT:
+            try:
+                return self.free | self._values.get(actual, 0)
+            except TypeError:  # Unhashable actual value
+                return self._passing_linear(actual)
+
+        if actual is None:
+            return self.free
+        try:
+            if self.kind == _MIN:
+                count = bisect_right(self._thresholds, actual)
+                return self.free | (self._cumulative[count - 1] if count else 0)
+            start = bisect_left(self._thresholds, actual)
+            return self.free | (self._cumulative[start] if start < len(self._thresholds) else 0)
+        except TypeError:
+            return self._passing_linear(actual)
+
+    def _passing_linear(self, actual: Any) -> int:
+        bits = self.free
+        for position, expected in self.required:
+            if condition_holds(self.kind, expected, actual):
+                bits |= 1 << position
+        return bits
+
+
+class TemplateIndex:
+    """
+    Compiled conditions of one template pool.
+
+    match() returns the same templates, in the same order, as evaluating
+    HeadlineGenerator._template_matches against every template in the pool.
+    """
+
+    def __init__(self, templates: Sequence[Any]):
+        """
+        Compile a template pool.
+
+        Args:
+            templates: HeadlineTemplate objects (anything with .conditions)
+        """
+        self.templates = list(templates)
+        self.all_bits = (1 << len(self.templates)) - 1
+
+        checks: Dict[Tuple[str, str], _FieldCheck] = {}
+        for position, template in enumerate(self.templates):
+            for key, expected in (template.conditions or {}).items():
+                field_name, kind = _parse_condition(key)
+                check = checks.get((field_name, kind))
+                if check is None:
+                    check = checks[(field_name, kind)] = _FieldCheck(field_name, kind, self.all_bits)
+                check.add(position, expected)
+        for check in checks.values():
+            check.compile()
+
+        # Most selective checks first so the candidate set empties early
+        self._checks = sorted(checks.values(), key=lambda c: bin(c.free).count("1"))
+
+    @classmethod
+    def for_pool(cls, templates: Sequence[Any]) -> "TemplateIndex":
+        """
+        Shared index for a module-level template pool, compiled on first use.
+
+        Args:
+            templates: Template list (indexed by identity)
+
+        Returns:
+            TemplateIndex for the pool
+        """
+        cached = _INDEX_CACHE.get(id(templates))
+        if cached is not None and cached[0] is templates and len(cached[1].templates) == len(templates):
+            return cached[1]
+        index = cls(templates)
+        _INDEX_CACHE[id(templates)] = (templates, index)
+        return index
+
+    def candidates(self, event_data: Dict[str, Any]) -> int:
+        """Bitset of matching template positions."""
+        bits = self.all_bits
+        for check in self._checks:
+            bits &= check.passing(event_data)
+            if not bits:
+                break
+        return bits
+
+    def match(self, event_data: Dict[str, Any]) -> List[Any]:
+        """
+        Templates whose conditions all hold for the event.
+
+        Args:
+            event_data: Event fields
+
+        Returns:
+            Matching templates in pool order
+        """
+        bits = self.candidates(event_data)
+        if bits == self.all_bits:
+            return list(self.templates)
+        matching = []
+        while bits:
+            low = bits & -bits
+            matching.append(self.templates[low.bit_length() - 1])
+            bits ^= low
+        return matching
+
+
+def clear_template_indexes(templates: Optional[Sequence[Any]] = None) -> None:
+    """Drop compiled indexes (all, or one pool's after editing it in place)."""
+    if templates is None:
+        _INDEX_CACHE.clear()
+    else:
+        _INDEX_CACHE.pop(id(templates), None)
@@ -0,0 +1,203 @@
+"""
+Headline Week Data - Bulk loading of everything game headlines read.
+
+HeadlineGenerator used to query per game and per team while writing a
+week's recaps: player_game_stats once per top-player or top-defender
+lookup (several times per game), players once per uncached name, box
+scores, game grades, play grades, two standings rows and a rivalry row
+per game, plus a fresh database connection per game for records.
+
+HeadlineWeekData loads all of it for the week's games up front:
+
+- player_game_stats rows for every game, grouped by (game_id, team_id)
+- names of every player whose stat row has no player_name
+- box scores, game grades and play grades for every game
+- the season's standings and the dynasty's rivalries
+
+Each category is fetched with one query. A category that fails to load is
+left as None so HeadlineGenerator falls back to its per-game queries.
+
+Usage:
+    week_data = HeadlineWeekData.load(db, dynasty_id, season, game_ids, ...)
+    rows = week_data.player_rows(game_id, team_id)
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Stat columns read by the top player ranking
+TOP_PLAYER_STAT_COLUMNS = (
+    "passing_yards",
+    "passing_tds",
+    "passing_completions",
+    "passing_attempts",
+    "passing_interceptions",
+    "rushing_yards",
+    "rushing_tds",
+    "rushing_attempts",
+    "receiving_yards",
+    "receiving_tds",
+    "receptions",
+    "targets",
+    "tackles_total",
+    "tackles_for_loss",
+    "sacks",
+    "interceptions",
+    "forced_fumbles",
+    "passes_defended",
+)
+
+# Plus the extra column the top defender lookup reports
+PLAYER_STAT_COLUMNS = TOP_PLAYER_STAT_COLUMNS + ("qb_hits",)
+
+
+class HeadlineWeekData:
+    """
+    Preloaded recap data for one week's games.
+
+    Attributes set to None were not loaded; callers query per game instead.
+    """
+
+    def __init__(self, game_ids: Sequence[str]):
+        self.game_ids = frozenset(game_ids)
+        self.player_stats: Optional[Dict[Tuple[str, int], List[Dict[str, Any]]]] = None
+        self.player_names: Dict[int, str] = {}
+        self.box_scores: Optional[Dict[str, List[Any]]] = None
+        self.game_grades: Optional[Dict[str, List[Any]]] = None
+        self.play_grades: Optional[Dict[str, List[Any]]] = None
+        self.standings: Optional[Dict[int, Any]] = None
+        self.rivalries: Optional[Dict[Tuple[int, int], Any]] = None
+
+    @classmethod
+    def load(
+        cls,
+        db: Any,
+        dynasty_id: str,
+        season: int,
+        game_ids: Sequence[str],
+        box_scores_api: Any = None,
+        analytics_api: Any = None,
+        play_grades_api: Any = None,
+        standings_api: Any = None,
+        rivalry_api: Any = None
+    ) -> "HeadlineWeekData":
+        """
+        Load a week's recap data.
+
+        Args:
+            db: GameCycleDatabase for player stats and names
+            dynasty_id: Dynasty identifier
+            season: Season year (for standings)
+            game_ids: The week's game IDs
+            box_scores_api: BoxScoresAPI (box scores skipped if None)
+            analytics_api: AnalyticsAPI (game grades skipped if None)
+            play_grades_api: PlayGradesAPI (play grades skipped if None)
+            standings_api: StandingsAPI (standings skipped if None)
+            rivalry_api: RivalryAPI (rivalries skipped if None)
+
+        Returns:
+            HeadlineWeekData for the games
+        """
+        game_ids = [g for g in dict.fromkeys(game_ids) if g]
+        data = cls(game_ids)
+        if not game_ids:
+            return data
+
+        try:
+            data._load_player_stats(db, dynasty_id, game_ids)
+        except Exception as e:
+            logger.debug(f"Could not preload player stats: {e}")
+            data.player_stats = None
+
+        if box_scores_api is not None:
+            try:
+                data.box_scores = box_scores_api.get_box_scores_for_games(dynasty_id, game_ids)
+            except Exception as e:
+                logger.debug(f"Could not preload box scores: {e}")
+
+        if analytics_api is not None:
+            try:
+                data.game_grades = analytics_api.get_game_grades_for_games(dynasty_id, game_ids)
+            except Exception as e:
+                logger.debug(f"Could not preload game grades: {e}")
+
+        if play_grades_api is not None:
+            try:
+                data.play_grades = play_grades_api.get_play_grades_for_games(dynasty_id, game_ids)
+            except Exception as e:
+                logger.debug(f"Could not preload play grades: {e}")
+
+        if standings_api is not None:
+            try:
+                data.standings = {
+                    s.team_id: s for s in standings_api.get_standings(dynasty_id, season)
+                }
+            except Exception as e:
+                logger.debug(f"Could not preload standings: {e}")
+
+        if rivalry_api is not None:
+            try:
+                data.rivalries = {
+                    (r.team_a_id, r.team_b_id): r for r in rivalry_api.get_all_rivalries(dynasty_id)
+                }
+            except Exception as e:
+                logger.debug(f"Could not preload rivalries: {e}")
+
+        return data
+
+    def _load_player_stats(self, db: Any, dynasty_id: str, game_ids: List[str]) -> None:
+        """Stat rows for every game (in insertion order) and missing player names."""
+        placeholders = ",".join("?" * len(game_ids))
+        conn = db.get_connection()
+        cursor = conn.execute(
+            f"""
+            SELECT game_id, team_id, player_id, player_name, position,
+                   {", ".join(PLAYER_STAT_COLUMNS)}
+            FROM player_game_stats
+            WHERE dynasty_id = ? AND game_id IN ({placeholders})
+            ORDER BY id
+            """,
+            (dynasty_id, *game_ids)
+        )
+        columns = [d[0] for d in cursor.description]
+
+        player_stats: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+        unnamed = set()
+        for row in cursor.fetchall():
+            record = dict(zip(columns, row))
+            player_stats.setdefault((record["game_id"], record["team_id"]), []).append(record)
+            if not record["player_name"] and record["player_id"]:
+                unnamed.add(int(record["player_id"]))
+        self.player_stats = player_stats
+
+        if unnamed:
+            ids = sorted(unnamed)
+            rows = conn.execute(
+                f"""
+                SELECT player_id, first_name, last_name
+                FROM players
+                WHERE dynasty_id = ? AND player_id IN ({",".join("?" * len(ids))})
+                """,
+                (dynasty_id, *ids)
+            ).fetchall()
+            for player_id, first_name, last_name in rows:
+                full_name = f"{first_name or ''} {last_name or ''}".strip()
+                if full_name:
+                    self.player_names[int(player_id)] = full_name
+
+    # -------------------- Lookups --------------------
+
+    def player_rows(self, game_id: str, team_id: int) -> List[Dict[str, Any]]:
+        """Stat rows for one team in one game."""
+        return (self.player_stats or {}).get((game_id, team_id), [])
+
+    def standing(self, team_id: int) -> Any:
+        """Team standing, or None."""
+        return (self.standings or {}).get(team_id)
+
+    def rivalry(self, team_id_1: int, team_id_2: int) -> Any:
+        """Rivalry between two teams, or None."""
+        key = (min(team_id_1, team_id_2), max(team_id_1, team_id_2))
+        return (self.rivalries or {}).get(key)
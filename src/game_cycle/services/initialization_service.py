@@ -130,6 +130,10 @@ class GameCycleInitializer:
             # Commit all changes
             conn.commit()
 
+            # Fresh rosters - drop anything cached under this dynasty ID
+            from team_management.team_data_cache import invalidate_team_data
+            invalidate_team_data(self._dynasty_id)
+
             # 6. Generate draft class for current year (AFTER commit so DraftClassAPI has data)
             self._generate_initial_draft_class()
 
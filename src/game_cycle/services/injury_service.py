@@ -38,6 +38,15 @@ class InjuryService:
     IR_MINIMUM_GAMES = 4
     IR_RETURN_SLOTS_PER_SEASON = 8
 
+    INSERT_INJURY_SQL = """
+        INSERT INTO player_injuries (
+            dynasty_id, player_id, season, week_occurred,
+            injury_type, body_part, severity,
+            estimated_weeks_out, occurred_during, game_id,
+            play_description, is_active
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str, dynasty_id: str, season: int):
         """
         Initialize InjuryService.
@@ -74,54 +83,12 @@ class InjuryService:
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")  # Better concurrency
         try:
-            db_dict = injury.to_db_dict()
-            cursor = conn.execute("""
-                INSERT INTO player_injuries (
-                    dynasty_id, player_id, season, week_occurred,
-                    injury_type, body_part, severity,
-                    estimated_weeks_out, occurred_during, game_id,
-                    play_description, is_active
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                self._dynasty_id,
-                db_dict['player_id'],
-                db_dict['season'],
-                db_dict['week_occurred'],
-                db_dict['injury_type'],
-                db_dict['body_part'],
-                db_dict['severity'],
-                db_dict['estimated_weeks_out'],
-                db_dict['occurred_during'],
-                db_dict.get('game_id'),
-                db_dict.get('play_description'),
-                1  # is_active = True
-            ))
+            cursor = conn.execute(self.INSERT_INJURY_SQL, self.injury_values(injury))
             conn.commit()
             injury_id = cursor.lastrowid
+            self._invalidate_team_data(injury.team_id)
 
-            # Log transaction (optional - may fail if using separate database)
-            try:
-                self._transaction_logger.log_transaction(
-                    dynasty_id=self._dynasty_id,
-                    season=self._season,
-                    transaction_type="INJURY",
-                    player_id=injury.player_id,
-                    player_name=injury.player_name,
-                    position=None,
-                    from_team_id=injury.team_id,
-                    to_team_id=injury.team_id,
-                    transaction_date=date.today(),
-                    details={
-                        'injury_type': injury.injury_type.value,
-                        'body_part': injury.body_part.value,
-                        'severity': injury.severity.value,
-                        'weeks_out': injury.weeks_out,
-                        'occurred_during': injury.occurred_during
-                    }
-                )
-            except Exception as tx_error:
-                # Transaction logging is optional - don't fail core functionality
-                self._logger.warning(f"Could not log injury transaction: {tx_error}")
+            self.log_injury_transaction(injury)
 
             self._logger.info(
                 f"Recorded injury: {injury.player_name} - "
@@ -137,6 +104,76 @@ class InjuryService:
         finally:
             conn.close()
 
+    def injury_values(self, injury: Injury) -> tuple:
+        """
+        Build the INSERT_INJURY_SQL parameters for a new (active) injury.
+
+        Args:
+            injury: Injury dataclass instance
+
+        Returns:
+            Parameter tuple in column order
+        """
+        db_dict = injury.to_db_dict()
+        return (
+            self._dynasty_id,
+            db_dict['player_id'],
+            db_dict['season'],
+            db_dict['week_occurred'],
+            db_dict['injury_type'],
+            db_dict['body_part'],
+            db_dict['severity'],
+            db_dict['estimated_weeks_out'],
+            db_dict['occurred_during'],
+            db_dict.get('game_id'),
+            db_dict.get('play_description'),
+            1  # is_active = True
+        )
+
+    def log_injury_transaction(self, injury: Injury) -> None:
+        """
+        Log an injury to the transaction history.
+
+        Transaction logging is optional (it may fail when the transactions
+        table lives in a separate database), so errors are only logged.
+
+        Args:
+            injury: Recorded injury
+        """
+        try:
+            self._transaction_logger.log_transaction(
+                dynasty_id=self._dynasty_id,
+                season=self._season,
+                transaction_type="INJURY",
+                player_id=injury.player_id,
+                player_name=injury.player_name,
+                position=None,
+                from_team_id=injury.team_id,
+                to_team_id=injury.team_id,
+                transaction_date=date.today(),
+                details={
+                    'injury_type': injury.injury_type.value,
+                    'body_part': injury.body_part.value,
+                    'severity': injury.severity.value,
+                    'weeks_out': injury.weeks_out,
+                    'occurred_during': injury.occurred_during
+                }
+            )
+        except Exception as tx_error:
+            # Transaction logging is optional - don't fail core functionality
+            self._logger.warning(f"Could not log injury transaction: {tx_error}")
+
+    def _invalidate_team_data(self, team_id: Optional[int] = None) -> None:
+        """
+        Drop cached simulation rosters after an injury or IR move.
+
+        Args:
+            team_id: Affected team (None when unknown)
+        """
+        from team_management.team_data_cache import invalidate_team_data
+
+        invalidate_team_data(self._dynasty_id, team_id)
+
     def get_active_injuries(self, team_id: Optional[int] = None) -> List[Injury]:
         """
         Get all active injuries, optionally filtered by team.
@@ -260,6 +297,7 @@ class InjuryService:
                     WHERE injury_id = ? AND dynasty_id = ?
                 """, (injury_id, self._dynasty_id))
             conn.commit()
+            self._invalidate_team_data()
             self._logger.info(f"Cleared injury {injury_id}")
         except Exception as e:
             conn.rollback()
@@ -553,6 +591,7 @@ class InjuryService:
             """, (self._dynasty_id, player_id))
 
             conn.commit()
+            self._invalidate_team_data(injury.team_id)
 
             # 4. Log transaction
             try:
@@ -707,6 +746,7 @@ class InjuryService:
             # Only commit if we own the connection
             if owns_connection:
                 conn.commit()
+            self._invalidate_team_data(team_id)
 
             # 7. Log transaction (defer if in batch mode to avoid lock conflicts)
             transaction_log_data = {
@@ -1384,6 +1424,7 @@ class InjuryService:
 
             # If we got here, all operations succeeded
             conn.commit()
+            self._invalidate_team_data(team_id)
 
             # Log deferred transactions now that commit succeeded
             for tx_data in pending_transaction_logs:
@@ -0,0 +1,549 @@
+"""
+Instant Score Model - Rating-aware scores for INSTANT simulation.
+
+generate_instant_result() draws both scores from fixed randint ranges and
+ignores the teams playing, so INSTANT seasons had no relationship to roster
+strength and FULL mode was the only way to get meaningful standings.
+
+InstantScoreModel predicts each team's points from roster ratings:
+
+    points = league_points
+             + offense_weight * (offense - rating_baseline)
+             - defense_weight * (opponent defense - rating_baseline)
+             + home_field (home team only)
+
+- offense and defense ratings are the mean overall of each side's top
+  eleven players, read through the shared TeamDataCache, so the roster
+  transactions and injuries that invalidate the cache also refresh ratings
+- both scores of every game are drawn in one call from a bivariate normal
+  with the fitted spread and home/away correlation
+- scores snap to realistic NFL totals; playoff games and most tied regular
+  season games get an overtime winner
+
+ScoreModelCalibrator fits the parameters by least squares against
+FullGameSimulator games between the current rosters. Calibrations are
+stored per (dynasty, season) in the score_model_calibrations table and
+cached per database; seasons without one use DEFAULT_PARAMETERS. The
+headless runner calibrates each season at Week 1 with --calibrate-instant.
+
+Usage:
+    calibrate_score_model(db_path, dynasty_id, season, games=64)  # slow, optional
+    model = get_score_model(db_path, dynasty_id, season)
+    home_scores, away_scores = model.generate(home_ids, away_ids)
+"""
+
+import logging
+import os
+import random
+import sqlite3
+import threading
+from dataclasses import astuple, dataclass, fields
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from constants.position_abbreviations import get_position_abbreviation
+
+logger = logging.getLogger(__name__)
+
+STARTERS_PER_SIDE = 11
+OVERTIME_TIE_RATE = 0.05  # Share of tied regular season games left tied after OT
+CALIBRATION_WEEK = 0
+MIN_CALIBRATION_GAMES = 8
+
+# Most common NFL final scores (same set as _adjust_to_realistic_score)
+REALISTIC_SCORES = np.array([
+    0, 3, 6, 7, 9, 10, 12, 13, 14, 16, 17, 19, 20, 21, 23, 24,
+    26, 27, 28, 30, 31, 33, 34, 35, 37, 38, 40, 41, 42, 44, 45
+])
+
+
+@dataclass(frozen=True)
+class ScoreModelParameters:
+    """Points model parameters (fitted by ScoreModelCalibrator)."""
+
+    league_points: float      # Points for a baseline team on a neutral field
+    home_field: float         # Extra points for the home team
+    offense_weight: float     # Points per offense rating point above baseline
+    defense_weight: float     # Points allowed less per defense rating point
+    rating_baseline: float    # Rating of a league-average side
+    stdev: float              # Spread of each team's points around the prediction
+    correlation: float        # Correlation of home and away residuals
+    games: int = 0            # FULL games fitted (0 = defaults)
+
+
+DEFAULT_PARAMETERS = ScoreModelParameters(
+    league_points=21.5,
+    home_field=2.0,
+    offense_weight=1.0,
+    defense_weight=1.0,
+    rating_baseline=80.0,
+    stdev=9.5,
+    correlation=0.1,
+)
+
+
+def team_ratings_from_records(records: List[Dict[str, Any]]) -> Tuple[float, float]:
+    """
+    Offense and defense ratings of a roster.
+
+    Args:
+        records: Roster records (TeamRosterGenerator.load_roster_records)
+
+    Returns:
+        (offense, defense): mean overall of each side's top eleven players,
+        or the default baseline for a side with no players
+    """
+    from .awards.models import OFFENSIVE_POSITIONS, DEFENSIVE_POSITIONS
+
+    offense, defense = [], []
+    for record in records:
+        overall = record['ratings'].get('overall')
+        if not isinstance(overall, (int, float)):
+            continue
+        position = get_position_abbreviation(str(record['primary_position']))
+        if position in OFFENSIVE_POSITIONS:
+            offense.append(overall)
+        elif position in DEFENSIVE_POSITIONS:
+            defense.append(overall)
+
+    def side_rating(overalls: List[float]) -> float:
+        if not overalls:
+            return DEFAULT_PARAMETERS.rating_baseline
+        return float(np.mean(sorted(overalls, reverse=True)[:STARTERS_PER_SIDE]))
+
+    return side_rating(offense), side_rating(defense)
+
+
+def fit_parameters(
+    home_ratings: np.ndarray,
+    away_ratings: np.ndarray,
+    home_scores: np.ndarray,
+    away_scores: np.ndarray
+) -> ScoreModelParameters:
+    """
+    Fit the points model to simulated games by least squares.
+
+    Each game contributes one row per team:
+    points ~ league_points + offense_weight * offense - defense_weight * opponent defense
+    + home_field * is_home.
+
+    Args:
+        home_ratings: (games, 2) home offense and defense ratings
+        away_ratings: (games, 2) away offense and defense ratings
+        home_scores: Home points per game
+        away_scores: Away points per game
+
+    Returns:
+        Fitted ScoreModelParameters
+
+    Raises:
+        ValueError: If fewer than MIN_CALIBRATION_GAMES games are given
+    """
+    n = len(home_scores)
+    if n < MIN_CALIBRATION_GAMES:
+        raise ValueError(f"Need at least {MIN_CALIBRATION_GAMES} games to calibrate, got {n}")
+
+    home_ratings = np.asarray(home_ratings, dtype=float)
+    away_ratings = np.asarray(away_ratings, dtype=float)
+    baseline = float(np.concatenate([home_ratings, away_ratings]).mean())
+
+    offense = np.concatenate([home_ratings[:, 0], away_ratings[:, 0]]) - baseline
+    opponent_defense = np.concatenate([away_ratings[:, 1], home_ratings[:, 1]]) - baseline
+    is_home = np.concatenate([np.ones(n), np.zeros(n)])
+    points = np.concatenate([home_scores, away_scores]).astype(float)
+
+    design = np.column_stack([np.ones(2 * n), offense, -opponent_defense, is_home])
+    (league_points, offense_weight, defense_weight, home_field), *_ = np.linalg.lstsq(
+        design, points, rcond=None
+    )
+
+    residuals = points - design @ np.array([league_points, offense_weight, defense_weight, home_field])
+    home_residuals, away_residuals = residuals[:n], residuals[n:]
+    if home_residuals.std() > 0 and away_residuals.std() > 0:
+        correlation = float(np.corrcoef(home_residuals, away_residuals)[0, 1])
+    else:
+        correlation = 0.0
+
+    return ScoreModelParameters(
+        league_points=float(league_points),
+        home_field=float(home_field),
+        offense_weight=float(offense_weight),
+        defense_weight=float(defense_weight),
+        rating_baseline=baseline,
+        stdev=float(residuals.std()),
+        correlation=float(np.clip(correlation, -0.9, 0.9)),
+        games=n,
+    )
+
+
+class InstantScoreModel:
+    """
+    Generates correlated, rating-aware scores for any number of games.
+
+    Thread-safe: INSTANT games simulated on worker threads share one model.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        dynasty_id: str,
+        season: int,
+        parameters: ScoreModelParameters = DEFAULT_PARAMETERS,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize the model.
+
+        Args:
+            db_path: Path to the game cycle database
+            dynasty_id: Dynasty whose rosters are rated
+            season: Season being simulated
+            parameters: Points model parameters
+            seed: Seed for the numpy Generator. None seeds each generate()
+                call from the global random module, so random.seed() (and the
+                headless runner's --seed) reproduce INSTANT scores
+        """
+        self.db_path = db_path
+        self.dynasty_id = dynasty_id
+        self.season = season
+        self.parameters = parameters
+        self._rng = np.random.default_rng(seed) if seed is not None else None
+        self._ratings: Dict[int, Tuple[Any, Tuple[float, float]]] = {}
+        self._lock = threading.Lock()
+
+    def team_ratings(self, team_id: int) -> Tuple[float, float]:
+        """
+        Offense and defense ratings for a team.
+
+        Ratings are recomputed whenever TeamDataCache reloads the roster,
+        i.e. after invalidate_team_data() for that team.
+
+        Args:
+            team_id: Team ID (1-32)
+
+        Returns:
+            (offense, defense); the rating baseline when no roster can be loaded
+        """
+        from team_management.team_data_cache import get_team_data_cache
+
+        try:
+            records = get_team_data_cache(self.db_path, self.dynasty_id).get_roster_records(
+                team_id, self.season
+            )
+        except Exception as e:
+            logger.debug("No roster ratings for team %s: %s", team_id, e)
+            baseline = self.parameters.rating_baseline
+            return baseline, baseline
+
+        cached = self._ratings.get(team_id)
+        if cached is None or cached[0] is not records:
+            cached = (records, team_ratings_from_records(records))
+            self._ratings[team_id] = cached
+        return cached[1]
+
+    def expected_points(
+        self,
+        home_team_ids: Sequence[int],
+        away_team_ids: Sequence[int],
+        home_field: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predicted points for each game.
+
+        Args:
+            home_team_ids: Home team per game
+            away_team_ids: Away team per game
+            home_field: False for neutral site games
+
+        Returns:
+            (home_points, away_points) arrays
+        """
+        params = self.parameters
+        home_team_ids = [int(t) for t in home_team_ids]
+        away_team_ids = [int(t) for t in away_team_ids]
+        ratings = {t: self.team_ratings(t) for t in set(home_team_ids) | set(away_team_ids)}
+        home = np.array([ratings[t] for t in home_team_ids], dtype=float).reshape(-1, 2)
+        away = np.array([ratings[t] for t in away_team_ids], dtype=float).reshape(-1, 2)
+        home -= params.rating_baseline
+        away -= params.rating_baseline
+
+        home_points = (params.league_points + params.offense_weight * home[:, 0]
+                       - params.defense_weight * away[:, 1])
+        away_points = (params.league_points + params.offense_weight * away[:, 0]
+                       - params.defense_weight * home[:, 1])
+        if home_field:
+            home_points = home_points + params.home_field
+        return home_points, away_points
+
+    def generate(
+        self,
+        home_team_ids: Sequence[int],
+        away_team_ids: Sequence[int],
+        is_playoff: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate final scores for a batch of games.
+
+        Args:
+            home_team_ids: Home team per game
+            away_team_ids: Away team per game
+            is_playoff: Playoff games always have a winner
+
+        Returns:
+            (home_scores, away_scores) integer arrays
+        """
+        home_mean, away_mean = self.expected_points(home_team_ids, away_team_ids)
+        n = len(home_mean)
+        params = self.parameters
+        covariance = params.stdev ** 2 * np.array([[1.0, params.correlation],
+                                                   [params.correlation, 1.0]])
+
+        with self._lock:
+            rng = self._rng if self._rng is not None else np.random.default_rng(random.getrandbits(64))
+            noise = rng.multivariate_normal([0.0, 0.0], covariance, size=n)
+            overtime_rolls = rng.random(n)
+            tie_rolls = rng.random(n)
+
+        home_scores = self._snap(home_mean + noise[:, 0])
+        away_scores = self._snap(away_mean + noise[:, 1])
+
+        # Overtime: the favourite is more likely to score first
+        tied = home_scores == away_scores
+        if not is_playoff:
+            tied &= tie_rolls >= OVERTIME_TIE_RATE
+        home_share = home_mean / np.maximum(home_mean + away_mean, 1e-9)
+        home_wins_ot = overtime_rolls < np.clip(home_share, 0.0, 1.0)
+        home_scores = np.where(tied & home_wins_ot, home_scores + 3, home_scores)
+        away_scores = np.where(tied & ~home_wins_ot, away_scores + 3, away_scores)
+        return home_scores, away_scores
+
+    @staticmethod
+    def _snap(points: np.ndarray) -> np.ndarray:
+        """Nearest realistic score (lower one on a tie), never negative."""
+        distance = np.abs(np.rint(points)[:, None] - REALISTIC_SCORES[None, :])
+        return REALISTIC_SCORES[distance.argmin(axis=1)]
+
+
+class ScoreModelCalibrator:
+    """
+    Fits ScoreModelParameters to FullGameSimulator games.
+
+    Games are random pairings of the current rosters, simulated sequentially
+    with deterministic per-game RNGs and nothing written to the database.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        dynasty_id: str,
+        season: int,
+        simulate: Optional[Callable[[int, int, str], Tuple[int, int]]] = None
+    ):
+        """
+        Initialize the calibrator.
+
+        Args:
+            db_path: Path to the game cycle database
+            dynasty_id: Dynasty whose rosters are simulated
+            season: Season being calibrated
+            simulate: (home_id, away_id, game_id) -> (home_score, away_score);
+                defaults to a FullGameSimulator game
+        """
+        self.db_path = db_path
+        self.dynasty_id = dynasty_id
+        self.season = season
+        self._simulate = simulate or self._simulate_full_game
+
+    def calibrate(self, games: int = 64, seed: Optional[int] = None) -> ScoreModelParameters:
+        """
+        Simulate games and fit the points model.
+
+        Args:
+            games: Number of FULL games to simulate
+            seed: Seed for the pairings
+
+        Returns:
+            Fitted ScoreModelParameters
+        """
+        rng = np.random.default_rng(seed)
+        matchups: List[Tuple[int, int]] = []
+        while len(matchups) < games:
+            teams = rng.permutation(np.arange(1, 33))
+            matchups.extend(zip(teams[0::2].tolist(), teams[1::2].tolist()))
+        matchups = matchups[:games]
+
+        model = InstantScoreModel(self.db_path, self.dynasty_id, self.season)
+        home_scores, away_scores = [], []
+        for i, (home_id, away_id) in enumerate(matchups):
+            home_score, away_score = self._simulate(
+                home_id, away_id, f"calibration_{self.season}_{i}"
+            )
+            home_scores.append(home_score)
+            away_scores.append(away_score)
+
+        parameters = fit_parameters(
+            np.array([model.team_ratings(home_id) for home_id, _ in matchups]),
+            np.array([model.team_ratings(away_id) for _, away_id in matchups]),
+            np.array(home_scores),
+            np.array(away_scores),
+        )
+        logger.info(
+            "Calibrated instant score model for season %s from %d FULL games: %s",
+            self.season, len(matchups), parameters
+        )
+        return parameters
+
+    def _simulate_full_game(self, home_team_id: int, away_team_id: int, game_id: str) -> Tuple[int, int]:
+        """One FullGameSimulator game between the current rosters."""
+        from game_management.full_game_simulator import FullGameSimulator
+        from play_engine.core.rng import GameRNG
+        from team_management.team_data_cache import get_team_data_cache
+
+        team_data = get_team_data_cache(self.db_path, self.dynasty_id)
+        simulator = FullGameSimulator(
+            away_team_id=away_team_id,
+            home_team_id=home_team_id,
+            dynasty_id=self.dynasty_id,
+            db_path=self.db_path,
+            rng=GameRNG.for_game(self.dynasty_id, self.season, CALIBRATION_WEEK, game_id),
+            away_roster=team_data.get_roster(away_team_id, self.season),
+            home_roster=team_data.get_roster(home_team_id, self.season),
+            away_coaching_staff=team_data.get_coaching_staff(away_team_id, self.season),
+            home_coaching_staff=team_data.get_coaching_staff(home_team_id, self.season)
+        )
+        final_score = simulator.simulate_game().final_score
+        return final_score.get(home_team_id, 0), final_score.get(away_team_id, 0)
+
+
+# Calibrations per (db_path, dynasty_id, season) and one model per (db_path, dynasty_id)
+_calibrations: Dict[Tuple[str, str, int], ScoreModelParameters] = {}
+_models: Dict[Tuple[str, str], InstantScoreModel] = {}
+_models_lock = threading.Lock()
+
+
+_CALIBRATION_COLUMNS = tuple(f.name for f in fields(ScoreModelParameters))
+
+
+def _load_calibration(db_path: str, dynasty_id: str, season: int) -> Optional[ScoreModelParameters]:
+    """Read a stored calibration (None if there is none or no table yet)."""
+    if not os.path.exists(db_path):
+        return None
+    try:
+        with sqlite3.connect(db_path) as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(_CALIBRATION_COLUMNS)} FROM score_model_calibrations "
+                "WHERE dynasty_id = ? AND season = ?",
+                (dynasty_id, season)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.debug("No stored score model calibration: %s", e)
+        return None
+    return ScoreModelParameters(*row) if row else None
+
+
+def _save_calibration(db_path: str, dynasty_id: str, season: int, parameters: ScoreModelParameters) -> None:
+    """Store a calibration, replacing the season's previous one."""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(
+            f"INSERT OR REPLACE INTO score_model_calibrations "
+            f"(dynasty_id, season, {', '.join(_CALIBRATION_COLUMNS)}) "
+            f"VALUES (?, ?, {', '.join('?' * len(_CALIBRATION_COLUMNS))})",
+            (dynasty_id, season, *astuple(parameters))
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_score_model_calibration(
+    db_path: str,
+    dynasty_id: str,
+    season: int
+) -> Optional[ScoreModelParameters]:
+    """
+    Calibrated parameters for a season, from the cache or the database.
+
+    Args:
+        db_path: Path to the game cycle database
+        dynasty_id: Dynasty identifier
+        season: Season year
+
+    Returns:
+        Stored ScoreModelParameters, or None if the season was never calibrated
+    """
+    key = (db_path, dynasty_id, season)
+    with _models_lock:
+        parameters = _calibrations.get(key)
+    if parameters is None:
+        parameters = _load_calibration(db_path, dynasty_id, season)
+        if parameters is not None:
+            with _models_lock:
+                _calibrations[key] = parameters
+    return parameters
+
+
+def get_score_model(db_path: str, dynasty_id: str, season: int) -> InstantScoreModel:
+    """
+    Get the shared score model for a database, dynasty and season.
+
+    Args:
+        db_path: Path to the game cycle database
+        dynasty_id: Dynasty identifier
+        season: Season being simulated (a new season gets a new model)
+
+    Returns:
+        InstantScoreModel using the season's calibration, if any
+    """
+    key = (db_path, dynasty_id)
+    with _models_lock:
+        model = _models.get(key)
+    if model is not None and model.season == season:
+        return model
+
+    parameters = get_score_model_calibration(db_path, dynasty_id, season) or DEFAULT_PARAMETERS
+    with _models_lock:
+        model = _models.get(key)
+        if model is None or model.season != season:
+            model = InstantScoreModel(db_path, dynasty_id, season, parameters)
+            _models[key] = model
+        return model
+
+
+def calibrate_score_model(
+    db_path: str,
+    dynasty_id: str,
+    season: int,
+    games: int = 64,
+    seed: Optional[int] = None
+) -> ScoreModelParameters:
+    """
+    Calibrate a season against FULL simulation and store the result.
+
+    Args:
+        db_path: Path to the game cycle database
+        dynasty_id: Dynasty identifier
+        season: Season to calibrate
+        games: Number of FULL games to simulate
+        seed: Seed for the pairings
+
+    Returns:
+        Fitted ScoreModelParameters (saved to score_model_calibrations and
+        used by get_score_model from now on, also after a restart)
+    """
+    parameters = ScoreModelCalibrator(db_path, dynasty_id, season).calibrate(games, seed)
+    _save_calibration(db_path, dynasty_id, season, parameters)
+    with _models_lock:
+        _calibrations[(db_path, dynasty_id, season)] = parameters
+        model = _models.get((db_path, dynasty_id))
+        if model is not None and model.season == season:
+            model.parameters = parameters
+    return parameters
+
+
+def clear_score_models() -> None:
+    """Drop every cached model and calibration (stored calibrations are kept)."""
+    with _models_lock:
+        _models.clear()
+        _calibrations.clear()
@@ -0,0 +1,221 @@
+"""
+Leaderboard Service - Cached league leader queries for the stats view.
+
+StatsView.refresh_stats used to run all nine category leader queries, the
+team stats rollup and three summary counts on the UI thread every time it
+was shown, the season or team filter changed, or Refresh was clicked -
+even when no game had been played since the last load.
+
+LeaderboardService answers the same UnifiedDatabaseAPI queries through an
+LRU cache keyed by LeaderboardQuery (season, category, team filter, sort):
+
+- results stay cached until games for that dynasty/season are persisted
+  (WeekPersistenceBatch calls notify_games_persisted after each commit)
+- get() is safe to call from a background thread; every thread gets its own
+  UnifiedDatabaseAPI, since SQLite connections are bound to their thread
+- peek() only reads the cache, so the UI thread can show a cached tab
+  without touching the database
+
+Usage:
+    service = LeaderboardService(db_path, dynasty_id)
+    query = LeaderboardQuery(season=2025, category="passing", team_id=None)
+    leaders = service.peek(query)      # None if not cached
+    leaders = service.get(query)       # Loads on a miss (worker thread)
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# category -> UnifiedDatabaseAPI leader method
+LEADER_CATEGORIES: Dict[str, str] = {
+    "passing": "stats_get_category_leaders_passing",
+    "rushing": "stats_get_category_leaders_rushing",
+    "receiving": "stats_get_category_leaders_receiving",
+    "defense": "stats_get_category_leaders_defense",
+    "kicking": "stats_get_category_leaders_kicking",
+    "punting": "stats_get_category_leaders_punting",
+    "blocking": "stats_get_category_leaders_blocking",
+    "coverage": "stats_get_category_leaders_coverage",
+    "pass_rush": "stats_get_category_leaders_pass_rush",
+}
+TEAM_STATS = "team_stats"
+SUMMARY = "summary"
+
+# (dynasty_id, season) -> number of persisted game batches
+_GENERATIONS: Dict[Tuple[str, int], int] = {}
+_GENERATIONS_LOCK = threading.Lock()
+
+
+def notify_games_persisted(dynasty_id: str, season: int) -> None:
+    """
+    Mark cached leaderboards for a dynasty's season as stale.
+
+    Called after new game results are committed; every LeaderboardService
+    reloads that season's queries on their next get().
+
+    Args:
+        dynasty_id: Dynasty identifier
+        season: Season year
+    """
+    with _GENERATIONS_LOCK:
+        key = (dynasty_id, season)
+        _GENERATIONS[key] = _GENERATIONS.get(key, 0) + 1
+
+
+def _generation(dynasty_id: str, season: int) -> int:
+    """Current persisted-games generation for a dynasty's season."""
+    with _GENERATIONS_LOCK:
+        return _GENERATIONS.get((dynasty_id, season), 0)
+
+
+@dataclass(frozen=True)
+class LeaderboardQuery:
+    """
+    Cache key for one leaderboard.
+
+    Attributes:
+        season: Season year
+        category: A LEADER_CATEGORIES key, TEAM_STATS or SUMMARY
+        team_id: Team filter (None = all teams; ignored by team stats and summary)
+        sort_by: Server-side sort column (defense only)
+        limit: Leaders to return when not filtered by team
+    """
+    season: int
+    category: str
+    team_id: Optional[int] = None
+    sort_by: Optional[str] = None
+    limit: int = 25
+
+
+class LeaderboardService:
+    """
+    LRU-cached leaderboard queries for one dynasty.
+
+    Thread-safe: the cache is shared, database access uses one
+    UnifiedDatabaseAPI per calling thread. Call close() from each thread
+    that used get() once it is done.
+    """
+
+    def __init__(self, db_path: str, dynasty_id: str, max_entries: int = 64):
+        """
+        Initialize the service (no connection is opened until a cache miss).
+
+        Args:
+            db_path: Path to game_cycle.db database
+            dynasty_id: Dynasty identifier
+            max_entries: Cached results kept before the least recently used
+                is evicted
+        """
+        self.db_path = db_path
+        self.dynasty_id = dynasty_id
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[LeaderboardQuery, Tuple[int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    # -------------------- Cache Methods --------------------
+
+    def peek(self, query: LeaderboardQuery) -> Optional[Any]:
+        """
+        Cached result for a query, without touching the database.
+
+        Args:
+            query: Leaderboard to look up
+
+        Returns:
+            The cached result, or None if missing or stale
+        """
+        generation = _generation(self.dynasty_id, query.season)
+        with self._lock:
+            entry = self._cache.get(query)
+            if entry is None or entry[0] != generation:
+                return None
+            self._cache.move_to_end(query)
+            return entry[1]
+
+    def get(self, query: LeaderboardQuery) -> Any:
+        """
+        Result for a query, loaded from the database on a cache miss.
+
+        Args:
+            query: Leaderboard to load
+
+        Returns:
+            List of leader/team stat dicts, or the summary counts dict
+
+        Raises:
+            ValueError: If the category is unknown
+        """
+        cached = self.peek(query)
+        if cached is not None:
+            return cached
+
+        # Read before querying: games persisted mid-load leave the entry stale
+        generation = _generation(self.dynasty_id, query.season)
+        result = self._load(query)
+        with self._lock:
+            self._cache[query] = (generation, result)
+            self._cache.move_to_end(query)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return result
+
+    def invalidate(self, season: Optional[int] = None) -> None:
+        """
+        Drop cached results.
+
+        Args:
+            season: Only drop this season's results (None = everything)
+        """
+        with self._lock:
+            if season is None:
+                self._cache.clear()
+                return
+            for query in [q for q in self._cache if q.season == season]:
+                del self._cache[query]
+
+    def close(self) -> None:
+        """Close the calling thread's database connections."""
+        api = getattr(self._local, "api", None)
+        if api is not None:
+            api.close()
+            self._local.api = None
+
+    # -------------------- Loading --------------------
+
+    def _api(self) -> Any:
+        """UnifiedDatabaseAPI owned by the calling thread."""
+        api = getattr(self._local, "api", None)
+        if api is None:
+            from database.unified_api import UnifiedDatabaseAPI
+            api = self._local.api = UnifiedDatabaseAPI(self.db_path, self.dynasty_id)
+        return api
+
+    def _load(self, query: LeaderboardQuery) -> Any:
+        """Run the query behind a leaderboard."""
+        api = self._api()
+
+        if query.category == SUMMARY:
+            return {
+                "games": api.stats_get_game_count(query.season),
+                "players": api.stats_get_player_count(query.season),
+                "week": api.stats_get_current_week(query.season),
+            }
+        if query.category == TEAM_STATS:
+            return api.team_stats_get_all_teams(query.season)
+
+        method = LEADER_CATEGORIES.get(query.category)
+        if method is None:
+            raise ValueError(f"Unknown leaderboard category: {query.category}")
+
+        kwargs: Dict[str, Any] = {
+            "season": query.season, "limit": query.limit, "team_id": query.team_id,
+        }
+        if query.sort_by is not None:
+            kwargs["sort_by"] = query.sort_by
+        return getattr(api, method)(**kwargs)
@@ -0,0 +1,333 @@
+"""
+Media Job Queue - Deferred headlines, social posts and derived data.
+
+RegularSeasonHandler.execute used to produce everything a week generates
+besides the game results inline: social posts and a headline per game,
+preview headlines for this week and next, award race tracking, power
+rankings, season grade aggregation and player popularity. "Sim to
+playoffs" waited for all of it before simulating the next week.
+
+With media_mode "deferred" the handler commits the week's results, queues
+that work as media_jobs rows and returns:
+
+- jobs are idempotent (unique per dynasty/season/week/type/key), so a
+  re-run or resumed week never duplicates content
+- MediaJobWorker runs them in queue order on a background thread with its
+  own database connection
+- one runner at a time per database, so a week's jobs keep the inline order
+  (season grades before popularity, ...)
+- drain() runs whatever is left in the caller's thread and returns once the
+  queue is empty; it returns False if any job failed since the last drain
+  (failed jobs stay in the table until MediaJobsAPI.retry_failed())
+
+Job types are registered by the code that owns the work
+(register_media_job); the regular season handler registers its own.
+
+Usage:
+    worker = get_media_worker(db_path)
+    MediaJobsAPI(db).enqueue_many(dynasty_id, season, jobs)
+    worker.notify()
+    ...
+    drain_media_jobs(db_path)
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from ..database.connection import GameCycleDatabase
+from ..database.media_jobs_api import MediaJob, MediaJobsAPI
+
+logger = logging.getLogger(__name__)
+
+# job_type -> callable(job, context)
+MediaJobHandler = Callable[[MediaJob, "MediaJobContext"], Any]
+_JOB_HANDLERS: Dict[str, MediaJobHandler] = {}
+
+# db_path -> worker
+_WORKERS: Dict[str, "MediaJobWorker"] = {}
+_WORKERS_LOCK = threading.Lock()
+
+
+def register_media_job(job_type: str, handler: MediaJobHandler) -> None:
+    """
+    Register the function that runs a job type.
+
+    Args:
+        job_type: media_jobs.job_type value
+        handler: Called as handler(job, context); raising marks the job failed
+    """
+    _JOB_HANDLERS[job_type] = handler
+
+
+class MediaJobContext:
+    """
+    Resources shared by the jobs of one worker run.
+
+    Owns the run's database connection and one HeadlineGenerator per
+    dynasty/season, so consecutive headline jobs reuse the generator and
+    its preloaded week.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.db = GameCycleDatabase(db_path)
+        self._generators: Dict[Tuple[str, int], Any] = {}
+        self._preloaded: Set[Tuple[str, int, int, str]] = set()
+
+    def headline_generator(self, job: MediaJob) -> Any:
+        """
+        HeadlineGenerator for the job's dynasty and season.
+
+        Recap data for every game with a job of this type in the job's week
+        is bulk-loaded the first time the week is seen.
+
+        Args:
+            job: Job being run
+
+        Returns:
+            Shared HeadlineGenerator
+        """
+        key = (job.dynasty_id, job.season)
+        generator = self._generators.get(key)
+        if generator is None:
+            from .headline_generator import HeadlineGenerator
+            generator = self._generators[key] = HeadlineGenerator(
+                self.db_path, job.dynasty_id, job.season
+            )
+
+        week_key = (job.dynasty_id, job.season, job.week, job.job_type)
+        if job.job_key and week_key not in self._preloaded:
+            self._preloaded.add(week_key)
+            jobs = MediaJobsAPI(self.db).get_jobs(
+                job.dynasty_id, job.season, week=job.week, job_type=job.job_type
+            )
+            try:
+                generator.preload_week([j.job_key for j in jobs])
+            except Exception as e:
+                logger.warning("Could not preload headline data for week %s: %s", job.week, e)
+        return generator
+
+    def close(self) -> None:
+        """Close the connection and any generators."""
+        for generator in self._generators.values():
+            generator.close()
+        self._generators.clear()
+        self.db.close()
+
+
+class MediaJobWorker:
+    """
+    Runs queued media jobs for one database.
+
+    start() launches a daemon thread that runs pending jobs whenever
+    notify() is called. run_pending() and drain() run jobs in the calling
+    thread; all runners share a lock, so jobs execute one at a time in
+    queue order.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the worker (not started).
+
+        Args:
+            db_path: Database holding the media_jobs queue
+        """
+        self.db_path = db_path
+        self._run_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        # Jobs failed since the last drain (updated while holding _run_lock)
+        self._failed = 0
+
+    @property
+    def is_running(self) -> bool:
+        """True while the background thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Start the background thread (no-op if already running).
+
+        Jobs left running by an interrupted session are queued again first.
+        """
+        if self.is_running:
+            return
+        self._requeue_interrupted()
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run_forever, name="media-job-worker", daemon=True
+        )
+        self._thread.start()
+        self._wakeup.set()  # Pick up jobs left by an earlier session
+
+    def notify(self) -> None:
+        """Wake the background thread after queueing jobs."""
+        self._wakeup.set()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background thread after its current job.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit (None = forever)
+        """
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if not self._thread.is_alive():
+                self._thread = None
+
+    def run_pending(self, max_jobs: Optional[int] = None) -> int:
+        """
+        Run pending jobs in the calling thread.
+
+        Args:
+            max_jobs: Stop after this many jobs (None = until the queue is empty)
+
+        Returns:
+            Number of jobs run
+        """
+        with self._run_lock:
+            return self._run_jobs(max_jobs)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the background thread's current run, then run the rest.
+
+        Args:
+            timeout: Seconds to wait for the background run (None = forever)
+
+        Returns:
+            True if the queue was drained and no job failed since the last
+            drain, False on timeout or if any job failed
+        """
+        if not self._run_lock.acquire(timeout=-1 if timeout is None else timeout):
+            return False
+        try:
+            self._run_jobs(None)
+            failed, self._failed = self._failed, 0
+        finally:
+            self._run_lock.release()
+        if failed:
+            logger.warning(
+                "%d media jobs failed since the last drain (requeue with MediaJobsAPI.retry_failed)",
+                failed
+            )
+        return failed == 0
+
+    def _requeue_interrupted(self) -> None:
+        """Return jobs marked running (by a session that ended mid-job) to the queue."""
+        try:
+            with self._run_lock:
+                db = GameCycleDatabase(self.db_path)
+                try:
+                    requeued = MediaJobsAPI(db).requeue_running()
+                finally:
+                    db.close()
+            if requeued:
+                logger.info("Requeued %d interrupted media jobs", requeued)
+        except Exception as e:
+            logger.error("Could not recover interrupted media jobs: %s", e)
+
+    def _run_forever(self) -> None:
+        """Background loop: run pending jobs each time the worker is woken."""
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopping:
+                return
+            try:
+                self.run_pending()
+            except Exception as e:
+                logger.error("Media job worker run failed: %s", e, exc_info=True)
+
+    def _run_jobs(self, max_jobs: Optional[int]) -> int:
+        """Claim and run jobs until the queue is empty (caller holds the lock)."""
+        context = MediaJobContext(self.db_path)
+        api = MediaJobsAPI(context.db)
+        ran = 0
+        try:
+            while max_jobs is None or ran < max_jobs:
+                if self._stopping and threading.current_thread() is self._thread:
+                    break
+                job = api.claim_next()
+                if job is None:
+                    break
+                self._run_job(api, job, context)
+                ran += 1
+        finally:
+            context.close()
+        return ran
+
+    def _run_job(self, api: MediaJobsAPI, job: MediaJob, context: MediaJobContext) -> None:
+        """Run one claimed job and record the outcome."""
+        handler = _JOB_HANDLERS.get(job.job_type)
+        if handler is None:
+            self._failed += 1
+            api.mark_failed(job.job_id, f"No handler registered for job type '{job.job_type}'")
+            logger.error("No handler registered for media job type %s", job.job_type)
+            return
+
+        try:
+            handler(job, context)
+        except Exception as e:
+            self._failed += 1
+            api.mark_failed(job.job_id, str(e))
+            logger.error(
+                "Media job %s (%s, week %d) failed: %s",
+                job.job_id, job.job_type, job.week, e, exc_info=True
+            )
+            return
+        api.mark_done(job.job_id)
+
+
+def get_media_worker(db_path: str) -> MediaJobWorker:
+    """
+    Running worker for a database (created and started on first use).
+
+    Args:
+        db_path: Database path
+
+    Returns:
+        Started MediaJobWorker
+    """
+    with _WORKERS_LOCK:
+        worker = _WORKERS.get(db_path)
+        if worker is None:
+            worker = _WORKERS[db_path] = MediaJobWorker(db_path)
+        worker.start()
+        return worker
+
+
+def drain_media_jobs(db_path: str, timeout: Optional[float] = None) -> bool:
+    """
+    Run every queued job for a database before returning.
+
+    Uses the database's worker if one exists, otherwise runs the jobs in
+    the calling thread.
+
+    Args:
+        db_path: Database path
+        timeout: Seconds to wait for a background run in progress
+
+    Returns:
+        True if the queue was drained without failed jobs, False on timeout
+        or if any job failed since the last drain
+    """
+    with _WORKERS_LOCK:
+        worker = _WORKERS.get(db_path)
+    if worker is None:
+        worker = MediaJobWorker(db_path)
+    return worker.drain(timeout)
+
+
+def stop_media_workers(timeout: Optional[float] = None) -> None:
+    """Stop and forget all workers (pending jobs stay queued)."""
+    with _WORKERS_LOCK:
+        workers = list(_WORKERS.values())
+        _WORKERS.clear()
+    for worker in workers:
+        worker.stop(timeout)
@@ -284,8 +284,8 @@ class MockStatsGenerator:
                 # Merge: add numeric values, keep non-numeric from first entry
                 existing = player_stats_by_id[player_id]
                 for key, value in stats.items():
-                    if key == 'player_id':
-                        continue
+                    if key in ('player_id', 'team_id'):
+                        continue  # Identity, not a stat
                     if isinstance(value, (int, float)):
                         # Additive merge for numeric stats
                         existing[key] = existing.get(key, 0) + value
@@ -17,16 +17,16 @@ Architecture:
 """
 
 import json
-import random
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional, Callable
+from typing import List, Dict, Set, Tuple
 
 from src.game_cycle.database.connection import GameCycleDatabase
 from src.game_cycle.database.schedule_rotation_api import ScheduleRotationAPI
 from src.game_cycle.database.standings_api import StandingsAPI
+from src.game_cycle.services.schedule_solver import ScheduleSolver
 
 
 @dataclass
@@ -130,6 +130,7 @@ class NFLScheduleGenerator:
         self._db = GameCycleDatabase(self.db_path)
         self._rotation_api = ScheduleRotationAPI(self._db)
         self._standings_api = StandingsAPI(self._db)
+        self._solver = ScheduleSolver(seed=self.dynasty_id)
         self._load_teams_data()
         self._load_static_schedules()
 
@@ -242,73 +243,59 @@ class NFLScheduleGenerator:
 
         print(f"[NFLScheduleGenerator] No static schedule found, generating algorithmically")
 
-        # Retry loop - if bye week assignment creates unschedulable config, retry
-        max_schedule_attempts = 10
-        last_error = None
-
-        for schedule_attempt in range(max_schedule_attempts):
-            # Reset counters
-            self.home_counts = {i: 0 for i in range(1, 33)}
-            self.away_counts = {i: 0 for i in range(1, 33)}
-
-            # Step 0: Assign bye weeks FIRST (Milestone 11, Tollgate 3)
-            print(f"[NFLScheduleGenerator] Assigning bye weeks...")
-            bye_assignments = self._assign_bye_weeks()
-            print(f"[NFLScheduleGenerator]   Bye weeks assigned for all 32 teams")
-
-            matchups: List[Matchup] = []
-
-            # Step 1: Generate all matchups
-            print(f"[NFLScheduleGenerator] Assigning division games...")
-            division_matchups = self._assign_division_games()
-            matchups.extend(division_matchups)
-            print(f"[NFLScheduleGenerator]   Created {len(division_matchups)} division games")
-
-            print(f"[NFLScheduleGenerator] Assigning in-conference rotation games...")
-            conference_matchups = self._assign_conference_rotation(season)
-            matchups.extend(conference_matchups)
-            print(f"[NFLScheduleGenerator]   Created {len(conference_matchups)} conference rotation games")
-
-            print(f"[NFLScheduleGenerator] Assigning cross-conference rotation games...")
-            cross_conf_matchups = self._assign_cross_conference_rotation(season)
-            matchups.extend(cross_conf_matchups)
-            print(f"[NFLScheduleGenerator]   Created {len(cross_conf_matchups)} cross-conference games")
-
-            print(f"[NFLScheduleGenerator] Assigning same-place finisher games...")
-            same_place_matchups = self._assign_same_place_finishers(season)
-            matchups.extend(same_place_matchups)
-            print(f"[NFLScheduleGenerator]   Created {len(same_place_matchups)} same-place finisher games")
-
-            print(f"[NFLScheduleGenerator] Assigning 17th game matchups...")
-            game_17_matchups = self._assign_17th_game(season)
-            matchups.extend(game_17_matchups)
-            print(f"[NFLScheduleGenerator]   Created {len(game_17_matchups)} 17th game matchups")
-
-            # Validate total matchups
-            if len(matchups) != self.TOTAL_GAMES:
-                raise ValueError(f"Expected {self.TOTAL_GAMES} games, got {len(matchups)}")
-
-            # Step 2: Balance home/away
-            print(f"[NFLScheduleGenerator] Balancing home/away assignments...")
-            matchups = self._balance_home_away(matchups)
-
-            # Step 3: Distribute to weeks (with bye week consideration)
-            print(f"[NFLScheduleGenerator] Distributing games to weeks (with byes)...")
-            try:
-                weekly_schedule = self._distribute_to_weeks_with_byes(matchups, bye_assignments)
-                # Success! Save bye weeks and break out of retry loop
-                self._save_bye_weeks(season, bye_assignments)
-                break
-            except ValueError as e:
-                last_error = e
-                if schedule_attempt < max_schedule_attempts - 1:
-                    print(f"[NFLScheduleGenerator] Distribution failed (attempt {schedule_attempt + 1}/{max_schedule_attempts}), retrying with new bye assignments...")
-                    continue
-                else:
-                    raise ValueError(
-                        f"Cannot generate schedule after {max_schedule_attempts} attempts. "
-                        f"Last error: {last_error}"
-                    )
+        # Deterministic per dynasty and season, independent of the global RNG
+        self._solver = ScheduleSolver(seed=f"{self.dynasty_id}:{season}")
+
+        # Reset counters
+        self.home_counts = {i: 0 for i in range(1, 33)}
+        self.away_counts = {i: 0 for i in range(1, 33)}
+
+        # Step 0: Assign bye weeks FIRST (Milestone 11, Tollgate 3)
+        print(f"[NFLScheduleGenerator] Assigning bye weeks...")
+        bye_assignments = self._assign_bye_weeks()
+        print(f"[NFLScheduleGenerator]   Bye weeks assigned for all 32 teams")
+
+        matchups: List[Matchup] = []
+
+        # Step 1: Generate all matchups
+        print(f"[NFLScheduleGenerator] Assigning division games...")
+        division_matchups = self._assign_division_games()
+        matchups.extend(division_matchups)
+        print(f"[NFLScheduleGenerator]   Created {len(division_matchups)} division games")
+
+        print(f"[NFLScheduleGenerator] Assigning in-conference rotation games...")
+        conference_matchups = self._assign_conference_rotation(season)
+        matchups.extend(conference_matchups)
+        print(f"[NFLScheduleGenerator]   Created {len(conference_matchups)} conference rotation games")
+
+        print(f"[NFLScheduleGenerator] Assigning cross-conference rotation games...")
+        cross_conf_matchups = self._assign_cross_conference_rotation(season)
+        matchups.extend(cross_conf_matchups)
+        print(f"[NFLScheduleGenerator]   Created {len(cross_conf_matchups)} cross-conference games")
+
+        print(f"[NFLScheduleGenerator] Assigning same-place finisher games...")
+        same_place_matchups = self._assign_same_place_finishers(season)
+        matchups.extend(same_place_matchups)
+        print(f"[NFLScheduleGenerator]   Created {len(same_place_matchups)} same-place finisher games")
+
+        print(f"[NFLScheduleGenerator] Assigning 17th game matchups...")
+        game_17_matchups = self._assign_17th_game(season)
+        matchups.extend(game_17_matchups)
+        print(f"[NFLScheduleGenerator]   Created {len(game_17_matchups)} 17th game matchups")
+
+        # Validate total matchups
+        if len(matchups) != self.TOTAL_GAMES:
+            raise ValueError(f"Expected {self.TOTAL_GAMES} games, got {len(matchups)}")
+
+        # Step 2: Balance home/away
+        print(f"[NFLScheduleGenerator] Balancing home/away assignments...")
+        matchups = self._balance_home_away(matchups)
+
+        # Step 3: Distribute to weeks (with bye week consideration)
+        print(f"[NFLScheduleGenerator] Distributing games to weeks (with byes)...")
+        weekly_schedule = self._distribute_to_weeks_with_byes(matchups, bye_assignments)
+        print(f"[NFLScheduleGenerator]   Solved in {self._solver.nodes} search nodes")
+        self._save_bye_weeks(season, bye_assignments)
 
         # Step 4: Convert to game events
         print(f"[NFLScheduleGenerator] Converting to game events...")
@@ -761,196 +748,6 @@ class NFLScheduleGenerator:
 
         return matchups
 
-    def _distribute_to_weeks(self, matchups: List[Matchup]) -> Dict[int, List[Matchup]]:
-        """
-        Distribute 272 matchups across 17 weeks (16 games/week).
-
-        Uses retry-based algorithm with different random orderings.
-
-        Constraints:
-        - No team plays multiple games in same week
-        - Each week has exactly 16 games
-
-        Args:
-            matchups: List of all 272 matchups
-
-        Returns:
-            Dict mapping week -> list of matchups
-        """
-        max_attempts = 100
-
-        for attempt in range(max_attempts):
-            result = self._try_distribute(matchups, attempt)
-            if result is not None:
-                return result
-
-            # Reset matchup weeks for next attempt
-            for m in matchups:
-                m.week = 0
-
-        raise ValueError(
-            f"Cannot distribute matchups to weeks after {max_attempts} attempts"
-        )
-
-    def _try_distribute(
-        self,
-        matchups: List[Matchup],
-        attempt: int
-    ) -> Optional[Dict[int, List[Matchup]]]:
-        """
-        Single attempt to distribute matchups to weeks.
-
-        Uses constraint-based ordering: most-constrained matchups first.
-        """
-        # Track team availability per week
-        team_week: Dict[int, Set[int]] = {t: set() for t in range(1, 33)}
-        week_games: Dict[int, List[Matchup]] = {w: [] for w in range(1, 18)}
-
-        def can_assign(m: Matchup, week: int) -> bool:
-            if len(week_games[week]) >= self.GAMES_PER_WEEK:
-                return False
-            if week in team_week[m.home_team_id]:
-                return False
-            if week in team_week[m.away_team_id]:
-                return False
-            return True
-
-        def assign(m: Matchup, week: int) -> None:
-            m.week = week
-            week_games[week].append(m)
-            team_week[m.home_team_id].add(week)
-            team_week[m.away_team_id].add(week)
-
-        def unassign(m: Matchup) -> None:
-            if m.week == 0:
-                return
-            week = m.week
-            m.week = 0
-            week_games[week].remove(m)
-            team_week[m.home_team_id].discard(week)
-            team_week[m.away_team_id].discard(week)
-
-        def count_available_weeks(m: Matchup) -> int:
-            return sum(1 for w in range(1, 18) if can_assign(m, w))
-
-        # Shuffle matchups with variation based on attempt
-        random.seed(attempt * 12345)  # Deterministic but varied
-        shuffled = list(matchups)
-        random.shuffle(shuffled)
-
-        # Sort by constraint level (most constrained first)
-        # Division games are most constrained, then by team "busyness"
-        def constraint_key(m: Matchup) -> Tuple[int, int, int]:
-            # Priority: division games, then fewest available weeks
-            div_priority = 0 if m.is_divisional else 1
-            available = count_available_weeks(m)
-            # Add small random factor to break ties differently each attempt
-            rand_factor = hash((m.home_team_id, m.away_team_id, attempt)) % 100
-            return (div_priority, available, rand_factor)
-
-        # Re-sort periodically during assignment to update constraints
-        remaining = sorted(shuffled, key=constraint_key)
-
-        while remaining:
-            # Take most constrained matchup
-            game = remaining.pop(0)
-
-            available_weeks = [w for w in range(1, 18) if can_assign(game, w)]
-
-            if available_weeks:
-                # Choose week that keeps schedule balanced
-                week = min(available_weeks, key=lambda w: len(week_games[w]))
-                assign(game, week)
-
-                # Re-sort remaining every 50 games to update constraint ordering
-                if len(remaining) % 50 == 0 and remaining:
-                    remaining.sort(key=constraint_key)
-            else:
-                # Can't place this game - try swapping
-                placed = self._try_swap_placement(
-                    game, week_games, team_week,
-                    assign, unassign, can_assign
-                )
-
-                if not placed:
-                    return None  # This attempt failed
-
-        # Verify completeness
-        for week in range(1, 18):
-            if len(week_games[week]) != 16:
-                return None
-
-        return week_games
-
-    def _try_swap_placement(
-        self,
-        game: Matchup,
-        week_games: Dict[int, List[Matchup]],
-        team_week: Dict[int, Set[int]],
-        assign: Callable[[Matchup, int], None],
-        unassign: Callable[[Matchup], None],
-        can_assign: Callable[[Matchup, int], bool]
-    ) -> bool:
-        """
-        Try to place a game by swapping with existing games.
-
-        Uses 2-level chain swapping.
-        """
-        for target_week in range(1, 18):
-            if len(week_games[target_week]) >= self.GAMES_PER_WEEK:
-                continue
-
-            # Find games blocking this matchup in target_week
-            blockers = []
-            if target_week in team_week[game.home_team_id]:
-                for m in week_games[target_week]:
-                    if game.home_team_id in (m.home_team_id, m.away_team_id):
-                        blockers.append(m)
-                        break
-
-            if target_week in team_week[game.away_team_id]:
-                for m in week_games[target_week]:
-                    if game.away_team_id in (m.home_team_id, m.away_team_id):
-                        if m not in blockers:
-                            blockers.append(m)
-                        break
-
-            # Try moving blockers to make room
-            for blocker in blockers:
-                orig_week = blocker.week
-                unassign(blocker)
-
-                if can_assign(game, target_week):
-                    # Find new spot for blocker
-                    for alt_week in range(1, 18):
-                        if can_assign(blocker, alt_week):
-                            assign(game, target_week)
-                            assign(blocker, alt_week)
-                            return True
-
-                    # Try 2-level chain: move blocker by displacing another game
-                    for alt_week in range(1, 18):
-                        if len(week_games[alt_week]) >= self.GAMES_PER_WEEK:
-                            continue
-
-                        for displaced in list(week_games[alt_week]):
-                            unassign(displaced)
-
-                            if can_assign(blocker, alt_week):
-                                for final_week in range(1, 18):
-                                    if can_assign(displaced, final_week):
-                                        assign(game, target_week)
-                                        assign(blocker, alt_week)
-                                        assign(displaced, final_week)
-                                        return True
-
-                            assign(displaced, alt_week)
-
-                # Revert if couldn't place
-                assign(blocker, orig_week)
-
-        return False
-
     # -------------------- Event Conversion --------------------
 
     def _convert_to_events(
@@ -1088,115 +885,21 @@ class NFLScheduleGenerator:
         """
         Assign bye weeks for all 32 teams.
 
-        Algorithm:
-            1. Process divisions in random order to avoid bias
-            2. For each team, find optimal bye week using scoring
-            3. Constraints: max 4 per week, max 2 per division per week
+        Constraints (ScheduleSolver.assign_byes):
+            - An even number of teams on bye each week, so every playing
+              team has an opponent
+            - Max 4 teams per week, max 2 per division per week
 
         Returns:
             Dict mapping team_id -> bye_week (5-14)
         """
-        bye_assignments: Dict[int, int] = {}
-        week_counts: Dict[int, int] = {w: 0 for w in range(self.BYE_WEEK_START, self.BYE_WEEK_END + 1)}
-        division_week_counts: Dict[int, Dict[int, int]] = {
-            d: {w: 0 for w in range(self.BYE_WEEK_START, self.BYE_WEEK_END + 1)}
-            for d in self.DIVISIONS.keys()
-        }
-
-        # Process divisions in random order to avoid bias
-        divisions = list(self.DIVISIONS.items())
-        random.shuffle(divisions)
-
-        for div_id, teams in divisions:
-            # Shuffle teams within division
-            team_list = list(teams)
-            random.shuffle(team_list)
-
-            for team_id in team_list:
-                # Find best bye week for this team
-                bye_week = self._find_best_bye_week(
-                    team_id, div_id, week_counts, division_week_counts
-                )
-
-                bye_assignments[team_id] = bye_week
-                week_counts[bye_week] += 1
-                division_week_counts[div_id][bye_week] += 1
-
-        return bye_assignments
-
-    def _calculate_bye_week_score(
-        self,
-        week: int,
-        current_count: int,
-        division_id: int,
-        division_week_counts: Dict[int, Dict[int, int]],
-        weeks_at_two: int
-    ) -> float:
-        """Calculate score for assigning a bye to a specific week (lower = better)."""
-        score = 0.0
-        new_count = current_count + 1
-
-        if new_count > self.MAX_TEAMS_PER_BYE:
-            score += 1000
-        if division_week_counts[division_id][week] >= self.MAX_DIVISION_PER_BYE:
-            score += 500
-        if new_count in (1, 3):
-            score += 100
-        if current_count == 2 and weeks_at_two >= 4:
-            score += 80
-        score += current_count * 15
-        score += random.uniform(0, 5)
-
-        return score
-
-    def _find_best_bye_week(
-        self,
-        team_id: int,
-        division_id: int,
-        week_counts: Dict[int, int],
-        division_week_counts: Dict[int, Dict[int, int]]
-    ) -> int:
-        """
-        Find optimal bye week for a team using scoring.
-
-        CRITICAL: We need EVEN numbers of byes per week to get integer games.
-        - 2 byes → 30 teams → 15 games
-        - 4 byes → 28 teams → 14 games
-        - 3 byes → 29 teams → 14 games (loses 1 team slot!)
-
-        Target distribution: 4 weeks with 2 byes + 6 weeks with 4 byes = 144 bye week games
-
-        Scoring criteria (lower = better):
-        - Week at capacity (4 teams): +1000 (hard constraint)
-        - Division already has 2+ teams on this bye: +500 (soft constraint)
-        - Odd bye count (1 or 3): +100 (prefer even counts for optimal scheduling)
-        - Balance: prefer weeks with fewer teams
-
-        Args:
-            team_id: Team to assign
-            division_id: Team's division
-            week_counts: Current teams per bye week
-            division_week_counts: Current division teams per bye week
-
-        Returns:
-            Best bye week (5-14)
-        """
-        best_week = self.BYE_WEEK_START
-        best_score = float('inf')
-
-        # Count how many weeks already have 2 byes (those should stay at 2)
-        weeks_at_two = sum(1 for c in week_counts.values() if c == 2)
-
-        for week in range(self.BYE_WEEK_START, self.BYE_WEEK_END + 1):
-            score = self._calculate_bye_week_score(
-                week, week_counts[week], division_id, division_week_counts, weeks_at_two
-            )
-
-            if score < best_score:
-                best_score = score
-                best_week = week
-
-        return best_week
+        return self._solver.assign_byes(
+            self.DIVISIONS,
+            first_week=self.BYE_WEEK_START,
+            last_week=self.BYE_WEEK_END,
+            max_per_week=self.MAX_TEAMS_PER_BYE,
+            max_per_division=self.MAX_DIVISION_PER_BYE,
+        )
 
     def _save_bye_weeks(
         self,
@@ -1225,11 +928,9 @@ class NFLScheduleGenerator:
         """
         Distribute 272 matchups across 18 weeks respecting bye weeks.
 
-        Key changes from _distribute_to_weeks:
-        - Teams cannot play during their bye week
-        - Games per week varies (14-16 depending on byes)
-        - Week capacity = (32 - teams_on_bye) / 2
-        - Uses MCV greedy first, then full backtracking as fallback
+        Every team plays once in each non-bye week, so games per week
+        vary (14-16 depending on byes). Solved by ScheduleSolver.assign_weeks
+        (bitmask domains, forward checking, most-constrained-first).
 
         Args:
             matchups: List of all 272 matchups
@@ -1237,745 +938,22 @@ class NFLScheduleGenerator:
 
         Returns:
             Dict mapping week -> list of matchups
-        """
-        # Try MCV greedy first (fast path)
-        for attempt in range(50):
-            for m in matchups:
-                m.week = 0
-
-            result, unassigned = self._greedy_with_unassigned(
-                matchups, bye_assignments, attempt
-            )
-
-            if not unassigned and self._verify_no_conflicts(result):
-                return result
-
-        # Greedy failed, use full recursive backtracking (guaranteed to work)
-        print("[NFLScheduleGenerator] Greedy failed, using full backtracking...")
-        for attempt in range(10):
-            for m in matchups:
-                m.week = 0
-            random.seed(attempt * 54321)
-
-            result = self._full_backtracking(matchups, bye_assignments)
-            if result is not None:
-                return result
-
-        raise ValueError(
-            "Cannot distribute matchups with byes after greedy + backtracking attempts"
-        )
-
-    def _greedy_with_unassigned(
-        self,
-        matchups: List[Matchup],
-        bye_assignments: Dict[int, int],
-        attempt: int
-    ) -> Tuple[Dict[int, List[Matchup]], List[Matchup]]:
-        """
-        Greedy assignment that always picks the most constrained game.
 
-        Uses most-constrained-variable (MCV) heuristic: always place the game
-        with the fewest available weeks first. This minimizes dead ends.
-
-        Returns:
-            Tuple of (week_games dict, list of unassigned games)
+        Raises:
+            ValueError: If no valid assignment is found
         """
-        # Track team availability (includes bye weeks)
-        team_week: Dict[int, Set[int]] = {t: set() for t in range(1, 33)}
-
-        # Pre-mark bye weeks as unavailable
-        for team_id, bye_week in bye_assignments.items():
-            team_week[team_id].add(bye_week)
-
-        # Calculate week capacities
-        week_capacity: Dict[int, int] = {}
-        for week in range(1, self.TOTAL_WEEKS + 1):
-            teams_on_bye = sum(1 for t, w in bye_assignments.items() if w == week)
-            week_capacity[week] = (self.TOTAL_TEAMS - teams_on_bye) // 2
-
-        week_games: Dict[int, List[Matchup]] = {w: [] for w in range(1, self.TOTAL_WEEKS + 1)}
-        unassigned: List[Matchup] = []
-
-        def can_assign(m: Matchup, week: int) -> bool:
-            if len(week_games[week]) >= week_capacity[week]:
-                return False
-            if week in team_week[m.home_team_id]:
-                return False
-            if week in team_week[m.away_team_id]:
-                return False
-            return True
-
-        def assign(m: Matchup, week: int) -> None:
-            m.week = week
-            week_games[week].append(m)
-            team_week[m.home_team_id].add(week)
-            team_week[m.away_team_id].add(week)
-
-        def count_available(m: Matchup) -> int:
-            return sum(1 for w in range(1, self.TOTAL_WEEKS + 1) if can_assign(m, w))
-
-        # Shuffle for variety on different attempts
-        random.seed(attempt * 12345)
-        remaining = list(matchups)
-        random.shuffle(remaining)
-
-        # MCV greedy: always pick the most constrained game
-        while remaining:
-            # Find game with fewest available weeks
-            best_idx = 0
-            best_count = count_available(remaining[0])
-            for i in range(1, len(remaining)):
-                count = count_available(remaining[i])
-                if count < best_count:
-                    best_count = count
-                    best_idx = i
-
-            game = remaining.pop(best_idx)
-
-            if best_count == 0:
-                unassigned.append(game)
-                continue
-
-            # Place in least-full available week
-            available_weeks = [w for w in range(1, self.TOTAL_WEEKS + 1) if can_assign(game, w)]
-            week = min(available_weeks, key=lambda w: len(week_games[w]))
-            assign(game, week)
-
-        return week_games, unassigned
-
-    def _full_backtracking(
-        self,
-        matchups: List[Matchup],
-        bye_assignments: Dict[int, int],
-        max_iterations: int = 500000
-    ) -> Optional[Dict[int, List[Matchup]]]:
-        """
-        Full recursive backtracking to place all 272 games.
-
-        This is the reliable fallback when greedy fails. It guarantees
-        finding a valid schedule if one exists by exploring the full
-        search space with pruning.
-
-        Args:
-            matchups: All 272 matchups to place
-            bye_assignments: Dict mapping team_id -> bye_week
-            max_iterations: Max iterations before giving up
-
-        Returns:
-            Dict mapping week -> list of matchups, or None if failed
-        """
-        # Track team availability (includes bye weeks)
-        team_week: Dict[int, Set[int]] = {t: set() for t in range(1, 33)}
-        for team_id, bye_week in bye_assignments.items():
-            team_week[team_id].add(bye_week)
-
-        # Calculate week capacities
-        week_capacity: Dict[int, int] = {}
-        for week in range(1, self.TOTAL_WEEKS + 1):
-            teams_on_bye = sum(1 for t, w in bye_assignments.items() if w == week)
-            week_capacity[week] = (self.TOTAL_TEAMS - teams_on_bye) // 2
-
-        week_games: Dict[int, List[Matchup]] = {w: [] for w in range(1, self.TOTAL_WEEKS + 1)}
-
-        def can_place(game: Matchup, week: int) -> bool:
-            if len(week_games[week]) >= week_capacity[week]:
-                return False
-            if week in team_week[game.home_team_id]:
-                return False
-            if week in team_week[game.away_team_id]:
-                return False
-            return True
-
-        def place(game: Matchup, week: int) -> None:
-            game.week = week
-            week_games[week].append(game)
-            team_week[game.home_team_id].add(week)
-            team_week[game.away_team_id].add(week)
-
-        def unplace(game: Matchup) -> None:
-            week = game.week
-            game.week = 0
-            week_games[week].remove(game)
-            team_week[game.home_team_id].discard(week)
-            team_week[game.away_team_id].discard(week)
-
-        def count_available(game: Matchup) -> int:
-            return sum(1 for w in range(1, self.TOTAL_WEEKS + 1) if can_place(game, w))
-
-        # Sort games by constraint level (most constrained first - MCV heuristic)
-        sorted_games = sorted(matchups, key=lambda g: count_available(g))
-
-        iterations = [0]
-
-        def backtrack(idx: int) -> bool:
-            if iterations[0] >= max_iterations:
-                return False
-            iterations[0] += 1
-
-            if idx >= len(sorted_games):
-                return True  # All games placed!
-
-            game = sorted_games[idx]
-
-            # Try weeks in order (could optimize with least-constraining-value)
-            for week in range(1, self.TOTAL_WEEKS + 1):
-                if can_place(game, week):
-                    place(game, week)
-                    if backtrack(idx + 1):
-                        return True
-                    unplace(game)
-
-            return False
-
-        if backtrack(0):
-            return week_games
-        return None
-
-    def _place_remaining_backtracking(
-        self,
-        games: List[Matchup],
-        week_games: Dict[int, List[Matchup]],
-        bye_assignments: Dict[int, int],
-        max_iterations: int = 100000
-    ) -> bool:
-        """
-        Use backtracking to place remaining unassigned games.
-
-        Args:
-            games: List of games to place
-            week_games: Current week assignment (will be modified)
-            bye_assignments: Bye week assignments
-            max_iterations: Max iterations before giving up
-
-        Returns:
-            True if all games placed, False otherwise
-        """
-        if not games:
-            return True
-
-        # Build tracking from current state
-        team_week: Dict[int, Set[int]] = {t: set() for t in range(1, 33)}
-        for team_id, bye_week in bye_assignments.items():
-            team_week[team_id].add(bye_week)
-        for week, gms in week_games.items():
-            for g in gms:
-                team_week[g.home_team_id].add(week)
-                team_week[g.away_team_id].add(week)
-
-        # Calculate capacities
-        week_capacity: Dict[int, int] = {}
-        for week in range(1, self.TOTAL_WEEKS + 1):
-            byes = sum(1 for t, w in bye_assignments.items() if w == week)
-            week_capacity[week] = (self.TOTAL_TEAMS - byes) // 2
-
-        def can_place(game: Matchup, week: int) -> bool:
-            if len(week_games[week]) >= week_capacity[week]:
-                return False
-            if week in team_week[game.home_team_id]:
-                return False
-            if week in team_week[game.away_team_id]:
-                return False
-            return True
-
-        def place(game: Matchup, week: int) -> None:
-            game.week = week
-            week_games[week].append(game)
-            team_week[game.home_team_id].add(week)
-            team_week[game.away_team_id].add(week)
-
-        def unplace(game: Matchup) -> None:
-            week = game.week
-            game.week = 0
-            week_games[week].remove(game)
-            team_week[game.home_team_id].discard(week)
-            team_week[game.away_team_id].discard(week)
-
-        # Iterative backtracking with stack
-        stack: List[Tuple[int, int, Optional[int]]] = [(0, 1, None)]
-        iterations = 0
-
-        while stack and iterations < max_iterations:
-            iterations += 1
-            game_idx, next_week, placed_week = stack.pop()
-
-            if placed_week is not None:
-                unplace(games[game_idx])
-
-            if game_idx >= len(games):
-                return True
-
-            game = games[game_idx]
-            found_week = None
-            for week in range(next_week, self.TOTAL_WEEKS + 1):
-                if can_place(game, week):
-                    found_week = week
-                    break
-
-            if found_week is not None:
-                place(game, found_week)
-                stack.append((game_idx, found_week + 1, found_week))
-                stack.append((game_idx + 1, 1, None))
-
-        return False
-
-    def _repair_conflicts(
-        self,
-        week_games: Dict[int, List[Matchup]],
-        bye_assignments: Dict[int, int]
-    ) -> Optional[Dict[int, List[Matchup]]]:
-        """
-        Repair any team conflicts in a schedule by swapping games.
-
-        Args:
-            week_games: Dict mapping week -> list of matchups
-            bye_assignments: Dict mapping team_id -> bye_week
-
-        Returns:
-            Repaired schedule dict, or None if repair failed
-        """
-        # Build tracking structures
-        team_week: Dict[int, Set[int]] = {t: set() for t in range(1, 33)}
-
-        # Pre-mark bye weeks
-        for team_id, bye_week in bye_assignments.items():
-            team_week[team_id].add(bye_week)
-
-        # Calculate week capacities
-        week_capacity: Dict[int, int] = {}
-        for week in range(1, self.TOTAL_WEEKS + 1):
-            byes = sum(1 for t, w in bye_assignments.items() if w == week)
-            week_capacity[week] = (self.TOTAL_TEAMS - byes) // 2
-
-        # Build team_week from current schedule
-        for week, games in week_games.items():
-            for game in games:
-                team_week[game.home_team_id].add(week)
-                team_week[game.away_team_id].add(week)
-
-        def can_place(game: Matchup, week: int) -> bool:
-            if len(week_games[week]) >= week_capacity[week]:
-                return False
-            if week in team_week[game.home_team_id]:
-                return False
-            if week in team_week[game.away_team_id]:
-                return False
-            return True
-
-        def move_game(game: Matchup, from_week: int, to_week: int) -> None:
-            week_games[from_week].remove(game)
-            week_games[to_week].append(game)
-            team_week[game.home_team_id].discard(from_week)
-            team_week[game.away_team_id].discard(from_week)
-            team_week[game.home_team_id].add(to_week)
-            team_week[game.away_team_id].add(to_week)
-            game.week = to_week
-
-        # Find and fix conflicts (limit iterations to prevent infinite loops)
-        max_repair_iterations = 1000
-        for iteration in range(max_repair_iterations):
-            # Find a conflict
-            conflict_found = False
-            for week in range(1, self.TOTAL_WEEKS + 1):
-                teams_seen: Dict[int, Matchup] = {}
-                for game in list(week_games[week]):
-                    for team_id in [game.home_team_id, game.away_team_id]:
-                        if team_id in teams_seen:
-                            # Conflict found! Try to move this game
-                            conflict_found = True
-
-                            # Find alternative week for this game
-                            original_week = week
-                            # Temporarily remove game from tracking
-                            week_games[week].remove(game)
-                            team_week[game.home_team_id].discard(week)
-                            team_week[game.away_team_id].discard(week)
-
-                            moved = False
-                            for alt_week in range(1, self.TOTAL_WEEKS + 1):
-                                if alt_week == week:
-                                    continue
-                                if can_place(game, alt_week):
-                                    # Move game to alternative week
-                                    week_games[alt_week].append(game)
-                                    team_week[game.home_team_id].add(alt_week)
-                                    team_week[game.away_team_id].add(alt_week)
-                                    game.week = alt_week
-                                    moved = True
-                                    break
-
-                            if not moved:
-                                # Try swapping with a game from another week
-                                for alt_week in range(1, self.TOTAL_WEEKS + 1):
-                                    if alt_week == week:
-                                        continue
-                                    for swap_game in list(week_games[alt_week]):
-                                        # Can we swap?
-                                        # Temporarily remove swap_game
-                                        week_games[alt_week].remove(swap_game)
-                                        team_week[swap_game.home_team_id].discard(alt_week)
-                                        team_week[swap_game.away_team_id].discard(alt_week)
-
-                                        if can_place(game, alt_week):
-                                            # Put game in alt_week
-                                            week_games[alt_week].append(game)
-                                            team_week[game.home_team_id].add(alt_week)
-                                            team_week[game.away_team_id].add(alt_week)
-                                            game.week = alt_week
-
-                                            # Try to place swap_game in original week
-                                            # Re-add to tracking to check
-                                            week_games[original_week].append(swap_game)
-                                            team_week[swap_game.home_team_id].add(original_week)
-                                            team_week[swap_game.away_team_id].add(original_week)
-                                            swap_game.week = original_week
-                                            moved = True
-                                            break
-                                        else:
-                                            # Restore swap_game
-                                            week_games[alt_week].append(swap_game)
-                                            team_week[swap_game.home_team_id].add(alt_week)
-                                            team_week[swap_game.away_team_id].add(alt_week)
-
-                                    if moved:
-                                        break
-
-                            if not moved:
-                                # Could not repair - restore and fail
-                                week_games[week].append(game)
-                                team_week[game.home_team_id].add(week)
-                                team_week[game.away_team_id].add(week)
-                                return None
-
-                            break  # Restart conflict search after a move
-                        teams_seen[team_id] = game
-
-                    if conflict_found:
-                        break
-                if conflict_found:
-                    break
-
-            if not conflict_found:
-                # No more conflicts - verify and return
-                if self._verify_no_conflicts(week_games):
-                    return week_games
-                else:
-                    # Should not happen, but safety check
-                    return None
-
-        # Max iterations reached
-        return None
-
-    def _verify_no_conflicts(self, week_games: Dict[int, List[Matchup]]) -> bool:
-        """
-        Verify no team plays twice in any week.
-
-        Args:
-            week_games: Dict mapping week -> list of matchups
-
-        Returns:
-            True if no conflicts, False otherwise
-        """
-        for week, games in week_games.items():
-            teams = set()
-            for game in games:
-                if game.home_team_id in teams or game.away_team_id in teams:
-                    return False
-                teams.add(game.home_team_id)
-                teams.add(game.away_team_id)
-        return True
-
-    def _distribute_backtracking(
-        self,
-        matchups: List[Matchup],
-        bye_assignments: Dict[int, int],
-        max_iterations: int = 500000
-    ) -> Optional[Dict[int, List[Matchup]]]:
-        """
-        Distribute matchups using iterative backtracking - simpler and more reliable.
-
-        Algorithm:
-        1. Pre-compute week capacity and blocked weeks
-        2. Use iterative stack-based approach (no recursion limit issues)
-        3. Prioritize divisional games and most-constrained matchups dynamically
-        4. Return first valid complete assignment
-
-        Args:
-            matchups: List of all 272 matchups
-            bye_assignments: Dict mapping team_id -> bye_week
-            max_iterations: Maximum iterations to prevent infinite loops
-
-        Returns:
-            Dict mapping week -> list of matchups, or None if failed
-        """
-        # Initialize tracking
-        team_week: Dict[int, Set[int]] = {t: set() for t in range(1, 33)}
-        week_games: Dict[int, List[Matchup]] = {w: [] for w in range(1, self.TOTAL_WEEKS + 1)}
-
-        # Pre-mark bye weeks
-        for team_id, bye_week in bye_assignments.items():
-            team_week[team_id].add(bye_week)
-
-        # Calculate week capacities
-        week_capacity: Dict[int, int] = {}
-        for week in range(1, self.TOTAL_WEEKS + 1):
-            byes = sum(1 for t, w in bye_assignments.items() if w == week)
-            week_capacity[week] = (self.TOTAL_TEAMS - byes) // 2
-
-        def can_place(game: Matchup, week: int) -> bool:
-            """Check if game can be placed in week."""
-            if len(week_games[week]) >= week_capacity[week]:
-                return False
-            if week in team_week[game.home_team_id]:
-                return False
-            if week in team_week[game.away_team_id]:
-                return False
-            return True
-
-        def place(game: Matchup, week: int) -> None:
-            """Place game in week."""
-            game.week = week
-            week_games[week].append(game)
-            team_week[game.home_team_id].add(week)
-            team_week[game.away_team_id].add(week)
-
-        def unplace(game: Matchup) -> None:
-            """Remove game from its week."""
-            week = game.week
-            game.week = 0
-            week_games[week].remove(game)
-            team_week[game.home_team_id].discard(week)
-            team_week[game.away_team_id].discard(week)
-
-        def count_available(game: Matchup) -> int:
-            """Count available weeks for a game."""
-            return sum(1 for w in range(1, self.TOTAL_WEEKS + 1) if can_place(game, w))
-
-        # Shuffle games first for variety, then sort by static priority
-        # (divisional first, then other conference, then non-conference)
-        game_list = list(matchups)
-        random.shuffle(game_list)
-
-        # Sort: divisional > conference > non-conference
-        def static_priority(g: Matchup) -> int:
-            if g.is_divisional:
-                return 0
-            elif g.is_conference:
-                return 1
-            else:
-                return 2
-
-        game_list.sort(key=static_priority)
-
-        # Use iterative approach with explicit stack
-        # Stack contains: (game_index, week_to_try_next, placed_week_or_none)
-        stack: List[Tuple[int, int, Optional[int]]] = [(0, 1, None)]
-        iterations = 0
-
-        while stack and iterations < max_iterations:
-            iterations += 1
-            game_idx, next_week, placed_week = stack.pop()
-
-            # If we placed a game, unplace it before trying next week
-            if placed_week is not None:
-                unplace(game_list[game_idx])
-
-            # All games placed successfully
-            if game_idx >= len(game_list):
-                return week_games
-
-            game = game_list[game_idx]
-
-            # Find next valid week to try
-            found_week = None
-            for week in range(next_week, self.TOTAL_WEEKS + 2):
-                if week > self.TOTAL_WEEKS:
-                    break
-                if can_place(game, week):
-                    found_week = week
-                    break
-
-            if found_week is not None:
-                # Place this game and push state for backtracking
-                place(game, found_week)
-                # Push backtrack state (try next week if we fail later)
-                stack.append((game_idx, found_week + 1, found_week))
-                # Push next game
-                stack.append((game_idx + 1, 1, None))
-            # If no week found, backtracking will happen naturally (pop to previous state)
-
-        return None
-
-    def _try_distribute_with_byes(
-        self,
-        matchups: List[Matchup],
-        bye_assignments: Dict[int, int],
-        attempt: int
-    ) -> Optional[Dict[int, List[Matchup]]]:
-        """
-        Single attempt to distribute matchups respecting bye weeks.
-
-        Uses constraint-based ordering: most-constrained matchups first.
-        Teams are pre-marked unavailable during their bye weeks.
-        """
-        # Track team availability (includes bye weeks)
-        team_week: Dict[int, Set[int]] = {t: set() for t in range(1, 33)}
-
-        # Pre-mark bye weeks as unavailable
-        for team_id, bye_week in bye_assignments.items():
-            team_week[team_id].add(bye_week)
-
-        # Calculate week capacities (accounting for byes)
-        week_capacity: Dict[int, int] = {}
-        for week in range(1, self.TOTAL_WEEKS + 1):
-            teams_on_bye = sum(1 for t, w in bye_assignments.items() if w == week)
-            teams_playing = self.TOTAL_TEAMS - teams_on_bye
-            week_capacity[week] = teams_playing // 2  # 14-16 games
+        weeks = self._solver.assign_weeks(
+            [(m.home_team_id, m.away_team_id) for m in matchups],
+            bye_assignments,
+            total_weeks=self.TOTAL_WEEKS,
+        )
 
         week_games: Dict[int, List[Matchup]] = {w: [] for w in range(1, self.TOTAL_WEEKS + 1)}
-
-        def can_assign(m: Matchup, week: int) -> bool:
-            if len(week_games[week]) >= week_capacity[week]:
-                return False
-            if week in team_week[m.home_team_id]:
-                return False
-            if week in team_week[m.away_team_id]:
-                return False
-            return True
-
-        def assign(m: Matchup, week: int) -> None:
+        for m, week in zip(matchups, weeks):
             m.week = week
             week_games[week].append(m)
-            team_week[m.home_team_id].add(week)
-            team_week[m.away_team_id].add(week)
-
-        def unassign(m: Matchup) -> None:
-            if m.week == 0:
-                return
-            week = m.week
-            m.week = 0
-            week_games[week].remove(m)
-            team_week[m.home_team_id].discard(week)
-            team_week[m.away_team_id].discard(week)
-
-        def count_available_weeks(m: Matchup) -> int:
-            return sum(1 for w in range(1, self.TOTAL_WEEKS + 1) if can_assign(m, w))
-
-        # Shuffle matchups with variation based on attempt
-        random.seed(attempt * 12345)  # Deterministic but varied
-        shuffled = list(matchups)
-        random.shuffle(shuffled)
-
-        # Sort by constraint level (most constrained first)
-        def constraint_key(m: Matchup) -> Tuple[int, int, int]:
-            div_priority = 0 if m.is_divisional else 1
-            available = count_available_weeks(m)
-            rand_factor = hash((m.home_team_id, m.away_team_id, attempt)) % 100
-            return (div_priority, available, rand_factor)
-
-        remaining = sorted(shuffled, key=constraint_key)
-
-        while remaining:
-            game = remaining.pop(0)
-            available_weeks = [w for w in range(1, self.TOTAL_WEEKS + 1) if can_assign(game, w)]
-
-            if available_weeks:
-                week = min(available_weeks, key=lambda w: len(week_games[w]))
-                assign(game, week)
-
-                if len(remaining) % 50 == 0 and remaining:
-                    remaining.sort(key=constraint_key)
-            else:
-                placed = self._try_swap_placement_with_byes(
-                    game, week_games, team_week, week_capacity,
-                    assign, unassign, can_assign
-                )
-                if not placed:
-                    return None
-
-        # Verify completeness (variable games per week)
-        for week in range(1, self.TOTAL_WEEKS + 1):
-            if len(week_games[week]) != week_capacity[week]:
-                return None
-
         return week_games
 
-    def _try_swap_placement_with_byes(
-        self,
-        game: Matchup,
-        week_games: Dict[int, List[Matchup]],
-        team_week: Dict[int, Set[int]],
-        week_capacity: Dict[int, int],
-        assign: Callable[[Matchup, int], None],
-        unassign: Callable[[Matchup], None],
-        can_assign: Callable[[Matchup, int], bool]
-    ) -> bool:
-        """
-        Try to place a game by swapping with existing games.
-
-        Uses 2-level chain swapping for bye-aware scheduling.
-        Adapted from _try_swap_placement for variable week capacity.
-        """
-        for target_week in range(1, self.TOTAL_WEEKS + 1):
-            if len(week_games[target_week]) >= week_capacity[target_week]:
-                continue
-
-            # Find games blocking this matchup in target_week
-            blockers = []
-            if target_week in team_week[game.home_team_id]:
-                for m in week_games[target_week]:
-                    if game.home_team_id in (m.home_team_id, m.away_team_id):
-                        blockers.append(m)
-                        break
-
-            if target_week in team_week[game.away_team_id]:
-                for m in week_games[target_week]:
-                    if game.away_team_id in (m.home_team_id, m.away_team_id):
-                        if m not in blockers:
-                            blockers.append(m)
-                        break
-
-            # If no blockers AND week is valid for both teams, assign directly
-            # CRITICAL: Must check can_assign to respect bye weeks!
-            if not blockers and can_assign(game, target_week):
-                assign(game, target_week)
-                return True
-
-            # Try moving blockers to make room
-            for blocker in blockers:
-                orig_week = blocker.week
-                unassign(blocker)
-
-                if can_assign(game, target_week):
-                    # Level 1: Find new spot for blocker
-                    for alt_week in range(1, self.TOTAL_WEEKS + 1):
-                        if can_assign(blocker, alt_week):
-                            assign(game, target_week)
-                            assign(blocker, alt_week)
-                            return True
-
-                    # Level 2: Move blocker by displacing another game
-                    for alt_week in range(1, self.TOTAL_WEEKS + 1):
-                        if len(week_games[alt_week]) >= week_capacity[alt_week]:
-                            continue
-
-                        for displaced in list(week_games[alt_week]):
-                            unassign(displaced)
-
-                            if can_assign(blocker, alt_week):
-                                for final_week in range(1, self.TOTAL_WEEKS + 1):
-                                    if can_assign(displaced, final_week):
-                                        assign(game, target_week)
-                                        assign(blocker, alt_week)
-                                        assign(displaced, final_week)
-                                        return True
-
-                            assign(displaced, alt_week)
-
-                # Revert if couldn't place
-                assign(blocker, orig_week)
-
-        return False
-
     def close(self):
         """Close database connection."""
         if hasattr(self, '_db') and self._db:
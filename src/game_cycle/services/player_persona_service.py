@@ -323,6 +323,18 @@ class PlayerPersonaService:
             return PlayerPersona.from_db_row(data)
         return None
 
+    def get_all_personas(self) -> Dict[int, PlayerPersona]:
+        """Load every persona in the dynasty with one query.
+
+        Returns:
+            Dict mapping player_id to PlayerPersona
+        """
+        api = self._get_persona_api()
+        return {
+            data["player_id"]: PlayerPersona.from_db_row(data)
+            for data in api.get_all_personas(self._dynasty_id)
+        }
+
     def save_persona(self, persona: PlayerPersona) -> bool:
         """Persist a persona to the database.
 
@@ -333,7 +345,25 @@ class PlayerPersonaService:
             True if successful
         """
         api = self._get_persona_api()
-        record = PersonaRecord(
+        return api.insert_persona(self._dynasty_id, self._to_record(persona))
+
+    def save_personas(self, personas: List[PlayerPersona]) -> int:
+        """Persist several personas in a single transaction.
+
+        Args:
+            personas: PlayerPersonas to save
+
+        Returns:
+            Number of personas saved
+        """
+        api = self._get_persona_api()
+        return api.insert_personas_batch(
+            self._dynasty_id, [self._to_record(persona) for persona in personas]
+        )
+
+    def _to_record(self, persona: PlayerPersona) -> PersonaRecord:
+        """Convert a persona to its database record."""
+        return PersonaRecord(
             player_id=persona.player_id,
             persona_type=persona.persona_type.value,
             money_importance=persona.money_importance,
@@ -351,7 +381,6 @@ class PlayerPersonaService:
             championship_count=persona.championship_count,
             pro_bowl_count=persona.pro_bowl_count,
         )
-        return api.insert_persona(self._dynasty_id, record)
 
     def update_career_context(
         self,
@@ -0,0 +1,370 @@
+"""
+Playoff Odds Engine - Monte Carlo playoff probabilities from the remaining schedule.
+
+FlexScheduler judged what was at stake in a game with simplified
+heuristics (top 7 of the conference, 8th place's maximum wins) and
+nothing in the project estimated real playoff odds.
+
+PlayoffOddsEngine simulates the rest of the season thousands of times
+at once:
+
+- team strength from point differential per game, regressed toward
+  average (or ratings supplied by the caller), turned into a home/away
+  win probability matrix with a normal margin model
+- every remaining game of every simulated season drawn as one array and
+  added to the current records with incidence-matrix products
+- PlayoffSeeder seeding applied to each simulated season with np.lexsort:
+  division winners seeds 1-4, wildcards 5-7, the same tiebreaker order
+  and the same stable ordering of tied teams
+- a reseeded bracket played out for Super Bowl odds
+
+Each simulated season keeps its game outcomes, so odds conditional on
+winning or losing a given game come from the same run.
+
+Usage:
+    engine = PlayoffOddsEngine(standings, remaining_games, seed=7)
+    odds = engine.run(iterations=10000)
+    odds.get(team_id).playoffs
+    odds.if_result(team_id, opponent_id, won=True, week=14).division
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from stores.standings_store import NFL_DIVISIONS
+
+DEFAULT_ITERATIONS = 10000
+MARGIN_STDEV = 13.5          # Points; NFL final margins vs. expectation
+HOME_FIELD_ADVANTAGE = 2.0   # Points
+REGRESSION_GAMES = 4         # Average-team games blended into each rating
+
+TEAM_IDS = list(range(1, 33))
+CONFERENCES = ("AFC", "NFC")
+
+# Bracket: seed 1 has a bye, wild card games are 2v7, 3v6, 4v5
+WILD_CARD_HOME_SEEDS = np.array([2, 3, 4])
+WILD_CARD_AWAY_SEEDS = np.array([7, 6, 5])
+
+
+@dataclass
+class TeamPlayoffOdds:
+    """Probabilities for one team (0.0-1.0)."""
+
+    team_id: int
+    playoffs: float
+    division: float
+    bye: float
+    super_bowl: float
+
+    @property
+    def clinched_playoffs(self) -> bool:
+        """In the playoffs in every simulated season."""
+        return self.playoffs == 1.0
+
+    @property
+    def eliminated(self) -> bool:
+        """Out of the playoffs in every simulated season."""
+        return self.playoffs == 0.0
+
+
+class PlayoffOdds:
+    """Per-simulation results of a PlayoffOddsEngine run."""
+
+    def __init__(
+        self,
+        games: List[Tuple[int, int, int]],
+        home_wins: np.ndarray,
+        seeds: np.ndarray,
+        champions: np.ndarray,
+    ):
+        """
+        Args:
+            games: Remaining (week, home_team_id, away_team_id), in simulation order
+            home_wins: [iteration, game] True if the home team won
+            seeds: [iteration, team index] seed 1-7, or 0 outside the playoffs
+            champions: [iteration] team index of the Super Bowl winner
+        """
+        self._games = games
+        self._home_wins = home_wins
+        self._seeds = seeds
+        self._champions = champions
+
+    @property
+    def iterations(self) -> int:
+        return len(self._seeds)
+
+    def get(self, team_id: int) -> TeamPlayoffOdds:
+        """Odds for a team across all simulated seasons."""
+        return self._odds(team_id, slice(None))
+
+    def all(self) -> Dict[int, TeamPlayoffOdds]:
+        """Odds for every team, keyed by team_id."""
+        return {team_id: self.get(team_id) for team_id in TEAM_IDS}
+
+    def if_result(
+        self,
+        team_id: int,
+        opponent_id: int,
+        won: bool,
+        week: Optional[int] = None,
+    ) -> Optional[TeamPlayoffOdds]:
+        """
+        Odds for a team in the simulated seasons where it won (or lost) a game.
+
+        Args:
+            team_id: Team to evaluate
+            opponent_id: Opponent in the remaining game
+            won: True for seasons the team won the game, False for losses
+            week: Week of the game (first remaining meeting if None)
+
+        Returns:
+            TeamPlayoffOdds, or None if the game isn't remaining or that
+            result never happened
+        """
+        for g, (game_week, home_id, away_id) in enumerate(self._games):
+            if {home_id, away_id} == {team_id, opponent_id} and week in (None, game_week):
+                team_won = self._home_wins[:, g] if home_id == team_id else ~self._home_wins[:, g]
+                mask = team_won == won
+                if not mask.any():
+                    return None
+                return self._odds(team_id, mask)
+        return None
+
+    def _odds(self, team_id: int, mask) -> TeamPlayoffOdds:
+        seeds = self._seeds[mask, team_id - 1]
+        return TeamPlayoffOdds(
+            team_id=team_id,
+            playoffs=float(np.mean(seeds > 0)),
+            division=float(np.mean((seeds > 0) & (seeds <= 4))),
+            bye=float(np.mean(seeds == 1)),
+            super_bowl=float(np.mean(self._champions[mask] == team_id - 1)),
+        )
+
+
+class PlayoffOddsEngine:
+    """
+    Simulates the remaining regular season and playoffs.
+
+    Standings entries need team_id, wins, losses, ties, points_for,
+    points_against, conference_wins and division_wins (StandingsAPI's
+    TeamStanding or the standings store's EnhancedTeamStanding).
+    """
+
+    def __init__(
+        self,
+        standings: Sequence[Any],
+        remaining_games: Sequence[Tuple[int, int, int]],
+        ratings: Optional[Dict[int, float]] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            standings: Current standings (missing teams start at 0-0)
+            remaining_games: Unplayed (week, home_team_id, away_team_id)
+            ratings: Optional points-per-game strength by team_id; derived
+                from point differential when None
+            seed: Seed for the numpy Generator (None for fresh entropy)
+        """
+        self._rng = np.random.default_rng(seed)
+        self._games = [tuple(game) for game in remaining_games]
+
+        n = len(TEAM_IDS)
+        columns = ("wins", "losses", "ties", "points_for", "points_against",
+                   "conference_wins", "division_wins")
+        self._record = {column: np.zeros(n) for column in columns}
+        for standing in standings:
+            i = standing.team_id - 1
+            for column in columns:
+                self._record[column][i] = getattr(standing, column)
+
+        games_played = self._record["wins"] + self._record["losses"] + self._record["ties"]
+        point_differential = self._record["points_for"] - self._record["points_against"]
+        if ratings is None:
+            self._ratings = point_differential / (games_played + REGRESSION_GAMES)
+        else:
+            self._ratings = np.array([float(ratings.get(team_id, 0.0)) for team_id in TEAM_IDS])
+
+        # Conference and division of every team, in PlayoffSeeder order
+        self._divisions: Dict[str, List[List[int]]] = {conference: [] for conference in CONFERENCES}
+        division_of = np.zeros(n, dtype=int)
+        conference_of = np.zeros(n, dtype=int)
+        for d, (division_name, team_ids) in enumerate(NFL_DIVISIONS.items()):
+            conference = next(c for c in CONFERENCES if c in division_name)
+            self._divisions[conference].append([team_id - 1 for team_id in team_ids])
+            for team_id in team_ids:
+                division_of[team_id - 1] = d
+                conference_of[team_id - 1] = CONFERENCES.index(conference)
+        self._conference_teams = {
+            "AFC": np.arange(0, 16),
+            "NFC": np.arange(16, 32),
+        }
+
+        # Incidence matrices: [game, team] = 1 for the home (away) team
+        home = np.array([game[1] - 1 for game in self._games], dtype=int)
+        away = np.array([game[2] - 1 for game in self._games], dtype=int)
+        self._home_index = home
+        self._away_index = away
+        self._home_matrix = np.zeros((len(self._games), n))
+        self._away_matrix = np.zeros((len(self._games), n))
+        self._home_matrix[np.arange(len(home)), home] = 1.0
+        self._away_matrix[np.arange(len(away)), away] = 1.0
+        self._conference_game = (conference_of[home] == conference_of[away]).astype(float)
+        self._division_game = (division_of[home] == division_of[away]).astype(float)
+
+        self._home_probability = self.win_probabilities()
+        self._neutral_probability = self.win_probabilities(home_field=0.0)
+
+    def win_probabilities(self, home_field: float = HOME_FIELD_ADVANTAGE) -> np.ndarray:
+        """
+        Probability that the row team beats the column team at home.
+
+        Args:
+            home_field: Home field advantage in points (0 for neutral site)
+
+        Returns:
+            32 x 32 matrix indexed by team_id - 1
+        """
+        expected_margin = self._ratings[:, None] - self._ratings[None, :] + home_field
+        return 0.5 * (1.0 + np.vectorize(math.erf)(expected_margin / (MARGIN_STDEV * math.sqrt(2.0))))
+
+    def run(self, iterations: int = DEFAULT_ITERATIONS) -> PlayoffOdds:
+        """
+        Simulate the remaining season and playoffs.
+
+        Args:
+            iterations: Number of simulated seasons
+
+        Returns:
+            PlayoffOdds for all teams
+        """
+        probability = self._home_probability[self._home_index, self._away_index]
+        home_wins = self._rng.random((iterations, len(self._games))) < probability
+
+        keys = self._final_keys(home_wins)
+        seeds = np.zeros((iterations, len(TEAM_IDS)), dtype=int)
+        champions = []
+        for conference in CONFERENCES:
+            conference_seeds = self._seed_conference(keys, conference)
+            np.put_along_axis(seeds, conference_seeds, np.arange(1, 8)[None, :], axis=1)
+            champions.append(self._play_conference(conference_seeds))
+
+        afc_won = self._play(champions[0], champions[1], self._neutral_probability)
+        super_bowl = np.where(afc_won, champions[0], champions[1])
+        return PlayoffOdds(self._games, home_wins, seeds, super_bowl)
+
+    # ========================================================================
+    # Regular season
+    # ========================================================================
+
+    def _final_keys(self, home_wins: np.ndarray) -> List[np.ndarray]:
+        """
+        Final-standings tiebreaker keys [iteration, team], in PlayoffSeeder order.
+
+        Win percentage, wins, conference wins and division wins include the
+        simulated games. Point differential adds each remaining game's
+        expected margin; points scored are as of now.
+        """
+        won = home_wins.astype(float)
+        lost = 1.0 - won
+        record = self._record
+
+        wins = record["wins"] + won @ self._home_matrix + lost @ self._away_matrix
+        conference_wins = (
+            record["conference_wins"]
+            + (won * self._conference_game) @ self._home_matrix
+            + (lost * self._conference_game) @ self._away_matrix
+        )
+        division_wins = (
+            record["division_wins"]
+            + (won * self._division_game) @ self._home_matrix
+            + (lost * self._division_game) @ self._away_matrix
+        )
+
+        games = (record["wins"] + record["losses"] + record["ties"]
+                 + self._home_matrix.sum(axis=0) + self._away_matrix.sum(axis=0))
+        wins = np.rint(wins)
+        win_percentage = np.divide(
+            wins + record["ties"] * 0.5, games,
+            out=np.zeros_like(wins), where=games > 0
+        )
+
+        expected_margin = (self._ratings[self._home_index] - self._ratings[self._away_index]
+                           + HOME_FIELD_ADVANTAGE)
+        point_differential = (record["points_for"] - record["points_against"]
+                              + expected_margin @ self._home_matrix
+                              - expected_margin @ self._away_matrix)
+
+        shape = wins.shape
+        return [
+            win_percentage,
+            wins,
+            np.rint(conference_wins),
+            np.rint(division_wins),
+            np.broadcast_to(point_differential, shape),
+            np.broadcast_to(record["points_for"], shape),
+        ]
+
+    def _seed_conference(self, keys: List[np.ndarray], conference: str) -> np.ndarray:
+        """Team indices [iteration, seed - 1] for seeds 1-7."""
+        iterations = keys[0].shape[0]
+
+        # Division leaders, in division order, then ranked for seeds 1-4
+        leaders = np.stack([
+            self._sort_teams(keys, np.broadcast_to(division, (iterations, len(division))))[:, 0]
+            for division in self._divisions[conference]
+        ], axis=1)
+        division_winners = self._sort_teams(keys, leaders)
+
+        # Wildcards: other conference teams in team order, best three
+        is_winner = np.zeros(keys[0].shape)
+        np.put_along_axis(is_winner, division_winners, 1.0, axis=1)
+        teams = self._conference_teams[conference]
+        wildcards = self._sort_teams(
+            [-is_winner] + keys, np.broadcast_to(teams, (iterations, len(teams)))
+        )[:, :3]
+
+        return np.concatenate([division_winners, wildcards], axis=1)
+
+    @staticmethod
+    def _sort_teams(keys: List[np.ndarray], teams: np.ndarray) -> np.ndarray:
+        """
+        Order each row of team indices best-first by keys (primary first).
+
+        Stable like sorted(..., reverse=True): tied teams keep their order.
+        """
+        gathered = [np.take_along_axis(key, teams, axis=1) for key in keys]
+        order = np.lexsort([-key for key in reversed(gathered)], axis=1)
+        return np.take_along_axis(teams, order, axis=1)
+
+    # ========================================================================
+    # Playoffs
+    # ========================================================================
+
+    def _play(self, home: np.ndarray, away: np.ndarray, probability: np.ndarray) -> np.ndarray:
+        """True where the home team (index array) beat the away team."""
+        return self._rng.random(home.shape) < probability[home, away]
+
+    def _play_conference(self, seeds: np.ndarray) -> np.ndarray:
+        """Conference champion per iteration (higher seed hosts, reseeded after wild card)."""
+        def play(high, low):
+            # Winning seed numbers; the higher seed (lower number) hosts
+            home = np.take_along_axis(seeds, high - 1, axis=1)
+            away = np.take_along_axis(seeds, low - 1, axis=1)
+            return np.where(self._play(home, away, self._home_probability), high, low)
+
+        iterations = seeds.shape[0]
+        wild_card = np.sort(play(
+            np.broadcast_to(WILD_CARD_HOME_SEEDS, (iterations, 3)),
+            np.broadcast_to(WILD_CARD_AWAY_SEEDS, (iterations, 3)),
+        ), axis=1)
+
+        # Divisional: seed 1 hosts the lowest remaining seed, the other two meet
+        top = play(np.ones((iterations, 1), dtype=int), wild_card[:, 2:])
+        bottom = play(wild_card[:, :1], wild_card[:, 1:2])
+        champion = play(np.minimum(top, bottom), np.maximum(top, bottom))
+        return np.take_along_axis(seeds, champion - 1, axis=1)[:, 0]
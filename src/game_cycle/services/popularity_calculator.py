@@ -715,142 +715,28 @@ class PopularityCalculator:
             Number of players updated
 
         Process:
-        1. Get all active players
-        2. For each player:
-           - Calculate performance score
-           - Calculate visibility multiplier
-           - Get market multiplier
-           - Apply formula: (Performance × Visibility × Market) - Decay
-           - Cap to 0-100 range
-           - Classify tier
-           - Calculate trend
-           - Save via PopularityAPI
+        1. Load the week for all active players at once (PopularityEngine):
+           4-week snaps, season grades, headlines, award races, selections
+        2. Skip players under the minimum snap threshold
+        3. Compute performance, visibility and market as arrays and apply
+           the formula: (Performance × Visibility × Market) - Decay, capped 0-100
+        4. Classify tier and trend, compare with the previous week
+        5. Save all scores in one statement via PopularityAPI
         """
         try:
-            import json
             from ..database.popularity_api import PopularityAPI
+            from .popularity_engine import PopularityEngine
 
             self._logger.info(
                 f"Calculating popularity for season {season}, week {week} (dynasty={self._dynasty_id})"
             )
 
-            # Get all active players from game_cycle database
-            conn = self._db.get_connection()
-            cursor = conn.cursor()
-
-            # Query all active players (team_id > 0 means on a roster, 0 = free agent)
-            cursor.execute("""
-                SELECT player_id, team_id, positions, first_name, last_name
-                FROM players
-                WHERE dynasty_id = ? AND team_id > 0 AND status = 'active'
-            """, (self._dynasty_id,))
-
-            all_players = []
-            for row in cursor.fetchall():
-                positions = json.loads(row[2]) if row[2] else []  # positions is column index 2
-                all_players.append({
-                    'player_id': row[0],  # player_id
-                    'team_id': row[1],    # team_id
-                    'positions': positions,
-                    'name': f"{row[3]} {row[4]}"  # first_name + last_name
-                })
-
-            if not all_players:
-                self._logger.warning("No players found for popularity calculation")
+            scores = PopularityEngine(self).calculate(season, week)
+            if not scores:
+                self._logger.warning("No players eligible for popularity calculation")
                 return 0
 
-            self._logger.info(f"Found {len(all_players)} active players for popularity calculation")
-
-            # Initialize PopularityAPI
-            pop_api = PopularityAPI(self._db)
-            players_updated = 0
-
-            # Calculate popularity for each player
-            for player in all_players:
-                try:
-                    player_id = player.get('player_id')
-                    team_id = player.get('team_id', 0)
-                    positions = player.get('positions', [])
-
-                    if not player_id or not positions:
-                        continue
-
-                    # Get primary position
-                    position = positions[0] if isinstance(positions, list) else positions
-
-                    # Check minimum snap threshold using rolling 4-week window
-                    # This allows backups who become starters to gain popularity quickly
-                    # while filtering out low-usage players (100 snaps = ~25 snaps/game)
-                    recent_snaps = self._get_recent_snap_count(player_id, season, week, weeks=4)
-
-                    if recent_snaps < 100:  # ~25 snaps/game over 4 games
-                        # Skip players who haven't played enough recently to be relevant
-                        continue
-
-                    # Calculate components
-                    performance = self.calculate_performance_score(
-                        player_id, season, week, position
-                    )
-                    visibility = self.calculate_visibility_multiplier(
-                        player_id, season, week
-                    )
-                    market = self.calculate_market_multiplier(team_id)
-
-                    # Apply formula with normalized performance and scaled multipliers
-                    # Normalize performance to 0-1 scale (PFF grades are 0-100)
-                    normalized_performance = performance / 100.0
-
-                    # Scale multipliers to prevent ceiling clustering (realistic distribution)
-                    # Visibility: 0.5-3.0x → 0.7-1.3x (reduce range by 75%)
-                    visibility_scaled = 0.7 + (visibility - 0.5) / 2.5 * 0.6
-                    # Market: 0.8-2.0x → 0.9-1.2x (reduce range by 75%)
-                    market_scaled = 0.9 + (market - 0.8) / 1.2 * 0.3
-
-                    # Calculate raw score (max theoretical: 1.0 × 1.3 × 1.2 × 100 = 156)
-                    raw_score = normalized_performance * visibility_scaled * market_scaled * 100
-
-                    # Apply weekly decay (use baseline -1 for now until event tracking is implemented)
-                    decay = -1.0  # TODO: Implement event-based decay calculation
-                    final_score = raw_score + decay
-
-                    # Cap to 0-100 range
-                    final_score = max(0.0, min(100.0, final_score))
-
-                    # Classify tier and trend
-                    tier_enum = self.classify_tier(final_score)
-                    trend_enum = self.calculate_trend(player_id, season, week)
-
-                    # Calculate week change (difference from previous week)
-                    week_change = 0.0
-                    if week > 1:
-                        prev_score = pop_api.get_popularity_score(
-                            self._dynasty_id, player_id, season, week - 1
-                        )
-                        if prev_score:
-                            week_change = final_score - prev_score.popularity_score
-
-                    # Save to database (convert enums to string values)
-                    pop_api.save_popularity_score(
-                        dynasty_id=self._dynasty_id,
-                        player_id=player_id,
-                        season=season,
-                        week=week,
-                        popularity_score=final_score,
-                        performance_score=performance,
-                        visibility_multiplier=visibility,
-                        market_multiplier=market,
-                        week_change=week_change,
-                        trend=trend_enum.value,
-                        tier=tier_enum.value
-                    )
-
-                    players_updated += 1
-
-                except Exception as e:
-                    self._logger.error(
-                        f"Failed to calculate popularity for player {player.get('player_id')}: {e}"
-                    )
-                    continue
+            players_updated = PopularityAPI(self._db).save_popularity_scores(scores)
 
             self._logger.info(
                 f"Popularity calculation complete: {players_updated} players updated"
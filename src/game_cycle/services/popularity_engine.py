@@ -0,0 +1,289 @@
+"""
+Popularity Engine - Weekly popularity for the whole league in one pass.
+
+PopularityCalculator.calculate_weekly_popularity() used to work one
+player at a time: a 4-week snap query, a season grade query, the week's
+headlines, three nominee lists and the player's All-Pro and Pro Bowl
+history, then a previous-week lookup and a save. Headlines and nominees
+were reloaded for every active player, every simulated week.
+
+PopularityEngine loads the week once:
+
+- 4-week snap totals and season grades for every player (one GROUP BY
+  query and one season query)
+- the week's headlines and the MVP/OPOY/DPOY nominee lists (one call each)
+- All-Pro and Pro Bowl selection counts for the season (one GROUP BY each)
+- the previous week's scores (one query)
+
+Performance, visibility, market and final scores are then computed as
+arrays with the calculator's constants, in the same order of operations
+as the per-player formula.
+
+Usage:
+    engine = PopularityEngine(calculator)
+    scores = engine.calculate(season, week)
+    PopularityAPI(db).save_popularity_scores(scores)
+"""
+
+import json
+import logging
+from typing import Any, Dict, List
+
+import numpy as np
+
+from constants.position_abbreviations import get_position_abbreviation
+
+logger = logging.getLogger(__name__)
+
+MIN_RECENT_SNAPS = 100  # ~25 snaps/game over the 4-week window
+SNAP_WINDOW_WEEKS = 4
+WEEKLY_DECAY = -1.0
+
+
+class PopularityEngine:
+    """
+    Calculates weekly popularity scores for every active player at once.
+
+    Rules and constants come from the PopularityCalculator, so market
+    multipliers, tiers and trends use its methods directly.
+    """
+
+    def __init__(self, calculator):
+        """
+        Initialize the engine.
+
+        Args:
+            calculator: PopularityCalculator providing data access and rules
+        """
+        self._calculator = calculator
+        self._db = calculator._db
+        self._dynasty_id = calculator._dynasty_id
+
+    def calculate(self, season: int, week: int) -> List[Dict[str, Any]]:
+        """
+        Calculate popularity for all active players with enough recent snaps.
+
+        Args:
+            season: Season year
+            week: Week number
+
+        Returns:
+            List of score dicts (PopularityAPI.save_popularity_score keywords),
+            in player query order
+        """
+        from .popularity_calculator import (
+            POSITION_VALUE_MULTIPLIERS,
+            VISIBILITY_FLOOR,
+            VISIBILITY_CEILING,
+        )
+
+        players = self._load_players()
+        if not players:
+            return []
+
+        snaps = self._load_recent_snaps(season, week)
+        players = [p for p in players if snaps.get(p["player_id"], 0) >= MIN_RECENT_SNAPS]
+        if not players:
+            return []
+
+        player_ids = [p["player_id"] for p in players]
+        index = {player_id: i for i, player_id in enumerate(player_ids)}
+        n = len(players)
+
+        # Performance: season grade x position value, 50 without a grade
+        grades = self._load_season_grades(season)
+        has_grade = np.array([pid in grades for pid in player_ids])
+        overall_grade = np.array([grades.get(pid) or 0.0 for pid in player_ids], dtype=float)
+        position_multipliers: Dict[str, float] = {}
+        for player in players:
+            position = player["position"]
+            if position not in position_multipliers:
+                position_multipliers[position] = POSITION_VALUE_MULTIPLIERS.get(
+                    get_position_abbreviation(position), 1.0
+                )
+        position_value = np.array([position_multipliers[p["position"]] for p in players])
+        performance = np.where(
+            has_grade, np.minimum(overall_grade * position_value, 100.0), 50.0
+        )
+
+        # Visibility, accumulated in the per-player order
+        visibility = np.ones(n)
+        for headline, boost in self._headline_boosts(season, week):
+            for player_id in dict.fromkeys(headline.player_ids):
+                i = index.get(player_id)
+                if i is not None:
+                    visibility[i] += boost
+        for boosts in self._award_race_boosts(season):
+            visibility += self._scatter(boosts, index, n)
+        for counts, boost in self._selection_counts(season):
+            visibility += self._scatter(counts, index, n) * boost
+        visibility = np.clip(visibility, VISIBILITY_FLOOR, VISIBILITY_CEILING)
+
+        # Market, once per team
+        market_by_team: Dict[int, float] = {}
+        for player in players:
+            team_id = player["team_id"]
+            if team_id not in market_by_team:
+                market_by_team[team_id] = self._calculator.calculate_market_multiplier(team_id)
+        market = np.array([market_by_team[p["team_id"]] for p in players])
+
+        # Scaled formula: performance 0-1, visibility 0.7-1.3x, market 0.9-1.2x
+        visibility_scaled = 0.7 + (visibility - 0.5) / 2.5 * 0.6
+        market_scaled = 0.9 + (market - 0.8) / 1.2 * 0.3
+        raw_score = performance / 100.0 * visibility_scaled * market_scaled * 100
+        final_score = np.clip(raw_score + WEEKLY_DECAY, 0.0, 100.0)
+
+        previous = self._load_previous_scores(season, week) if week > 1 else {}
+
+        scores = []
+        for i, player_id in enumerate(player_ids):
+            if not 0 <= performance[i] <= 100:
+                self._calculator._logger.error(
+                    f"Failed to calculate popularity for player {player_id}: "
+                    f"performance_score must be 0-100, got {performance[i]}"
+                )
+                continue
+            score = float(final_score[i])
+            week_change = score - previous[player_id] if player_id in previous else 0.0
+            scores.append({
+                "dynasty_id": self._dynasty_id,
+                "player_id": player_id,
+                "season": season,
+                "week": week,
+                "popularity_score": score,
+                "performance_score": float(performance[i]),
+                "visibility_multiplier": float(visibility[i]),
+                "market_multiplier": float(market[i]),
+                "week_change": week_change,
+                "trend": self._calculator.calculate_trend(player_id, season, week).value,
+                "tier": self._calculator.classify_tier(score).value,
+            })
+        return scores
+
+    # ========================================================================
+    # Loading
+    # ========================================================================
+
+    def _load_players(self) -> List[Dict[str, Any]]:
+        """Active rostered players with a primary position."""
+        rows = self._db.query_all(
+            """SELECT player_id, team_id, positions
+               FROM players
+               WHERE dynasty_id = ? AND team_id > 0 AND status = 'active'""",
+            (self._dynasty_id,)
+        )
+        players = []
+        for player_id, team_id, positions_json in rows:
+            positions = json.loads(positions_json) if positions_json else []
+            if not player_id or not positions:
+                continue
+            position = positions[0] if isinstance(positions, list) else positions
+            players.append({"player_id": player_id, "team_id": team_id, "position": position})
+        return players
+
+    def _load_recent_snaps(self, season: int, week: int) -> Dict[int, int]:
+        """Total snaps per player over the last SNAP_WINDOW_WEEKS weeks."""
+        start_week = max(1, week - SNAP_WINDOW_WEEKS + 1)
+        rows = self._db.query_all(
+            """SELECT player_id,
+                      SUM(offensive_snaps + defensive_snaps + special_teams_snaps)
+               FROM player_game_grades
+               WHERE dynasty_id = ? AND season = ? AND week BETWEEN ? AND ?
+               GROUP BY player_id""",
+            (self._dynasty_id, season, start_week, week)
+        )
+        return {player_id: int(total) for player_id, total in rows if total}
+
+    def _load_season_grades(self, season: int) -> Dict[int, Any]:
+        """Overall season grade per player (None when ungraded)."""
+        rows = self._db.query_all(
+            """SELECT player_id, overall_grade
+               FROM player_season_grades
+               WHERE dynasty_id = ? AND season = ?""",
+            (self._dynasty_id, season)
+        )
+        return {player_id: overall_grade for player_id, overall_grade in rows}
+
+    def _load_previous_scores(self, season: int, week: int) -> Dict[int, float]:
+        """Popularity scores from the previous week."""
+        rows = self._db.query_all(
+            """SELECT player_id, popularity_score
+               FROM player_popularity
+               WHERE dynasty_id = ? AND season = ? AND week = ?""",
+            (self._dynasty_id, season, week - 1)
+        )
+        return {player_id: score for player_id, score in rows}
+
+    # ========================================================================
+    # Visibility components
+    # ========================================================================
+
+    def _headline_boosts(self, season: int, week: int):
+        """(headline, boost) pairs in priority order."""
+        from .popularity_calculator import (
+            NATIONAL_HEADLINE_BOOST,
+            REGIONAL_HEADLINE_BOOST,
+            LOCAL_HEADLINE_BOOST,
+        )
+
+        for headline in self._calculator._media_api.get_headlines(self._dynasty_id, season, week):
+            if headline.priority > 80:
+                yield headline, NATIONAL_HEADLINE_BOOST
+            elif headline.priority >= 60:
+                yield headline, REGIONAL_HEADLINE_BOOST
+            else:
+                yield headline, LOCAL_HEADLINE_BOOST
+
+    def _award_race_boosts(self, season: int) -> List[Dict[int, float]]:
+        """MVP, OPOY and DPOY race boosts per player, in that order."""
+        from .popularity_calculator import (
+            MVP_TOP_3_BOOST,
+            MVP_TOP_10_BOOST,
+            AWARD_TOP_5_BOOST,
+        )
+
+        awards_api = self._calculator._awards_api
+        mvp: Dict[int, float] = {}
+        for nominee in awards_api.get_nominees(self._dynasty_id, season, 'MVP'):
+            if nominee.player_id in mvp:
+                continue
+            if nominee.nomination_rank <= 3:
+                mvp[nominee.player_id] = MVP_TOP_3_BOOST
+            elif nominee.nomination_rank <= 10:
+                mvp[nominee.player_id] = MVP_TOP_10_BOOST
+            else:
+                mvp[nominee.player_id] = 0.0
+
+        boosts = [mvp]
+        for award_id in ['OPOY', 'DPOY']:
+            boosts.append({
+                nominee.player_id: AWARD_TOP_5_BOOST
+                for nominee in awards_api.get_nominees(self._dynasty_id, season, award_id)
+                if nominee.nomination_rank <= 5
+            })
+        return boosts
+
+    def _selection_counts(self, season: int):
+        """(selections per player, boost) for All-Pro then Pro Bowl."""
+        from .popularity_calculator import ALL_PRO_BOOST, PRO_BOWL_BOOST
+
+        for table, boost in (("all_pro_selections", ALL_PRO_BOOST),
+                             ("pro_bowl_selections", PRO_BOWL_BOOST)):
+            rows = self._db.query_all(
+                f"""SELECT player_id, COUNT(*)
+                    FROM {table}
+                    WHERE dynasty_id = ? AND season = ?
+                    GROUP BY player_id""",
+                (self._dynasty_id, season)
+            )
+            yield {player_id: count for player_id, count in rows}, boost
+
+    @staticmethod
+    def _scatter(values: Dict[int, float], index: Dict[int, int], n: int) -> np.ndarray:
+        """Per-player values as an array aligned with the player index."""
+        array = np.zeros(n)
+        for player_id, value in values.items():
+            i = index.get(player_id)
+            if i is not None:
+                array[i] = value
+        return array
@@ -161,8 +161,8 @@ class PreseasonScheduleService:
                 DELETE FROM events
                 WHERE dynasty_id = ?
                 AND event_type = 'GAME'
-                AND json_extract(data, '$.parameters.season') = ?
-                AND json_extract(data, '$.parameters.season_type') = 'preseason'
+                AND game_season = ?
+                AND game_season_type = 'preseason'
                 """,
                 (self._dynasty_id, self._season),
             )
@@ -483,9 +483,9 @@ class PreseasonScheduleService:
                     SELECT data FROM events
                     WHERE dynasty_id = ?
                     AND event_type = 'GAME'
-                    AND json_extract(data, '$.parameters.season') = ?
-                    AND json_extract(data, '$.parameters.season_type') = 'preseason'
-                    AND CAST(json_extract(data, '$.parameters.week') AS INTEGER) = ?
+                    AND game_season = ?
+                    AND game_season_type = 'preseason'
+                    AND game_week = ?
                     ORDER BY timestamp
                     """,
                     (self._dynasty_id, self._season, week),
@@ -496,9 +496,9 @@ class PreseasonScheduleService:
                     SELECT data FROM events
                     WHERE dynasty_id = ?
                     AND event_type = 'GAME'
-                    AND json_extract(data, '$.parameters.season') = ?
-                    AND json_extract(data, '$.parameters.season_type') = 'preseason'
-                    ORDER BY json_extract(data, '$.parameters.week'), timestamp
+                    AND game_season = ?
+                    AND game_season_type = 'preseason'
+                    ORDER BY game_week, timestamp
                     """,
                     (self._dynasty_id, self._season),
                 )
@@ -0,0 +1,246 @@
+"""
+Progression Engine - League-wide training camp development as array operations.
+
+TrainingCampService.process_all_players() used to roll every position
+attribute of every player one at a time through
+AgeWeightedDevelopment.calculate_changes() and recalculate each overall
+from a copy of the attribute dict.
+
+ProgressionEngine lays the league out as a players x attributes matrix
+(one column per attribute in AgeWeightedDevelopment.POSITION_ATTRIBUTES)
+and applies the same rules with NumPy:
+
+- per-player age phase, distance-to-peak multiplier, position growth and
+  regression rates and archetype development curve
+- per-cell attribute category weights and improve/decline ranges
+  (AttributeCategoryParameters, including the mental super-veteran phase)
+- one draw of rolls and magnitudes for the whole league from a seeded
+  numpy Generator
+- diminishing returns, potential ceiling and rating floor
+- the new overall as the awareness-weighted mean of position attributes
+
+Usage:
+    engine = ProgressionEngine(AgeWeightedDevelopment(), seed=42)
+    progressions = engine.run(players)
+    progressions[0].changes, progressions[0].new_overall
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.constants.position_normalizer import normalize_position
+from src.transactions.transaction_constants import (
+    AttributeCategory,
+    AttributeCategoryParameters,
+    DevelopmentCurveModifiers,
+    get_attribute_category,
+)
+
+AGE_PHASES = ("young", "prime", "veteran")
+AWARENESS_WEIGHT = 1.5
+
+
+@dataclass
+class PlayerProgression:
+    """Training camp outcome for one player."""
+
+    changes: Dict[str, int]  # attribute_name -> change, in position attribute order
+    new_overall: int
+
+
+class ProgressionEngine:
+    """
+    Applies AgeWeightedDevelopment to the whole league at once.
+
+    Each player dict needs the values TrainingCampService prepares:
+    age, position, attributes, potential, archetype_id and age_category.
+    """
+
+    def __init__(self, algorithm: Any, seed: Optional[int] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            algorithm: AgeWeightedDevelopment instance (rules and constants)
+            seed: Seed for the numpy Generator (None for fresh entropy)
+        """
+        self._algorithm = algorithm
+        self._rng = np.random.default_rng(seed)
+
+        self._columns = sorted({
+            attr
+            for attrs in list(algorithm.POSITION_ATTRIBUTES.values()) + [['awareness']]
+            for attr in attrs
+        })
+        self._column_index = {attr: i for i, attr in enumerate(self._columns)}
+        categories = list(AttributeCategory)
+        self._column_category = np.array(
+            [categories.index(get_attribute_category(attr)) for attr in self._columns]
+        )
+        self._column_weight = np.array(
+            [AWARENESS_WEIGHT if attr == 'awareness' else 1.0 for attr in self._columns]
+        )
+
+        self._position_rates: Dict[str, tuple] = {}
+        self._curve_modifiers: Dict[Optional[str], dict] = {}
+
+    def run(self, players: List[Dict[str, Any]]) -> List[PlayerProgression]:
+        """
+        Calculate attribute changes and new overalls for every player.
+
+        Args:
+            players: Prepared player dicts (see class docstring)
+
+        Returns:
+            PlayerProgression per player, in input order
+        """
+        n = len(players)
+        if n == 0:
+            return []
+        m = len(self._columns)
+
+        values = np.zeros((n, m))
+        active = np.zeros((n, m), dtype=bool)
+        phase = np.zeros(n, dtype=int)
+        ages = np.zeros(n, dtype=int)
+        potential = np.zeros(n, dtype=int)
+        base_improve = np.zeros((n, 2), dtype=int)
+        base_decline = np.zeros((n, 2), dtype=int)
+        relevant_columns: List[List[int]] = []
+
+        for i, player in enumerate(players):
+            attributes = player["attributes"]
+            phase[i] = AGE_PHASES.index(player["age_category"].value)
+            ages[i] = player["age"]
+            potential[i] = player["potential"]
+
+            position_key = normalize_position(player["position"])
+            columns = []
+            for attr in self._algorithm.POSITION_ATTRIBUTES.get(position_key, ['awareness']):
+                value = attributes.get(attr)
+                if isinstance(value, (int, float)):
+                    column = self._column_index[attr]
+                    values[i, column] = value
+                    active[i, column] = True
+                    columns.append(column)
+            relevant_columns.append(columns)
+
+            if phase[i] == 0:
+                base_improve[i] = self._base_range(player, positive=True)
+            elif phase[i] == 2:
+                base_decline[i] = self._base_range(player, positive=False)
+
+        current = np.trunc(values).astype(int)
+
+        # Attribute category parameters for each (category, phase, age)
+        unique_ages, age_index = np.unique(ages, return_inverse=True)
+        params = self._category_parameters(unique_ages)
+        cell = (self._column_category[None, :], phase[:, None], age_index[:, None])
+        improve_chance = params["improve_chance"][cell]
+        decline_chance = params["decline_chance"][cell]
+        improve_low = params["improve_low"][cell]
+        improve_high = params["improve_high"][cell]
+        decline_low = params["decline_low"][cell]
+        decline_high = params["decline_high"][cell]
+
+        # Young players blend in their growth range, veterans their regression range
+        young = (phase == 0)[:, None]
+        veteran = (phase == 2)[:, None]
+        improve_low = np.where(young, np.maximum(improve_low, base_improve[:, :1]), improve_low)
+        improve_high = np.where(young, np.maximum(improve_high, base_improve[:, 1:]), improve_high)
+        decline_low = np.where(veteran, np.minimum(decline_low, base_decline[:, :1]), decline_low)
+        decline_high = np.where(veteran, np.minimum(decline_high, base_decline[:, 1:]), decline_high)
+
+        rolls = self._rng.random((n, m))
+        improve_draw = self._rng.integers(improve_low, improve_high + 1)
+        decline_draw = self._rng.integers(decline_low, decline_high + 1)
+
+        improves = active & (rolls < improve_chance)
+        declines = active & ~improves & (rolls < improve_chance + decline_chance)
+
+        improvement = np.where(
+            current >= self._algorithm.DIMINISHING_RETURNS_THRESHOLD,
+            np.maximum(1, improve_draw // 2),
+            improve_draw,
+        )
+        improvement = np.minimum(improvement, potential[:, None] - current)
+        decline = np.maximum(decline_draw, self._algorithm.RATING_FLOOR - current)
+
+        changes = np.where(improves & (improvement > 0), improvement, 0)
+        changes = np.where(declines & (decline < 0), decline, changes)
+
+        # New overall: awareness-weighted mean of the position attributes
+        new_values = np.where(
+            changes != 0,
+            np.clip(current + changes, self._algorithm.RATING_FLOOR, self._algorithm.RATING_CEILING),
+            values,
+        )
+        weights = np.where(active, self._column_weight[None, :], 0.0)
+        weight_totals = weights.sum(axis=1)
+        new_overalls = np.rint(
+            (new_values * weights).sum(axis=1) / np.where(weight_totals > 0, weight_totals, 1.0)
+        ).astype(int)
+
+        progressions = []
+        for i, player in enumerate(players):
+            player_changes = {
+                self._columns[column]: int(changes[i, column])
+                for column in relevant_columns[i]
+                if changes[i, column] != 0
+            }
+            if weight_totals[i] > 0:
+                new_overall = int(new_overalls[i])
+            else:
+                new_overall = int(player["attributes"].get("overall", 70))
+            progressions.append(PlayerProgression(player_changes, new_overall))
+        return progressions
+
+    def _base_range(self, player: Dict[str, Any], positive: bool) -> tuple:
+        """Position growth (or regression) range scaled by curve and distance to peak."""
+        position = player["position"]
+        if position not in self._position_rates:
+            from src.game_cycle.services.training_camp_service import PositionPeakAges
+            self._position_rates[position] = (
+                PositionPeakAges.get_peak_ages(position) + PositionPeakAges.get_growth_rates(position)
+            )
+        peak_start, peak_end, growth_rate, regression_rate = self._position_rates[position]
+
+        archetype_id = player.get("archetype_id")
+        if archetype_id not in self._curve_modifiers:
+            curve = self._algorithm._get_archetype_development_curve(archetype_id)
+            self._curve_modifiers[archetype_id] = DevelopmentCurveModifiers.get_modifiers(curve)
+        curve_modifiers = self._curve_modifiers[archetype_id]
+
+        age = player["age"]
+        if positive:
+            distance_multiplier = 1.0 + min(0.5, 0.1 * (peak_start - age))
+            effective_rate = growth_rate * curve_modifiers["growth"] * distance_multiplier
+        else:
+            distance_multiplier = 1.0 + min(0.5, 0.1 * (age - peak_end))
+            effective_rate = regression_rate * curve_modifiers["decline"] * distance_multiplier
+        return self._algorithm._rate_to_range(effective_rate, positive=positive)
+
+    def _category_parameters(self, unique_ages: np.ndarray) -> Dict[str, np.ndarray]:
+        """Weights and ranges indexed by [category, phase, age index]."""
+        categories = list(AttributeCategory)
+        shape = (len(categories), len(AGE_PHASES), len(unique_ages))
+        params = {
+            "improve_chance": np.zeros(shape),
+            "decline_chance": np.zeros(shape),
+            "improve_low": np.zeros(shape, dtype=int),
+            "improve_high": np.zeros(shape, dtype=int),
+            "decline_low": np.zeros(shape, dtype=int),
+            "decline_high": np.zeros(shape, dtype=int),
+        }
+        for c, category in enumerate(categories):
+            for p, phase in enumerate(AGE_PHASES):
+                for a, age in enumerate(unique_ages):
+                    cat_params = AttributeCategoryParameters.get_params(category, phase, int(age))
+                    improve_chance, _, decline_chance = cat_params["weights"]
+                    params["improve_chance"][c, p, a] = improve_chance
+                    params["decline_chance"][c, p, a] = decline_chance
+                    params["improve_low"][c, p, a], params["improve_high"][c, p, a] = cat_params["improve_range"]
+                    params["decline_low"][c, p, a], params["decline_high"][c, p, a] = cat_params["decline_range"]
+        return params
@@ -37,6 +37,7 @@ from game_cycle.models.persistent_gm_proposal import (
 )
 from game_cycle.models.proposal_enums import ProposalType, ProposalStatus
 from game_cycle.services.trade_service import TradeService
+from transactions.league_asset_index import LeagueAsset, LeagueAssetIndex
 from transactions.models import TradeDecisionType
 
 
@@ -131,6 +132,7 @@ class TradeProposalGenerator:
         season: int,
         team_id: int,
         directives: OwnerDirectives,
+        asset_index: Optional[LeagueAssetIndex] = None,
     ):
         """
         Initialize the trade proposal generator.
@@ -141,6 +143,9 @@ class TradeProposalGenerator:
             season: Current season year
             team_id: User's team ID
             directives: Owner's strategic directives
+            asset_index: League asset index from _build_asset_index() to share
+                between generators in the same trade window (built lazily
+                if None)
         """
         self._db_path = db_path
         self._dynasty_id = dynasty_id
@@ -158,6 +163,11 @@ class TradeProposalGenerator:
         self._stats_cache: Dict[int, Dict[str, Any]] = {}  # player_id -> stats
         self._stats_api = None  # Lazy-loaded
 
+        # League-wide index for target searches (position/OVR range lookups)
+        self._asset_index = asset_index
+        if asset_index is not None:
+            self._cache_index_players(asset_index)
+
     def _get_stats_api(self):
         """Lazy-load the PlayerSeasonStatsAPI."""
         if self._stats_api is None:
@@ -344,6 +354,51 @@ class TradeProposalGenerator:
             self._players_cache[team_id] = self._get_trade_service().get_tradeable_players(team_id)
         return self._players_cache[team_id]
 
+    def _get_asset_index(self) -> LeagueAssetIndex:
+        """
+        Get the league asset index, loading every team's players in one query.
+
+        Also fills the per-team players cache, so later _get_team_players()
+        calls need no queries.
+        """
+        if self._asset_index is None:
+            self._asset_index = self._build_asset_index(
+                self._get_trade_service().get_league_tradeable_players()
+            )
+            self._cache_index_players(self._asset_index)
+        return self._asset_index
+
+    def _build_asset_index(
+        self,
+        players_by_team: Dict[int, List[Dict[str, Any]]]
+    ) -> LeagueAssetIndex:
+        """Index TradeService tradeable player dicts by normalized position."""
+        assets = []
+        for team_id in self.ALL_TEAM_IDS:
+            for player in players_by_team.get(team_id, []):
+                assets.append(LeagueAsset(
+                    player_id=player["player_id"],
+                    team_id=team_id,
+                    position=self._normalize_position(player.get("position")),
+                    overall=extract_overall_rating(player, default=0),
+                    age=player.get("age", 99),
+                    cap_hit=player.get("cap_hit", 0),
+                    years_remaining=player.get("contract_years_remaining") or 0,
+                    player=player,
+                ))
+        return LeagueAssetIndex(assets)
+
+    def _cache_index_players(self, index: LeagueAssetIndex) -> None:
+        """Fill the players cache from an asset index."""
+        for team_id in self.ALL_TEAM_IDS:
+            assets = sorted(index.team_assets(team_id), key=self._league_order)
+            self._players_cache.setdefault(team_id, [a.player for a in assets])
+
+    @staticmethod
+    def _league_order(asset: LeagueAsset) -> Tuple[int, int, str]:
+        """Team by team, in get_tradeable_players() order (OVR desc, position)."""
+        return (asset.team_id, -asset.overall, str(asset.player.get("position") or ""))
+
     def _get_team_picks(self, team_id: int) -> List[Dict[str, Any]]:
         """
         Get tradeable picks for a team (with lazy caching).
@@ -457,32 +512,26 @@ class TradeProposalGenerator:
         current_ovr = need["current_ovr"]
         min_target_ovr = current_ovr + min_improvement
 
+        # Must match position, be high enough OVR, and not too old
+        matches = self._get_asset_index().find(
+            [position],
+            min_overall=min_target_ovr,
+            max_age=self.MAX_AGE_WIN_NOW,
+            exclude_team_id=self._team_id,
+        )
+
         candidates = []
-        for team_id in self.ALL_TEAM_IDS:
-            if team_id == self._team_id:
+        for asset in sorted(matches, key=self._league_order):
+            # Skip untouchable players
+            if self._is_untouchable(asset.player):
                 continue
 
-            for player in self._get_team_players(team_id):
-                # Skip untouchable players
-                if self._is_untouchable(player):
-                    continue
-
-                player_pos = self._normalize_position(player.get("position"))
-                player_ovr = extract_overall_rating(player, default=0)
-                player_age = player.get("age", 99)
-
-                # Must match position, be high enough OVR, and not too old
-                if (
-                    player_pos == position
-                    and player_ovr >= min_target_ovr
-                    and player_age <= self.MAX_AGE_WIN_NOW
-                ):
-                    candidates.append({
-                        **player,
-                        "team_id": team_id,
-                        "team_name": self._get_team_name(team_id),
-                        "improvement": player_ovr - current_ovr,
-                    })
+            candidates.append({
+                **asset.player,
+                "team_id": asset.team_id,
+                "team_name": self._get_team_name(asset.team_id),
+                "improvement": asset.overall - current_ovr,
+            })
 
         # v1.3: Deterministic shuffle based on team_id for variety
         # This ensures different teams prioritize different candidates
@@ -884,35 +933,28 @@ class TradeProposalGenerator:
         Returns:
             Best target dict with team info, or None
         """
-        best_target: Optional[Dict[str, Any]] = None
-        best_ovr = min_overall - 1
-
-        for team_id in self.ALL_TEAM_IDS:
-            if team_id == self._team_id:
-                continue
-
-            # Use cache for team players
-            players = self._get_team_players(team_id)
-            for player in players:
-                # Skip untouchable players (v1.2 - trade realism)
-                if self._is_untouchable(player):
-                    continue
-
-                # Normalize position for comparison (handles JSON array format)
-                player_pos = self._normalize_position(player.get("position"))
-                target_pos = position.upper()
-
-                if (
-                    player_pos == target_pos
-                    and extract_overall_rating(player, default=0) >= min_overall
-                    and player.get("age", 99) <= max_age
-                    and extract_overall_rating(player, default=0) > best_ovr
-                ):
-                    best_target = player.copy()
-                    best_target["team_id"] = team_id
-                    best_target["team_name"] = self._get_team_name(team_id)
-                    best_ovr = extract_overall_rating(player, default=0)
+        # Highest OVR first; ties go to the first team/roster slot
+        matches = self._get_asset_index().find(
+            [position.upper()],
+            min_overall=min_overall,
+            max_age=max_age,
+            exclude_team_id=self._team_id,
+        )
+        eligible = [
+            asset for asset in matches
+            # Skip untouchable players (v1.2 - trade realism)
+            if not self._is_untouchable(asset.player)
+        ]
+        if not eligible:
+            return None
 
+        best = min(
+            (asset for asset in eligible if asset.overall == eligible[0].overall),
+            key=self._league_order
+        )
+        best_target = best.player.copy()
+        best_target["team_id"] = best.team_id
+        best_target["team_name"] = self._get_team_name(best.team_id)
         return best_target
 
     def _construct_acquisition_package(
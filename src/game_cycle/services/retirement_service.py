@@ -370,7 +370,33 @@ class RetirementService:
         except Exception as e:
             self._logger.error(f"Error getting all players: {e}")
 
-        return all_players
+        # Retired players are left with team_id = 0 and come back as free agents
+        retired_ids = self._get_retired_player_ids()
+        return [p for p in all_players if p['player_id'] not in retired_ids]
+
+    def _get_retired_player_ids(self) -> Set[int]:
+        """
+        Get IDs of players already retired in this dynasty.
+
+        Returns:
+            Set of retired player IDs
+        """
+        retired_ids = set()
+        conn = sqlite3.connect(self._db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT player_id FROM retired_players WHERE dynasty_id = ?",
+                (self._dynasty_id,)
+            )
+            retired_ids = {row[0] for row in cursor.fetchall()}
+
+        except Exception as e:
+            self._logger.debug(f"Error getting retired player IDs: {e}")
+        finally:
+            conn.close()
+
+        return retired_ids
 
     # =========================================================================
     # Internal Methods - Context Building
@@ -503,8 +529,8 @@ class RetirementService:
         )
 
         # Insert into database using direct sqlite3 to avoid migration issues
+        conn = sqlite3.connect(self._db_path)
         try:
-            conn = sqlite3.connect(self._db_path)
             cursor = conn.cursor()
 
             # Insert retired player record
@@ -577,10 +603,12 @@ class RetirementService:
             ))
 
             conn.commit()
-            conn.close()
         except Exception as e:
             self._logger.error(f"Error inserting retirement records: {e}")
             raise
+        finally:
+            # A failed INSERT leaves its write transaction open until closed
+            conn.close()
 
         # Remove from roster if on a team
         if team_id > 0:
@@ -0,0 +1,338 @@
+"""
+Schedule Solver - Constraint propagation for bye weeks and week assignment.
+
+NFLScheduleGenerator used to place games with up to 10 outer x 100 inner
+randomized greedy attempts, swap chains and a full backtracking fallback,
+reseeding the global random module (random.seed(attempt * 12345)) inside
+those loops. Generation time depended on luck, and the reseeding clobbered
+randomness for everything else running in the process.
+
+ScheduleSolver treats week assignment as a constraint problem:
+
+- one bitmask domain per game: the weeks both teams still have free
+  (every team plays exactly once in each of its non-bye weeks)
+- most-constrained-first: always branch on the game with the fewest
+  possible weeks, ties broken by a per-solve random priority
+- forward checking: placing a game removes its week from every game that
+  shares a team, and fails as soon as a game has no week left or a team
+  has a free week none of its remaining games can fill
+- a team week that only one game can fill is assigned immediately
+- a node budget per search, with a bounded number of reshuffled restarts
+
+Bye weeks are solved the same way: an even number of teams per week (so
+every playing team has an opponent), at most four per week and two per
+division.
+
+All randomness comes from the solver's own random.Random.
+
+Usage:
+    solver = ScheduleSolver(seed=f"{dynasty_id}:{season}")
+    byes = solver.assign_byes(divisions, first_week=5, last_week=14)
+    weeks = solver.assign_weeks([(home, away), ...], byes, total_weeks=18)
+"""
+
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_MAX_NODES = 1000
+DEFAULT_MAX_RESTARTS = 50
+
+
+class ScheduleSolverError(ValueError):
+    """Raised when no schedule is found within the search budget."""
+
+
+class _SearchExhausted(Exception):
+    """Node budget for one search used up."""
+
+
+class ScheduleSolver:
+    """
+    Deterministic bye week and week-assignment solver.
+
+    The same seed and inputs always give the same schedule.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[object] = None,
+        max_nodes: int = DEFAULT_MAX_NODES,
+        max_restarts: int = DEFAULT_MAX_RESTARTS
+    ):
+        """
+        Initialize the solver.
+
+        Args:
+            seed: Seed for the solver's private random.Random
+            max_nodes: Search nodes allowed per attempt
+            max_restarts: Reshuffled attempts before giving up
+        """
+        self._rng = random.Random(seed)
+        self.max_nodes = max_nodes
+        self.max_restarts = max_restarts
+        self.nodes = 0  # Nodes used by the last solve, across restarts
+
+    # -------------------- Bye Weeks --------------------
+
+    def assign_byes(
+        self,
+        divisions: Dict[int, List[int]],
+        first_week: int,
+        last_week: int,
+        max_per_week: int = 4,
+        max_per_division: int = 2
+    ) -> Dict[int, int]:
+        """
+        Assign one bye week to every team.
+
+        Weeks get an even number of byes (largest allowed count first, the
+        rest at two), spread randomly across the bye window.
+
+        Args:
+            divisions: division_id -> team_ids
+            first_week: First week a bye may fall in
+            last_week: Last week a bye may fall in
+            max_per_week: Most teams on bye in one week (even)
+            max_per_division: Most teams of one division on bye in one week
+
+        Returns:
+            team_id -> bye week
+
+        Raises:
+            ScheduleSolverError: If the constraints cannot be met
+        """
+        weeks = list(range(first_week, last_week + 1))
+        teams = sum(len(team_ids) for team_ids in divisions.values())
+        capacity = self._bye_capacities(teams, len(weeks), max_per_week)
+        if capacity is None:
+            raise ScheduleSolverError(
+                f"Cannot give {teams} teams even bye counts of at most {max_per_week} "
+                f"over {len(weeks)} weeks"
+            )
+        self._rng.shuffle(capacity)
+        week_capacity = dict(zip(weeks, capacity))
+
+        division_of = {t: d for d, team_ids in divisions.items() for t in team_ids}
+        order = list(division_of)
+        self._rng.shuffle(order)
+        division_counts = {d: {w: 0 for w in weeks} for d in divisions}
+        byes: Dict[int, int] = {}
+        self.nodes = 0
+
+        def search(index: int) -> bool:
+            self.nodes += 1
+            if index == len(order):
+                return True
+            team_id = order[index]
+            division_id = division_of[team_id]
+            candidates = [
+                w for w in weeks
+                if week_capacity[w] > 0 and division_counts[division_id][w] < max_per_division
+            ]
+            # Fill the emptiest weeks first, random among equals
+            self._rng.shuffle(candidates)
+            candidates.sort(key=lambda w: -week_capacity[w])
+            for week in candidates:
+                byes[team_id] = week
+                week_capacity[week] -= 1
+                division_counts[division_id][week] += 1
+                if search(index + 1):
+                    return True
+                week_capacity[week] += 1
+                division_counts[division_id][week] -= 1
+                del byes[team_id]
+            return False
+
+        if not search(0):
+            raise ScheduleSolverError("No bye week assignment satisfies the division limit")
+        return byes
+
+    @staticmethod
+    def _bye_capacities(teams: int, weeks: int, max_per_week: int) -> Optional[List[int]]:
+        """Even bye counts per week summing to teams (max_per_week first)."""
+        if teams % 2 or max_per_week < 2:
+            return None
+        full = max_per_week - max_per_week % 2
+        for fours in range(min(weeks, teams // full), -1, -1):
+            rest = teams - fours * full
+            twos, remainder = divmod(rest, 2)
+            if remainder == 0 and fours + twos <= weeks and (full > 2 or twos == 0):
+                return [full] * fours + [2] * twos + [0] * (weeks - fours - twos)
+        return None
+
+    # -------------------- Week Assignment --------------------
+
+    def assign_weeks(
+        self,
+        games: Sequence[Tuple[int, int]],
+        bye_weeks: Dict[int, int],
+        total_weeks: int
+    ) -> List[int]:
+        """
+        Assign every game to a week.
+
+        Every team must play exactly once in each week except its bye
+        (teams without a bye play every week).
+
+        Args:
+            games: (home_team_id, away_team_id) per game
+            bye_weeks: team_id -> bye week
+            total_weeks: Number of weeks (1..total_weeks)
+
+        Returns:
+            Week per game, in input order
+
+        Raises:
+            ScheduleSolverError: If no assignment is found within the budget
+        """
+        teams = sorted({t for game in games for t in game})
+        full = ((1 << total_weeks) - 1) << 1  # Bits 1..total_weeks
+        team_free = {t: full & ~(1 << bye_weeks[t]) if t in bye_weeks else full for t in teams}
+        games_of: Dict[int, List[int]] = {t: [] for t in teams}
+        for g, (home, away) in enumerate(games):
+            games_of[home].append(g)
+            games_of[away].append(g)
+        for t in teams:
+            if len(games_of[t]) != bin(team_free[t]).count("1"):
+                raise ScheduleSolverError(
+                    f"Team {t} has {len(games_of[t])} games for "
+                    f"{bin(team_free[t]).count('1')} open weeks"
+                )
+
+        self.nodes = 0
+        for _ in range(self.max_restarts):
+            priority = [self._rng.random() for _ in games]
+            week_order = list(range(1, total_weeks + 1))
+            self._rng.shuffle(week_order)
+            search = _WeekSearch(games, games_of, dict(team_free), priority, week_order, self.max_nodes)
+            try:
+                weeks = search.run()
+            except _SearchExhausted:
+                weeks = None
+            self.nodes += search.nodes
+            if weeks is not None:
+                return weeks
+        raise ScheduleSolverError(
+            f"No week assignment found in {self.max_restarts} searches of {self.max_nodes} nodes"
+        )
+
+
+class _WeekSearch:
+    """One depth-first search over game domains."""
+
+    def __init__(self, games, games_of, team_free, priority, week_order, max_nodes):
+        self.games = games
+        self.games_of = games_of
+        self.priority = priority
+        self.week_order = week_order
+        self.max_nodes = max_nodes
+        self.nodes = 0
+
+        self.week = [0] * len(games)
+        self.team_free = team_free
+        self.domain = [team_free[h] & team_free[a] for h, a in games]
+
+    def run(self) -> Optional[List[int]]:
+        """Weeks per game, or None if the search space is exhausted."""
+        if not self._propagate(set(self.team_free)):
+            return None
+        if self._search():
+            return list(self.week)
+        return None
+
+    def _search(self) -> bool:
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise _SearchExhausted()
+
+        unassigned = [g for g in range(len(self.games)) if not self.week[g]]
+        if not unassigned:
+            return True
+        domain = self.domain
+        priority = self.priority
+        game = min(unassigned, key=lambda g: (bin(domain[g]).count("1"), priority[g]))
+
+        for week in self.week_order:
+            if not domain[game] & (1 << week):
+                continue
+            saved = (list(self.week), list(domain), dict(self.team_free))
+            if self._place(game, week) and self._search():
+                return True
+            self.week, self.domain, self.team_free = saved
+            domain = self.domain
+        return False
+
+    def _place(self, game: int, week: int) -> bool:
+        """Place a game and propagate; False on a dead end."""
+        pending = [(game, week)]
+        while pending:
+            game, week = pending.pop()
+            if self.week[game]:
+                if self.week[game] != week:
+                    return False
+                continue
+            bit = 1 << week
+            if not self.domain[game] & bit:
+                return False
+            home, away = self.games[game]
+            self.week[game] = week
+            self.domain[game] = 0
+            self.team_free[home] &= ~bit
+            self.team_free[away] &= ~bit
+
+            touched = {home, away}
+            for team in (home, away):
+                for other in self.games_of[team]:
+                    if not self.week[other] and self.domain[other] & bit:
+                        self.domain[other] &= ~bit
+                        if not self.domain[other]:
+                            return False
+                        touched.update(self.games[other])
+            forced = self._check_teams(touched)
+            if forced is None:
+                return False
+            pending.extend(forced)
+        return True
+
+    def _propagate(self, teams) -> bool:
+        """Initial consistency check and forced placements."""
+        forced = self._check_teams(teams)
+        if forced is None:
+            return False
+        for game, week in forced:
+            if not self._place(game, week):
+                return False
+        return True
+
+    def _check_teams(self, teams) -> Optional[List[Tuple[int, int]]]:
+        """
+        Every free week of each team must be fillable.
+
+        Returns:
+            (game, week) placements forced by a week only one game can
+            fill, or None on a dead end
+        """
+        forced = []
+        for team in teams:
+            free = self.team_free[team]
+            if not free:
+                continue
+            seen_once = 0
+            seen_twice = 0
+            for g in self.games_of[team]:
+                if not self.week[g]:
+                    d = self.domain[g]
+                    seen_twice |= seen_once & d
+                    seen_once |= d
+            if seen_once & free != free:
+                return None
+            single = free & ~seen_twice
+            while single:
+                bit = single & -single
+                single ^= bit
+                week = bit.bit_length() - 1
+                for g in self.games_of[team]:
+                    if not self.week[g] and self.domain[g] & bit:
+                        forced.append((g, week))
+                        break
+        return forced
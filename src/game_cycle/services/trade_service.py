@@ -101,6 +101,31 @@ class TradeService:
     # Asset Queries
     # =========================================================================
 
+    # Columns of get_tradeable_players() / get_league_tradeable_players()
+    _TRADEABLE_PLAYER_SELECT = """
+        SELECT
+            p.player_id,
+            p.team_id,
+            p.first_name,
+            p.last_name,
+            p.positions as position,
+            json_extract(p.attributes, '$.overall') as overall_rating,
+            ? - CAST(substr(p.birthdate, 1, 4) AS INTEGER) as age,
+            p.years_pro,
+            pc.contract_id,
+            pc.end_year - ? as years_remaining,
+            json_extract(cyd.base_salary, '$') as base_salary,
+            json_extract(cyd.total_cap_hit, '$') as cap_hit
+        FROM players p
+        LEFT JOIN player_contracts pc ON p.player_id = pc.player_id
+            AND pc.dynasty_id = p.dynasty_id
+            AND pc.is_active = 1
+        LEFT JOIN contract_year_details cyd ON pc.contract_id = cyd.contract_id
+            AND cyd.season_year = ?
+        WHERE p.dynasty_id = ?
+            AND COALESCE(p.status, 'active') != 'IR'
+    """
+
     def get_tradeable_players(self, team_id: int) -> List[Dict[str, Any]]:
         """
         Get players on a team's roster who are eligible for trade.
@@ -117,58 +142,70 @@ class TradeService:
         """
         conn = self._get_connection()
         try:
-            cursor = conn.execute("""
-                SELECT
-                    p.player_id,
-                    p.first_name,
-                    p.last_name,
-                    p.positions as position,
-                    json_extract(p.attributes, '$.overall') as overall_rating,
-                    ? - CAST(substr(p.birthdate, 1, 4) AS INTEGER) as age,
-                    p.years_pro,
-                    pc.contract_id,
-                    pc.end_year - ? as years_remaining,
-                    json_extract(cyd.base_salary, '$') as base_salary,
-                    json_extract(cyd.total_cap_hit, '$') as cap_hit
-                FROM players p
-                LEFT JOIN player_contracts pc ON p.player_id = pc.player_id
-                    AND pc.dynasty_id = p.dynasty_id
-                    AND pc.is_active = 1
-                LEFT JOIN contract_year_details cyd ON pc.contract_id = cyd.contract_id
-                    AND cyd.season_year = ?
-                WHERE p.dynasty_id = ?
+            cursor = conn.execute(
+                self._TRADEABLE_PLAYER_SELECT + """
                     AND p.team_id = ?
-                    AND COALESCE(p.status, 'active') != 'IR'
                 ORDER BY json_extract(p.attributes, '$.overall') DESC, p.positions
-            """, (self._season, self._season, self._season, self._dynasty_id, team_id))
+                """,
+                (self._season, self._season, self._season, self._dynasty_id, team_id)
+            )
+            return [self._tradeable_player_from_row(row) for row in cursor.fetchall()]
 
-            players = []
-            for row in cursor.fetchall():
-                # Calculate age from years_pro if birthdate not available
-                age = row["age"]
-                if age is None:
-                    age = 22 + (row["years_pro"] or 0)
-
-                players.append({
-                    "player_id": row["player_id"],
-                    "first_name": row["first_name"],
-                    "last_name": row["last_name"],
-                    "name": f"{row['first_name']} {row['last_name']}",
-                    "position": row["position"],
-                    "overall_rating": row["overall_rating"] or 70,
-                    "age": age,
-                    "years_pro": row["years_pro"] or 0,
-                    "contract_id": row["contract_id"],
-                    "contract_years_remaining": row["years_remaining"],
-                    "base_salary": row["base_salary"] or 0,
-                    "cap_hit": row["cap_hit"] or 0,
-                })
+        finally:
+            conn.close()
+
+    def get_league_tradeable_players(self) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Get the tradeable players of all 32 teams in one query.
+
+        Same dicts and per-team ordering as get_tradeable_players().
+
+        Returns:
+            Dict mapping team_id to list of player dicts
+        """
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(
+                self._TRADEABLE_PLAYER_SELECT + """
+                    AND p.team_id BETWEEN 1 AND 32
+                ORDER BY p.team_id, json_extract(p.attributes, '$.overall') DESC, p.positions
+                """,
+                (self._season, self._season, self._season, self._dynasty_id)
+            )
 
-            return players
+            players_by_team: Dict[int, List[Dict[str, Any]]] = {}
+            for row in cursor.fetchall():
+                players_by_team.setdefault(row["team_id"], []).append(
+                    self._tradeable_player_from_row(row)
+                )
+            return players_by_team
 
         finally:
             conn.close()
 
+    @staticmethod
+    def _tradeable_player_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Build a tradeable player dict from a _TRADEABLE_PLAYER_SELECT row."""
+        # Calculate age from years_pro if birthdate not available
+        age = row["age"]
+        if age is None:
+            age = 22 + (row["years_pro"] or 0)
+
+        return {
+            "player_id": row["player_id"],
+            "first_name": row["first_name"],
+            "last_name": row["last_name"],
+            "name": f"{row['first_name']} {row['last_name']}",
+            "position": row["position"],
+            "overall_rating": row["overall_rating"] or 70,
+            "age": age,
+            "years_pro": row["years_pro"] or 0,
+            "contract_id": row["contract_id"],
+            "contract_years_remaining": row["years_remaining"],
+            "base_salary": row["base_salary"] or 0,
+            "cap_hit": row["cap_hit"] or 0,
+        }
+
     def get_tradeable_picks(
         self,
         team_id: int,
@@ -720,6 +757,10 @@ class TradeService:
 
             conn.commit()
 
+            # Both rosters changed - drop cached simulation rosters
+            from team_management.team_data_cache import invalidate_team_data
+            invalidate_team_data(self._dynasty_id, (proposal.team1_id, proposal.team2_id))
+
         except Exception as e:
             conn.rollback()
             self._logger.error(f"Trade execution failed: {e}")
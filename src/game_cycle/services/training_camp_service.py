@@ -226,6 +226,10 @@ class AgeWeightedDevelopment:
     RATING_CEILING = 99
     DIMINISHING_RETURNS_THRESHOLD = 90
 
+    def __init__(self):
+        # Archetype registry, loaded on first lookup and reused for every player
+        self._archetype_registry = None
+
     def get_age_category(
         self,
         age: int,
@@ -288,9 +292,7 @@ class AgeWeightedDevelopment:
         Returns None if archetype not found or registry not available.
         """
         try:
-            from src.player_generation.archetypes.archetype_registry import ArchetypeRegistry
-            registry = ArchetypeRegistry()
-            archetype = registry.get_archetype(archetype_id)
+            archetype = self._get_archetype(archetype_id)
             if archetype and hasattr(archetype, 'peak_age_range') and archetype.peak_age_range:
                 return archetype.peak_age_range
         except Exception:
@@ -298,6 +300,13 @@ class AgeWeightedDevelopment:
             pass
         return None
 
+    def _get_archetype(self, archetype_id: str):
+        """Look up an archetype, loading the archetype registry on first use."""
+        if self._archetype_registry is None:
+            from src.player_generation.archetypes.archetype_registry import ArchetypeRegistry
+            self._archetype_registry = ArchetypeRegistry()
+        return self._archetype_registry.get_archetype(archetype_id)
+
     def _get_archetype_development_curve(self, archetype_id: Optional[str]) -> str:
         """
         Look up development curve from archetype registry.
@@ -313,9 +322,7 @@ class AgeWeightedDevelopment:
             return "normal"
 
         try:
-            from src.player_generation.archetypes.archetype_registry import ArchetypeRegistry
-            registry = ArchetypeRegistry()
-            archetype = registry.get_archetype(archetype_id)
+            archetype = self._get_archetype(archetype_id)
             if archetype and hasattr(archetype, 'development_curve') and archetype.development_curve:
                 return archetype.development_curve
         except Exception:
@@ -504,7 +511,8 @@ class TrainingCampService:
         db_path: str,
         dynasty_id: str,
         season: int,
-        algorithm: Optional[DevelopmentAlgorithm] = None
+        algorithm: Optional[DevelopmentAlgorithm] = None,
+        seed: Optional[int] = None
     ):
         """
         Initialize the training camp service.
@@ -514,11 +522,14 @@ class TrainingCampService:
             dynasty_id: Dynasty identifier
             season: Current season year
             algorithm: Optional custom development algorithm (default: AgeWeightedDevelopment)
+            seed: Optional seed for the league-wide progression engine
+                  (default: drawn from the random module, so random.seed() still applies)
         """
         self._db_path = db_path
         self._dynasty_id = dynasty_id
         self._season = season
         self._algorithm = algorithm or AgeWeightedDevelopment()
+        self._seed = seed
         self._logger = logging.getLogger(__name__)
         self._history_api = ProgressionHistoryAPI(db_path)
 
@@ -541,10 +552,13 @@ class TrainingCampService:
 
         self._logger.info(f"Processing training camp for {len(players)} players")
 
-        for player in players:
-            result = self._process_single_player(player)
-            all_results.append(result)
+        if type(self._algorithm) is AgeWeightedDevelopment:
+            # Default algorithm: whole league at once as array operations
+            all_results = self._process_players_batch(players)
+        else:
+            all_results = [self._process_single_player(player) for player in players]
 
+        for result in all_results:
             team_id = result.team_id
             if team_id not in results_by_team:
                 results_by_team[team_id] = []
@@ -593,12 +607,35 @@ class TrainingCampService:
 
     def _process_single_player(self, player: Dict[str, Any]) -> PlayerDevelopmentResult:
         """Process training camp for a single player."""
-        player_id = player.get("player_id")
-        first_name = player.get("first_name", "")
-        last_name = player.get("last_name", "")
-        player_name = f"{first_name} {last_name}".strip()
-        team_id = player.get("team_id", 0)
+        prepared = self._prepare_player(player)
+
+        # Calculate attribute changes with potential ceiling and development curve
+        changes_dict = self._algorithm.calculate_changes(
+            prepared["age"], prepared["position"], prepared["attributes"],
+            potential=prepared["potential"],
+            archetype_id=prepared["archetype_id"]
+        )
+        new_overall = self._recalculate_overall(
+            prepared["attributes"], changes_dict, prepared["position"]
+        )
+
+        return self._build_result(prepared, changes_dict, new_overall)
+
+    def _process_players_batch(self, players: List[Dict[str, Any]]) -> List[PlayerDevelopmentResult]:
+        """Process training camp for all players through the ProgressionEngine."""
+        from src.game_cycle.services.progression_engine import ProgressionEngine
+
+        prepared = [self._prepare_player(player) for player in players]
+        seed = self._seed if self._seed is not None else random.getrandbits(64)
+        progressions = ProgressionEngine(self._algorithm, seed=seed).run(prepared)
+
+        return [
+            self._build_result(player, progression.changes, progression.new_overall)
+            for player, progression in zip(prepared, progressions)
+        ]
 
+    def _prepare_player(self, player: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a players row into the values development needs."""
         # Parse positions
         positions = player.get("positions", [])
         if isinstance(positions, str):
@@ -616,21 +653,34 @@ class TrainingCampService:
         # Get archetype_id if available (for position-specific peak ages)
         archetype_id = attributes.get('archetype_id') or player.get('archetype_id')
 
-        # Get age category (position-specific)
-        age_category = self._algorithm.get_age_category(age, position, archetype_id)
-
         # Extract potential from attributes (Tollgate 3: Individual Player Potential)
         player_potential = attributes.get('potential')
         if player_potential is None:
             # Default: overall + 5 if not set (for existing players without potential)
             player_potential = min(99, int(attributes.get('overall', 70)) + 5)
 
-        # Calculate attribute changes with potential ceiling and development curve
-        changes_dict = self._algorithm.calculate_changes(
-            age, position, attributes,
-            potential=player_potential,
-            archetype_id=archetype_id
-        )
+        return {
+            "player_id": player.get("player_id"),
+            "player_name": f"{player.get('first_name', '')} {player.get('last_name', '')}".strip(),
+            "team_id": player.get("team_id", 0),
+            "position": position,
+            "attributes": attributes,
+            "age": age,
+            "archetype_id": archetype_id,
+            # Get age category (position-specific)
+            "age_category": self._algorithm.get_age_category(age, position, archetype_id),
+            "potential": player_potential,
+        }
+
+    def _build_result(
+        self,
+        prepared: Dict[str, Any],
+        changes_dict: Dict[str, int],
+        new_overall: int
+    ) -> PlayerDevelopmentResult:
+        """Build a PlayerDevelopmentResult from a prepared player and its changes."""
+        attributes = prepared["attributes"]
+        archetype_id = prepared["archetype_id"]
 
         # Build attribute change records
         attribute_changes = []
@@ -645,9 +695,7 @@ class TrainingCampService:
                     change=new_value - old_value
                 ))
 
-        # Calculate new overall
         old_overall = int(attributes.get("overall", 70))
-        new_overall = self._recalculate_overall(attributes, changes_dict, position)
 
         # Get development type from archetype (Tollgate 7: UI Integration)
         dev_type = "N"
@@ -656,17 +704,17 @@ class TrainingCampService:
             dev_type = {"early": "E", "normal": "N", "late": "L"}.get(curve, "N")
 
         return PlayerDevelopmentResult(
-            player_id=player_id,
-            player_name=player_name,
-            position=position,
-            age=age,
-            team_id=team_id,
-            age_category=age_category,
+            player_id=prepared["player_id"],
+            player_name=prepared["player_name"],
+            position=prepared["position"],
+            age=prepared["age"],
+            team_id=prepared["team_id"],
+            age_category=prepared["age_category"],
             old_overall=old_overall,
             new_overall=new_overall,
             overall_change=new_overall - old_overall,
             attribute_changes=attribute_changes,
-            potential=player_potential,
+            potential=prepared["potential"],
             dev_type=dev_type,
         )
 
@@ -729,24 +777,24 @@ class TrainingCampService:
             Number of players updated
         """
         conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         updated_count = 0
 
         try:
-            for result in results:
-                if not result.attribute_changes and result.overall_change == 0:
-                    continue  # No changes to persist
+            changed = [r for r in results if r.attribute_changes or r.overall_change != 0]
 
-                # Get current attributes from DB
-                query = "SELECT attributes FROM players WHERE dynasty_id = ? AND player_id = ?"
-                cursor.execute(query, (self._dynasty_id, result.player_id))
-                row = cursor.fetchone()
+            # Current attributes for the whole dynasty in one read
+            cursor.execute(
+                "SELECT player_id, attributes FROM players WHERE dynasty_id = ?",
+                (self._dynasty_id,)
+            )
+            current_by_id = dict(cursor.fetchall())
 
-                if not row:
+            updates = []
+            for result in changed:
+                current_attrs = current_by_id.get(result.player_id)
+                if current_attrs is None:
                     continue
-
-                current_attrs = row['attributes']
                 if isinstance(current_attrs, str):
                     current_attrs = json.loads(current_attrs)
 
@@ -757,21 +805,26 @@ class TrainingCampService:
                 # Update overall
                 current_attrs["overall"] = result.new_overall
 
-                # Persist to database
-                update_query = """
-                    UPDATE players
-                    SET attributes = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE dynasty_id = ? AND player_id = ?
+                updates.append((json.dumps(current_attrs), self._dynasty_id, result.player_id))
+
+            # Persist to database
+            cursor.executemany(
                 """
-                cursor.execute(
-                    update_query,
-                    (json.dumps(current_attrs), self._dynasty_id, result.player_id)
-                )
-                updated_count += 1
+                UPDATE players
+                SET attributes = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE dynasty_id = ? AND player_id = ?
+                """,
+                updates
+            )
+            updated_count = len(updates)
 
             conn.commit()
             self._logger.info(f"Training camp: Updated {updated_count} players in database")
 
+            # Ratings changed league-wide - drop cached simulation rosters
+            from team_management.team_data_cache import invalidate_team_data
+            invalidate_team_data(self._dynasty_id)
+
         except Exception as e:
             conn.rollback()
             self._logger.error(f"Error persisting training camp changes: {e}")
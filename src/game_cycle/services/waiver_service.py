@@ -642,6 +642,10 @@ class WaiverService:
 
             conn.commit()
 
+            if awarded_claims:
+                from team_management.team_data_cache import invalidate_team_data
+                invalidate_team_data(self._dynasty_id, {c["team_id"] for c in awarded_claims})
+
             self._logger.info(f"Processed waiver claims: {len(awarded_claims)} players claimed")
 
             result = {
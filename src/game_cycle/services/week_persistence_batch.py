@@ -0,0 +1,387 @@
+"""
+Week Persistence Batch - One write transaction per simulated week.
+
+Persisting a regular season week used to cost dozens of connections and
+commits per game: games_insert_result, one commit per player stat row, a new
+PlayByPlayAPI connection for drives and plays, one commit per box score, a
+read-modify-write of the event, a new InjuryService connection per game and
+a commit per standings/head-to-head/rivalry update.
+
+WeekPersistenceBatch accumulates the rows for every game of the week and
+writes them on the shared GameCycleDatabase connection inside a single
+transaction:
+
+- games, player_game_stats, game_drives, game_plays, box_scores and
+  player_injuries rows are written with one executemany per table
+  (games first - player_game_stats references games)
+- event results are read with one SELECT and written with one executemany
+- the season stat aggregates (statistics.season_stat_aggregates) are
+  refreshed for every game of the season not yet in them, or whose
+  player_game_stats rows changed
+- standings updates queued with defer() run on the same connection, so
+  their writes join the transaction
+- cached leaderboards for the season are marked stale once the week commits
+
+Each table is written under its own SAVEPOINT: as before, a failure in the
+optional tables (stats, play-by-play, box scores, events, stat aggregates)
+is logged and the rest of the week is still persisted. If a table's
+executemany fails its rows are retried one by one, so only the bad rows are
+dropped. Injury and standings
+failures roll the whole week back and re-raise.
+
+Usage:
+    batch = WeekPersistenceBatch(gc_db, dynasty_id, season)
+    batch.add_game_result(game_result)
+    batch.add_player_stats(game_id, player_stats)
+    batch.add_play_by_play(game_id, drives, home_team_id, away_team_id)
+    batch.defer(update_standings, home_score, away_score)
+    counts = batch.flush()
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from database.unified_api import (
+    GAME_RESULT_INSERT_SQL,
+    PLAYER_GAME_STATS_INSERT_SQL,
+    dedupe_player_game_stats,
+    game_result_values,
+    player_game_stats_values,
+)
+from ..database.box_scores_api import BoxScoresAPI
+from ..database.play_by_play_api import PlayByPlayAPI
+from .injury_service import InjuryService
+from .leaderboard_service import notify_games_persisted
+
+logger = logging.getLogger(__name__)
+
+
+class WeekPersistenceBatch:
+    """
+    Accumulates a week's game rows and writes them in one transaction.
+
+    flush() writes everything added so far and empties the batch; if it
+    raises, nothing is committed and the queued rows are kept.
+    """
+
+    def __init__(
+        self,
+        gc_db: Any,
+        dynasty_id: str,
+        season: int,
+        season_type: str = "regular_season"
+    ):
+        """
+        Initialize an empty batch.
+
+        Args:
+            gc_db: Shared GameCycleDatabase connection (owns the transaction)
+            dynasty_id: Dynasty identifier
+            season: Season being persisted
+            season_type: 'regular_season' or 'playoffs' (player_game_stats)
+        """
+        self._db = gc_db
+        self._dynasty_id = dynasty_id
+        self._season = season
+        self._season_type = season_type
+
+        # Row builders (no connections are opened by these)
+        self._pbp_api = PlayByPlayAPI(gc_db.db_path)
+        self._box_scores_api = BoxScoresAPI(gc_db.db_path)
+        self._injury_service = InjuryService(gc_db.db_path, dynasty_id, season)
+
+        self._game_rows: List[Tuple] = []
+        self._stat_rows: List[Tuple] = []
+        self._drive_rows: List[Tuple] = []
+        self._play_rows: List[Tuple] = []
+        self._box_score_rows: List[Tuple] = []
+        self._event_results: Dict[str, Tuple[int, int]] = {}
+        self._injuries: List[Any] = []
+        self._deferred: List[Tuple[Callable, tuple, dict]] = []
+
+    # -------------------- Accumulation --------------------
+
+    def add_game_result(self, game_result: Dict[str, Any]) -> None:
+        """
+        Queue a games row.
+
+        Args:
+            game_result: Game result dictionary (see UnifiedDatabaseAPI.games_insert_result)
+        """
+        self._game_rows.append(game_result_values(self._dynasty_id, game_result))
+
+    def add_player_stats(self, game_id: str, player_stats: List[Dict[str, Any]]) -> int:
+        """
+        Queue player_game_stats rows for a game.
+
+        Duplicate players keep their last entry; entries missing player_id or
+        team_id are skipped (as in UnifiedDatabaseAPI.stats_insert_game_stats).
+
+        Args:
+            game_id: Game identifier
+            player_stats: Player stat dictionaries
+
+        Returns:
+            Number of rows queued
+        """
+        count = 0
+        for stats in dedupe_player_game_stats(player_stats):
+            if 'player_id' not in stats or 'team_id' not in stats:
+                logger.warning("Skipping stats entry missing player_id or team_id: %s", stats)
+                continue
+            self._stat_rows.append(
+                player_game_stats_values(self._dynasty_id, game_id, self._season_type, stats)
+            )
+            count += 1
+        return count
+
+    def add_play_by_play(
+        self,
+        game_id: str,
+        drives: List[Any],
+        home_team_id: Optional[int] = None,
+        away_team_id: Optional[int] = None
+    ) -> None:
+        """
+        Queue game_drives and game_plays rows for a game.
+
+        Args:
+            game_id: Game identifier
+            drives: DriveResult objects containing plays
+            home_team_id: Home team ID (for score tracking)
+            away_team_id: Away team ID (for score tracking)
+        """
+        if not drives:
+            return
+        self._drive_rows.extend(self._pbp_api.drive_rows(self._dynasty_id, game_id, drives))
+        self._play_rows.extend(
+            self._pbp_api.play_rows(self._dynasty_id, game_id, drives, home_team_id, away_team_id)
+        )
+
+    def add_box_scores(
+        self,
+        game_id: str,
+        home_team_id: int,
+        away_team_id: int,
+        home_box: Dict[str, Any],
+        away_box: Dict[str, Any]
+    ) -> None:
+        """
+        Queue home and away box_scores rows for a game.
+
+        Args:
+            game_id: Game identifier
+            home_team_id: Home team ID
+            away_team_id: Away team ID
+            home_box: Dict with home team stats
+            away_box: Dict with away team stats
+        """
+        for box_score in self._box_scores_api.game_box_scores(
+            self._dynasty_id, game_id, home_team_id, away_team_id, home_box, away_box
+        ):
+            self._box_score_rows.append(self._box_scores_api.box_score_values(box_score))
+
+    def add_event_result(self, event_id: str, home_score: int, away_score: int) -> None:
+        """
+        Queue the final score for a GAME event (legacy events table).
+
+        Args:
+            event_id: Event ID of the game
+            home_score: Home team final score
+            away_score: Away team final score
+        """
+        self._event_results[event_id] = (home_score, away_score)
+
+    def add_injuries(self, injuries: List[Any]) -> None:
+        """
+        Queue new injuries.
+
+        Args:
+            injuries: Injury dataclass instances
+        """
+        self._injuries.extend(injuries)
+
+    def defer(self, func: Callable, *args: Any, **kwargs: Any) -> None:
+        """
+        Queue a write to run inside the batch transaction, after the row inserts.
+
+        The callable must write through the shared GameCycleDatabase (e.g.
+        StandingsAPI, HeadToHeadAPI); opening another connection would wait
+        on the transaction's write lock.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        """
+        self._deferred.append((func, args, kwargs))
+
+    # -------------------- Flush --------------------
+
+    def flush(self) -> Dict[str, int]:
+        """
+        Write everything in one transaction and commit once.
+
+        Returns:
+            Rows written per table ('games', 'player_game_stats', 'game_drives',
+            'game_plays', 'box_scores', 'events', 'player_injuries'), games added
+            to (or re-applied in) the season stat aggregates
+            ('season_stat_aggregates'), plus the
+            number of deferred writes run ('deferred')
+
+        Raises:
+            Exception: If injuries or a deferred write fail (nothing is committed)
+        """
+        counts: Dict[str, int] = {}
+        with self._db.transaction() as conn:
+            counts['games'] = self._write_rows(conn, 'games', GAME_RESULT_INSERT_SQL, self._game_rows)
+            counts['player_game_stats'] = self._write_rows(
+                conn, 'player_game_stats', PLAYER_GAME_STATS_INSERT_SQL, self._stat_rows
+            )
+            counts['game_drives'] = self._write_rows(
+                conn, 'game_drives', PlayByPlayAPI.INSERT_DRIVE_SQL, self._drive_rows
+            )
+            counts['game_plays'] = self._write_rows(
+                conn, 'game_plays', PlayByPlayAPI.INSERT_PLAY_SQL, self._play_rows
+            )
+            counts['box_scores'] = self._write_rows(
+                conn, 'box_scores', BoxScoresAPI.INSERT_SQL, self._box_score_rows
+            )
+            counts['events'] = self._write_event_results(conn)
+            counts['season_stat_aggregates'] = (
+                self._update_season_aggregates(conn)
+                if counts['games'] or counts['player_game_stats'] else 0
+            )
+
+            if self._injuries:
+                conn.executemany(
+                    InjuryService.INSERT_INJURY_SQL,
+                    [self._injury_service.injury_values(injury) for injury in self._injuries]
+                )
+            counts['player_injuries'] = len(self._injuries)
+
+            for func, args, kwargs in self._deferred:
+                func(*args, **kwargs)
+            counts['deferred'] = len(self._deferred)
+
+        self._after_commit(counts)
+        logger.debug("Week batch committed: %s", counts)
+        self._clear()
+        return counts
+
+    def _write_rows(self, conn: Any, table: str, sql: str, rows: List[Tuple]) -> int:
+        """
+        Insert one table's rows under a savepoint, logging (not raising) failures.
+
+        The rows go in with one executemany. If that fails, the savepoint is
+        rolled back and the rows are retried one at a time, so a bad row only
+        loses itself (as the per-row inserts did) instead of the whole week.
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+        conn.execute(f"SAVEPOINT batch_{table}")
+        try:
+            conn.executemany(sql, rows)
+            written = len(rows)
+        except Exception:
+            conn.execute(f"ROLLBACK TO SAVEPOINT batch_{table}")
+            written = 0
+            for row in rows:
+                try:
+                    conn.execute(sql, row)
+                    written += 1
+                except Exception as e:
+                    logger.warning("Failed to persist %s row: %s", table, e)
+        conn.execute(f"RELEASE SAVEPOINT batch_{table}")
+        return written
+
+    def _write_event_results(self, conn: Any) -> int:
+        """
+        Store final scores in the GAME events' data JSON (one read, one write).
+
+        Returns:
+            Number of events updated
+        """
+        if not self._event_results:
+            return 0
+
+        event_ids = list(self._event_results)
+        placeholders = ",".join("?" * len(event_ids))
+        try:
+            rows = conn.execute(
+                f"SELECT event_id, data FROM events WHERE dynasty_id = ? AND event_id IN ({placeholders})",
+                (self._dynasty_id, *event_ids)
+            ).fetchall()
+        except Exception as e:
+            logger.debug("Could not read events for result updates: %s (events table optional)", e)
+            return 0
+
+        updates = []
+        for event_id, data in rows:
+            data = json.loads(data) if isinstance(data, str) else (data or {})
+            home_score, away_score = self._event_results[event_id]
+            data['results'] = {
+                'home_score': home_score,
+                'away_score': away_score,
+                'completed': True
+            }
+            updates.append((json.dumps(data), event_id, self._dynasty_id))
+
+        return self._write_rows(
+            conn, 'events', "UPDATE events SET data = ? WHERE event_id = ? AND dynasty_id = ?", updates
+        )
+
+    def _update_season_aggregates(self, conn: Any) -> int:
+        """
+        Bring the season stat totals and ranks up to date with the games table.
+
+        Every game of the season missing from the aggregates is added, with or
+        without stats rows; if a recorded game's stats were replaced (e.g. a
+        re-simulated week) the season is rebuilt.
+
+        Returns:
+            Number of games added (0 if the update failed)
+        """
+        from statistics.season_stat_aggregates import SeasonStatAggregates
+
+        conn.execute("SAVEPOINT batch_season_aggregates")
+        try:
+            added = SeasonStatAggregates(self._dynasty_id).refresh(
+                conn, self._season, self._season_type
+            )
+        except Exception as e:
+            conn.execute("ROLLBACK TO SAVEPOINT batch_season_aggregates")
+            conn.execute("RELEASE SAVEPOINT batch_season_aggregates")
+            logger.warning("Failed to update season stat aggregates: %s", e)
+            return 0
+        conn.execute("RELEASE SAVEPOINT batch_season_aggregates")
+        return added
+
+    def _after_commit(self, counts: Dict[str, int]) -> None:
+        """Side effects that must only happen once the week is committed."""
+        if counts['games'] or counts['player_game_stats']:
+            notify_games_persisted(self._dynasty_id, self._season)
+
+        if not self._injuries:
+            return
+
+        from team_management.team_data_cache import invalidate_team_data
+
+        invalidate_team_data(self._dynasty_id, {injury.team_id for injury in self._injuries})
+        for injury in self._injuries:
+            self._injury_service.log_injury_transaction(injury)
+
+    def _clear(self) -> None:
+        """Empty the batch after a flush."""
+        self._game_rows.clear()
+        self._stat_rows.clear()
+        self._drive_rows.clear()
+        self._play_rows.clear()
+        self._box_score_rows.clear()
+        self._event_results.clear()
+        self._injuries.clear()
+        self._deferred.clear()
@@ -30,6 +30,7 @@ class StageContext(TypedDict):
     dynasty_state_api: Any  # DynastyStateAPI
     user_team_id: int
     simulation_mode: str
+    media_mode: str
 
 
 class StageHandler(Protocol):
@@ -161,6 +162,7 @@ class StageController:
         self._current_stage: Optional[Stage] = None
         self._initialized = False
         self._simulation_mode: str = "full"  # Default to full sim ("instant" or "full")
+        self._media_mode: str = "inline"  # "inline" or "deferred" (background media jobs)
         self._progress_callback: Optional[callable] = None  # For UI progress updates
 
     @property
@@ -180,6 +182,44 @@ class StageController:
         self._simulation_mode = mode
         logger.info(f"Simulation mode set to: {mode}")
 
+    @property
+    def simulation_mode(self) -> str:
+        """Get simulation mode ("instant" or "full")."""
+        return self._simulation_mode
+
+    def set_media_mode(self, mode: str) -> None:
+        """
+        Set how regular season weeks produce media and derived data.
+
+        Args:
+            mode: "inline" to generate headlines, social posts, rankings and
+                popularity before a week returns, "deferred" to queue them
+                for the background media job worker
+        """
+        if mode not in ("inline", "deferred"):
+            raise ValueError(f"Invalid media mode: {mode}. Use 'inline' or 'deferred'.")
+        self._media_mode = mode
+        logger.info(f"Media mode set to: {mode}")
+
+    @property
+    def media_mode(self) -> str:
+        """Get media mode ("inline" or "deferred")."""
+        return self._media_mode
+
+    def drain_media_jobs(self, timeout: Optional[float] = None) -> bool:
+        """
+        Run queued media jobs for this database before returning.
+
+        Args:
+            timeout: Seconds to wait for a background run in progress
+
+        Returns:
+            True if the queue was drained without failed jobs, False on
+            timeout or if any job failed since the last drain
+        """
+        from .services.media_job_queue import drain_media_jobs
+        return drain_media_jobs(self._db_path, timeout)
+
     def set_progress_callback(self, callback: Optional[callable]) -> None:
         """
         Set callback for progress updates during stage execution.
@@ -388,7 +428,7 @@ class StageController:
         )
 
         # Determine if we should increment the season year
-        # Only increment if games DO NOT exist for current season's Week 1
+        # Stay in the current season only while its Week 1 is scheduled and unplayed
         # This handles both:
         # 1. Initial dynasty setup: offseason → first regular season (games already scheduled for current year)
         # 2. End of season: offseason → new regular season (need to increment to next year)
@@ -400,13 +440,14 @@ class StageController:
                 week=1,
                 season_type='regular_season'
             )
+            week1_played = any(game.get('home_score') is not None for game in current_season_games)
 
-            if len(current_season_games) > 0:
-                # Games exist for current season - stay in current year (initial dynasty setup)
+            if len(current_season_games) > 0 and not week1_played:
+                # Unplayed games exist for current season - stay in current year (initial dynasty setup)
                 logger.info(f"Week 1 games found for season {self._season}, staying in current season")
                 is_new_season = False
             else:
-                # No games for current season - increment to next year (true season transition)
+                # Current season's Week 1 played (or never scheduled) - increment to next year (true season transition)
                 logger.info(f"Transitioning to new season, incrementing SSOT from {self._season} to {self._season + 1}")
                 self._season = self._season + 1
                 is_new_season = True
@@ -417,6 +458,10 @@ class StageController:
                     season=self._season
                 )
 
+        # Deferred media jobs finish before the playoffs read the season's data
+        if current.phase == SeasonPhase.REGULAR_SEASON and next_stage_temp.phase != SeasonPhase.REGULAR_SEASON:
+            self.drain_media_jobs()
+
         # Now create the next stage with the correct season from SSOT
         next_stage = Stage(
             stage_type=next_stage_temp.stage_type,
@@ -622,6 +667,28 @@ class StageController:
 
         return new_stage
 
+    def adopt_stage(self, stage: Stage) -> None:
+        """
+        Take over a stage reached by another controller for the same dynasty.
+
+        Used when stages are executed on a simulation worker thread with its
+        own StageController: the stage (including its in-memory completed
+        flag) is already saved to dynasty_state, so it is only cached here.
+
+        Args:
+            stage: Current stage of the other controller
+        """
+        self._current_stage = Stage(
+            stage_type=stage.stage_type,
+            season_year=stage.season_year,
+            completed=stage.completed
+        )
+        self._season = stage.season_year
+
+    def close(self) -> None:
+        """Close pooled database connections (owned by the creating thread)."""
+        self._unified_api.close()
+
     def get_stage_preview(self) -> Dict[str, Any]:
         """
         Get preview of the current stage.
@@ -749,7 +816,7 @@ class StageController:
         current_season = stage.season_year if stage else self._season
 
         # Query standings via StandingsAPI
-        gc_db = GameCycleDatabase()
+        gc_db = GameCycleDatabase(self._db_path)
         standings_api = StandingsAPI(gc_db)
         all_standings = standings_api.get_standings(
             dynasty_id=self._dynasty_id,
@@ -851,6 +918,7 @@ class StageController:
             "dynasty_state_api": self._dynasty_state_api,
             "user_team_id": user_team_id,
             "simulation_mode": self._simulation_mode,
+            "media_mode": self._media_mode,
             "progress_callback": self._progress_callback,  # For UI progress updates
         }
 
@@ -717,7 +717,7 @@ class CentralizedStatsAggregator:
         return {
             "game_info": self.game_stats.get_summary(),
             "player_statistics": {
-                "all_players": [p.__dict__ for p in self.get_player_statistics()],
+                "all_players": [p.to_dict() for p in self.get_player_statistics()],
                 "total_players": self.player_stats.get_player_count(),
                 "plays_processed": self.player_stats.get_plays_processed()
             },
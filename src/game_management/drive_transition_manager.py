@@ -5,7 +5,6 @@ Handles transitions between drives including kickoffs, punts, turnovers, and sco
 Coordinates with PossessionManager and DriveManager to ensure smooth drive handoffs.
 """
 
-import random
 from dataclasses import dataclass
 from typing import Optional, Tuple
 from enum import Enum
@@ -14,6 +13,7 @@ from play_engine.game_state.drive_manager import DriveManager, DriveEndReason
 from play_engine.game_state.possession_manager import PossessionManager
 from play_engine.game_state.game_clock import GameClock
 from play_engine.core.play_result import PlayResult
+from play_engine.core.rng import GameRNG, stream_or_global, DRIVE_TRANSITION_STREAM
 
 
 class TransitionType(Enum):
@@ -81,16 +81,19 @@ class DriveTransitionManager:
     - Special situations (safeties, onside kicks)
     """
     
-    def __init__(self, possession_manager: PossessionManager, game_clock: Optional[GameClock] = None):
+    def __init__(self, possession_manager: PossessionManager, game_clock: Optional[GameClock] = None,
+                 rng: Optional[GameRNG] = None):
         """
         Initialize drive transition manager
         
         Args:
             possession_manager: Manages possession tracking
             game_clock: Game clock for time management (optional)
+            rng: Per-game GameRNG (None = global random module)
         """
         self.possession_manager = possession_manager
         self.game_clock = game_clock
+        self._rng = stream_or_global(rng, DRIVE_TRANSITION_STREAM)
     
     def handle_drive_transition(self,
                               completed_drive: DriveManager,
@@ -373,13 +376,13 @@ class DriveTransitionManager:
         """
         if is_onside_kick:
             # Onside kick - much shorter with recovery attempt
-            recovery_success = random.random() < 0.25  # ~25% success rate (NFL average)
+            recovery_success = self._rng.random() < 0.25  # ~25% success rate (NFL average)
             if recovery_success:
                 return KickoffResult(
                     kicking_team_id=kicking_team_id,
                     receiving_team_id=receiving_team_id,
                     return_yards=0,
-                    starting_field_position=random.randint(42, 48),  # Around midfield
+                    starting_field_position=self._rng.randint(42, 48),  # Around midfield
                     is_touchback=False,
                     is_onside_kick=True,
                     onside_kick_recovered=True,
@@ -389,8 +392,8 @@ class DriveTransitionManager:
                 return KickoffResult(
                     kicking_team_id=kicking_team_id,
                     receiving_team_id=receiving_team_id,
-                    return_yards=random.randint(5, 15),
-                    starting_field_position=random.randint(35, 50),
+                    return_yards=self._rng.randint(5, 15),
+                    starting_field_position=self._rng.randint(35, 50),
                     is_touchback=False,
                     is_onside_kick=True,
                     onside_kick_recovered=False,
@@ -400,7 +403,7 @@ class DriveTransitionManager:
             # Regular kickoff - more realistic distribution
             touchback_chance = 0.52  # 52% touchback rate (2024 NFL average)
 
-            if random.random() < touchback_chance:
+            if self._rng.random() < touchback_chance:
                 return KickoffResult(
                     kicking_team_id=kicking_team_id,
                     receiving_team_id=receiving_team_id,
@@ -413,16 +416,16 @@ class DriveTransitionManager:
             else:
                 # Kickoff return - simulate realistic outcomes
                 # Most NFL kickoffs reach 3-8 yards deep in the end zone or land at 1-5 yard line
-                distribution_roll = random.random()
+                distribution_roll = self._rng.random()
 
                 if distribution_roll < 0.10:  # 10% - short return (bad blocking/quick tackle)
-                    return_yards = random.randint(8, 17)
+                    return_yards = self._rng.randint(8, 17)
                 elif distribution_roll < 0.70:  # 60% - average return
-                    return_yards = random.randint(18, 28)
+                    return_yards = self._rng.randint(18, 28)
                 elif distribution_roll < 0.92:  # 22% - good return
-                    return_yards = random.randint(29, 38)
+                    return_yards = self._rng.randint(29, 38)
                 else:  # 8% - big return (40+ yards)
-                    return_yards = random.randint(39, 65)
+                    return_yards = self._rng.randint(39, 65)
 
                 # Most kickoffs land in/near the end zone, so returns start from goal line
                 # A 20-yard return from the goal line = 20-yard line
@@ -432,14 +435,14 @@ class DriveTransitionManager:
 
                 # Add slight variance for kicks that don't reach end zone
                 # (about 15% of non-touchback kicks land short)
-                if random.random() < 0.15:
+                if self._rng.random() < 0.15:
                     # Kick landed short (3-7 yard line)
-                    catch_spot = random.randint(3, 7)
+                    catch_spot = self._rng.randint(3, 7)
                     starting_position = min(catch_spot + return_yards, 95)
 
                 # Cap extremely good field position (very rare to cross own 45 unless huge return)
                 if starting_position > 45 and return_yards < 50:
-                    starting_position = random.randint(35, 43)
+                    starting_position = self._rng.randint(35, 43)
 
                 return KickoffResult(
                     kicking_team_id=kicking_team_id,
@@ -454,11 +457,11 @@ class DriveTransitionManager:
     def _simulate_punt(self, punting_team_id: int, receiving_team_id: int, field_position: int) -> PuntResult:
         """Simulate punt with realistic NFL outcomes"""
         # Punt distance varies based on field position
-        punt_distance = random.randint(35, 50)
+        punt_distance = self._rng.randint(35, 50)
 
         # Fair catch chance increases in certain situations
         fair_catch_chance = 0.3
-        is_fair_catch = random.random() < fair_catch_chance
+        is_fair_catch = self._rng.random() < fair_catch_chance
 
         # Calculate where punt lands from punting team's perspective (how far down field)
         landing_spot = field_position + punt_distance
@@ -477,7 +480,7 @@ class DriveTransitionManager:
             if is_fair_catch:
                 return_yards = 0
             else:
-                return_yards = random.randint(3, 12)  # Typical punt return
+                return_yards = self._rng.randint(3, 12)  # Typical punt return
                 # Return moves the ball toward punting team's goal (increases field position)
                 receiving_team_field_position = min(receiving_team_field_position + return_yards, 95)
 
@@ -495,7 +498,7 @@ class DriveTransitionManager:
     def _simulate_safety_kick(self, kicking_team_id: int, receiving_team_id: int) -> KickoffResult:
         """Simulate safety kick (free kick after safety)"""
         # Safety kicks are typically shorter and more returnable
-        return_yards = random.randint(20, 35)
+        return_yards = self._rng.randint(20, 35)
         starting_position = min(20 + return_yards, 90)
         
         return KickoffResult(
@@ -13,12 +13,68 @@ from game_management.game_manager import GameManager
 from game_management.game_loop_controller import GameLoopController, GameResult, DriveResult
 from game_management.drive_transition_manager import DriveTransitionManager
 from game_management.overtime_manager import OvertimeType, create_overtime_manager
+from game_management.play_phase_profiler import PlayPhaseProfiler
+from play_engine.core.rng import GameRNG
 import json
 from pathlib import Path
 import time
 from typing import Optional, Dict, List, Any
 
 
+def load_coaching_staff_config(team_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Load the coaching staff configuration for a team from the config files.
+
+    Reads team_coaching_styles.json for the staff names, then the head coach,
+    offensive coordinator and defensive coordinator JSON files.
+
+    Args:
+        team_id: Numerical team ID (1-32)
+
+    Returns:
+        Dict with head_coach, offensive_coordinator and defensive_coordinator
+        configs, or None if the team has no (readable) staff configuration
+    """
+    try:
+        # Load team coaching styles mapping
+        config_dir = Path(__file__).parent.parent / "config"
+        team_styles_path = config_dir / "team_coaching_styles.json"
+
+        with open(team_styles_path, 'r') as f:
+            team_styles = json.load(f)
+
+        # Get coaching staff names for this team
+        team_config = team_styles.get(str(team_id))
+        if not team_config:
+            return None
+
+        # Load individual coach configs
+        coaching_staff = {}
+
+        # Load head coach
+        hc_name = team_config["head_coach"]
+        hc_path = config_dir / "coaching_staff" / "head_coaches" / f"{hc_name}.json"
+        with open(hc_path, 'r') as f:
+            coaching_staff["head_coach"] = json.load(f)
+
+        # Load offensive coordinator
+        oc_name = team_config["offensive_coordinator"]
+        oc_path = config_dir / "coaching_staff" / "offensive_coordinators" / f"{oc_name}.json"
+        with open(oc_path, 'r') as f:
+            coaching_staff["offensive_coordinator"] = json.load(f)
+
+        # Load defensive coordinator
+        dc_name = team_config["defensive_coordinator"]
+        dc_path = config_dir / "coaching_staff" / "defensive_coordinators" / f"{dc_name}.json"
+        with open(dc_path, 'r') as f:
+            coaching_staff["defensive_coordinator"] = json.load(f)
+
+        return coaching_staff
+
+    except (FileNotFoundError, KeyError, json.JSONDecodeError):
+        return None
+
+
 class FullGameSimulator:
     """
     Complete NFL game simulator with modular architecture.
@@ -31,7 +87,13 @@ class FullGameSimulator:
                  dynasty_id: Optional[str] = None,
                  db_path: Optional[str] = None,
                  overtime_type: str = "regular_season",
-                 season_type: str = "regular_season"):
+                 season_type: str = "regular_season",
+                 away_roster: Optional[List[Any]] = None,
+                 home_roster: Optional[List[Any]] = None,
+                 away_coaching_staff: Optional[Dict[str, Any]] = None,
+                 home_coaching_staff: Optional[Dict[str, Any]] = None,
+                 rng: Optional[GameRNG] = None,
+                 profile_plays: bool = False):
         """
         Initialize game simulator with two teams.
 
@@ -42,6 +104,13 @@ class FullGameSimulator:
             db_path: Database path (REQUIRED for database rosters, None for demo mode)
             overtime_type: Type of overtime rules ("regular_season" or "playoffs")
             season_type: Type of season ("regular_season" or "playoffs")
+            away_roster: Pre-loaded away roster (skips roster loading when provided)
+            home_roster: Pre-loaded home roster (skips roster loading when provided)
+            away_coaching_staff: Pre-loaded away coaching staff config
+            home_coaching_staff: Pre-loaded home coaching staff config
+            rng: Per-game GameRNG for reproducible simulation (None = global random module)
+            profile_plays: Time each play's phases; the GameResult then carries
+                a PlayPhaseReport in play_phase_profile
         """
         # Load team data
         self.away_team = get_team_by_id(away_team_id)
@@ -69,8 +138,18 @@ class FullGameSimulator:
         # Store season type for game result persistence
         self.season_type = season_type
 
-        # Load team rosters (database or synthetic)
-        if dynasty_id and db_path:
+        # Per-game random streams (None = legacy global random module)
+        self.rng = rng
+
+        # Opt-in per-play phase timing
+        self.profile_plays = profile_plays
+
+        # Load team rosters (pre-loaded, database or synthetic)
+        if away_roster is not None and home_roster is not None:
+            self.away_roster = away_roster
+            self.home_roster = home_roster
+            roster_source = "pre-loaded"
+        elif dynasty_id and db_path:
             # Production mode: Load from database
             self.away_roster = TeamRosterGenerator.load_team_roster(
                 away_team_id, dynasty_id=dynasty_id, db_path=db_path
@@ -88,11 +167,11 @@ class FullGameSimulator:
         # Initialization logging removed for performance - use get_team_info() for details
 
         # Initialize GameManager for core game management
-        self.game_manager = GameManager(self.home_team, self.away_team)
+        self.game_manager = GameManager(self.home_team, self.away_team, rng=self.rng)
 
-        # Load coaching staff
-        self.away_coaching_staff = self._load_coaching_staff(away_team_id)
-        self.home_coaching_staff = self._load_coaching_staff(home_team_id)
+        # Load coaching staff (unless pre-loaded by caller)
+        self.away_coaching_staff = away_coaching_staff or self._load_coaching_staff(away_team_id)
+        self.home_coaching_staff = home_coaching_staff or self._load_coaching_staff(home_team_id)
 
         # Coaching staff logging removed for performance
 
@@ -133,7 +212,9 @@ class FullGameSimulator:
                 away_roster=self.away_roster,
                 overtime_manager=overtime_manager,
                 game_date=date,
-                season_type=self.season_type
+                season_type=self.season_type,
+                rng=self.rng,
+                phase_profiler=PlayPhaseProfiler() if self.profile_plays else None
             )
 
             # Run complete game simulation
@@ -348,45 +429,11 @@ class FullGameSimulator:
     
     def _load_coaching_staff(self, team_id: int):
         """Load coaching staff configuration for a team"""
-        try:
-            # Load team coaching styles mapping
-            config_dir = Path(__file__).parent.parent / "config"
-            team_styles_path = config_dir / "team_coaching_styles.json"
-            
-            with open(team_styles_path, 'r') as f:
-                team_styles = json.load(f)
-            
-            # Get coaching staff names for this team
-            team_config = team_styles.get(str(team_id))
-            if not team_config:
-                return self._get_fallback_coaching_staff(team_id)
-            
-            # Load individual coach configs
-            coaching_staff = {}
-            
-            # Load head coach
-            hc_name = team_config["head_coach"]
-            hc_path = config_dir / "coaching_staff" / "head_coaches" / f"{hc_name}.json"
-            with open(hc_path, 'r') as f:
-                coaching_staff["head_coach"] = json.load(f)
-            
-            # Load offensive coordinator
-            oc_name = team_config["offensive_coordinator"]
-            oc_path = config_dir / "coaching_staff" / "offensive_coordinators" / f"{oc_name}.json"
-            with open(oc_path, 'r') as f:
-                coaching_staff["offensive_coordinator"] = json.load(f)
-            
-            # Load defensive coordinator
-            dc_name = team_config["defensive_coordinator"]
-            dc_path = config_dir / "coaching_staff" / "defensive_coordinators" / f"{dc_name}.json"
-            with open(dc_path, 'r') as f:
-                coaching_staff["defensive_coordinator"] = json.load(f)
-            
-            return coaching_staff
-            
-        except (FileNotFoundError, KeyError, json.JSONDecodeError):
+        coaching_staff = load_coaching_staff_config(team_id)
+        if coaching_staff is None:
             # Silent fallback - warning handled by caller if needed
             return self._get_fallback_coaching_staff(team_id)
+        return coaching_staff
     
     def _get_fallback_coaching_staff(self, team_id: int):
         """Get fallback coaching staff if real configs can't be loaded"""
@@ -16,7 +16,6 @@ from typing import Dict, List, Optional, Any
 from enum import Enum
 import json
 import logging
-import random
 from pathlib import Path
 
 from game_management.game_manager import GameManager, GamePhase
@@ -57,14 +56,18 @@ from play_engine.play_calling.staff_factory import StaffFactory
 from play_engine.play_calling.play_caller import PlayCaller, PlayCallContext
 from play_engine.core.engine import simulate
 from play_engine.core.params import PlayEngineParams
+from play_engine.core.rng import (
+    GameRNG, stream_or_global, GAME_STREAM, PLAY_CALLING_STREAM, ROTATION_STREAM
+)
 from play_engine.core.play_result import PlayResult
 from play_engine.simulation.stats import PlayerStatsAccumulator, TeamStatsAccumulator, PlayerStats
 from play_engine.simulation.field_goal import FieldGoalSimulator
 from play_engine.game_state.field_position import FieldPosition, FieldZone
 from play_engine.game_state.down_situation import DownState, calculate_first_down_line
+from play_engine.game_state.lineup_index import GameLineupIndex
 from play_engine.mechanics.rb_rotation import RBSubstitutionManager
 from play_engine.mechanics.defensive_rotation import DefensiveRotationManager
-from play_engine.mechanics.penalties.penalty_engine import PlayContext
+from play_engine.mechanics.penalties.penalty_engine import PenaltyEngine, PlayContext
 from team_management.teams.team_loader import Team
 from team_management.players.player import Position
 from game_management.centralized_stats_aggregator import CentralizedStatsAggregator
@@ -75,6 +78,10 @@ from game_management.player_performance_tracker import PlayerPerformanceTracker
 from game_management.random_events import RandomEventChecker
 from game_management.rivalry_modifiers import RivalryGameModifiers, get_rivalry_game_description
 from game_management.quarter_continuation_manager import QuarterContinuationManager, DriveEndState
+from game_management.play_phase_profiler import (
+    PlayPhaseProfiler, PHASE_SITUATION, PHASE_PLAY_CALLING, PHASE_PERSONNEL, PHASE_PARAMS,
+    PHASE_ENGINE, PHASE_MOMENTUM, PHASE_CLOCK, PHASE_DRIVE, PHASE_STATS,
+)
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -125,7 +132,9 @@ class GameLoopController:
                  # Dependency injection for testability
                  momentum_tracker: MomentumTracker = None,
                  performance_tracker: PlayerPerformanceTracker = None,
-                 random_event_checker: RandomEventChecker = None):
+                 random_event_checker: RandomEventChecker = None,
+                 rng: Optional[GameRNG] = None,
+                 phase_profiler: Optional[PlayPhaseProfiler] = None):
         """
         Initialize game loop controller with all required components
 
@@ -144,7 +153,12 @@ class GameLoopController:
             momentum_tracker: Optional MomentumTracker instance (for testing)
             performance_tracker: Optional PlayerPerformanceTracker instance (for testing)
             random_event_checker: Optional RandomEventChecker instance (for testing)
+            rng: Per-game GameRNG; every random draw in the game comes from its
+                sub-streams (None = global random module)
+            phase_profiler: Optional PlayPhaseProfiler timing each play's phases;
+                its report is attached to the GameResult (None = not profiled)
         """
+        self.rng = rng
         self.game_manager = game_manager
         self.home_team = home_team
         self.away_team = away_team
@@ -159,6 +173,20 @@ class GameLoopController:
             away_roster,
             key=lambda p: (getattr(p, 'depth_chart_order', 99), -getattr(p, 'overall', 0))
         )
+        # Per-game position indexes (rebuilt only when a roster list changes)
+        # Offense indexes cover the depth-sorted rosters; defense indexes are
+        # refreshed each snap with the rotation-ordered defensive roster
+        self.home_offense_lineup = GameLineupIndex(self.home_roster)
+        self.away_offense_lineup = GameLineupIndex(self.away_roster)
+        self.home_defense_lineup = GameLineupIndex(self.home_roster)
+        self.away_defense_lineup = GameLineupIndex(self.away_roster)
+        self._defensive_groups: Dict[int, tuple] = {}
+        # One penalty engine per game: discipline modifiers and penalty
+        # probability tables are compiled once and reused every snap
+        self.penalty_engine = PenaltyEngine(rng=rng)
+        self.phase_profiler = phase_profiler
+        if phase_profiler is not None:
+            phase_profiler.instrument_penalties(self.penalty_engine)
         self.game_date = game_date
         self.season_type = season_type
         
@@ -172,6 +200,10 @@ class GameLoopController:
         self.away_coaching_staff = self._create_coaching_staff_from_config(
             away_coaching_staff_config, away_team.team_id
         )
+        if rng is not None:
+            play_calling_rng = rng.stream(PLAY_CALLING_STREAM)
+            self.home_coaching_staff.use_rng(play_calling_rng)
+            self.away_coaching_staff.use_rng(play_calling_rng)
         
         # Create PlayCaller instances for both teams
         self.home_play_caller = PlayCaller(
@@ -184,20 +216,21 @@ class GameLoopController:
         )
 
         # RB rotation managers - distribute carries between starter/backup based on OC philosophy
+        rotation_rng = rng.stream(ROTATION_STREAM) if rng is not None else None
         self.home_rb_manager = RBSubstitutionManager.from_coaching_staff(
-            self.home_coaching_staff.offensive_coordinator
+            self.home_coaching_staff.offensive_coordinator, rng=rotation_rng
         )
         self.away_rb_manager = RBSubstitutionManager.from_coaching_staff(
-            self.away_coaching_staff.offensive_coordinator
+            self.away_coaching_staff.offensive_coordinator, rng=rotation_rng
         )
 
         # Defensive rotation managers - distribute snaps across position groups based on DC philosophy
         # DL rotates most (55-75%), LB moderate (70-85%), DB least (82-95%)
         self.home_def_rotation = DefensiveRotationManager.from_defensive_coordinator(
-            self.home_coaching_staff.defensive_coordinator
+            self.home_coaching_staff.defensive_coordinator, rng=rotation_rng
         )
         self.away_def_rotation = DefensiveRotationManager.from_defensive_coordinator(
-            self.away_coaching_staff.defensive_coordinator
+            self.away_coaching_staff.defensive_coordinator, rng=rotation_rng
         )
 
         # Game tracking
@@ -230,7 +263,7 @@ class GameLoopController:
         # Variance & Unpredictability tracking (Tollgate 7)
         # Use injected instances or create defaults (dependency injection for testability)
         self.performance_tracker = performance_tracker or PlayerPerformanceTracker()
-        self.random_event_checker = random_event_checker or RandomEventChecker()
+        self.random_event_checker = random_event_checker or RandomEventChecker(rng=rng)
 
         # Environmental context (Tollgate 6) - set at game start
         self.game_weather = self._initialize_weather()
@@ -242,7 +275,8 @@ class GameLoopController:
         # Drive transition manager for handling drive-to-drive transitions
         self.drive_transition_manager = DriveTransitionManager(
             possession_manager=self.game_manager.possession_manager,
-            game_clock=self.game_manager.game_clock
+            game_clock=self.game_manager.game_clock,
+            rng=rng
         )
 
         # Quarter continuation manager for preserving down state across Q1→Q2 and Q3→Q4
@@ -257,6 +291,8 @@ class GameLoopController:
         """
         logger.info("Starting Game Loop Simulation: %s @ %s",
                     self.away_team.abbreviation, self.home_team.abbreviation)
+        if self.phase_profiler is not None:
+            self.phase_profiler.begin_game()
 
         # Initialize game with coin toss and opening setup
         self.game_manager.start_game()
@@ -294,7 +330,10 @@ class GameLoopController:
         # Handle overtime if needed
         if self._needs_overtime():
             self._run_overtime()
-        
+
+        if self.phase_profiler is not None:
+            self.phase_profiler.end_game()
+
         # Generate final result
         return self._generate_final_result()
     
@@ -399,6 +438,7 @@ class GameLoopController:
         # Track drive statistics
         plays_in_drive: List[PlayResult] = []
         drive_total_yards = 0
+        profiler = self.phase_profiler
         
         # Main drive loop - run plays until drive ends OR quarter time expires
         # FIX: Added quarter completion check to prevent plays executing at 0:00
@@ -411,6 +451,8 @@ class GameLoopController:
             pre_play_field_position = pre_play_situation.field_position if pre_play_situation else 25
 
             # Run single play
+            if profiler is not None:
+                profiler.begin_play()
             play_result = self._run_play(drive_manager, possessing_team_id)
 
             # ✅ FIX 7: Process play FIRST to finalize field position and scoring detection
@@ -434,6 +476,9 @@ class GameLoopController:
 
                 plays_in_drive.append(finalized_play)
 
+            if profiler is not None:
+                profiler.mark(PHASE_DRIVE)
+
             # ✅ FIX: Record stats AFTER drive processing so TDs are included
             # DriveManager._update_touchdown_attribution() has already run at this point
             current_situation = drive_manager.get_current_situation() if not drive_manager.is_drive_over() else None
@@ -465,6 +510,9 @@ class GameLoopController:
             # Update statistics
             self.total_plays += 1
             drive_total_yards += play_result.yards
+            if profiler is not None:
+                profiler.mark(PHASE_STATS)
+                profiler.end_play()
 
         # FIX: Check if drive ended due to time expiration (quarter clock hit 0:00)
         # This happens when _is_quarter_complete() is True but drive_manager.is_drive_over() is False
@@ -572,6 +620,8 @@ class GameLoopController:
         Returns:
             PlayResult from play execution
         """
+        profiler = self.phase_profiler
+
         # Get current drive situation
         current_situation = drive_manager.get_current_situation()
 
@@ -611,6 +661,9 @@ class GameLoopController:
             raw_game_state=raw_game_state
         )
         
+        if profiler is not None:
+            profiler.mark(PHASE_SITUATION)
+
         # Get play callers for both teams
         offensive_play_caller = (self.home_play_caller if possessing_team_id == self.home_team.team_id 
                                else self.away_play_caller)
@@ -620,7 +673,10 @@ class GameLoopController:
         # Select plays
         offensive_play_call = offensive_play_caller.select_offensive_play(play_context)
         defensive_play_call = defensive_play_caller.select_defensive_play(play_context)
-        
+        if profiler is not None:
+            profiler.play_type = str(getattr(offensive_play_call, 'play_type', None) or 'unknown')
+            profiler.mark(PHASE_PLAY_CALLING)
+
         # Get team rosters
         offensive_players = (self.home_roster if possessing_team_id == self.home_team.team_id
                            else self.away_roster)
@@ -635,6 +691,17 @@ class GameLoopController:
             defensive_players, def_rotation_manager, defensive_play_call
         )
 
+        # Position indexes: offense is reused across snaps, defense follows the rotation
+        if possessing_team_id == self.home_team.team_id:
+            offensive_lineup, defensive_lineup = self.home_offense_lineup, self.away_defense_lineup
+        else:
+            offensive_lineup, defensive_lineup = self.away_offense_lineup, self.home_defense_lineup
+        if not offensive_lineup.covers(offensive_players):
+            offensive_lineup.update(offensive_players)
+        defensive_lineup.update(defensive_players)
+        if profiler is not None:
+            profiler.mark(PHASE_PERSONNEL)
+
         # Determine team IDs for proper player stats attribution
         offensive_team_id = (self.home_team.team_id if possessing_team_id == self.home_team.team_id
                              else self.away_team.team_id)
@@ -653,11 +720,15 @@ class GameLoopController:
             else self.rivalry_modifiers.away_offensive_boost
         )
         momentum_modifier = momentum_modifier * rivalry_offensive_boost
+        if profiler is not None:
+            profiler.mark(PHASE_PARAMS)
 
         # RB rotation: Select RB for run plays based on workload distribution
         rb_manager = self.home_rb_manager if possessing_team_id == self.home_team.team_id else self.away_rb_manager
-        available_rbs = [p for p in offensive_players if getattr(p, 'primary_position', None) == Position.RB]
+        available_rbs = list(offensive_lineup.players_at((Position.RB,)))
         selected_rb = rb_manager.select_rb_for_carry(available_rbs) if available_rbs else None
+        if profiler is not None:
+            profiler.mark(PHASE_PERSONNEL)
 
         # Create PlayEngineParams with momentum, variance trackers, environmental params, and selected RB
         play_params = PlayEngineParams(
@@ -678,11 +749,20 @@ class GameLoopController:
             selected_ball_carrier=selected_rb,  # RB rotation for workload distribution
             field_position=current_situation.field_position,  # Pass actual field position
             down=current_situation.down,  # Pass current down
-            distance=current_situation.yards_to_go  # Pass yards to go
+            distance=current_situation.yards_to_go,  # Pass yards to go
+            rng=self.rng,  # Per-game random streams
+            offensive_lineup=offensive_lineup,  # O(1) position lookups
+            defensive_lineup=defensive_lineup,
+            penalty_engine=self.penalty_engine  # Precompiled per-game penalty tables
         )
 
+        if profiler is not None:
+            profiler.mark(PHASE_PARAMS)
+
         # Execute play
         play_result = simulate(play_params)
+        if profiler is not None:
+            profiler.mark(PHASE_ENGINE)
 
         # Record RB carry for workload tracking (only for run plays)
         if selected_rb and hasattr(offensive_play_call, 'play_type'):
@@ -702,6 +782,8 @@ class GameLoopController:
 
         # NEW: Apply momentum decay after each play
         self.momentum_tracker.decay()
+        if profiler is not None:
+            profiler.mark(PHASE_MOMENTUM)
 
         # Advance game clock by play time
         clock_result = self.game_manager.game_clock.advance_time(play_result.time_elapsed)
@@ -711,6 +793,8 @@ class GameLoopController:
         # should reflect only 3 seconds consumed, not 25
         if clock_result.time_advanced < play_result.time_elapsed:
             play_result.time_elapsed = clock_result.time_advanced
+        if profiler is not None:
+            profiler.mark(PHASE_CLOCK)
 
         # ✅ FIX: Stats recording moved to _run_drive() AFTER drive processing
         # This ensures TDs added by DriveManager are included in stats
@@ -846,7 +930,9 @@ class GameLoopController:
                 offensive_players=offensive_players,
                 defensive_players=defensive_players,
                 offensive_formation=SpecialTeamsFormation.FIELD_GOAL.value,  # Standard PAT formation
-                defensive_formation=SpecialTeamsFormation.FIELD_GOAL_BLOCK.value  # Standard PAT defense
+                defensive_formation=SpecialTeamsFormation.FIELD_GOAL_BLOCK.value,  # Standard PAT defense
+                rng=self.rng,
+                penalty_engine=self.penalty_engine
             )
         except (IndexError, AttributeError, KeyError) as e:
             logger.warning("PAT simulator init failed: %s. Defaulting to made.", e)
@@ -1242,7 +1328,8 @@ class GameLoopController:
             player_stats=player_stats,              # List[PlayerStats] - guaranteed objects
             home_team_stats=home_stats_dict,        # Dict with momentum info
             away_team_stats=away_stats_dict,        # Dict with momentum info
-            final_statistics=comprehensive_stats    # Dict for serialization (includes momentum)
+            final_statistics=comprehensive_stats,   # Dict for serialization (includes momentum)
+            play_phase_profile=self.phase_profiler.report() if self.phase_profiler is not None else None
         )
 
         # Debug logging for GameResult
@@ -1414,7 +1501,7 @@ class GameLoopController:
         Returns:
             Weather condition string ("clear", "rain", "heavy_wind", "snow")
         """
-        rand = random.random()
+        rand = stream_or_global(self.rng, GAME_STREAM).random()
         if rand < WEATHER_PROBABILITY_CLEAR:
             return WeatherCondition.CLEAR.value
         elif rand < WEATHER_PROBABILITY_RAIN:
@@ -1618,14 +1705,19 @@ class GameLoopController:
         if dl_slots == 0 and lb_slots == 0 and db_slots == 0:
             dl_slots, lb_slots, db_slots = 4, 3, 4
 
-        # Group players by position
-        dl_players = [p for p in defensive_players
-                     if getattr(p, 'primary_position', '').lower() in DEFENSIVE_LINE_POSITIONS]
-        lb_players = [p for p in defensive_players
-                     if getattr(p, 'primary_position', '').lower() in LINEBACKER_POSITIONS
-                     or 'linebacker' in getattr(p, 'primary_position', '').lower()]
-        db_players = [p for p in defensive_players
-                     if getattr(p, 'primary_position', '').lower() in DEFENSIVE_BACK_POSITIONS]
+        # Group players by position (once per roster list - membership doesn't change)
+        groups = self._defensive_groups.get(id(defensive_players))
+        if groups is None or groups[0] is not defensive_players:
+            dl = [p for p in defensive_players
+                  if getattr(p, 'primary_position', '').lower() in DEFENSIVE_LINE_POSITIONS]
+            lb = [p for p in defensive_players
+                  if getattr(p, 'primary_position', '').lower() in LINEBACKER_POSITIONS
+                  or 'linebacker' in getattr(p, 'primary_position', '').lower()]
+            db = [p for p in defensive_players
+                  if getattr(p, 'primary_position', '').lower() in DEFENSIVE_BACK_POSITIONS]
+            groups = (defensive_players, dl, lb, db)
+            self._defensive_groups[id(defensive_players)] = groups
+        _, dl_players, lb_players, db_players = groups
 
         # Apply rotation selection for each position group
         rotated_dl = rotation_manager.select_field_players('DL', dl_players, dl_slots)
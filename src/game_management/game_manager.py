@@ -5,11 +5,11 @@ Central orchestrator for complete NFL game simulation. Coordinates all game syst
 including clock management, drive management, possession tracking, scoring, and statistics.
 """
 
-import random
 from dataclasses import dataclass
 from typing import Optional, Dict, List, Tuple
 from enum import Enum
 
+from play_engine.core.rng import GameRNG, stream_or_global, GAME_STREAM
 from play_engine.game_state.game_clock import GameClock
 from play_engine.game_state.drive_manager import DriveManager
 from play_engine.game_state.possession_manager import PossessionManager
@@ -69,16 +69,18 @@ class GameManager:
     - Statistics: Player and team statistics accumulation
     """
     
-    def __init__(self, home_team: Team, away_team: Team):
+    def __init__(self, home_team: Team, away_team: Team, rng: Optional[GameRNG] = None):
         """
         Initialize game between two teams
         
         Args:
             home_team: Home team object with full metadata
             away_team: Away team object with full metadata
+            rng: Per-game GameRNG for the coin toss (None = global random module)
         """
         self.home_team = home_team
         self.away_team = away_team
+        self._rng = stream_or_global(rng, GAME_STREAM)
         
         # Initialize core game systems
         self.game_clock = GameClock()
@@ -127,10 +129,10 @@ class GameManager:
     def _conduct_coin_toss(self) -> None:
         """Conduct opening coin toss with realistic NFL logic"""
         # Away team calls the toss
-        self.coin_toss_winner = random.choice([self.home_team.team_id, self.away_team.team_id])
+        self.coin_toss_winner = self._rng.choice([self.home_team.team_id, self.away_team.team_id])
         
         # Winner typically defers to second half (70% of the time)
-        if random.random() < 0.7:
+        if self._rng.random() < 0.7:
             # Winner defers - opponent receives opening kickoff
             self.opening_kickoff_team = self.coin_toss_winner
             self.second_half_receiving_team = self.coin_toss_winner
@@ -397,8 +399,7 @@ class GameManager:
             overtime_receiving_team = self.home_team.team_id if self.opening_kickoff_team == self.away_team.team_id else self.away_team.team_id
         else:
             # Fallback: use current possession or random choice
-            import random
-            overtime_receiving_team = random.choice([self.home_team.team_id, self.away_team.team_id])
+            overtime_receiving_team = self._rng.choice([self.home_team.team_id, self.away_team.team_id])
         
         self.possession_manager.set_possession(overtime_receiving_team, "overtime_coin_toss")
         self._log_event(f"🪙 Overtime possession: {self._get_team_name(overtime_receiving_team)} receives")
@@ -0,0 +1,273 @@
+"""
+Play Phase Profiler
+
+Opt-in timer for the per-play hot path of GameLoopController. Each snap is
+split into phases (situation, play calling, personnel, engine params, play
+engine, penalties, momentum, clock, drive bookkeeping, stats) and timed with
+time.perf_counter_ns() into counters allocated up front, so recording a phase
+is one clock read and two list updates.
+
+Profiling is off unless a profiler is passed to GameLoopController; the
+controller then skips every timing call, so unprofiled games pay only a None
+check per phase.
+
+Usage:
+    profiler = PlayPhaseProfiler()
+    controller = GameLoopController(..., phase_profiler=profiler)
+    result = controller.run_game()
+    print(result.play_phase_profile.format_table())
+
+    # A whole week (reports are picklable, e.g. from worker processes)
+    week = PlayPhaseReport.combine(r.play_phase_profile for r in results)
+"""
+
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# Phase indexes into the counter lists (order = order within a play)
+PHASE_SITUATION = 0      # Drive situation, score and game state for play calling
+PHASE_PLAY_CALLING = 1   # Offensive and defensive play selection
+PHASE_PERSONNEL = 2      # Defensive rotation, lineup indexes, RB selection
+PHASE_PARAMS = 3         # Momentum/rivalry modifiers and PlayEngineParams
+PHASE_ENGINE = 4         # play_engine.core.engine.simulate (minus penalties)
+PHASE_PENALTIES = 5      # PenaltyEngine.check_for_penalty inside the engine
+PHASE_MOMENTUM = 6       # RB carry tracking, momentum events and decay
+PHASE_CLOCK = 7          # Game clock advance
+PHASE_DRIVE = 8          # DriveManager.process_play_result and play history
+PHASE_STATS = 9          # CentralizedStatsAggregator.record_play_result
+
+PHASE_NAMES = (
+    "situation", "play_calling", "personnel", "params", "engine",
+    "penalties", "momentum", "clock", "drive", "stats",
+)
+NUM_PHASES = len(PHASE_NAMES)
+
+UNKNOWN_PLAY_TYPE = "unknown"
+
+
+@dataclass
+class PlayPhaseReport:
+    """
+    Time per play phase and per play type for one or more games.
+
+    All times are integer nanoseconds. game_ns is the wall time of run_game()
+    for the included games; other_ns is the part outside the timed play
+    phases (kickoffs, PATs, drive transitions, overtime setup).
+    """
+    games: int = 0
+    plays: int = 0
+    game_ns: int = 0
+    phase_ns: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(PHASE_NAMES, 0))
+    # play type -> {"plays": count, <phase name>: ns, ...}
+    play_types: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def play_ns(self) -> int:
+        """Time spent in timed play phases."""
+        return sum(self.phase_ns.values())
+
+    @property
+    def other_ns(self) -> int:
+        """Game time outside the timed play phases."""
+        return max(0, self.game_ns - self.play_ns)
+
+    def merge(self, other: "PlayPhaseReport") -> "PlayPhaseReport":
+        """
+        Add another report's counts into this one.
+
+        Args:
+            other: Report to add
+
+        Returns:
+            self, for chaining
+        """
+        self.games += other.games
+        self.plays += other.plays
+        self.game_ns += other.game_ns
+        for name, ns in other.phase_ns.items():
+            self.phase_ns[name] = self.phase_ns.get(name, 0) + ns
+        for play_type, counts in other.play_types.items():
+            row = self.play_types.setdefault(play_type, {})
+            for key, value in counts.items():
+                row[key] = row.get(key, 0) + value
+        return self
+
+    @classmethod
+    def combine(cls, reports: Iterable[Optional["PlayPhaseReport"]]) -> "PlayPhaseReport":
+        """
+        Aggregate reports (e.g. every game of a week); None entries are skipped.
+
+        Args:
+            reports: Per-game reports
+
+        Returns:
+            New report with the summed counts
+        """
+        total = cls()
+        for report in reports:
+            if report is not None:
+                total.merge(report)
+        return total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Structured summary in milliseconds for logs and JSON reports.
+
+        Returns:
+            Dict with totals, per-phase ms/share/µs-per-play and per play type
+            plays, ms and µs-per-play
+        """
+        play_ns = self.play_ns
+        phases = {
+            name: {
+                "ms": round(ns / 1e6, 3),
+                "share": round(ns / play_ns, 4) if play_ns else 0.0,
+                "us_per_play": round(ns / self.plays / 1e3, 2) if self.plays else 0.0,
+            }
+            for name, ns in self.phase_ns.items()
+        }
+        play_types = {}
+        for play_type, counts in sorted(self.play_types.items()):
+            plays = counts.get("plays", 0)
+            type_ns = sum(counts.get(name, 0) for name in PHASE_NAMES)
+            play_types[play_type] = {
+                "plays": plays,
+                "ms": round(type_ns / 1e6, 3),
+                "us_per_play": round(type_ns / plays / 1e3, 2) if plays else 0.0,
+                "phases_ms": {name: round(counts.get(name, 0) / 1e6, 3) for name in PHASE_NAMES},
+            }
+        return {
+            "games": self.games,
+            "plays": self.plays,
+            "game_ms": round(self.game_ns / 1e6, 3),
+            "play_ms": round(play_ns / 1e6, 3),
+            "other_ms": round(self.other_ns / 1e6, 3),
+            "phases": phases,
+            "play_types": play_types,
+        }
+
+    def format_table(self) -> str:
+        """Human-readable phase table (slowest phase first)."""
+        summary = self.to_dict()
+        lines = [
+            f"{summary['games']} games, {summary['plays']} plays, "
+            f"{summary['game_ms']:.1f} ms ({summary['other_ms']:.1f} ms outside plays)"
+        ]
+        ranked = sorted(summary["phases"].items(), key=lambda item: item[1]["ms"], reverse=True)
+        for name, phase in ranked:
+            lines.append(
+                f"  {name:<14}{phase['ms']:>10.1f} ms {phase['share']:>7.1%}"
+                f"{phase['us_per_play']:>10.1f} us/play"
+            )
+        for play_type, row in summary["play_types"].items():
+            lines.append(
+                f"  [{play_type}] {row['plays']} plays, {row['us_per_play']:.1f} us/play"
+            )
+        return "\n".join(lines)
+
+
+class PlayPhaseProfiler:
+    """
+    Records phase times for the plays of one game.
+
+    The controller calls begin_play() before a snap, mark(phase) after each
+    phase (charging the time since the previous mark to that phase) and
+    end_play() once the play's stats are recorded.
+    """
+
+    __slots__ = (
+        "_totals", "_current", "_by_type", "_last_ns", "_game_start_ns",
+        "_in_play", "game_ns", "games", "plays", "play_type",
+    )
+
+    def __init__(self):
+        self._totals: List[int] = [0] * NUM_PHASES
+        self._current: List[int] = [0] * NUM_PHASES
+        # play type -> [plays, ns per phase...]
+        self._by_type: Dict[str, List[int]] = {}
+        self._last_ns = 0
+        self._game_start_ns = 0
+        self._in_play = False
+        self.game_ns = 0
+        self.games = 0
+        self.plays = 0
+        self.play_type = UNKNOWN_PLAY_TYPE
+
+    def begin_game(self) -> None:
+        """Start the game clock."""
+        self._game_start_ns = perf_counter_ns()
+
+    def end_game(self) -> None:
+        """Stop the game clock."""
+        self.game_ns += perf_counter_ns() - self._game_start_ns
+        self.games += 1
+
+    def begin_play(self) -> None:
+        """Start timing a play."""
+        self.play_type = UNKNOWN_PLAY_TYPE
+        self._in_play = True
+        self._last_ns = perf_counter_ns()
+
+    def mark(self, phase: int) -> None:
+        """Charge the time since the previous mark to a phase."""
+        now = perf_counter_ns()
+        self._current[phase] += now - self._last_ns
+        self._last_ns = now
+
+    def end_play(self) -> None:
+        """Add the current play to the totals and its play type."""
+        current = self._current
+        row = self._by_type.get(self.play_type)
+        if row is None:
+            row = self._by_type[self.play_type] = [0] * (NUM_PHASES + 1)
+        row[0] += 1
+        totals = self._totals
+        for phase in range(NUM_PHASES):
+            ns = current[phase]
+            totals[phase] += ns
+            row[phase + 1] += ns
+            current[phase] = 0
+        self.plays += 1
+        self._in_play = False
+
+    def instrument_penalties(self, penalty_engine: Any) -> None:
+        """
+        Time penalty checks separately from the rest of the play engine.
+
+        Wraps check_for_penalty on this engine instance only. Checks made
+        during a play move their time from the engine phase to the penalty
+        phase; checks outside plays (PAT attempts) are not timed.
+
+        Args:
+            penalty_engine: The game's PenaltyEngine
+        """
+        check_for_penalty = penalty_engine.check_for_penalty
+        current = self._current
+
+        def timed_check_for_penalty(*args, **kwargs):
+            if not self._in_play:
+                return check_for_penalty(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return check_for_penalty(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                current[PHASE_PENALTIES] += elapsed
+                current[PHASE_ENGINE] -= elapsed
+
+        penalty_engine.check_for_penalty = timed_check_for_penalty
+
+    def report(self) -> PlayPhaseReport:
+        """Snapshot of the recorded plays as a PlayPhaseReport."""
+        return PlayPhaseReport(
+            games=self.games,
+            plays=self.plays,
+            game_ns=self.game_ns,
+            phase_ns=dict(zip(PHASE_NAMES, self._totals)),
+            play_types={
+                play_type: {"plays": row[0], **dict(zip(PHASE_NAMES, row[1:]))}
+                for play_type, row in self._by_type.items()
+            },
+        )
@@ -29,6 +29,8 @@ import random
 from enum import Enum
 from typing import Optional
 
+from play_engine.core.rng import GameRNG, RANDOM_EVENTS_STREAM
+
 
 class RandomEventType(Enum):
     """Types of random events that can occur during plays"""
@@ -53,18 +55,25 @@ class RandomEventChecker:
     """
     Checks for random rare events at realistic NFL rates.
 
-    Can be initialized with a random seed for testing reproducibility.
+    Can be initialized with a random seed for testing reproducibility, or
+    with a per-game GameRNG so rolls come from the game's own stream.
     """
 
-    def __init__(self, seed: Optional[int] = None):
+    def __init__(self, seed: Optional[int] = None, rng: Optional[GameRNG] = None):
         """
         Initialize random event checker.
 
         Args:
-            seed: Optional random seed for reproducible testing
+            seed: Optional random seed for reproducible testing (uses a private
+                generator; the global random module is not reseeded)
+            rng: Per-game GameRNG (takes precedence over seed)
         """
-        if seed is not None:
-            random.seed(seed)
+        if rng is not None:
+            self._rng = rng.stream(RANDOM_EVENTS_STREAM)
+        elif seed is not None:
+            self._rng = random.Random(seed)
+        else:
+            self._rng = random
 
     def check_event(self, event_type: RandomEventType) -> bool:
         """
@@ -77,7 +86,7 @@ class RandomEventChecker:
             True if event occurs, False otherwise
         """
         probability = EVENT_PROBABILITIES.get(event_type, 0.0)
-        return random.random() < probability
+        return self._rng.random() < probability
 
     def check_blocked_punt(self) -> bool:
         """
@@ -565,8 +565,8 @@ class OffseasonEventScheduler:
                 FROM events
                 WHERE dynasty_id = ?
                   AND event_type = 'GAME'
-                  AND json_extract(data, '$.parameters.season_type') = 'preseason'
-                  AND json_extract(data, '$.parameters.season') = ?
+                  AND game_season = ?
+                  AND game_season_type = 'preseason'
             '''
 
             cursor.execute(query, (dynasty_id, season_year + 1))
@@ -41,15 +41,23 @@ class TransactionLogger:
     - Contract and event ID linking
     """
 
-    def __init__(self, database_path: str = "data/database/nfl_simulation.db"):
+    def __init__(
+        self,
+        database_path: str = "data/database/nfl_simulation.db",
+        connection: Optional[sqlite3.Connection] = None
+    ):
         """
         Initialize Transaction Logger.
 
         Args:
             database_path: Path to SQLite database
+            connection: Optional shared database connection for transaction mode.
+                       If provided, transactions are inserted on it without
+                       committing (the caller manages the transaction).
         """
         self.database_path = database_path
         self.db_connection = DatabaseConnection(database_path)
+        self.shared_conn = connection  # Use for transaction mode
         self.logger = logging.getLogger(__name__)
 
     def log_transaction(
@@ -445,6 +453,28 @@ class TransactionLogger:
         Raises:
             sqlite3.Error: If database operation fails after retries
         """
+        insert_query = '''
+            INSERT INTO player_transactions (
+                dynasty_id, season, transaction_type,
+                player_id, first_name, last_name, position,
+                from_team_id, to_team_id,
+                transaction_date, details,
+                contract_id, event_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        '''
+        params = (
+            dynasty_id, season, transaction_type,
+            player_id, first_name, last_name, position,
+            from_team_id, to_team_id,
+            transaction_date, details_json,
+            contract_id, event_id
+        )
+
+        # Use shared connection if available (for transaction mode)
+        if self.shared_conn:
+            cursor = self.shared_conn.execute(insert_query, params)
+            return cursor.lastrowid  # Don't commit - caller manages transaction
+
         max_retries = 5
         base_delay = 0.1  # 100ms base delay
 
@@ -452,22 +482,7 @@ class TransactionLogger:
             conn = self.db_connection.get_connection()
 
             try:
-                cursor = conn.execute('''
-                    INSERT INTO player_transactions (
-                        dynasty_id, season, transaction_type,
-                        player_id, first_name, last_name, position,
-                        from_team_id, to_team_id,
-                        transaction_date, details,
-                        contract_id, event_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    dynasty_id, season, transaction_type,
-                    player_id, first_name, last_name, position,
-                    from_team_id, to_team_id,
-                    transaction_date, details_json,
-                    contract_id, event_id
-                ))
-
+                cursor = conn.execute(insert_query, params)
                 conn.commit()
                 transaction_id = cursor.lastrowid
 
@@ -71,7 +71,17 @@ def simulate(play_engine_params):
                 performance_tracker=play_engine_params.get_performance_tracker(),  # RB hot/cold streaks
 
                 # ✅ FIX 1: Pass field position for touchdown detection
-                field_position=play_engine_params.get_field_position()
+                field_position=play_engine_params.get_field_position(),
+
+                # Per-game random streams (None = global random module)
+                rng=play_engine_params.get_rng(),
+
+                # Per-game position indexes (O(1) player lookups)
+                offensive_lineup=play_engine_params.get_offensive_lineup(),
+                defensive_lineup=play_engine_params.get_defensive_lineup(),
+
+                # Shared per-game penalty engine (precompiled penalty tables)
+                penalty_engine=play_engine_params.get_penalty_engine()
             )
             
             # Create context with actual field position for penalty calculations
@@ -162,7 +172,17 @@ def simulate(play_engine_params):
 
                 # NEW: Blitz package and rusher assignments for dynamic sack attribution
                 blitz_package=blitz_package,
-                rusher_assignments=rusher_assignments
+                rusher_assignments=rusher_assignments,
+
+                # Per-game random streams (None = global random module)
+                rng=play_engine_params.get_rng(),
+
+                # Per-game position indexes (O(1) player lookups)
+                offensive_lineup=play_engine_params.get_offensive_lineup(),
+                defensive_lineup=play_engine_params.get_defensive_lineup(),
+
+                # Shared per-game penalty engine (precompiled penalty tables)
+                penalty_engine=play_engine_params.get_penalty_engine()
             )
             
             # Create context with actual field position for penalty calculations
@@ -281,7 +301,9 @@ def simulate(play_engine_params):
                     # NEW: Pass environmental context (subset - no clutch/primetime for FG)
                     weather_condition=play_engine_params.get_weather_condition(),
                     crowd_noise_level=play_engine_params.get_crowd_noise_level(),
-                    is_away_team=play_engine_params.is_away_team_offensive()
+                    is_away_team=play_engine_params.is_away_team_offensive(),
+                    rng=play_engine_params.get_rng(),
+                    penalty_engine=play_engine_params.get_penalty_engine()
                 )
                 
                 # Get comprehensive simulation results using validated enum params
@@ -349,7 +371,9 @@ def simulate(play_engine_params):
                     defensive_players=defensive_players,
                     offensive_formation=offensive_formation,
                     defensive_formation=defensive_formation,
-                    random_event_checker=play_engine_params.get_random_event_checker()  # NEW (Tollgate 7)
+                    random_event_checker=play_engine_params.get_random_event_checker(),  # NEW (Tollgate 7)
+                    rng=play_engine_params.get_rng(),
+                    penalty_engine=play_engine_params.get_penalty_engine()
                 )
                 
                 # Get comprehensive simulation results
@@ -406,7 +430,9 @@ def simulate(play_engine_params):
                     offensive_formation=offensive_formation,
                     defensive_formation=defensive_formation,
                     offensive_team_id=play_engine_params.get_offensive_team_id(),
-                    defensive_team_id=play_engine_params.get_defensive_team_id()
+                    defensive_team_id=play_engine_params.get_defensive_team_id(),
+                    rng=play_engine_params.get_rng(),
+                    penalty_engine=play_engine_params.get_penalty_engine()
                 )
                 
                 # Get comprehensive simulation results using validated enum params
@@ -6,7 +6,8 @@ class PlayEngineParams:
                  weather_condition="clear", crowd_noise_level=0, clutch_factor=0.0,
                  primetime_variance=0.0, is_away_team=False, selected_ball_carrier=None,
                  performance_tracker=None, random_event_checker=None,
-                 field_position=50, down=1, distance=10):
+                 field_position=50, down=1, distance=10, rng=None,
+                 offensive_lineup=None, defensive_lineup=None, penalty_engine=None):
         """
         Initialize play engine parameters
 
@@ -29,6 +30,10 @@ class PlayEngineParams:
             field_position: Current field position (1-100 scale, default 50)
             down: Current down (1-4, default 1)
             distance: Yards to go for first down (default 10)
+            rng: Per-game GameRNG for reproducible outcomes (None = global random module)
+            offensive_lineup: GameLineupIndex over offensive_players (optional, O(1) position lookups)
+            defensive_lineup: GameLineupIndex over defensive_players (optional)
+            penalty_engine: Shared per-game PenaltyEngine (None = simulators create their own)
         """
         self.offensive_players = offensive_players  # List of 11 Player objects
         self.defensive_players = defensive_players  # List of 11 Player objects
@@ -56,6 +61,16 @@ class PlayEngineParams:
         self.field_position = field_position
         self.down = down
         self.distance = distance
+
+        # Per-game random streams
+        self.rng = rng
+
+        # Per-game position indexes over the player lists above
+        self.offensive_lineup = offensive_lineup
+        self.defensive_lineup = defensive_lineup
+
+        # Per-game penalty engine (precompiled penalty tables, reused every play)
+        self.penalty_engine = penalty_engine
     
     def get_offensive_play_call(self):
         """Get the offensive play call object"""
@@ -129,6 +144,22 @@ class PlayEngineParams:
         """Get the yards to go for first down"""
         return self.distance
 
+    def get_rng(self):
+        """Get the per-game GameRNG (None = global random module)"""
+        return self.rng
+
+    def get_offensive_lineup(self):
+        """Get the offensive GameLineupIndex (None if not provided)"""
+        return self.offensive_lineup
+
+    def get_defensive_lineup(self):
+        """Get the defensive GameLineupIndex (None if not provided)"""
+        return self.defensive_lineup
+
+    def get_penalty_engine(self):
+        """Get the shared per-game PenaltyEngine (None if not provided)"""
+        return self.penalty_engine
+
     def __str__(self):
         off_count = len(self.offensive_players) if self.offensive_players else 0
         def_count = len(self.defensive_players) if self.defensive_players else 0
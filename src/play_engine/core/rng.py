@@ -0,0 +1,139 @@
+"""
+Per-game random number streams for the play engine.
+
+Every game owns a GameRNG seeded from (dynasty_id, season, week, game_id).
+Each subsystem (run plays, pass plays, penalties, tackler selection, ...)
+draws from its own independent random.Random sub-stream, so:
+
+- Games are reproducible: re-simulating the same game yields the same result
+- Games are isolated: parallel games (threads or processes) and code that
+  reseeds the global random module cannot perturb an in-flight game
+- Subsystems are isolated: an extra draw in one subsystem does not shift
+  the sequence seen by the others
+
+Components accept an optional GameRNG. When none is given they keep using
+the global random module (legacy behavior, still used by demos and tests
+that call random.seed()).
+
+Usage:
+    rng = GameRNG.for_game(dynasty_id, season, week, game_id)
+    pass_rng = stream_or_global(rng, PASS_STREAM)
+    if pass_rng.random() < completion_rate:
+        ...
+"""
+
+import hashlib
+import random
+from typing import Any, Dict, Optional
+
+
+# Sub-stream names (one per subsystem)
+GAME_STREAM = "game"                        # Coin toss, weather
+PLAY_CALLING_STREAM = "play_calling"        # Formation/concept/blitz selection
+ROTATION_STREAM = "rotation"                # RB and defensive rotations
+DRIVE_TRANSITION_STREAM = "drive_transition"  # Kickoffs/punts between drives
+PLAY_DURATION_STREAM = "play_duration"      # Clock variance per play
+RUN_STREAM = "run"
+PASS_STREAM = "pass"
+PUNT_STREAM = "punt"
+KICKOFF_STREAM = "kickoff"
+FIELD_GOAL_STREAM = "field_goal"
+EXTRA_POINT_STREAM = "extra_point"
+TACKLER_STREAM = "tackler"
+PENALTY_STREAM = "penalty"
+RANDOM_EVENTS_STREAM = "random_events"
+
+
+def derive_seed(*parts: Any) -> int:
+    """
+    Derive a stable 64-bit seed from arbitrary parts.
+
+    Uses SHA-256 rather than hash() so seeds are identical across processes
+    and Python runs (str hashing is randomized per process).
+
+    Args:
+        *parts: Values identifying the seed (converted with str())
+
+    Returns:
+        Non-negative 64-bit integer seed
+    """
+    key = "\x1f".join(str(part) for part in parts).encode("utf-8")
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "big")
+
+
+class GameRNG:
+    """
+    Root random context for a single game.
+
+    Holds one lazily-created random.Random per subsystem. Sub-stream seeds
+    are derived from the root seed and the stream name, so streams are
+    independent of each other and of creation order.
+    """
+
+    def __init__(self, seed: int):
+        """
+        Initialize game RNG.
+
+        Args:
+            seed: Root seed for the game
+        """
+        self.seed = seed
+        self._streams: Dict[str, random.Random] = {}
+
+    @classmethod
+    def for_game(
+        cls,
+        dynasty_id: Optional[str],
+        season: int,
+        week: int,
+        game_id: str
+    ) -> "GameRNG":
+        """
+        Create the RNG for a scheduled game.
+
+        Args:
+            dynasty_id: Dynasty identifier
+            season: Season year
+            week: Week number
+            game_id: Unique game identifier
+
+        Returns:
+            GameRNG seeded from the game's identity
+        """
+        return cls(derive_seed(dynasty_id, season, week, game_id))
+
+    def stream(self, name: str) -> random.Random:
+        """
+        Get the sub-stream for a subsystem (created on first use).
+
+        Args:
+            name: Sub-stream name (e.g. PASS_STREAM)
+
+        Returns:
+            random.Random dedicated to that subsystem for this game
+        """
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = random.Random(derive_seed(self.seed, name))
+            self._streams[name] = rng
+        return rng
+
+    def __repr__(self) -> str:
+        return f"GameRNG(seed={self.seed})"
+
+
+def stream_or_global(rng: Optional[GameRNG], name: str) -> Any:
+    """
+    Resolve the random source for a subsystem.
+
+    Args:
+        rng: Game RNG, or None for legacy global randomness
+        name: Sub-stream name
+
+    Returns:
+        The named sub-stream, or the global random module when rng is None
+        (both expose random(), randint(), uniform(), gauss(), choice(), ...)
+    """
+    if rng is None:
+        return random
+    return rng.stream(name)
@@ -0,0 +1,212 @@
+"""
+Game Lineup Index - Per-game position lookups for play simulators.
+
+Play simulators receive a team's full roster (~53 players) and repeatedly
+filter it by position: finding the QB, the on-field offensive line, the
+pass rushers, the receiving backs, the tackler pools, ... Each filter is an
+O(roster) scan, and several run on every snap.
+
+GameLineupIndex buckets a roster by position once. Lookups are then served
+from cached tuples:
+
+- players_at(positions): roster-order players at any of the positions
+- first_at(position): first roster player at a position
+- field_players(formation, personnel, positions): depth-chart-sorted,
+  formation-limited players actually on the field
+- field_ratings(...): cached rating vectors for those on-field players
+
+The index must be refreshed with update() whenever the roster order or
+membership changes (defensive rotation reorders the defense every snap,
+injuries remove players). Ratings are assumed constant within a game.
+
+Usage:
+    offense = GameLineupIndex(home_roster)
+    qb = offense.first_at(Position.QB)
+    line = offense.field_players(formation, personnel, [Position.LT, Position.C])
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from constants.position_abbreviations import get_position_limit_with_aliases
+
+
+def depth_chart_key(player: Any) -> Tuple[int, int]:
+    """Sort key putting starters first (depth chart order, then best overall)."""
+    return (getattr(player, 'depth_chart_order', 99), -getattr(player, 'overall', 0))
+
+
+def select_field_players(candidates: Sequence, personnel: Dict[str, int]) -> List:
+    """
+    Limit candidates to the players a formation actually puts on the field.
+
+    Candidates are sorted by depth chart (stable, so ties keep roster order)
+    and admitted until each formation slot (with position alias support)
+    is filled.
+
+    Args:
+        candidates: Players matching the requested positions, in roster order
+        personnel: Formation personnel requirements (position -> count)
+
+    Returns:
+        On-field players, starters first
+    """
+    position_counts: Dict[str, int] = {}
+    field_players = []
+
+    for player in sorted(candidates, key=depth_chart_key):
+        position = getattr(player, 'primary_position', '')
+
+        # Get the limit for this position from formation (with alias support)
+        pos_limit, tracking_pos = get_position_limit_with_aliases(position, personnel, position_counts)
+
+        pos_count = position_counts.get(tracking_pos, 0)
+        if pos_count >= pos_limit:
+            continue  # Formation doesn't use more of this position
+
+        field_players.append(player)
+        position_counts[tracking_pos] = pos_count + 1
+
+    return field_players
+
+
+class GameLineupIndex:
+    """
+    Position index over one team's roster for the duration of a game.
+
+    Built once per team per game; call update() after a rotation or injury
+    changes the roster list. All cached lookups are invalidated on update.
+    """
+
+    def __init__(self, players: List):
+        """
+        Build the index.
+
+        Args:
+            players: Team roster (order is preserved and significant)
+        """
+        self.players: List = []
+        self._order: Dict[int, int] = {}
+        self._by_position: Dict[Any, List] = {}
+        self._players_at_cache: Dict[Tuple, Tuple] = {}
+        self._field_cache: Dict[Tuple, Tuple] = {}
+        self._ratings_cache: Dict[Tuple, Tuple] = {}
+        self.update(players)
+
+    def update(self, players: List) -> None:
+        """
+        Re-index after the roster order or membership changed.
+
+        Args:
+            players: New roster list (e.g. defense reordered by rotation)
+        """
+        self.players = players
+        self._order = {id(player): i for i, player in enumerate(players)}
+        self._by_position = {}
+        for player in players:
+            position = getattr(player, 'primary_position', None)
+            self._by_position.setdefault(position, []).append(player)
+        self._players_at_cache.clear()
+        self._field_cache.clear()
+        self._ratings_cache.clear()
+
+    def covers(self, players: List) -> bool:
+        """Check whether this index was built for exactly this roster list."""
+        return players is self.players
+
+    def first_at(self, position: str) -> Optional[Any]:
+        """
+        Get the first roster player at a position.
+
+        Args:
+            position: Position string
+
+        Returns:
+            Player or None if the roster has nobody at that position
+        """
+        bucket = self._by_position.get(position)
+        return bucket[0] if bucket else None
+
+    def players_at(self, positions: Sequence[str]) -> Tuple:
+        """
+        Get all roster players at any of the positions, in roster order.
+
+        Args:
+            positions: Position strings to match
+
+        Returns:
+            Tuple of matching players (cached)
+        """
+        key = tuple(positions)
+        cached = self._players_at_cache.get(key)
+        if cached is None:
+            buckets = [self._by_position.get(position, ()) for position in dict.fromkeys(key)]
+            if len(buckets) == 1:
+                cached = tuple(buckets[0])
+            else:
+                merged = [player for bucket in buckets for player in bucket]
+                merged.sort(key=lambda player: self._order[id(player)])
+                cached = tuple(merged)
+            self._players_at_cache[key] = cached
+        return cached
+
+    def field_players(
+        self,
+        formation: str,
+        personnel: Dict[str, int],
+        positions: Sequence[str]
+    ) -> Tuple:
+        """
+        Get the on-field players at the positions for a formation.
+
+        Args:
+            formation: Formation name (cache key)
+            personnel: Personnel requirements for that formation
+            positions: Position strings to match
+
+        Returns:
+            Tuple of on-field players, starters first (cached)
+        """
+        key = (formation, tuple(positions))
+        cached = self._field_cache.get(key)
+        if cached is None:
+            cached = tuple(select_field_players(self.players_at(positions), personnel))
+            self._field_cache[key] = cached
+        return cached
+
+    def field_ratings(
+        self,
+        formation: str,
+        personnel: Dict[str, int],
+        positions: Sequence[str],
+        rating: str = 'overall'
+    ) -> Tuple:
+        """
+        Get a rating vector for the on-field players at the positions.
+
+        Players without a ratings dict are skipped.
+
+        Args:
+            formation: Formation name (cache key)
+            personnel: Personnel requirements for that formation
+            positions: Position strings to match
+            rating: Rating name (e.g. 'overall', 'hands')
+
+        Returns:
+            Tuple of rating values (cached)
+        """
+        key = (formation, tuple(positions), rating)
+        cached = self._ratings_cache.get(key)
+        if cached is None:
+            cached = tuple(
+                player.get_rating(rating)
+                for player in self.field_players(formation, personnel, positions)
+                if hasattr(player, 'ratings')
+            )
+            self._ratings_cache[key] = cached
+        return cached
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def __repr__(self) -> str:
+        return f"GameLineupIndex(players={len(self.players)}, positions={len(self._by_position)})"
@@ -61,7 +61,8 @@ class DefensiveRotationManager:
         self,
         dl_starter_share: float = 0.65,
         lb_starter_share: float = 0.80,
-        db_starter_share: float = 0.90
+        db_starter_share: float = 0.90,
+        rng=None
     ):
         """
         Initialize defensive rotation manager.
@@ -70,6 +71,7 @@ class DefensiveRotationManager:
             dl_starter_share: Target percentage for DL starters (0.55-0.75)
             lb_starter_share: Target percentage for LB starters (0.70-0.85)
             db_starter_share: Target percentage for DB starters (0.82-0.95)
+            rng: Random source (e.g. a GameRNG sub-stream; None = global random module)
         """
         self.position_configs = {
             'DL': PositionGroupConfig(starter_share=dl_starter_share),
@@ -86,8 +88,10 @@ class DefensiveRotationManager:
         # Track which players are starters for each position group
         self._starter_keys: Dict[str, set] = {'DL': set(), 'LB': set(), 'DB': set()}
 
+        self._rng = rng or random
+
     @classmethod
-    def from_defensive_coordinator(cls, dc: 'DefensiveCoordinator') -> 'DefensiveRotationManager':
+    def from_defensive_coordinator(cls, dc: 'DefensiveCoordinator', rng=None) -> 'DefensiveRotationManager':
         """
         Create manager from DC philosophy.
 
@@ -97,6 +101,7 @@ class DefensiveRotationManager:
 
         Args:
             dc: DefensiveCoordinator with personnel usage traits
+            rng: Random source (None = global random module)
 
         Returns:
             Configured DefensiveRotationManager
@@ -125,7 +130,8 @@ class DefensiveRotationManager:
         return cls(
             dl_starter_share=dl_share,
             lb_starter_share=lb_share,
-            db_starter_share=db_share
+            db_starter_share=db_share,
+            rng=rng
         )
 
     def get_position_group(self, position: str) -> Optional[str]:
@@ -265,7 +271,7 @@ class DefensiveRotationManager:
             # Probability of subbing based on how close to target
             sub_probability = 1.0 - config.starter_share
 
-            if backups and random.random() < sub_probability * 0.3:
+            if backups and self._rng.random() < sub_probability * 0.3:
                 # Small chance to sub in backup for variety
                 # Replace the starter with lowest overall rating
                 try:
@@ -3,9 +3,10 @@
 from .penalty_engine import PenaltyEngine, PlayContext, PenaltyResult
 from .penalty_data_structures import PenaltyInstance, PlayerPenaltyStats, TeamPenaltyStats, GamePenaltyTracker
 from .penalty_config_loader import PenaltyConfigLoader, get_penalty_config
+from .penalty_model import PenaltyModel
 
 __all__ = [
     'PenaltyEngine', 'PlayContext', 'PenaltyResult',
     'PenaltyInstance', 'PlayerPenaltyStats', 'TeamPenaltyStats', 'GamePenaltyTracker',
-    'PenaltyConfigLoader', 'get_penalty_config'
+    'PenaltyConfigLoader', 'get_penalty_config', 'PenaltyModel'
 ]
\ No newline at end of file
@@ -10,12 +10,12 @@ The PenaltyEngine is responsible for:
 Integrates with the two-stage run play simulation system.
 """
 
-import random
 import math
 from typing import List, Optional, Tuple, Dict, Any
 from dataclasses import dataclass
 
 from .penalty_config_loader import get_penalty_config
+from .penalty_model import PenaltyModel, POSITION_PENALTY_WEIGHTS, discipline_to_modifier
 from .penalty_data_structures import PenaltyInstance, PlayerPenaltyStats, TeamPenaltyStats
 from .penalty_enforcement import (
     get_final_enforcement,
@@ -23,6 +23,7 @@ from .penalty_enforcement import (
     PENALTY_CONFIG as ENFORCEMENT_CONFIG,
 )
 from team_management.players.player import Player
+from ...core.rng import GameRNG, stream_or_global, PENALTY_STREAM
 
 
 @dataclass
@@ -55,10 +56,25 @@ class PenaltyResult:
 
 
 class PenaltyEngine:
-    """Core engine for determining and applying penalties in football simulation"""
+    """
+    Core engine for determining and applying penalties in football simulation
+
+    Holds no per-play state, so one engine can serve every play of a game
+    (GameLoopController shares one through PlayEngineParams). Per-game
+    caches live in its PenaltyModel.
+    """
     
-    def __init__(self):
+    def __init__(self, rng: Optional[GameRNG] = None, model: Optional[PenaltyModel] = None):
+        """
+        Initialize penalty engine.
+
+        Args:
+            rng: Per-game GameRNG (None = global random module)
+            model: Precompiled penalty model (default: new model for this engine)
+        """
         self.config_loader = get_penalty_config()
+        self._rng = stream_or_global(rng, PENALTY_STREAM)
+        self.model = model or PenaltyModel(self.config_loader)
         
         # Penalty timing categories
         self.PRE_SNAP_PENALTIES = ["false_start", "encroachment", "offsides", "delay_of_game", "illegal_formation"]
@@ -113,42 +129,11 @@ class PenaltyEngine:
             Penalty type string if penalty occurs, None otherwise
         """
         
-        # Calculate team discipline factors
-        team_penalty_modifier = self._calculate_team_penalty_modifier(
-            offensive_players + defensive_players, context.is_home_team
-        )
-        
-        # Get all available penalty types
-        available_penalties = self.config_loader.get_available_penalty_types()
+        # Team discipline factor (cached per player list)
+        team_penalty_modifier = self.model.team_penalty_modifier(offensive_players, defensive_players)
         
-        # Check each penalty type for occurrence
-        for penalty_type in available_penalties:
-            if self._should_penalty_occur(penalty_type, team_penalty_modifier, context):
-                return penalty_type
-        
-        return None
-    
-    def _should_penalty_occur(self, penalty_type: str, team_modifier: float, context: PlayContext) -> bool:
-        """Determine if a specific penalty type should occur"""
-        
-        # Get base penalty rate
-        base_rate = self.config_loader.get_penalty_base_rate(penalty_type)
-        
-        # Apply team discipline modifier
-        modified_rate = base_rate * team_modifier
-        
-        # Apply situational modifier
-        situational_modifier = self.config_loader.get_situational_modifier(
-            penalty_type, context.down, context.distance, context.field_position
-        )
-        final_rate = modified_rate * situational_modifier
-        
-        # Apply home field advantage
-        home_modifier = self.config_loader.get_home_field_modifier(context.is_home_team)
-        final_rate *= home_modifier
-        
-        # Roll for penalty occurrence
-        return random.random() < final_rate
+        # Single draw against the precompiled cumulative distribution
+        return self.model.draw(self._rng.random(), team_penalty_modifier, context)
     
     def _calculate_team_penalty_modifier(self, all_players: List[Player], is_home_team: bool) -> float:
         """
@@ -185,32 +170,12 @@ class PenaltyEngine:
         
         # Convert discipline rating to penalty modifier
         # Higher discipline = fewer penalties
-        if avg_discipline >= 85:
-            modifier = 0.6
-        elif avg_discipline >= 70:
-            modifier = 0.8
-        elif avg_discipline >= 50:
-            modifier = 1.0
-        elif avg_discipline >= 30:
-            modifier = 1.3
-        else:
-            modifier = 1.6
-        
-        return modifier
+        return discipline_to_modifier(avg_discipline)
     
     def _get_position_penalty_weight(self, position: str) -> float:
         """Get how much a position's discipline affects team penalty rate"""
         
-        # Key positions that affect penalties more
-        high_impact_positions = {
-            "quarterback": 1.5,      # QB discipline affects many penalties
-            "center": 1.3,           # Center sets protection/calls
-            "mike_linebacker": 1.2,  # MLB is defensive QB
-            "left_tackle": 1.2,      # LT protects blind side
-            "strong_safety": 1.1     # SS involved in many plays
-        }
-        
-        return high_impact_positions.get(position, 1.0)
+        return POSITION_PENALTY_WEIGHTS.get(position, 1.0)
     
     def _select_guilty_player(self, 
                              penalty_type: str,
@@ -265,10 +230,10 @@ class PenaltyEngine:
         
         # Select player based on weights
         if not weighted_players:
-            return random.choice(candidate_players)
+            return self._rng.choice(candidate_players)
         
         total_weight = sum(weight for _, weight in weighted_players)
-        random_value = random.random() * total_weight
+        random_value = self._rng.random() * total_weight
         
         current_weight = 0
         for player, weight in weighted_players:
@@ -281,30 +246,7 @@ class PenaltyEngine:
     
     def _get_position_penalty_tendency(self, position: str, penalty_type: str) -> float:
         """Get position-specific tendency for certain penalty types"""
-        
-        try:
-            # Load discipline effects to get position tendencies
-            config_dict = self.config_loader.load_config()
-            if hasattr(config_dict, 'discipline_effects'):
-                discipline_effects = config_dict.discipline_effects
-            else:
-                discipline_effects = config_dict.get('discipline_effects', {})
-                
-            position_tendencies = discipline_effects.get("position_penalty_tendencies", {})
-            
-            # Check each position group
-            for group_name, group_info in position_tendencies.items():
-                # Ensure group_info is a dictionary
-                if isinstance(group_info, dict):
-                    positions = group_info.get("positions", [])
-                    if position in positions:
-                        increased_penalties = group_info.get("increased_penalties", {})
-                        return increased_penalties.get(penalty_type, 1.0)
-        except (AttributeError, KeyError, TypeError) as e:
-            # If configuration structure is not as expected, return default
-            pass
-        
-        return 1.0  # Default tendency
+        return self.model.position_tendency(position, penalty_type)
     
     def _create_penalty_instance(self, 
                                 penalty_type: str,
@@ -322,7 +264,7 @@ class PenaltyEngine:
         # Generate context description
         penalty_contexts = self.config_loader.get_penalty_contexts(penalty_type)
         possible_contexts = penalty_contexts.get("contexts", ["Generic penalty context"])
-        context_description = random.choice(possible_contexts)
+        context_description = self._rng.choice(possible_contexts)
         
         # Create penalty instance
         penalty_instance = PenaltyInstance(
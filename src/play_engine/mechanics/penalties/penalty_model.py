@@ -0,0 +1,339 @@
+"""
+Penalty Model - Per-game precompiled penalty probabilities.
+
+The legacy penalty check walked every configured penalty type on every
+snap: base rate lookup, situational modifier scan, home modifier lookup and
+one random() draw per type, plus a discipline average over every player on
+the field. None of those inputs change during a game except the situation.
+
+PenaltyModel compiles them once per game:
+
+- Team discipline: each player's weighted discipline contribution is cached,
+  and the (weighted sum, weight) totals of a player list are memoized for as
+  long as the same list object is passed in (offensive rosters are reused
+  across snaps).
+- Situation table: situations are bucketed by (down, distance bucket, field
+  zone, home/away). Bucket boundaries are derived from the situational
+  modifier config, so every situation in a bucket has identical modifiers.
+  Each (team modifier, situation) entry is compiled on first use into a
+  cumulative first-penalty distribution.
+- One draw per play: a single random() is located in the cumulative table.
+  The outcome distribution is identical to the sequential per-type rolls
+  (P(type i) = r_i * prod(1 - r_j) for j < i).
+
+Usage:
+    model = PenaltyModel(get_penalty_config())
+    team_modifier = model.team_penalty_modifier(offense, defense)
+    penalty_type = model.draw(rng.random(), team_modifier, context)
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .penalty_config_loader import PenaltyConfigLoader, get_penalty_config
+
+
+# Key positions whose discipline weighs more in the team penalty modifier
+POSITION_PENALTY_WEIGHTS = {
+    "quarterback": 1.5,      # QB discipline affects many penalties
+    "center": 1.3,           # Center sets protection/calls
+    "mike_linebacker": 1.2,  # MLB is defensive QB
+    "left_tackle": 1.2,      # LT protects blind side
+    "strong_safety": 1.1     # SS involved in many plays
+}
+
+# Player lists whose discipline totals are memoized at once (defensive
+# rotation builds a new list every snap, so old entries are dropped)
+_MAX_MEMOIZED_LISTS = 8
+
+
+def discipline_to_modifier(avg_discipline: float) -> float:
+    """
+    Convert an average discipline rating to a team penalty rate modifier.
+
+    Args:
+        avg_discipline: Weighted average discipline (0-100)
+
+    Returns:
+        Modifier where 1.0 = average, <1.0 = fewer penalties, >1.0 = more penalties
+    """
+    if avg_discipline >= 85:
+        return 0.6
+    elif avg_discipline >= 70:
+        return 0.8
+    elif avg_discipline >= 50:
+        return 1.0
+    elif avg_discipline >= 30:
+        return 1.3
+    return 1.6
+
+
+class PenaltyModel:
+    """
+    Precompiled penalty probabilities for one game.
+
+    Ratings and configuration are assumed constant for the model's lifetime;
+    create one model per game (PenaltyEngine does this).
+    """
+
+    def __init__(self, config_loader: Optional[PenaltyConfigLoader] = None):
+        """
+        Compile the configuration-derived parts of the model.
+
+        Args:
+            config_loader: Penalty configuration (defaults to the global loader)
+        """
+        self.config_loader = config_loader or get_penalty_config()
+        self.penalty_types: Tuple[str, ...] = tuple(self.config_loader.get_available_penalty_types())
+
+        self._downs, self._distance_bounds, self._field_bounds = self._compile_buckets()
+        self._tables: Dict[Tuple, Tuple[float, ...]] = {}
+        self._player_discipline: Dict[int, Tuple[float, float]] = {}
+        self._list_discipline: Dict[int, Tuple[List, float, float]] = {}
+        self._tendencies: Dict[Tuple[str, str], float] = {}
+
+    # ------------------------------------------------------------------
+    # Situation buckets
+    # ------------------------------------------------------------------
+
+    def _compile_buckets(self) -> Tuple[frozenset, Tuple[List, List], Tuple[List, List]]:
+        """
+        Derive bucket boundaries from the situational modifier config.
+
+        Returns:
+            (downs referenced by conditions,
+             (distance minimums, distance maximums),
+             (field position minimums, field position maximums))
+        """
+        modifiers = self.config_loader.load_config().situational_modifiers
+
+        downs = set()
+        distance_mins, distance_maxes = set(), set()
+        field_mins, field_maxes = set(), set()
+
+        for info in modifiers.get('field_position_modifiers', {}).values():
+            low, high = info.get('field_position_range', [0, 100])
+            field_mins.add(low)
+            field_maxes.add(high)
+
+        for info in modifiers.get('down_and_distance_modifiers', {}).values():
+            conditions = info.get('conditions', {})
+            if 'down' in conditions:
+                downs.add(conditions['down'])
+            if 'distance_min' in conditions:
+                distance_mins.add(conditions['distance_min'])
+            if 'distance_max' in conditions:
+                distance_maxes.add(conditions['distance_max'])
+            if 'field_position_min' in conditions:
+                field_mins.add(conditions['field_position_min'])
+
+        return (
+            frozenset(downs),
+            (sorted(distance_mins), sorted(distance_maxes)),
+            (sorted(field_mins), sorted(field_maxes)),
+        )
+
+    def situation_key(self, down: int, distance: int, field_position: int, is_home_team: bool) -> Tuple:
+        """
+        Bucket a game situation.
+
+        Situations with the same key match exactly the same situational
+        modifiers: a minimum condition holds when value >= min and a maximum
+        condition when value <= max, so each bucket counts the minimums
+        reached and the maximums exceeded.
+
+        Args:
+            down: Current down
+            distance: Yards to go
+            field_position: Yards from own goal line
+            is_home_team: Whether the offense is the home team
+
+        Returns:
+            (down bucket, distance bucket, field zone, home/away)
+        """
+        distance_mins, distance_maxes = self._distance_bounds
+        field_mins, field_maxes = self._field_bounds
+        return (
+            down if down in self._downs else None,
+            (bisect_right(distance_mins, distance), bisect_left(distance_maxes, distance)),
+            (bisect_right(field_mins, field_position), bisect_left(field_maxes, field_position)),
+            bool(is_home_team),
+        )
+
+    # ------------------------------------------------------------------
+    # Probability tables
+    # ------------------------------------------------------------------
+
+    def penalty_rates(self, team_modifier: float, context: Any) -> Tuple[float, ...]:
+        """
+        Per-type penalty rates for a situation (one entry per penalty type).
+
+        Args:
+            team_modifier: Team discipline modifier
+            context: PlayContext (down, distance, field_position, is_home_team)
+
+        Returns:
+            Tuple of rates in penalty_types order
+        """
+        loader = self.config_loader
+        home_modifier = loader.get_home_field_modifier(context.is_home_team)
+        rates = []
+        for penalty_type in self.penalty_types:
+            rate = loader.get_penalty_base_rate(penalty_type) * team_modifier
+            rate *= loader.get_situational_modifier(
+                penalty_type, context.down, context.distance, context.field_position
+            )
+            rates.append(rate * home_modifier)
+        return tuple(rates)
+
+    def cumulative_table(self, team_modifier: float, context: Any) -> Tuple[float, ...]:
+        """
+        Cumulative first-penalty probabilities for a situation (cached).
+
+        Entry i is the probability that one of the first i + 1 penalty
+        types is the first to occur when each type is rolled in order.
+
+        Args:
+            team_modifier: Team discipline modifier
+            context: PlayContext (down, distance, field_position, is_home_team)
+
+        Returns:
+            Non-decreasing tuple in penalty_types order
+        """
+        key = (team_modifier,) + self.situation_key(
+            context.down, context.distance, context.field_position, context.is_home_team
+        )
+        table = self._tables.get(key)
+        if table is None:
+            cumulative = []
+            total = 0.0
+            none_yet = 1.0  # Probability no earlier type occurred
+            for rate in self.penalty_rates(team_modifier, context):
+                rate = min(max(rate, 0.0), 1.0)
+                total += none_yet * rate
+                none_yet *= 1.0 - rate
+                cumulative.append(total)
+            table = tuple(cumulative)
+            self._tables[key] = table
+        return table
+
+    def draw(self, roll: float, team_modifier: float, context: Any) -> Optional[str]:
+        """
+        Resolve a single uniform roll to a penalty type.
+
+        Args:
+            roll: Uniform draw in [0, 1)
+            team_modifier: Team discipline modifier
+            context: PlayContext
+
+        Returns:
+            Penalty type, or None if no penalty occurs
+        """
+        table = self.cumulative_table(team_modifier, context)
+        index = bisect_right(table, roll)
+        if index < len(table):
+            return self.penalty_types[index]
+        return None
+
+    # ------------------------------------------------------------------
+    # Team discipline
+    # ------------------------------------------------------------------
+
+    def discipline_totals(self, players: Sequence) -> Tuple[float, float]:
+        """
+        Weighted discipline sum and total weight for a player list.
+
+        Memoized per list object; per-player contributions are cached for
+        the model's lifetime.
+
+        Args:
+            players: Player list
+
+        Returns:
+            (sum of weight * discipline, sum of weights)
+        """
+        entry = self._list_discipline.get(id(players))
+        if entry is not None and entry[0] is players:
+            return entry[1], entry[2]
+
+        weighted_discipline = 0.0
+        total_weight = 0.0
+        for player in players:
+            contribution = self._player_discipline.get(id(player))
+            if contribution is None:
+                weight = POSITION_PENALTY_WEIGHTS.get(player.primary_position, 1.0)
+                contribution = (player.get_rating("discipline") * weight, weight)
+                self._player_discipline[id(player)] = contribution
+            weighted_discipline += contribution[0]
+            total_weight += contribution[1]
+
+        if len(self._list_discipline) >= _MAX_MEMOIZED_LISTS:
+            self._list_discipline.clear()
+        self._list_discipline[id(players)] = (players, weighted_discipline, total_weight)
+        return weighted_discipline, total_weight
+
+    def team_penalty_modifier(self, *player_groups: Sequence) -> float:
+        """
+        Discipline modifier over the combined player groups.
+
+        Args:
+            *player_groups: Player lists (e.g. offense and defense)
+
+        Returns:
+            Modifier where 1.0 = average, <1.0 = fewer penalties, >1.0 = more penalties
+        """
+        weighted_discipline = 0.0
+        total_weight = 0.0
+        for players in player_groups:
+            if players:
+                group_discipline, group_weight = self.discipline_totals(players)
+                weighted_discipline += group_discipline
+                total_weight += group_weight
+
+        if total_weight == 0:
+            return 1.0
+        return discipline_to_modifier(weighted_discipline / total_weight)
+
+    # ------------------------------------------------------------------
+    # Guilty player selection
+    # ------------------------------------------------------------------
+
+    def position_tendency(self, position: str, penalty_type: str) -> float:
+        """
+        Position-specific tendency for a penalty type (cached).
+
+        Args:
+            position: Player position
+            penalty_type: Penalty type
+
+        Returns:
+            Multiplier on the player's selection weight (1.0 = neutral)
+        """
+        key = (position, penalty_type)
+        tendency = self._tendencies.get(key)
+        if tendency is None:
+            tendency = self._lookup_position_tendency(position, penalty_type)
+            self._tendencies[key] = tendency
+        return tendency
+
+    def _lookup_position_tendency(self, position: str, penalty_type: str) -> float:
+        """Read a position tendency from the discipline effects config"""
+        try:
+            config_dict = self.config_loader.load_config()
+            if hasattr(config_dict, 'discipline_effects'):
+                discipline_effects = config_dict.discipline_effects
+            else:
+                discipline_effects = config_dict.get('discipline_effects', {})
+
+            position_tendencies = discipline_effects.get("position_penalty_tendencies", {})
+
+            # Check each position group
+            for group_info in position_tendencies.values():
+                if isinstance(group_info, dict):
+                    if position in group_info.get("positions", []):
+                        return group_info.get("increased_penalties", {}).get(penalty_type, 1.0)
+        except (AttributeError, KeyError, TypeError):
+            # If configuration structure is not as expected, return default
+            pass
+
+        return 1.0
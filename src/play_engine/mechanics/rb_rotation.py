@@ -22,19 +22,21 @@ class RBSubstitutionManager:
     based on the offensive coordinator's play-calling tendencies.
     """
 
-    def __init__(self, starter_share: float = 0.55):
+    def __init__(self, starter_share: float = 0.55, rng=None):
         """
         Initialize RB rotation manager.
 
         Args:
             starter_share: Target percentage of carries for starter (0.5-0.7)
                           Default 0.55 = committee approach
+            rng: Random source (e.g. a GameRNG sub-stream; None = global random module)
         """
         self.starter_share = max(0.5, min(0.75, starter_share))  # Clamp to reasonable range
+        self._rng = rng or random
         self.carries_by_player: Dict[Union[int, str], int] = {}  # player_key -> carry count this game
 
     @classmethod
-    def from_coaching_staff(cls, offensive_coordinator: 'OffensiveCoordinator') -> 'RBSubstitutionManager':
+    def from_coaching_staff(cls, offensive_coordinator: 'OffensiveCoordinator', rng=None) -> 'RBSubstitutionManager':
         """
         Create manager with starter_share based on OC philosophy.
 
@@ -45,6 +47,7 @@ class RBSubstitutionManager:
 
         Args:
             offensive_coordinator: The team's OC with philosophy traits
+            rng: Random source (None = global random module)
 
         Returns:
             Configured RBSubstitutionManager
@@ -70,7 +73,7 @@ class RBSubstitutionManager:
             else:
                 starter_share = 0.55
 
-        return cls(starter_share=starter_share)
+        return cls(starter_share=starter_share, rng=rng)
 
     def select_rb_for_carry(self, available_rbs: List) -> Optional[any]:
         """
@@ -134,7 +137,7 @@ class RBSubstitutionManager:
             return starter
         else:
             # Within range - use weighted random based on target
-            return starter if random.random() < self.starter_share else backup
+            return starter if self._rng.random() < self.starter_share else backup
 
     def record_carry(self, player_key) -> None:
         """
@@ -37,6 +37,9 @@ class CoachingStaff:
     offensive_coordinator: OffensiveCoordinator
     defensive_coordinator: DefensiveCoordinator
     special_teams_coordinator: Optional[SpecialTeamsCoordinator] = None
+
+    # Random source for play-calling decisions (not a dataclass field; see use_rng)
+    _rng = random
     
     def __post_init__(self):
         """Validate coaching staff composition"""
@@ -49,6 +52,17 @@ class CoachingStaff:
         if self.special_teams_coordinator is not None and not isinstance(self.special_teams_coordinator, SpecialTeamsCoordinator):
             raise ValueError("special_teams_coordinator must be a SpecialTeamsCoordinator instance or None")
     
+    def use_rng(self, rng) -> None:
+        """
+        Draw play-calling randomness (formations, concepts, blitzes) from a
+        dedicated random source instead of the global random module.
+
+        Args:
+            rng: Random source (e.g. a GameRNG sub-stream)
+        """
+        self._rng = rng
+        self.defensive_coordinator.use_rng(rng)
+
     def _weighted_random_choice(self, weighted_dict: Dict[str, float]) -> str:
         """
         Weighted random selection from dictionary of choices and weights
@@ -70,7 +84,7 @@ class CoachingStaff:
             raise ValueError(f"Total weight {total_weight} must be > 0. Weights: {weighted_dict}")
         
         # Generate random value between 0 and total_weight
-        rand_value = random.uniform(0, total_weight)
+        rand_value = self._rng.uniform(0, total_weight)
         current_weight = 0
         
         # Select based on cumulative weights
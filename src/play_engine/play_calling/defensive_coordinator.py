@@ -5,6 +5,7 @@ The defensive coordinator is responsible for defensive formation selection,
 coverage schemes, pressure packages, and defensive game planning.
 """
 
+import random
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 from enum import Enum
@@ -107,11 +108,23 @@ class DefensiveCoordinator(BaseCoachArchetype):
     
     # Defensive playbook preferences
     preferred_defensive_playbooks: List[str] = field(default_factory=lambda: ["balanced_defense"])
+
+    # Random source for blitz decisions (not a dataclass field; see use_rng)
+    _rng = random
     
     def __post_init__(self):
         """Initialize defensive coordinator with proper type and validation"""
         self.coach_type = CoachType.DEFENSIVE_COORDINATOR
         super().__post_init__()
+
+    def use_rng(self, rng) -> None:
+        """
+        Draw blitz decisions from a dedicated random source.
+
+        Args:
+            rng: Random source (e.g. a GameRNG sub-stream)
+        """
+        self._rng = rng
     
     def get_defensive_formation(self, offensive_formation: str, situation: str, context: Dict[str, Any] = None) -> UnifiedDefensiveFormation:
         """
@@ -346,7 +359,6 @@ class DefensiveCoordinator(BaseCoachArchetype):
         Returns:
             True if should send pressure/blitz (more than 4 rushers)
         """
-        import random
 
         # Base blitz rate boosted to achieve NFL sack distribution
         # Original philosophy.blitz_frequency is 0.2-0.8, we add 0.3 baseline
@@ -376,7 +388,7 @@ class DefensiveCoordinator(BaseCoachArchetype):
         adjusted_pressure_rate = min(0.8, adjusted_pressure_rate)
 
         # Probabilistic blitz decision
-        return random.random() < adjusted_pressure_rate
+        return self._rng.random() < adjusted_pressure_rate
 
     def select_blitz_package(self, situation: str, context: Dict[str, Any] = None):
         """
@@ -396,7 +408,6 @@ class DefensiveCoordinator(BaseCoachArchetype):
             BlitzPackageType enum value
         """
         from ..play_types.blitz_types import BlitzPackageType
-        import random
 
         if not context:
             context = {}
@@ -425,7 +436,7 @@ class DefensiveCoordinator(BaseCoachArchetype):
             return BlitzPackageType.MIKE_BLITZ  # Fallback
 
         normalized = [w / total_weight for w in weight_values]
-        selected = random.choices(packages, weights=normalized, k=1)[0]
+        selected = self._rng.choices(packages, weights=normalized, k=1)[0]
 
         return selected
 
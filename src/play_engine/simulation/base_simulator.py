@@ -3,7 +3,7 @@ Base Play Simulator - Shared functionality for all play simulators.
 
 Provides common helper methods used by RunPlaySimulator, PassPlaySimulator,
 and other play type simulators. Consolidates duplicate code for:
-- Player finding by position
+- Player finding by position (served from a GameLineupIndex when provided)
 - Snap tracking for all players on field
 - Touchdown detection
 - Player stats validation
@@ -13,6 +13,7 @@ Part of play engine refactoring to reduce code duplication.
 
 from typing import List, Optional, Tuple
 from .stats import PlayerStats, create_player_stats_from_player
+from ..game_state.lineup_index import GameLineupIndex, select_field_players
 
 
 class BasePlaySimulator:
@@ -26,6 +27,10 @@ class BasePlaySimulator:
     - defensive_formation: Defensive formation string
     - offensive_team_id: Team ID of offensive team (1-32)
     - defensive_team_id: Team ID of defensive team (1-32)
+
+    Optionally (for O(1) position lookups during full games):
+    - offensive_lineup: GameLineupIndex built over offensive_players
+    - defensive_lineup: GameLineupIndex built over defensive_players
     """
 
     # Subclasses must set these
@@ -36,6 +41,22 @@ class BasePlaySimulator:
     offensive_team_id: int = None
     defensive_team_id: int = None
     field_position: int = 50
+    offensive_lineup: Optional[GameLineupIndex] = None
+    defensive_lineup: Optional[GameLineupIndex] = None
+
+    def _offensive_index(self) -> Optional[GameLineupIndex]:
+        """Lineup index for offensive_players, or None if absent/stale."""
+        lineup = self.offensive_lineup
+        if lineup is not None and lineup.covers(self.offensive_players):
+            return lineup
+        return None
+
+    def _defensive_index(self) -> Optional[GameLineupIndex]:
+        """Lineup index for defensive_players, or None if absent/stale."""
+        lineup = self.defensive_lineup
+        if lineup is not None and lineup.covers(self.defensive_players):
+            return lineup
+        return None
 
     # ============================================
     # Player Finding Methods
@@ -55,6 +76,10 @@ class BasePlaySimulator:
             Subclasses may override this to add position-specific logic
             (e.g., RunPlaySimulator handles RB rotation with selected_ball_carrier)
         """
+        lineup = self._offensive_index()
+        if lineup is not None:
+            return lineup.first_at(position)
+
         # Default: find first matching player
         for player in self.offensive_players:
             if player.primary_position == position:
@@ -71,6 +96,10 @@ class BasePlaySimulator:
         Returns:
             List of matching Player objects
         """
+        lineup = self._offensive_index()
+        if lineup is not None:
+            return list(lineup.players_at(positions))
+
         found_players = []
         for player in self.offensive_players:
             if player.primary_position in positions:
@@ -87,6 +116,10 @@ class BasePlaySimulator:
         Returns:
             List of matching Player objects
         """
+        lineup = self._defensive_index()
+        if lineup is not None:
+            return list(lineup.players_at(positions))
+
         found_players = []
         for player in self.defensive_players:
             if player.primary_position in positions:
@@ -112,7 +145,6 @@ class BasePlaySimulator:
             List of Player objects who are on the field and match the positions
         """
         from play_engine.mechanics.formations import DefensiveFormation
-        from constants.position_abbreviations import get_position_limit_with_aliases
 
         # Get formation personnel requirements
         personnel = DefensiveFormation.get_personnel_requirements(self.defensive_formation)
@@ -120,34 +152,12 @@ class BasePlaySimulator:
             # Fallback to all players if formation not found
             return self._find_defensive_players_by_positions(positions)
 
-        # Get all matching players
-        all_matching = self._find_defensive_players_by_positions(positions)
-
-        # Track how many players of each position we've added (matching snap tracking logic)
-        position_counts = {}
-        field_players = []
+        lineup = self._defensive_index()
+        if lineup is not None:
+            return list(lineup.field_players(self.defensive_formation, personnel, positions))
 
-        # Sort by depth chart order to ensure starters are selected first
-        sorted_players = sorted(
-            all_matching,
-            key=lambda p: (getattr(p, 'depth_chart_order', 99), -getattr(p, 'overall', 0))
-        )
-
-        for player in sorted_players:
-            position = getattr(player, 'primary_position', '')
-
-            # Get the limit for this position from formation (with alias support)
-            pos_limit, tracking_pos = get_position_limit_with_aliases(position, personnel, position_counts)
-
-            # Check if we've already filled this position
-            pos_count = position_counts.get(tracking_pos, 0)
-            if pos_count >= pos_limit:
-                continue  # Skip - formation doesn't use more of this position
-
-            field_players.append(player)
-            position_counts[tracking_pos] = pos_count + 1
-
-        return field_players
+        # Starters first, limited to the formation's slots per position
+        return select_field_players(self._find_defensive_players_by_positions(positions), personnel)
 
     def _get_field_offensive_players_by_positions(self, positions: List[str]) -> List:
         """
@@ -168,7 +178,6 @@ class BasePlaySimulator:
             List of Player objects who are on the field and match the positions
         """
         from play_engine.mechanics.formations import OffensiveFormation
-        from constants.position_abbreviations import get_position_limit_with_aliases
 
         # Get formation personnel requirements
         personnel = OffensiveFormation.get_personnel_requirements(self.offensive_formation)
@@ -176,34 +185,64 @@ class BasePlaySimulator:
             # Fallback to all players if formation not found
             return self._find_players_by_positions(positions)
 
-        # Get all matching players
-        all_matching = self._find_players_by_positions(positions)
+        lineup = self._offensive_index()
+        if lineup is not None:
+            return list(lineup.field_players(self.offensive_formation, personnel, positions))
 
-        # Track how many players of each position we've added (matching snap tracking logic)
-        position_counts = {}
-        field_players = []
+        # Starters first, limited to the formation's slots per position
+        return select_field_players(self._find_players_by_positions(positions), personnel)
 
-        # Sort by depth chart order to ensure starters are selected first
-        sorted_players = sorted(
-            all_matching,
-            key=lambda p: (getattr(p, 'depth_chart_order', 99), -getattr(p, 'overall', 0))
-        )
+    def _get_field_offensive_ratings(self, positions: List[str], rating: str = 'overall',
+                                  players: Optional[List] = None) -> List[int]:
+        """
+        Get a rating for each on-field offensive player at the positions.
 
-        for player in sorted_players:
-            position = getattr(player, 'primary_position', '')
+        Players without a ratings dict are skipped. Served from the lineup
+        index's cached rating vectors when available.
 
-            # Get the limit for this position from formation (with alias support)
-            pos_limit, tracking_pos = get_position_limit_with_aliases(position, personnel, position_counts)
+        Args:
+            positions: List of position strings to match
+            rating: Rating name (default 'overall')
+            players: On-field players already looked up by the caller (used
+                when there is no lineup index)
 
-            # Check if we've already filled this position
-            pos_count = position_counts.get(tracking_pos, 0)
-            if pos_count >= pos_limit:
-                continue  # Skip - formation doesn't use more of this position
+        Returns:
+            List of rating values
+        """
+        from play_engine.mechanics.formations import OffensiveFormation
+
+        lineup = self._offensive_index()
+        personnel = OffensiveFormation.get_personnel_requirements(self.offensive_formation)
+        if lineup is not None and personnel:
+            return list(lineup.field_ratings(self.offensive_formation, personnel, positions, rating))
 
-            field_players.append(player)
-            position_counts[tracking_pos] = pos_count + 1
+        if players is None:
+            players = self._get_field_offensive_players_by_positions(positions)
+        return [p.get_rating(rating) for p in players if hasattr(p, 'ratings')]
+
+    def _get_field_defensive_ratings(self, positions: List[str], rating: str = 'overall',
+                                  players: Optional[List] = None) -> List[int]:
+        """
+        Get a rating for each on-field defensive player at the positions.
+
+        Args:
+            positions: List of position strings to match
+            rating: Rating name (default 'overall')
+            players: On-field players already looked up by the caller (optional)
+
+        Returns:
+            List of rating values (players without a ratings dict are skipped)
+        """
+        from play_engine.mechanics.formations import DefensiveFormation
+
+        lineup = self._defensive_index()
+        personnel = DefensiveFormation.get_personnel_requirements(self.defensive_formation)
+        if lineup is not None and personnel:
+            return list(lineup.field_ratings(self.defensive_formation, personnel, positions, rating))
 
-        return field_players
+        if players is None:
+            players = self._get_field_defensive_players_by_positions(positions)
+        return [p.get_rating(rating) for p in players if hasattr(p, 'ratings')]
 
     # ============================================
     # Snap Tracking
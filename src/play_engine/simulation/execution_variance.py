@@ -75,7 +75,7 @@ def get_play_complexity(play_concept: Optional[str]) -> str:
 
 
 def apply_execution_variance(base_value: float, play_concept: Optional[str] = None,
-                             complexity: Optional[str] = None) -> float:
+                             complexity: Optional[str] = None, rng=None) -> float:
     """
     Apply execution variance to success rate, yards, etc.
 
@@ -87,6 +87,7 @@ def apply_execution_variance(base_value: float, play_concept: Optional[str] = No
         base_value: Base success rate, yards, etc. (0.0-1.0 for rates, any for yards)
         play_concept: Play concept name (optional, auto-determines complexity)
         complexity: Override complexity level ("simple", "medium", "complex")
+        rng: Random source (e.g. a GameRNG sub-stream; None = global random module)
 
     Returns:
         Adjusted value with Gaussian variance applied
@@ -108,7 +109,7 @@ def apply_execution_variance(base_value: float, play_concept: Optional[str] = No
 
     # Apply Gaussian variance (mean=base_value, std=base_value * variance)
     # This creates a bell curve centered on base_value with spread determined by variance
-    adjusted = random.gauss(base_value, base_value * variance)
+    adjusted = (rng or random).gauss(base_value, base_value * variance)
 
     # For rates (0.0-1.0), clamp to valid range
     # For yards, allow negative variance (rare bad execution, fumbles)
@@ -118,7 +119,7 @@ def apply_execution_variance(base_value: float, play_concept: Optional[str] = No
     return adjusted
 
 
-def apply_variance_to_params(params: Dict, play_concept: Optional[str]) -> Dict:
+def apply_variance_to_params(params: Dict, play_concept: Optional[str], rng=None) -> Dict:
     """
     Apply execution variance to all relevant play parameters.
 
@@ -128,6 +129,7 @@ def apply_variance_to_params(params: Dict, play_concept: Optional[str]) -> Dict:
     Args:
         params: Dictionary of play parameters to modify
         play_concept: Play concept name for complexity determination
+        rng: Random source (None = global random module)
 
     Returns:
         Modified params dictionary (modified in-place and returned)
@@ -142,45 +144,45 @@ def apply_variance_to_params(params: Dict, play_concept: Optional[str]) -> Dict:
     # Apply variance to success rates
     if "completion_rate" in params:
         params["completion_rate"] = apply_execution_variance(
-            params["completion_rate"], complexity=complexity
+            params["completion_rate"], complexity=complexity, rng=rng
         )
 
     if "sack_rate" in params:
         params["sack_rate"] = apply_execution_variance(
-            params["sack_rate"], complexity=complexity
+            params["sack_rate"], complexity=complexity, rng=rng
         )
 
     if "interception_rate" in params:
         params["interception_rate"] = apply_execution_variance(
-            params["interception_rate"], complexity=complexity
+            params["interception_rate"], complexity=complexity, rng=rng
         )
 
     # Apply variance to yards (can be negative for fumbles/sacks)
     if "avg_yards" in params:
         params["avg_yards"] = apply_execution_variance(
-            params["avg_yards"], complexity=complexity
+            params["avg_yards"], complexity=complexity, rng=rng
         )
 
     if "yards_after_catch" in params:
         params["yards_after_catch"] = apply_execution_variance(
-            params["yards_after_catch"], complexity=complexity
+            params["yards_after_catch"], complexity=complexity, rng=rng
         )
 
     # Also apply to air yards and YAC (used by pass_play_config.json)
     if "avg_air_yards" in params:
         params["avg_air_yards"] = apply_execution_variance(
-            params["avg_air_yards"], complexity=complexity
+            params["avg_air_yards"], complexity=complexity, rng=rng
         )
 
     if "avg_yac" in params:
         params["avg_yac"] = apply_execution_variance(
-            params["avg_yac"], complexity=complexity
+            params["avg_yac"], complexity=complexity, rng=rng
         )
 
     return params
 
 
-def can_upset_occur(base_probability: float, complexity: str = "medium") -> bool:
+def can_upset_occur(base_probability: float, complexity: str = "medium", rng=None) -> bool:
     """
     Check if execution variance causes an upset (low-probability event succeeds).
 
@@ -190,6 +192,7 @@ def can_upset_occur(base_probability: float, complexity: str = "medium") -> bool
     Args:
         base_probability: Base success probability (0.0-1.0)
         complexity: Play complexity ("simple", "medium", "complex")
+        rng: Random source (None = global random module)
 
     Returns:
         True if variance-adjusted roll succeeds
@@ -198,5 +201,5 @@ def can_upset_occur(base_probability: float, complexity: str = "medium") -> bool
         >>> # 10% success rate play with variance can occasionally succeed
         >>> can_upset_occur(0.10, complexity="complex")  # Has chance to return True
     """
-    adjusted_probability = apply_execution_variance(base_probability, complexity=complexity)
-    return random.random() < adjusted_probability
+    adjusted_probability = apply_execution_variance(base_probability, complexity=complexity, rng=rng)
+    return (rng or random).random() < adjusted_probability
@@ -19,6 +19,7 @@ from .run_plays import RunPlaySimulator
 from ..mechanics.formations import OffensiveFormation, DefensiveFormation
 from ..play_types.base_types import PlayType
 from team_management.players.player import Position
+from ..core.rng import GameRNG, stream_or_global, EXTRA_POINT_STREAM
 from ..mechanics.penalties.penalty_engine import PenaltyEngine, PlayContext
 from ..config.config_loader import config
 from ..config.timing_config import NFLTimingConfig
@@ -28,7 +29,7 @@ class ExtraPointResult:
     """Result data structure for extra point attempts"""
 
     def __init__(self, outcome: str, points_scored: int = 0, is_two_point: bool = False,
-                 conversion_type: str = None, yards_gained: int = 0):
+                 conversion_type: str = None, yards_gained: int = 0, rng=None):
         """
         Initialize extra point result
 
@@ -39,6 +40,7 @@ class ExtraPointResult:
             is_two_point: Whether this was a 2-point conversion attempt
             conversion_type: Type of 2-point conversion ("pass" or "run") if applicable
             yards_gained: Yards gained on 2-point conversion attempt (usually 0 or 2)
+            rng: Random source for timing (None = global random module)
         """
         self.outcome = outcome
         self.points_scored = points_scored
@@ -48,7 +50,7 @@ class ExtraPointResult:
 
         # Time elapsed (PAT is quick, 2pt conversion takes longer)
         min_time, max_time = NFLTimingConfig.get_extra_point_timing(is_two_point=is_two_point)
-        self.time_elapsed = random.uniform(min_time, max_time)
+        self.time_elapsed = (rng if rng is not None else random).uniform(min_time, max_time)
 
         # Individual player stats
         self.player_stats = {}
@@ -65,7 +67,9 @@ class ExtraPointSimulator(BasePlaySimulator):
                  offensive_team_id: int = None, defensive_team_id: int = None,
                  weather_condition: str = "clear",
                  crowd_noise_level: int = 0,
-                 is_away_team: bool = False):
+                 is_away_team: bool = False,
+                 rng: Optional[GameRNG] = None,
+                 penalty_engine: Optional[PenaltyEngine] = None):
         """
         Initialize extra point simulator
 
@@ -79,6 +83,8 @@ class ExtraPointSimulator(BasePlaySimulator):
             weather_condition: Weather condition ("clear", "rain", "snow", "heavy_wind")
             crowd_noise_level: Crowd noise intensity (0-100)
             is_away_team: Whether the kicking team is the away team
+            rng: Per-game GameRNG (None = global random module)
+            penalty_engine: Shared per-game PenaltyEngine (None = new engine on rng)
         """
         self.offensive_players = offensive_players
         self.defensive_players = defensive_players
@@ -92,8 +98,12 @@ class ExtraPointSimulator(BasePlaySimulator):
         self.crowd_noise_level = crowd_noise_level
         self.is_away_team = is_away_team
 
+        # Per-game random stream for this play type (global random module when rng is None)
+        self._game_rng = rng
+        self._rng = stream_or_global(rng, EXTRA_POINT_STREAM)
+
         # Initialize penalty engine
-        self.penalty_engine = PenaltyEngine()
+        self.penalty_engine = penalty_engine or PenaltyEngine(rng=rng)
 
         # Identify key special teams players
         self._identify_special_teams_players()
@@ -198,7 +208,7 @@ class ExtraPointSimulator(BasePlaySimulator):
         # Determine conversion type if not specified
         if conversion_type is None:
             # NFL 2-point conversions are roughly 60% pass, 40% run
-            conversion_type = "pass" if random.random() < 0.6 else "run"
+            conversion_type = "pass" if self._rng.random() < 0.6 else "run"
 
         # Default context if none provided
         if context is None:
@@ -238,8 +248,9 @@ class ExtraPointSimulator(BasePlaySimulator):
         # Only truly terrible snap/hold causes instant miss (very rare)
         # Threshold lowered from 0.90 to 0.80, and chance reduced from 50% to 10%
         if snap_quality < 0.80 or hold_quality < 0.80:
-            if random.random() < 0.10:  # 10% chance catastrophic snap/hold causes miss
+            if self._rng.random() < 0.10:  # 10% chance catastrophic snap/hold causes miss
                 return ExtraPointResult(
+                    rng=self._rng,
                     outcome="pat_missed",
                     points_scored=0,
                     is_two_point=False
@@ -249,6 +260,7 @@ class ExtraPointSimulator(BasePlaySimulator):
         block_probability = 0.015  # 1.5% block rate
         if self._check_for_block():
             return ExtraPointResult(
+                rng=self._rng,
                 outcome="pat_blocked",
                 points_scored=0,
                 is_two_point=False
@@ -269,14 +281,16 @@ class ExtraPointSimulator(BasePlaySimulator):
         final_success_rate = max(0.85, min(0.98, final_success_rate))
 
         # Determine outcome
-        if random.random() < final_success_rate:
+        if self._rng.random() < final_success_rate:
             return ExtraPointResult(
+                rng=self._rng,
                 outcome="pat_made",
                 points_scored=1,
                 is_two_point=False
             )
         else:
             return ExtraPointResult(
+                rng=self._rng,
                 outcome="pat_missed",
                 points_scored=0,
                 is_two_point=False
@@ -301,7 +315,8 @@ class ExtraPointSimulator(BasePlaySimulator):
             weather_condition=self.weather_condition,
             crowd_noise_level=self.crowd_noise_level,
             is_away_team=self.is_away_team,
-            field_position=98  # 2-yard line
+            field_position=98,  # 2-yard line
+            rng=self._game_rng
         )
 
         # Simulate the pass play
@@ -342,7 +357,8 @@ class ExtraPointSimulator(BasePlaySimulator):
             weather_condition=self.weather_condition,
             crowd_noise_level=self.crowd_noise_level,
             is_away_team=self.is_away_team,
-            field_position=98  # 2-yard line
+            field_position=98,  # 2-yard line
+            rng=self._game_rng
         )
 
         # Simulate the run play
@@ -441,7 +457,7 @@ class ExtraPointSimulator(BasePlaySimulator):
         # Cap at reasonable maximum (5%)
         adjusted_block_prob = min(adjusted_block_prob, 0.05)
 
-        return random.random() < adjusted_block_prob
+        return self._rng.random() < adjusted_block_prob
 
     def _get_defensive_line_strength(self) -> float:
         """
@@ -594,7 +610,7 @@ class ExtraPointSimulator(BasePlaySimulator):
 
             if result.outcome == "pat_blocked":
                 # Random assignment of block responsibility
-                if random.random() < 0.2:  # 20% chance
+                if self._rng.random() < 0.2:  # 20% chance
                     protector_stats.blocks_allowed = 1
 
             player_stats.append(protector_stats)
@@ -609,7 +625,7 @@ class ExtraPointSimulator(BasePlaySimulator):
             # Credit block if applicable
             if result.outcome == "pat_blocked":
                 # Random assignment of block credit
-                if random.random() < 0.3:  # 30% chance for any defender
+                if self._rng.random() < 0.3:  # 30% chance for any defender
                     # Note: Would need to add 'kicks_blocked' stat to PlayerStats
                     pass
 
@@ -18,6 +18,7 @@ from ..mechanics.formations import OffensiveFormation, DefensiveFormation
 from ..mechanics.unified_formations import UnifiedDefensiveFormation, SimulatorContext
 from ..play_types.base_types import PlayType
 from team_management.players.player import Position
+from ..core.rng import GameRNG, stream_or_global, FIELD_GOAL_STREAM
 from ..mechanics.penalties.penalty_engine import PenaltyEngine, PlayContext, PenaltyResult
 from ..mechanics.penalties.penalty_data_structures import PenaltyInstance
 from ..config.config_loader import config
@@ -49,7 +50,8 @@ class FieldGoalAttemptResult:
     """Result data structure for field goal attempts"""
     
     def __init__(self, outcome: str, yards_gained: int = 0, points_scored: int = 0,
-                 is_fake: bool = False, fake_type: str = None, distance: int = None):
+                 is_fake: bool = False, fake_type: str = None, distance: int = None,
+                 rng=None):
         self.outcome = outcome  # "made", "missed_wide_left", "missed_wide_right", "missed_short", "blocked", "fake_success", "fake_failed"
         self.yards_gained = yards_gained  # 0 for made FG, actual yards for fakes
         self.points_scored = points_scored  # 3 for made FG, 6 for fake TD, 0 for miss/block
@@ -59,7 +61,7 @@ class FieldGoalAttemptResult:
         # Import timing config at module level to avoid circular imports
         from ..config.timing_config import NFLTimingConfig
         min_time, max_time = NFLTimingConfig.get_field_goal_timing(is_fake=is_fake)
-        self.time_elapsed = random.uniform(min_time, max_time)
+        self.time_elapsed = (rng if rng is not None else random).uniform(min_time, max_time)
         
         # Individual player stats
         self.player_stats = {}
@@ -85,7 +87,9 @@ class FieldGoalSimulator(BasePlaySimulator):
                  offensive_team_id: int = None, defensive_team_id: int = None,
                  weather_condition: str = "clear",
                  crowd_noise_level: int = 0,
-                 is_away_team: bool = False):
+                 is_away_team: bool = False,
+                 rng: Optional[GameRNG] = None,
+                 penalty_engine: Optional[PenaltyEngine] = None):
         """
         Initialize field goal simulator
 
@@ -99,6 +103,8 @@ class FieldGoalSimulator(BasePlaySimulator):
             weather_condition: Weather condition ("clear", "rain", "snow", "heavy_wind")
             crowd_noise_level: Crowd noise intensity (0-100, 0=quiet, 100=deafening)
             is_away_team: Whether the kicking team is the away team
+            rng: Per-game GameRNG (None = global random module)
+            penalty_engine: Shared per-game PenaltyEngine (None = new engine on rng)
         """
         self.offensive_players = offensive_players
         self.defensive_players = defensive_players
@@ -112,8 +118,11 @@ class FieldGoalSimulator(BasePlaySimulator):
         self.crowd_noise_level = crowd_noise_level
         self.is_away_team = is_away_team
 
+        # Per-game random stream for this play type (global random module when rng is None)
+        self._rng = stream_or_global(rng, FIELD_GOAL_STREAM)
+
         # Initialize penalty engine
-        self.penalty_engine = PenaltyEngine()
+        self.penalty_engine = penalty_engine or PenaltyEngine(rng=rng)
 
         # Load field goal configuration
         self.fg_config = config.get_field_goal_config()
@@ -305,12 +314,12 @@ class FieldGoalSimulator(BasePlaySimulator):
             fake_probability += situational_mods.get('goal_line', {}).get('fake_bonus', 0.25)
         
         # Make fake decision
-        is_fake = random.random() < fake_probability
+        is_fake = self._rng.random() < fake_probability
         
         if is_fake:
             # Determine fake type (pass vs run)
             fake_type_dist = fake_config.get('fake_type_distribution', {'pass': 0.65, 'run': 0.35})
-            fake_type = 'pass' if random.random() < fake_type_dist['pass'] else 'run'
+            fake_type = 'pass' if self._rng.random() < fake_type_dist['pass'] else 'run'
             return FakeDecision(True, fake_type, fake_probability)
         
         return FakeDecision(False, None, 1.0 - fake_probability)
@@ -335,6 +344,7 @@ class FieldGoalSimulator(BasePlaySimulator):
         
         if is_blocked:
             return FieldGoalAttemptResult(
+                rng=self._rng,
                 outcome="blocked",
                 yards_gained=0,
                 points_scored=0,
@@ -351,11 +361,12 @@ class FieldGoalSimulator(BasePlaySimulator):
         final_accuracy = base_accuracy * hold_quality * kicker_modifier * environmental_modifier
         
         # Determine kick outcome
-        kick_result = random.random()
+        kick_result = self._rng.random()
         
         if kick_result < final_accuracy:
             # Successful field goal
             return FieldGoalAttemptResult(
+                rng=self._rng,
                 outcome="made",
                 yards_gained=0,
                 points_scored=3,
@@ -366,6 +377,7 @@ class FieldGoalSimulator(BasePlaySimulator):
             # Miss - determine miss type
             miss_type = self._determine_miss_type(distance, final_accuracy)
             return FieldGoalAttemptResult(
+                rng=self._rng,
                 outcome=miss_type,
                 yards_gained=0,
                 points_scored=0,
@@ -399,10 +411,10 @@ class FieldGoalSimulator(BasePlaySimulator):
         completion_probability = base_completion * fake_advantage * holder_modifier
         
         # Determine completion
-        if random.random() < completion_probability:
+        if self._rng.random() < completion_probability:
             # Completed pass
             yards_config = fake_config.get('yards_range', {'min': 2, 'max': 15, 'avg': 7})
-            yards_gained = max(0, int(random.gauss(yards_config['avg'], 
+            yards_gained = max(0, int(self._rng.gauss(yards_config['avg'], 
                                                  (yards_config['max'] - yards_config['min']) / 4)))
             
             # Determine if touchdown (if in red zone and good yardage)
@@ -410,6 +422,7 @@ class FieldGoalSimulator(BasePlaySimulator):
             is_touchdown = field_pos + yards_gained >= 100
             
             return FieldGoalAttemptResult(
+                rng=self._rng,
                 outcome="fake_success",
                 yards_gained=yards_gained,
                 points_scored=6 if is_touchdown else 0,
@@ -419,8 +432,9 @@ class FieldGoalSimulator(BasePlaySimulator):
             )
         else:
             # Incomplete pass or interception
-            outcome = "fake_failed" if random.random() < 0.9 else "fake_interception"
+            outcome = "fake_failed" if self._rng.random() < 0.9 else "fake_interception"
             return FieldGoalAttemptResult(
+                rng=self._rng,
                 outcome=outcome,
                 yards_gained=0,
                 points_scored=0,
@@ -455,10 +469,10 @@ class FieldGoalSimulator(BasePlaySimulator):
         success_probability = base_success * fake_advantage * holder_modifier
         
         # Determine success
-        if random.random() < success_probability:
+        if self._rng.random() < success_probability:
             # Successful run
             yards_config = fake_config.get('yards_range', {'min': 0, 'max': 12, 'avg': 4})
-            yards_gained = max(0, int(random.gauss(yards_config['avg'], 
+            yards_gained = max(0, int(self._rng.gauss(yards_config['avg'], 
                                                  (yards_config['max'] - yards_config['min']) / 4)))
             
             # Determine if touchdown
@@ -466,6 +480,7 @@ class FieldGoalSimulator(BasePlaySimulator):
             is_touchdown = field_pos + yards_gained >= 100
             
             return FieldGoalAttemptResult(
+                rng=self._rng,
                 outcome="fake_success",
                 yards_gained=yards_gained,
                 points_scored=6 if is_touchdown else 0,
@@ -475,8 +490,9 @@ class FieldGoalSimulator(BasePlaySimulator):
             )
         else:
             # Tackled for minimal/no gain
-            yards_gained = max(0, random.randint(0, 2))
+            yards_gained = max(0, self._rng.randint(0, 2))
             return FieldGoalAttemptResult(
+                rng=self._rng,
                 outcome="fake_failed",
                 yards_gained=yards_gained,
                 points_scored=0,
@@ -629,20 +645,20 @@ class FieldGoalSimulator(BasePlaySimulator):
         
         block_probability = matchup.get('block_probability', formation_config.get('default_matchup', {}).get('block_probability', 0.05))
         
-        return random.random() < block_probability
+        return self._rng.random() < block_probability
     
     def _determine_miss_type(self, distance: int, accuracy: float) -> str:
         """Determine type of miss for failed field goal"""
         # Miss types based on distance and accuracy
         if distance > 50:
             # Long kicks more likely to be short
-            if random.random() < 0.4:
+            if self._rng.random() < 0.4:
                 return "missed_short"
             else:
-                return "missed_wide_left" if random.random() < 0.5 else "missed_wide_right"
+                return "missed_wide_left" if self._rng.random() < 0.5 else "missed_wide_right"
         else:
             # Shorter kicks more likely to be directional misses
-            return "missed_wide_left" if random.random() < 0.5 else "missed_wide_right"
+            return "missed_wide_left" if self._rng.random() < 0.5 else "missed_wide_right"
     
     def _get_holder_passing_modifier(self) -> float:
         """Get holder's fake passing ability modifier"""
@@ -767,7 +783,7 @@ class FieldGoalSimulator(BasePlaySimulator):
         player_stats.extend(fg_protection_stats)
         
         # Return only players who recorded stats
-        return [stats for stats in player_stats if stats.get_total_stats()]
+        return [stats for stats in player_stats if stats.has_stats()]
 
     def _attribute_field_goal_protection_stats(self, result) -> List[PlayerStats]:
         """
@@ -787,7 +803,7 @@ class FieldGoalSimulator(BasePlaySimulator):
             # Field goal protection stats based on outcome
             if result.outcome == "blocked":
                 # Blocked field goal - protection failure
-                if random.random() < 0.2:  # 20% chance this protector allowed block
+                if self._rng.random() < 0.2:  # 20% chance this protector allowed block
                     protector_stats.blocks_allowed += 1
                     protector_stats.add_missed_assignment()
                 protector_stats.add_block(successful=False)
@@ -805,7 +821,7 @@ class FieldGoalSimulator(BasePlaySimulator):
 
                 # Pancake opportunities on perfect protection (very long makes)
                 if result.outcome == "good" and result.distance >= 50:
-                    if random.random() < 0.03:  # 3% chance of pancake on long FG
+                    if self._rng.random() < 0.03:  # 3% chance of pancake on long FG
                         protector_stats.add_pancake()
 
             protection_stats.append(protector_stats)
@@ -840,7 +856,7 @@ class FieldGoalSimulator(BasePlaySimulator):
             base_grade = 60.0  # Average for other outcomes
 
         # Add randomness
-        grade = base_grade + random.uniform(-3.0, 3.0)
+        grade = base_grade + self._rng.uniform(-3.0, 3.0)
         return max(0.0, min(100.0, grade))
 
 
@@ -8,7 +8,6 @@ Implements enhanced four-phase simulation with NFL realism:
 4. Final resolution with comprehensive player statistics attribution
 """
 
-import random
 import math
 from typing import List, Tuple, Dict, Optional, Union
 from enum import Enum
@@ -18,6 +17,7 @@ from ..mechanics.formations import OffensiveFormation, DefensiveFormation
 from ..mechanics.unified_formations import UnifiedDefensiveFormation, SimulatorContext
 from ..play_types.base_types import PlayType
 from team_management.players.player import Position
+from ..core.rng import GameRNG, stream_or_global, KICKOFF_STREAM
 from ..mechanics.penalties.penalty_engine import PenaltyEngine, PlayContext, PenaltyResult
 from ..mechanics.penalties.penalty_data_structures import PenaltyInstance
 from ..config.config_loader import config
@@ -112,7 +112,9 @@ class KickoffSimulator(BasePlaySimulator):
 
     def __init__(self, offensive_players: List, defensive_players: List,
                  offensive_formation: str, defensive_formation: str,
-                 offensive_team_id: int = None, defensive_team_id: int = None):
+                 offensive_team_id: int = None, defensive_team_id: int = None,
+                 rng: Optional[GameRNG] = None,
+                 penalty_engine: Optional[PenaltyEngine] = None):
         """
         Initialize kickoff simulator
 
@@ -123,6 +125,8 @@ class KickoffSimulator(BasePlaySimulator):
             defensive_formation: Defensive formation ("KICKOFF_RETURN")
             offensive_team_id: Team ID for the kicking team
             defensive_team_id: Team ID for the receiving team
+            rng: Per-game GameRNG (None = global random module)
+            penalty_engine: Shared per-game PenaltyEngine (None = new engine on rng)
         """
         # Set both standard BasePlaySimulator attributes and kickoff-specific names
         self.offensive_players = offensive_players
@@ -134,8 +138,11 @@ class KickoffSimulator(BasePlaySimulator):
         self.offensive_team_id = offensive_team_id
         self.defensive_team_id = defensive_team_id
 
+        # Per-game random stream for this play type (global random module when rng is None)
+        self._rng = stream_or_global(rng, KICKOFF_STREAM)
+
         # Initialize penalty engine
-        self.penalty_engine = PenaltyEngine()
+        self.penalty_engine = penalty_engine or PenaltyEngine(rng=rng)
 
         # Load kickoff configuration
         self.kickoff_config = config.get_kickoff_config()
@@ -243,7 +250,7 @@ class KickoffSimulator(BasePlaySimulator):
             # Adjust penalty rate based on game situation
             adjusted_rate = self._adjust_penalty_rate(base_rate, context)
             
-            if random.random() < adjusted_rate:
+            if self._rng.random() < adjusted_rate:
                 # Create penalty instance
                 penalty_instance = PenaltyInstance(
                     penalty_type=penalty_type,
@@ -302,7 +309,7 @@ class KickoffSimulator(BasePlaySimulator):
         # Calculate kick distance with variance
         avg_distance = tier_config.get('avg_distance', 61)
         distance_variance = tier_config.get('distance_variance', 10)
-        kick_distance = max(30, int(random.gauss(avg_distance, distance_variance)))
+        kick_distance = max(30, int(self._rng.gauss(avg_distance, distance_variance)))
         
         # Calculate hang time
         hang_time_config = kick_config.get('hang_time', {})
@@ -329,10 +336,10 @@ class KickoffSimulator(BasePlaySimulator):
         # Onside kicks have different characteristics
         avg_distance = execution_config.get('avg_distance', 15)
         distance_variance = execution_config.get('distance_variance', 8)
-        kick_distance = max(10, int(random.gauss(avg_distance, distance_variance)))
+        kick_distance = max(10, int(self._rng.gauss(avg_distance, distance_variance)))
         
         # Shorter hang time for onside kicks
-        hang_time = random.uniform(1.8, 3.5)
+        hang_time = self._rng.uniform(1.8, 3.5)
         
         # Lower directional accuracy due to intentional bouncing
         directional_accuracy = 0.6
@@ -380,7 +387,7 @@ class KickoffSimulator(BasePlaySimulator):
         # If kick reaches end zone, high probability of kneeling
         if kick.landing_zone == "end_zone_edge":
             kneel_prob = returner_decisions.get('end_zone_kneel_probability', 0.87)
-            if random.random() < kneel_prob:
+            if self._rng.random() < kneel_prob:
                 return KickoffResult(KickoffOutcome.TOUCHBACK_LANDING_ZONE, 0, 0, 20)
         
         # Execute return attempt
@@ -392,7 +399,7 @@ class KickoffSimulator(BasePlaySimulator):
         coverage_factor = 1.0 - (coverage_effectiveness - 0.7) * 0.5  # Normalize around 0.7
         return_factor = 1.0 + (return_effectiveness - 0.7) * 0.4
         
-        raw_return = random.gauss(base_return, variance)
+        raw_return = self._rng.gauss(base_return, variance)
         final_return = max(0, int(raw_return * coverage_factor * return_factor))
         
         # Check for special outcomes
@@ -402,15 +409,15 @@ class KickoffSimulator(BasePlaySimulator):
         fumble_prob = return_outcomes.get('fumble_probability', 0.012)
         
         # Fumble check
-        if random.random() < fumble_prob:
+        if self._rng.random() < fumble_prob:
             # Determine fumble recovery
-            if random.random() < 0.45:  # 45% chance kicking team recovers
+            if self._rng.random() < 0.45:  # 45% chance kicking team recovers
                 return KickoffResult(KickoffOutcome.FUMBLE_RECOVERY, 0, 0, 
                                    max(20, 100 - kick.distance + final_return))
         
         # Touchdown check
         kick_to_endzone_distance = 100 - kick.distance + 17  # From goalline
-        if final_return >= kick_to_endzone_distance and random.random() < td_prob:
+        if final_return >= kick_to_endzone_distance and self._rng.random() < td_prob:
             return KickoffResult(KickoffOutcome.RETURN_TOUCHDOWN, final_return, 6, 100)
         
         # Calculate final field position
@@ -431,7 +438,7 @@ class KickoffSimulator(BasePlaySimulator):
             recovery_rate = recovery_probs.get('surprise_onside', 0.65)
         
         # Check if kicking team recovers
-        if random.random() < recovery_rate:
+        if self._rng.random() < recovery_rate:
             # Kicking team recovers - they get possession
             recovery_spot = 50 + kick.distance  # Approximate recovery location
             return KickoffResult(KickoffOutcome.ONSIDE_RECOVERY, 0, 0, recovery_spot)
@@ -494,7 +501,7 @@ class KickoffSimulator(BasePlaySimulator):
         else:
             timing = timing_config.get('regular_return', {'min': 6.5, 'max': 12.0})
         
-        coverage_result.time_elapsed = random.uniform(timing['min'], timing['max'])
+        coverage_result.time_elapsed = self._rng.uniform(timing['min'], timing['max'])
         
         # Attribute individual player statistics
         self._attribute_player_statistics(coverage_result, context)
@@ -522,7 +529,7 @@ class KickoffSimulator(BasePlaySimulator):
             if result.yards_gained > 30:  # Big return
                 base_rate *= (1 + situational_mods.get('big_return_penalty_bonus', 0.25))
             
-            if random.random() < base_rate:
+            if self._rng.random() < base_rate:
                 # Penalty occurred
                 penalty_instance = PenaltyInstance(
                     penalty_type=penalty_type,
@@ -594,7 +601,7 @@ class KickoffSimulator(BasePlaySimulator):
 
             if result.outcome == KickoffOutcome.REGULAR_RETURN:
                 # Randomly assign tackle credit
-                if random.random() < 0.15:  # 15% chance any coverage player gets tackle
+                if self._rng.random() < 0.15:  # 15% chance any coverage player gets tackle
                     coverage_stats.tackles = 1
 
             result.player_stats[player.name] = coverage_stats
@@ -661,12 +668,12 @@ class KickoffSimulator(BasePlaySimulator):
         if hasattr(context, 'quarter') and context.quarter == 4:
             if hasattr(context, 'score_differential') and context.score_differential < 0:
                 # Trailing in 4th quarter - might declare onside
-                return random.random() < 0.15  # 15% chance to declare
+                return self._rng.random() < 0.15  # 15% chance to declare
         return False
     
     def _should_surprise_onside(self, context: PlayContext) -> bool:
         """Determine if team should attempt surprise onside (very rare)"""
-        return random.random() < 0.02  # 2% chance of surprise onside
+        return self._rng.random() < 0.02  # 2% chance of surprise onside
     
     def _adjust_penalty_rate(self, base_rate: float, context: PlayContext) -> float:
         """Adjust penalty rate based on game situation"""
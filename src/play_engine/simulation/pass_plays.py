@@ -9,7 +9,6 @@ Implements enhanced multi-phase simulation with comprehensive NFL statistics:
 5. Attribute comprehensive individual player statistics
 """
 
-import random
 from typing import List, Tuple, Dict, Optional, Any
 from .stats import PlayerStats, PlayStatsSummary, create_player_stats_from_player
 from .base_simulator import BasePlaySimulator
@@ -18,6 +17,8 @@ from .tackler_selection import TacklerSelector
 from ..mechanics.formations import OffensiveFormation, DefensiveFormation
 from ..play_types.base_types import PlayType
 from team_management.players.player import Position
+from ..core.rng import GameRNG, stream_or_global, PASS_STREAM
+from ..game_state.lineup_index import GameLineupIndex
 from ..mechanics.penalties.penalty_engine import PenaltyEngine, PlayContext, PenaltyResult
 from ..mechanics.penalties.penalty_data_structures import PenaltyInstance
 from ..config.config_loader import config, get_pass_formation_matchup
@@ -25,6 +26,12 @@ from ..config.timing_config import NFLTimingConfig
 from .execution_variance import apply_variance_to_params
 
 
+# Position groups used for rating-based parameter modifiers
+OFFENSIVE_LINE_POSITIONS = (Position.LT, Position.LG, Position.C, Position.RG, Position.RT)
+RECEIVER_POSITIONS = (Position.WR, Position.TE)
+PASS_COVERAGE_POSITIONS = (Position.CB, Position.FS, Position.SS, Position.NCB)
+
+
 class PassPlaySimulator(BasePlaySimulator):
     """Simulates pass plays with comprehensive NFL statistics and individual player attribution"""
     
@@ -36,7 +43,11 @@ class PassPlaySimulator(BasePlaySimulator):
                  clutch_factor: float = 0.0, primetime_variance: float = 0.0,
                  is_away_team: bool = False, performance_tracker = None,
                  field_position: int = 50, down: int = None,
-                 blitz_package: str = None, rusher_assignments = None):
+                 blitz_package: str = None, rusher_assignments = None,
+                 rng: Optional[GameRNG] = None,
+                 offensive_lineup: Optional[GameLineupIndex] = None,
+                 defensive_lineup: Optional[GameLineupIndex] = None,
+                 penalty_engine: Optional[PenaltyEngine] = None):
         """
         Initialize pass play simulator
 
@@ -58,6 +69,10 @@ class PassPlaySimulator(BasePlaySimulator):
             field_position: Current yard line (0-100, where 100 is opponent's goal line)
             blitz_package: Named blitz package (e.g., "four_man_base", "corner_blitz", "safety_blitz")
             rusher_assignments: RusherAssignments tracking which positions are rushing vs covering
+            rng: Per-game GameRNG (None = global random module)
+            offensive_lineup: Per-game GameLineupIndex over offensive_players (optional)
+            defensive_lineup: Per-game GameLineupIndex over defensive_players (optional)
+            penalty_engine: Shared per-game PenaltyEngine (None = new engine on rng)
         """
         self.offensive_players = offensive_players
         self.defensive_players = defensive_players
@@ -65,6 +80,8 @@ class PassPlaySimulator(BasePlaySimulator):
         self.defensive_formation = defensive_formation
         self.offensive_team_id = offensive_team_id
         self.defensive_team_id = defensive_team_id
+        self.offensive_lineup = offensive_lineup
+        self.defensive_lineup = defensive_lineup
         self.coverage_scheme = coverage_scheme
         self.momentum_modifier = momentum_modifier  # Store momentum modifier
         self.field_position = field_position  # Store field position for touchdown detection
@@ -93,8 +110,11 @@ class PassPlaySimulator(BasePlaySimulator):
         self.qb_scramble_config = config.get_qb_scramble_config()
         self.situational_modifiers_config = config.get_situational_modifiers_config()
 
+        # Per-game random stream for this play type (global random module when rng is None)
+        self._rng = stream_or_global(rng, PASS_STREAM)
+
         # Initialize penalty engine
-        self.penalty_engine = PenaltyEngine()
+        self.penalty_engine = penalty_engine or PenaltyEngine(rng=rng)
 
     def _get_actual_pass_rushers(self) -> List:
         """
@@ -273,7 +293,7 @@ class PassPlaySimulator(BasePlaySimulator):
             return {
                 'outcome_type': 'sack',
                 'yards': -pressure_outcome['sack_yards'],
-                'time_elapsed': round(random.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
+                'time_elapsed': round(self._rng.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
                 'qb_sacked': True,
                 'pressure_applied': True
             }
@@ -284,7 +304,7 @@ class PassPlaySimulator(BasePlaySimulator):
             return {
                 'outcome_type': 'scramble',
                 'yards': scramble_yards,
-                'time_elapsed': round(random.uniform(3.0, 5.5), 1),  # Scrambles take longer
+                'time_elapsed': round(self._rng.uniform(3.0, 5.5), 1),  # Scrambles take longer
                 'qb_scrambled': True,
                 'pressure_applied': True,
                 'scramble_yards': scramble_yards
@@ -329,10 +349,10 @@ class PassPlaySimulator(BasePlaySimulator):
         
         # Find key players (using field-limited method to only get on-field players)
         quarterback = self._find_player_by_position(Position.QB)
-        receivers = self._get_field_offensive_players_by_positions([Position.WR, Position.TE])
-        offensive_line = self._get_field_offensive_players_by_positions([Position.LT, Position.LG, Position.C, Position.RG, Position.RT])
+        receivers = self._get_field_offensive_players_by_positions(RECEIVER_POSITIONS)
+        offensive_line = self._get_field_offensive_players_by_positions(OFFENSIVE_LINE_POSITIONS)
         pass_rushers = self._get_field_defensive_players_by_positions([Position.DE, Position.DT, Position.OLB])
-        defensive_backs = self._get_field_defensive_players_by_positions([Position.CB, Position.FS, Position.SS, Position.NCB])
+        defensive_backs = self._get_field_defensive_players_by_positions(PASS_COVERAGE_POSITIONS)
         
         # QB attributes affect completion rate and decision making
         if quarterback and hasattr(quarterback, 'ratings'):
@@ -368,7 +388,7 @@ class PassPlaySimulator(BasePlaySimulator):
         ol_poor_protection = ol_modifiers.get('poor_protection_penalty', -0.8)
         
         if offensive_line:
-            ol_ratings = [p.get_rating('overall') for p in offensive_line if hasattr(p, 'ratings')]
+            ol_ratings = self._get_field_offensive_ratings(OFFENSIVE_LINE_POSITIONS, players=offensive_line)
             if ol_ratings:
                 avg_ol_rating = sum(ol_ratings) / len(ol_ratings)
                 average_threshold = thresholds.get('average', 75)
@@ -393,7 +413,7 @@ class PassPlaySimulator(BasePlaySimulator):
         speed_yac_multiplier = receiver_modifiers.get('speed_yac_multiplier', 1.2)
 
         if receivers:
-            wr_ratings = [p.get_rating('overall') for p in receivers if hasattr(p, 'ratings')]
+            wr_ratings = self._get_field_offensive_ratings(RECEIVER_POSITIONS, players=receivers)
             if wr_ratings:
                 avg_wr_rating = sum(wr_ratings) / len(wr_ratings)
                 if avg_wr_rating >= very_good_threshold:  # Elite receivers
@@ -433,7 +453,7 @@ class PassPlaySimulator(BasePlaySimulator):
         poor_rush_penalty = defensive_modifiers.get('poor_rush_penalty', 0.7)
         
         if defensive_backs:
-            db_ratings = [p.get_rating('overall') for p in defensive_backs if hasattr(p, 'ratings')]
+            db_ratings = self._get_field_defensive_ratings(PASS_COVERAGE_POSITIONS, players=defensive_backs)
             if db_ratings:
                 avg_db_rating = sum(db_ratings) / len(db_ratings)
                 if avg_db_rating >= very_good_threshold:  # Elite secondary
@@ -514,7 +534,7 @@ class PassPlaySimulator(BasePlaySimulator):
         # Step 10: Apply execution variance (Tollgate 7: Variance & Unpredictability)
         # Applied FINAL to add natural randomness to all play outcomes
         # NOTE: Play concept not available yet, defaults to medium complexity (±8% variance)
-        modified_params = apply_variance_to_params(modified_params, play_concept=None)
+        modified_params = apply_variance_to_params(modified_params, play_concept=None, rng=self._rng)
 
         return modified_params
 
@@ -689,8 +709,8 @@ class PassPlaySimulator(BasePlaySimulator):
         Returns:
             Dictionary with pressure outcome details including scramble info
         """
-        sack_roll = random.random()
-        pressure_roll = random.random()
+        sack_roll = self._rng.random()
+        pressure_roll = self._rng.random()
 
         # Get base rates from params
         sack_rate = params['sack_rate']
@@ -728,7 +748,7 @@ class PassPlaySimulator(BasePlaySimulator):
                     scramble_chance * scramble_config['sack_escape_multiplier']
                 )
 
-            if random.random() < scramble_chance:
+            if self._rng.random() < scramble_chance:
                 # QB scrambles instead of staying in pocket or taking sack
                 scrambled = True
                 scramble_yards = self._calculate_scramble_yards()
@@ -755,7 +775,7 @@ class PassPlaySimulator(BasePlaySimulator):
                         (mobility - designed_config['base_mobility_offset']) /
                         designed_config['chance_divisor']
                     )
-                    if random.random() < designed_scramble_chance:
+                    if self._rng.random() < designed_scramble_chance:
                         scrambled = True
                         scramble_yards = self._calculate_scramble_yards()
 
@@ -773,7 +793,7 @@ class PassPlaySimulator(BasePlaySimulator):
             sack_mechanics = mechanics_config.get('sack_mechanics', {})
             min_sack_yards = sack_mechanics.get('min_yards_lost', 5)
             max_sack_yards = sack_mechanics.get('max_yards_lost', 12)
-            outcome['sack_yards'] = random.randint(min_sack_yards, max_sack_yards)
+            outcome['sack_yards'] = self._rng.randint(min_sack_yards, max_sack_yards)
 
         return outcome
 
@@ -867,13 +887,13 @@ class PassPlaySimulator(BasePlaySimulator):
             elif agility >= agility_thresholds['medium']['min_rating']:
                 variance += agility_thresholds['medium']['variance_bonus']
 
-        yards = max(0, round(random.gauss(base_yards, variance)))
+        yards = max(0, round(self._rng.gauss(base_yards, variance)))
 
         # Chance of big scramble (10-20 yards) for mobile QBs (from config)
         big_scramble_config = yards_config['big_scramble']
         if qb and qb.get_rating('speed') and qb.get_rating('speed') >= big_scramble_config['speed_threshold']:
-            if random.random() < big_scramble_config['probability']:
-                yards = random.randint(big_scramble_config['min_yards'], big_scramble_config['max_yards'])
+            if self._rng.random() < big_scramble_config['probability']:
+                yards = self._rng.randint(big_scramble_config['min_yards'], big_scramble_config['max_yards'])
 
         return yards
 
@@ -971,10 +991,10 @@ class PassPlaySimulator(BasePlaySimulator):
 
         total_weight = sum(weight for _, weight in candidates)
         if total_weight <= 0:
-            return random.choice(candidates)[0]  # Fallback to equal probability
+            return self._rng.choice(candidates)[0]  # Fallback to equal probability
 
         # Weighted random selection
-        random_value = random.random() * total_weight
+        random_value = self._rng.random() * total_weight
         current_weight = 0
 
         for player, weight in candidates:
@@ -1087,32 +1107,32 @@ class PassPlaySimulator(BasePlaySimulator):
             cbs = [db for db in defensive_backs
                    if getattr(db, 'primary_position', '') in [Position.CB, 'cornerback', Position.NCB, 'nickel_cornerback']]
             if cbs:
-                return random.choice(cbs)
+                return self._rng.choice(cbs)
             # Fallback to any DB
             if defensive_backs:
-                return random.choice(defensive_backs)
+                return self._rng.choice(defensive_backs)
 
         # TEs → Safeties or LBs (60% safeties, 40% LBs)
         elif receiver_pos in [Position.TE, 'tight_end']:
             safeties = [db for db in defensive_backs
                        if getattr(db, 'primary_position', '') in [Position.FS, Position.SS, 'free_safety', 'strong_safety', 'safety']]
-            if safeties and random.random() < 0.6:
-                return random.choice(safeties)
+            if safeties and self._rng.random() < 0.6:
+                return self._rng.choice(safeties)
             if linebackers:
-                return random.choice(linebackers)
+                return self._rng.choice(linebackers)
             if defensive_backs:
-                return random.choice(defensive_backs)
+                return self._rng.choice(defensive_backs)
 
         # RBs → LBs
         elif receiver_pos in [Position.RB, 'running_back', Position.FB, 'fullback']:
             if linebackers:
-                return random.choice(linebackers)
+                return self._rng.choice(linebackers)
             if defensive_backs:
-                return random.choice(defensive_backs)
+                return self._rng.choice(defensive_backs)
 
         # Default: any coverage defender
         all_defenders = defensive_backs + linebackers
-        return random.choice(all_defenders) if all_defenders else None
+        return self._rng.choice(all_defenders) if all_defenders else None
 
     def _assign_zone_coverage_defender(self, target_receiver, defensive_backs: List, linebackers: List):
         """
@@ -1133,33 +1153,33 @@ class PassPlaySimulator(BasePlaySimulator):
         """
         # Estimate route depth randomly (we don't know actual depth yet)
         # Deep: 40%, Medium: 35%, Short: 25%
-        route_depth_roll = random.random()
+        route_depth_roll = self._rng.random()
 
         if route_depth_roll < 0.4:
             # Deep zone → Safety
             safeties = [db for db in defensive_backs
                        if getattr(db, 'primary_position', '') in [Position.FS, Position.SS, 'free_safety', 'strong_safety', 'safety']]
             if safeties:
-                return random.choice(safeties)
+                return self._rng.choice(safeties)
 
         elif route_depth_roll < 0.75:
             # Medium zone → CB or LB (50/50)
-            if random.random() < 0.5:
+            if self._rng.random() < 0.5:
                 cbs = [db for db in defensive_backs
                        if getattr(db, 'primary_position', '') in [Position.CB, 'cornerback', Position.NCB, 'nickel_cornerback']]
                 if cbs:
-                    return random.choice(cbs)
+                    return self._rng.choice(cbs)
             if linebackers:
-                return random.choice(linebackers)
+                return self._rng.choice(linebackers)
 
         else:
             # Short zone → LB
             if linebackers:
-                return random.choice(linebackers)
+                return self._rng.choice(linebackers)
 
         # Fallback
         all_defenders = defensive_backs + linebackers
-        return random.choice(all_defenders) if all_defenders else None
+        return self._rng.choice(all_defenders) if all_defenders else None
 
     def _determine_pass_completion(self, params: Dict, target_receiver, pressure_outcome: Dict) -> Dict:
         """
@@ -1183,9 +1203,9 @@ class PassPlaySimulator(BasePlaySimulator):
             completion_rate *= accuracy_impact
         
         # Determine outcome type
-        completion_roll = random.random()
-        int_roll = random.random()
-        deflection_roll = random.random()
+        completion_roll = self._rng.random()
+        int_roll = self._rng.random()
+        deflection_roll = self._rng.random()
         
         # Get configured time ranges and variances
         mechanics_config = config.get_play_mechanics_config('pass_play')
@@ -1203,7 +1223,7 @@ class PassPlaySimulator(BasePlaySimulator):
             hands_modifier = (75 - hands_rating) / 300
             drop_chance = max(0.025, min(0.08, base_drop_rate + hands_modifier))
 
-            drop_roll = random.random()
+            drop_roll = self._rng.random()
             if drop_roll < drop_chance:
                 # Dropped pass - return immediately
                 inc_time_min = time_ranges.get('incompletion_time_min', 2.0)
@@ -1212,7 +1232,7 @@ class PassPlaySimulator(BasePlaySimulator):
                 return {
                     'outcome_type': 'incomplete',
                     'yards': 0,
-                    'time_elapsed': round(random.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
+                    'time_elapsed': round(self._rng.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
                     'target_receiver': target_receiver,
                     'incomplete': True,
                     'dropped': True,  # NEW FLAG - distinguishes drops from other incompletions
@@ -1227,7 +1247,7 @@ class PassPlaySimulator(BasePlaySimulator):
             return {
                 'outcome_type': 'interception',
                 'yards': 0,
-                'time_elapsed': round(random.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
+                'time_elapsed': round(self._rng.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
                 'target_receiver': target_receiver,
                 'intercepted': True,
                 'pressure_applied': pressure_outcome['pressured']
@@ -1241,7 +1261,7 @@ class PassPlaySimulator(BasePlaySimulator):
             return {
                 'outcome_type': 'deflected_incomplete',
                 'yards': 0,
-                'time_elapsed': round(random.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
+                'time_elapsed': round(self._rng.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
                 'target_receiver': target_receiver,
                 'pass_deflected': True,
                 'pressure_applied': pressure_outcome['pressured']
@@ -1253,8 +1273,8 @@ class PassPlaySimulator(BasePlaySimulator):
             air_yards_variance = variance_config.get('air_yards_variance', 3.0)
             yac_variance = variance_config.get('yac_variance', 2.5)
 
-            air_yards = max(1, int(random.gauss(params['avg_air_yards'], air_yards_variance)))
-            yac = max(0, int(random.gauss(params['avg_yac'], yac_variance)))
+            air_yards = max(1, int(self._rng.gauss(params['avg_air_yards'], air_yards_variance)))
+            yac = max(0, int(self._rng.gauss(params['avg_yac'], yac_variance)))
 
             # TE YAC penalty - TEs average less YAC than WRs (slower, tackled near LOS)
             if target_receiver and hasattr(target_receiver, 'position') and target_receiver.position == 'TE':
@@ -1267,7 +1287,7 @@ class PassPlaySimulator(BasePlaySimulator):
 
             # NEW: Apply primetime variance (Tollgate 6: Environmental & Situational Modifiers)
             if self.primetime_variance > 0:
-                variance_factor = 1.0 + random.gauss(0, self.primetime_variance)
+                variance_factor = 1.0 + self._rng.gauss(0, self.primetime_variance)
                 # Completions always gain at least 1 yard (0-yard catches are extremely rare in NFL)
                 total_yards = max(1, int(total_yards * variance_factor))
 
@@ -1292,7 +1312,7 @@ class PassPlaySimulator(BasePlaySimulator):
                 'yards': total_yards,
                 'air_yards': air_yards,
                 'yac': yac,
-                'time_elapsed': round(random.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
+                'time_elapsed': round(self._rng.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
                 'target_receiver': target_receiver,
                 'completed': True,
                 'went_out_of_bounds': went_oob,  # Track OOB for clock management
@@ -1306,7 +1326,7 @@ class PassPlaySimulator(BasePlaySimulator):
             return {
                 'outcome_type': 'incomplete',
                 'yards': 0,
-                'time_elapsed': round(random.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
+                'time_elapsed': round(self._rng.uniform(*NFLTimingConfig.get_pass_play_timing()), 1),
                 'target_receiver': target_receiver,
                 'incomplete': True,
                 'pressure_applied': pressure_outcome['pressured']
@@ -1337,8 +1357,6 @@ class PassPlaySimulator(BasePlaySimulator):
         Returns:
             True if receiver went out of bounds
         """
-        import random
-
         # Base OOB probability
         base_oob_chance = 0.0
 
@@ -1368,7 +1386,7 @@ class PassPlaySimulator(BasePlaySimulator):
         # Field position: 0 = own goal line, 100 = opponent goal line
         # Hash marks are ~18 yards from sideline, so we don't have exact sideline data
         # Use randomness to simulate some plays being near sideline
-        near_sideline = random.random() < 0.3  # 30% of plays near sideline
+        near_sideline = self._rng.random() < 0.3  # 30% of plays near sideline
         if near_sideline:
             base_oob_chance *= 1.4  # +40% when near sideline
 
@@ -1376,7 +1394,7 @@ class PassPlaySimulator(BasePlaySimulator):
         final_oob_chance = min(0.8, base_oob_chance)
 
         # Roll for OOB
-        went_oob = random.random() < final_oob_chance
+        went_oob = self._rng.random() < final_oob_chance
 
         return went_oob
 
@@ -1435,7 +1453,7 @@ class PassPlaySimulator(BasePlaySimulator):
                 # Estimate yards after contact (typically 30-50% of scramble yards)
                 scramble_yards = pass_outcome.get('yards', 0)
                 if scramble_yards > 0:
-                    yac_ratio = random.uniform(0.3, 0.5)
+                    yac_ratio = self._rng.uniform(0.3, 0.5)
                     qb_stats.yards_after_contact = int(scramble_yards * yac_ratio)
 
             player_stats.append(qb_stats)
@@ -1473,7 +1491,7 @@ class PassPlaySimulator(BasePlaySimulator):
                 max_rushers = blocking_config.get('max_pass_rushers', 2)
 
                 # Skill-weighted sack attribution: better pass rushers get more sacks
-                num_sack_participants = min(len(pass_rushers), random.randint(min_rushers, max_rushers))
+                num_sack_participants = min(len(pass_rushers), self._rng.randint(min_rushers, max_rushers))
                 sack_participants = self._select_sack_participants_weighted(pass_rushers, num_sack_participants)
 
                 for rusher in sack_participants:
@@ -1484,7 +1502,7 @@ class PassPlaySimulator(BasePlaySimulator):
                     player_stats.append(rusher_stats)
             elif pass_outcome.get('pressure_applied'):
                 # Select 1 player who applied pressure
-                pressure_player = random.choice(pass_rushers)
+                pressure_player = self._rng.choice(pass_rushers)
                 pressure_stats = create_player_stats_from_player(pressure_player, team_id=self.defensive_team_id)
                 pressure_stats.qb_pressures = 1
 
@@ -1493,7 +1511,7 @@ class PassPlaySimulator(BasePlaySimulator):
                 pressure_effects = mechanics_config.get('pressure_effects', {})
                 hit_conversion_rate = pressure_effects.get('pressure_to_hit_conversion', 0.4)
 
-                if random.random() < hit_conversion_rate:
+                if self._rng.random() < hit_conversion_rate:
                     pressure_stats.qb_hits = 1
                 player_stats.append(pressure_stats)
             elif pass_outcome.get('qb_scrambled'):
@@ -1518,7 +1536,7 @@ class PassPlaySimulator(BasePlaySimulator):
                                 weighted_defenders.append(defender)  # 1x weight for DL
 
                         if weighted_defenders:
-                            tackler = random.choice(weighted_defenders)
+                            tackler = self._rng.choice(weighted_defenders)
                             tackler_stats = create_player_stats_from_player(tackler, team_id=self.defensive_team_id)
                             tackler_stats.add_tackle(assisted=False)
                             player_stats.append(tackler_stats)
@@ -1572,7 +1590,7 @@ class PassPlaySimulator(BasePlaySimulator):
                 # Tight coverage forcing incompletion - attribute pass defended
                 # NFL counts ~10-15% of incompletions as exceptional coverage deserving PD credit
                 # The rest are drops, throwaways, miscommunication, poor throws, etc.
-                if random.random() < 0.10:  # 10% of incompletions credited to exceptional coverage
+                if self._rng.random() < 0.10:  # 10% of incompletions credited to exceptional coverage
                     coverage_player = self._select_interception_player_weighted(defensive_backs)
                     if coverage_player:
                         coverage_stats = create_player_stats_from_player(coverage_player, team_id=self.defensive_team_id)
@@ -1591,7 +1609,7 @@ class PassPlaySimulator(BasePlaySimulator):
                         hands_modifier = (75 - hands_rating) / 400  # ±0.0625 adjustment (was /500)
                         drop_chance = max(0.03, min(0.20, base_drop_rate + hands_modifier))
 
-                        if random.random() < drop_chance:
+                        if self._rng.random() < drop_chance:
                             # Find and update existing receiver_stats
                             for stats in player_stats:
                                 if (stats.player_name == target_receiver.name and
@@ -1683,7 +1701,7 @@ class PassPlaySimulator(BasePlaySimulator):
 
         # Select participating pass protectors (all 5 O-line usually involved)
         num_protectors = min(len(offensive_line), 5)  # Standard 5-man protection
-        selected_protectors = random.sample(offensive_line, num_protectors)
+        selected_protectors = self._rng.sample(offensive_line, num_protectors)
 
         for i, protector in enumerate(selected_protectors):
             protector_stats = create_player_stats_from_player(protector, team_id=self.offensive_team_id)
@@ -1700,11 +1718,11 @@ class PassPlaySimulator(BasePlaySimulator):
                 # Sack attribution logic
                 if time_in_pocket < quick_pressure_threshold:
                     # Immediate pressure - blame specific rusher's assigned blocker
-                    if random.random() < 0.4:  # 40% chance this protector allowed sack
+                    if self._rng.random() < 0.4:  # 40% chance this protector allowed sack
                         protector_stats.add_sack_allowed()
                 elif time_in_pocket < 3.0:
                     # Normal pocket time - someone missed assignment or got beat
-                    if random.random() < 0.3:  # 30% chance this protector allowed sack
+                    if self._rng.random() < 0.3:  # 30% chance this protector allowed sack
                         protector_stats.add_sack_allowed()
                 else:
                     # Coverage sack - good protection, no blame
@@ -1714,11 +1732,11 @@ class PassPlaySimulator(BasePlaySimulator):
                 # Pressure attribution
                 if time_in_pocket < quick_pressure_threshold:
                     # Quick pressure
-                    if random.random() < 0.35:  # 35% chance this protector allowed pressure
+                    if self._rng.random() < 0.35:  # 35% chance this protector allowed pressure
                         protector_stats.add_pressure_allowed()
                 elif time_in_pocket < 2.5:
                     # Hurry - QB rushed into quick throw
-                    if random.random() < 0.25:  # 25% chance this protector allowed hurry
+                    if self._rng.random() < 0.25:  # 25% chance this protector allowed hurry
                         protector_stats.add_hurry_allowed()
 
             else:
@@ -1729,11 +1747,11 @@ class PassPlaySimulator(BasePlaySimulator):
                     # Pancake opportunities on very clean pockets
                     if time_in_pocket >= pancake_threshold:
                         pancake_chance = self._calculate_pass_pancake_chance(time_in_pocket, protector)
-                        if random.random() < pancake_chance:
+                        if self._rng.random() < pancake_chance:
                             protector_stats.add_pancake()
 
                     # Chip blocks for RBs/TEs before releasing to routes
-                    if yards_gained > 10 and random.random() < 0.15:  # 15% chance on good plays
+                    if yards_gained > 10 and self._rng.random() < 0.15:  # 15% chance on good plays
                         protector_stats.add_chip_block()
 
                 else:
@@ -1824,7 +1842,7 @@ class PassPlaySimulator(BasePlaySimulator):
         base_grade = outcome_grade + rating_impact + position_bonus
 
         # Add LARGER randomness for individual variation (±8 instead of ±3)
-        grade = base_grade + random.uniform(-8.0, 8.0)
+        grade = base_grade + self._rng.uniform(-8.0, 8.0)
 
         return max(0.0, min(100.0, grade))
 
@@ -1903,7 +1921,7 @@ class PassPlaySimulator(BasePlaySimulator):
             # Short/no YAC: low chance of assisted tackle
             effective_assist_prob = assisted_tackle_prob * 0.3  # REDUCED from 0.5 to 0.3 (18%)
 
-        if random.random() < effective_assist_prob:
+        if self._rng.random() < effective_assist_prob:
             remaining = [p for p in potential_tacklers if p != primary_tackler]
             if remaining:
                 assisted_tackler = self._select_pass_tackler_by_position_weight(remaining)
@@ -2011,7 +2029,7 @@ class PassPlaySimulator(BasePlaySimulator):
             normalized = [w / total_weight for w in remaining_weights]
 
             # Select one player
-            chosen = random.choices(remaining_rushers, weights=normalized, k=1)[0]
+            chosen = self._rng.choices(remaining_rushers, weights=normalized, k=1)[0]
             selected.append(chosen)
 
             # Remove from pool for next selection
@@ -2086,7 +2104,7 @@ class PassPlaySimulator(BasePlaySimulator):
         # Weighted selection
         total_weight = sum(weights)
         normalized = [w / total_weight for w in weights]
-        chosen = random.choices(defensive_backs, weights=normalized, k=1)[0]
+        chosen = self._rng.choices(defensive_backs, weights=normalized, k=1)[0]
 
         return chosen
 
@@ -2221,14 +2239,14 @@ class PassPlaySimulator(BasePlaySimulator):
 
         # Fallback to uniform if no categorized players
         if not candidates:
-            return random.choice(potential_tacklers)
+            return self._rng.choice(potential_tacklers)
 
         # Normalize weights to sum to 1.0
         total_weight = sum(weights)
         normalized_weights = [w / total_weight for w in weights]
 
         # Use weighted random selection
-        selected_player = random.choices(candidates, weights=normalized_weights, k=1)[0]
+        selected_player = self._rng.choices(candidates, weights=normalized_weights, k=1)[0]
 
         # Update tackle count for diminishing returns tracking
         player_key = getattr(selected_player, 'player_id', selected_player.name)
@@ -2336,7 +2354,7 @@ class PassPlaySimulator(BasePlaySimulator):
         for candidate in candidates[:3]:  # Check up to 3 candidates
             if len(missed) >= 2:
                 break
-            if random.random() < adjusted_prob:
+            if self._rng.random() < adjusted_prob:
                 missed.append(candidate)
                 adjusted_prob *= 0.5  # Diminishing returns for additional misses
 
@@ -2412,12 +2430,12 @@ class PassPlaySimulator(BasePlaySimulator):
             elif rush_rating >= 80:
                 double_team_prob = 0.18
 
-            is_double_teamed = random.random() < double_team_prob
-            won_rep = random.random() < win_prob
+            is_double_teamed = self._rng.random() < double_team_prob
+            won_rep = self._rng.random() < win_prob
 
             # If double-teamed, harder to win but still possible
             if is_double_teamed:
-                won_rep = random.random() < (win_prob * 0.4)  # 40% of normal win rate
+                won_rep = self._rng.random() < (win_prob * 0.4)  # 40% of normal win rate
 
             # Create stats and record
             rusher_stats = create_player_stats_from_player(rusher, team_id=self.defensive_team_id)
@@ -9,7 +9,6 @@ Implements enhanced multi-phase simulation with comprehensive NFL realism:
 5. Individual player statistics attribution for special teams units
 """
 
-import random
 import math
 from typing import List, Tuple, Dict, Optional, Union
 from .stats import PlayerStats, PlayStatsSummary, create_player_stats_from_player
@@ -21,6 +20,7 @@ from ..play_types.offensive_types import PuntPlayType
 from ..play_types.defensive_types import DefensivePlayType
 from ..play_types.punt_types import PuntOutcome
 from team_management.players.player import Position
+from ..core.rng import GameRNG, stream_or_global, PUNT_STREAM
 from ..mechanics.penalties.penalty_engine import PenaltyEngine, PlayContext, PenaltyResult
 from ..mechanics.penalties.penalty_data_structures import PenaltyInstance
 from ..config.config_loader import config
@@ -60,7 +60,9 @@ class PuntSimulator(BasePlaySimulator):
     def __init__(self, offensive_players: List, defensive_players: List,
                  offensive_formation: str, defensive_formation: str,
                  offensive_team_id: int = None, defensive_team_id: int = None,
-                 random_event_checker=None):
+                 random_event_checker=None,
+                 rng: Optional[GameRNG] = None,
+                 penalty_engine: Optional[PenaltyEngine] = None):
         """
         Initialize punt simulator
 
@@ -72,6 +74,8 @@ class PuntSimulator(BasePlaySimulator):
             offensive_team_id: Team ID for the punting team (1-32)
             defensive_team_id: Team ID for the return team (1-32)
             random_event_checker: Optional RandomEventChecker for rare events (Tollgate 7)
+            rng: Per-game GameRNG (None = global random module)
+            penalty_engine: Shared per-game PenaltyEngine (None = new engine on rng)
         """
         self.offensive_players = offensive_players
         self.defensive_players = defensive_players
@@ -81,10 +85,13 @@ class PuntSimulator(BasePlaySimulator):
         self.defensive_team_id = defensive_team_id
 
         # Variance & Unpredictability (Tollgate 7)
-        self.random_event_checker = random_event_checker or RandomEventChecker()
+        self.random_event_checker = random_event_checker or RandomEventChecker(rng=rng)
+
+        # Per-game random stream for this play type (global random module when rng is None)
+        self._rng = stream_or_global(rng, PUNT_STREAM)
 
         # Initialize penalty engine
-        self.penalty_engine = PenaltyEngine()
+        self.penalty_engine = penalty_engine or PenaltyEngine(rng=rng)
 
         # Load punt configuration
         self.punt_config = config.get_punt_config()
@@ -264,7 +271,7 @@ class PuntSimulator(BasePlaySimulator):
         # Additional formation-based block chance (tactical decision)
         # This supplements the random rare event with strategic blocking attempts
         formation_block_modifier = formation_matchup.get('block_probability', 0.0)
-        if formation_block_modifier > 0 and random.random() < formation_block_modifier:
+        if formation_block_modifier > 0 and self._rng.random() < formation_block_modifier:
             return True
 
         return False
@@ -275,7 +282,7 @@ class PuntSimulator(BasePlaySimulator):
             outcome=PuntOutcome.BLOCKED,
             punt_yards=0,
             return_yards=0,
-            time_elapsed=random.uniform(*NFLTimingConfig.get_punt_timing())
+            time_elapsed=self._rng.uniform(*NFLTimingConfig.get_punt_timing())
         )
         blocked_result.blocked = True
         return blocked_result
@@ -296,36 +303,36 @@ class PuntSimulator(BasePlaySimulator):
                 outcome=PuntOutcome.TOUCHBACK,
                 punt_yards=touchback_distance,
                 return_yards=0,
-                time_elapsed=random.uniform(*NFLTimingConfig.get_punt_timing())
+                time_elapsed=self._rng.uniform(*NFLTimingConfig.get_punt_timing())
             )
         
         # Check for out of bounds (including coffin corner)
         out_of_bounds_prob = self.punt_config.get('field_position_mechanics', {}).get('out_of_bounds_probability', {}).get('base_rate', 0.18)
-        if random.random() < out_of_bounds_prob:
+        if self._rng.random() < out_of_bounds_prob:
             # Determine if it's a coffin corner (near goal line)
             if end_position >= 85:
                 return PuntResult(
                     outcome=PuntOutcome.COFFIN_CORNER,
                     punt_yards=punt_distance,
                     return_yards=0,
-                    time_elapsed=random.uniform(*NFLTimingConfig.get_punt_timing())
+                    time_elapsed=self._rng.uniform(*NFLTimingConfig.get_punt_timing())
                 )
             else:
                 return PuntResult(
                     outcome=PuntOutcome.OUT_OF_BOUNDS,
                     punt_yards=punt_distance,
                     return_yards=0,
-                    time_elapsed=random.uniform(*NFLTimingConfig.get_punt_timing())
+                    time_elapsed=self._rng.uniform(*NFLTimingConfig.get_punt_timing())
                 )
         
         # Check for illegal touching by coverage team
         illegal_touching_prob = self.punt_config.get('field_position_mechanics', {}).get('illegal_touching_probability', {}).get('base_rate', 0.08)
-        if random.random() < illegal_touching_prob:
+        if self._rng.random() < illegal_touching_prob:
             return PuntResult(
                 outcome=PuntOutcome.ILLEGAL_TOUCHING,
                 punt_yards=punt_distance,
                 return_yards=0,
-                time_elapsed=random.uniform(*NFLTimingConfig.get_punt_timing())
+                time_elapsed=self._rng.uniform(*NFLTimingConfig.get_punt_timing())
             )
         
         # Punt is returnable - will be processed in return sequence
@@ -333,27 +340,27 @@ class PuntSimulator(BasePlaySimulator):
             outcome="returnable",  # Internal state, will be updated in return sequence
             punt_yards=punt_distance,
             return_yards=0,
-            time_elapsed=random.uniform(4.2, 5.8)
+            time_elapsed=self._rng.uniform(4.2, 5.8)
         )
     
     def _execute_return_sequence(self, punt_result: 'PuntResult', formation_matchup: Dict, context: PlayContext) -> 'PuntResult':
         """Execute punt return sequence (fair catch, return, muff, or downed)"""
         # Check for muff first
         muff_probability = self._calculate_muff_probability()
-        if random.random() < muff_probability:
+        if self._rng.random() < muff_probability:
             punt_result.outcome = PuntOutcome.MUFFED
             punt_result.muffed = True
             return punt_result
         
         # Check for coverage team downing the punt
         downed_probability = self._calculate_downed_probability()
-        if random.random() < downed_probability:
+        if self._rng.random() < downed_probability:
             punt_result.outcome = PuntOutcome.DOWNED
             return punt_result
         
         # Check for fair catch
         fair_catch_probability = self._calculate_fair_catch_probability(punt_result.punt_yards)
-        if random.random() < fair_catch_probability:
+        if self._rng.random() < fair_catch_probability:
             punt_result.outcome = PuntOutcome.FAIR_CATCH
             punt_result.fair_catch = True
             return punt_result
@@ -382,10 +389,10 @@ class PuntSimulator(BasePlaySimulator):
         completion_probability = base_completion * fake_advantage * punter_modifier
         
         # Determine completion
-        if random.random() < completion_probability:
+        if self._rng.random() < completion_probability:
             # Completed pass
             yards_config = fake_config.get('yards_range', {'min': 2, 'max': 20, 'avg': 9})
-            yards_gained = max(0, int(random.gauss(yards_config['avg'], 
+            yards_gained = max(0, int(self._rng.gauss(yards_config['avg'], 
                                                  (yards_config['max'] - yards_config['min']) / 4)))
             
             # Determine if touchdown
@@ -396,7 +403,7 @@ class PuntSimulator(BasePlaySimulator):
                 outcome=PuntOutcome.FAKE_SUCCESS,
                 punt_yards=0,  # No punt occurred
                 return_yards=0,
-                time_elapsed=random.uniform(*NFLTimingConfig.get_punt_timing(is_fake=True))
+                time_elapsed=self._rng.uniform(*NFLTimingConfig.get_punt_timing(is_fake=True))
             )
             result.is_fake = True
             result.fake_type = "pass"
@@ -409,13 +416,13 @@ class PuntSimulator(BasePlaySimulator):
             return result
         else:
             # Incomplete pass or interception
-            outcome = PuntOutcome.FAKE_FAILED if random.random() < 0.9 else PuntOutcome.FAKE_INTERCEPTION
+            outcome = PuntOutcome.FAKE_FAILED if self._rng.random() < 0.9 else PuntOutcome.FAKE_INTERCEPTION
             
             result = PuntResult(
                 outcome=outcome,
                 punt_yards=0,
                 return_yards=0,
-                time_elapsed=random.uniform(*NFLTimingConfig.get_punt_timing(is_fake=True))
+                time_elapsed=self._rng.uniform(*NFLTimingConfig.get_punt_timing(is_fake=True))
             )
             result.is_fake = True
             result.fake_type = "pass"
@@ -438,10 +445,10 @@ class PuntSimulator(BasePlaySimulator):
         success_probability = base_success * fake_advantage * punter_modifier
         
         # Determine success
-        if random.random() < success_probability:
+        if self._rng.random() < success_probability:
             # Successful run
             yards_config = fake_config.get('yards_range', {'min': 0, 'max': 15, 'avg': 5})
-            yards_gained = max(0, int(random.gauss(yards_config['avg'], 
+            yards_gained = max(0, int(self._rng.gauss(yards_config['avg'], 
                                                  (yards_config['max'] - yards_config['min']) / 4)))
             
             # Determine if touchdown
@@ -452,7 +459,7 @@ class PuntSimulator(BasePlaySimulator):
                 outcome=PuntOutcome.FAKE_SUCCESS,
                 punt_yards=0,
                 return_yards=0,
-                time_elapsed=random.uniform(*NFLTimingConfig.get_punt_timing(is_fake=True))
+                time_elapsed=self._rng.uniform(*NFLTimingConfig.get_punt_timing(is_fake=True))
             )
             result.is_fake = True
             result.fake_type = "run"
@@ -465,13 +472,13 @@ class PuntSimulator(BasePlaySimulator):
             return result
         else:
             # Failed run attempt
-            yards_gained = max(0, random.randint(0, 2))  # Minimal gain on failure
+            yards_gained = max(0, self._rng.randint(0, 2))  # Minimal gain on failure
             
             result = PuntResult(
                 outcome=PuntOutcome.FAKE_FAILED,
                 punt_yards=0,
                 return_yards=0,
-                time_elapsed=random.uniform(*NFLTimingConfig.get_punt_timing(is_fake=True))
+                time_elapsed=self._rng.uniform(*NFLTimingConfig.get_punt_timing(is_fake=True))
             )
             result.is_fake = True
             result.fake_type = "run"
@@ -495,7 +502,7 @@ class PuntSimulator(BasePlaySimulator):
         
         # Calculate final distance
         modified_avg = base_avg + punter_modifier
-        distance = random.gauss(modified_avg, (base_max - base_min) / 6) * environmental_modifier
+        distance = self._rng.gauss(modified_avg, (base_max - base_min) / 6) * environmental_modifier
         
         return max(base_min, min(base_max + 10, int(distance)))  # Allow slight overflow for elite punters
     
@@ -553,11 +560,11 @@ class PuntSimulator(BasePlaySimulator):
         
         # Calculate hang time based on distance (physics-based)
         if punt_distance < 35:
-            hang_time = random.uniform(3.8, 4.2)
+            hang_time = self._rng.uniform(3.8, 4.2)
         elif punt_distance < 50:
-            hang_time = random.uniform(4.2, 4.8)
+            hang_time = self._rng.uniform(4.2, 4.8)
         else:
-            hang_time = random.uniform(4.8, 5.5)
+            hang_time = self._rng.uniform(4.8, 5.5)
         
         # Determine punt placement strategy
         placement = self._determine_punt_placement(context)
@@ -610,14 +617,14 @@ class PuntSimulator(BasePlaySimulator):
             fair_catch_prob *= 1.4  # More conservative
             
         # Fair catch decision
-        if random.random() < fair_catch_prob:
+        if self._rng.random() < fair_catch_prob:
             return 0, PuntOutcome.FAIR_CATCH, punt_physics.hang_time
         
         # Return attempt - simulate execution
         return_yards = self._execute_return_attempt(punt_physics, return_opportunity)
         
         # Calculate total play time (hang time + return time)
-        return_time = max(1.5, return_yards * 0.15 + random.uniform(1.0, 3.0))
+        return_time = max(1.5, return_yards * 0.15 + self._rng.uniform(1.0, 3.0))
         total_time = punt_physics.hang_time + return_time
         
         return return_yards, PuntOutcome.PUNT_RETURN, total_time
@@ -659,9 +666,9 @@ class PuntSimulator(BasePlaySimulator):
         field_position = getattr(context, 'field_position', 50)
         
         if field_position > 60:  # In opponent territory
-            return "corner" if random.random() < 0.3 else "sideline"
+            return "corner" if self._rng.random() < 0.3 else "sideline"
         else:
-            return "middle" if random.random() < 0.6 else "sideline"
+            return "middle" if self._rng.random() < 0.6 else "sideline"
     
     def _execute_return_attempt(self, punt_physics: 'PuntPhysics', return_opportunity: 'ReturnOpportunity') -> int:
         """Execute the actual return based on Stage 1 conditions"""
@@ -677,11 +684,11 @@ class PuntSimulator(BasePlaySimulator):
         expected_return = base_return * (1.0 + advantage) * returner_modifier
         
         # Add variance
-        return_yards = random.gauss(expected_return, expected_return * 0.4)
+        return_yards = self._rng.gauss(expected_return, expected_return * 0.4)
         
         # Explosive play check (5% chance based on advantage)
-        if advantage > 0.3 and random.random() < 0.05:
-            return_yards += random.randint(15, 40)  # Breakaway potential
+        if advantage > 0.3 and self._rng.random() < 0.05:
+            return_yards += self._rng.randint(15, 40)  # Breakaway potential
         
         return max(0, int(return_yards))
     
@@ -701,7 +708,7 @@ class PuntSimulator(BasePlaySimulator):
         
         # Calculate final return yards
         expected_return = base_return * return_advantage * returner_modifier / coverage_modifier
-        return_yards = random.gauss(expected_return, expected_return * 0.4)
+        return_yards = self._rng.gauss(expected_return, expected_return * 0.4)
         
         return max(0, int(return_yards))
     
@@ -891,12 +898,12 @@ class PuntSimulator(BasePlaySimulator):
 
             if result.outcome == PuntOutcome.DOWNED:
                 # Randomly assign downed punt credit
-                if random.random() < 0.3:  # 30% chance any coverage player gets credit
+                if self._rng.random() < 0.3:  # 30% chance any coverage player gets credit
                     coverage_stats.punts_downed = 1
 
             if result.outcome == PuntOutcome.PUNT_RETURN:
                 # Coverage tackle attribution
-                if random.random() < 0.4:  # 40% chance coverage player gets tackle
+                if self._rng.random() < 0.4:  # 40% chance coverage player gets tackle
                     coverage_stats.tackles = 1  # Solo tackle (use 'tackles' field, not 'solo_tackles')
 
             result.player_stats[player.name] = coverage_stats
@@ -931,7 +938,7 @@ class PuntSimulator(BasePlaySimulator):
         # Limit to realistic punt protection unit size
         max_protectors = min(7, len(protection_players))
         if protection_players:
-            selected_protectors = random.sample(protection_players, min(max_protectors, len(protection_players)))
+            selected_protectors = self._rng.sample(protection_players, min(max_protectors, len(protection_players)))
 
             for protector in selected_protectors:
                 protector_stats = create_player_stats_from_player(protector)
@@ -939,7 +946,7 @@ class PuntSimulator(BasePlaySimulator):
                 # Punt protection stats based on outcome
                 if result.blocked:
                     # Blocked punt - someone missed assignment
-                    if random.random() < 0.3:  # 30% chance this protector allowed block
+                    if self._rng.random() < 0.3:  # 30% chance this protector allowed block
                         protector_stats.blocks_allowed += 1
                         protector_stats.add_missed_assignment()
                     protector_stats.add_block(successful=False)
@@ -953,7 +960,7 @@ class PuntSimulator(BasePlaySimulator):
 
                     # Pancake opportunities on excellent protection (coffin corner punts)
                     if result.outcome in [PuntOutcome.COFFIN_CORNER, PuntOutcome.DOWNED]:
-                        if random.random() < 0.05:  # 5% chance of pancake on excellent punt
+                        if self._rng.random() < 0.05:  # 5% chance of pancake on excellent punt
                             protector_stats.add_pancake()
 
                 protection_stats[protector.name] = protector_stats
@@ -994,7 +1001,7 @@ class PuntSimulator(BasePlaySimulator):
             base_grade = 65.0  # Fair catch or other neutral outcome
 
         # Add some randomness
-        grade = base_grade + random.uniform(-5.0, 5.0)
+        grade = base_grade + self._rng.uniform(-5.0, 5.0)
         return max(0.0, min(100.0, grade))
 
     # NOTE: _track_special_teams_snaps_for_all_players is inherited from BasePlaySimulator
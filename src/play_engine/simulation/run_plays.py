@@ -7,7 +7,6 @@ Implements enhanced two-stage simulation with penalty system:
 3. Attribute individual player statistics based on final outcome
 """
 
-import random
 from typing import List, Tuple, Dict, Optional
 from .stats import PlayerStats, PlayStatsSummary, create_player_stats_from_player
 from .base_simulator import BasePlaySimulator
@@ -16,6 +15,8 @@ from .tackler_selection import TacklerSelector
 from ..mechanics.formations import OffensiveFormation, DefensiveFormation
 from ..play_types.base_types import PlayType
 from team_management.players.player import Position
+from ..core.rng import GameRNG, stream_or_global, RUN_STREAM
+from ..game_state.lineup_index import GameLineupIndex
 from ..mechanics.penalties.penalty_engine import PenaltyEngine, PlayContext, PenaltyResult
 from ..mechanics.penalties.penalty_data_structures import PenaltyInstance
 from ..config.config_loader import config, get_run_formation_matchup
@@ -32,7 +33,11 @@ class RunPlaySimulator(BasePlaySimulator):
                  weather_condition: str = "clear", crowd_noise_level: int = 0,
                  is_away_team: bool = False, selected_ball_carrier=None,
                  performance_tracker=None, clutch_factor: float = 0.0,
-                 primetime_variance: float = 0.0, field_position: int = 50):
+                 primetime_variance: float = 0.0, field_position: int = 50,
+                 rng: Optional[GameRNG] = None,
+                 offensive_lineup: Optional[GameLineupIndex] = None,
+                 defensive_lineup: Optional[GameLineupIndex] = None,
+                 penalty_engine: Optional[PenaltyEngine] = None):
         """
         Initialize run play simulator
 
@@ -53,6 +58,10 @@ class RunPlaySimulator(BasePlaySimulator):
             clutch_factor: Clutch pressure level (0.0-1.0 from urgency analyzer, Tollgate 6)
             primetime_variance: Additional outcome variance for primetime games (0.0-0.15, Tollgate 6)
             field_position: Current yard line (0-100, where 100 is opponent's goal line)
+            rng: Per-game GameRNG (None = global random module)
+            offensive_lineup: Per-game GameLineupIndex over offensive_players (optional)
+            defensive_lineup: Per-game GameLineupIndex over defensive_players (optional)
+            penalty_engine: Shared per-game PenaltyEngine (None = new engine on rng)
         """
         self.offensive_players = offensive_players
         self.defensive_players = defensive_players
@@ -60,6 +69,8 @@ class RunPlaySimulator(BasePlaySimulator):
         self.defensive_formation = defensive_formation
         self.offensive_team_id = offensive_team_id
         self.defensive_team_id = defensive_team_id
+        self.offensive_lineup = offensive_lineup
+        self.defensive_lineup = defensive_lineup
         self.coverage_scheme = coverage_scheme  # Store coverage scheme
         self.momentum_modifier = momentum_modifier  # Store momentum modifier
         self.field_position = field_position  # Store field position for touchdown detection
@@ -77,8 +88,11 @@ class RunPlaySimulator(BasePlaySimulator):
         # RB rotation - use pre-selected ball carrier if provided
         self.selected_ball_carrier = selected_ball_carrier
 
+        # Per-game random stream for this play type (global random module when rng is None)
+        self._rng = stream_or_global(rng, RUN_STREAM)
+
         # Initialize penalty engine
-        self.penalty_engine = PenaltyEngine()
+        self.penalty_engine = penalty_engine or PenaltyEngine(rng=rng)
     
     def simulate_run_play(self, context: Optional[PlayContext] = None) -> PlayStatsSummary:
         """
@@ -226,7 +240,7 @@ class RunPlaySimulator(BasePlaySimulator):
         # Generate yards with modified distribution
         # Use round() instead of int() to preserve statistical mean (int() truncates, losing ~0.4 yards avg)
         # Allow TFL up to -3 yards for realistic tackles behind the line
-        yards_gained = max(-3, round(random.gauss(modified_avg_yards, modified_variance)))
+        yards_gained = max(-3, round(self._rng.gauss(modified_avg_yards, modified_variance)))
 
         # NEW: Breakaway run check (speed-based explosive play mechanism)
         # Separate from normal distribution to achieve NFL-realistic 20+ yard run frequency
@@ -243,15 +257,15 @@ class RunPlaySimulator(BasePlaySimulator):
                 speed_bonus = (speed - speed_threshold) * speed_bonus_rate
                 breakaway_chance = min(0.12, base_prob + speed_bonus)  # Cap at 12%
 
-                if random.random() < breakaway_chance:
+                if self._rng.random() < breakaway_chance:
                     # Breakaway! Generate explosive yards
                     min_yards = breakaway_config.get('min_yards', 15)
                     max_yards = breakaway_config.get('max_yards', 35)
-                    yards_gained = random.randint(min_yards, max_yards)
+                    yards_gained = self._rng.randint(min_yards, max_yards)
 
         # Time elapsed - use realistic NFL timing (includes huddle, play clock, execution)
         min_time, max_time = NFLTimingConfig.get_run_play_timing()
-        time_elapsed = round(random.uniform(min_time, max_time), 1)
+        time_elapsed = round(self._rng.uniform(min_time, max_time), 1)
 
         return yards_gained, time_elapsed
     
@@ -451,7 +465,7 @@ class RunPlaySimulator(BasePlaySimulator):
             # Contact typically occurs 40-60% into the run; YAC is yards gained after first hit
             if yards_gained > 0:
                 # Calculate yards before contact (approximately 40-60% of total yards)
-                yards_before_contact = int(yards_gained * random.uniform(0.4, 0.6))
+                yards_before_contact = int(yards_gained * self._rng.uniform(0.4, 0.6))
                 yac = max(0, yards_gained - yards_before_contact)
 
                 # Adjust YAC based on RB elusiveness/power ratings if available
@@ -544,7 +558,7 @@ class RunPlaySimulator(BasePlaySimulator):
 
         # Validation removed for performance - team_id consistency should be guaranteed by player loading
 
-        return [stats for stats in player_stats if stats.get_total_stats()]
+        return [stats for stats in player_stats if stats.has_stats()]
 
     def _attribute_advanced_oline_stats(self, yards_gained: int, offensive_line: List) -> List[PlayerStats]:
         """
@@ -577,11 +591,11 @@ class RunPlaySimulator(BasePlaySimulator):
         if yards_gained >= big_run_threshold:
             num_blockers = min(len(offensive_line), max_blockers)  # All hands on deck for big runs
         elif yards_gained >= pancake_threshold:
-            num_blockers = min(len(offensive_line), random.randint(max_blockers-1, max_blockers))
+            num_blockers = min(len(offensive_line), self._rng.randint(max_blockers-1, max_blockers))
         else:
-            num_blockers = min(len(offensive_line), random.randint(min_blockers, max_blockers))
+            num_blockers = min(len(offensive_line), self._rng.randint(min_blockers, max_blockers))
 
-        selected_blockers = random.sample(offensive_line, num_blockers)
+        selected_blockers = self._rng.sample(offensive_line, num_blockers)
 
         for i, blocker in enumerate(selected_blockers):
             blocker_stats = create_player_stats_from_player(blocker, team_id=self.offensive_team_id)
@@ -592,7 +606,7 @@ class RunPlaySimulator(BasePlaySimulator):
 
             # Determine block outcome and advanced stats
             success_rate = base_success_rate + (yards_gained * 0.04)  # Better success rate for longer runs
-            is_successful_block = random.random() < success_rate
+            is_successful_block = self._rng.random() < success_rate
 
             if is_successful_block:
                 blocker_stats.add_block(successful=True)
@@ -600,17 +614,17 @@ class RunPlaySimulator(BasePlaySimulator):
                 # Pancake opportunities on long runs
                 if yards_gained >= pancake_threshold:
                     pancake_chance = self._calculate_pancake_chance(yards_gained, blocker)
-                    if random.random() < pancake_chance:
+                    if self._rng.random() < pancake_chance:
                         blocker_stats.add_pancake()
 
                 # Double team blocks on power runs (short yardage, goal line)
                 if 1 <= yards_gained <= 4 and len(selected_blockers) >= 4:
-                    if random.random() < 0.15:  # 15% chance of double team credit
+                    if self._rng.random() < 0.15:  # 15% chance of double team credit
                         blocker_stats.add_double_team_block()
 
                 # Downfield blocks on big runs
                 if yards_gained >= big_run_threshold and i < 2:  # Lead blockers
-                    if random.random() < 0.3:  # 30% chance
+                    if self._rng.random() < 0.3:  # 30% chance
                         blocker_stats.add_downfield_block()
 
             else:
@@ -618,7 +632,7 @@ class RunPlaySimulator(BasePlaySimulator):
 
                 # Missed assignments on negative plays
                 if yards_gained <= tfl_threshold:
-                    if random.random() < 0.25:  # 25% chance of missed assignment on TFL
+                    if self._rng.random() < 0.25:  # 25% chance of missed assignment on TFL
                         blocker_stats.add_missed_assignment()
 
             oline_stats.append(blocker_stats)
@@ -694,7 +708,7 @@ class RunPlaySimulator(BasePlaySimulator):
         base_grade = outcome_grade + rating_impact + position_bonus
 
         # Add LARGER randomness for individual variation (±8 instead of ±5)
-        grade = base_grade + random.uniform(-8.0, 8.0)
+        grade = base_grade + self._rng.uniform(-8.0, 8.0)
 
         return max(0.0, min(100.0, grade))
 
@@ -747,11 +761,7 @@ class RunPlaySimulator(BasePlaySimulator):
         if position == Position.RB and self.selected_ball_carrier is not None:
             return self.selected_ball_carrier
 
-        # Default: find first matching player
-        for player in self.offensive_players:
-            if player.primary_position == position:
-                return player
-        return None
+        return super()._find_player_by_position(position)
     
     # Inherited from BasePlaySimulator:
     # - _find_players_by_positions()
@@ -798,7 +808,7 @@ class RunPlaySimulator(BasePlaySimulator):
             # Short run: low chance of assisted tackle (pile tackles)
             effective_assist_prob = assisted_tackle_prob * 0.3  # REDUCED from 0.6 to 0.3 (18%)
 
-        if random.random() < effective_assist_prob:
+        if self._rng.random() < effective_assist_prob:
             remaining = [p for p in potential_tacklers if p != primary_tackler]
             if remaining:
                 assisted_tackler = self._select_tackler_by_position_weight(remaining, yards_gained)
@@ -974,14 +984,14 @@ class RunPlaySimulator(BasePlaySimulator):
 
         # Fallback to uniform if no categorized players
         if not candidates:
-            return random.choice(potential_tacklers)
+            return self._rng.choice(potential_tacklers)
 
         # Normalize weights to sum to 1.0
         total_weight = sum(weights)
         normalized_weights = [w / total_weight for w in weights]
 
         # Use weighted random selection
-        selected_player = random.choices(candidates, weights=normalized_weights, k=1)[0]
+        selected_player = self._rng.choices(candidates, weights=normalized_weights, k=1)[0]
 
         # Update tackle count for diminishing returns tracking
         player_key = getattr(selected_player, 'player_id', selected_player.name)
@@ -1059,13 +1069,13 @@ class RunPlaySimulator(BasePlaySimulator):
 
         # Fallback to random if no candidates with weights
         if not candidates or sum(weights) == 0:
-            return random.choice(potential_sackers) if potential_sackers else None
+            return self._rng.choice(potential_sackers) if potential_sackers else None
 
         # Normalize and select
         total_weight = sum(weights)
         normalized_weights = [w / total_weight for w in weights]
 
-        return random.choices(candidates, weights=normalized_weights, k=1)[0]
+        return self._rng.choices(candidates, weights=normalized_weights, k=1)[0]
 
     def _generate_missed_tackles(
         self,
@@ -1123,7 +1133,7 @@ class RunPlaySimulator(BasePlaySimulator):
         for candidate in candidates[:4]:  # Check up to 4 candidates
             if len(missed) >= 2:
                 break
-            if random.random() < adjusted_prob:
+            if self._rng.random() < adjusted_prob:
                 missed.append(candidate)
                 adjusted_prob *= 0.5  # Diminishing returns for additional misses
 
@@ -1177,14 +1187,14 @@ class RunPlaySimulator(BasePlaySimulator):
             base_rate += rb_modifiers.get('poor_increase', 0.004)
 
         # Roll for fumble
-        fumble_occurred = random.random() < base_rate
+        fumble_occurred = self._rng.random() < base_rate
 
         if not fumble_occurred:
             return False, False
 
         # Fumble occurred - check recovery
         # ~50% recovery rate for offense (NFL average)
-        defense_recovered = random.random() < recovery_rate
+        defense_recovered = self._rng.random() < recovery_rate
 
         return True, defense_recovered
 
@@ -1231,7 +1241,7 @@ class RunPlaySimulator(BasePlaySimulator):
 
         potential_forcers = linebackers + safeties + defensive_line
         if potential_forcers:
-            forcer = random.choice(potential_forcers)
+            forcer = self._rng.choice(potential_forcers)
             forcer_stats = create_player_stats_from_player(forcer, team_id=self.defensive_team_id)
             forcer_stats.forced_fumbles = 1
             # Only credit fumble recovery if defense actually recovered
@@ -5,8 +5,11 @@ Tracks individual player contributions during play execution including
 rushing, blocking, tackling, and other position-specific statistics.
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+from array import array
+from itertools import compress
+from operator import attrgetter
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field, fields
 from ..play_types.base_types import PlayType
 try:
     from ...constants.player_stats_fields import PlayerStatField, ALL_STAT_FIELDS
@@ -18,9 +21,15 @@ except ImportError:
     from constants.player_stats_fields import PlayerStatField, ALL_STAT_FIELDS
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerStats:
-    """Individual player statistics for a single play"""
+    """
+    Individual player statistics for a single play
+
+    Slotted: one is created per player per play, so instances carry no
+    __dict__ and only declared fields can be set. Use to_dict() instead
+    of vars().
+    """
     player_name: str
     player_number: int
     position: str
@@ -137,6 +146,14 @@ class PlayerStats:
     punts_inside_20: int = 0
     punts_downed: int = 0
 
+    # Kickoff stats (Kicker / Returner)
+    kickoff_attempts: int = 0
+    touchbacks: int = 0
+    onside_recoveries: int = 0
+    kickoff_returns: int = 0
+    kickoff_return_yards: int = 0
+    kickoff_return_touchdowns: int = 0
+
     # Punt return stats (Returner)
     punt_returns: int = 0
     punt_return_yards: int = 0
@@ -351,13 +368,12 @@ class PlayerStats:
 
     def get_total_stats(self) -> Dict[str, int]:
         """Get all non-zero stats as dictionary, including snap counts"""
-        # Use canonical stat fields from enum
-        stat_fields = ALL_STAT_FIELDS
-
-        stats = {}
-        for field_name, value in self.__dict__.items():
-            if field_name in stat_fields and isinstance(value, (int, float)) and value != 0:
-                stats[field_name] = value
+        # Canonical stat fields (ALL_STAT_FIELDS) read in one pass
+        stats = {
+            field_name: value
+            for field_name, value in zip(_TOTAL_STAT_FIELDS, _read_total_stat_values(self))
+            if value != 0 and isinstance(value, (int, float))
+        }
 
         # CRITICAL FIX: Always include snap counts (even if not in ALL_STAT_FIELDS)
         # Players with ONLY snaps (no other stats) still played and need to be tracked
@@ -371,6 +387,17 @@ class PlayerStats:
 
         return stats
 
+    def has_stats(self) -> bool:
+        """Check whether get_total_stats() would be non-empty (without building it)"""
+        return (any(_read_total_stat_values(self))
+                or self.offensive_snaps > 0
+                or self.defensive_snaps > 0
+                or self.special_teams_snaps > 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get identity and stat fields as a dictionary (vars() replacement)"""
+        return {name: getattr(self, name) for name in _PLAYER_STATS_FIELD_NAMES}
+
     def get_total_yards(self) -> int:
         """
         Calculate total yards for this player across all categories.
@@ -493,6 +520,40 @@ class PlayerStats:
         return base_info
 
 
+# ============================================
+# Stat field schema
+# ============================================
+
+# Player identity fields (never merged)
+PLAYER_IDENTITY_FIELDS = frozenset({
+    'player_name', 'player_number', 'position', 'team_id',
+    'player_id', 'player_attributes'
+})
+
+# Fields merged with max() instead of sum()
+PLAYER_STAT_MAX_FIELDS = frozenset({
+    'longest_field_goal', 'run_blocking_grade', 'pass_blocking_efficiency',
+    'receiving_long', 'rushing_long'
+})
+
+_PLAYER_STATS_FIELD_NAMES = tuple(f.name for f in fields(PlayerStats))
+
+# Fixed field-index schema for every numeric stat (declaration order)
+PLAYER_STAT_FIELDS: Tuple[str, ...] = tuple(
+    name for name in _PLAYER_STATS_FIELD_NAMES if name not in PLAYER_IDENTITY_FIELDS
+)
+PLAYER_STAT_INDEX: Dict[str, int] = {name: i for i, name in enumerate(PLAYER_STAT_FIELDS)}
+
+# Materialization types: float-annotated totals stay float, whole-number
+# totals of other fields become int, untouched fields keep their default
+_FLOAT_STAT_FIELDS = frozenset(f.name for f in fields(PlayerStats) if f.type is float)
+_STAT_DEFAULTS = tuple(f.default for f in fields(PlayerStats) if f.name not in PLAYER_IDENTITY_FIELDS)
+_TOTAL_STAT_FIELDS = tuple(name for name in PLAYER_STAT_FIELDS if name in ALL_STAT_FIELDS)
+
+_read_stat_values = attrgetter(*PLAYER_STAT_FIELDS)
+_read_total_stat_values = attrgetter(*_TOTAL_STAT_FIELDS)
+
+
 @dataclass
 class PlayStatsSummary:
     """Summary of all player statistics for a single play with penalty information"""
@@ -525,7 +586,7 @@ class PlayStatsSummary:
     
     def get_players_with_stats(self) -> List[PlayerStats]:
         """Get only players who recorded statistics this play"""
-        return [stats for stats in self.player_stats if stats.get_total_stats()]
+        return [stats for stats in self.player_stats if stats.has_stats()]
     
     def get_stats_by_position(self, position: str) -> List[PlayerStats]:
         """Get stats for all players at a specific position"""
@@ -718,6 +779,11 @@ class PlayerStatsAccumulator:
     
     Handles merging player stats from PlayStatsSummary objects into running game totals.
     Provides query methods for accessing accumulated player statistics.
+
+    Totals are kept as one array('d') row per player (PLAYER_STAT_FIELDS
+    order), keyed by player_id. Each play merges only the non-zero fields
+    of the incoming stats. PlayerStats totals are materialized on query,
+    and only for players whose rows changed since the last query.
     """
     
     def __init__(self, game_identifier: Optional[str] = None):
@@ -728,7 +794,10 @@ class PlayerStatsAccumulator:
             game_identifier: Optional identifier for this game (e.g., "Browns_vs_49ers_Q1")
         """
         self.game_id = game_identifier
-        self._player_totals: Dict[str, PlayerStats] = {}
+        self._rows: Dict[Tuple, array] = {}                 # player key -> stat row
+        self._player_totals: Dict[Tuple, PlayerStats] = {}  # player key -> materialized totals
+        self._keys_by_name: Dict[str, Tuple] = {}           # "PlayerName_Position" -> player key
+        self._stale: set = set()                            # player keys with unmaterialized rows
         self._plays_processed = 0
     
     def add_play_stats(self, play_summary: PlayStatsSummary) -> None:
@@ -742,21 +811,17 @@ class PlayerStatsAccumulator:
 
         # Process each player's stats from the play
         for player_stats in play_summary.player_stats:
-            total_stats = player_stats.get_total_stats()
-            if total_stats:  # Only accumulate players with actual stats
+            if player_stats.has_stats():  # Only accumulate players with actual stats
                 self._merge_player_stats(player_stats)
     
     # Fields excluded from automatic stat merging (player identity, not stats)
-    _MERGE_EXCLUDED_FIELDS = frozenset({
-        'player_name', 'player_number', 'position', 'team_id',
-        'player_id', 'player_attributes', 'total_snaps'
-    })
+    _MERGE_EXCLUDED_FIELDS = PLAYER_IDENTITY_FIELDS | {'total_snaps'}
 
     # Fields that use max() instead of sum() when merging
-    _MERGE_MAX_FIELDS = frozenset({
-        'longest_field_goal', 'run_blocking_grade', 'pass_blocking_efficiency',
-        'receiving_long', 'rushing_long'
-    })
+    _MERGE_MAX_FIELDS = PLAYER_STAT_MAX_FIELDS
+
+    _STAT_INDEXES = tuple(range(len(PLAYER_STAT_FIELDS)))
+    _MAX_INDEXES = frozenset(PLAYER_STAT_INDEX[name] for name in PLAYER_STAT_MAX_FIELDS)
 
     # PFF-critical stats to trace for grading audit
     # These stats are required for accurate PFF-style grades but often missing
@@ -778,23 +843,37 @@ class PlayerStatsAccumulator:
     # Enable/disable PFF stats tracing (set to True to debug stats flow)
     _TRACE_PFF_STATS = False
 
+    @staticmethod
+    def _player_key(stats: PlayerStats) -> Tuple:
+        """
+        Accumulator key for a player.
+
+        player_id identifies database players; the name guards against
+        collisions between generated ids of synthetic players, and keys
+        players without an id.
+        """
+        return (stats.player_id, stats.player_name) if stats.player_id is not None \
+            else (None, stats.player_name, stats.position)
+
     def _merge_player_stats(self, incoming_stats: PlayerStats) -> None:
         """
-        Merge incoming player stats into accumulated totals using introspection.
+        Merge incoming player stats into accumulated totals.
 
-        Automatically handles all numeric stat fields:
+        Reads all stat fields in one pass and updates only the non-zero ones:
         - Most fields: summed (rushing_yards, tackles, etc.)
         - Max fields: take maximum (longest_field_goal, grades)
-        - Excluded fields: player identity fields not merged
+        - Identity fields: taken from the first stats seen for the player
 
         Args:
             incoming_stats: PlayerStats from a single play to merge into totals
         """
-        # Create unique key for this player
-        player_key = f"{incoming_stats.player_name}_{incoming_stats.position}"
+        player_key = self._player_key(incoming_stats)
+        row = self._rows.get(player_key)
 
-        if player_key not in self._player_totals:
-            # First time seeing this player - create new accumulated stats
+        if row is None:
+            # First time seeing this player - keep identity, start an empty row
+            row = array('d', bytes(8 * len(PLAYER_STAT_FIELDS)))
+            self._rows[player_key] = row
             self._player_totals[player_key] = PlayerStats(
                 player_name=incoming_stats.player_name,
                 player_number=incoming_stats.player_number,
@@ -803,8 +882,9 @@ class PlayerStatsAccumulator:
                 player_id=incoming_stats.player_id,
                 player_attributes=incoming_stats.player_attributes
             )
-
-        existing = self._player_totals[player_key]
+            self._keys_by_name.setdefault(
+                f"{incoming_stats.player_name}_{incoming_stats.position}", player_key
+            )
 
         # PFF stats tracing - log when non-zero PFF-critical stats are being merged
         if self._TRACE_PFF_STATS:
@@ -817,27 +897,30 @@ class PlayerStatsAccumulator:
                 print(f"[PFF_TRACE:ACCUMULATOR] {incoming_stats.player_name} ({incoming_stats.position}): "
                       f"{', '.join(pff_stats_found)}")
 
-        # Auto-merge all numeric fields using introspection
-        for field_name, incoming_value in incoming_stats.__dict__.items():
-            # Skip non-stat fields
-            if field_name in self._MERGE_EXCLUDED_FIELDS:
-                continue
-
-            # Only merge numeric values
-            if not isinstance(incoming_value, (int, float)):
-                continue
-
-            # Skip zero values (no stat recorded)
-            if incoming_value == 0:
-                continue
-
-            existing_value = getattr(existing, field_name, 0)
-
-            # Use max strategy for grade/longest fields, sum for everything else
-            if field_name in self._MERGE_MAX_FIELDS:
-                setattr(existing, field_name, max(existing_value, incoming_value))
+        # Index-wise merge over the touched (non-zero) fields only
+        values = _read_stat_values(incoming_stats)
+        max_indexes = self._MAX_INDEXES
+        for index in compress(self._STAT_INDEXES, values):
+            value = values[index]
+            if index in max_indexes:
+                if value > row[index]:
+                    row[index] = value
             else:
-                setattr(existing, field_name, existing_value + incoming_value)
+                row[index] += value
+
+        self._stale.add(player_key)
+
+    def _materialize(self) -> None:
+        """Copy changed rows into their PlayerStats totals"""
+        for player_key in self._stale:
+            totals = self._player_totals[player_key]
+            for name, value, default in zip(PLAYER_STAT_FIELDS, self._rows[player_key], _STAT_DEFAULTS):
+                if value == 0:
+                    value = default
+                elif name not in _FLOAT_STAT_FIELDS and value.is_integer():
+                    value = int(value)
+                setattr(totals, name, value)
+        self._stale.clear()
 
     def get_player_stats(self, player_identifier: str) -> Optional[PlayerStats]:
         """
@@ -849,7 +932,11 @@ class PlayerStatsAccumulator:
         Returns:
             PlayerStats object with accumulated totals, or None if player not found
         """
-        return self._player_totals.get(player_identifier)
+        player_key = self._keys_by_name.get(player_identifier)
+        if player_key is None:
+            return None
+        self._materialize()
+        return self._player_totals[player_key]
     
     def get_all_players_with_stats(self) -> List[PlayerStats]:
         """
@@ -858,7 +945,8 @@ class PlayerStatsAccumulator:
         Returns:
             List of PlayerStats objects for all players with accumulated stats
         """
-        return [stats for stats in self._player_totals.values() if stats.get_total_stats()]
+        self._materialize()
+        return [stats for stats in self._player_totals.values() if stats.has_stats()]
     
     def get_players_by_position(self, position: str) -> List[PlayerStats]:
         """
@@ -870,8 +958,9 @@ class PlayerStatsAccumulator:
         Returns:
             List of PlayerStats objects for players at the specified position
         """
+        self._materialize()
         return [stats for stats in self._player_totals.values() 
-                if stats.position == position and stats.get_total_stats()]
+                if stats.position == position and stats.has_stats()]
     
     def get_plays_processed(self) -> int:
         """
@@ -897,7 +986,10 @@ class PlayerStatsAccumulator:
         
         Clears all accumulated player stats and resets play count.
         """
+        self._rows.clear()
         self._player_totals.clear()
+        self._keys_by_name.clear()
+        self._stale.clear()
         self._plays_processed = 0
 
 
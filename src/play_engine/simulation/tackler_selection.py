@@ -71,7 +71,8 @@ class TacklerSelector:
         yards_gained: int,
         potential_tacklers: List,
         long_run_threshold: int = 5,
-        assisted_tackle_prob: float = 0.6
+        assisted_tackle_prob: float = 0.6,
+        rng=None
     ) -> List[Tuple]:
         """
         Select tacklers for run plays using NFL-realistic position weights.
@@ -81,6 +82,7 @@ class TacklerSelector:
             potential_tacklers: List of defensive players who could make tackles
             long_run_threshold: Yards threshold for considering assisted tackles
             assisted_tackle_prob: Probability of assisted tackle on long runs
+            rng: Random source (e.g. a GameRNG sub-stream; None = global random module)
 
         Returns:
             List of (player, is_assisted) tuples
@@ -91,7 +93,8 @@ class TacklerSelector:
             weight_config=cls.RUN_PLAY_WEIGHTS,
             categorize_func=cls._categorize_for_run,
             long_threshold=long_run_threshold,
-            assisted_prob=assisted_tackle_prob
+            assisted_prob=assisted_tackle_prob,
+            rng=rng
         )
 
     @classmethod
@@ -100,7 +103,8 @@ class TacklerSelector:
         yac_yards: int,
         potential_tacklers: List,
         long_yac_threshold: int = 8,
-        assisted_tackle_prob: float = 0.6
+        assisted_tackle_prob: float = 0.6,
+        rng=None
     ) -> List[Tuple]:
         """
         Select tacklers for pass plays (after catch) using NFL-realistic position weights.
@@ -110,6 +114,7 @@ class TacklerSelector:
             potential_tacklers: List of defensive players who could make tackles
             long_yac_threshold: YAC threshold for considering assisted tackles
             assisted_tackle_prob: Probability of assisted tackle on long YAC
+            rng: Random source (None = global random module)
 
         Returns:
             List of (player, is_assisted) tuples
@@ -120,7 +125,8 @@ class TacklerSelector:
             weight_config=cls.PASS_PLAY_WEIGHTS,
             categorize_func=cls._categorize_for_pass,
             long_threshold=long_yac_threshold,
-            assisted_prob=assisted_tackle_prob
+            assisted_prob=assisted_tackle_prob,
+            rng=rng
         )
 
     # ============================================
@@ -135,7 +141,8 @@ class TacklerSelector:
         weight_config: Dict[str, float],
         categorize_func,
         long_threshold: int,
-        assisted_prob: float
+        assisted_prob: float,
+        rng=None
     ) -> List[Tuple]:
         """
         Core tackler selection logic with configurable weights.
@@ -147,6 +154,7 @@ class TacklerSelector:
             categorize_func: Function to categorize players by position
             long_threshold: Yards threshold for assisted tackles
             assisted_prob: Probability of assisted tackle
+            rng: Random source (None = global random module)
 
         Returns:
             List of (player, is_assisted) tuples
@@ -154,23 +162,24 @@ class TacklerSelector:
         if not potential_tacklers:
             return []
 
+        rng = rng or random
         tacklers = []
 
         # More yards = more likely to have assisted tackles
         if yards_gained >= long_threshold:
             # Long play: likely 1 primary tackler + 1 assisted
-            primary_tackler = cls._select_by_weight(potential_tacklers, weight_config, categorize_func)
+            primary_tackler = cls._select_by_weight(potential_tacklers, weight_config, categorize_func, rng)
             tacklers.append((primary_tackler, False))
 
             # Chance of assisted tackle
-            if random.random() < assisted_prob:
+            if rng.random() < assisted_prob:
                 remaining = [p for p in potential_tacklers if p != primary_tackler]
                 if remaining:
-                    assisted_tackler = cls._select_by_weight(remaining, weight_config, categorize_func)
+                    assisted_tackler = cls._select_by_weight(remaining, weight_config, categorize_func, rng)
                     tacklers.append((assisted_tackler, True))
         else:
             # Short play: likely just 1 tackler
-            primary_tackler = cls._select_by_weight(potential_tacklers, weight_config, categorize_func)
+            primary_tackler = cls._select_by_weight(potential_tacklers, weight_config, categorize_func, rng)
             tacklers.append((primary_tackler, False))
 
         return tacklers
@@ -180,7 +189,8 @@ class TacklerSelector:
         cls,
         potential_tacklers: List,
         weight_config: Dict[str, float],
-        categorize_func
+        categorize_func,
+        rng=None
     ):
         """
         Select a single tackler using position-weighted probabilities.
@@ -189,6 +199,7 @@ class TacklerSelector:
             potential_tacklers: List of defensive players
             weight_config: Position category to weight mapping
             categorize_func: Function to categorize players
+            rng: Random source (None = global random module)
 
         Returns:
             Selected player
@@ -196,6 +207,8 @@ class TacklerSelector:
         if not potential_tacklers:
             return None
 
+        rng = rng or random
+
         # Categorize players
         categorized = categorize_func(potential_tacklers)
 
@@ -213,17 +226,17 @@ class TacklerSelector:
 
         # Fallback to uniform if no categorized players
         if not candidates:
-            return random.choice(potential_tacklers)
+            return rng.choice(potential_tacklers)
 
         # Normalize weights to sum to 1.0
         total_weight = sum(weights)
         if total_weight <= 0:
-            return random.choice(potential_tacklers)
+            return rng.choice(potential_tacklers)
 
         normalized_weights = [w / total_weight for w in weights]
 
         # Use weighted random selection
-        return random.choices(candidates, weights=normalized_weights, k=1)[0]
+        return rng.choices(candidates, weights=normalized_weights, k=1)[0]
 
     # ============================================
     # Position Categorization
@@ -87,6 +87,54 @@ class CapCalculator:
             self.db_api.initialize_team_cap(team_id, season, dynasty_id, salary_cap, 0)
             cap_summary = self.db_api.get_team_cap_summary(team_id, season, dynasty_id)
 
+        return self._cap_space_from_summary(cap_summary, roster_mode)
+
+    def calculate_all_team_cap_space(
+        self,
+        team_ids: List[int],
+        season: int,
+        dynasty_id: str,
+        roster_mode: str = "regular_season"
+    ) -> Dict[int, int]:
+        """
+        Calculate available cap space for many teams at once.
+
+        Loads every team's cap summary in one query; teams without a
+        summary fall back to calculate_team_cap_space(), which initializes it.
+
+        Args:
+            team_ids: Team IDs to calculate
+            season: Season year
+            dynasty_id: Dynasty identifier
+            roster_mode: "regular_season" (53-man) or "offseason" (top-51)
+
+        Returns:
+            Dict mapping team_id to available cap space in dollars
+        """
+        summaries = self.db_api.get_team_cap_summaries(season, dynasty_id)
+
+        cap_space = {}
+        for team_id in team_ids:
+            cap_summary = summaries.get(team_id)
+            if cap_summary:
+                cap_space[team_id] = self._cap_space_from_summary(cap_summary, roster_mode)
+            else:
+                cap_space[team_id] = self.calculate_team_cap_space(
+                    team_id, season, dynasty_id, roster_mode
+                )
+        return cap_space
+
+    def _cap_space_from_summary(self, cap_summary: Dict[str, Any], roster_mode: str) -> int:
+        """
+        Apply the cap space formula to a vw_team_cap_summary row.
+
+        Args:
+            cap_summary: Cap summary dict
+            roster_mode: "regular_season" (53-man) or "offseason" (top-51)
+
+        Returns:
+            Available cap space in dollars
+        """
         # Calculate total cap available
         total_cap_available = (
             cap_summary['salary_cap_limit'] +
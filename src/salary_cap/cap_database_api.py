@@ -9,7 +9,8 @@ Provides dynasty-aware CRUD operations for all cap-related tables.
 
 import sqlite3
 import json
-from typing import Dict, List, Any, Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import date, datetime
 from pathlib import Path
 import logging
@@ -32,7 +33,8 @@ class CapDatabaseAPI:
     def __init__(
         self,
         database_path: str = "data/database/nfl_simulation.db",
-        dynasty_id: Optional[str] = None
+        dynasty_id: Optional[str] = None,
+        connection: Optional[sqlite3.Connection] = None
     ):
         """
         Initialize Cap Database API.
@@ -40,9 +42,15 @@ class CapDatabaseAPI:
         Args:
             database_path: Path to SQLite database
             dynasty_id: Optional default dynasty context (can be overridden per method)
+            connection: Optional shared database connection for transaction mode.
+                       If provided, contract creation writes (insert_contract,
+                       insert_contract_year_details, log_transaction) use this
+                       connection (no auto-commit).
+                       If None, operations create their own connections (auto-commit).
         """
         self.database_path = database_path
         self.dynasty_id = dynasty_id
+        self.shared_conn = connection  # Use for transaction mode
         self.logger = logging.getLogger(__name__)
 
         # Ensure database directory exists
@@ -80,6 +88,18 @@ class CapDatabaseAPI:
             self.logger.error(f"Error ensuring schema exists: {e}")
             raise
 
+    @contextmanager
+    def _write_connection(self, foreign_keys: bool = False) -> Iterator[sqlite3.Connection]:
+        """Shared connection (caller commits) or a new auto-committing one."""
+        if self.shared_conn is not None:
+            yield self.shared_conn
+            return
+        with sqlite3.connect(self.database_path) as conn:
+            if foreign_keys:
+                conn.execute("PRAGMA foreign_keys = ON")
+            yield conn
+            conn.commit()
+
     # ========================================================================
     # CONTRACT OPERATIONS
     # ========================================================================
@@ -126,8 +146,7 @@ class CapDatabaseAPI:
         if signed_date is None:
             signed_date = date.today()
 
-        with sqlite3.connect(self.database_path) as conn:
-            conn.execute("PRAGMA foreign_keys = ON")
+        with self._write_connection(foreign_keys=True) as conn:
             cursor = conn.execute('''
                 INSERT INTO player_contracts (
                     player_id, team_id, dynasty_id,
@@ -143,7 +162,6 @@ class CapDatabaseAPI:
                 guaranteed_at_signing, injury_guaranteed, total_guaranteed,
                 signed_date
             ))
-            conn.commit()
             return cursor.lastrowid
 
     def insert_contract_year_details(
@@ -182,7 +200,7 @@ class CapDatabaseAPI:
         Returns:
             detail_id of inserted record
         """
-        with sqlite3.connect(self.database_path) as conn:
+        with self._write_connection() as conn:
             cursor = conn.execute('''
                 INSERT INTO contract_year_details (
                     contract_id, contract_year, season_year,
@@ -200,7 +218,6 @@ class CapDatabaseAPI:
                 signing_bonus_proration, option_bonus_proration,
                 total_cap_hit, cash_paid, is_voided
             ))
-            conn.commit()
             return cursor.lastrowid
 
     def get_contract(self, contract_id: int) -> Optional[Dict[str, Any]]:
@@ -668,6 +685,30 @@ class CapDatabaseAPI:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def get_team_cap_summaries(
+        self,
+        season: int,
+        dynasty_id: str
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get cap summaries for every team in one query.
+
+        Args:
+            season: Season year
+            dynasty_id: Dynasty identifier
+
+        Returns:
+            Dict mapping team_id to cap summary dict (teams without a
+            team_salary_cap record are missing)
+        """
+        with sqlite3.connect(self.database_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute('''
+                SELECT * FROM vw_team_cap_summary
+                WHERE season = ? AND dynasty_id = ?
+            ''', (season, dynasty_id))
+            return {row['team_id']: dict(row) for row in cursor.fetchall()}
+
     def get_team_cap(
         self,
         team_id: int,
@@ -948,7 +989,7 @@ class CapDatabaseAPI:
         """
         cap_impact_future_json = json.dumps(cap_impact_future) if cap_impact_future else None
 
-        with sqlite3.connect(self.database_path) as conn:
+        with self._write_connection() as conn:
             cursor = conn.execute('''
                 INSERT INTO cap_transactions (
                     team_id, season, dynasty_id,
@@ -966,7 +1007,6 @@ class CapDatabaseAPI:
                 cash_impact, dead_money_created,
                 description
             ))
-            conn.commit()
             return cursor.lastrowid
 
     def get_team_transactions(
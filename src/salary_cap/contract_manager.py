@@ -15,6 +15,7 @@ Supports:
 from typing import List, Dict, Any, Optional
 from datetime import date
 import logging
+import sqlite3
 
 from .cap_calculator import CapCalculator
 from .cap_database_api import CapDatabaseAPI
@@ -33,14 +34,21 @@ class ContractManager:
     Integrates CapCalculator for formulas and CapDatabaseAPI for persistence.
     """
 
-    def __init__(self, database_path: str = "data/database/nfl_simulation.db"):
+    def __init__(
+        self,
+        database_path: str = "data/database/nfl_simulation.db",
+        connection: Optional[sqlite3.Connection] = None
+    ):
         """
         Initialize Contract Manager.
 
         Args:
             database_path: Path to database
+            connection: Optional shared database connection for transaction mode.
+                       If provided, contracts are created on this connection
+                       (no auto-commit; the caller commits or rolls back).
         """
-        self.db_api = CapDatabaseAPI(database_path)
+        self.db_api = CapDatabaseAPI(database_path, connection=connection)
         self.calculator = CapCalculator(database_path)
         self.logger = logging.getLogger(__name__)
 
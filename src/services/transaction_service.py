@@ -122,6 +122,7 @@ class TransactionService:
         )
 
         if not is_allowed:
+            self.transaction_ai.end_trade_window()
             print(f"[AI_TRANSACTION_REQUEST] Exiting - trades not allowed\n")
             return []
 
@@ -132,6 +133,13 @@ class TransactionService:
         try:
             current_date = self.calendar.get_current_date()
 
+            # One league-wide player/contract index for all 32 searches
+            try:
+                self.transaction_ai.begin_trade_window(self.season_year)
+            except Exception as e:
+                self.logger.warning(f"[AI_TRANSACTION_REQUEST] Asset index unavailable, scanning rosters: {e}")
+                self.transaction_ai.end_trade_window()
+
             # Evaluate all 32 teams
             print("[AI_TRANSACTION_REQUEST] Evaluating all 32 teams for trade opportunities...")
             self.logger.info("[AI_TRANSACTION_REQUEST] Evaluating all 32 teams for trade opportunities")
@@ -193,6 +201,7 @@ class TransactionService:
                         if trade_result['success']:
                             # Track these players as traded
                             traded_players.update(all_proposal_players)
+                            self.transaction_ai.refresh_assets(list(all_proposal_players))
 
                             executed_trades.append(trade_result['trade_details'])
                             print(f"[AI_TRANSACTION_REQUEST] ✅ TRADE EXECUTED: Team {proposal.team1_id} ↔ Team {proposal.team2_id}")
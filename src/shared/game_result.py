@@ -40,6 +40,7 @@ class GameResult:
     away_team_stats: Optional[Any] = None  # Away team stats for store compatibility
     overtime_periods: int = 0  # Overtime periods for store compatibility
     weather_conditions: Optional[Any] = None  # Weather conditions for store compatibility
+    play_phase_profile: Optional[Any] = None  # PlayPhaseReport when the game was profiled
     
     def __post_init__(self):
         """Auto-populate compatible fields if not provided"""
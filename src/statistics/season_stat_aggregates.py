@@ -0,0 +1,488 @@
+"""
+Season Stat Aggregates - Materialized season totals and ranks for StatsAPI.
+
+StatsAPI used to re-aggregate every player_game_stats row of a season and
+re-rank the whole league in Python for each ranking call. This module keeps
+that work in tables that are updated once per simulated week:
+
+- season_player_stat_totals: one row per player/team/position per season
+  (the grouping StatsAPI has always returned), with conference/division
+- season_player_stat_ranks: league, conference and division rank plus
+  percentile for every RANKED_CATEGORIES stat
+- season_team_stat_totals: team totals for teams 1-32 with passing,
+  rushing and offensive ranks
+- season_stat_aggregate_games: ledger of every game already added with its
+  stats version (row count and newest player_game_stats id), so a game is
+  never counted twice and replaced stats are noticed
+
+The tables are created by the game cycle schema (schema.sql). They are
+written only by the persistence paths: WeekPersistenceBatch refreshes the
+season in the week's transaction and UnifiedDatabaseAPI.stats_insert_game_stats()
+adds the games it writes (playoffs). GameCycleDatabase backfills seasons
+simulated before the tables existed; reads never update them.
+
+Totals are updated incrementally (apply_games) by adding the new games'
+sums with an UPSERT; ranks are recomputed with SQL window functions from the
+totals, so their cost grows with the number of players, not games played.
+A game whose stats were replaced (re-simulated) cannot have its old sums
+subtracted, so its season is rebuilt.
+
+Usage:
+    aggregates = SeasonStatAggregates(dynasty_id)
+    aggregates.apply_games(conn, season, "regular_season", game_ids)
+    aggregates.refresh(conn, season)
+    rank = aggregates.get_player_rank(conn, player_id, season, "passing_yards")
+"""
+
+import logging
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from team_management.teams.team_loader import get_team_by_id
+
+logger = logging.getLogger(__name__)
+
+
+# (aggregate column, player_game_stats column) - names match StatsAPI output
+STAT_COLUMNS = (
+    ('passing_yards', 'passing_yards'),
+    ('passing_touchdowns', 'passing_tds'),
+    ('passing_completions', 'passing_completions'),
+    ('passing_attempts', 'passing_attempts'),
+    ('passing_interceptions', 'passing_interceptions'),
+    ('rushing_yards', 'rushing_yards'),
+    ('rushing_touchdowns', 'rushing_tds'),
+    ('rushing_attempts', 'rushing_attempts'),
+    ('receiving_yards', 'receiving_yards'),
+    ('receiving_touchdowns', 'receiving_tds'),
+    ('receptions', 'receptions'),
+    ('targets', 'targets'),
+    ('tackles_total', 'tackles_total'),
+    ('sacks', 'sacks'),
+    ('interceptions', 'interceptions'),
+    ('field_goals_made', 'field_goals_made'),
+    ('field_goals_attempted', 'field_goals_attempted'),
+    ('extra_points_made', 'extra_points_made'),
+    ('extra_points_attempted', 'extra_points_attempted'),
+)
+
+# Stat categories with precomputed ranks
+RANKED_CATEGORIES = tuple(column for column, _ in STAT_COLUMNS)
+
+# StatsAPI team aggregates cover the 32 league teams
+TEAM_IDS = range(1, 33)
+
+# Keeps IN (...) lists under SQLite's host parameter limit
+_GAME_CHUNK_SIZE = 400
+
+# Adds the given games' sums to the existing totals
+_APPLY_GAMES_SQL = """
+    INSERT INTO season_player_stat_totals (
+        dynasty_id, season, season_type, player_id, player_name, team_id, position,
+        games, {columns}
+    )
+    SELECT
+        pgs.dynasty_id, g.season, pgs.season_type, pgs.player_id,
+        COALESCE(pgs.player_name, ''), pgs.team_id, COALESCE(pgs.position, ''),
+        COUNT(DISTINCT pgs.game_id), {sums}
+    FROM player_game_stats pgs
+    JOIN games g ON pgs.game_id = g.game_id AND pgs.dynasty_id = g.dynasty_id
+    WHERE pgs.dynasty_id = ?
+        AND g.season = ?
+        AND pgs.season_type = ?
+        AND pgs.game_id IN ({{placeholders}})
+    GROUP BY pgs.player_id, pgs.player_name, pgs.team_id, pgs.position
+    ON CONFLICT(dynasty_id, season, season_type, player_id, player_name, team_id, position)
+    DO UPDATE SET games = games + excluded.games, {updates}
+""".format(
+    columns=", ".join(column for column, _ in STAT_COLUMNS),
+    sums=", ".join(f"COALESCE(SUM(pgs.{source}), 0)" for _, source in STAT_COLUMNS),
+    updates=", ".join(f"{column} = {column} + excluded.{column}" for column, _ in STAT_COLUMNS),
+)
+
+# Stats version of each game: stat rows and newest row id. player_game_stats
+# ids are AUTOINCREMENT, so replacing a game's stats always changes it.
+_GAME_VERSIONS_SQL = """
+    SELECT g.game_id, COUNT(pgs.id), COALESCE(MAX(pgs.id), 0)
+    FROM games g
+    LEFT JOIN player_game_stats pgs
+        ON pgs.dynasty_id = g.dynasty_id
+        AND pgs.game_id = g.game_id
+        AND pgs.season_type = ?
+    WHERE g.dynasty_id = ? AND g.season = ? AND {game_filter}
+    GROUP BY g.game_id
+"""
+
+# Same tie handling as statistics.rankings (1, 1, 3) and get_percentile()
+_RANKS_SQL = """
+    INSERT INTO season_player_stat_ranks (
+        totals_id, dynasty_id, season, season_type, stat_category, stat_value,
+        league_rank, conference_rank, division_rank, percentile
+    )
+    SELECT
+        id, dynasty_id, season, season_type, ?, {column},
+        RANK() OVER (ORDER BY {column} DESC),
+        CASE WHEN conference IS NULL THEN NULL
+             ELSE RANK() OVER (PARTITION BY conference ORDER BY {column} DESC) END,
+        CASE WHEN division IS NULL THEN NULL
+             ELSE RANK() OVER (PARTITION BY division ORDER BY {column} DESC) END,
+        (RANK() OVER (ORDER BY {column}) - 1) * 100.0 / COUNT(*) OVER ()
+    FROM season_player_stat_totals
+    WHERE dynasty_id = ? AND season = ? AND season_type = ?
+"""
+
+# Team totals for teams 1-32; ranks keep team_id order on ties like StatsAPI's stable sorts
+_TEAM_TOTALS_SQL = """
+    INSERT INTO season_team_stat_totals (
+        dynasty_id, season, season_type, team_id,
+        total_passing_yards, total_passing_tds, total_rushing_yards, total_rushing_tds,
+        total_receiving_yards, total_receiving_tds, total_points_scored,
+        player_count, games, passing_rank, rushing_rank, offensive_rank
+    )
+    SELECT
+        ?, ?, ?, team_id,
+        passing_yards, passing_tds, rushing_yards, rushing_tds,
+        receiving_yards, receiving_tds, (passing_tds + rushing_tds + receiving_tds) * 6,
+        player_count, games,
+        ROW_NUMBER() OVER (ORDER BY passing_yards DESC, team_id),
+        ROW_NUMBER() OVER (ORDER BY rushing_yards DESC, team_id),
+        ROW_NUMBER() OVER (ORDER BY passing_yards + rushing_yards DESC, team_id)
+    FROM (
+        SELECT
+            t.team_id,
+            COALESCE(SUM(p.passing_yards), 0) AS passing_yards,
+            COALESCE(SUM(p.passing_touchdowns), 0) AS passing_tds,
+            COALESCE(SUM(p.rushing_yards), 0) AS rushing_yards,
+            COALESCE(SUM(p.rushing_touchdowns), 0) AS rushing_tds,
+            COALESCE(SUM(p.receiving_yards), 0) AS receiving_yards,
+            COALESCE(SUM(p.receiving_touchdowns), 0) AS receiving_tds,
+            COUNT(p.id) AS player_count,
+            COALESCE(MAX(p.games), 0) AS games
+        FROM ({team_ids}) t
+        LEFT JOIN season_player_stat_totals p
+            ON p.team_id = t.team_id
+            AND p.dynasty_id = ? AND p.season = ? AND p.season_type = ?
+        GROUP BY t.team_id
+    )
+""".format(team_ids=" UNION ALL ".join(f"SELECT {team_id} AS team_id" for team_id in TEAM_IDS))
+
+
+class SeasonStatAggregates:
+    """
+    Materialized season totals and ranks for one dynasty.
+
+    All methods take an open sqlite3 connection and never commit, so the
+    updates can join the caller's transaction (e.g. a week's persistence
+    batch).
+    """
+
+    def __init__(self, dynasty_id: str):
+        """
+        Initialize aggregates for a dynasty.
+
+        Args:
+            dynasty_id: Dynasty identifier for data isolation
+        """
+        self.dynasty_id = dynasty_id
+
+    # -------------------- Updates --------------------
+
+    def apply_games(
+        self,
+        conn: Any,
+        season: int,
+        season_type: str,
+        game_ids: Iterable[str]
+    ) -> int:
+        """
+        Add games' player stats to the season totals and re-rank the season.
+
+        Every game found in the games table is recorded, with or without
+        stat rows. Games already recorded with the same stats are skipped,
+        so calling this twice for a game does not double count it; a game
+        whose stats changed since it was recorded rebuilds the season.
+
+        Args:
+            conn: Open database connection
+            season: Season year of the games
+            season_type: "regular_season" or "playoffs"
+            game_ids: Games whose results/player_game_stats rows were written
+
+        Returns:
+            Number of games added
+        """
+        game_ids = list(dict.fromkeys(game_ids))
+        if not game_ids:
+            return 0
+
+        versions = {}
+        for start in range(0, len(game_ids), _GAME_CHUNK_SIZE):
+            chunk = game_ids[start:start + _GAME_CHUNK_SIZE]
+            versions.update(self._game_versions(
+                conn, season, season_type, f"g.game_id IN ({','.join('?' * len(chunk))})", chunk
+            ))
+        return self._update(conn, season, season_type, versions)
+
+    def refresh(self, conn: Any, season: int, season_type: str = "regular_season") -> int:
+        """
+        Bring a season's aggregates up to date with its games.
+
+        Adds games not recorded yet and rebuilds the season if a recorded
+        game's stats were replaced. Only the season's games and their stat
+        rows are read (the player_game_stats index on dynasty/game).
+
+        Args:
+            conn: Open database connection
+            season: Season year
+            season_type: "regular_season" or "playoffs"
+
+        Returns:
+            Number of games added
+        """
+        versions = self._game_versions(conn, season, season_type, "g.season_type = ?", [season_type])
+        return self._update(conn, season, season_type, versions)
+
+    def rebuild(self, conn: Any, season: int, season_type: str = "regular_season") -> int:
+        """
+        Drop a season's aggregates and rebuild them from player_game_stats.
+
+        Args:
+            conn: Open database connection
+            season: Season year
+            season_type: "regular_season" or "playoffs"
+
+        Returns:
+            Number of games aggregated
+        """
+        params = (self.dynasty_id, season, season_type)
+        for table in (
+            "season_player_stat_ranks", "season_player_stat_totals",
+            "season_team_stat_totals", "season_stat_aggregate_games"
+        ):
+            conn.execute(
+                f"DELETE FROM {table} WHERE dynasty_id = ? AND season = ? AND season_type = ?",
+                params
+            )
+        return self.refresh(conn, season, season_type)
+
+    def _update(
+        self,
+        conn: Any,
+        season: int,
+        season_type: str,
+        versions: Dict[str, Tuple[int, int]]
+    ) -> int:
+        """Add the unrecorded games of versions, or rebuild if a recorded game changed."""
+        if not versions:
+            return 0
+
+        recorded = {
+            game_id: (stats_rows, stats_version)
+            for game_id, stats_rows, stats_version in conn.execute("""
+                SELECT game_id, stats_rows, stats_version FROM season_stat_aggregate_games
+                WHERE dynasty_id = ? AND season = ? AND season_type = ?
+            """, (self.dynasty_id, season, season_type))
+        }
+        changed = [
+            game_id for game_id, version in versions.items()
+            if game_id in recorded and recorded[game_id] != version
+        ]
+        if changed:
+            logger.info(
+                "Stats replaced for %d %s %d games, rebuilding season aggregates",
+                len(changed), season_type, season
+            )
+            return self.rebuild(conn, season, season_type)
+
+        new_games = [game_id for game_id in versions if game_id not in recorded]
+        if not new_games:
+            return 0
+
+        for start in range(0, len(new_games), _GAME_CHUNK_SIZE):
+            chunk = new_games[start:start + _GAME_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            conn.execute(
+                _APPLY_GAMES_SQL.format(placeholders=placeholders),
+                (self.dynasty_id, season, season_type, *chunk)
+            )
+        conn.executemany("""
+            INSERT INTO season_stat_aggregate_games (
+                dynasty_id, game_id, season_type, season, stats_rows, stats_version
+            ) VALUES (?, ?, ?, ?, ?, ?)
+        """, [
+            (self.dynasty_id, game_id, season_type, season, *versions[game_id])
+            for game_id in new_games
+        ])
+
+        self._assign_divisions(conn, season, season_type)
+        self.refresh_rankings(conn, season, season_type)
+        logger.debug("Added %d games to %s %d season aggregates", len(new_games), season_type, season)
+        return len(new_games)
+
+    def _game_versions(
+        self,
+        conn: Any,
+        season: int,
+        season_type: str,
+        game_filter: str,
+        filter_params: List[Any]
+    ) -> Dict[str, Tuple[int, int]]:
+        """(stat rows, newest stat row id) per game of the season matching game_filter."""
+        rows = conn.execute(
+            _GAME_VERSIONS_SQL.format(game_filter=game_filter),
+            (season_type, self.dynasty_id, season, *filter_params)
+        ).fetchall()
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    def refresh_rankings(self, conn: Any, season: int, season_type: str) -> None:
+        """
+        Recompute player ranks and team totals/ranks from the season totals.
+
+        Args:
+            conn: Open database connection
+            season: Season year
+            season_type: "regular_season" or "playoffs"
+        """
+        params = (self.dynasty_id, season, season_type)
+        conn.execute(
+            "DELETE FROM season_player_stat_ranks WHERE dynasty_id = ? AND season = ? AND season_type = ?",
+            params
+        )
+        for category in RANKED_CATEGORIES:
+            conn.execute(_RANKS_SQL.format(column=category), (category, *params))
+
+        conn.execute(
+            "DELETE FROM season_team_stat_totals WHERE dynasty_id = ? AND season = ? AND season_type = ?",
+            params
+        )
+        conn.execute(_TEAM_TOTALS_SQL, (*params, *params))
+
+    def _assign_divisions(self, conn: Any, season: int, season_type: str) -> None:
+        """Fill conference/division for new rows (as statistics.rankings looks them up)."""
+        rows = conn.execute("""
+            SELECT DISTINCT team_id FROM season_player_stat_totals
+            WHERE dynasty_id = ? AND season = ? AND season_type = ? AND conference IS NULL
+        """, (self.dynasty_id, season, season_type)).fetchall()
+
+        updates = []
+        for (team_id,) in rows:
+            team = get_team_by_id(team_id)
+            if team is not None:
+                updates.append((team.conference, team.division, self.dynasty_id, season, season_type, team_id))
+        if updates:
+            conn.executemany("""
+                UPDATE season_player_stat_totals SET conference = ?, division = ?
+                WHERE dynasty_id = ? AND season = ? AND season_type = ? AND team_id = ?
+            """, updates)
+
+    # -------------------- Queries --------------------
+
+    def get_player_totals(
+        self,
+        conn: Any,
+        season: int,
+        season_type: str = "regular_season"
+    ) -> List[Dict[str, Any]]:
+        """
+        Get every player's season totals.
+
+        Args:
+            conn: Open database connection
+            season: Season year
+            season_type: "regular_season" or "playoffs"
+
+        Returns:
+            Player stat dictionaries in the format of StatsAPI._get_all_player_stats()
+        """
+        return _query_dicts(conn, f"""
+            SELECT player_id, NULLIF(player_name, '') AS player_name, team_id,
+                   NULLIF(position, '') AS position, games,
+                   {", ".join(RANKED_CATEGORIES)}
+            FROM season_player_stat_totals
+            WHERE dynasty_id = ? AND season = ? AND season_type = ?
+            ORDER BY id
+        """, (self.dynasty_id, season, season_type))
+
+    def get_player_rank(
+        self,
+        conn: Any,
+        player_id: str,
+        season: int,
+        stat_category: str,
+        season_type: str = "regular_season"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a player's precomputed rank in a stat category.
+
+        Args:
+            conn: Open database connection
+            player_id: Player identifier
+            season: Season year
+            stat_category: One of RANKED_CATEGORIES
+            season_type: "regular_season" or "playoffs"
+
+        Returns:
+            Dict with stat_value, league_rank, conference_rank, division_rank
+            and percentile, or None if the player has no stats
+        """
+        rows = _query_dicts(conn, """
+            SELECT r.stat_value, r.league_rank, r.conference_rank, r.division_rank, r.percentile
+            FROM season_player_stat_totals t
+            JOIN season_player_stat_ranks r ON r.totals_id = t.id AND r.stat_category = ?
+            WHERE t.dynasty_id = ? AND t.season = ? AND t.season_type = ? AND t.player_id = ?
+            ORDER BY t.id
+            LIMIT 1
+        """, (stat_category, self.dynasty_id, season, season_type, player_id))
+        return rows[0] if rows else None
+
+    def get_team_totals(
+        self,
+        conn: Any,
+        season: int,
+        season_type: str = "regular_season",
+        team_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get team totals and ranks (teams 1-32, ordered by team_id).
+
+        Args:
+            conn: Open database connection
+            season: Season year
+            season_type: "regular_season" or "playoffs"
+            team_id: Optional single team
+
+        Returns:
+            Team total dictionaries (aggregate_team_stats() keys plus
+            passing_rank, rushing_rank and offensive_rank)
+        """
+        query = """
+            SELECT team_id, total_passing_yards, total_passing_tds, total_rushing_yards,
+                   total_rushing_tds, total_receiving_yards, total_receiving_tds,
+                   total_points_scored, player_count, games,
+                   passing_rank, rushing_rank, offensive_rank
+            FROM season_team_stat_totals
+            WHERE dynasty_id = ? AND season = ? AND season_type = ?
+        """
+        params = [self.dynasty_id, season, season_type]
+        if team_id is not None:
+            query += " AND team_id = ?"
+            params.append(team_id)
+        return _query_dicts(conn, query + " ORDER BY team_id", params)
+
+
+def _query_dicts(conn: Any, query: str, params: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Rows as dicts, whatever the connection's row_factory.
+
+    A database without the game cycle schema has no aggregate tables; it is
+    read as having no aggregated games.
+    """
+    try:
+        cursor = conn.execute(query, tuple(params))
+    except sqlite3.OperationalError as e:
+        if "no such table" not in str(e):
+            raise
+        logger.debug("Season stat aggregates unavailable: %s", e)
+        return []
+    columns = [description[0] for description in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -4,9 +4,11 @@ Main Statistics API for The Owner's Sim
 Central entry point for all statistical queries.
 Provides leader queries, player queries, team queries, and rankings.
 """
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 from database.api import DatabaseAPI
 from statistics.leaderboards import LeaderboardBuilder
+from statistics.season_stat_aggregates import RANKED_CATEGORIES, SeasonStatAggregates
 from statistics.models import (
     PassingStats,
     RushingStats,
@@ -53,6 +55,7 @@ class StatsAPI:
         self.dynasty_id = dynasty_id
         self.db_api = DatabaseAPI(db_path)
         self.leaderboard_builder = LeaderboardBuilder(self.db_api)
+        self.season_aggregates = SeasonStatAggregates(dynasty_id)
         self._cache = {}  # Simple cache for expensive queries
 
     # === LEADER QUERIES (10 methods) ===
@@ -251,23 +254,27 @@ class StatsAPI:
             return {}
 
         # Return first match (should be unique)
-        stat = player_stats[0]
+        return self._add_calculated_metrics(player_stats[0])
 
-        # Add calculated metrics based on position
-        if stat.get('position') == 'QB':
-            stat['passer_rating'] = self._calculate_passer_rating(
-                stat.get('passing_completions', 0),
-                stat.get('passing_attempts', 0),
-                stat.get('passing_yards', 0),
-                stat.get('passing_touchdowns', 0),
-                stat.get('passing_interceptions', 0)
-            )
-            stat['completion_pct'] = (
-                (stat.get('passing_completions', 0) / stat.get('passing_attempts', 1)) * 100
-                if stat.get('passing_attempts', 0) > 0 else 0.0
-            )
+    def get_all_player_season_stats(self, season: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Get complete season statistics for every player in one read.
 
-        return stat
+        Same dicts as get_player_season_stats(), keyed by player_id, for
+        callers that would otherwise call it once per player.
+
+        Args:
+            season: Season year
+
+        Returns:
+            Dict mapping player_id to stats with calculated metrics
+        """
+        season_stats: Dict[str, Dict[str, Any]] = {}
+        for stat in self._get_all_player_stats(season):
+            # First match wins, as in get_player_season_stats()
+            if stat['player_id'] not in season_stats:
+                season_stats[stat['player_id']] = self._add_calculated_metrics(stat)
+        return season_stats
 
     def get_player_career_stats(self, player_id: str) -> Dict[str, Any]:
         """
@@ -492,6 +499,14 @@ class StatsAPI:
                 'percentile': float
             }
         """
+        # Precomputed ranks: one indexed lookup
+        if stat_category in RANKED_CATEGORIES:
+            with self._season_aggregates(season) as conn:
+                rank = self.season_aggregates.get_player_rank(conn, player_id, season, stat_category)
+            if not rank:
+                return {}
+            return {'player_id': player_id, **rank}
+
         # Get all stats
         all_stats = self._get_all_player_stats(season)
 
@@ -533,7 +548,24 @@ class StatsAPI:
         Returns:
             TeamStats dataclass with aggregated stats
         """
-        # Get all player stats
+        with self._season_aggregates(season) as conn:
+            team_totals = self.season_aggregates.get_team_totals(conn, season, team_id=team_id)
+        if team_totals:
+            team_agg = team_totals[0]
+            return TeamStats(
+                team_id=team_id,
+                season=season,
+                dynasty_id=self.dynasty_id,
+                total_passing_yards=team_agg['total_passing_yards'],
+                total_rushing_yards=team_agg['total_rushing_yards'],
+                total_points=team_agg['total_points_scored'],
+                total_points_allowed=0,  # TODO: Add when defensive team stats available
+                total_yards_allowed=0,  # TODO: Add when defensive team stats available
+                offensive_rank=team_agg['offensive_rank'],
+                defensive_rank=None,
+            )
+
+        # Teams outside 1-32 (or seasons without games): aggregate directly
         all_stats = self._get_all_player_stats(season)
 
         # Aggregate for this team
@@ -586,6 +618,16 @@ class StatsAPI:
                 'rushing_rank': int,
             }
         """
+        with self._season_aggregates(season) as conn:
+            team_totals = self.season_aggregates.get_team_totals(conn, season, team_id=team_id)
+        if team_totals:
+            return {
+                'passing_rank': team_totals[0]['passing_rank'],
+                'rushing_rank': team_totals[0]['rushing_rank'],
+                'offensive_rank': team_totals[0]['offensive_rank'],
+                'defensive_rank': None,  # TODO: implement when defensive stats available
+            }
+
         # Get all player stats
         all_stats = self._get_all_player_stats(season)
 
@@ -624,11 +666,10 @@ class StatsAPI:
         Returns:
             List of TeamStats for all teams
         """
-        # Get all player stats
-        all_stats = self._get_all_player_stats(season)
-
-        # Aggregate all teams
-        all_team_aggs = aggregate_all_teams(all_stats)
+        with self._season_aggregates(season) as conn:
+            all_team_aggs = self.season_aggregates.get_team_totals(conn, season)
+        if not all_team_aggs:
+            all_team_aggs = aggregate_all_teams(self._get_all_player_stats(season))
 
         # Convert to TeamStats dataclass
         return [
@@ -1215,7 +1256,7 @@ class StatsAPI:
 
     def _get_all_player_stats(self, season: int, season_type: str = "regular_season") -> List[Dict[str, Any]]:
         """
-        Get all player stats for a season from database.
+        Get all player stats for a season from the materialized season totals.
 
         Args:
             season: Season year to filter stats
@@ -1223,48 +1264,48 @@ class StatsAPI:
 
         Returns:
             List of player stat dictionaries with season-filtered stats
+            (one per player/team/position, as summed from player_game_stats)
         """
-        # Query database for all player game stats
-        # IMPORTANT: Must JOIN with games table to filter by season
-        # Also filter by season_type to separate preseason/regular/playoffs
-        query = '''
-            SELECT
-                pgs.player_id,
-                pgs.player_name,
-                pgs.team_id,
-                pgs.position,
-                COUNT(DISTINCT pgs.game_id) as games,
-                SUM(pgs.passing_yards) as passing_yards,
-                SUM(pgs.passing_tds) as passing_touchdowns,
-                SUM(pgs.passing_completions) as passing_completions,
-                SUM(pgs.passing_attempts) as passing_attempts,
-                SUM(pgs.passing_interceptions) as passing_interceptions,
-                SUM(pgs.rushing_yards) as rushing_yards,
-                SUM(pgs.rushing_tds) as rushing_touchdowns,
-                SUM(pgs.rushing_attempts) as rushing_attempts,
-                SUM(pgs.receiving_yards) as receiving_yards,
-                SUM(pgs.receiving_tds) as receiving_touchdowns,
-                SUM(pgs.receptions) as receptions,
-                SUM(pgs.targets) as targets,
-                SUM(pgs.tackles_total) as tackles_total,
-                SUM(pgs.sacks) as sacks,
-                SUM(pgs.interceptions) as interceptions,
-                SUM(pgs.field_goals_made) as field_goals_made,
-                SUM(pgs.field_goals_attempted) as field_goals_attempted,
-                SUM(pgs.extra_points_made) as extra_points_made,
-                SUM(pgs.extra_points_attempted) as extra_points_attempted
-            FROM player_game_stats pgs
-            JOIN games g ON pgs.game_id = g.game_id AND pgs.dynasty_id = g.dynasty_id
-            WHERE pgs.dynasty_id = ?
-                AND g.season = ?
-                AND pgs.season_type = ?
-            GROUP BY pgs.player_id, pgs.player_name, pgs.team_id, pgs.position
-        '''
+        with self._season_aggregates(season, season_type) as conn:
+            return self.season_aggregates.get_player_totals(conn, season, season_type)
 
-        results = self.db_api.db_connection.execute_query(query, (self.dynasty_id, season, season_type))
+    @contextmanager
+    def _season_aggregates(self, season: int, season_type: str = "regular_season"):
+        """
+        Open a connection for reading the season's aggregates.
+
+        Read-only: the aggregates are kept up to date by the persistence
+        paths (WeekPersistenceBatch, stats_insert_game_stats) when games are
+        written.
+
+        Args:
+            season: Season year
+            season_type: "regular_season" or "playoffs"
+
+        Yields:
+            Open database connection
+        """
+        conn = self.db_api.db_connection.get_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
 
-        # Already converted to list of dicts by execute_query()
-        return results
+    def _add_calculated_metrics(self, stat: Dict[str, Any]) -> Dict[str, Any]:
+        """Add position-based calculated metrics (QB passer rating, completion %) to a stat dict."""
+        if stat.get('position') == 'QB':
+            stat['passer_rating'] = self._calculate_passer_rating(
+                stat.get('passing_completions', 0),
+                stat.get('passing_attempts', 0),
+                stat.get('passing_yards', 0),
+                stat.get('passing_touchdowns', 0),
+                stat.get('passing_interceptions', 0)
+            )
+            stat['completion_pct'] = (
+                (stat.get('passing_completions', 0) / stat.get('passing_attempts', 1)) * 100
+                if stat.get('passing_attempts', 0) > 0 else 0.0
+            )
+        return stat
 
     def _calculate_passer_rating(
         self,
@@ -237,41 +237,86 @@ class TeamRosterGenerator:
         Raises:
             ValueError: If no roster found
         """
+        return cls.roster_from_records(cls.load_roster_records(team_id, dynasty_id, db_path))
+
+    @classmethod
+    def load_roster_records(cls, team_id: int, dynasty_id: str,
+                            db_path: str) -> List[Dict[str, Any]]:
+        """
+        Read a team's active roster and parse its JSON fields.
+
+        The returned records are plain data, so callers may keep them
+        (e.g. TeamDataCache) and build fresh Player objects from them with
+        roster_from_records().
+
+        Args:
+            team_id: Team ID (1-32)
+            dynasty_id: Dynasty context
+            db_path: Database path
+
+        Returns:
+            List of records with the Player constructor fields plus
+            depth_chart_order, sorted starters first
+        """
         from database.player_roster_api import PlayerRosterAPI
 
         roster_api = PlayerRosterAPI(db_path)
         roster_data = roster_api.get_team_roster(dynasty_id, team_id)
 
-        # Convert database records to Player objects
-        roster = []
+        records = []
         for row in roster_data:
             # Parse JSON fields
             positions = json.loads(row['positions'])
             attributes = json.loads(row['attributes'])
 
-            # Create Player object with database player_id preserved
-            player = Player(
-                name=f"{row['first_name']} {row['last_name']}",
-                number=row['number'],
-                primary_position=positions[0] if positions else Position.WR,
-                ratings=attributes,
-                team_id=row['team_id'],
-                player_id=row['player_id']  # Preserve stable database player_id
-            )
-
-            # Add depth_chart_order attribute (loaded from database)
             # sqlite3.Row doesn't have .get() method, use try/except for column access
             try:
-                player.depth_chart_order = row['depth_chart_order']
+                depth_chart_order = row['depth_chart_order']
             except (KeyError, IndexError):
-                player.depth_chart_order = 99  # Default if column doesn't exist
+                depth_chart_order = 99  # Default if column doesn't exist
+
+            records.append({
+                'name': f"{row['first_name']} {row['last_name']}",
+                'number': row['number'],
+                'primary_position': positions[0] if positions else Position.WR,
+                'ratings': attributes,
+                'team_id': row['team_id'],
+                'player_id': row['player_id'],  # Preserve stable database player_id
+                'depth_chart_order': depth_chart_order,
+            })
+
+        # Sort by depth_chart_order so starters are processed first
+        # This ensures snap tracking assigns snaps to starters, not backups
+        records.sort(key=lambda r: r['depth_chart_order'])
 
-            roster.append(player)
+        return records
 
-        # Sort roster by depth_chart_order so starters are processed first
-        # This ensures snap tracking assigns snaps to starters, not backups
-        roster.sort(key=lambda p: (getattr(p, 'depth_chart_order', 99), -getattr(p, 'overall', 0)))
+    @classmethod
+    def roster_from_records(cls, records: List[Dict[str, Any]]) -> List[Player]:
+        """
+        Build Player objects from roster records.
 
+        Each player gets its own copy of the ratings dict, so records can be
+        reused for any number of games.
+
+        Args:
+            records: Records from load_roster_records()
+
+        Returns:
+            List of Player objects in record order
+        """
+        roster = []
+        for record in records:
+            player = Player(
+                name=record['name'],
+                number=record['number'],
+                primary_position=record['primary_position'],
+                ratings=dict(record['ratings']),
+                team_id=record['team_id'],
+                player_id=record['player_id']
+            )
+            player.depth_chart_order = record['depth_chart_order']
+            roster.append(player)
         return roster
     
     @classmethod
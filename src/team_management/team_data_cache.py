@@ -0,0 +1,235 @@
+"""
+Team Data Cache - Season-scoped rosters and coaching staff for game simulation.
+
+Every FULL-mode game used to load both rosters from the database (a new
+PlayerRosterAPI connection plus json.loads of every player's positions and
+attributes) and re-read team_coaching_styles.json and three coach JSON files
+per team. Rosters only change through transactions and injuries, so one load
+per team per season is enough.
+
+TeamDataCache keeps, per (database, dynasty):
+
+- Roster records: parsed roster rows (TeamRosterGenerator.load_roster_records).
+  Every get_roster() call builds fresh Player objects from them, so a game
+  can never leak state into the next one. INSTANT mode rates teams from the
+  same records (get_roster_records).
+- Coaching staff configs (load_coaching_staff_config), shared read-only.
+
+Entries are dropped when the season changes, and explicitly through
+invalidate_team_data(), which roster transactions (signings, releases, trades,
+waivers, IR moves, depth chart edits, attribute changes) and injuries call
+after they write. Each call bumps team_data_generation(), so caches in other
+processes (GameSimulationPool workers) can tell they are out of date.
+
+Usage:
+    cache = get_team_data_cache(db_path, dynasty_id)
+    roster = cache.get_roster(team_id, season=2025)
+    staff = cache.get_coaching_staff(team_id, season=2025)
+
+    # After a roster write
+    invalidate_team_data(dynasty_id, team_id, db_path=db_path)
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class TeamDataCache:
+    """
+    Rosters and coaching staff configs for one dynasty, scoped to a season.
+
+    Thread-safe: games simulated on worker threads share one cache.
+    """
+
+    def __init__(self, db_path: str, dynasty_id: str):
+        """
+        Initialize an empty cache.
+
+        Args:
+            db_path: Path to the game cycle database
+            dynasty_id: Dynasty whose rosters are cached
+        """
+        self.db_path = db_path
+        self.dynasty_id = dynasty_id
+        self.season: Optional[int] = None
+        self._roster_records: Dict[int, List[Dict[str, Any]]] = {}
+        self._coaching_staff: Dict[int, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+
+    def _enter_season(self, season: Optional[int]) -> None:
+        """Drop every entry when a different season is requested."""
+        if season is not None and season != self.season:
+            if self.season is not None:
+                logger.debug("Team data cache for %s reset for season %s", self.dynasty_id, season)
+            self._roster_records.clear()
+            self._coaching_staff.clear()
+            self.season = season
+
+    def get_roster(self, team_id: int, season: Optional[int] = None) -> List[Any]:
+        """
+        Get a team's active roster, loading it from the database on first use.
+
+        Args:
+            team_id: Team ID (1-32)
+            season: Season being simulated (a new season empties the cache)
+
+        Returns:
+            Fresh list of Player objects, starters first
+        """
+        from team_management.personnel import TeamRosterGenerator
+
+        return TeamRosterGenerator.roster_from_records(self.get_roster_records(team_id, season))
+
+    def get_roster_records(self, team_id: int, season: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get a team's parsed roster records, loading them on first use.
+
+        A new list is loaded after the team is invalidated, so callers may
+        key derived data (e.g. team ratings) on the list's identity.
+
+        Args:
+            team_id: Team ID (1-32)
+            season: Season being simulated (a new season empties the cache)
+
+        Returns:
+            Roster records (shared, do not modify), starters first
+        """
+        from team_management.personnel import TeamRosterGenerator
+
+        with self._lock:
+            self._enter_season(season)
+            records = self._roster_records.get(team_id)
+            if records is None:
+                records = TeamRosterGenerator.load_roster_records(
+                    team_id, self.dynasty_id, self.db_path
+                )
+                self._roster_records[team_id] = records
+            return records
+
+    def get_coaching_staff(self, team_id: int, season: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a team's coaching staff config, reading the JSON files on first use.
+
+        Args:
+            team_id: Team ID (1-32)
+            season: Season being simulated (a new season empties the cache)
+
+        Returns:
+            Coaching staff config dict (shared, do not modify), or None to let
+            FullGameSimulator fall back to its generic staff
+        """
+        with self._lock:
+            self._enter_season(season)
+            if team_id not in self._coaching_staff:
+                from game_management.full_game_simulator import load_coaching_staff_config
+
+                self._coaching_staff[team_id] = load_coaching_staff_config(team_id)
+            return self._coaching_staff[team_id]
+
+    def invalidate(self, team_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            team_ids: Teams to drop, or None for every team
+        """
+        with self._lock:
+            if team_ids is None:
+                self._roster_records.clear()
+                self._coaching_staff.clear()
+                return
+            for team_id in team_ids:
+                self._roster_records.pop(team_id, None)
+                self._coaching_staff.pop(team_id, None)
+
+    def is_cached(self, team_id: int) -> bool:
+        """Check whether a team's roster is currently cached."""
+        return team_id in self._roster_records
+
+
+# One cache per (db_path, dynasty_id), shared by every GameSimulatorService
+_caches: Dict[Tuple[str, str], TeamDataCache] = {}
+_caches_lock = threading.Lock()
+
+# Bumped by every invalidation in this process (see team_data_generation)
+_generation = 0
+
+
+def get_team_data_cache(db_path: str, dynasty_id: str) -> TeamDataCache:
+    """
+    Get the shared cache for a database and dynasty.
+
+    Args:
+        db_path: Path to the game cycle database
+        dynasty_id: Dynasty identifier
+
+    Returns:
+        TeamDataCache (created on first use)
+    """
+    key = (db_path, dynasty_id)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = TeamDataCache(db_path, dynasty_id)
+            _caches[key] = cache
+        return cache
+
+
+def invalidate_team_data(
+    dynasty_id: Optional[str] = None,
+    team_ids: Union[int, Iterable[int], None] = None,
+    db_path: Optional[str] = None
+) -> None:
+    """
+    Invalidation hook for roster transactions and injuries.
+
+    Call after writing to players, team_rosters or the depth chart. Teams
+    that are not cached are ignored, so calling this is always cheap.
+
+    Args:
+        dynasty_id: Dynasty whose rosters changed (None = every dynasty)
+        team_ids: Team ID or IDs that changed (None = every team, for
+            writes where the affected teams are not known)
+        db_path: Database written to (None = every database)
+    """
+    global _generation
+
+    if isinstance(team_ids, int):
+        team_ids = (team_ids,)
+    elif team_ids is not None:
+        team_ids = tuple(team_ids)
+
+    with _caches_lock:
+        _generation += 1
+        caches = [
+            cache for (path, dynasty), cache in _caches.items()
+            if (dynasty_id is None or dynasty == dynasty_id)
+            and (db_path is None or path == db_path)
+        ]
+    for cache in caches:
+        cache.invalidate(team_ids)
+
+
+def clear_team_data_caches() -> None:
+    """Drop every shared cache (tests, dynasty switches)."""
+    global _generation
+
+    with _caches_lock:
+        _generation += 1
+        _caches.clear()
+
+
+def team_data_generation() -> int:
+    """
+    Count of invalidations in this process.
+
+    Worker processes keep their own caches; a changed generation tells them
+    to drop those before the next game.
+
+    Returns:
+        Number of invalidate_team_data()/clear_team_data_caches() calls so far
+    """
+    return _generation
@@ -0,0 +1,474 @@
+"""
+League Asset Index
+
+In-memory index of every tradeable player in the league, built once per
+transaction window and shared by all trade target searches.
+
+Scanning for trade targets used to load all 32 rosters for every team that
+looked for a trade, re-parsing position/attribute JSON and querying the
+contracts table once or twice per player (~1,600 queries per scan). The
+index loads the league in one query:
+
+- One LeagueAsset per player under contract: position, overall, age, cap
+  hit, years remaining and trade value
+- Players sorted by overall within each position, and league-wide by trade
+  value, so "WR, 80+ OVR, cap hit under X" is a range lookup
+- Updated in place as trades, signings and cuts land (move/remove/add, or
+  refresh() to re-read specific players)
+
+Usage:
+    index = LeagueAssetIndex.load(db_path, dynasty_id, season, calculator)
+    targets = index.find(['wide_receiver'], min_overall=80,
+                         max_cap_hit=10_000_000, exclude_team_id=7)
+    index.refresh(traded_player_ids)    # After a trade executes
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+import json
+import logging
+import sqlite3
+
+
+@dataclass
+class LeagueAsset:
+    """
+    One tradeable player.
+
+    Attributes:
+        player_id: Player ID
+        team_id: Current team (1-32)
+        position: Primary position (as stored, e.g. 'wide_receiver')
+        overall: Overall rating
+        age: Age in years (from birthdate when known)
+        cap_hit: Cap hit for the index season
+        years_remaining: Contract years left, including the index season
+        trade_value: Generic trade value (no acquiring team)
+        player: Player dict in the caller's format (for load(), a
+            PlayerRosterAPI.get_team_roster() row with positions/attributes
+            parsed)
+        contract: Active contract dict (adds 'years_remaining', 'aav' and
+            'cap_hit' to the player_contracts row), or None
+    """
+    player_id: int
+    team_id: int
+    position: str
+    overall: int
+    age: int
+    cap_hit: int = 0
+    years_remaining: int = 0
+    trade_value: float = 0.0
+    player: Dict[str, Any] = field(default_factory=dict)
+    contract: Optional[Dict[str, Any]] = None
+
+
+class _SortedIds:
+    """Player IDs kept sorted by a numeric key (ties by player_id)."""
+
+    def __init__(self):
+        self._entries: List[Tuple[float, int]] = []
+
+    def add(self, key: float, player_id: int) -> None:
+        insort(self._entries, (key, player_id))
+
+    def remove(self, key: float, player_id: int) -> None:
+        i = bisect_left(self._entries, (key, player_id))
+        if i < len(self._entries) and self._entries[i] == (key, player_id):
+            del self._entries[i]
+
+    def between(self, low: Optional[float], high: Optional[float]) -> List[int]:
+        """IDs with low <= key <= high, highest key first."""
+        start = 0 if low is None else bisect_left(self._entries, (low, -float('inf')))
+        end = len(self._entries) if high is None else bisect_right(self._entries, (high, float('inf')))
+        return [player_id for _, player_id in reversed(self._entries[start:end])]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# One row per rostered player with an active contract for the season
+_ASSETS_QUERY = """
+    SELECT
+        p.player_id, p.first_name, p.last_name, p.number, p.team_id,
+        p.positions, p.attributes, p.status, p.years_pro, p.birthdate,
+        tr.depth_chart_order,
+        pc.contract_id, pc.start_year, pc.end_year, pc.contract_years,
+        pc.contract_type, pc.total_value, pc.signing_bonus, pc.total_guaranteed,
+        cyd.total_cap_hit
+    FROM players p
+    JOIN team_rosters tr
+        ON tr.dynasty_id = p.dynasty_id
+        AND tr.player_id = p.player_id
+        AND tr.roster_status = 'active'
+    JOIN player_contracts pc
+        ON pc.dynasty_id = p.dynasty_id
+        AND pc.player_id = p.player_id
+        AND pc.team_id = p.team_id
+        AND pc.is_active = 1
+        AND pc.start_year <= ?
+        AND pc.end_year >= ?
+    LEFT JOIN contract_year_details cyd
+        ON cyd.contract_id = pc.contract_id
+        AND cyd.season_year = ?
+    WHERE p.dynasty_id = ?
+        AND p.team_id BETWEEN 1 AND 32
+"""
+
+# Changes when contracts are signed/voided, active rosters change size or
+# players/contracts move between teams (trades write team_id in place)
+_FINGERPRINT_QUERY = """
+    SELECT
+        (SELECT COUNT(*) FROM team_rosters
+         WHERE dynasty_id = ? AND roster_status = 'active'),
+        (SELECT COUNT(*) FROM player_contracts
+         WHERE dynasty_id = ? AND is_active = 1),
+        (SELECT MAX(contract_id) FROM player_contracts WHERE dynasty_id = ?),
+        (SELECT TOTAL(player_id * team_id) FROM players WHERE dynasty_id = ?),
+        (SELECT TOTAL(player_id * team_id) FROM player_contracts
+         WHERE dynasty_id = ? AND is_active = 1)
+"""
+
+
+class LeagueAssetIndex:
+    """
+    Tradeable players of the whole league, indexed for target searches.
+
+    Build with load() (one query) or from LeagueAsset objects. Lookups
+    return LeagueAsset objects; the index is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        assets: Iterable[LeagueAsset] = (),
+        loader: Optional[Callable[[Optional[List[int]]], List[LeagueAsset]]] = None
+    ):
+        """
+        Args:
+            assets: Initial assets
+            loader: Reloads assets from the database (all players when passed
+                None, else the given player IDs); required by refresh()
+        """
+        self._assets: Dict[int, LeagueAsset] = {}
+        self._by_position: Dict[str, _SortedIds] = {}
+        self._by_value = _SortedIds()
+        self._by_team: Dict[int, Set[int]] = {}
+        self._loader = loader
+        self._fingerprint: Optional[Tuple] = None
+        self._fingerprint_fn: Optional[Callable[[], Tuple]] = None
+        self.logger = logging.getLogger("LeagueAssetIndex")
+
+        for asset in assets:
+            self.add(asset)
+
+    @classmethod
+    def load(
+        cls,
+        database_path: str,
+        dynasty_id: str,
+        season: int,
+        calculator: Any = None
+    ) -> 'LeagueAssetIndex':
+        """
+        Load every rostered player with an active contract for the season.
+
+        Args:
+            database_path: Path to SQLite database
+            dynasty_id: Dynasty identifier
+            season: Season contracts must cover
+            calculator: TradeValueCalculator for trade_value (0.0 if None)
+
+        Returns:
+            Populated index (supports refresh() and is_stale())
+        """
+        def loader(player_ids: Optional[List[int]] = None) -> List[LeagueAsset]:
+            return _load_assets(database_path, dynasty_id, season, calculator, player_ids)
+
+        def fingerprint() -> Tuple:
+            with sqlite3.connect(database_path) as conn:
+                return tuple(conn.execute(_FINGERPRINT_QUERY, (dynasty_id,) * 5).fetchone())
+
+        index = cls(loader(), loader=loader)
+        index._fingerprint_fn = fingerprint
+        index._fingerprint = fingerprint()
+        index.logger.info(f"Indexed {len(index)} tradeable players for season {season}")
+        return index
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def find(
+        self,
+        positions: Iterable[str],
+        min_overall: int = 0,
+        max_overall: Optional[int] = None,
+        max_cap_hit: Optional[int] = None,
+        max_age: Optional[int] = None,
+        min_years_remaining: Optional[int] = None,
+        exclude_team_id: Optional[int] = None
+    ) -> List[LeagueAsset]:
+        """
+        Players at the given positions within an overall range.
+
+        Args:
+            positions: Positions to search (index position keys)
+            min_overall: Minimum overall rating (inclusive)
+            max_overall: Maximum overall rating (inclusive)
+            max_cap_hit: Maximum cap hit (inclusive)
+            max_age: Maximum age (inclusive)
+            min_years_remaining: Minimum contract years left
+            exclude_team_id: Skip this team's players (the searching team)
+
+        Returns:
+            Matching assets, highest overall first
+        """
+        matches = []
+        for position in positions:
+            sorted_ids = self._by_position.get(position)
+            if sorted_ids is None:
+                continue
+            for player_id in sorted_ids.between(min_overall, max_overall):
+                asset = self._assets[player_id]
+                if exclude_team_id is not None and asset.team_id == exclude_team_id:
+                    continue
+                if max_cap_hit is not None and asset.cap_hit > max_cap_hit:
+                    continue
+                if max_age is not None and asset.age > max_age:
+                    continue
+                if min_years_remaining is not None and asset.years_remaining < min_years_remaining:
+                    continue
+                matches.append(asset)
+
+        if len(set(positions)) > 1:
+            matches.sort(key=lambda a: (-a.overall, -a.player_id))
+        return matches
+
+    def by_value(
+        self,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        exclude_team_id: Optional[int] = None
+    ) -> List[LeagueAsset]:
+        """
+        Players whose trade value is within a range, highest first.
+
+        Args:
+            min_value: Minimum trade value (inclusive)
+            max_value: Maximum trade value (inclusive)
+            exclude_team_id: Skip this team's players
+
+        Returns:
+            Matching assets
+        """
+        return [
+            self._assets[player_id]
+            for player_id in self._by_value.between(min_value, max_value)
+            if exclude_team_id is None or self._assets[player_id].team_id != exclude_team_id
+        ]
+
+    def team_assets(self, team_id: int) -> List[LeagueAsset]:
+        """A team's indexed players, highest overall first."""
+        assets = [self._assets[player_id] for player_id in self._by_team.get(team_id, ())]
+        assets.sort(key=lambda a: (-a.overall, a.player_id))
+        return assets
+
+    def get(self, player_id: int) -> Optional[LeagueAsset]:
+        """Asset for a player, or None if not indexed."""
+        return self._assets.get(player_id)
+
+    def positions(self) -> List[str]:
+        """Positions with at least one indexed player."""
+        return [position for position, ids in self._by_position.items() if len(ids)]
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._assets
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def add(self, asset: LeagueAsset) -> None:
+        """Index a player (replaces any existing entry, e.g. after a signing)."""
+        self.remove(asset.player_id)
+        self._assets[asset.player_id] = asset
+        self._by_position.setdefault(asset.position, _SortedIds()).add(asset.overall, asset.player_id)
+        self._by_value.add(asset.trade_value, asset.player_id)
+        self._by_team.setdefault(asset.team_id, set()).add(asset.player_id)
+
+    def remove(self, player_id: int) -> Optional[LeagueAsset]:
+        """Drop a player (cut, retired, contract voided). Returns the old asset."""
+        asset = self._assets.pop(player_id, None)
+        if asset is None:
+            return None
+        self._by_position[asset.position].remove(asset.overall, player_id)
+        self._by_value.remove(asset.trade_value, player_id)
+        self._by_team[asset.team_id].discard(player_id)
+        return asset
+
+    def move(self, player_id: int, team_id: int) -> None:
+        """Record a player changing teams (contract carried over)."""
+        asset = self._assets.get(player_id)
+        if asset is None or asset.team_id == team_id:
+            return
+        self._by_team[asset.team_id].discard(player_id)
+        self._by_team.setdefault(team_id, set()).add(player_id)
+        asset.team_id = team_id
+        if 'team_id' in asset.player:
+            asset.player['team_id'] = team_id
+        if asset.contract is not None:
+            asset.contract['team_id'] = team_id
+
+    def apply_trade(
+        self,
+        team1_id: int,
+        team1_player_ids: Iterable[int],
+        team2_id: int,
+        team2_player_ids: Iterable[int]
+    ) -> None:
+        """Swap traded players between two teams."""
+        for player_id in team1_player_ids:
+            self.move(player_id, team2_id)
+        for player_id in team2_player_ids:
+            self.move(player_id, team1_id)
+
+    def refresh(self, player_ids: Iterable[int]) -> None:
+        """
+        Re-read players from the database (after trades, signings or cuts).
+
+        Players no longer rostered under contract are removed.
+
+        Raises:
+            RuntimeError: If the index was not built with load()
+        """
+        if self._loader is None:
+            raise RuntimeError("LeagueAssetIndex.refresh() requires an index built with load()")
+
+        player_ids = list(player_ids)
+        for player_id in player_ids:
+            self.remove(player_id)
+        for asset in self._loader(player_ids):
+            self.add(asset)
+        if self._fingerprint_fn is not None:
+            self._fingerprint = self._fingerprint_fn()
+
+    def is_stale(self) -> bool:
+        """
+        Whether rosters or contracts changed outside refresh().
+
+        Compares active roster/contract counts, the newest contract ID and
+        player/contract team ownership with the values seen at load() or the
+        last refresh(). Always False
+        for indexes not built with load().
+        """
+        if self._fingerprint_fn is None:
+            return False
+        return self._fingerprint_fn() != self._fingerprint
+
+
+def _load_assets(
+    database_path: str,
+    dynasty_id: str,
+    season: int,
+    calculator: Any,
+    player_ids: Optional[List[int]] = None
+) -> List[LeagueAsset]:
+    """Run _ASSETS_QUERY and build LeagueAsset objects."""
+    query = _ASSETS_QUERY
+    params: List[Any] = [season, season, season, dynasty_id]
+    if player_ids is not None:
+        if not player_ids:
+            return []
+        query += f" AND p.player_id IN ({','.join('?' * len(player_ids))})"
+        params.extend(player_ids)
+    query += " ORDER BY p.team_id, tr.depth_chart_order, pc.contract_id DESC"
+
+    with sqlite3.connect(database_path) as conn:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(query, params).fetchall()
+
+    assets = []
+    seen: Set[int] = set()
+    for row in rows:
+        if row['player_id'] in seen:
+            continue  # Newest of several active contracts
+        seen.add(row['player_id'])
+        assets.append(_asset_from_row(row, season, calculator))
+    return assets
+
+
+def _asset_from_row(row: sqlite3.Row, season: int, calculator: Any) -> LeagueAsset:
+    """Build one LeagueAsset from an _ASSETS_QUERY row."""
+    positions = json.loads(row['positions']) if row['positions'] else []
+    attributes = json.loads(row['attributes']) if row['attributes'] else {}
+    position = positions[0] if positions else 'unknown'
+    overall = attributes.get('overall', 0)
+
+    # Same age TradeValueCalculator derives when given a player_id
+    if row['birthdate']:
+        age = (date.today() - date.fromisoformat(row['birthdate'])).days // 365
+    else:
+        age = attributes.get('age', 25)
+
+    contract_years = row['contract_years'] or 1
+    aav = (row['total_value'] or 0) // contract_years
+    cap_hit = row['total_cap_hit'] if row['total_cap_hit'] is not None else aav
+    years_remaining = row['end_year'] - season + 1
+
+    player = {
+        'player_id': row['player_id'],
+        'first_name': row['first_name'],
+        'last_name': row['last_name'],
+        'number': row['number'],
+        'team_id': row['team_id'],
+        'positions': positions,
+        'attributes': attributes,
+        'status': row['status'],
+        'years_pro': row['years_pro'],
+        'birthdate': row['birthdate'],
+        'depth_chart_order': row['depth_chart_order'],
+        'roster_status': 'active',
+    }
+    contract = {
+        'contract_id': row['contract_id'],
+        'player_id': row['player_id'],
+        'team_id': row['team_id'],
+        'start_year': row['start_year'],
+        'end_year': row['end_year'],
+        'contract_years': row['contract_years'],
+        'contract_type': row['contract_type'],
+        'total_value': row['total_value'],
+        'signing_bonus': row['signing_bonus'],
+        'total_guaranteed': row['total_guaranteed'] or 0,
+        'is_active': True,
+        'years_remaining': years_remaining,
+        'aav': aav,
+        'cap_hit': cap_hit,
+    }
+
+    trade_value = 0.0
+    if calculator is not None:
+        trade_value = calculator.calculate_player_value(
+            overall_rating=overall,
+            position=position,
+            age=age,
+            contract_years_remaining=years_remaining,
+            annual_cap_hit=aav
+        )
+
+    return LeagueAsset(
+        player_id=row['player_id'],
+        team_id=row['team_id'],
+        position=position,
+        overall=overall,
+        age=age,
+        cap_hit=cap_hit,
+        years_remaining=years_remaining,
+        trade_value=trade_value,
+        player=player,
+        contract=contract,
+    )
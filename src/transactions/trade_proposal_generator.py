@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from database.player_roster_api import PlayerRosterAPI
 from salary_cap.cap_database_api import CapDatabaseAPI
 from transactions.trade_value_calculator import TradeValueCalculator
+from transactions.league_asset_index import LeagueAsset, LeagueAssetIndex
 from transactions.models import (
     TradeProposal,
     TradeAsset,
@@ -172,6 +173,11 @@ class TradeProposalGenerator:
         self.debug_mode = debug_mode
         self.current_season = None  # Will be set when generate_trade_proposals is called
 
+        # League-wide player/contract index for the current transaction window
+        # (set by TransactionAIManager.begin_trade_window). When None, targets
+        # are found by scanning every roster.
+        self.asset_index: Optional[LeagueAssetIndex] = None
+
         # Initialize database APIs
         self.player_api = PlayerRosterAPI(database_path)
         self.cap_api = CapDatabaseAPI(database_path)
@@ -396,6 +402,9 @@ class TradeProposalGenerator:
                 ...
             ]
         """
+        if self.asset_index is not None:
+            return self._find_targets_in_index(team_id, needs)
+
         potential_targets = []
 
         # Extract needed positions
@@ -448,14 +457,7 @@ class TradeProposalGenerator:
                     for need in needs:
                         if need['position'] == player_position:
                             matching_need = need
-
-                            # Determine minimum OVR based on urgency
-                            if need.get('urgency') == NeedUrgency.CRITICAL or need.get('urgency_score', 0) == 5:
-                                min_overall = self.MIN_OVERALL_CRITICAL
-                            elif need.get('urgency') == NeedUrgency.HIGH or need.get('urgency_score', 0) == 4:
-                                min_overall = self.MIN_OVERALL_HIGH
-                            else:
-                                min_overall = self.MIN_OVERALL_MEDIUM
+                            min_overall = self._min_overall_for_need(need)
                             break
 
                     # Check if player meets minimum quality threshold
@@ -492,6 +494,65 @@ class TradeProposalGenerator:
         self.logger.info(f"Found {len(potential_targets)} potential trade targets")
         return potential_targets
 
+    def _find_targets_in_index(
+        self,
+        team_id: int,
+        needs: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Same targets as the roster scan, as range lookups on the asset index.
+
+        Args:
+            team_id: Team doing the scanning (to exclude own players)
+            needs: Priority needs to fill
+
+        Returns:
+            Potential trade targets (see _scan_league_for_targets), in roster
+            scan order
+        """
+        potential_targets = []
+        searched_positions = set()
+
+        for need in needs:
+            position = need['position']
+            if position in searched_positions:
+                continue  # First need for a position sets the threshold
+            searched_positions.add(position)
+
+            matches = self.asset_index.find(
+                [position],
+                min_overall=self._min_overall_for_need(need),
+                min_years_remaining=1,  # Skip pending free agents
+                exclude_team_id=team_id
+            )
+            for asset in matches:
+                potential_targets.append({
+                    'player': asset.player,
+                    'value': self._calculate_asset_value(asset, acquiring_team_id=team_id),
+                    'need': need,
+                    'position': position,
+                    'contract': asset.contract
+                })
+
+        # Proposals are built for the first targets found, so keep the
+        # team-by-team depth chart order of the roster scan (NULLs first,
+        # as in get_team_roster's ORDER BY)
+        def roster_order(target: Dict[str, Any]) -> Tuple:
+            player = target['player']
+            depth = player.get('depth_chart_order')
+            number = player.get('number')
+            return (
+                player['team_id'],
+                -1 if depth is None else depth,
+                -player['attributes'].get('overall', 0),
+                -1 if number is None else number
+            )
+
+        potential_targets.sort(key=roster_order)
+
+        self.logger.info(f"Found {len(potential_targets)} potential trade targets")
+        return potential_targets
+
     def _identify_surplus_assets(
         self,
         team_id: int,
@@ -578,19 +639,27 @@ class TradeProposalGenerator:
                     for player in surplus_players:
                         player_id = player.get('player_id')
 
-                        # Skip players without active contracts (cannot be traded)
-                        if not self._player_has_active_contract(player_id, team_id):
-                            continue
-
-                        # Get contract
-                        contract = self._get_player_contract(player_id)
-
-                        # Calculate value
-                        value = self._calculate_player_value(
-                            player=player,
-                            contract=contract,
-                            acquiring_team_id=0  # Generic value
-                        )
+                        if self.asset_index is not None:
+                            # Indexed players are exactly those under contract
+                            asset = self.asset_index.get(player_id)
+                            if asset is None or asset.team_id != team_id:
+                                continue
+                            contract = asset.contract
+                            value = asset.trade_value  # Generic value
+                        else:
+                            # Skip players without active contracts (cannot be traded)
+                            if not self._player_has_active_contract(player_id, team_id):
+                                continue
+
+                            # Get contract
+                            contract = self._get_player_contract(player_id)
+
+                            # Calculate value
+                            value = self._calculate_player_value(
+                                player=player,
+                                contract=contract,
+                                acquiring_team_id=0  # Generic value
+                            )
 
                         # Create TradeAsset
                         asset = self._create_player_asset(
@@ -1069,6 +1138,14 @@ class TradeProposalGenerator:
             self.logger.warning(f"Error getting contract for player {player_id}: {e}")
             return None
 
+    def _min_overall_for_need(self, need: Dict[str, Any]) -> int:
+        """Minimum target OVR for a need, based on its urgency."""
+        if need.get('urgency') == NeedUrgency.CRITICAL or need.get('urgency_score', 0) == 5:
+            return self.MIN_OVERALL_CRITICAL
+        elif need.get('urgency') == NeedUrgency.HIGH or need.get('urgency_score', 0) == 4:
+            return self.MIN_OVERALL_HIGH
+        return self.MIN_OVERALL_MEDIUM
+
     def _player_has_active_contract(self, player_id: int, team_id: int) -> bool:
         """
         Check if player has an active contract with the specified team.
@@ -1170,6 +1247,22 @@ class TradeProposalGenerator:
 
         return value
 
+    def _calculate_asset_value(self, asset: LeagueAsset, acquiring_team_id: int) -> float:
+        """
+        Trade value of an indexed player for the acquiring team.
+
+        The index already holds the calculator's player lookups (overall,
+        position, age), so no player_id is passed and no query is made.
+        """
+        return self.calculator.calculate_player_value(
+            overall_rating=asset.overall,
+            position=asset.position,
+            age=asset.age,
+            contract_years_remaining=asset.years_remaining,
+            annual_cap_hit=asset.contract['aav'] if asset.contract else 1_000_000,
+            acquiring_team_id=acquiring_team_id
+        )
+
     def _create_player_asset(
         self,
         player: Dict[str, Any],
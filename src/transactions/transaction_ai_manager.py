@@ -17,6 +17,7 @@ import logging
 from transactions.trade_proposal_generator import TradeProposalGenerator, TeamContext
 from transactions.trade_value_calculator import TradeValueCalculator
 from transactions.trade_evaluator import TradeEvaluator
+from transactions.league_asset_index import LeagueAssetIndex
 from transactions.models import TradeProposal, TradeDecision, TradeDecisionType, AssetType
 from transactions.transaction_constants import (
     TransactionProbability,
@@ -48,6 +49,8 @@ class TransactionAIManager:
         max_transactions_per_day: Max proposals per team per day (default: 2)
         trade_cooldown_days: Days before re-evaluation after trade (default: 7)
         debug_mode: Enable comprehensive debug logging (default: False)
+        asset_index: League asset index of the open trade window (None outside
+            begin_trade_window()/end_trade_window())
     """
 
     database_path: str
@@ -76,6 +79,10 @@ class TransactionAIManager:
     # Debug data collection
     _debug_data: List[Dict[str, Any]] = field(default_factory=list, init=False)
 
+    # Trade window state
+    asset_index: Optional[LeagueAssetIndex] = field(default=None, init=False)
+    _window_season: Optional[int] = field(default=None, init=False)
+
     # Logger
     logger: Optional[logging.Logger] = field(default=None, init=False)
 
@@ -124,6 +131,54 @@ class TransactionAIManager:
         # For now, initialize empty history
         self._trade_history = {}
 
+    # -------------------------------------------------------------------------
+    # Trade Window
+    # -------------------------------------------------------------------------
+
+    def begin_trade_window(self, season: int) -> LeagueAssetIndex:
+        """
+        Build the league asset index shared by every team's trade search.
+
+        Call before evaluating teams on a day trades are allowed. The index
+        is kept across days and rebuilt only for a new season or when rosters
+        or contracts changed outside refresh_assets() (signings, cuts).
+
+        Args:
+            season: Season whose contracts are tradeable
+
+        Returns:
+            The window's LeagueAssetIndex
+        """
+        if (
+            self.asset_index is None
+            or self._window_season != season
+            or self.asset_index.is_stale()
+        ):
+            self.asset_index = LeagueAssetIndex.load(
+                self.database_path, self.dynasty_id, season, self.calculator
+            )
+            self._window_season = season
+
+        self.proposal_generator.asset_index = self.asset_index
+        return self.asset_index
+
+    def refresh_assets(self, player_ids: List[int]) -> None:
+        """
+        Update the window's index after players moved (executed trades).
+
+        Args:
+            player_ids: Players whose team or contract changed
+        """
+        if self.asset_index is not None:
+            self.asset_index.refresh(player_ids)
+
+    def end_trade_window(self) -> None:
+        """Drop the asset index; proposals fall back to roster scans."""
+        self.asset_index = None
+        self._window_season = None
+        if self.proposal_generator is not None:
+            self.proposal_generator.asset_index = None
+
     # -------------------------------------------------------------------------
     # Probability System
     # -------------------------------------------------------------------------
@@ -540,23 +595,15 @@ class TransactionAIManager:
                 return [], debug_data  # No needs, no trades
 
             # Step 4: Generate trade proposals
+            proposals, proposal_debug = self.proposal_generator.generate_trade_proposals(
+                team_id=team_id,
+                gm_archetype=gm_archetype,
+                team_context=team_context,
+                needs=team_needs,
+                season=self._window_season or 2025  # TODO: Make year configurable outside trade windows
+            )
             if self.debug_mode:
-                proposals, proposal_debug = self.proposal_generator.generate_trade_proposals(
-                    team_id=team_id,
-                    gm_archetype=gm_archetype,
-                    team_context=team_context,
-                    needs=team_needs,
-                    season=2025  # TODO: Make year configurable
-                )
                 debug_data['proposal_generation'] = proposal_debug
-            else:
-                proposals = self.proposal_generator.generate_trade_proposals(
-                    team_id=team_id,
-                    gm_archetype=gm_archetype,
-                    team_context=team_context,
-                    needs=team_needs,
-                    season=2025
-                )
 
             proposals_generated = len(proposals)
             self._proposal_count += proposals_generated
@@ -0,0 +1,235 @@
+"""
+Tests for DatabaseManager
+
+Validates the process-wide schema registry and connection pool:
+- Schema setup runs once per file and version (schema_version table)
+- Re-running after a version change, a new file, or another thread's setup
+- Thread-affine pooled connections with uniform pragmas
+- Rollback and reset on release; replaced files not reused
+- GameCycleDatabase and DatabaseConnection delegating to the manager
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+
+import pytest
+
+from database.connection import DatabaseConnection
+from database.database_manager import (
+    DatabaseManager,
+    get_database_manager,
+    schema_fingerprint
+)
+from game_cycle.database.connection import GameCycleDatabase
+
+
+@pytest.fixture
+def db_path():
+    """Path for a temporary database file."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+        path = tmp.name
+    yield path
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.unlink(path + suffix)
+        except OSError:
+            pass
+
+
+@pytest.fixture
+def manager():
+    """Fresh manager (not the process-wide one) for isolated counters."""
+    manager = DatabaseManager()
+    yield manager
+    manager.close_idle()
+
+
+def _create_players(conn):
+    conn.execute("CREATE TABLE IF NOT EXISTS players (id INTEGER PRIMARY KEY, name TEXT)")
+
+
+class TestSchemaRegistry:
+    """ensure_schema() runs setups once per version."""
+
+    def test_runs_once_per_version(self, manager, db_path):
+        with manager.connection(db_path) as conn:
+            assert manager.ensure_schema(conn, "test/schema.sql", "v1", _create_players)
+            assert not manager.ensure_schema(conn, "test/schema.sql", "v1", _create_players)
+
+        with manager.connection(db_path) as conn:
+            assert not manager.ensure_schema(conn, "test/schema.sql", "v1", _create_players)
+            row = conn.execute("SELECT version FROM schema_version WHERE schema_file = 'test/schema.sql'").fetchone()
+            assert row["version"] == "v1"
+
+        stats = manager.get_stats()
+        assert stats.schema_runs == 1
+        assert stats.schema_skips == 2
+
+    def test_new_version_reapplies(self, manager, db_path):
+        calls = []
+        with manager.connection(db_path) as conn:
+            manager.ensure_schema(conn, "test/schema.sql", "v1", calls.append)
+            manager.ensure_schema(conn, "test/schema.sql", "v2", calls.append)
+            manager.ensure_schema(conn, "test/other.sql", "v2", calls.append)  # Versions are per file
+
+        assert len(calls) == 3
+
+    def test_version_lives_in_the_database(self, db_path):
+        """A new process (fresh manager) still skips current schemas."""
+        first, second = DatabaseManager(), DatabaseManager()
+        with first.connection(db_path) as conn:
+            first.ensure_schema(conn, "test/schema.sql", "v1", _create_players)
+        with second.connection(db_path) as conn:
+            assert not second.ensure_schema(conn, "test/schema.sql", "v1", _create_players)
+
+    def test_failed_setup_not_recorded(self, manager, db_path):
+        def fail(conn):
+            raise sqlite3.OperationalError("boom")
+
+        with manager.connection(db_path) as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                manager.ensure_schema(conn, "test/schema.sql", "v1", fail)
+            assert manager.ensure_schema(conn, "test/schema.sql", "v1", _create_players)
+
+    def test_concurrent_setup_runs_once(self, manager, db_path):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_setup(conn):
+            calls.append(threading.get_ident())
+            started.set()
+            release.wait(5)
+            _create_players(conn)
+
+        def worker():
+            with manager.connection(db_path) as conn:
+                manager.ensure_schema(conn, "test/schema.sql", "v1", slow_setup)
+
+        first = threading.Thread(target=worker)
+        first.start()
+        assert started.wait(5)
+        second = threading.Thread(target=worker)
+        second.start()
+        second.join(0.2)  # Blocked on the setup lock
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        stats = manager.get_stats()
+        assert len(calls) == 1
+        assert (stats.schema_runs, stats.schema_skips, stats.pool_waits) == (1, 1, 1)
+
+    def test_fingerprint_changes_with_parts(self):
+        assert schema_fingerprint("a", b"b") == schema_fingerprint("a", b"b")
+        assert schema_fingerprint("a", "b") != schema_fingerprint("ab")
+
+
+class TestConnections:
+    """Pooled, thread-affine connections."""
+
+    def test_uniform_pragmas(self, manager, db_path):
+        with manager.connection(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16000
+            assert conn.row_factory is sqlite3.Row
+
+    def test_released_connection_reused(self, manager, db_path):
+        with manager.connection(db_path) as conn:
+            first = conn
+        with manager.connection(db_path) as conn:
+            assert conn is first
+
+        stats = manager.get_stats()
+        assert (stats.opens, stats.reuses) == (1, 1)
+
+    def test_release_rolls_back_and_resets(self, manager, db_path):
+        with manager.connection(db_path) as conn:
+            _create_players(conn)
+            conn.commit()
+            conn.execute("INSERT INTO players (name) VALUES ('uncommitted')")
+            conn.row_factory = None
+            conn.execute("PRAGMA foreign_keys = OFF")
+
+        with manager.connection(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) AS n FROM players").fetchone()["n"] == 0
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_closed_or_replaced_connections_not_reused(self, manager, db_path):
+        conn = manager.acquire(db_path)
+        conn.close()  # Closed by its user
+        manager.release(conn, db_path)
+        assert manager.acquire(db_path) is not conn
+
+        conn = manager.acquire(db_path)
+        manager.release(conn, db_path)
+        os.unlink(db_path)
+        open(db_path, "wb").close()  # New file at the same path
+        assert manager.acquire(db_path) is not conn
+
+    def test_memory_databases_not_pooled(self, manager):
+        with manager.connection(":memory:") as conn:
+            conn.execute("CREATE TABLE t (x)")
+        with manager.connection(":memory:") as conn:
+            assert conn.execute("SELECT name FROM sqlite_master WHERE name = 't'").fetchone() is None
+
+    def test_connections_stay_on_their_thread(self, manager, db_path):
+        with manager.connection(db_path) as conn:
+            main_conn = conn
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(manager.acquire(db_path)))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_conn
+        with manager.connection(db_path) as conn:
+            assert conn is main_conn
+
+
+class TestDelegation:
+    """Existing database classes use the process-wide manager."""
+
+    def test_game_cycle_database_schema_once(self, db_path):
+        manager = get_database_manager()
+        GameCycleDatabase(db_path).close()
+        manager.reset_stats()
+
+        for _ in range(5):
+            db = GameCycleDatabase(db_path)
+            assert db.table_exists("teams")
+            db.close()
+
+        stats = manager.get_stats()
+        assert stats.schema_runs == 0
+        assert stats.schema_skips == 5
+        assert stats.opens == 0  # Pooled connection reused
+
+    def test_game_cycle_database_close_discards_uncommitted(self, db_path):
+        db = GameCycleDatabase(db_path)
+        db.get_connection().execute(
+            "INSERT INTO teams (team_id, name, abbreviation, conference, division) "
+            "VALUES (1, 'Team', 'TM', 'AFC', 'East')"
+        )
+        db.close()
+
+        db = GameCycleDatabase(db_path)
+        assert db.row_count("teams") == 0
+        db.close()
+
+    def test_database_connection_creates_tables_once(self, db_path):
+        db = DatabaseConnection(db_path)
+        conn = db.get_connection()
+        conn.close()
+
+        conn = db.get_connection()
+        try:
+            versions = conn.execute("SELECT schema_file FROM schema_version").fetchall()
+            assert [row["schema_file"] for row in versions] == [DatabaseConnection.SCHEMA_FILE]
+            assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'dynasties'").fetchone()
+        finally:
+            conn.close()
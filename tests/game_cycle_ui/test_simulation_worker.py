@@ -0,0 +1,210 @@
+"""
+Tests for StageSimulationWorker - stage execution off the Qt main thread.
+
+Covers:
+- Stages execute on the worker thread with a backend created there
+- Progress and per-stage results streamed through signals
+- Multi-stage runs stop when the phase changes or on cancel()
+- Multi-stage runs defer media and drain the queue before finishing
+- Exceptions reported through simulation_failed
+"""
+
+import threading
+from typing import List
+
+import pytest
+
+# Skip import if PySide6 not available (CI/headless environments)
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QApplication
+
+from game_cycle import SeasonPhase, Stage, StageType
+from game_cycle.stage_controller import StageResult
+import game_cycle_ui.controllers.simulation_worker as simulation_worker
+from game_cycle_ui.controllers.simulation_worker import StageSimulationWorker
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create QApplication for Qt tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+class FakeBackend:
+    """Backend StageController stand-in that walks the stage sequence."""
+
+    instances: List["FakeBackend"] = []
+    fail = False
+    on_execute = None
+
+    def __init__(self, db_path, dynasty_id, season):
+        self.created_on = threading.get_ident()
+        self.executed_on = []
+        self.executed = []
+        self.closed = False
+        self.mode = None
+        self.media_mode = "inline"
+        self.drained = 0
+        self._stage = None
+        self._callback = None
+        FakeBackend.instances.append(self)
+
+    def set_simulation_mode(self, mode):
+        self.mode = mode
+
+    def set_media_mode(self, mode):
+        self.media_mode = mode
+
+    def drain_media_jobs(self):
+        self.drained += 1
+        return True
+
+    def adopt_stage(self, stage):
+        self._stage = Stage(stage.stage_type, stage.season_year, stage.completed)
+
+    def set_progress_callback(self, callback):
+        self._callback = callback
+
+    @property
+    def current_stage(self):
+        return self._stage
+
+    def execute_current_stage(self):
+        if FakeBackend.fail:
+            raise RuntimeError("database is locked")
+        self.executed_on.append(threading.get_ident())
+        self.executed.append(self._stage.stage_type)
+        self._callback(1, 1, f"{self._stage.display_name} done")
+        if FakeBackend.on_execute:
+            FakeBackend.on_execute(self)
+        self._stage.completed = True
+        return StageResult(
+            stage=self._stage, success=True, games_played=[], events_processed=[],
+            errors=[], can_advance=True, next_stage=self._stage.next_stage()
+        )
+
+    def advance_to_next_stage(self):
+        self._stage = self._stage.next_stage()
+        return self._stage
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    FakeBackend.instances = []
+    FakeBackend.fail = False
+    FakeBackend.on_execute = None
+    monkeypatch.setattr(simulation_worker, "BackendStageController", FakeBackend)
+    return FakeBackend
+
+
+def _run(qapp, worker):
+    """Start the worker, wait for it and deliver its queued signals."""
+    events = {"started": [], "progress": [], "completed": [], "finished": [], "failed": []}
+    worker.stage_started.connect(lambda stage: events["started"].append(stage.stage_type))
+    worker.progress.connect(lambda current, total, message: events["progress"].append(message))
+    worker.stage_completed.connect(lambda result: events["completed"].append(result.stage.stage_type))
+    worker.simulation_finished.connect(
+        lambda result, stage, cancelled: events["finished"].append((result, stage, cancelled))
+    )
+    worker.simulation_failed.connect(lambda error: events["failed"].append(error))
+    worker.start()
+    assert worker.wait(5000)
+    qapp.processEvents()
+    return events
+
+
+class TestSingleStage:
+    """One stage per worker by default."""
+
+    def test_executes_on_worker_thread(self, qapp, fake_backend):
+        worker = StageSimulationWorker("db", "dyn", Stage(StageType.REGULAR_WEEK_3, 2025), "instant")
+
+        _run(qapp, worker)
+
+        backend = fake_backend.instances[0]
+        assert backend.created_on != threading.get_ident()
+        assert backend.executed_on == [backend.created_on]
+        assert backend.mode == "instant"
+        assert backend.closed
+
+    def test_streams_progress_and_result(self, qapp, fake_backend):
+        worker = StageSimulationWorker("db", "dyn", Stage(StageType.REGULAR_WEEK_3, 2025), "full")
+
+        events = _run(qapp, worker)
+
+        assert events["progress"] == ["Week 3 done"]
+        assert events["completed"] == [StageType.REGULAR_WEEK_3]
+        result, final_stage, cancelled = events["finished"][0]
+        assert result.stage.completed
+        assert final_stage.stage_type == StageType.REGULAR_WEEK_3
+        assert not cancelled
+
+    def test_failure_reported(self, qapp, fake_backend):
+        fake_backend.fail = True
+        worker = StageSimulationWorker("db", "dyn", Stage(StageType.REGULAR_WEEK_3, 2025), "full")
+
+        events = _run(qapp, worker)
+
+        assert isinstance(events["failed"][0], RuntimeError)
+        assert events["finished"] == []
+        assert fake_backend.instances[0].closed
+
+
+class TestContinuePhase:
+    """Consecutive stages of one phase (sim to playoffs)."""
+
+    def test_stops_at_phase_change(self, qapp, fake_backend):
+        worker = StageSimulationWorker(
+            "db", "dyn", Stage(StageType.REGULAR_WEEK_16, 2025), "instant",
+            continue_phase=SeasonPhase.REGULAR_SEASON
+        )
+
+        events = _run(qapp, worker)
+
+        assert fake_backend.instances[0].executed == [
+            StageType.REGULAR_WEEK_16, StageType.REGULAR_WEEK_17, StageType.REGULAR_WEEK_18
+        ]
+        _, final_stage, cancelled = events["finished"][0]
+        assert final_stage.stage_type == StageType.WILD_CARD
+        assert not cancelled
+
+    def test_cancel_stops_after_current_stage(self, qapp, fake_backend):
+        worker = StageSimulationWorker(
+            "db", "dyn", Stage(StageType.REGULAR_WEEK_10, 2025), "instant",
+            continue_phase=SeasonPhase.REGULAR_SEASON
+        )
+        fake_backend.on_execute = lambda backend: worker.cancel()
+
+        events = _run(qapp, worker)
+
+        assert fake_backend.instances[0].executed == [StageType.REGULAR_WEEK_10]
+        _, final_stage, cancelled = events["finished"][0]
+        assert final_stage.stage_type == StageType.REGULAR_WEEK_11
+        assert cancelled
+
+    def test_defers_media_and_drains(self, qapp, fake_backend):
+        worker = StageSimulationWorker(
+            "db", "dyn", Stage(StageType.REGULAR_WEEK_17, 2025), "instant",
+            continue_phase=SeasonPhase.REGULAR_SEASON
+        )
+
+        _run(qapp, worker)
+
+        backend = fake_backend.instances[0]
+        assert backend.media_mode == "deferred"
+        assert backend.drained == 1
+
+    def test_single_stage_keeps_inline_media(self, qapp, fake_backend):
+        worker = StageSimulationWorker("db", "dyn", Stage(StageType.REGULAR_WEEK_3, 2025), "instant")
+
+        _run(qapp, worker)
+
+        assert fake_backend.instances[0].media_mode == "inline"
+        assert fake_backend.instances[0].drained == 0
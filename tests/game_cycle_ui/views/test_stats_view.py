@@ -0,0 +1,177 @@
+"""
+Tests for StatsView lazy, cached leaderboard loading.
+
+Covers:
+- refresh_stats() loading only the visible tab (plus adjacent prefetch)
+  on the background loader, then the summary
+- Switching to a prefetched tab needing no query
+- Cached tabs shown without a query until the season is invalidated
+- Model-backed tables: formatting, numeric sorting, leader highlight,
+  player dict for double-click
+- Results for outdated filters ignored
+"""
+
+import time
+from typing import List
+
+import pytest
+
+# Skip import if PySide6 not available (CI/headless environments)
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+import game_cycle_ui.views.stats_view as stats_view
+from game_cycle.services.leaderboard_service import (
+    LeaderboardQuery, LeaderboardService, notify_games_persisted
+)
+from game_cycle_ui.models.leaderboard_table_model import RECORD_ROLE, SORT_ROLE
+
+SEASON = 2031  # Not written by any other test
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create QApplication for Qt tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+class FakeLeaderboardService(LeaderboardService):
+    """Serves canned rows and records the queries that would hit the database."""
+
+    loads: List[LeaderboardQuery] = []
+
+    def _load(self, query):
+        FakeLeaderboardService.loads.append(query)
+        if query.category == "summary":
+            return {"games": 16, "players": 700, "week": 1}
+        if query.category == "team_stats":
+            return [
+                {"team_id": 1, "games_played": 1, "total_yards": 350, "turnover_margin": 2},
+                {"team_id": 2, "games_played": 1, "total_yards": 410, "turnover_margin": -2},
+            ]
+        return [
+            {"player_id": 10, "player_name": "Leader", "team_id": 1, "position": "quarterback",
+             "passing_yards": 300, "passing_attempts": 30, "passing_completions": 21,
+             "passing_tds": 3, "rushing_yards": 120, "rushing_attempts": 20},
+            {"player_id": 11, "player_name": "Runner Up", "team_id": 2, "position": "quarterback",
+             "passing_yards": 1250, "passing_attempts": 8, "passing_completions": 2,
+             "passing_tds": 1, "rushing_yards": 90, "rushing_attempts": 9},
+        ]
+
+
+@pytest.fixture
+def view(qapp, monkeypatch):
+    FakeLeaderboardService.loads = []
+    monkeypatch.setattr(stats_view, "LeaderboardService", FakeLeaderboardService)
+    view = stats_view.StatsView()
+    view.set_context("stats_view_test", ":memory:", SEASON)
+    yield view
+    view._loader.stop(timeout=5)
+
+
+def _wait_for(qapp, condition, timeout=5.0):
+    """Process events until condition() holds."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        qapp.processEvents()
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _categories():
+    return [q.category for q in FakeLeaderboardService.loads]
+
+
+class TestLazyLoading:
+    """Only the visible tab, its neighbours and the summary are loaded."""
+
+    def test_refresh_loads_visible_tab_then_prefetches(self, qapp, view):
+        view.refresh_stats()
+        assert view.passing_model.message == "Loading..."
+
+        assert _wait_for(qapp, lambda: view.players_label.text() == "700")
+        assert _wait_for(qapp, lambda: view.rushing_model.rowCount() == 2)
+        assert _categories() == ["passing", "summary", "rushing"]
+        assert view.passing_model.rowCount() == 2
+        assert view.receiving_model.rowCount() == 0  # Not loaded until shown
+
+    def test_prefetched_tab_needs_no_query(self, qapp, view):
+        view.refresh_stats()
+        assert _wait_for(qapp, lambda: view.rushing_model.rowCount() == 2)
+
+        FakeLeaderboardService.loads.clear()
+        view.category_tabs.setCurrentIndex(1)  # Rushing
+        assert _wait_for(qapp, lambda: view.receiving_model.rowCount() == 2)
+        assert _categories() == ["receiving"]  # Only the new neighbour
+
+    def test_cached_until_games_persisted(self, qapp, view):
+        view.refresh_stats()
+        assert _wait_for(qapp, lambda: len(FakeLeaderboardService.loads) == 3)
+
+        FakeLeaderboardService.loads.clear()
+        view.refresh_stats()
+        qapp.processEvents()
+        assert FakeLeaderboardService.loads == []
+        assert view.passing_model.rowCount() == 2
+
+        notify_games_persisted("stats_view_test", SEASON)
+        view.refresh_stats()
+        assert view.passing_model.rowCount() == 2  # Previous rows kept while reloading
+        assert _wait_for(qapp, lambda: len(FakeLeaderboardService.loads) == 3)
+
+    def test_outdated_result_ignored(self, qapp, view):
+        view.refresh_stats()
+        view._team_filter = 5  # Changed while the unfiltered query was loading
+        # Summary is queued after the visible tab, so its result arrives later
+        assert _wait_for(qapp, lambda: view.players_label.text() == "700")
+
+        assert view.passing_model.message == "Loading..."
+        assert view._tabs[0].loaded_query is None
+
+
+class TestTables:
+    """Model-backed tables keep the QTableWidget behaviour."""
+
+    def test_passing_cells(self, qapp, view):
+        view.refresh_stats()
+        assert _wait_for(qapp, lambda: view.passing_model.rowCount() == 2)
+
+        model = view.passing_table.model()
+        headers = [model.headerData(c, Qt.Horizontal) for c in range(model.columnCount())]
+        row = [model.index(0, c).data() for c in range(model.columnCount())]
+        assert headers[6:8] == ["CMP%", "YDS"]
+        assert row[0] == "1" and row[1] == "Leader" and row[2] == "QB"
+        assert row[6] == "70.0%"
+        assert model.index(0, 6).data(SORT_ROLE) == pytest.approx(70.0)
+        assert model.index(0, 8).data(Qt.ForegroundRole) is not None  # Leader's TD highlighted
+        assert model.index(1, 8).data(Qt.ForegroundRole) is None
+        assert model.index(1, 3).data(RECORD_ROLE)["player_id"] == 11
+
+    def test_numeric_sort(self, qapp, view):
+        view.refresh_stats()
+        assert _wait_for(qapp, lambda: view.passing_model.rowCount() == 2)
+
+        view.passing_table.sortByColumn(7, Qt.DescendingOrder)  # YDS: 1250 before 300
+        model = view.passing_table.model()
+        assert [model.index(r, 1).data() for r in range(2)] == ["Runner Up", "Leader"]
+        assert model.index(0, 0).data() == "2"  # Rank stays with the player
+
+    def test_team_stats_toggle_uses_loaded_rows(self, qapp, view):
+        view.category_tabs.setCurrentIndex(9)
+        view.refresh_stats()
+        assert _wait_for(qapp, lambda: view.team_stats_model.rowCount() == 2)
+        FakeLeaderboardService.loads.clear()
+
+        view._on_team_stats_toggle("turnovers")
+
+        model = view.team_stats_model
+        assert model.headerData(5, Qt.Horizontal) == "TO Margin"
+        assert [model.index(r, 5).data() for r in range(2)] == ["+2", "-2"]
+        assert "team_stats" not in _categories()
@@ -0,0 +1,202 @@
+"""
+Tests for the per-play phase profiler (game_management.play_phase_profiler).
+
+Covers:
+- Phase and play type counters, penalty time split from the engine
+- Merging reports for a week and pickling them across processes
+- A profiled game: report on the GameResult, same outcome as unprofiled
+"""
+
+import contextlib
+import copy
+import io
+import pickle
+
+import pytest
+
+from game_management.full_game_simulator import FullGameSimulator
+from game_management.play_phase_profiler import (
+    PHASE_CLOCK,
+    PHASE_ENGINE,
+    PHASE_NAMES,
+    PHASE_PENALTIES,
+    PHASE_PLAY_CALLING,
+    PlayPhaseProfiler,
+    PlayPhaseReport,
+)
+from play_engine.core.rng import GameRNG
+from play_engine.play_types.offensive_types import OffensivePlayType
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+@pytest.fixture(scope="module")
+def synthetic_teams():
+    """Synthetic rosters and staff configs for a single matchup."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulator = FullGameSimulator(away_team_id=3, home_team_id=4)
+    return {
+        "away_roster": simulator.away_roster,
+        "home_roster": simulator.home_roster,
+        "away_coaching_staff": simulator.away_coaching_staff,
+        "home_coaching_staff": simulator.home_coaching_staff,
+    }
+
+
+def _play_game(synthetic_teams, profile_plays):
+    """Simulate one seeded game on fresh roster copies."""
+    simulator = FullGameSimulator(
+        away_team_id=3,
+        home_team_id=4,
+        away_roster=copy.deepcopy(synthetic_teams["away_roster"]),
+        home_roster=copy.deepcopy(synthetic_teams["home_roster"]),
+        away_coaching_staff=synthetic_teams["away_coaching_staff"],
+        home_coaching_staff=synthetic_teams["home_coaching_staff"],
+        rng=GameRNG(2024),
+        profile_plays=profile_plays,
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        return simulator.simulate_game()
+
+
+class FakePenaltyEngine:
+    """Records calls in place of PenaltyEngine.check_for_penalty."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def check_for_penalty(self, *args, **kwargs):
+        self.calls += 1
+        return "no penalty"
+
+
+# ============================================
+# Profiler counters
+# ============================================
+
+class TestPlayPhaseProfiler:
+    """Phase marks, play types and penalty timing."""
+
+    def test_phases_and_play_types(self):
+        profiler = PlayPhaseProfiler()
+        for play_type in ("run", "pass", "run"):
+            profiler.begin_play()
+            profiler.play_type = play_type
+            profiler.mark(PHASE_PLAY_CALLING)
+            profiler.mark(PHASE_ENGINE)
+            profiler.end_play()
+
+        report = profiler.report()
+        assert report.plays == 3
+        assert set(report.phase_ns) == set(PHASE_NAMES)
+        assert report.phase_ns["engine"] > 0
+        assert report.phase_ns["stats"] == 0
+        assert report.play_types["run"]["plays"] == 2
+        assert report.play_types["pass"]["plays"] == 1
+        type_ns = sum(
+            counts[name] for counts in report.play_types.values() for name in PHASE_NAMES
+        )
+        assert type_ns == report.play_ns
+
+    def test_penalty_checks_split_from_engine_during_plays(self):
+        profiler = PlayPhaseProfiler()
+        engine = FakePenaltyEngine()
+        profiler.instrument_penalties(engine)
+
+        # PAT attempts check penalties outside a play: passed through, not timed
+        assert engine.check_for_penalty("pat") == "no penalty"
+        profiler.begin_play()
+        assert engine.check_for_penalty("snap") == "no penalty"
+        profiler.mark(PHASE_ENGINE)
+        profiler.mark(PHASE_CLOCK)
+        profiler.end_play()
+
+        report = profiler.report()
+        assert engine.calls == 2
+        assert report.phase_ns["penalties"] > 0
+        assert report.phase_ns["engine"] >= 0
+        assert report.play_ns == sum(report.play_types["unknown"][name] for name in PHASE_NAMES)
+
+    def test_game_time_includes_other_work(self):
+        profiler = PlayPhaseProfiler()
+        profiler.begin_game()
+        profiler.begin_play()
+        profiler.mark(PHASE_PENALTIES)
+        profiler.end_play()
+        sum(range(10000))  # Work between plays (kickoffs, transitions)
+        profiler.end_game()
+
+        report = profiler.report()
+        assert report.games == 1
+        assert report.game_ns >= report.play_ns
+        assert report.other_ns == report.game_ns - report.play_ns
+
+
+# ============================================
+# Reports
+# ============================================
+
+class TestPlayPhaseReport:
+    """Week aggregation and serialization."""
+
+    def _report(self, plays, engine_ns, play_type="run"):
+        phase_ns = dict.fromkeys(PHASE_NAMES, 0)
+        phase_ns["engine"] = engine_ns
+        return PlayPhaseReport(
+            games=1, plays=plays, game_ns=engine_ns * 2, phase_ns=phase_ns,
+            play_types={play_type: {"plays": plays, **phase_ns}},
+        )
+
+    def test_combine_sums_games(self):
+        week = PlayPhaseReport.combine([
+            self._report(100, 4_000_000), None, self._report(50, 2_000_000, "pass"),
+        ])
+
+        assert (week.games, week.plays) == (2, 150)
+        assert week.phase_ns["engine"] == 6_000_000
+        assert week.other_ns == 6_000_000
+        assert week.play_types["run"]["plays"] == 100
+        assert week.play_types["pass"]["engine"] == 2_000_000
+
+    def test_to_dict_and_table(self):
+        summary = self._report(100, 4_000_000).to_dict()
+
+        assert summary["play_ms"] == 4.0
+        assert summary["phases"]["engine"] == {"ms": 4.0, "share": 1.0, "us_per_play": 40.0}
+        assert summary["play_types"]["run"]["us_per_play"] == 40.0
+        assert self._report(100, 4_000_000).format_table().splitlines()[1].split()[0] == "engine"
+
+    def test_report_pickles(self):
+        report = self._report(10, 1_000)
+        assert pickle.loads(pickle.dumps(report)) == report
+
+
+# ============================================
+# Profiled games
+# ============================================
+
+class TestProfiledGame:
+    """GameLoopController with a profiler attached."""
+
+    def test_game_result_carries_report(self, synthetic_teams):
+        result = _play_game(synthetic_teams, profile_plays=True)
+        report = result.play_phase_profile
+
+        assert isinstance(report, PlayPhaseReport)
+        assert report.games == 1
+        assert report.plays == result.total_plays
+        assert sum(counts["plays"] for counts in report.play_types.values()) == result.total_plays
+        assert {OffensivePlayType.RUN, OffensivePlayType.PASS} <= set(report.play_types)
+        assert report.phase_ns["engine"] > 0
+        assert report.phase_ns["penalties"] > 0
+        assert report.game_ns > report.play_ns
+
+    def test_profiling_does_not_change_game(self, synthetic_teams):
+        profiled = _play_game(synthetic_teams, profile_plays=True)
+        plain = _play_game(synthetic_teams, profile_plays=False)
+
+        assert plain.play_phase_profile is None
+        assert profiled.final_score == plain.final_score
+        assert profiled.total_plays == plain.total_plays
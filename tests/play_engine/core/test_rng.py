@@ -0,0 +1,138 @@
+"""
+Tests for per-game RNG streams (play_engine.core.rng).
+
+Covers:
+- Stable seed derivation and independent sub-streams
+- Components falling back to the global random module without a GameRNG
+- Bit-for-bit replay of a full game from the same seed, regardless of
+  global random.seed() calls
+"""
+
+import contextlib
+import copy
+import io
+import random
+
+import pytest
+
+from game_management.full_game_simulator import FullGameSimulator
+from game_management.random_events import RandomEventChecker
+from play_engine.core.rng import (
+    GameRNG,
+    PASS_STREAM,
+    PENALTY_STREAM,
+    RUN_STREAM,
+    derive_seed,
+    stream_or_global,
+)
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+@pytest.fixture(scope="module")
+def synthetic_teams():
+    """Synthetic rosters and staff configs for a single matchup."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulator = FullGameSimulator(away_team_id=1, home_team_id=2)
+    return {
+        "away_roster": simulator.away_roster,
+        "home_roster": simulator.home_roster,
+        "away_coaching_staff": simulator.away_coaching_staff,
+        "home_coaching_staff": simulator.home_coaching_staff,
+    }
+
+
+def _play_game(synthetic_teams, rng):
+    """Simulate one game on fresh roster copies and return a comparable trace."""
+    simulator = FullGameSimulator(
+        away_team_id=1,
+        home_team_id=2,
+        away_roster=copy.deepcopy(synthetic_teams["away_roster"]),
+        home_roster=copy.deepcopy(synthetic_teams["home_roster"]),
+        away_coaching_staff=synthetic_teams["away_coaching_staff"],
+        home_coaching_staff=synthetic_teams["home_coaching_staff"],
+        rng=rng,
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = simulator.simulate_game()
+    plays = [
+        (play.outcome, play.yards, play.time_elapsed)
+        for drive in result.drives
+        for play in drive.plays
+    ]
+    return result.final_score, plays
+
+
+# ============================================
+# Seeds and streams
+# ============================================
+
+class TestGameRNG:
+    """GameRNG seeding and sub-stream behavior."""
+
+    def test_derive_seed_is_stable(self):
+        assert derive_seed("dyn", 2025, 1, "g1") == derive_seed("dyn", 2025, 1, "g1")
+        assert derive_seed("dyn", 2025, 1, "g1") != derive_seed("dyn", 2025, 1, "g2")
+
+    def test_for_game_matches_derived_seed(self):
+        rng = GameRNG.for_game("dyn", 2025, 3, "game_7")
+        assert rng.seed == derive_seed("dyn", 2025, 3, "game_7")
+
+    def test_stream_is_cached(self):
+        rng = GameRNG(42)
+        assert rng.stream(RUN_STREAM) is rng.stream(RUN_STREAM)
+
+    def test_streams_are_independent_of_draw_order(self):
+        first = GameRNG(42)
+        first.stream(PASS_STREAM).random()
+        first.stream(PASS_STREAM).random()
+        run_after_pass = first.stream(RUN_STREAM).random()
+
+        second = GameRNG(42)
+        run_only = second.stream(RUN_STREAM).random()
+
+        assert run_after_pass == run_only
+
+    def test_streams_differ_from_each_other(self):
+        rng = GameRNG(42)
+        assert rng.stream(RUN_STREAM).random() != rng.stream(PENALTY_STREAM).random()
+
+    def test_stream_or_global_without_rng(self):
+        assert stream_or_global(None, RUN_STREAM) is random
+
+
+class TestRandomEventChecker:
+    """RandomEventChecker no longer reseeds the global random module."""
+
+    def test_seed_uses_private_generator(self):
+        random.seed(1)
+        expected = random.random()
+
+        random.seed(1)
+        RandomEventChecker(seed=99)
+
+        assert random.random() == expected
+
+
+# ============================================
+# Full game replay
+# ============================================
+
+class TestGameReplay:
+    """Same seed -> same game, independent of global random state."""
+
+    def test_same_seed_replays_game(self, synthetic_teams):
+        random.seed(1)
+        first = _play_game(synthetic_teams, GameRNG(7))
+        random.seed(12345)
+        second = _play_game(synthetic_teams, GameRNG(7))
+
+        assert first == second
+
+    def test_different_seed_changes_game(self, synthetic_teams):
+        first = _play_game(synthetic_teams, GameRNG(7))
+        second = _play_game(synthetic_teams, GameRNG(8))
+
+        assert first[1] != second[1]
@@ -0,0 +1,169 @@
+"""
+Tests for GameLineupIndex - per-game position lookups for play simulators.
+
+Lookups served from the index must match the roster scans they replace,
+including roster order and depth-chart tie-breaking.
+"""
+
+import pytest
+
+from play_engine.game_state.lineup_index import GameLineupIndex, select_field_players
+from play_engine.mechanics.formations import DefensiveFormation, OffensiveFormation
+from play_engine.simulation.pass_plays import PassPlaySimulator
+from team_management.players.player import Player, Position
+
+
+def _player(name, position, depth=1, overall=70):
+    player = Player(name=name, number=0, primary_position=position, ratings={'overall': overall})
+    player.depth_chart_order = depth
+    return player
+
+
+@pytest.fixture
+def offense():
+    """Small offensive roster with backups interleaved by position."""
+    return [
+        _player("QB1", Position.QB, 1, 85),
+        _player("WR2", Position.WR, 2, 70),
+        _player("RB1", Position.RB, 1, 80),
+        _player("WR1", Position.WR, 1, 88),
+        _player("TE1", Position.TE, 1, 75),
+        _player("RB2", Position.RB, 2, 72),
+        _player("WR3", Position.WR, 3, 65),
+        _player("LT", Position.LT, 1, 78),
+        _player("LG", Position.LG, 1, 74),
+        _player("C", Position.C, 1, 76),
+        _player("RG", Position.RG, 1, 73),
+        _player("RT", Position.RT, 1, 77),
+        _player("QB2", Position.QB, 2, 68),
+    ]
+
+
+@pytest.fixture
+def defense():
+    return [
+        _player("DE1", Position.DE, 1, 82),
+        _player("DE2", Position.DE, 1, 79),
+        _player("DT1", Position.DT, 1, 80),
+        _player("DT2", Position.DT, 1, 78),
+        _player("DE3", Position.DE, 2, 70),
+        _player("MLB", Position.MIKE, 1, 81),
+        _player("SLB", Position.SAM, 1, 75),
+        _player("WLB", Position.WILL, 1, 74),
+        _player("CB1", Position.CB, 1, 86),
+        _player("CB2", Position.CB, 1, 80),
+        _player("CB3", Position.CB, 2, 72),
+        _player("FS", Position.FS, 1, 79),
+        _player("SS", Position.SS, 1, 77),
+    ]
+
+
+class TestLookups:
+    """Index lookups match linear roster scans."""
+
+    def test_first_at(self, offense):
+        index = GameLineupIndex(offense)
+        assert index.first_at(Position.QB).name == "QB1"
+        assert index.first_at(Position.K) is None
+
+    def test_players_at_preserves_roster_order(self, offense):
+        index = GameLineupIndex(offense)
+        positions = [Position.RB, Position.WR]
+
+        expected = [p for p in offense if p.primary_position in positions]
+
+        assert list(index.players_at(positions)) == expected
+
+    def test_players_at_is_cached(self, offense):
+        index = GameLineupIndex(offense)
+        assert index.players_at([Position.WR]) is index.players_at([Position.WR])
+
+    def test_field_players_matches_uncached_selection(self, offense):
+        index = GameLineupIndex(offense)
+        formation = OffensiveFormation.SHOTGUN
+        personnel = OffensiveFormation.get_personnel_requirements(formation)
+        positions = [Position.WR, Position.TE]
+
+        expected = select_field_players(
+            [p for p in offense if p.primary_position in positions], personnel
+        )
+
+        assert list(index.field_players(formation, personnel, positions)) == expected
+
+    def test_field_ratings(self, offense):
+        index = GameLineupIndex(offense)
+        formation = OffensiveFormation.SHOTGUN
+        personnel = OffensiveFormation.get_personnel_requirements(formation)
+        line = [Position.LT, Position.LG, Position.C, Position.RG, Position.RT]
+
+        assert index.field_ratings(formation, personnel, line) == (78, 74, 76, 73, 77)
+
+
+class TestUpdate:
+    """update() re-indexes after rotation or injury."""
+
+    def test_update_invalidates_caches(self, defense):
+        index = GameLineupIndex(defense)
+        assert index.first_at(Position.DE).name == "DE1"
+
+        rotated = [defense[1], defense[0]] + defense[2:]
+        index.update(rotated)
+
+        assert index.covers(rotated)
+        assert not index.covers(defense)
+        assert index.first_at(Position.DE).name == "DE2"
+
+    def test_update_after_injury(self, offense):
+        index = GameLineupIndex(offense)
+        healthy = [p for p in offense if p.name != "QB1"]
+
+        index.update(healthy)
+
+        assert index.first_at(Position.QB).name == "QB2"
+
+
+class TestSimulatorIntegration:
+    """Simulators return the same players with and without an index."""
+
+    def _simulator(self, offense, defense, with_index):
+        return PassPlaySimulator(
+            offensive_players=offense,
+            defensive_players=defense,
+            offensive_formation=OffensiveFormation.SHOTGUN,
+            defensive_formation=DefensiveFormation.NICKEL,
+            offensive_lineup=GameLineupIndex(offense) if with_index else None,
+            defensive_lineup=GameLineupIndex(defense) if with_index else None,
+        )
+
+    @pytest.mark.parametrize("positions", [
+        [Position.WR, Position.TE],
+        [Position.RB],
+        [Position.LT, Position.LG, Position.C, Position.RG, Position.RT],
+    ])
+    def test_offensive_field_players(self, offense, defense, positions):
+        indexed = self._simulator(offense, defense, True)
+        scanned = self._simulator(offense, defense, False)
+
+        assert (indexed._get_field_offensive_players_by_positions(positions)
+                == scanned._get_field_offensive_players_by_positions(positions))
+
+    def test_defensive_field_players(self, offense, defense):
+        indexed = self._simulator(offense, defense, True)
+        scanned = self._simulator(offense, defense, False)
+        positions = [Position.CB, Position.FS, Position.SS, Position.NCB]
+
+        assert (indexed._get_field_defensive_players_by_positions(positions)
+                == scanned._get_field_defensive_players_by_positions(positions))
+        assert (indexed._get_field_defensive_ratings(positions)
+                == scanned._get_field_defensive_ratings(positions))
+
+    def test_stale_index_is_ignored(self, offense, defense):
+        simulator = PassPlaySimulator(
+            offensive_players=offense,
+            defensive_players=defense,
+            offensive_formation=OffensiveFormation.SHOTGUN,
+            defensive_formation=DefensiveFormation.NICKEL,
+            offensive_lineup=GameLineupIndex(offense[1:]),
+        )
+
+        assert simulator._find_player_by_position(Position.QB).name == "QB1"
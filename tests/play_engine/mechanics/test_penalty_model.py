@@ -0,0 +1,178 @@
+"""
+Tests for PenaltyModel - precompiled per-game penalty probabilities.
+
+The single-draw table must reproduce the distribution of the legacy
+sequential per-type rolls, situation buckets must never merge situations
+with different modifiers, and cached team discipline must match the
+uncached calculation.
+"""
+
+import pytest
+
+from play_engine.mechanics.penalties.penalty_config_loader import get_penalty_config
+from play_engine.mechanics.penalties.penalty_engine import PenaltyEngine, PlayContext
+from play_engine.mechanics.penalties.penalty_model import PenaltyModel, discipline_to_modifier
+from play_engine.simulation.run_plays import RunPlaySimulator
+from team_management.players.player import Player, Position
+
+
+def _player(name, position, discipline):
+    return Player(name=name, number=0, primary_position=position,
+                  ratings={'overall': 70, 'discipline': discipline})
+
+
+def _sequential_probabilities(config, team_modifier, context):
+    """First-penalty probabilities of the legacy loop (one roll per type)."""
+    probabilities = {}
+    none_yet = 1.0
+    for penalty_type in config.get_available_penalty_types():
+        rate = (config.get_penalty_base_rate(penalty_type) * team_modifier
+                * config.get_situational_modifier(penalty_type, context.down,
+                                                  context.distance, context.field_position)
+                * config.get_home_field_modifier(context.is_home_team))
+        probabilities[penalty_type] = none_yet * rate
+        none_yet *= 1.0 - rate
+    return probabilities
+
+
+class _FixedRoll:
+    """Random source returning a fixed value."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def random(self):
+        return self.value
+
+
+@pytest.fixture
+def model():
+    return PenaltyModel(get_penalty_config())
+
+
+@pytest.fixture
+def offense():
+    return [
+        _player("QB", Position.QB, 90),
+        _player("C", Position.C, 40),
+        _player("LT", Position.LT, 75),
+        _player("WR", Position.WR, 60),
+    ]
+
+
+@pytest.fixture
+def defense():
+    return [
+        _player("MLB", Position.MIKE, 55),
+        _player("SS", Position.SS, 80),
+        _player("CB", Position.CB, 65),
+    ]
+
+
+SITUATIONS = [
+    PlayContext(down=1, distance=10, field_position=25),
+    PlayContext(down=3, distance=9, field_position=50),
+    PlayContext(down=4, distance=1, field_position=97, is_home_team=False),
+    PlayContext(down=1, distance=5, field_position=92),
+    PlayContext(down=2, distance=2, field_position=5, is_home_team=False),
+]
+
+
+class TestCumulativeTable:
+    """Single-draw table matches the sequential per-type rolls."""
+
+    @pytest.mark.parametrize("context", SITUATIONS)
+    @pytest.mark.parametrize("team_modifier", [0.6, 1.0, 1.6])
+    def test_matches_sequential_distribution(self, model, context, team_modifier):
+        expected = _sequential_probabilities(model.config_loader, team_modifier, context)
+
+        table = model.cumulative_table(team_modifier, context)
+        previous = 0.0
+        for penalty_type, cumulative in zip(model.penalty_types, table):
+            assert cumulative - previous == pytest.approx(expected[penalty_type])
+            previous = cumulative
+
+    def test_table_is_cached(self, model):
+        context = SITUATIONS[0]
+        assert model.cumulative_table(1.0, context) is model.cumulative_table(1.0, context)
+
+    def test_draw_resolves_rolls(self, model):
+        context = SITUATIONS[1]
+        table = model.cumulative_table(1.0, context)
+
+        assert model.draw(0.0, 1.0, context) == model.penalty_types[0]
+        assert model.draw(table[0], 1.0, context) == model.penalty_types[1]
+        assert model.draw(table[-1], 1.0, context) is None
+
+
+class TestSituationBuckets:
+    """Bucket boundaries follow the situational modifier config."""
+
+    @pytest.mark.parametrize("down", [1, 2, 3, 4])
+    @pytest.mark.parametrize("distance", range(0, 16))
+    def test_same_bucket_same_modifiers(self, model, down, distance):
+        config = model.config_loader
+        by_key = {}
+        for field_position in range(0, 101):
+            key = model.situation_key(down, distance, field_position, True)
+            modifiers = tuple(
+                config.get_situational_modifier(t, down, distance, field_position)
+                for t in model.penalty_types
+            )
+            assert by_key.setdefault(key, modifiers) == modifiers
+
+    def test_boundaries_split_buckets(self, model):
+        assert model.situation_key(3, 7, 50, True) != model.situation_key(3, 8, 50, True)
+        assert model.situation_key(1, 10, 79, True) != model.situation_key(1, 10, 80, True)
+        assert model.situation_key(1, 10, 50, True) != model.situation_key(1, 10, 50, False)
+
+    def test_unreferenced_downs_share_bucket(self, model):
+        assert model.situation_key(2, 10, 50, True) == model.situation_key(5, 10, 50, True)
+
+
+class TestTeamDiscipline:
+    """Cached team modifier matches the uncached engine calculation."""
+
+    def test_matches_engine_calculation(self, model, offense, defense):
+        engine = PenaltyEngine()
+        expected = engine._calculate_team_penalty_modifier(offense + defense, True)
+
+        assert model.team_penalty_modifier(offense, defense) == expected
+
+    def test_totals_memoized_per_list(self, model, offense):
+        model.discipline_totals(offense)
+        offense[0].ratings['discipline'] = 0  # Ratings are constant within a game
+
+        assert model.discipline_totals(offense) == model.discipline_totals(list(offense))
+
+    def test_empty_groups(self, model):
+        assert model.team_penalty_modifier([], []) == 1.0
+
+    @pytest.mark.parametrize("avg, modifier", [(85, 0.6), (70, 0.8), (50, 1.0), (30, 1.3), (29.9, 1.6)])
+    def test_discipline_to_modifier(self, avg, modifier):
+        assert discipline_to_modifier(avg) == modifier
+
+
+class TestEngineReuse:
+    """One engine serves every play of a game."""
+
+    def test_simulators_share_engine(self, offense, defense):
+        engine = PenaltyEngine()
+
+        simulators = [
+            RunPlaySimulator(offensive_players=offense, defensive_players=defense,
+                             offensive_formation="i_formation", defensive_formation="4_3_base",
+                             penalty_engine=engine)
+            for _ in range(2)
+        ]
+
+        assert all(simulator.penalty_engine is engine for simulator in simulators)
+
+    def test_one_roll_per_check(self, offense, defense):
+        engine = PenaltyEngine()
+        engine._rng = _FixedRoll(0.999999)
+
+        result = engine.check_for_penalty(offense, defense, PlayContext(), original_play_yards=4)
+
+        assert not result.penalty_occurred
+        assert result.modified_yards == 4
@@ -0,0 +1,162 @@
+"""
+Tests for PlayerStatsAccumulator - array-backed per-game player totals.
+
+Covers:
+- Sum/max merge semantics over the fixed stat schema
+- Player keys (player_id, name fallback) and "Name_Position" lookups
+- Lazy materialization of PlayerStats totals
+- Slotted PlayerStats (to_dict() in place of vars())
+"""
+
+import pickle
+
+import pytest
+
+from play_engine.simulation.stats import (
+    PLAYER_STAT_FIELDS,
+    PLAYER_STAT_INDEX,
+    PlayerStats,
+    PlayerStatsAccumulator,
+    PlayStatsSummary,
+)
+
+
+def _stats(name="Runner", position="running_back", player_id=None, **values):
+    stats = PlayerStats(player_name=name, player_number=22, position=position,
+                        team_id=1, player_id=player_id)
+    for field_name, value in values.items():
+        setattr(stats, field_name, value)
+    return stats
+
+
+def _play(*player_stats):
+    return PlayStatsSummary(play_type="run", yards_gained=0, time_elapsed=5.0,
+                            player_stats=list(player_stats))
+
+
+@pytest.fixture
+def accumulator():
+    return PlayerStatsAccumulator("test_game")
+
+
+class TestSchema:
+    """Fixed field-index schema."""
+
+    def test_identity_fields_excluded(self):
+        assert "player_name" not in PLAYER_STAT_INDEX
+        assert "player_attributes" not in PLAYER_STAT_INDEX
+
+    def test_index_matches_field_order(self):
+        assert all(PLAYER_STAT_FIELDS[i] == name for name, i in PLAYER_STAT_INDEX.items())
+
+
+class TestMerge:
+    """Merged totals follow the sum/max rules."""
+
+    def test_sum_fields(self, accumulator):
+        accumulator.add_play_stats(_play(_stats(rushing_attempts=1, rushing_yards=7)))
+        accumulator.add_play_stats(_play(_stats(rushing_attempts=1, rushing_yards=-2)))
+
+        totals = accumulator.get_player_stats("Runner_running_back")
+
+        assert totals.rushing_attempts == 2
+        assert totals.rushing_yards == 5
+        assert isinstance(totals.rushing_yards, int)
+
+    def test_max_fields(self, accumulator):
+        accumulator.add_play_stats(_play(_stats(rushing_long=12)))
+        accumulator.add_play_stats(_play(_stats(rushing_long=4)))
+
+        assert accumulator.get_player_stats("Runner_running_back").rushing_long == 12
+
+    def test_float_fields(self, accumulator):
+        accumulator.add_play_stats(_play(_stats("End", "defensive_end", sacks=0.5)))
+        accumulator.add_play_stats(_play(_stats("End", "defensive_end", sacks=0.5, time_to_throw_total=0.0)))
+
+        totals = accumulator.get_player_stats("End_defensive_end")
+
+        assert totals.sacks == 1.0
+        assert totals.time_to_throw_total == 0.0
+
+    def test_players_without_stats_skipped(self, accumulator):
+        accumulator.add_play_stats(_play(_stats("Idle", "wide_receiver")))
+
+        assert accumulator.get_player_stats("Idle_wide_receiver") is None
+        assert accumulator.get_plays_processed() == 1
+
+    def test_snaps_only_players_tracked(self, accumulator):
+        accumulator.add_play_stats(_play(_stats("Guard", "left_guard", offensive_snaps=1)))
+
+        assert accumulator.get_player_count() == 1
+
+
+class TestPlayerKeys:
+    """Players are keyed by player_id, with the name as fallback and guard."""
+
+    def test_same_id_merged(self, accumulator):
+        accumulator.add_play_stats(_play(_stats(player_id=7, rushing_yards=3)))
+        accumulator.add_play_stats(_play(_stats(player_id=7, rushing_yards=4)))
+
+        assert accumulator.get_player_stats("Runner_running_back").rushing_yards == 7
+
+    def test_colliding_ids_kept_apart(self, accumulator):
+        accumulator.add_play_stats(_play(_stats("A", player_id=7, rushing_yards=3)))
+        accumulator.add_play_stats(_play(_stats("B", player_id=7, rushing_yards=4)))
+
+        assert accumulator.get_player_count() == 2
+
+
+class TestMaterialization:
+    """Totals are materialized on query and refreshed after new plays."""
+
+    def test_totals_refreshed_after_new_play(self, accumulator):
+        accumulator.add_play_stats(_play(_stats(rushing_yards=3)))
+        totals = accumulator.get_player_stats("Runner_running_back")
+
+        accumulator.add_play_stats(_play(_stats(rushing_yards=4)))
+
+        assert accumulator.get_player_stats("Runner_running_back") is totals
+        assert totals.rushing_yards == 7
+
+    def test_identity_updates_persist(self, accumulator):
+        accumulator.add_play_stats(_play(_stats(rushing_yards=3)))
+        accumulator.get_all_players_with_stats()[0].team_id = 2
+
+        accumulator.add_play_stats(_play(_stats(rushing_yards=4)))
+
+        assert accumulator.get_all_players_with_stats()[0].team_id == 2
+
+    def test_reset(self, accumulator):
+        accumulator.add_play_stats(_play(_stats(rushing_yards=3)))
+        accumulator.reset()
+
+        assert accumulator.get_all_players_with_stats() == []
+        assert accumulator.get_player_stats("Runner_running_back") is None
+
+
+class TestSlottedPlayerStats:
+    """PlayerStats has no __dict__; to_dict() replaces vars()."""
+
+    def test_undeclared_attribute_rejected(self):
+        with pytest.raises(AttributeError):
+            _stats().not_a_stat = 1
+
+    def test_to_dict(self):
+        stats = _stats(rushing_yards=9)
+
+        as_dict = stats.to_dict()
+
+        assert as_dict["player_name"] == "Runner"
+        assert as_dict["rushing_yards"] == 9
+
+    def test_get_total_stats_and_has_stats(self):
+        stats = _stats(rushing_yards=9, defensive_snaps=1)
+
+        assert stats.get_total_stats() == {"rushing_yards": 9, "defensive_snaps": 1}
+        assert stats.has_stats()
+        assert not _stats().has_stats()
+
+    def test_pickle_round_trip(self):
+        stats = _stats(rushing_yards=9)
+
+        assert pickle.loads(pickle.dumps(stats)) == stats
@@ -0,0 +1,356 @@
+"""
+Tests for SeasonStatAggregates - materialized season totals and ranks.
+
+Covers:
+- Incremental totals match a full re-aggregation of player_game_stats
+- Games are never counted twice
+- Precomputed player ranks match statistics.rankings
+- Team rankings through StatsAPI
+- Backfill of games missing from the aggregates, with or without stats
+- Rebuild when a game's stats are replaced
+- Week persistence updating the aggregates in its transaction; reads never do
+- GameCycleDatabase backfilling databases from before the stats versions
+"""
+
+import os
+import random
+import sqlite3
+import tempfile
+
+import pytest
+
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.services.week_persistence_batch import WeekPersistenceBatch
+from statistics.rankings import add_all_rankings, get_percentile
+from statistics.season_stat_aggregates import RANKED_CATEGORIES, SeasonStatAggregates
+from statistics.stats_api import StatsAPI
+
+
+DYNASTY = "aggregates_test"
+SEASON = 2025
+
+# Full re-aggregation, as StatsAPI._get_all_player_stats() used to run it
+FULL_AGGREGATION_SQL = """
+    SELECT pgs.player_id, pgs.player_name, pgs.team_id, pgs.position,
+           COUNT(DISTINCT pgs.game_id) AS games,
+           SUM(pgs.passing_yards) AS passing_yards,
+           SUM(pgs.passing_tds) AS passing_touchdowns,
+           SUM(pgs.rushing_yards) AS rushing_yards,
+           SUM(pgs.receiving_yards) AS receiving_yards,
+           SUM(pgs.sacks) AS sacks
+    FROM player_game_stats pgs
+    JOIN games g ON pgs.game_id = g.game_id AND pgs.dynasty_id = g.dynasty_id
+    WHERE pgs.dynasty_id = ? AND g.season = ? AND pgs.season_type = 'regular_season'
+    GROUP BY pgs.player_id, pgs.player_name, pgs.team_id, pgs.position
+"""
+
+
+@pytest.fixture
+def db_path():
+    """GameCycleDatabase with one dynasty."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.execute("""
+        INSERT INTO teams (team_id, name, abbreviation, conference, division)
+        VALUES (1, 'Buffalo Bills', 'BUF', 'AFC', 'East')
+    """)
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Aggregates', 1)",
+        (DYNASTY,)
+    )
+    conn.commit()
+    db.close()
+
+    yield path
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _game(week, home_team_id, away_team_id):
+    return {
+        "game_id": f"g_{week}_{home_team_id}_{away_team_id}", "season": SEASON, "week": week,
+        "home_team_id": home_team_id, "away_team_id": away_team_id,
+        "home_score": 24, "away_score": 17,
+    }
+
+
+def _player_stats(rng, team_ids):
+    """Three players per team with random stats (ties included)."""
+    stats = []
+    for team_id in team_ids:
+        stats.extend([
+            {"player_id": f"qb_{team_id}", "player_name": f"QB {team_id}", "team_id": team_id,
+             "position": "QB", "passing_yards": rng.choice([180, 220, 250]),
+             "passing_tds": rng.randint(0, 3), "rushing_yards": rng.randint(0, 20)},
+            {"player_id": f"rb_{team_id}", "player_name": f"RB {team_id}", "team_id": team_id,
+             "position": "RB", "rushing_yards": rng.randint(30, 120), "receiving_yards": rng.randint(0, 40)},
+            {"player_id": f"de_{team_id}", "player_name": f"DE {team_id}", "team_id": team_id,
+             "position": "DE", "sacks": rng.choice([0, 0.5, 1.0, 2.0])},
+        ])
+    return stats
+
+
+AGGREGATE_TABLES = (
+    "season_player_stat_ranks", "season_player_stat_totals",
+    "season_team_stat_totals", "season_stat_aggregate_games",
+)
+
+
+def _simulate_weeks(db_path, weeks):
+    """Persist weeks of games for teams 1-8 through WeekPersistenceBatch."""
+    rng = random.Random(7)
+    db = GameCycleDatabase(db_path)
+    try:
+        for week in weeks:
+            batch = WeekPersistenceBatch(db, DYNASTY, SEASON)
+            for home, away in ((1, 2), (3, 4), (5, 6), (7, 8)):
+                game = _game(week, home, away)
+                batch.add_game_result(game)
+                batch.add_player_stats(game["game_id"], _player_stats(rng, (home, away)))
+            batch.flush()
+    finally:
+        db.close()
+
+
+def _connect(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _clear_aggregates(db_path):
+    """Empty the aggregate tables, as for seasons played before they existed."""
+    conn = _connect(db_path)
+    for table in AGGREGATE_TABLES:
+        conn.execute(f"DELETE FROM {table}")
+    conn.commit()
+    conn.close()
+
+
+def _qb_games(conn, team_id=1):
+    totals = SeasonStatAggregates(DYNASTY).get_player_totals(conn, SEASON)
+    return next(r for r in totals if r["player_id"] == f"qb_{team_id}")["games"]
+
+
+class TestTotals:
+    """Incremental totals equal a full re-aggregation."""
+
+    def test_matches_full_aggregation(self, db_path):
+        _simulate_weeks(db_path, range(1, 5))
+
+        conn = _connect(db_path)
+        expected = {row["player_id"]: dict(row) for row in conn.execute(FULL_AGGREGATION_SQL, (DYNASTY, SEASON))}
+        totals = SeasonStatAggregates(DYNASTY).get_player_totals(conn, SEASON)
+        conn.close()
+
+        assert len(totals) == len(expected) == 24
+        for row in totals:
+            assert {key: row[key] for key in expected[row["player_id"]]} == expected[row["player_id"]]
+
+    def test_games_not_counted_twice(self, db_path):
+        _simulate_weeks(db_path, range(1, 3))
+        aggregates = SeasonStatAggregates(DYNASTY)
+
+        conn = _connect(db_path)
+        before = aggregates.get_player_totals(conn, SEASON)
+        added = aggregates.apply_games(conn, SEASON, "regular_season", ["g_1_1_2", "g_2_3_4"])
+        after = aggregates.get_player_totals(conn, SEASON)
+        conn.close()
+
+        assert added == 0
+        assert after == before
+
+    def test_refresh_backfills_missing_games(self, db_path):
+        _simulate_weeks(db_path, range(1, 3))
+        _clear_aggregates(db_path)
+        aggregates = SeasonStatAggregates(DYNASTY)
+
+        conn = _connect(db_path)
+        assert aggregates.refresh(conn, SEASON) == 8
+        assert aggregates.refresh(conn, SEASON) == 0
+        assert _qb_games(conn) == 2
+        conn.close()
+
+    def test_game_without_stats_recorded(self, db_path):
+        db = GameCycleDatabase(db_path)
+        batch = WeekPersistenceBatch(db, DYNASTY, SEASON)
+        batch.add_game_result(_game(1, 1, 2))
+        counts = batch.flush()
+        db.close()
+
+        conn = _connect(db_path)
+        recorded = conn.execute(
+            "SELECT game_id, stats_rows FROM season_stat_aggregate_games"
+        ).fetchall()
+        assert SeasonStatAggregates(DYNASTY).refresh(conn, SEASON) == 0
+        conn.close()
+
+        assert counts["season_stat_aggregates"] == 1
+        assert [tuple(row) for row in recorded] == [("g_1_1_2", 0)]
+
+    def test_replaced_stats_rebuild_season(self, db_path):
+        _simulate_weeks(db_path, range(1, 3))
+        game = _game(1, 1, 2)
+        stats = _player_stats(random.Random(99), (1, 2))
+        stats[0]["passing_yards"] = 999
+
+        # Re-simulated game: same game_id, its stats rows replaced
+        db = GameCycleDatabase(db_path)
+        batch = WeekPersistenceBatch(db, DYNASTY, SEASON)
+        batch.add_game_result(game)
+        batch.add_player_stats(game["game_id"], stats)
+        batch.flush()
+        db.close()
+
+        conn = _connect(db_path)
+        expected = {row["player_id"]: dict(row) for row in conn.execute(FULL_AGGREGATION_SQL, (DYNASTY, SEASON))}
+        totals = SeasonStatAggregates(DYNASTY).get_player_totals(conn, SEASON)
+        conn.close()
+
+        assert expected["qb_1"]["games"] == 2
+        for row in totals:
+            assert {key: row[key] for key in expected[row["player_id"]]} == expected[row["player_id"]]
+
+    def test_rebuild_matches_incremental(self, db_path):
+        _simulate_weeks(db_path, range(1, 4))
+        aggregates = SeasonStatAggregates(DYNASTY)
+
+        conn = _connect(db_path)
+        incremental = aggregates.get_player_totals(conn, SEASON)
+        assert aggregates.rebuild(conn, SEASON) == 12
+        rebuilt = aggregates.get_player_totals(conn, SEASON)
+        conn.close()
+
+        key = lambda row: row["player_id"]
+        assert sorted(rebuilt, key=key) == sorted(incremental, key=key)
+
+
+class TestRanks:
+    """Precomputed ranks match the Python ranking functions."""
+
+    @pytest.mark.parametrize("category", ["passing_yards", "rushing_yards", "sacks"])
+    def test_player_rank_matches_rankings_module(self, db_path, category):
+        _simulate_weeks(db_path, range(1, 4))
+        api = StatsAPI(db_path, DYNASTY)
+
+        all_stats = add_all_rankings(api._get_all_player_stats(SEASON), category)
+        values = [s[category] for s in all_stats]
+        for stat in all_stats:
+            rank = api.get_player_rank(stat["player_id"], SEASON, category)
+            assert rank == {
+                "player_id": stat["player_id"],
+                "stat_value": stat[category],
+                "league_rank": stat["league_rank"],
+                "conference_rank": stat["conference_rank"],
+                "division_rank": stat["division_rank"],
+                "percentile": pytest.approx(get_percentile(stat[category], values)),
+            }
+
+    def test_every_category_ranked(self, db_path):
+        _simulate_weeks(db_path, [1])
+
+        conn = _connect(db_path)
+        categories = {row[0] for row in conn.execute(
+            "SELECT DISTINCT stat_category FROM season_player_stat_ranks"
+        )}
+        conn.close()
+
+        assert categories == set(RANKED_CATEGORIES)
+
+    def test_unknown_player(self, db_path):
+        _simulate_weeks(db_path, [1])
+
+        assert StatsAPI(db_path, DYNASTY).get_player_rank("nobody", SEASON, "passing_yards") == {}
+
+
+class TestTeamRankings:
+    """Team totals and ranks for teams 1-32."""
+
+    def test_team_rankings(self, db_path):
+        _simulate_weeks(db_path, range(1, 3))
+        api = StatsAPI(db_path, DYNASTY)
+
+        teams = api.get_all_team_stats(SEASON)
+        by_offense = sorted(
+            teams, key=lambda t: t.total_passing_yards + t.total_rushing_yards, reverse=True
+        )
+        by_passing = sorted(teams, key=lambda t: t.total_passing_yards, reverse=True)
+
+        assert len(teams) == 32
+        for rank, team in enumerate(by_offense, start=1):
+            rankings = api.get_team_rankings(team.team_id, SEASON)
+            assert rankings["offensive_rank"] == rank
+            assert rankings["passing_rank"] == by_passing.index(team) + 1
+            assert api.get_team_stats(team.team_id, SEASON).offensive_rank == rank
+
+    def test_team_without_stats_ranked_last(self, db_path):
+        _simulate_weeks(db_path, [1])
+
+        rankings = StatsAPI(db_path, DYNASTY).get_team_rankings(32, SEASON)
+
+        assert rankings["offensive_rank"] == 32
+
+
+class TestWeekPersistence:
+    """The week's batch updates the aggregates before committing; reads never write."""
+
+    def test_flush_updates_aggregates(self, db_path):
+        db = GameCycleDatabase(db_path)
+        batch = WeekPersistenceBatch(db, DYNASTY, SEASON)
+        game = _game(1, 1, 2)
+        batch.add_game_result(game)
+        batch.add_player_stats(game["game_id"], _player_stats(random.Random(1), (1, 2)))
+
+        counts = batch.flush()
+        db.close()
+
+        assert counts["season_stat_aggregates"] == 1
+        conn = _connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM season_player_stat_totals").fetchone()[0] == 6
+        conn.close()
+
+    def test_reads_do_not_update_aggregates(self, db_path):
+        _simulate_weeks(db_path, [1])
+        _clear_aggregates(db_path)
+        api = StatsAPI(db_path, DYNASTY)
+
+        assert api.get_player_rank("qb_1", SEASON, "passing_yards") == {}
+        api.get_all_team_stats(SEASON)
+
+        conn = _connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM season_stat_aggregate_games").fetchone()[0] == 0
+        conn.close()
+
+
+class TestMigration:
+    """GameCycleDatabase rebuilds aggregates from before the stats versions."""
+
+    def test_old_ledger_rebuilt_on_open(self, db_path):
+        _simulate_weeks(db_path, range(1, 3))
+        conn = _connect(db_path)
+        conn.execute("DROP TABLE season_stat_aggregate_games")
+        conn.execute("""
+            CREATE TABLE season_stat_aggregate_games (
+                dynasty_id TEXT NOT NULL, game_id TEXT NOT NULL,
+                season_type TEXT NOT NULL, season INTEGER NOT NULL,
+                PRIMARY KEY (dynasty_id, game_id)
+            )
+        """)
+        conn.execute("DELETE FROM season_player_stat_totals")
+        conn.execute("DELETE FROM schema_version")
+        conn.commit()
+        conn.close()
+
+        GameCycleDatabase(db_path).close()
+
+        conn = _connect(db_path)
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(season_stat_aggregate_games)")]
+        assert "stats_version" in columns
+        assert _qb_games(conn) == 2
+        conn.close()
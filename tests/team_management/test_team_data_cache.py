@@ -0,0 +1,192 @@
+"""
+Tests for TeamDataCache - season-scoped rosters and coaching staff.
+
+Covers:
+- Cached rosters match TeamRosterGenerator.load_team_roster()
+- One database load per team until invalidated or the season changes
+- Fresh Player objects per call
+- Invalidation hooks fired by roster transactions and injuries
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.models.injury_models import BodyPart, Injury, InjurySeverity, InjuryType
+from src.game_cycle.services.injury_service import InjuryService
+from database.player_roster_api import PlayerRosterAPI
+from team_management.personnel import TeamRosterGenerator
+from team_management.team_data_cache import (
+    clear_team_data_caches,
+    get_team_data_cache,
+    invalidate_team_data,
+)
+
+
+DYNASTY = "cache_test"
+
+
+@pytest.fixture
+def db_path():
+    """Temporary database with two small rosters (teams 1 and 2)."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.execute("""
+        INSERT INTO teams (team_id, name, abbreviation, conference, division)
+        VALUES (1, 'Buffalo Bills', 'BUF', 'AFC', 'East'), (2, 'Miami Dolphins', 'MIA', 'AFC', 'East')
+    """)
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Cache Test', 1)",
+        (DYNASTY,)
+    )
+    players = [
+        (101, 'Backup', 'Quarterback', 12, 1, '["quarterback"]', '{"overall": 65}', 2),
+        (102, 'Starting', 'Quarterback', 9, 1, '["quarterback"]', '{"overall": 88}', 1),
+        (103, 'Lead', 'Back', 28, 1, '["running_back"]', '{"overall": 80}', 1),
+        (201, 'Other', 'Passer', 7, 2, '["quarterback"]', '{"overall": 75}', 1),
+    ]
+    for player_id, first, last, number, team_id, positions, attributes, depth in players:
+        conn.execute("""
+            INSERT INTO players (dynasty_id, player_id, first_name, last_name,
+                                 number, team_id, positions, attributes)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (DYNASTY, player_id, first, last, number, team_id, positions, attributes))
+        conn.execute("""
+            INSERT INTO team_rosters (dynasty_id, team_id, player_id, depth_chart_order)
+            VALUES (?, ?, ?, ?)
+        """, (DYNASTY, team_id, player_id, depth))
+    conn.commit()
+    db.close()
+
+    clear_team_data_caches()
+    yield path
+    clear_team_data_caches()
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _set_overall(db_path, player_id, overall):
+    """Change a player's ratings behind the cache's back."""
+    db = GameCycleDatabase(db_path)
+    conn = db.get_connection()
+    conn.execute(
+        "UPDATE players SET attributes = ? WHERE dynasty_id = ? AND player_id = ?",
+        (f'{{"overall": {overall}}}', DYNASTY, player_id)
+    )
+    conn.commit()
+    db.close()
+
+
+def _overall(roster, player_id):
+    return next(p for p in roster if p.player_id == player_id).ratings['overall']
+
+
+class TestRosters:
+    """Cached rosters match direct database loads."""
+
+    def test_matches_load_team_roster(self, db_path):
+        cached = get_team_data_cache(db_path, DYNASTY).get_roster(1, season=2025)
+        loaded = TeamRosterGenerator.load_team_roster(1, dynasty_id=DYNASTY, db_path=db_path)
+
+        assert [p.player_id for p in cached] == [p.player_id for p in loaded] == [102, 103, 101]
+        assert [p.ratings for p in cached] == [p.ratings for p in loaded]
+        assert [p.depth_chart_order for p in cached] == [1, 1, 2]
+
+    def test_fresh_players_per_call(self, db_path):
+        cache = get_team_data_cache(db_path, DYNASTY)
+
+        first = cache.get_roster(1, season=2025)
+        first[0].ratings['overall'] = 0
+        second = cache.get_roster(1, season=2025)
+
+        assert first[0] is not second[0]
+        assert second[0].ratings['overall'] == 88
+
+    def test_loaded_once_per_team(self, db_path):
+        cache = get_team_data_cache(db_path, DYNASTY)
+        cache.get_roster(1, season=2025)
+
+        _set_overall(db_path, 102, 50)
+
+        assert _overall(cache.get_roster(1, season=2025), 102) == 88
+
+    def test_new_season_reloads(self, db_path):
+        cache = get_team_data_cache(db_path, DYNASTY)
+        cache.get_roster(1, season=2025)
+
+        _set_overall(db_path, 102, 50)
+
+        assert _overall(cache.get_roster(1, season=2026), 102) == 50
+
+    def test_shared_per_database_and_dynasty(self, db_path):
+        assert get_team_data_cache(db_path, DYNASTY) is get_team_data_cache(db_path, DYNASTY)
+        assert get_team_data_cache(db_path, DYNASTY) is not get_team_data_cache(db_path, "other")
+
+    def test_coaching_staff_cached(self, db_path):
+        cache = get_team_data_cache(db_path, DYNASTY)
+
+        staff = cache.get_coaching_staff(1, season=2025)
+
+        assert staff is not None
+        assert cache.get_coaching_staff(1, season=2025) is staff
+
+
+class TestInvalidation:
+    """Invalidation hooks drop only the affected entries."""
+
+    def test_invalidate_single_team(self, db_path):
+        cache = get_team_data_cache(db_path, DYNASTY)
+        cache.get_roster(1, season=2025)
+        cache.get_roster(2, season=2025)
+
+        invalidate_team_data(DYNASTY, 1)
+
+        assert not cache.is_cached(1)
+        assert cache.is_cached(2)
+
+    def test_other_dynasty_untouched(self, db_path):
+        cache = get_team_data_cache(db_path, DYNASTY)
+        cache.get_roster(1, season=2025)
+
+        invalidate_team_data("other", 1)
+
+        assert cache.is_cached(1)
+
+    def test_roster_move_invalidates(self, db_path):
+        cache = get_team_data_cache(db_path, DYNASTY)
+        cache.get_roster(1, season=2025)
+        cache.get_roster(2, season=2025)
+
+        PlayerRosterAPI(db_path).update_player_team(DYNASTY, 103, 2)
+
+        assert sorted(p.player_id for p in cache.get_roster(2, season=2025)) == [103, 201]
+        assert 103 not in [p.player_id for p in cache.get_roster(1, season=2025)]
+
+    def test_injury_invalidates_team(self, db_path):
+        cache = get_team_data_cache(db_path, DYNASTY)
+        cache.get_roster(1, season=2025)
+        cache.get_roster(2, season=2025)
+
+        InjuryService(db_path, DYNASTY, 2025).record_injury(Injury(
+            player_id=103,
+            player_name="Lead Back",
+            team_id=1,
+            injury_type=InjuryType.ACL_TEAR,
+            body_part=BodyPart.KNEE,
+            severity=InjurySeverity.SEVERE,
+            weeks_out=6,
+            week_occurred=3,
+            season=2025,
+            occurred_during='game'
+        ))
+
+        assert not cache.is_cached(1)
+        assert cache.is_cached(2)
@@ -0,0 +1,268 @@
+"""
+Tests for the indexed schedule columns on the events table.
+
+Covers:
+- Migration 14 adding game_season/game_week/game_season_type to an existing
+  events table and backfilling idx_events_schedule
+- ensure_schedule_columns() idempotence and missing events table
+- EventDatabaseAPI creating the columns on new databases
+- Columns following updates to the event JSON
+- events_get_games_by_week / events_get_games_by_season results and
+  index use
+- Week lookups staying flat as seasons of events accumulate
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import time
+
+import pytest
+
+from src.database.unified_api import UnifiedDatabaseAPI, ensure_schedule_columns
+from src.events.event_database_api import EventDatabaseAPI
+from src.game_cycle.database.connection import GameCycleDatabase
+
+
+DYNASTY = "schedule_index_test"
+WEEK_QUERY_PLAN = """
+    EXPLAIN QUERY PLAN
+    SELECT event_id, game_id, data FROM events
+    WHERE dynasty_id = ? AND game_season = ?
+    AND game_week = ? AND game_season_type = ?
+    AND event_type = 'GAME'
+"""
+
+
+def _game_row(season, week, game_number, season_type="regular_season", dynasty_id=DYNASTY):
+    """events row for one scheduled game (week order reversed by date)."""
+    game_id = f"{season}_{season_type}_{week}_{game_number}"
+    data = {
+        "parameters": {
+            "season": season,
+            "week": week,
+            "season_type": season_type,
+            "home_team_id": game_number * 2 + 1,
+            "away_team_id": game_number * 2 + 2,
+            "game_date": f"{season}-09-{28 - game_number:02d}",
+        },
+        "results": None,
+        "metadata": {},
+    }
+    return (f"event_{game_id}", "GAME", season * 1000 + week, game_id, dynasty_id, json.dumps(data))
+
+
+def _insert_seasons(conn, seasons, weeks=18, games_per_week=16):
+    """Full regular seasons of GAME events plus one non-game event per week."""
+    rows = []
+    for season in seasons:
+        for week in range(1, weeks + 1):
+            rows.extend(_game_row(season, week, n) for n in range(games_per_week))
+            rows.append((
+                f"deadline_{season}_{week}", "DEADLINE", season * 1000 + week,
+                f"deadline_{season}_{week}", DYNASTY, json.dumps({"parameters": {"season": season}}),
+            ))
+    conn.executemany(
+        "INSERT INTO events (event_id, event_type, timestamp, game_id, dynasty_id, data) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows
+    )
+    conn.commit()
+
+
+def _columns(conn):
+    return {row[1] for row in conn.execute("PRAGMA table_xinfo(events)")}
+
+
+def _indexes(conn):
+    return {row[1] for row in conn.execute("PRAGMA index_list(events)")}
+
+
+@pytest.fixture
+def db_path():
+    """Initialized game cycle database with two teams and the test dynasty."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.execute("""
+        INSERT INTO teams (team_id, name, abbreviation, conference, division)
+        VALUES (1, 'Buffalo Bills', 'BUF', 'AFC', 'East'), (2, 'Miami Dolphins', 'MIA', 'AFC', 'East')
+    """)
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Schedule', 1)",
+        (DYNASTY,)
+    )
+    conn.commit()
+    db.close()
+
+    yield path
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@pytest.fixture
+def api(db_path):
+    return UnifiedDatabaseAPI(db_path, DYNASTY)
+
+
+@pytest.fixture
+def temp_path():
+    """Path for a database created by the test itself."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    os.unlink(path)
+    yield path
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class TestMigration:
+    """Existing databases get the columns and a backfilled index."""
+
+    def test_migration_backfills_existing_events(self, temp_path):
+        conn = sqlite3.connect(temp_path)
+        conn.execute("""
+            CREATE TABLE events (
+                event_id TEXT PRIMARY KEY,
+                event_type TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
+                game_id TEXT,
+                dynasty_id TEXT,
+                data TEXT NOT NULL
+            )
+        """)
+        _insert_seasons(conn, [2025], weeks=2, games_per_week=2)
+        conn.close()
+
+        db = GameCycleDatabase(temp_path)
+        try:
+            conn = db.get_connection()
+            assert {"game_season", "game_week", "game_season_type"} <= _columns(conn)
+            assert "idx_events_schedule" in _indexes(conn)
+
+            rows = conn.execute(
+                "SELECT game_id FROM events INDEXED BY idx_events_schedule "
+                "WHERE dynasty_id = ? AND game_season = 2025 AND game_season_type = 'regular_season' "
+                "AND game_week = 2 ORDER BY game_id",
+                (DYNASTY,)
+            ).fetchall()
+            assert [r[0] for r in rows] == ["2025_regular_season_2_0", "2025_regular_season_2_1"]
+
+            # Existing rows keep working with SELECT * / positional INSERT
+            row = conn.execute("SELECT * FROM events WHERE event_type = 'DEADLINE' LIMIT 1").fetchone()
+            assert row["game_week"] is None
+        finally:
+            db.close()
+
+    def test_ensure_is_idempotent(self, db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            assert ensure_schedule_columns(conn) == 0
+            assert ensure_schedule_columns(conn) == 0
+        finally:
+            conn.close()
+
+    def test_no_events_table(self):
+        conn = sqlite3.connect(":memory:")
+        assert ensure_schedule_columns(conn) == 0
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'events'").fetchone() is None
+        conn.close()
+
+    def test_event_database_api_creates_columns(self, temp_path):
+        EventDatabaseAPI(temp_path)
+        conn = sqlite3.connect(temp_path)
+        try:
+            assert {"game_season", "game_week", "game_season_type"} <= _columns(conn)
+            assert "idx_events_schedule" in _indexes(conn)
+        finally:
+            conn.close()
+
+
+class TestScheduleQueries:
+    """Schedule lookups read the typed columns."""
+
+    def test_games_by_week(self, db_path, api):
+        conn = sqlite3.connect(db_path)
+        _insert_seasons(conn, [2025, 2026], weeks=3, games_per_week=3)
+        conn.execute("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?)",
+                     _game_row(2025, 2, 0, season_type="preseason"))
+        conn.commit()
+        conn.close()
+
+        games = api.events_get_games_by_week(2025, 2)
+
+        assert [g["game_id"] for g in games] == [
+            "2025_regular_season_2_2", "2025_regular_season_2_1", "2025_regular_season_2_0"
+        ]  # game_date order
+        assert games[0]["week"] == 2 and games[0]["season"] == 2025
+        assert len(api.events_get_games_by_week(2025, 2, season_type="preseason")) == 1
+        assert api.events_get_games_by_week(2027, 2) == []
+
+    def test_games_by_season_ordered_by_week(self, db_path, api):
+        conn = sqlite3.connect(db_path)
+        _insert_seasons(conn, [2025, 2026], weeks=12, games_per_week=1)
+        conn.close()
+
+        games = api.events_get_games_by_season(2026)
+
+        assert [g["data"]["parameters"]["week"] for g in games] == list(range(1, 13))
+
+    def test_columns_follow_json_updates(self, db_path, api):
+        conn = sqlite3.connect(db_path)
+        _insert_seasons(conn, [2025], weeks=3, games_per_week=1)
+        # Flex scheduling style move of a game to another week
+        conn.execute(
+            "UPDATE events SET data = json_set(data, '$.parameters.week', 3) WHERE game_id = ?",
+            ("2025_regular_season_1_0",)
+        )
+        conn.commit()
+        conn.close()
+
+        assert api.events_get_games_by_week(2025, 1) == []
+        assert len(api.events_get_games_by_week(2025, 3)) == 2
+
+    def test_week_lookup_uses_schedule_index(self, db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            plan = " ".join(
+                row[3] for row in conn.execute(WEEK_QUERY_PLAN, (DYNASTY, 2025, 1, "regular_season"))
+            )
+        finally:
+            conn.close()
+
+        assert "idx_events_schedule" in plan
+        assert "SCAN" not in plan
+
+
+class TestWeekLookupBenchmark:
+    """Week lookups cost the same with one or many seasons stored."""
+
+    @staticmethod
+    def _time_week_lookups(api, season, repeats=20):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for week in range(1, 19):
+                assert len(api.events_get_games_by_week(season, week)) == 16
+        return time.perf_counter() - start
+
+    def test_week_lookups_stay_flat(self, db_path, api):
+        conn = sqlite3.connect(db_path)
+        _insert_seasons(conn, [2025])
+        conn.close()
+        one_season = min(self._time_week_lookups(api, 2025) for _ in range(3))
+
+        conn = sqlite3.connect(db_path)
+        _insert_seasons(conn, range(2026, 2046))
+        conn.close()
+        many_seasons = min(self._time_week_lookups(api, 2025) for _ in range(3))
+
+        # 21x the events; a json_extract scan would grow ~20x
+        assert many_seasons < one_season * 3
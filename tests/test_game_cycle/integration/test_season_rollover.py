@@ -10,6 +10,7 @@ Tests the complete flow of advancing from one season to the next:
 Relates to: Fix for Season 2 Week 1 standings bug (SSOT pattern)
 """
 
+import json
 import pytest
 import sqlite3
 import tempfile
@@ -19,6 +20,7 @@ from pathlib import Path
 from game_cycle.stage_controller import StageController
 from game_cycle.stage_definitions import Stage, StageType
 from database.dynasty_state_api import DynastyStateAPI
+from database.unified_api import UnifiedDatabaseAPI
 
 
 class TestSeasonRollover:
@@ -362,3 +364,45 @@ class TestSeasonRollover:
             assert team['wins'] == 0
             assert team['losses'] == 0
             assert team['ties'] == 0
+
+    def _schedule_week_1(self, db_path: str, dynasty_id: str, season: int, played: bool):
+        """Add a Week 1 GAME event for a season (with a result if played)."""
+        data = {
+            "parameters": {
+                "home_team_id": 1, "away_team_id": 2, "week": 1,
+                "season": season, "season_type": "regular_season"
+            },
+            "results": {"home_score": 24, "away_score": 17} if played else None,
+        }
+        game_id = f"regular_{season}_1_1"
+        UnifiedDatabaseAPI(db_path, dynasty_id).events_insert(
+            event_id=f"game_{game_id}", event_type="GAME", timestamp=0,
+            game_id=game_id, data=json.dumps(data)
+        )
+
+    def test_season_rollover_after_played_season(self, test_db_path):
+        """A finished season's Week 1 games don't keep the dynasty in that season."""
+        dynasty_id = 'test_dynasty'
+        self._initialize_season_1_state(test_db_path, dynasty_id)
+        self._schedule_week_1(test_db_path, dynasty_id, 2024, played=True)
+        self._schedule_week_1(test_db_path, dynasty_id, 2025, played=False)
+
+        controller = StageController(db_path=test_db_path, dynasty_id=dynasty_id)
+        controller.adopt_stage(Stage(StageType.OFFSEASON_WAIVER_WIRE, 2024))
+        next_stage = controller.advance_to_next_stage()
+
+        assert next_stage.stage_type == StageType.REGULAR_WEEK_1
+        assert next_stage.season_year == 2025
+
+    def test_no_rollover_before_first_season(self, test_db_path):
+        """New dynasty: the current season's Week 1 is scheduled but unplayed."""
+        dynasty_id = 'test_dynasty'
+        self._initialize_season_1_state(test_db_path, dynasty_id)
+        self._schedule_week_1(test_db_path, dynasty_id, 2024, played=False)
+
+        controller = StageController(db_path=test_db_path, dynasty_id=dynasty_id)
+        controller.adopt_stage(Stage(StageType.OFFSEASON_WAIVER_WIRE, 2024))
+        next_stage = controller.advance_to_next_stage()
+
+        assert next_stage.stage_type == StageType.REGULAR_WEEK_1
+        assert next_stage.season_year == 2024
@@ -0,0 +1,304 @@
+"""
+Tests for the awards season frame - bulk eligibility and candidate data.
+
+Covers:
+- Eligibility checks and candidates identical with and without the frame
+- All six awards, All-Pro teams and Pro Bowl rosters unchanged by the frame
+- No per-player queries once the frame is loaded
+- StatsAPI.get_all_player_season_stats matching the per-player lookup
+"""
+
+import os
+import random
+import sqlite3
+import tempfile
+
+import pytest
+
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.services.awards.eligibility import EligibilityChecker
+from src.game_cycle.services.awards.models import AwardType
+from src.game_cycle.services.awards.voting_engine import VotingEngine
+from src.game_cycle.services.awards_service import AwardsService
+from src.game_cycle.services.week_persistence_batch import WeekPersistenceBatch
+from statistics.stats_api import StatsAPI
+
+
+DYNASTY = "award_frame_test"
+SEASON = 2025
+# (position in players/grades, abbreviation in player_game_stats)
+POSITIONS = [
+    ("quarterback", "QB"), ("running_back", "RB"), ("wide_receiver", "WR"),
+    ("tight_end", "TE"), ("left_tackle", "LT"), ("center", "C"),
+    ("defensive_end", "DE"), ("defensive_tackle", "DT"), ("middle_linebacker", "MLB"),
+    ("cornerback", "CB"), ("free_safety", "FS"), ("kicker", "K"),
+]
+
+
+def _stat_line(rng, abbreviation):
+    """One game of stats sized for the position."""
+    if abbreviation == "QB":
+        attempts = rng.randint(20, 40)
+        return {"passing_attempts": attempts, "passing_completions": attempts * 2 // 3,
+                "passing_yards": rng.randint(150, 350), "passing_tds": rng.randint(0, 3),
+                "passing_interceptions": rng.randint(0, 2)}
+    if abbreviation == "RB":
+        return {"rushing_attempts": rng.randint(5, 25), "rushing_yards": rng.randint(20, 140),
+                "rushing_tds": rng.randint(0, 2), "receptions": rng.randint(0, 4)}
+    if abbreviation in ("WR", "TE"):
+        return {"receptions": rng.randint(1, 9), "targets": rng.randint(3, 12),
+                "receiving_yards": rng.randint(10, 140), "receiving_tds": rng.randint(0, 2)}
+    if abbreviation in ("DE", "DT", "MLB", "CB", "FS"):
+        return {"tackles_total": rng.randint(1, 9), "sacks": rng.choice([0, 0, 0.5, 1.0]),
+                "interceptions": rng.choice([0, 0, 0, 1]), "forced_fumbles": rng.choice([0, 0, 1])}
+    return {}
+
+
+@pytest.fixture
+def db_path():
+    """32 teams, two players per position on four teams, grades for two seasons and 18 weeks of stats."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    rng = random.Random(5)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO teams (team_id, name, abbreviation, conference, division) VALUES (?, ?, ?, ?, 'East')",
+        [(team_id, f"Team {team_id}", f"T{team_id}", "AFC" if team_id <= 16 else "NFC")
+         for team_id in range(1, 33)]
+    )
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Award Frame', 1)",
+        (DYNASTY,)
+    )
+
+    players = []
+    player_id = 1
+    for team_id in (1, 2, 17, 18):
+        for position, abbreviation in POSITIONS:
+            for _ in range(2):
+                # Rookies, veterans and rookies recorded by birthdate only
+                years_pro = rng.choice([0, 0, 2, 5])
+                birthdate = rng.choice(["2003-03-03", "1995-03-03"]) if years_pro == 0 else None
+                players.append((player_id, team_id, position, abbreviation, years_pro, birthdate))
+                player_id += 1
+
+    conn.executemany(
+        "INSERT INTO players (dynasty_id, player_id, first_name, last_name, number, team_id, "
+        "positions, attributes, birthdate, years_pro) VALUES (?, ?, 'Player', ?, ?, ?, ?, '{}', ?, ?)",
+        [(DYNASTY, pid, f"P{pid}", pid % 99, team_id, f'["{position}"]', birthdate, years_pro)
+         for pid, team_id, position, _, years_pro, birthdate in players]
+    )
+    grade_rows = []
+    for pid, team_id, position, _, _, _ in players:
+        for season in (SEASON - 1, SEASON):
+            if season < SEASON and rng.random() < 0.3:
+                continue
+            grade_rows.append((
+                DYNASTY, season, pid, team_id, position,
+                round(rng.uniform(55, 95), 1), round(rng.uniform(50, 90), 1), round(rng.uniform(50, 90), 1),
+                round(rng.uniform(50, 90), 1), round(rng.uniform(50, 90), 1),
+                rng.choice([80, 300, 600, 900]), rng.choice([10, 14, 18]),
+            ))
+    conn.executemany(
+        "INSERT INTO player_season_grades (dynasty_id, season, player_id, team_id, position, "
+        "overall_grade, passing_grade, pass_blocking_grade, run_blocking_grade, tackling_grade, "
+        "total_snaps, games_graded) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        grade_rows
+    )
+    conn.executemany(
+        "INSERT INTO standings (dynasty_id, team_id, season, season_type, wins, losses, "
+        "division_wins, playoff_seed) VALUES (?, ?, ?, 'regular_season', ?, ?, ?, ?)",
+        [(DYNASTY, team_id, SEASON, 17 - team_id % 12, team_id % 12, 4 + team_id % 3,
+          team_id % 7 + 1 if team_id <= 14 else None)
+         for team_id in range(1, 33)]
+    )
+    conn.commit()
+
+    for week in range(1, 19):
+        batch = WeekPersistenceBatch(db, DYNASTY, SEASON)
+        for home, away in ((1, 17), (2, 18)):
+            game_id = f"g_{week}_{home}_{away}"
+            batch.add_game_result({
+                "game_id": game_id, "season": SEASON, "week": week,
+                "home_team_id": home, "away_team_id": away, "home_score": 24, "away_score": 17,
+            })
+            batch.add_player_stats(game_id, [
+                dict(_stat_line(rng, abbreviation), player_id=str(pid), player_name=f"Player P{pid}",
+                     team_id=team_id, position=abbreviation)
+                for pid, team_id, _, abbreviation, _, _ in players
+                if team_id in (home, away)
+            ])
+        batch.flush()
+    db.close()
+
+    yield path
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _copy(db_path, tmp_path):
+    reference_path = str(tmp_path / "reference.db")
+    source, copy = sqlite3.connect(db_path), sqlite3.connect(reference_path)
+    source.backup(copy)
+    source.close()
+    copy.close()
+    return reference_path
+
+
+def _player_ids(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT player_id FROM players ORDER BY player_id")]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def count_queries(monkeypatch):
+    """Record every SQL statement run on connections opened from now on."""
+    statements = []
+    connect = sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(sqlite3, "connect", traced_connect)
+    return statements
+
+
+ALL_PRO_POSITIONS = ("QB", "RB", "WR", "EDGE", "LB", "CB")
+
+
+class TestEligibility:
+    """The frame gives the same answers as the per-player queries."""
+
+    @pytest.mark.parametrize("award_type", list(AwardType))
+    def test_checks_and_candidates_match(self, db_path, award_type):
+        per_player = EligibilityChecker(db_path, DYNASTY, SEASON)
+        framed = EligibilityChecker(db_path, DYNASTY, SEASON)
+        assert framed.load_season_frame()
+
+        for player_id in _player_ids(db_path):
+            assert framed.check_eligibility(player_id, award_type) == \
+                per_player.check_eligibility(player_id, award_type)
+            assert framed.get_candidate_by_id(player_id, award_type) == \
+                per_player.get_candidate_by_id(player_id, award_type)
+
+        assert framed.get_eligible_candidates(award_type) == per_player.get_eligible_candidates(award_type)
+        fast = framed.get_eligible_candidates_fast(award_type)
+        assert fast and fast == per_player.get_eligible_candidates_fast(award_type)
+
+    def test_all_pro_stat_minimums_match(self, db_path):
+        per_player = EligibilityChecker(db_path, DYNASTY, SEASON)
+        framed = EligibilityChecker(db_path, DYNASTY, SEASON)
+        framed.load_season_frame()
+
+        results = [
+            framed.check_all_pro_stat_minimums(player_id, position)
+            for player_id in _player_ids(db_path)
+            for position in ALL_PRO_POSITIONS
+        ]
+
+        assert results == [
+            per_player.check_all_pro_stat_minimums(player_id, position)
+            for player_id in _player_ids(db_path)
+            for position in ALL_PRO_POSITIONS
+        ]
+        assert {eligible for eligible, _ in results} == {True, False}
+
+    def test_unknown_player(self, db_path):
+        checker = EligibilityChecker(db_path, DYNASTY, SEASON)
+        checker.load_season_frame()
+
+        result = checker.check_eligibility(9999, AwardType.MVP)
+
+        assert not result.is_eligible
+        assert result.reasons == ["Player not found"]
+        assert checker.get_candidate_by_id(9999, AwardType.MVP) is None
+
+    def test_no_queries_after_load(self, db_path, count_queries):
+        checker = EligibilityChecker(db_path, DYNASTY, SEASON)
+        checker.load_season_frame()
+        loaded = len(count_queries)
+
+        for award_type in AwardType:
+            checker.get_eligible_candidates_fast(award_type)
+            for player_id in _player_ids(db_path):
+                checker.get_candidate_by_id(player_id, award_type)
+                checker.check_all_pro_stat_minimums(player_id, "QB")
+
+        # Only _player_ids() itself touches the database
+        assert len(count_queries) == loaded + len(AwardType)
+
+    def test_clear_season_frame(self, db_path, count_queries):
+        checker = EligibilityChecker(db_path, DYNASTY, SEASON)
+        checker.load_season_frame()
+        checker.clear_season_frame()
+        loaded = len(count_queries)
+
+        checker.check_eligibility(1, AwardType.MVP)
+
+        assert not checker.has_season_frame
+        assert len(count_queries) > loaded
+
+
+class TestAwardsService:
+    """Honors results are unchanged; the frame is loaded once."""
+
+    def _run(self, path):
+        service = AwardsService(path, DYNASTY, SEASON)
+        service._voting_engine = VotingEngine(num_voters=50, seed=7)
+        awards = service.calculate_all_awards()
+        all_pro = service.select_all_pro_teams()
+        pro_bowl = service.select_pro_bowl_rosters()
+        return service, awards, all_pro, pro_bowl
+
+    def test_honors_match_per_player_queries(self, db_path, tmp_path, monkeypatch):
+        reference_path = _copy(db_path, tmp_path)
+
+        _, awards, all_pro, pro_bowl = self._run(db_path)
+        monkeypatch.setattr(EligibilityChecker, "load_season_frame", lambda self: False)
+        _, ref_awards, ref_all_pro, ref_pro_bowl = self._run(reference_path)
+
+        assert sum(r.has_winner for r in awards.values()) >= 5
+        assert awards == ref_awards
+        assert all_pro.total_selections > 20
+        assert all_pro == ref_all_pro
+        assert pro_bowl.total_selections > 20
+        assert pro_bowl == ref_pro_bowl
+
+    def test_frame_loaded_once(self, db_path, monkeypatch):
+        loads = []
+        load_season_frame = EligibilityChecker.load_season_frame
+
+        def counting_load(self):
+            loads.append(self)
+            return load_season_frame(self)
+
+        monkeypatch.setattr(EligibilityChecker, "load_season_frame", counting_load)
+
+        service, _, _, _ = self._run(db_path)
+
+        assert len(loads) == 1
+        assert service.eligibility_checker.has_season_frame
+
+
+class TestBulkSeasonStats:
+    """get_all_player_season_stats() matches get_player_season_stats()."""
+
+    def test_matches_per_player_lookup(self, db_path):
+        api = StatsAPI(db_path, DYNASTY)
+
+        season_stats = api.get_all_player_season_stats(SEASON)
+
+        assert len(season_stats) == len(_player_ids(db_path))
+        for player_id in _player_ids(db_path):
+            assert season_stats.get(str(player_id), {}) == api.get_player_season_stats(str(player_id), SEASON)
+        assert all("passer_rating" in s for s in season_stats.values() if s["position"] == "QB")
@@ -0,0 +1,251 @@
+"""
+Tests for DraftBoardEngine - in-memory draft board for simulated picks.
+
+Covers:
+- Same picks and rows as the per-pick process_ai_pick() loop
+  (reach penalty, need boosts, user team draft direction)
+- Only the first 224 available prospects considered
+- sim_to_user_pick stopping before the user's pick
+- Picks committed together (players, contracts, draft order, transactions)
+- A failed commit leaving the draft untouched
+"""
+
+import json
+import os
+import random
+import sqlite3
+import tempfile
+
+import pytest
+
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.models import DraftDirection, DraftStrategy
+from src.game_cycle.services.draft_service import DraftService
+import src.persistence.transaction_logger as transaction_logger
+from offseason.team_needs_analyzer import TeamNeedsAnalyzer
+
+
+DYNASTY = "draft_board_test"
+SEASON = 2025
+USER_TEAM_ID = 5
+POSITIONS = ["QB", "RB", "WR", "TE", "OT", "OG", "C", "EDGE", "DT", "LB", "CB", "S"]
+
+
+@pytest.fixture
+def db_path(monkeypatch):
+    """32 teams, a generated draft class with 40 extra prospects and a draft order."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO teams (team_id, name, abbreviation, conference, division) VALUES (?, ?, ?, 'AFC', 'East')",
+        [(team_id, f"Team {team_id}", f"T{team_id}") for team_id in range(1, 33)]
+    )
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Draft Board', ?)",
+        (DYNASTY, USER_TEAM_ID)
+    )
+    conn.commit()
+    db.close()
+
+    random.seed(1)
+    service = DraftService(path, DYNASTY, SEASON)
+    service.ensure_draft_class_exists()
+    service.ensure_draft_order_exists()
+
+    # 40 more prospects across the board, pushing the lowest rated out of the 224 window
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        INSERT INTO draft_prospects (
+            draft_class_id, dynasty_id, first_name, last_name, position, college, age,
+            overall, potential, attributes, projected_round, projected_pick_min, projected_pick_max
+        )
+        SELECT draft_class_id, dynasty_id, first_name, last_name || ' Jr', position, college, age,
+               overall - 1, potential, attributes, projected_round, projected_pick_min, projected_pick_max
+        FROM draft_prospects WHERE prospect_id % 5 = 0 LIMIT 40
+    """)
+    conn.commit()
+    conn.close()
+
+    # Needs keyed by prospect positions so need boosts apply
+    def analyze_team_needs(self, team_id, season, include_future_contracts=True):
+        rng = random.Random(team_id)
+        return [
+            {"position": position, "urgency_score": rng.choice([0, 2, 3, 4, 5])}
+            for position in POSITIONS
+        ]
+
+    monkeypatch.setattr(TeamNeedsAnalyzer, "analyze_team_needs", analyze_team_needs)
+
+    yield path
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _copy(db_path, tmp_path):
+    reference_path = str(tmp_path / "reference.db")
+    source, copy = sqlite3.connect(db_path), sqlite3.connect(reference_path)
+    source.backup(copy)
+    source.close()
+    copy.close()
+    return reference_path
+
+
+def _per_pick_calls(service, user_team_id, draft_direction=None, stop_at_user_pick=False):
+    """The draft run one process_ai_pick() at a time."""
+    picks = []
+    while True:
+        current_pick = service.get_current_pick()
+        if current_pick is None:
+            break
+        team_id = current_pick["current_team_id"]
+        if stop_at_user_pick and team_id == user_team_id:
+            break
+        result = service.process_ai_pick(
+            team_id=team_id,
+            pick_info=current_pick,
+            draft_direction=draft_direction if team_id == user_team_id else None
+        )
+        if not result["success"]:
+            break
+        picks.append(result)
+    return picks
+
+
+def _rows(path, query):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(query).fetchall()
+    finally:
+        conn.close()
+
+
+PROSPECT_ROWS_SQL = """
+    SELECT prospect_id, is_drafted, drafted_team_id, draft_round, draft_pick,
+           draft_overall_pick, player_id
+    FROM draft_prospects ORDER BY prospect_id
+"""
+PLAYER_ROWS_SQL = """
+    SELECT p.player_id, p.first_name, p.last_name, p.number, p.team_id, p.positions,
+           p.attributes, p.birthdate, p.contract_id IS NOT NULL, r.depth_chart_order
+    FROM players p JOIN team_rosters r ON r.dynasty_id = p.dynasty_id AND r.player_id = p.player_id
+    ORDER BY p.player_id
+"""
+CONTRACT_ROWS_SQL = """
+    SELECT c.player_id, c.team_id, c.start_year, c.contract_type, c.total_value,
+           c.signing_bonus_proration, c.guaranteed_at_signing,
+           d.contract_year, d.base_salary, d.guarantee_type, d.total_cap_hit, d.cash_paid
+    FROM player_contracts c
+    JOIN contract_year_details d ON d.contract_id = c.contract_id
+    ORDER BY c.player_id, d.contract_year
+"""
+ORDER_ROWS_SQL = "SELECT overall_pick, team_id, prospect_id, is_completed FROM draft_order ORDER BY overall_pick"
+TRANSACTION_ROWS_SQL = """
+    SELECT player_id, to_team_id, season, transaction_date, details
+    FROM player_transactions WHERE transaction_type = 'DRAFT' ORDER BY player_id
+"""
+
+
+class TestPickSelection:
+    """The engine reproduces the per-pick process_ai_pick() loop."""
+
+    @pytest.mark.parametrize("draft_direction", [
+        None,
+        DraftDirection(strategy=DraftStrategy.NEEDS_BASED),
+        DraftDirection(
+            strategy=DraftStrategy.POSITION_FOCUS, priority_positions=["WR", "CB"]
+        ),
+    ])
+    def test_matches_per_pick_calls(self, db_path, tmp_path, draft_direction):
+        reference_path = _copy(db_path, tmp_path)
+
+        random.seed(11)
+        picks = DraftService(db_path, DYNASTY, SEASON).auto_complete_draft(
+            USER_TEAM_ID, draft_direction=draft_direction
+        )
+        random.seed(11)
+        reference = _per_pick_calls(
+            DraftService(reference_path, DYNASTY, SEASON), USER_TEAM_ID, draft_direction
+        )
+
+        assert len(picks) == 224
+        assert picks == reference
+        for query in (PROSPECT_ROWS_SQL, PLAYER_ROWS_SQL, CONTRACT_ROWS_SQL, ORDER_ROWS_SQL):
+            assert _rows(db_path, query) == _rows(reference_path, query)
+
+    def test_only_window_considered(self, db_path):
+        # The lowest rated prospect (264th) becomes the only one the user's team wants
+        conn = sqlite3.connect(db_path)
+        kicker_id = conn.execute(
+            "SELECT prospect_id FROM draft_prospects ORDER BY overall, prospect_id DESC LIMIT 1"
+        ).fetchone()[0]
+        conn.execute("UPDATE draft_prospects SET position = 'K' WHERE prospect_id = ?", (kicker_id,))
+        conn.commit()
+        conn.close()
+        direction = DraftDirection(strategy=DraftStrategy.POSITION_FOCUS, priority_positions=["K"])
+
+        picks = DraftService(db_path, DYNASTY, SEASON).auto_complete_draft(USER_TEAM_ID, direction)
+
+        # First pick in round 1 (264 available), second once the kicker is in the top 224
+        user_picks = [p for p in picks if p["team_id"] == USER_TEAM_ID]
+        assert user_picks[0]["overall_pick"] < 40 < user_picks[1]["overall_pick"]
+        assert user_picks[0]["prospect_id"] != kicker_id
+        assert user_picks[1]["prospect_id"] == kicker_id
+
+    def test_sim_to_user_pick(self, db_path, tmp_path):
+        reference_path = _copy(db_path, tmp_path)
+
+        random.seed(3)
+        picks = DraftService(db_path, DYNASTY, SEASON).sim_to_user_pick(USER_TEAM_ID)
+        random.seed(3)
+        reference = _per_pick_calls(
+            DraftService(reference_path, DYNASTY, SEASON), USER_TEAM_ID, stop_at_user_pick=True
+        )
+
+        assert picks == reference
+        assert picks and USER_TEAM_ID not in {p["team_id"] for p in picks}
+        current_pick = DraftService(db_path, DYNASTY, SEASON).get_current_pick()
+        assert current_pick["team_id"] == USER_TEAM_ID
+
+
+class TestCommit:
+    """Picks are written in one transaction."""
+
+    def test_picks_committed(self, db_path):
+        picks = DraftService(db_path, DYNASTY, SEASON).auto_complete_draft(USER_TEAM_ID)
+
+        logged = {row[0]: row for row in _rows(db_path, TRANSACTION_ROWS_SQL)}
+        contracts = dict(_rows(db_path, "SELECT player_id, contract_id FROM player_contracts"))
+        players = dict(
+            (row[0], row[1:]) for row in _rows(db_path, "SELECT player_id, team_id, contract_id FROM players")
+        )
+
+        assert DraftService(db_path, DYNASTY, SEASON).is_draft_complete()
+        for pick in picks:
+            team_id, contract_id = players[pick["player_id"]]
+            assert team_id == pick["team_id"]
+            assert contracts[pick["player_id"]] == contract_id
+            _, to_team_id, season, transaction_date, details = logged[pick["player_id"]]
+            assert (to_team_id, season, transaction_date) == (pick["team_id"], SEASON + 1, "2026-04-24")
+            assert json.loads(details)["overall_pick"] == pick["overall_pick"]
+
+    def test_failed_commit_rolls_back(self, db_path, monkeypatch):
+        def fail(self, **kwargs):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(transaction_logger.TransactionLogger, "log_transaction", fail)
+
+        with pytest.raises(sqlite3.OperationalError):
+            DraftService(db_path, DYNASTY, SEASON).auto_complete_draft(USER_TEAM_ID)
+
+        assert _rows(db_path, "SELECT COUNT(*) FROM draft_prospects WHERE is_drafted") == [(0,)]
+        assert _rows(db_path, "SELECT COUNT(*) FROM players") == [(0,)]
+        assert _rows(db_path, "SELECT COUNT(*) FROM draft_order WHERE is_completed = 1") == [(0,)]
+        # Rookie contracts are written on the draft transaction's connection
+        assert _rows(db_path, "SELECT COUNT(*) FROM player_contracts") == [(0,)]
+        assert _rows(db_path, "SELECT COUNT(*) FROM cap_transactions") == [(0,)]
@@ -0,0 +1,253 @@
+"""
+Tests for FAMarketEngine - in-memory AI free agent signings.
+
+Covers:
+- Same signings, rejections and rows as the per-signing service calls
+- Accepted signings committed together (contracts, roster moves, transactions)
+- Bulk cap space matching CapCalculator.calculate_team_cap_space
+- Teams without cap space skipped
+- A failed commit leaving the market untouched
+"""
+
+import json
+import os
+import random
+import sqlite3
+import tempfile
+
+import pytest
+
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.services.free_agency_service import FreeAgencyService
+import src.persistence.transaction_logger as transaction_logger
+from salary_cap.cap_calculator import CapCalculator
+from salary_cap.cap_database_api import CapDatabaseAPI
+
+
+DYNASTY = "fa_market_test"
+SEASON = 2025
+USER_TEAM_ID = 1
+POSITIONS = [
+    "quarterback", "running_back", "wide_receiver", "tight_end", "left_tackle",
+    "center", "defensive_end", "linebacker", "cornerback", "safety",
+]
+
+
+@pytest.fixture
+def db_path():
+    """32 teams with thin rosters, 120 free agents and next-season cap records."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    rng = random.Random(3)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO teams (team_id, name, abbreviation, conference, division) VALUES (?, ?, ?, 'AFC', 'East')",
+        [(team_id, f"Team {team_id}", f"T{team_id}") for team_id in range(1, 33)]
+    )
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'FA Market', ?)",
+        (DYNASTY, USER_TEAM_ID)
+    )
+
+    player_id = 1
+    players = []
+    rosters = []
+    for team_id in range(1, 33):
+        for position in POSITIONS:
+            for _ in range(rng.choice([0, 1, 2, 2])):
+                players.append((player_id, "Roster", f"Player{player_id}", team_id, position,
+                                rng.randint(60, 90), "1998-01-01", 3))
+                rosters.append((DYNASTY, team_id, player_id))
+                player_id += 1
+    for _ in range(120):
+        players.append((player_id, "Free", f"Agent{player_id}", 0, rng.choice(POSITIONS),
+                        rng.randint(55, 92), f"{rng.randint(1988, 2002)}-05-05", rng.randint(0, 10)))
+        player_id += 1
+
+    conn.executemany(
+        "INSERT INTO players (dynasty_id, player_id, first_name, last_name, number, team_id, "
+        "positions, attributes, birthdate, years_pro) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [(DYNASTY, pid, first, last, pid % 99, team_id, json.dumps([position]),
+          json.dumps({"overall": overall}), birthdate, years_pro)
+         for pid, first, last, team_id, position, overall, birthdate, years_pro in players]
+    )
+    conn.executemany(
+        "INSERT INTO team_rosters (dynasty_id, team_id, player_id, roster_status, depth_chart_order) "
+        "VALUES (?, ?, ?, 'active', 1)",
+        rosters
+    )
+    conn.commit()
+    db.close()
+
+    # Salary cap schema; team 32 has no record and is initialized on demand
+    CapDatabaseAPI(path)
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO team_salary_cap (team_id, season, dynasty_id, salary_cap_limit, active_contracts_total) "
+        "VALUES (?, ?, ?, 255000000, ?)",
+        [(team_id, SEASON + 1, DYNASTY, rng.randint(200_000_000, 262_000_000)) for team_id in range(1, 32)]
+    )
+    conn.commit()
+    conn.close()
+
+    yield path
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _per_signing_calls(service, user_team_id, max_signings_per_team=3, max_attempts_per_signing=3):
+    """The market resolved with one service call per interest check and signing."""
+    from team_management.teams.team_loader import TeamDataLoader
+    from database.player_roster_api import PlayerRosterAPI
+
+    roster_api = PlayerRosterAPI(service._db_path)
+    available_fas = service.get_available_free_agents()
+    signings, rejections = [], []
+
+    for team in TeamDataLoader().get_all_teams():
+        if team.team_id == user_team_id:
+            continue
+        cap_space = service.get_team_cap_space(team.team_id)
+        if cap_space <= 0:
+            continue
+
+        signings_made = 0
+        for need_position in service._get_team_positional_needs(team.team_id, roster_api):
+            if signings_made >= max_signings_per_team:
+                break
+            attempts = 0
+            for fa in available_fas[:]:
+                if attempts >= max_attempts_per_signing:
+                    break
+                if fa["position"].lower() != need_position or fa["estimated_aav"] > cap_space:
+                    continue
+                interest = service.evaluate_player_interest(fa["player_id"], team.team_id)
+                if interest["interest_level"] == "low" and attempts > 0:
+                    continue
+                attempts += 1
+                result = service.sign_free_agent(
+                    fa["player_id"], team.team_id, use_valuation_engine=True
+                )
+                if result["success"]:
+                    signings.append((fa["player_id"], team.team_id, result["contract_details"]))
+                    cap_space -= fa["estimated_aav"]
+                    signings_made += 1
+                    available_fas.remove(fa)
+                    break
+                rejections.append((fa["player_id"], team.team_id, result.get("rejection_reason")))
+
+    return signings, rejections
+
+
+def _rows(path, query):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(query).fetchall()
+    finally:
+        conn.close()
+
+
+CONTRACT_ROWS_SQL = """
+    SELECT c.player_id, c.team_id, c.start_year, c.contract_years, c.total_value,
+           c.signing_bonus_proration, c.guaranteed_at_signing,
+           d.contract_year, d.base_salary, d.guarantee_type, d.total_cap_hit, d.cash_paid
+    FROM player_contracts c
+    JOIN contract_year_details d ON d.contract_id = c.contract_id
+    ORDER BY c.player_id, d.contract_year
+"""
+
+
+class TestMarketResolution:
+    """The engine reproduces the per-signing service calls."""
+
+    def test_matches_per_signing_calls(self, db_path, tmp_path):
+        reference_path = str(tmp_path / "reference.db")
+        source, copy = sqlite3.connect(db_path), sqlite3.connect(reference_path)
+        source.backup(copy)
+        source.close()
+        copy.close()
+
+        random.seed(11)
+        result = FreeAgencyService(db_path, DYNASTY, SEASON).process_ai_signings(USER_TEAM_ID)
+        random.seed(11)
+        signings, rejections = _per_signing_calls(
+            FreeAgencyService(reference_path, DYNASTY, SEASON), USER_TEAM_ID
+        )
+
+        assert len(signings) > 10 and rejections
+        assert [(s["player_id"], s["team_id"], s["contract_details"]) for s in result["signings"]] == signings
+        assert [(r["player_id"], r["team_id"], r["reason"]) for r in result["rejections"]] == rejections
+        assert _rows(db_path, CONTRACT_ROWS_SQL) == _rows(reference_path, CONTRACT_ROWS_SQL)
+
+    def test_players_signed_once_and_user_team_skipped(self, db_path):
+        result = FreeAgencyService(db_path, DYNASTY, SEASON).process_ai_signings(USER_TEAM_ID)
+
+        signed_ids = [s["player_id"] for s in result["signings"]]
+        assert len(signed_ids) == len(set(signed_ids))
+        assert USER_TEAM_ID not in {s["team_id"] for s in result["signings"]}
+        assert len(result["events"]) == len(signed_ids)
+
+    def test_teams_without_cap_space_skipped(self, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE team_salary_cap SET active_contracts_total = 300000000")
+        conn.commit()
+        conn.close()
+
+        result = FreeAgencyService(db_path, DYNASTY, SEASON).process_ai_signings(USER_TEAM_ID)
+
+        assert {s["team_id"] for s in result["signings"]} <= {32}
+
+
+class TestCommit:
+    """Accepted signings are written in one transaction."""
+
+    def test_signings_committed(self, db_path):
+        result = FreeAgencyService(db_path, DYNASTY, SEASON).process_ai_signings(USER_TEAM_ID)
+
+        players = dict(
+            (row[0], row[1:]) for row in _rows(db_path, "SELECT player_id, team_id, contract_id FROM players")
+        )
+        contracts = dict(_rows(db_path, "SELECT contract_id, player_id FROM player_contracts"))
+        logged = _rows(
+            db_path,
+            "SELECT player_id, to_team_id, season FROM player_transactions WHERE transaction_type = 'UFA_SIGNING'"
+        )
+
+        assert len(contracts) == len(result["signings"])
+        for signing in result["signings"]:
+            team_id, contract_id = players[signing["player_id"]]
+            assert team_id == signing["team_id"]
+            assert contracts[contract_id] == signing["player_id"]
+            assert (signing["player_id"], signing["team_id"], SEASON + 1) in logged
+
+    def test_failed_commit_rolls_back(self, db_path, monkeypatch):
+        def fail(self, **kwargs):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(transaction_logger.TransactionLogger, "log_transaction", fail)
+
+        with pytest.raises(sqlite3.OperationalError):
+            FreeAgencyService(db_path, DYNASTY, SEASON).process_ai_signings(USER_TEAM_ID)
+
+        assert _rows(db_path, "SELECT COUNT(*) FROM player_contracts") == [(0,)]
+        assert _rows(db_path, "SELECT COUNT(*) FROM players WHERE team_id = 0") == [(120,)]
+
+
+class TestBulkCapSpace:
+    """calculate_all_team_cap_space() uses the per-team formula."""
+
+    def test_matches_per_team_calculation(self, db_path):
+        calculator = CapCalculator(db_path)
+        team_ids = list(range(1, 33))
+
+        bulk = calculator.calculate_all_team_cap_space(team_ids, SEASON + 1, DYNASTY)
+
+        assert bulk == {
+            team_id: calculator.calculate_team_cap_space(team_id, SEASON + 1, DYNASTY)
+            for team_id in team_ids
+        }
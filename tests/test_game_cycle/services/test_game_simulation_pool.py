@@ -0,0 +1,348 @@
+"""
+Tests for GameSimulationPool - process-based weekly game simulation.
+
+Covers:
+- Compact, picklable result payloads (play-by-play fields preserved)
+- Worker count resolution
+- One pool per season, reused across weeks
+- Real spawn workers simulating FULL games
+- RegularSeasonHandler executor selection and thread fallback
+"""
+
+import contextlib
+import io
+import pickle
+import sys
+from pathlib import Path
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.game_cycle.services.game_simulation_pool import (
+    CompactDrive,
+    CompactPlay,
+    GameSimulationRequest,
+    compact_simulation_result,
+    get_season_pool,
+    resolve_worker_count,
+    shutdown_season_pool,
+)
+from src.game_cycle.services.game_simulator_service import (
+    GameSimulationResult,
+    SimulationMode,
+)
+from src.game_cycle.handlers.regular_season import GameSimContext, RegularSeasonHandler
+from src.game_cycle.services.initialization_service import GameCycleInitializer
+from team_management.team_data_cache import invalidate_team_data
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+@pytest.fixture(scope="module")
+def full_game_drives():
+    """Drives from one synthetic-roster FULL simulation."""
+    from game_management.full_game_simulator import FullGameSimulator
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulator = FullGameSimulator(away_team_id=1, home_team_id=2)
+        game_result = simulator.simulate_game()
+    return game_result.drives
+
+
+@pytest.fixture(scope="module")
+def dynasty_db(tmp_path_factory):
+    """Initialized dynasty with rosters for worker processes."""
+    db_path = str(tmp_path_factory.mktemp("simulation_pool") / "game_cycle.db")
+    with contextlib.redirect_stdout(io.StringIO()):
+        GameCycleInitializer(db_path, "pool_test", season=2025).initialize_dynasty(team_id=1)
+    return db_path
+
+
+@pytest.fixture
+def worker_sys_path(monkeypatch):
+    """
+    Project root and src first, tests/ removed, for spawned workers.
+
+    Spawn workers import everything again from the sys.path they inherit.
+    Pytest may put tests/ back at the front after conftest removed it, and
+    the workers would then import tests/persistence instead of src/persistence.
+    """
+    project_root = Path(__file__).resolve().parents[3]
+    front = [str(project_root), str(project_root / "src")]
+    tests_path = str(project_root / "tests")
+    monkeypatch.setattr(
+        sys, "path", front + [p for p in sys.path if p not in front and p != tests_path]
+    )
+
+
+@pytest.fixture
+def season_pool_cleanup():
+    """Stop the shared season pool after the test."""
+    yield
+    shutdown_season_pool()
+
+
+def _make_ctx(index: int) -> GameSimContext:
+    return GameSimContext(
+        game={"game_id": f"g{index}"},
+        game_id_for_db=f"g{index}",
+        home_team_id=2 * index + 1,
+        away_team_id=2 * index + 2,
+        event_id=None,
+        season=2025,
+        week=1,
+    )
+
+
+def _make_result(ctx: GameSimContext) -> GameSimulationResult:
+    return GameSimulationResult(
+        game_id=ctx.game_id_for_db,
+        home_team_id=ctx.home_team_id,
+        away_team_id=ctx.away_team_id,
+        home_score=21,
+        away_score=17,
+    )
+
+
+# ============================================
+# Compact payloads
+# ============================================
+
+class TestCompactSimulationResult:
+    """compact_simulation_result() keeps play-by-play data, drops the rest."""
+
+    def test_drives_replaced_with_compact_records(self, full_game_drives):
+        result = GameSimulationResult(
+            game_id="g1", home_team_id=2, away_team_id=1,
+            home_score=0, away_score=0, drives=list(full_game_drives)
+        )
+
+        compact = compact_simulation_result(result)
+
+        assert len(compact.drives) == len(full_game_drives)
+        assert all(isinstance(d, CompactDrive) for d in compact.drives)
+        assert all(isinstance(p, CompactPlay) for d in compact.drives for p in d.plays)
+
+    def test_persisted_fields_preserved(self, full_game_drives):
+        result = GameSimulationResult(
+            game_id="g1", home_team_id=2, away_team_id=1,
+            home_score=0, away_score=0, drives=list(full_game_drives)
+        )
+
+        compact = compact_simulation_result(result)
+
+        for original, drive in zip(full_game_drives, compact.drives):
+            assert drive.possessing_team_id == original.possessing_team_id
+            assert drive.points_scored == original.points_scored
+            assert drive.drive_outcome == original.drive_outcome
+            assert len(drive.plays) == len(original.plays)
+            for original_play, play in zip(original.plays, drive.plays):
+                assert play.outcome == original_play.outcome
+                assert play.yards == original_play.yards
+                assert play.points == original_play.points
+                assert play.time_elapsed == original_play.time_elapsed
+
+    def test_compact_payload_is_smaller(self, full_game_drives):
+        full_size = len(pickle.dumps(list(full_game_drives)))
+        result = GameSimulationResult(
+            game_id="g1", home_team_id=2, away_team_id=1,
+            home_score=0, away_score=0, drives=list(full_game_drives)
+        )
+
+        compact_size = len(pickle.dumps(compact_simulation_result(result)))
+
+        assert compact_size < full_size / 5
+
+    def test_result_without_drives_unchanged(self):
+        result = GameSimulationResult(
+            game_id="g1", home_team_id=2, away_team_id=1, home_score=3, away_score=0
+        )
+
+        assert compact_simulation_result(result).drives == []
+
+
+# ============================================
+# Worker count
+# ============================================
+
+class TestResolveWorkerCount:
+    """resolve_worker_count() bounds the pool size."""
+
+    def test_explicit_count_capped_by_games(self):
+        assert resolve_worker_count(16, 4) == 4
+
+    def test_explicit_count_used(self):
+        assert resolve_worker_count(3, 16) == 3
+
+    def test_minimum_one_worker(self):
+        assert resolve_worker_count(0, 16) == 1
+
+    def test_default_uses_cpu_count(self):
+        with patch("src.game_cycle.services.game_simulation_pool.os.cpu_count", return_value=8):
+            assert resolve_worker_count(None, 16) == 7
+
+
+# ============================================
+# Season pool
+# ============================================
+
+@pytest.mark.usefixtures("season_pool_cleanup")
+class TestSeasonPool:
+    """get_season_pool() keeps one pool per season."""
+
+    def _patched_pool(self):
+        return patch(
+            "src.game_cycle.services.game_simulation_pool.GameSimulationPool",
+            side_effect=lambda db_path, dynasty_id, max_workers, profile_plays=False: MagicMock(
+                max_workers=max_workers
+            ),
+        )
+
+    def test_weeks_of_a_season_share_a_pool(self):
+        with self._patched_pool() as pool_cls:
+            week_1 = get_season_pool("db.sqlite", "dyn", 2025, 4)
+            week_2 = get_season_pool("db.sqlite", "dyn", 2025, 3)
+
+        assert week_2 is week_1
+        assert pool_cls.call_count == 1
+        week_1.shutdown.assert_not_called()
+
+    def test_new_season_replaces_pool(self):
+        with self._patched_pool() as pool_cls:
+            old = get_season_pool("db.sqlite", "dyn", 2025, 4)
+            new = get_season_pool("db.sqlite", "dyn", 2026, 4)
+
+        assert new is not old
+        assert pool_cls.call_count == 2
+        old.shutdown.assert_called_once()
+
+    def test_more_workers_replaces_pool(self):
+        with self._patched_pool():
+            small = get_season_pool("db.sqlite", "dyn", 2025, 2)
+            large = get_season_pool("db.sqlite", "dyn", 2025, 4)
+
+        assert large.max_workers == 4
+        small.shutdown.assert_called_once()
+
+    def test_shutdown_stops_pool(self):
+        with self._patched_pool():
+            pool = get_season_pool("db.sqlite", "dyn", 2025, 2)
+            shutdown_season_pool()
+            replacement = get_season_pool("db.sqlite", "dyn", 2025, 2)
+
+        pool.shutdown.assert_called_once()
+        assert replacement is not pool
+
+
+class TestWorkerTeamData:
+    """Workers drop cached rosters when the parent's generation changes."""
+
+    def test_new_generation_invalidates_worker_cache(self):
+        module = "src.game_cycle.services.game_simulation_pool"
+        simulator = MagicMock()
+        simulator.simulate_game.side_effect = lambda game_id, **kwargs: GameSimulationResult(
+            game_id=game_id, home_team_id=1, away_team_id=2, home_score=0, away_score=0
+        )
+        request = GameSimulationRequest("g1", home_team_id=1, away_team_id=2, season=2025, week=1)
+
+        with patch(f"{module}._worker_simulator", simulator), \
+                patch(f"{module}._worker_team_data_generation", None), \
+                patch(f"{module}.invalidate_team_data") as invalidate:
+            from src.game_cycle.services.game_simulation_pool import _simulate_in_worker
+
+            _simulate_in_worker(request, SimulationMode.FULL.value, 5)
+            _simulate_in_worker(request, SimulationMode.FULL.value, 5)
+            assert invalidate.call_count == 1
+            _simulate_in_worker(request, SimulationMode.FULL.value, 6)
+            assert invalidate.call_count == 2
+
+
+@pytest.mark.usefixtures("worker_sys_path", "season_pool_cleanup")
+class TestSpawnWorkers:
+    """A real two-process spawn pool: simulator and results cross processes."""
+
+    def test_full_games_in_two_workers(self, dynasty_db):
+        requests = [
+            GameSimulationRequest("w1_g1", home_team_id=1, away_team_id=2, season=2025, week=1),
+            GameSimulationRequest("w1_g2", home_team_id=3, away_team_id=4, season=2025, week=1),
+        ]
+
+        pool = get_season_pool(dynasty_db, "pool_test", 2025, 2)
+        results = dict(pool.simulate(requests, SimulationMode.FULL))
+
+        assert set(results) == set(requests)
+        for request, result in results.items():
+            assert result.game_id == request.game_id
+            assert result.home_team_id == request.home_team_id
+            assert result.total_plays > 0
+            assert result.player_stats
+            assert all(isinstance(d, CompactDrive) for d in result.drives)
+
+        # Next week: same worker processes, rosters reloaded after a roster write
+        invalidate_team_data("pool_test", 1)
+        next_week = GameSimulationRequest("w2_g1", home_team_id=2, away_team_id=1, season=2025, week=2)
+        assert get_season_pool(dynasty_db, "pool_test", 2025, 2) is pool
+        [(request, result)] = list(pool.simulate([next_week], SimulationMode.FULL))
+
+        assert request == next_week
+        assert result.total_plays > 0
+
+
+# ============================================
+# RegularSeasonHandler integration
+# ============================================
+
+class TestHandlerProcessExecution:
+    """RegularSeasonHandler._simulate_games_in_processes()."""
+
+    def test_results_mapped_back_to_contexts(self):
+        handler = RegularSeasonHandler()
+        contexts = [_make_ctx(i) for i in range(3)]
+
+        pool = MagicMock()
+        pool.simulate.side_effect = lambda requests, mode: [
+            (request, _make_result(ctx)) for request, ctx in zip(requests, contexts)
+        ]
+
+        with patch("src.game_cycle.handlers.regular_season.get_season_pool",
+                   return_value=pool) as get_pool:
+            results = handler._simulate_games_in_processes(
+                contexts, MagicMock(), SimulationMode.FULL, "db.sqlite", "dyn", 2
+            )
+
+        get_pool.assert_called_once_with("db.sqlite", "dyn", 2025, 2, profile_plays=False)
+        requests = pool.simulate.call_args[0][0]
+        assert all(isinstance(r, GameSimulationRequest) for r in requests)
+        assert [ctx for ctx, _ in results] == contexts
+        assert all(result.game_id == ctx.game_id_for_db for ctx, result in results)
+
+    def test_broken_pool_falls_back_to_threads(self):
+        handler = RegularSeasonHandler()
+        contexts = [_make_ctx(i) for i in range(3)]
+
+        def partial_then_break(requests, mode):
+            yield requests[0], _make_result(contexts[0])
+            raise BrokenProcessPool("worker died")
+
+        pool = MagicMock()
+        pool.simulate.side_effect = partial_then_break
+
+        game_simulator = MagicMock()
+        game_simulator.simulate_game.side_effect = lambda game_id, **kwargs: GameSimulationResult(
+            game_id=game_id, home_team_id=0, away_team_id=0, home_score=10, away_score=7
+        )
+
+        with patch("src.game_cycle.handlers.regular_season.get_season_pool",
+                   return_value=pool), \
+                patch("src.game_cycle.handlers.regular_season.shutdown_season_pool") as shutdown:
+            results = handler._simulate_games_in_processes(
+                contexts, game_simulator, SimulationMode.FULL, "db.sqlite", "dyn", None
+            )
+
+        shutdown.assert_called_once()
+        assert sorted(ctx.game_id_for_db for ctx, _ in results) == ["g0", "g1", "g2"]
+        # Only the two games without results are re-simulated in-process
+        assert game_simulator.simulate_game.call_count == 2
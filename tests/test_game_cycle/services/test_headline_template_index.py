@@ -0,0 +1,129 @@
+"""
+Tests for TemplateIndex - precompiled headline template matching.
+
+Covers:
+- Index results equal to the linear _template_matches scan, in pool order,
+  for every template pool the generator uses
+- Min/max thresholds, exact values, missing fields and string thresholds
+- Pools compiled once and shared between generators
+"""
+
+import random
+
+import pytest
+
+from src.game_cycle.services import headline_generator
+from src.game_cycle.services.headline_generator import (
+    BLOWOUT_TEMPLATES,
+    PLAYOFF_TEMPLATES,
+    HeadlineGenerator,
+    HeadlineTemplate,
+    HeadlineType,
+)
+from src.game_cycle.services.headline_template_index import TemplateIndex, clear_template_indexes
+
+
+def _linear(templates, event_data):
+    return [t for t in templates if HeadlineGenerator._template_matches(None, t, event_data)]
+
+
+def _all_pools():
+    """Every module-level template list, including playoff pools."""
+    pools = []
+    for value in vars(headline_generator).values():
+        candidates = value.values() if isinstance(value, dict) else [value]
+        for pool in candidates:
+            if isinstance(pool, list) and pool and isinstance(pool[0], HeadlineTemplate):
+                pools.append(pool)
+    for round_pools in PLAYOFF_TEMPLATES.values():
+        pools.extend(round_pools.values())
+    return pools
+
+
+def _random_event(rng, pools):
+    """Event data drawing values from the conditions the templates use."""
+    values = {}
+    for pool in pools:
+        for template in pool:
+            for key, expected in template.conditions.items():
+                field = key[:-4] if key.endswith(("_min", "_max")) else key
+                values.setdefault(field, set()).add(expected)
+
+    event = {}
+    for field, options in values.items():
+        roll = rng.random()
+        if roll < 0.15:
+            continue  # Missing field
+        option = rng.choice(sorted(options, key=repr))
+        if isinstance(option, bool):
+            event[field] = rng.random() < 0.5
+        elif isinstance(option, int):
+            event[field] = option + rng.randint(-3, 3)
+        else:
+            event[field] = option
+    return event
+
+
+class TestMatchesLinearScan:
+    """Index and linear scan agree."""
+
+    def test_every_pool(self):
+        rng = random.Random(1)
+        pools = _all_pools()
+
+        for _ in range(300):
+            event = _random_event(rng, pools)
+            for pool in pools:
+                assert TemplateIndex.for_pool(pool).match(event) == _linear(pool, event)
+
+    def test_thresholds_and_exact_values(self):
+        pool = [
+            HeadlineTemplate("a", {"margin_min": 7}),
+            HeadlineTemplate("b", {"margin_max": 7}),
+            HeadlineTemplate("c", {"margin_min": 3, "margin_max": 10, "is_rivalry": True}),
+            HeadlineTemplate("d"),
+            HeadlineTemplate("e", {"playoff_round": "wild_card", "margin_min": 7}),
+            HeadlineTemplate("f", {"severity_min": "moderate"}),
+        ]
+        index = TemplateIndex(pool)
+        events = [
+            {}, {"margin": 7}, {"margin": 6}, {"margin": 11}, {"margin": 3, "is_rivalry": True},
+            {"margin": 10, "is_rivalry": 1}, {"margin": 7, "playoff_round": "wild_card"},
+            {"margin": None}, {"severity": "severe"}, {"severity": "minor"}, {"is_rivalry": [1]},
+        ]
+
+        for event in events:
+            assert index.match(event) == _linear(pool, event)
+
+    def test_no_templates(self):
+        assert TemplateIndex([]).match({"margin": 3}) == []
+
+
+class TestSharedIndexes:
+    """Module-level pools are compiled once."""
+
+    def test_for_pool_cached(self):
+        assert TemplateIndex.for_pool(BLOWOUT_TEMPLATES) is TemplateIndex.for_pool(BLOWOUT_TEMPLATES)
+
+    def test_recompiled_after_clear(self):
+        pool = [HeadlineTemplate("a", {"margin_min": 1})]
+        index = TemplateIndex.for_pool(pool)
+        pool.append(HeadlineTemplate("b"))
+
+        assert TemplateIndex.for_pool(pool) is not index
+        clear_template_indexes(pool)
+        assert TemplateIndex.for_pool(pool).match({"margin": 0}) == [pool[1]]
+
+    @pytest.mark.parametrize("playoff_round", [None, "wild_card", "super_bowl"])
+    def test_generator_uses_index(self, playoff_round, tmp_path):
+        generator = HeadlineGenerator(str(tmp_path / "headlines.db"), "test", 2025)
+        event = {"margin": 24, "is_upset": False, "playoff_round": playoff_round}
+        try:
+            matching = generator._get_matching_templates(HeadlineType.BLOWOUT, event)
+        finally:
+            generator._db.close()
+
+        pool = (PLAYOFF_TEMPLATES[playoff_round][HeadlineType.BLOWOUT]
+                if playoff_round else BLOWOUT_TEMPLATES)
+        expected = _linear(pool, event) or _linear(BLOWOUT_TEMPLATES, event)
+        assert matching == expected
@@ -0,0 +1,209 @@
+"""
+Tests for HeadlineWeekData - bulk recap data for a week's headlines.
+
+Covers:
+- One load for all games: player stats by team, missing names, box scores,
+  standings and rivalries
+- Preloaded lookups matching HeadlineGenerator's per-game queries
+- Headline generation needing no further database reads once preloaded
+- Games outside the preloaded week still querying the database
+"""
+
+import os
+import random
+import tempfile
+
+import pytest
+
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.services.headline_generator import HeadlineGenerator
+from src.game_cycle.services.headline_week_data import HeadlineWeekData
+
+
+DYNASTY = "week_data_test"
+SEASON = 2025
+GAMES = [("g1", 1, 2), ("g2", 3, 4), ("g3", 5, 6)]
+POSITIONS = ["QB", "RB", "WR", "TE", "LB", "DE", "CB", "FS"]
+
+
+@pytest.fixture
+def db_path():
+    """Database with three played games: stats, box scores, standings, a rivalry."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    rng = random.Random(3)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO teams (team_id, name, abbreviation, conference, division) VALUES (?, ?, ?, 'AFC', 'East')",
+        [(t, f"Team {t}", f"T{t}") for t in range(1, 33)]
+    )
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Week Data', 1)",
+        (DYNASTY,)
+    )
+    player_id = 100
+    for game_id, home_id, away_id in GAMES:
+        for team_id in (home_id, away_id):
+            conn.execute(
+                "INSERT INTO box_scores (game_id, team_id, dynasty_id, q1_score, q4_score, total_yards) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (game_id, team_id, DYNASTY, rng.randint(0, 14), rng.randint(0, 14), rng.randint(200, 450))
+            )
+            for position in POSITIONS:
+                player_id += 1
+                named = player_id % 3 != 0  # Every third stat row has no player_name
+                conn.execute(
+                    "INSERT INTO players (dynasty_id, player_id, first_name, last_name, number, team_id, "
+                    "positions, attributes) VALUES (?, ?, 'First', ?, 1, ?, '[]', '{}')",
+                    (DYNASTY, player_id, f"Last{player_id}", team_id)
+                )
+                conn.execute(
+                    "INSERT INTO player_game_stats (dynasty_id, game_id, player_id, player_name, team_id, "
+                    "position, passing_yards, passing_tds, rushing_yards, receiving_yards, receptions, "
+                    "tackles_total, sacks, interceptions, passes_defended) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (DYNASTY, game_id, str(player_id), f"Named {player_id}" if named else None,
+                     team_id, position,
+                     rng.randint(150, 350) if position == "QB" else 0,
+                     rng.randint(0, 3) if position == "QB" else 0,
+                     rng.randint(0, 120), rng.randint(0, 120), rng.randint(0, 8),
+                     rng.randint(0, 12), rng.choice([0, 0, 1, 2]), rng.choice([0, 0, 1]),
+                     rng.randint(0, 3))
+                )
+        for team_id, wins in ((home_id, 3), (away_id, 1)):
+            conn.execute(
+                "INSERT INTO standings (dynasty_id, season, team_id, wins, losses, season_type) "
+                "VALUES (?, ?, ?, ?, ?, 'regular_season')",
+                (DYNASTY, SEASON, team_id, wins, 4 - wins)
+            )
+    conn.execute(
+        "INSERT INTO rivalries (dynasty_id, team_a_id, team_b_id, rivalry_type, rivalry_name, intensity) "
+        "VALUES (?, 1, 2, 'division', 'Test Rivalry', 80)",
+        (DYNASTY,)
+    )
+    conn.commit()
+    db.close()
+
+    yield path
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@pytest.fixture
+def generator(db_path):
+    gen = HeadlineGenerator(db_path, DYNASTY, SEASON)
+    yield gen
+    gen._db.close()
+
+
+def _game_data(game_id, home_id, away_id):
+    return {
+        "game_id": game_id, "week": 4, "winner_id": home_id, "loser_id": away_id,
+        "winner_score": 27, "loser_score": 17, "home_team_id": home_id,
+        "away_team_id": away_id, "is_playoff": False,
+    }
+
+
+def _recap_snapshot(generator):
+    """Everything the per-game lookups return for the test games."""
+    snapshot = []
+    for game_id, home_id, away_id in GAMES:
+        recap = generator._gather_recap_data(game_id, home_id, away_id)
+        enriched = generator._enrich_game_data(_game_data(game_id, home_id, away_id))
+        snapshot.append((
+            generator._get_top_players_by_stats(game_id, home_id, limit=4),
+            generator._get_top_players_by_stats(game_id, away_id, limit=1),
+            generator._get_top_defensive_player(game_id, home_id),
+            generator._get_top_defensive_player(game_id, away_id),
+            [b.to_dict() for b in recap["box_scores"]],
+            recap["winner_standing"], recap["loser_standing"],
+            recap["rivalry"].rivalry_name if recap["rivalry"] else None,
+            {k: v for k, v in enriched.items() if k.endswith("_record") or k.startswith("player")},
+        ))
+    return snapshot
+
+
+class TestLoad:
+    """One bulk load for the week."""
+
+    def test_contents(self, db_path):
+        from src.game_cycle.database.box_scores_api import BoxScoresAPI
+        from src.game_cycle.database.rivalry_api import RivalryAPI
+        from src.game_cycle.database.standings_api import StandingsAPI
+
+        db = GameCycleDatabase(db_path)
+        try:
+            data = HeadlineWeekData.load(
+                db, DYNASTY, SEASON, [g for g, _, _ in GAMES],
+                box_scores_api=BoxScoresAPI(db_path),
+                standings_api=StandingsAPI(db),
+                rivalry_api=RivalryAPI(db),
+            )
+        finally:
+            db.close()
+
+        assert data.game_ids == {"g1", "g2", "g3"}
+        assert len(data.player_rows("g2", 3)) == len(POSITIONS)
+        assert data.player_rows("g2", 1) == []
+        assert len(data.player_names) == 16  # Unnamed stat rows across 6 teams
+        assert all(name.startswith("First Last") for name in data.player_names.values())
+        assert sorted(b.team_id for b in data.box_scores["g3"]) == [5, 6]
+        assert data.standing(5).wins == 3
+        assert data.rivalry(2, 1).rivalry_name == "Test Rivalry"
+        assert data.rivalry(3, 4) is None
+        assert data.game_grades is None  # Not requested
+
+    def test_empty_week(self, db_path):
+        db = GameCycleDatabase(db_path)
+        try:
+            data = HeadlineWeekData.load(db, DYNASTY, SEASON, [])
+        finally:
+            db.close()
+
+        assert data.player_stats is None
+        assert data.player_rows("g1", 1) == []
+
+
+class TestGeneratorPreload:
+    """Preloaded recaps match the per-game queries."""
+
+    def test_same_results(self, generator):
+        per_game = _recap_snapshot(generator)
+        generator._player_names_cache.clear()
+
+        generator.preload_week([g for g, _, _ in GAMES])
+
+        assert _recap_snapshot(generator) == per_game
+        assert per_game[0][0]  # Top players found
+
+    def test_no_queries_after_preload(self, generator, db_path):
+        expected = _recap_snapshot(generator)
+        generator._player_names_cache.clear()
+        generator.preload_week([g for g, _, _ in GAMES])
+
+        db = GameCycleDatabase(db_path)
+        for table in ("player_game_stats", "players", "box_scores", "standings", "rivalries"):
+            db.execute(f"DELETE FROM {table}")
+        db.close()
+
+        assert _recap_snapshot(generator) == expected
+        for game_id, home_id, away_id in GAMES:
+            headline = generator.generate_game_headline(_game_data(game_id, home_id, away_id))
+            assert headline.body_text
+
+    def test_other_games_still_query(self, generator, db_path):
+        generator.preload_week(["g1"])
+        db = GameCycleDatabase(db_path)
+        db.execute("DELETE FROM player_game_stats WHERE game_id = 'g1'")
+        db.close()
+
+        assert generator._get_top_players_by_stats("g1", 1)
+        assert generator._get_top_players_by_stats("g2", 3)
+
+        generator.clear_week_data()
+        assert generator._get_top_players_by_stats("g1", 1) == []
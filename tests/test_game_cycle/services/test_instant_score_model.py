@@ -0,0 +1,307 @@
+"""
+Tests for InstantScoreModel - rating-aware INSTANT scores.
+
+Covers:
+- Team ratings from roster records, refreshed when TeamDataCache is invalidated
+- Stronger rosters scoring more and winning more, home field advantage
+- Realistic final scores, no playoff ties, rare regular season ties
+- Least squares calibration recovering known parameters
+- Calibrations stored in the database and reused after a restart
+- Week batches through GameSimulatorService.generate_instant_scores()
+"""
+
+import os
+import random
+import tempfile
+
+import numpy as np
+import pytest
+
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.services.game_simulator_service import GameSimulatorService
+from src.game_cycle.services.instant_score_model import (
+    DEFAULT_PARAMETERS,
+    REALISTIC_SCORES,
+    InstantScoreModel,
+    ScoreModelCalibrator,
+    ScoreModelParameters,
+    clear_score_models,
+    calibrate_score_model,
+    fit_parameters,
+    get_score_model,
+    get_score_model_calibration,
+    team_ratings_from_records,
+)
+from team_management.team_data_cache import clear_team_data_caches, invalidate_team_data
+
+
+DYNASTY = "score_model_test"
+SEASON = 2025
+OFFENSE = ["quarterback", "running_back", "wide_receiver", "wide_receiver", "wide_receiver",
+           "tight_end", "left_tackle", "left_guard", "center", "right_guard", "right_tackle"]
+DEFENSE = ["defensive_end", "defensive_tackle", "defensive_tackle", "defensive_end",
+           "mike_linebacker", "outside_linebacker", "outside_linebacker",
+           "cornerback", "cornerback", "free_safety", "strong_safety"]
+
+
+def _team_overall(team_id):
+    """Offense and defense overall for a team: team 1 weakest, team 32 strongest."""
+    return 70 + team_id // 2, 70 + team_id // 2
+
+
+@pytest.fixture
+def db_path():
+    """Temporary database with 32 rosters of graded starters plus a kicker."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO teams (team_id, name, abbreviation, conference, division) VALUES (?, ?, ?, 'AFC', 'East')",
+        [(team_id, f"Team {team_id}", f"T{team_id}") for team_id in range(1, 33)]
+    )
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Score Model', 1)",
+        (DYNASTY,)
+    )
+    player_id = 0
+    for team_id in range(1, 33):
+        offense, defense = _team_overall(team_id)
+        roster = ([(p, offense) for p in OFFENSE] + [(p, defense) for p in DEFENSE]
+                  + [("quarterback", offense - 20), ("kicker", 99)])
+        for depth, (position, overall) in enumerate(roster, start=1):
+            player_id += 1
+            conn.execute(
+                "INSERT INTO players (dynasty_id, player_id, first_name, last_name, number, team_id, "
+                "positions, attributes) VALUES (?, ?, 'P', ?, ?, ?, ?, ?)",
+                (DYNASTY, player_id, str(player_id), depth, team_id,
+                 f'["{position}"]', f'{{"overall": {overall}}}')
+            )
+            conn.execute(
+                "INSERT INTO team_rosters (dynasty_id, team_id, player_id, depth_chart_order) "
+                "VALUES (?, ?, ?, ?)",
+                (DYNASTY, team_id, player_id, depth)
+            )
+    conn.commit()
+    db.close()
+
+    clear_team_data_caches()
+    clear_score_models()
+    yield path
+
+    clear_team_data_caches()
+    clear_score_models()
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class TestTeamRatings:
+    """Ratings come from each side's top eleven players."""
+
+    def test_ratings_from_records(self):
+        records = (
+            [{"primary_position": "quarterback", "ratings": {"overall": 90}}]
+            + [{"primary_position": "wide_receiver", "ratings": {"overall": 70}}] * 12
+            + [{"primary_position": "cornerback", "ratings": {"overall": 80}}]
+            + [{"primary_position": "kicker", "ratings": {"overall": 99}}]
+            + [{"primary_position": "safety", "ratings": {}}]
+        )
+
+        offense, defense = team_ratings_from_records(records)
+
+        assert offense == pytest.approx((90 + 70 * 10) / 11)
+        assert defense == 80
+
+    def test_ratings_from_database(self, db_path):
+        model = InstantScoreModel(db_path, DYNASTY, SEASON)
+
+        assert model.team_ratings(1) == (70.0, 70.0)
+        assert model.team_ratings(32) == (86.0, 86.0)
+
+    def test_invalidation_refreshes_ratings(self, db_path):
+        model = InstantScoreModel(db_path, DYNASTY, SEASON)
+        assert model.team_ratings(5) == (72.0, 72.0)
+
+        db = GameCycleDatabase(db_path)
+        db.execute(
+            "UPDATE players SET attributes = '{\"overall\": 94}' "
+            "WHERE dynasty_id = ? AND team_id = 5 AND number = 1",
+            (DYNASTY,)
+        )
+        db.close()
+        assert model.team_ratings(5) == (72.0, 72.0)
+
+        invalidate_team_data(DYNASTY, 5, db_path=db_path)
+
+        assert model.team_ratings(5) == (74.0, 72.0)
+
+    def test_missing_roster_uses_baseline(self, db_path):
+        model = InstantScoreModel(db_path, "no_such_dynasty", SEASON)
+
+        home, away = model.generate([1, 2], [3, 4])
+
+        assert model.team_ratings(1) == (80.0, 80.0)
+        assert len(home) == len(away) == 2
+
+
+class TestGeneratedScores:
+    """Scores follow ratings and look like NFL scores."""
+
+    def test_stronger_team_scores_more(self, db_path):
+        model = InstantScoreModel(db_path, DYNASTY, SEASON, seed=1)
+        n = 4000
+
+        home, away = model.generate([20] * n, [12] * n)
+
+        expected_home, expected_away = model.expected_points([20], [12])
+        assert expected_home[0] - expected_away[0] == pytest.approx(8 + 2.0)
+        assert np.mean(home > away) > 0.7
+        assert np.mean(home) - np.mean(away) == pytest.approx(10, abs=1)
+
+    def test_home_field_advantage(self, db_path):
+        model = InstantScoreModel(db_path, DYNASTY, SEASON, seed=2)
+        n = 8000
+
+        home, away = model.generate([10] * n, [11] * n)
+
+        assert np.mean(home) - np.mean(away) == pytest.approx(2.0, abs=0.7)
+
+    def test_realistic_scores(self, db_path):
+        model = InstantScoreModel(db_path, DYNASTY, SEASON, seed=3)
+        teams = np.arange(1, 33)
+
+        home, away = model.generate(np.repeat(teams, 32), np.tile(teams, 32))
+
+        home_mean, away_mean = model.expected_points(teams, teams[::-1])
+        assert home_mean[0] - away_mean[0] == pytest.approx(-32 + 2.0)
+
+        allowed = set(REALISTIC_SCORES.tolist()) | {s + 3 for s in REALISTIC_SCORES.tolist()}
+        assert set(home.tolist()) <= allowed
+        assert set(away.tolist()) <= allowed
+        assert 0 < np.mean(home == away) < 0.01
+
+    def test_no_playoff_ties(self, db_path):
+        model = InstantScoreModel(db_path, DYNASTY, SEASON, seed=4)
+
+        home, away = model.generate([16] * 2000, [17] * 2000, is_playoff=True)
+
+        assert not np.any(home == away)
+
+    def test_correlated_scores(self, db_path):
+        params = ScoreModelParameters(**{**DEFAULT_PARAMETERS.__dict__, "correlation": 0.6})
+        model = InstantScoreModel(db_path, DYNASTY, SEASON, parameters=params, seed=5)
+
+        home, away = model.generate([12] * 5000, [20] * 5000)
+
+        assert np.corrcoef(home, away)[0, 1] > 0.4
+
+    def test_same_seed_same_scores(self, db_path):
+        first = InstantScoreModel(db_path, DYNASTY, SEASON, seed=6).generate([1, 2, 3], [4, 5, 6])
+        second = InstantScoreModel(db_path, DYNASTY, SEASON, seed=6).generate([1, 2, 3], [4, 5, 6])
+
+        assert np.array_equal(first[0], second[0])
+        assert np.array_equal(first[1], second[1])
+
+    def test_unseeded_model_follows_random_seed(self, db_path):
+        model = InstantScoreModel(db_path, DYNASTY, SEASON)
+        random.seed(11)
+        first = model.generate(list(range(1, 17)), list(range(17, 33)))
+        random.seed(11)
+        second = model.generate(list(range(1, 17)), list(range(17, 33)))
+
+        assert np.array_equal(first[0], second[0])
+        assert np.array_equal(first[1], second[1])
+
+
+class TestCalibration:
+    """Parameters fitted to simulated games."""
+
+    TRUTH = ScoreModelParameters(
+        league_points=23.0, home_field=3.0, offense_weight=0.8, defense_weight=0.5,
+        rating_baseline=78.0, stdev=7.0, correlation=0.0,
+    )
+
+    def test_fit_recovers_parameters(self):
+        rng = np.random.default_rng(7)
+        n = 20000
+        home = rng.uniform(70, 86, size=(n, 2))
+        away = rng.uniform(70, 86, size=(n, 2))
+        t = self.TRUTH
+        home_scores = (t.league_points + t.home_field + t.offense_weight * (home[:, 0] - 78)
+                       - t.defense_weight * (away[:, 1] - 78) + rng.normal(0, t.stdev, n))
+        away_scores = (t.league_points + t.offense_weight * (away[:, 0] - 78)
+                       - t.defense_weight * (home[:, 1] - 78) + rng.normal(0, t.stdev, n))
+
+        fitted = fit_parameters(home, away, home_scores, away_scores)
+
+        assert fitted.games == n
+        assert fitted.offense_weight == pytest.approx(0.8, abs=0.05)
+        assert fitted.defense_weight == pytest.approx(0.5, abs=0.05)
+        assert fitted.home_field == pytest.approx(3.0, abs=0.3)
+        assert fitted.stdev == pytest.approx(7.0, abs=0.2)
+        assert abs(fitted.correlation) < 0.05
+
+    def test_too_few_games(self):
+        with pytest.raises(ValueError):
+            fit_parameters(np.zeros((3, 2)), np.zeros((3, 2)), np.zeros(3), np.zeros(3))
+
+    def test_calibrator_fits_simulated_games(self, db_path):
+        truth = InstantScoreModel(db_path, DYNASTY, SEASON, parameters=self.TRUTH, seed=8)
+        games = []
+
+        def simulate(home_id, away_id, game_id):
+            games.append(game_id)
+            home_mean, away_mean = truth.expected_points([home_id], [away_id])
+            return home_mean[0], away_mean[0]
+
+        fitted = ScoreModelCalibrator(db_path, DYNASTY, SEASON, simulate=simulate).calibrate(
+            games=40, seed=8
+        )
+
+        assert len(set(games)) == 40
+        assert fitted.stdev == pytest.approx(0.0, abs=1e-6)
+        model = InstantScoreModel(db_path, DYNASTY, SEASON, parameters=fitted)
+        assert np.allclose(
+            model.expected_points([3, 30], [31, 4]), truth.expected_points([3, 30], [31, 4])
+        )
+
+    def test_calibration_stored_and_reloaded(self, db_path, monkeypatch):
+        truth = InstantScoreModel(db_path, DYNASTY, SEASON, parameters=self.TRUTH)
+
+        def simulate(calibrator, home_id, away_id, game_id):
+            home_mean, away_mean = truth.expected_points([home_id], [away_id])
+            return home_mean[0], away_mean[0]
+
+        monkeypatch.setattr(ScoreModelCalibrator, "_simulate_full_game", simulate)
+        assert get_score_model_calibration(db_path, DYNASTY, SEASON) is None
+
+        fitted = calibrate_score_model(db_path, DYNASTY, SEASON, games=16, seed=9)
+        clear_score_models()  # As after a restart
+
+        assert get_score_model_calibration(db_path, DYNASTY, SEASON) == fitted
+        assert get_score_model(db_path, DYNASTY, SEASON).parameters == fitted
+        assert get_score_model_calibration(db_path, DYNASTY, SEASON + 1) is None
+
+
+class TestWeekBatch:
+    """GameSimulatorService uses the shared season model."""
+
+    def test_week_scores(self, db_path):
+        service = GameSimulatorService(db_path, DYNASTY)
+        matchups = [(team_id, 33 - team_id) for team_id in range(1, 17)]
+
+        scores = service.generate_instant_scores(matchups, SEASON)
+
+        assert len(scores) == 16
+        assert all(isinstance(home, int) and isinstance(away, int) for home, away in scores)
+        assert service.generate_instant_scores([], SEASON) == []
+
+    def test_model_per_season(self, db_path):
+        model = get_score_model(db_path, DYNASTY, SEASON)
+
+        assert get_score_model(db_path, DYNASTY, SEASON) is model
+        assert get_score_model(db_path, DYNASTY, SEASON + 1).season == SEASON + 1
+        assert model.parameters == DEFAULT_PARAMETERS
@@ -0,0 +1,198 @@
+"""
+Tests for LeaderboardService - cached league leader queries.
+
+Covers:
+- Results cached per (season, category, team filter, sort)
+- peek() never querying the database
+- Persisting a week (WeekPersistenceBatch) invalidating that season only
+- LRU eviction and explicit invalidation
+- Per-thread database connections
+"""
+
+import os
+import tempfile
+import threading
+
+import pytest
+
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.services import leaderboard_service
+from src.game_cycle.services.leaderboard_service import LeaderboardQuery, LeaderboardService
+from src.game_cycle.services.week_persistence_batch import WeekPersistenceBatch
+
+
+DYNASTY = "leaderboard_test"
+SEASON = 2025
+
+
+def _persist_week(db_path, week, passing_yards):
+    """Persist one game with a passer for each team."""
+    db = GameCycleDatabase(db_path)
+    try:
+        batch = WeekPersistenceBatch(db, DYNASTY, SEASON)
+        game_id = f"g{week}"
+        batch.add_game_result({
+            "game_id": game_id, "season": SEASON, "week": week,
+            "home_team_id": 1, "away_team_id": 2, "home_score": 21, "away_score": 14,
+        })
+        batch.add_player_stats(game_id, [
+            {"player_id": 101, "team_id": 1, "player_name": "Home Passer", "position": "QB",
+             "passing_yards": passing_yards, "passing_attempts": 30, "passing_completions": 20},
+            {"player_id": 201, "team_id": 2, "player_name": "Away Passer", "position": "QB",
+             "passing_yards": 200, "passing_attempts": 28, "passing_completions": 17},
+        ])
+        batch.flush()
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def db_path():
+    """Database with two teams and one played week."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.execute("""
+        INSERT INTO teams (team_id, name, abbreviation, conference, division)
+        VALUES (1, 'Buffalo Bills', 'BUF', 'AFC', 'East'), (2, 'Miami Dolphins', 'MIA', 'AFC', 'East')
+    """)
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Leaderboards', 1)",
+        (DYNASTY,)
+    )
+    conn.commit()
+    db.close()
+    _persist_week(path, 1, passing_yards=310)
+
+    yield path
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@pytest.fixture
+def service(db_path):
+    service = LeaderboardService(db_path, DYNASTY)
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def loads(service, monkeypatch):
+    """Record every query that reaches the database."""
+    seen = []
+    original = LeaderboardService._load
+
+    def counting(self, query):
+        seen.append(query)
+        return original(self, query)
+
+    monkeypatch.setattr(LeaderboardService, "_load", counting)
+    return seen
+
+
+def _passing(team_id=None):
+    return LeaderboardQuery(season=SEASON, category="passing", team_id=team_id)
+
+
+class TestCache:
+    """Queries hit the database once until games are persisted."""
+
+    def test_get_caches_per_key(self, service, loads):
+        leaders = service.get(_passing())
+        assert [p["player_name"] for p in leaders] == ["Home Passer", "Away Passer"]
+
+        assert service.get(_passing()) is leaders
+        assert service.peek(_passing()) is leaders
+        assert [p["player_name"] for p in service.get(_passing(team_id=2))] == ["Away Passer"]
+
+        defense = LeaderboardQuery(season=SEASON, category="defense", sort_by="sacks")
+        service.get(defense)
+        service.get(LeaderboardQuery(season=SEASON, category="defense", sort_by="sacks"))
+        assert loads == [_passing(), _passing(team_id=2), defense]
+
+    def test_peek_does_not_query(self, service, loads):
+        assert service.peek(_passing()) is None
+        assert loads == []
+
+    def test_summary_and_team_stats(self, service):
+        summary = service.get(LeaderboardQuery(season=SEASON, category="summary"))
+        assert summary == {"games": 1, "players": 2, "week": 1}
+        assert isinstance(service.get(LeaderboardQuery(season=SEASON, category="team_stats")), list)
+
+    def test_unknown_category(self, service):
+        with pytest.raises(ValueError):
+            service.get(LeaderboardQuery(season=SEASON, category="bowling"))
+
+
+class TestInvalidation:
+    """Persisted games and explicit invalidation drop cached results."""
+
+    def test_persisted_week_invalidates_season(self, db_path, service, loads):
+        service.get(_passing())
+        other_season = LeaderboardQuery(season=SEASON - 1, category="passing")
+        service.get(other_season)
+
+        _persist_week(db_path, 2, passing_yards=290)
+
+        assert service.peek(_passing()) is None
+        assert service.peek(other_season) == []
+        leaders = service.get(_passing())
+        assert leaders[0]["passing_yards"] == 600
+        assert loads == [_passing(), other_season, _passing()]
+
+    def test_notify_games_persisted(self, service):
+        service.get(_passing())
+        leaderboard_service.notify_games_persisted("other_dynasty", SEASON)
+        assert service.peek(_passing()) is not None
+
+        leaderboard_service.notify_games_persisted(DYNASTY, SEASON)
+        assert service.peek(_passing()) is None
+
+    def test_invalidate(self, service):
+        service.get(_passing())
+        service.get(LeaderboardQuery(season=SEASON - 1, category="passing"))
+
+        service.invalidate(season=SEASON - 1)
+        assert service.peek(_passing()) is not None
+        assert service.peek(LeaderboardQuery(season=SEASON - 1, category="passing")) is None
+
+        service.invalidate()
+        assert service.peek(_passing()) is None
+
+    def test_lru_eviction(self, db_path, loads):
+        service = LeaderboardService(db_path, DYNASTY, max_entries=2)
+        try:
+            service.get(_passing())
+            service.get(_passing(team_id=1))
+            service.get(_passing())  # Most recently used
+            service.get(_passing(team_id=2))
+
+            assert service.peek(_passing()) is not None
+            assert service.peek(_passing(team_id=1)) is None
+        finally:
+            service.close()
+
+
+class TestThreads:
+    """Background threads use their own connections."""
+
+    def test_get_from_worker_thread(self, service):
+        results = []
+
+        def load():
+            try:
+                results.append(service.get(_passing()))
+            finally:
+                service.close()
+
+        thread = threading.Thread(target=load)
+        thread.start()
+        thread.join(10)
+
+        assert results and results[0][0]["player_name"] == "Home Passer"
+        assert service.peek(_passing()) is results[0]  # Cache shared with this thread
@@ -0,0 +1,281 @@
+"""
+Tests for the deferred media job queue (MediaJobsAPI, MediaJobWorker).
+
+Covers:
+- Idempotent enqueue per (dynasty, season, week, type, key)
+- Claiming in queue order, done/failed bookkeeping, requeue and retry
+- Worker runs: queue order, failures recorded, unknown job types
+- Background thread woken by notify(), drain() waiting for the queue
+- Regular season jobs: queued in the inline order and dispatched to the
+  handler's generation methods
+"""
+
+import os
+import tempfile
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.database.media_jobs_api import MediaJobsAPI
+from src.game_cycle.handlers import regular_season
+from src.game_cycle.handlers.regular_season import GameSimContext, RegularSeasonHandler
+from src.game_cycle.services import media_job_queue
+from src.game_cycle.services.media_job_queue import MediaJobWorker, register_media_job
+
+
+DYNASTY = "media_jobs_test"
+SEASON = 2025
+
+
+@pytest.fixture
+def db_path():
+    """Database with teams and the test dynasty."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO teams (team_id, name, abbreviation, conference, division) VALUES (?, ?, ?, 'AFC', 'East')",
+        [(t, f"Team {t}", f"T{t}") for t in range(1, 33)]
+    )
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Media Jobs', 1)",
+        (DYNASTY,)
+    )
+    conn.commit()
+    db.close()
+
+    yield path
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@pytest.fixture
+def api(db_path):
+    db = GameCycleDatabase(db_path)
+    yield MediaJobsAPI(db)
+    db.close()
+
+
+@pytest.fixture
+def handlers(monkeypatch):
+    """Isolated job handler registry; records (job_type, job_key) per run."""
+    monkeypatch.setattr(media_job_queue, "_JOB_HANDLERS", {})
+    ran = []
+
+    def record(job, context):
+        ran.append((job.job_type, job.job_key))
+
+    def fail(job, context):
+        raise RuntimeError("boom")
+
+    register_media_job("record", record)
+    register_media_job("fail", fail)
+    return ran
+
+
+@pytest.fixture
+def worker(db_path, monkeypatch):
+    """The database's registered worker (started on first queue), stopped afterwards."""
+    worker = MediaJobWorker(db_path)
+    monkeypatch.setattr(media_job_queue, "_WORKERS", {db_path: worker})
+    yield worker
+    worker.stop(timeout=5)
+
+
+class TestMediaJobsAPI:
+    """Queue bookkeeping."""
+
+    def test_enqueue_is_idempotent(self, api):
+        assert api.enqueue(DYNASTY, SEASON, 3, "record", "g1", {"score": 7})
+        assert not api.enqueue(DYNASTY, SEASON, 3, "record", "g1", {"score": 9})
+        assert api.enqueue(DYNASTY, SEASON, 4, "record", "g1")
+
+        jobs = api.get_jobs(DYNASTY, SEASON)
+        assert [(j.week, j.job_key) for j in jobs] == [(3, "g1"), (4, "g1")]
+        assert jobs[0].payload == {"score": 7}
+        assert jobs[1].payload == {}
+
+    def test_enqueue_many_counts_new_jobs(self, api):
+        jobs = [(1, "record", "a", None), (1, "record", "b", None)]
+        assert api.enqueue_many(DYNASTY, SEASON, jobs) == 2
+        assert api.enqueue_many(DYNASTY, SEASON, jobs + [(1, "record", "c", None)]) == 1
+        assert api.enqueue_many(DYNASTY, SEASON, []) == 0
+
+    def test_claim_in_order_and_complete(self, api):
+        api.enqueue_many(DYNASTY, SEASON, [(1, "record", k, None) for k in "abc"])
+
+        first = api.claim_next()
+        second = api.claim_next()
+        assert (first.job_key, first.status, first.attempts) == ("a", "running", 1)
+        assert second.job_key == "b"
+
+        api.mark_done(first.job_id)
+        api.mark_failed(second.job_id, "broken")
+
+        assert api.count_jobs("done") == 1
+        assert api.count_jobs("failed") == 1
+        assert api.count_jobs("pending", dynasty_id=DYNASTY) == 1
+        assert api.get_jobs(DYNASTY, SEASON, job_type="record")[1].error == "broken"
+
+    def test_requeue_and_retry(self, api):
+        api.enqueue_many(DYNASTY, SEASON, [(1, "record", k, None) for k in "ab"])
+        running = api.claim_next()
+        failed = api.claim_next()
+        api.mark_failed(failed.job_id, "broken")
+
+        assert api.requeue_running() == 1
+        assert api.retry_failed(DYNASTY) == 1
+        assert api.count_jobs("pending") == 2
+        assert api.claim_next().job_id == running.job_id
+
+
+class TestMediaJobWorker:
+    """Running queued jobs."""
+
+    def test_run_pending_in_order(self, db_path, api, handlers):
+        api.enqueue_many(DYNASTY, SEASON, [
+            (2, "record", "x", None), (1, "fail", "", None), (1, "record", "y", None), (1, "unknown", "", None),
+        ])
+
+        assert MediaJobWorker(db_path).run_pending() == 4
+
+        assert handlers == [("record", "x"), ("record", "y")]
+        statuses = {j.job_type: (j.status, j.error) for j in api.get_jobs(DYNASTY, SEASON)}
+        assert statuses["record"] == ("done", None)
+        assert statuses["fail"] == ("failed", "boom")
+        assert statuses["unknown"][0] == "failed"
+
+    def test_max_jobs(self, db_path, api, handlers):
+        api.enqueue_many(DYNASTY, SEASON, [(1, "record", k, None) for k in "abc"])
+
+        worker = MediaJobWorker(db_path)
+        assert worker.run_pending(max_jobs=2) == 2
+        assert api.count_jobs("pending") == 1
+        assert worker.run_pending() == 1
+
+    def test_drain_reports_failed_jobs(self, db_path, api, handlers):
+        worker = MediaJobWorker(db_path)
+        api.enqueue_many(DYNASTY, SEASON, [(1, "fail", "", None), (1, "record", "a", None)])
+        worker.run_pending(max_jobs=1)  # Failure in an earlier run counts too
+
+        assert not worker.drain(timeout=5)
+        assert handlers == [("record", "a")]
+        assert api.count_jobs("failed") == 1
+
+        # Reported once; the next drain only covers new jobs
+        api.enqueue(DYNASTY, SEASON, 2, "record", "b")
+        assert worker.drain(timeout=5)
+
+    def test_background_thread_and_drain(self, db_path, api, handlers, monkeypatch):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow(job, context):
+            started.set()
+            release.wait(5)
+            handlers.append(("slow", job.job_key))
+
+        register_media_job("slow", slow)
+        worker = MediaJobWorker(db_path)
+        worker.start()
+        try:
+            api.enqueue_many(DYNASTY, SEASON, [(1, "slow", "a", None), (1, "record", "b", None)])
+            worker.notify()
+            assert started.wait(5)
+
+            assert not worker.drain(timeout=0.05)  # Background run still busy
+            release.set()
+            assert worker.drain(timeout=5)
+        finally:
+            worker.stop(timeout=5)
+
+        assert handlers == [("slow", "a"), ("record", "b")]
+        assert api.count_jobs("pending") == 0
+        assert not worker.is_running
+
+    def test_start_requeues_interrupted_jobs(self, db_path, api, handlers):
+        api.enqueue(DYNASTY, SEASON, 1, "record", "left_running")
+        api.claim_next()
+
+        worker = MediaJobWorker(db_path)
+        worker.start()
+        try:
+            worker.drain(timeout=5)
+        finally:
+            worker.stop(timeout=5)
+
+        assert handlers == [("record", "left_running")]
+
+
+class TestRegularSeasonJobs:
+    """Jobs queued and run by the regular season handler."""
+
+    def _sim_results(self):
+        results = []
+        for game_id, home, away in (("g1", 1, 2), ("g2", 3, 4)):
+            ctx = GameSimContext(game={}, game_id_for_db=game_id, home_team_id=home,
+                                 away_team_id=away, event_id=None, season=SEASON, week=5)
+            player_stats = [
+                {"team_id": home, "player_name": f"Home QB {game_id}", "passing_yards": 300},
+                {"team_id": home, "player_name": "Home RB", "rushing_yards": 80},
+                {"team_id": away, "player_name": f"Away WR {game_id}", "receiving_yards": 110},
+            ]
+            results.append((ctx, SimpleNamespace(home_score=24, away_score=17,
+                                                 overtime_periods=1, player_stats=player_stats)))
+        return results
+
+    def test_week_jobs_in_inline_order(self, db_path, api, worker, monkeypatch):
+        monkeypatch.setattr(media_job_queue, "_JOB_HANDLERS", {})  # Leave the jobs queued
+        handler = RegularSeasonHandler()
+
+        queued = handler._queue_week_media(db_path, DYNASTY, SEASON, 5, self._sim_results())
+        again = handler._queue_week_media(db_path, DYNASTY, SEASON, 5, self._sim_results())
+
+        jobs = api.get_jobs(DYNASTY, SEASON)
+        assert (queued, again) == (len(jobs), 0)
+        assert worker.is_running
+        assert [(j.week, j.job_type, j.job_key) for j in jobs] == [
+            (5, "social_posts", "g1"), (5, "game_headline", "g1"),
+            (5, "social_posts", "g2"), (5, "game_headline", "g2"),
+            (5, "award_race", ""), (5, "power_rankings", ""), (6, "preview_headlines", ""),
+            (5, "season_grades", ""), (5, "popularity", ""),
+        ]
+        assert jobs[0].payload["star_players"] == {"1": "Home QB g1", "2": "Away WR g1"}
+        assert jobs[1].payload["overtime_periods"] == 1
+
+    def test_jobs_call_generation_methods(self, db_path, api, worker, monkeypatch):
+        calls = []
+        for name in ("_generate_game_social_posts", "_generate_game_headline",
+                     "_generate_preview_headlines", "_update_award_race_tracking",
+                     "_generate_power_rankings", "_aggregate_season_grades",
+                     "_update_player_popularity"):
+            monkeypatch.setattr(
+                RegularSeasonHandler, name,
+                lambda self, *args, _name=name, **kwargs: calls.append((_name, args, kwargs))
+            )
+        monkeypatch.setattr(media_job_queue.MediaJobContext, "headline_generator",
+                            lambda self, job: "generator")
+
+        regular_season._register_media_jobs()
+        RegularSeasonHandler()._queue_week_media(db_path, DYNASTY, SEASON, 17, self._sim_results())
+        assert worker.drain(timeout=5)
+
+        names = [name for name, _, _ in calls]
+        assert names[:4] == ["_generate_game_social_posts", "_generate_game_headline"] * 2
+        assert names[4:] == ["_update_award_race_tracking", "_generate_power_rankings",
+                             "_aggregate_season_grades", "_update_player_popularity"]
+        social = calls[0][2]
+        assert social["star_players"] == {1: "Home QB g1", 2: "Away WR g1"}
+        assert (social["game_id"], social["home_score"], social["week"]) == ("g1", 24, 17)
+        headline = calls[1][2]
+        assert headline["headline_generator"] == "generator"
+        assert headline["overtime_periods"] == 1
+        assert calls[-1][1] == (db_path, DYNASTY, SEASON, 17)
+        assert api.count_jobs("done") == 8  # No previews after week 17
@@ -290,6 +290,20 @@ class TestMockStatsGenerator:
         assert any(p in positions for p in ['LT', 'LG', 'C', 'RG', 'RT']), "Missing OL stats"
         assert any('LB' in p or 'DE' in p or 'CB' in p or 'S' in p for p in positions), "Missing defensive stats"
 
+    def test_merged_entries_keep_team_id(self, temp_db):
+        """Players with several stat entries (RB rushing + receiving) keep their team_id."""
+        generator = MockStatsGenerator(temp_db, 'test_dynasty')
+
+        merged = generator._merge_player_stats([
+            {'player_id': 2, 'team_id': 17, 'position': 'RB', 'rushing_yards': 80},
+            {'player_id': 2, 'team_id': 17, 'position': 'RB', 'receiving_yards': 25},
+        ])
+
+        assert len(merged) == 1
+        assert merged[0]['team_id'] == 17
+        assert merged[0]['rushing_yards'] == 80
+        assert merged[0]['receiving_yards'] == 25
+
     def test_passer_rating_calculation(self, temp_db):
         """Test passer rating calculation is in valid range."""
         generator = MockStatsGenerator(temp_db, 'test_dynasty')
@@ -0,0 +1,234 @@
+"""
+Tests for PlayoffOddsEngine - Monte Carlo playoff probabilities.
+
+Covers:
+- Seeding of every simulated season matching PlayoffSeeder (including
+  ties on record broken by conference, division and points)
+- Probabilities summing to the number of playoff spots, division titles,
+  byes and champions, and favouring stronger teams
+- Odds conditional on a game result
+- FlexScheduler clinch/elimination flags from simulated odds
+"""
+
+import random
+import time
+
+import numpy as np
+import pytest
+
+from src.game_cycle.database.standings_api import TeamStanding
+from src.game_cycle.services.flex_scheduler import FlexScheduler, PlayoffImplications
+from src.game_cycle.services.playoff_odds_engine import (
+    HOME_FIELD_ADVANTAGE,
+    PlayoffOddsEngine,
+)
+from playoff_system.playoff_seeder import PlayoffSeeder
+from stores.standings_store import EnhancedTeamStanding, NFL_DIVISIONS
+
+
+DIVISION_OF = {team_id: name for name, team_ids in NFL_DIVISIONS.items() for team_id in team_ids}
+
+
+def _standings(seed, games_played=12):
+    """League standings with many ties on record."""
+    rng = random.Random(seed)
+    standings = []
+    for team_id in range(1, 33):
+        wins = rng.choice([4, 6, 6, 8, 8, 9])
+        ties = 1 if team_id % 11 == 0 else 0
+        losses = games_played - wins - ties
+        points_for = rng.choice([250, 260, 260])
+        standings.append(TeamStanding(
+            team_id=team_id, wins=wins, losses=losses, ties=ties,
+            points_for=points_for, points_against=points_for + rng.choice([-10, 0, 0, 10]),
+            division_wins=rng.choice([1, 2, 2]), division_losses=1,
+            conference_wins=rng.choice([4, 5, 5]), conference_losses=3,
+            home_wins=0, home_losses=0, away_wins=0, away_losses=0,
+        ))
+    return standings
+
+
+def _schedule(seed, first_week=13, last_week=18):
+    """Each team plays once per remaining week."""
+    rng = random.Random(seed)
+    games = []
+    for week in range(first_week, last_week + 1):
+        teams = list(range(1, 33))
+        rng.shuffle(teams)
+        games.extend((week, teams[i], teams[i + 1]) for i in range(0, 32, 2))
+    return games
+
+
+def _seeder_seeds(standings, games, home_wins):
+    """Seed per team from PlayoffSeeder for one simulated season."""
+    records = {
+        s.team_id: EnhancedTeamStanding(
+            team_id=s.team_id, wins=s.wins, losses=s.losses, ties=s.ties,
+            division_wins=s.division_wins, conference_wins=s.conference_wins,
+            points_for=s.points_for, points_against=s.points_against,
+        )
+        for s in standings
+    }
+    for (week, home_id, away_id), home_won in zip(games, home_wins):
+        winner, loser = (home_id, away_id) if home_won else (away_id, home_id)
+        records[winner].wins += 1
+        records[loser].losses += 1
+        if DIVISION_OF[home_id][:3] == DIVISION_OF[away_id][:3]:
+            records[winner].conference_wins += 1
+        if DIVISION_OF[home_id] == DIVISION_OF[away_id]:
+            records[winner].division_wins += 1
+        # Zero ratings: expected margin is home field advantage
+        records[home_id].points_against -= int(HOME_FIELD_ADVANTAGE)
+        records[away_id].points_against += int(HOME_FIELD_ADVANTAGE)
+
+    seeding = PlayoffSeeder().calculate_seeding(records, season=2025, week=18)
+    seeds = {team_id: 0 for team_id in range(1, 33)}
+    for conference in (seeding.afc, seeding.nfc):
+        for seed in conference.seeds:
+            seeds[seed.team_id] = seed.seed
+    return seeds
+
+
+class TestSeeding:
+    """Simulated seasons are seeded like PlayoffSeeder."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_final_standings_match_seeder(self, seed):
+        standings = _standings(seed, games_played=17)
+
+        odds = PlayoffOddsEngine(standings, [], seed=seed).run(50)
+
+        expected = _seeder_seeds(standings, [], [])
+        for team_id, team_seed in expected.items():
+            team_odds = odds.get(team_id)
+            assert team_odds.playoffs == (team_seed > 0)
+            assert team_odds.division == (1 <= team_seed <= 4)
+            assert team_odds.bye == (team_seed == 1)
+
+    @pytest.mark.parametrize("seed", [4, 5])
+    def test_simulated_seasons_match_seeder(self, seed):
+        standings = _standings(seed)
+        games = _schedule(seed)
+        ratings = {team_id: 0.0 for team_id in range(1, 33)}
+
+        odds = PlayoffOddsEngine(standings, games, ratings=ratings, seed=seed).run(60)
+
+        for iteration in range(odds.iterations):
+            expected = _seeder_seeds(standings, games, odds._home_wins[iteration])
+            assert list(odds._seeds[iteration]) == [expected[t] for t in range(1, 33)]
+
+
+class TestProbabilities:
+    """Odds are consistent and follow team strength."""
+
+    def test_totals(self):
+        odds = PlayoffOddsEngine(_standings(6), _schedule(6), seed=6).run(2000)
+
+        all_odds = odds.all().values()
+        assert sum(o.playoffs for o in all_odds) == pytest.approx(14)
+        assert sum(o.division for o in all_odds) == pytest.approx(8)
+        assert sum(o.bye for o in all_odds) == pytest.approx(2)
+        assert sum(o.super_bowl for o in all_odds) == pytest.approx(1)
+        assert all(o.playoffs >= o.division >= o.bye for o in all_odds)
+
+    def test_stronger_team_more_likely(self):
+        standings = _standings(7)
+        ratings = {team_id: 0.0 for team_id in range(1, 33)}
+        ratings[3] = 30.0
+
+        odds = PlayoffOddsEngine(standings, _schedule(7), ratings=ratings, seed=7).run(2000)
+        baseline = PlayoffOddsEngine(standings, _schedule(7), seed=7).run(2000)
+
+        assert odds.get(3).playoffs > baseline.get(3).playoffs
+        assert odds.get(3).super_bowl > 0.5
+
+    def test_win_probabilities(self):
+        engine = PlayoffOddsEngine(_standings(8), [], seed=8)
+
+        home = engine.win_probabilities()
+        neutral = engine.win_probabilities(home_field=0.0)
+
+        assert np.allclose(neutral + neutral.T, 1.0)
+        assert np.allclose(np.diag(neutral), 0.5)
+        assert np.all(np.diag(home) > 0.5)
+
+    def test_same_seed_same_odds(self):
+        standings, games = _standings(9), _schedule(9)
+
+        first = PlayoffOddsEngine(standings, games, seed=1).run(500).all()
+        second = PlayoffOddsEngine(standings, games, seed=1).run(500).all()
+
+        assert first == second
+
+    def test_ten_thousand_iterations_under_a_second(self):
+        engine = PlayoffOddsEngine(_standings(10, games_played=0), _schedule(10, 1, 17), seed=10)
+
+        start = time.perf_counter()
+        odds = engine.run(10000)
+        elapsed = time.perf_counter() - start
+
+        assert odds.iterations == 10000
+        assert elapsed < 1.0
+
+
+class TestConditionalOdds:
+    """Odds given a game result."""
+
+    def test_split_by_result(self):
+        games = _schedule(11)
+        week, home_id, away_id = games[0]
+        odds = PlayoffOddsEngine(_standings(11), games, seed=11).run(4000)
+
+        if_win = odds.if_result(home_id, away_id, won=True, week=week)
+        if_loss = odds.if_result(home_id, away_id, won=False, week=week)
+        share = float(np.mean(odds._home_wins[:, 0]))
+
+        assert if_win.playoffs >= if_loss.playoffs
+        assert share * if_win.playoffs + (1 - share) * if_loss.playoffs == pytest.approx(
+            odds.get(home_id).playoffs
+        )
+
+    def test_unknown_game(self):
+        games = _schedule(12)
+        week, home_id, away_id = games[0]
+        odds = PlayoffOddsEngine(_standings(12), games, seed=12).run(100)
+
+        assert odds.if_result(home_id, away_id, won=True, week=week + 20) is None
+
+
+class TestFlexImplications:
+    """FlexScheduler uses simulated odds for clinch and elimination."""
+
+    def _implications(self, standings, games, team_id, opponent_id, week):
+        scheduler = FlexScheduler.__new__(FlexScheduler)
+        odds = PlayoffOddsEngine(standings, games, seed=13).run(4000)
+        implications = PlayoffImplications(team_id=team_id)
+        scheduler._apply_playoff_odds(implications, week, opponent_id, odds)
+        return implications
+
+    def test_win_clinches(self):
+        # One game left; team 1 leads its division by a game over team 2
+        standings = _standings(13, games_played=16)
+        for s in standings:
+            s.wins, s.losses, s.ties = (12, 4, 0) if s.team_id == 1 else (4, 12, 0)
+        standings[1].wins, standings[1].losses = 11, 5
+        games = [(17, 1, 2)] + [(17, t, t + 1) for t in range(3, 33, 2)]
+
+        implications = self._implications(standings, games, 1, 2, 17)
+
+        assert implications.can_clinch_division
+        assert not implications.elimination_game
+
+    def test_loss_eliminates(self):
+        standings = _standings(14, games_played=16)
+        for s in standings:
+            s.wins, s.losses, s.ties = (10, 6, 0) if s.team_id <= 7 else (4, 12, 0)
+        standings[7].wins, standings[7].losses = 9, 7  # Team 8 one game back of 7th
+        games = [(17, 8, 9)] + [(17, t, t + 1) for t in (1, 3, 5, 7)] + [
+            (17, t, t + 1) for t in range(10, 32, 2)
+        ]
+
+        implications = self._implications(standings, games, 8, 9, 17)
+
+        assert implications.elimination_game
+        assert not implications.can_clinch_playoff
@@ -0,0 +1,249 @@
+"""
+Tests for PopularityEngine - weekly popularity for the whole league.
+
+Covers:
+- Same scores as the per-player calculation (snap window, season grades,
+  headlines, award races, All-Pro/Pro Bowl selections, market, week change)
+- A fixed number of queries regardless of league size
+- Scores saved in bulk, and nothing saved when a score is out of range
+"""
+
+import json
+import os
+import random
+import tempfile
+
+import pytest
+
+from game_cycle.database.connection import GameCycleDatabase
+from game_cycle.database.popularity_api import PopularityAPI
+from game_cycle.services.popularity_calculator import PopularityCalculator
+from game_cycle.services.popularity_engine import PopularityEngine
+
+
+DYNASTY = "popularity_test"
+SEASON = 2025
+WEEK = 6
+POSITIONS = ["quarterback", "wide_receiver", "running_back", "left_tackle",
+             "cornerback", "linebacker", "kicker", "tight_end"]
+
+
+def _seed_league(db, player_count):
+    """Players, game and season grades, headlines, award races and selections."""
+    rng = random.Random(4)
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO teams (team_id, name, abbreviation, conference, division) VALUES (?, ?, ?, 'AFC', 'East')",
+        [(team_id, f"Team {team_id}", f"T{team_id}") for team_id in range(1, 33)]
+    )
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Popularity', 1)",
+        (DYNASTY,)
+    )
+
+    players, grades = [], []
+    for player_id in range(1, player_count + 1):
+        team_id = player_id % 33  # Team 0 = free agent
+        status = "active" if player_id % 17 else "retired"
+        positions = [] if player_id % 23 == 0 else [rng.choice(POSITIONS)]
+        players.append((DYNASTY, player_id, "Player", str(player_id), 1, team_id,
+                        json.dumps(positions), "{}", status))
+        for week in range(1, WEEK + 1):
+            snaps, defensive = rng.choice([0, 10, 25, 40, 60]), rng.choice([0, 5])
+            if player_id % 13 in (0, 1):
+                snaps, defensive = 23 - player_id % 13, 0  # 100 or 96 over the window
+            grades.append((DYNASTY, f"g{week}_{player_id}", SEASON, week, player_id,
+                           max(team_id, 1), "QB", 70.0, snaps, defensive,
+                           None if player_id % 11 == 0 and week == WEEK else 2))
+    conn.executemany(
+        "INSERT INTO players (dynasty_id, player_id, first_name, last_name, number, team_id, "
+        "positions, attributes, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        players
+    )
+    conn.executemany(
+        "INSERT INTO player_game_grades (dynasty_id, game_id, season, week, player_id, team_id, "
+        "position, overall_grade, offensive_snaps, defensive_snaps, special_teams_snaps) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        grades
+    )
+    conn.executemany(
+        "INSERT INTO player_season_grades (dynasty_id, season, player_id, team_id, position, overall_grade) "
+        "VALUES (?, ?, ?, ?, 'QB', ?)",
+        [(DYNASTY, SEASON, player_id, player_id % 32 + 1, rng.choice([0.0, 55.5, 72.3, 88.8, 96.1]))
+         for player_id in range(1, player_count + 1) if player_id % 7]
+    )
+
+    headlines = []
+    for week in (WEEK - 1, WEEK):
+        for h in range(40):
+            ids = rng.sample(range(1, player_count + 1), rng.randint(0, 3))
+            if ids and h % 9 == 0:
+                ids.append(ids[0])  # Mentioned twice in one headline
+            headlines.append((DYNASTY, SEASON, week, "GAME_RECAP", f"Headline {h}",
+                              rng.choice([40, 60, 75, 80, 81, 95]), json.dumps(ids)))
+    conn.executemany(
+        "INSERT INTO media_headlines (dynasty_id, season, week, headline_type, headline, priority, player_ids) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        headlines
+    )
+
+    nominees = []
+    for award_id, count in (("MVP", 12), ("OPOY", 8), ("DPOY", 8)):
+        for rank, player_id in enumerate(rng.sample(range(1, player_count + 1), count), start=1):
+            nominees.append((DYNASTY, SEASON, award_id, player_id, player_id % 32 + 1, rank))
+    conn.executemany(
+        "INSERT INTO award_nominees (dynasty_id, season, award_id, player_id, team_id, nomination_rank) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        nominees
+    )
+
+    all_pro = rng.sample(range(1, player_count + 1), 30)
+    conn.executemany(
+        "INSERT INTO all_pro_selections (dynasty_id, season, player_id, team_id, position, team_type) "
+        "VALUES (?, ?, ?, 1, ?, ?)",
+        [(DYNASTY, SEASON - (i % 3 == 0), player_id, position, team_type)
+         for i, player_id in enumerate(all_pro)
+         for position, team_type in (("QB", "FIRST_TEAM"), ("WR", "SECOND_TEAM"))[:1 + i % 2]]
+    )
+    conn.executemany(
+        "INSERT INTO pro_bowl_selections (dynasty_id, season, player_id, team_id, conference, position, "
+        "selection_type) VALUES (?, ?, ?, 1, 'AFC', 'QB', 'STARTER')",
+        [(DYNASTY, SEASON - (i % 4 == 0), player_id)
+         for i, player_id in enumerate(rng.sample(range(1, player_count + 1), 40))]
+    )
+
+    conn.executemany(
+        "INSERT INTO player_popularity (dynasty_id, player_id, season, week, popularity_score, "
+        "performance_score, visibility_multiplier, market_multiplier, tier) "
+        "VALUES (?, ?, ?, ?, ?, 50, 1.0, 1.0, 'KNOWN')",
+        [(DYNASTY, player_id, SEASON, WEEK - 1, rng.uniform(10, 90))
+         for player_id in range(1, player_count + 1, 2)]
+    )
+    conn.commit()
+
+
+@pytest.fixture
+def db():
+    """GameCycleDatabase with a 300-player league."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    db = GameCycleDatabase(path)
+    _seed_league(db, 300)
+
+    yield db
+
+    db.close()
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _per_player_scores(calculator, season, week):
+    """Weekly popularity calculated one player at a time."""
+    pop_api = PopularityAPI(calculator._db)
+    rows = calculator._db.query_all(
+        "SELECT player_id, team_id, positions FROM players "
+        "WHERE dynasty_id = ? AND team_id > 0 AND status = 'active'",
+        (DYNASTY,)
+    )
+    scores = []
+    for player_id, team_id, positions in rows:
+        positions = json.loads(positions)
+        if not positions:
+            continue
+        if calculator._get_recent_snap_count(player_id, season, week, weeks=4) < 100:
+            continue
+
+        performance = calculator.calculate_performance_score(player_id, season, week, positions[0])
+        visibility = calculator.calculate_visibility_multiplier(player_id, season, week)
+        market = calculator.calculate_market_multiplier(team_id)
+        visibility_scaled = 0.7 + (visibility - 0.5) / 2.5 * 0.6
+        market_scaled = 0.9 + (market - 0.8) / 1.2 * 0.3
+        raw_score = performance / 100.0 * visibility_scaled * market_scaled * 100
+        final_score = max(0.0, min(100.0, raw_score + -1.0))
+
+        week_change = 0.0
+        prev_score = pop_api.get_popularity_score(DYNASTY, player_id, season, week - 1)
+        if prev_score:
+            week_change = final_score - prev_score.popularity_score
+
+        scores.append({
+            "dynasty_id": DYNASTY, "player_id": player_id, "season": season, "week": week,
+            "popularity_score": final_score, "performance_score": performance,
+            "visibility_multiplier": visibility, "market_multiplier": market,
+            "week_change": week_change,
+            "trend": calculator.calculate_trend(player_id, season, week).value,
+            "tier": calculator.classify_tier(final_score).value,
+        })
+    return scores
+
+
+class TestMatchesPerPlayer:
+    """The engine reproduces the per-player calculation."""
+
+    def test_same_scores(self, db):
+        calculator = PopularityCalculator(db, DYNASTY)
+
+        scores = PopularityEngine(calculator).calculate(SEASON, WEEK)
+        reference = _per_player_scores(calculator, SEASON, WEEK)
+
+        assert len(scores) > 50
+        assert scores == reference
+
+    def test_components_vary(self, db):
+        scores = PopularityEngine(PopularityCalculator(db, DYNASTY)).calculate(SEASON, WEEK)
+
+        assert {s["performance_score"] for s in scores} >= {50.0, 100.0}
+        assert min(s["visibility_multiplier"] for s in scores) == 1.0
+        assert max(s["visibility_multiplier"] for s in scores) > 2.0
+        assert len({s["market_multiplier"] for s in scores}) > 10
+        assert any(s["week_change"] == 0.0 for s in scores)
+        assert any(s["week_change"] != 0.0 for s in scores)
+
+    def test_first_week_has_no_change(self, db):
+        scores = PopularityEngine(PopularityCalculator(db, DYNASTY)).calculate(SEASON, 1)
+
+        assert scores == _per_player_scores(PopularityCalculator(db, DYNASTY), SEASON, 1)
+        assert all(s["week_change"] == 0.0 for s in scores)
+
+    def test_fixed_query_count(self, db):
+        calculator = PopularityCalculator(db, DYNASTY)
+        statements = []
+        db.get_connection().set_trace_callback(statements.append)
+        try:
+            scores = PopularityEngine(calculator).calculate(SEASON, WEEK)
+        finally:
+            db.get_connection().set_trace_callback(None)
+
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(scores) > 50
+        assert len(selects) <= 10
+
+
+class TestWeeklyPopularity:
+    """calculate_weekly_popularity() saves the batch."""
+
+    def test_scores_saved(self, db):
+        calculator = PopularityCalculator(db, DYNASTY)
+        reference = _per_player_scores(calculator, SEASON, WEEK)
+
+        updated = calculator.calculate_weekly_popularity(SEASON, WEEK)
+
+        pop_api = PopularityAPI(db)
+        assert updated == len(reference)
+        for expected in reference:
+            saved = pop_api.get_popularity_score(DYNASTY, expected["player_id"], SEASON, WEEK)
+            assert {key: getattr(saved, key) for key in expected} == expected
+
+    def test_invalid_score_saves_nothing(self, db):
+        scores = PopularityEngine(PopularityCalculator(db, DYNASTY)).calculate(SEASON, WEEK)
+        scores[-1]["market_multiplier"] = 2.5
+
+        with pytest.raises(ValueError):
+            PopularityAPI(db).save_popularity_scores(scores)
+
+        assert db.query_one(
+            "SELECT COUNT(*) FROM player_popularity WHERE week = ?", (WEEK,)
+        )[0] == 0
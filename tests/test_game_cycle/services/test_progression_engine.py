@@ -0,0 +1,252 @@
+"""
+Tests for ProgressionEngine - league-wide training camp development.
+
+Covers:
+- Same changes and overalls as AgeWeightedDevelopment.calculate_changes()
+  for identical rolls and magnitudes (every position, age phase, curve,
+  diminishing returns, potential ceiling and rating floor)
+- Seeded, reproducible results
+- TrainingCampService persisting the batch in one pass
+"""
+
+import json
+import os
+import random
+import sqlite3
+import tempfile
+
+import numpy as np
+import pytest
+
+from src.game_cycle.services.progression_engine import ProgressionEngine
+from src.game_cycle.services.training_camp_service import (
+    AgeWeightedDevelopment,
+    TrainingCampService,
+)
+
+
+DYNASTY = "progression_test"
+SEASON = 2025
+ARCHETYPES = [None, "power_back_rb", "pocket_passer_qb", "developmental_qb", "deep_threat_wr",
+              "athletic_c", "nonexistent_archetype"]
+
+SCHEMA = """
+    CREATE TABLE dynasties (
+        dynasty_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        team_id INTEGER NOT NULL
+    );
+    CREATE TABLE players (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        dynasty_id TEXT NOT NULL,
+        player_id INTEGER NOT NULL,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        number INTEGER NOT NULL DEFAULT 1,
+        team_id INTEGER NOT NULL,
+        positions TEXT NOT NULL,
+        attributes TEXT NOT NULL,
+        birthdate TEXT,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(dynasty_id, player_id)
+    );
+    CREATE TABLE player_progression_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        dynasty_id TEXT NOT NULL,
+        player_id INTEGER NOT NULL,
+        season INTEGER NOT NULL,
+        age INTEGER NOT NULL,
+        position TEXT,
+        team_id INTEGER,
+        age_category TEXT,
+        overall_before INTEGER NOT NULL,
+        overall_after INTEGER NOT NULL,
+        overall_change INTEGER NOT NULL,
+        attribute_changes TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(dynasty_id, player_id, season)
+    );
+"""
+
+
+def _player_rows(count=400):
+    """Players at every position and age, with edge-case attribute values."""
+    rng = random.Random(9)
+    positions = list(AgeWeightedDevelopment.POSITION_ATTRIBUTES) + ["Wide Receiver", "unknown"]
+    rows = []
+    for player_id in range(1, count + 1):
+        position = positions[player_id % len(positions)]
+        attrs = {
+            attr: rng.choice([41, 55, 70, 84, 89, 90, 95, 99, 72.6])
+            for attr in AgeWeightedDevelopment.POSITION_ATTRIBUTES.get(position, ["awareness"])
+            if rng.random() < 0.9
+        }
+        attrs["overall"] = rng.randint(50, 95)
+        if rng.random() < 0.6:
+            attrs["potential"] = rng.randint(60, 99)
+        archetype_id = rng.choice(ARCHETYPES)
+        if archetype_id:
+            attrs["archetype_id"] = archetype_id
+        rows.append({
+            "player_id": player_id, "first_name": "Player", "last_name": str(player_id),
+            "team_id": player_id % 33, "positions": json.dumps([position]),
+            "attributes": json.dumps(attrs), "birthdate": f"{SEASON - rng.randint(21, 39)}-04-01",
+        })
+    return rows
+
+
+@pytest.fixture
+def db_path():
+    """Players table with 400 players."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.execute("INSERT INTO dynasties VALUES (?, 'Progression', 1)", (DYNASTY,))
+    conn.executemany(
+        "INSERT INTO players (dynasty_id, player_id, first_name, last_name, team_id, positions, "
+        "attributes, birthdate) VALUES (?, :player_id, :first_name, :last_name, :team_id, "
+        ":positions, :attributes, :birthdate)".replace("?", f"'{DYNASTY}'"),
+        _player_rows()
+    )
+    conn.commit()
+    conn.close()
+
+    yield path
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@pytest.fixture
+def service(db_path, monkeypatch):
+    service = TrainingCampService(db_path, DYNASTY, SEASON)
+    monkeypatch.setattr(service, "_regenerate_all_depth_charts", lambda: {})
+    return service
+
+
+class FixedRng:
+    """Same roll for every cell; magnitudes at the low or high end of each range."""
+
+    def __init__(self, roll, high):
+        self.roll = roll
+        self.high = high
+
+    def random(self, size):
+        return np.full(size, self.roll)
+
+    def integers(self, low, high):
+        return high - 1 if self.high else low
+
+
+class TestMatchesAlgorithm:
+    """The engine applies AgeWeightedDevelopment's rules."""
+
+    @pytest.mark.parametrize("high", [True, False])
+    @pytest.mark.parametrize("roll", [0.0, 0.08, 0.27, 0.45, 0.62, 0.75, 0.88, 0.97])
+    def test_same_changes_for_same_draws(self, service, monkeypatch, roll, high):
+        prepared = [service._prepare_player(row) for row in _player_rows()]
+        algorithm = service._algorithm
+
+        engine = ProgressionEngine(algorithm)
+        engine._rng = FixedRng(roll, high)
+        progressions = engine.run(prepared)
+
+        monkeypatch.setattr(random, "random", lambda: roll)
+        monkeypatch.setattr(random, "randint", lambda a, b: b if high else a)
+        for player, progression in zip(prepared, progressions):
+            changes = algorithm.calculate_changes(
+                player["age"], player["position"], player["attributes"],
+                potential=player["potential"], archetype_id=player["archetype_id"]
+            )
+            assert progression.changes == changes
+            assert list(progression.changes) == list(changes)
+            assert progression.new_overall == service._recalculate_overall(
+                player["attributes"], changes, player["position"]
+            )
+
+    def test_changes_cover_every_case(self, service):
+        prepared = [service._prepare_player(row) for row in _player_rows()]
+
+        progressions = ProgressionEngine(service._algorithm, seed=1).run(prepared)
+
+        changes = [c for p in progressions for c in p.changes.values()]
+        assert min(changes) < -1 and max(changes) > 1
+        assert {p["age_category"].value for p in prepared} == {"young", "prime", "veteran"}
+
+    def test_no_players(self, service):
+        assert ProgressionEngine(service._algorithm, seed=1).run([]) == []
+
+
+class TestSeeding:
+    """Results are reproducible."""
+
+    def test_same_seed_same_results(self, service):
+        prepared = [service._prepare_player(row) for row in _player_rows()]
+
+        first = ProgressionEngine(service._algorithm, seed=7).run(prepared)
+        second = ProgressionEngine(service._algorithm, seed=7).run(prepared)
+        other = ProgressionEngine(service._algorithm, seed=8).run(prepared)
+
+        assert first == second
+        assert first != other
+
+    def test_service_follows_random_seed(self, db_path, tmp_path, monkeypatch):
+        reference_path = str(tmp_path / "reference.db")
+        source, copy = sqlite3.connect(db_path), sqlite3.connect(reference_path)
+        source.backup(copy)
+        source.close()
+        copy.close()
+
+        outcomes = []
+        for path in (db_path, reference_path):
+            service = TrainingCampService(path, DYNASTY, SEASON)
+            monkeypatch.setattr(service, "_regenerate_all_depth_charts", lambda: {})
+            random.seed(21)
+            outcomes.append([
+                (r.player_id, r.new_overall, r.attribute_changes)
+                for r in service.process_all_players()["results"]
+            ])
+
+        assert outcomes[0] == outcomes[1]
+
+
+class TestPersistence:
+    """TrainingCampService writes the batch back."""
+
+    def test_attributes_persisted(self, service, db_path):
+        before = {row["player_id"]: json.loads(row["attributes"]) for row in _player_rows()}
+
+        results = service.process_all_players()["results"]
+
+        conn = sqlite3.connect(db_path)
+        after = {pid: json.loads(attrs) for pid, attrs in conn.execute(
+            "SELECT player_id, attributes FROM players"
+        )}
+        history = conn.execute("SELECT COUNT(*) FROM player_progression_history").fetchone()[0]
+        conn.close()
+
+        changed = [r for r in results if r.attribute_changes or r.overall_change]
+        assert len(changed) > 100
+        assert history == len(changed)
+        for result in results:
+            expected = dict(before[result.player_id])
+            if result in changed:
+                expected.update({c.attribute_name: c.new_value for c in result.attribute_changes})
+                expected["overall"] = result.new_overall
+            assert after[result.player_id] == expected
+
+    def test_custom_algorithm_processed_per_player(self, db_path, monkeypatch):
+        class NoChange(AgeWeightedDevelopment):
+            def calculate_changes(self, *args, **kwargs):
+                return {}
+
+        service = TrainingCampService(db_path, DYNASTY, SEASON, algorithm=NoChange())
+        monkeypatch.setattr(service, "_regenerate_all_depth_charts", lambda: {})
+
+        results = service.process_all_players()["results"]
+
+        assert all(not r.attribute_changes for r in results)
@@ -432,6 +432,60 @@ class TestRetirementContext:
         assert 600 in context.career_ending_injury_ids
 
 
+# ============================================
+# Repeat Retirement Tests (2)
+# ============================================
+
+class TestRepeatRetirement:
+
+    def _retire(self, db_path, dynasty_id, season, player_id):
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            INSERT INTO players
+            (dynasty_id, player_id, first_name, last_name, team_id, positions, attributes)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (dynasty_id, player_id, 'Retired', 'Vet', 0, '["QB"]', '{"overall": 60}'))
+        conn.execute("""
+            INSERT INTO retired_players
+            (dynasty_id, player_id, retirement_season, retirement_reason,
+             final_team_id, years_played, age_at_retirement)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (dynasty_id, player_id, season - 1, 'age_decline', 1, 15, 38))
+        conn.commit()
+        conn.close()
+
+    def test_retired_players_not_evaluated_again(self, temp_db, dynasty_id, season):
+        """Retired players (team_id 0) are not listed as free agents next season."""
+        self._retire(temp_db, dynasty_id, season, 700)
+        roster_api = MagicMock()
+        roster_api.get_full_roster.return_value = []
+        roster_api.get_free_agents.return_value = [{'player_id': 700}, {'player_id': 701}]
+
+        service = RetirementService(temp_db, dynasty_id, season)
+        with patch('src.database.player_roster_api.PlayerRosterAPI', return_value=roster_api), \
+                patch('src.database.connection.DatabaseConnection'):
+            player_ids = [p['player_id'] for p in service._get_all_active_players()]
+
+        assert player_ids == [701]
+
+    def test_failed_insert_releases_database(self, temp_db, dynasty_id, season, mock_career_summary):
+        """A duplicate retirement fails without leaving the database locked."""
+        self._retire(temp_db, dynasty_id, season, 700)
+        service = RetirementService(temp_db, dynasty_id, season)
+        player = {'player_id': 700, 'first_name': 'Retired', 'last_name': 'Vet',
+                  'team_id': 0, 'positions': ['QB'], 'attributes': {'overall': 60}}
+
+        with patch.object(service._summary_generator, 'generate_career_summary',
+                          return_value=mock_career_summary):
+            with pytest.raises(sqlite3.IntegrityError):
+                service._process_single_retirement(player, RetirementReason.AGE_DECLINE)
+
+        conn = sqlite3.connect(temp_db, timeout=0.1)
+        conn.execute("UPDATE players SET team_id = 0 WHERE player_id = 700")
+        conn.commit()
+        conn.close()
+
+
 # ============================================
 # Notable Retirement Tests (4)
 # ============================================
@@ -0,0 +1,180 @@
+"""
+Tests for ScheduleSolver - constraint propagation schedule solving.
+
+Covers:
+- Bye weeks: one per team, even counts per week, week and division limits
+- Week assignment: every team plays once in each non-bye week
+- Same seed, same schedule; the global random module is never touched
+- NFLScheduleGenerator producing valid 272-game seasons in bounded time
+"""
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+
+import pytest
+
+from src.game_cycle.database.bye_week_api import ByeWeekAPI
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.services.nfl_schedule_generator import NFLScheduleGenerator
+from src.game_cycle.services.schedule_solver import ScheduleSolver, ScheduleSolverError
+
+
+DYNASTY = "solver_test"
+DIVISIONS = {d: list(range(4 * d - 3, 4 * d + 1)) for d in range(1, 9)}
+
+
+@pytest.fixture
+def db_path():
+    """Database with all 32 teams and a dynasty."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO teams (team_id, name, abbreviation, conference, division) VALUES (?, ?, ?, ?, 'East')",
+        [(t, f"Team {t}", f"T{t}", "AFC" if t <= 16 else "NFC") for t in range(1, 33)]
+    )
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Solver', 1)",
+        (DYNASTY,)
+    )
+    conn.commit()
+    db.close()
+
+    yield path
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@pytest.fixture
+def generator(db_path):
+    gen = NFLScheduleGenerator(db_path=db_path, dynasty_id=DYNASTY)
+    yield gen
+    gen.close()
+
+
+def _season_matchups(generator, season):
+    """The season's 272 balanced matchups, as the generator builds them."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.home_counts = {t: 0 for t in range(1, 33)}
+        generator.away_counts = {t: 0 for t in range(1, 33)}
+        matchups = (
+            generator._assign_division_games()
+            + generator._assign_conference_rotation(season)
+            + generator._assign_cross_conference_rotation(season)
+            + generator._assign_same_place_finishers(season)
+            + generator._assign_17th_game(season)
+        )
+        return [(m.home_team_id, m.away_team_id) for m in generator._balance_home_away(matchups)]
+
+
+def _assert_valid(games, weeks, byes, total_weeks=18):
+    slots = Counter()
+    for (home, away), week in zip(games, weeks):
+        assert 1 <= week <= total_weeks
+        assert byes[home] != week and byes[away] != week
+        slots[(home, week)] += 1
+        slots[(away, week)] += 1
+    for team_id, bye in byes.items():
+        for week in range(1, total_weeks + 1):
+            assert slots[(team_id, week)] == (0 if week == bye else 1)
+
+
+class TestByeWeeks:
+    """Bye week assignment constraints."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_constraints(self, seed):
+        byes = ScheduleSolver(seed=seed).assign_byes(DIVISIONS, 5, 14)
+
+        assert set(byes) == set(range(1, 33))
+        assert all(5 <= week <= 14 for week in byes.values())
+        week_counts = Counter(byes.values())
+        assert all(count in (2, 4) for count in week_counts.values())
+        for teams in DIVISIONS.values():
+            assert max(Counter(byes[t] for t in teams).values()) <= 2
+
+    def test_impossible_window(self):
+        with pytest.raises(ScheduleSolverError):
+            ScheduleSolver(seed=1).assign_byes(DIVISIONS, 5, 10)
+
+
+class TestWeekAssignment:
+    """Week assignment over real season matchups."""
+
+    @pytest.mark.parametrize("season", [2026, 2027, 2028, 2029])
+    def test_valid_schedule(self, generator, season):
+        games = _season_matchups(generator, season)
+        solver = ScheduleSolver(seed=season)
+
+        byes = solver.assign_byes(DIVISIONS, 5, 14)
+        weeks = solver.assign_weeks(games, byes, total_weeks=18)
+
+        assert len(games) == 272
+        _assert_valid(games, weeks, byes)
+
+    def test_deterministic_and_private(self, generator):
+        games = _season_matchups(generator, 2030)
+        random.seed(99)
+        state = random.getstate()
+
+        first = ScheduleSolver(seed="a:2030")
+        first_byes = first.assign_byes(DIVISIONS, 5, 14)
+        first_weeks = first.assign_weeks(games, first_byes, 18)
+        second = ScheduleSolver(seed="a:2030")
+        second_byes = second.assign_byes(DIVISIONS, 5, 14)
+
+        assert second_byes == first_byes
+        assert second.assign_weeks(games, second_byes, 18) == first_weeks
+        assert random.getstate() == state
+
+    def test_game_count_mismatch(self):
+        with pytest.raises(ScheduleSolverError):
+            ScheduleSolver(seed=1).assign_weeks([(1, 2), (1, 2)], {1: 2, 2: 2}, total_weeks=4)
+
+    def test_small_round_robin(self):
+        # 4 teams, double round robin over 6 weeks, no byes
+        games = [(a, b) for a in range(1, 5) for b in range(1, 5) if a != b]
+        weeks = ScheduleSolver(seed=3).assign_weeks(games, {}, total_weeks=6)
+
+        _assert_valid(games, weeks, {t: 0 for t in range(1, 5)}, total_weeks=6)
+
+
+class TestGenerator:
+    """NFLScheduleGenerator uses the solver."""
+
+    def test_consecutive_seasons(self, generator, db_path):
+        for season in (2026, 2027, 2028):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                events = generator.generate_schedule(season)
+            elapsed = time.perf_counter() - start
+
+            byes = ByeWeekAPI(GameCycleDatabase(db_path)).get_all_bye_weeks(DYNASTY, season)
+            games = [(e["data"]["parameters"]["home_team_id"], e["data"]["parameters"]["away_team_id"]) for e in events]
+            weeks = [e["data"]["parameters"]["week"] for e in events]
+            assert len(events) == 272
+            _assert_valid(games, weeks, byes)
+            assert elapsed < 5.0
+
+    def test_same_schedule_for_same_dynasty_season(self, generator, db_path):
+        with contextlib.redirect_stdout(io.StringIO()):
+            first = generator.generate_schedule(2031)
+            other = NFLScheduleGenerator(db_path=db_path, dynasty_id=DYNASTY)
+            second = other.generate_schedule(2031)
+            other.close()
+
+        def key(events):
+            return [(e["data"]["parameters"]["week"], e["data"]["parameters"]["home_team_id"],
+                     e["data"]["parameters"]["away_team_id"]) for e in events]
+
+        assert key(first) == key(second)
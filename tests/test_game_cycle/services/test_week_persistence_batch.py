@@ -0,0 +1,240 @@
+"""
+Tests for WeekPersistenceBatch - one write transaction per simulated week.
+
+Covers:
+- Rows for every table written by a single flush
+- Player stat dedup and skipped entries
+- Event result updates
+- Deferred standings updates joining the transaction
+- Rollback when a deferred write fails
+- Optional tables failing without losing the rest of the week
+- A bad row dropping only itself, not the rest of its table
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+from src.game_cycle.database.connection import GameCycleDatabase
+from src.game_cycle.database.standings_api import StandingsAPI
+from src.game_cycle.models.injury_models import BodyPart, Injury, InjurySeverity, InjuryType
+from src.game_cycle.services.week_persistence_batch import WeekPersistenceBatch
+
+
+DYNASTY = "batch_test"
+
+
+@pytest.fixture
+def gc_db():
+    """GameCycleDatabase with one dynasty and a GAME event."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.execute("""
+        INSERT INTO teams (team_id, name, abbreviation, conference, division)
+        VALUES (1, 'Buffalo Bills', 'BUF', 'AFC', 'East'), (2, 'Miami Dolphins', 'MIA', 'AFC', 'East')
+    """)
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Batch Test', 1)",
+        (DYNASTY,)
+    )
+    conn.execute(
+        "INSERT INTO events (event_id, event_type, timestamp, game_id, dynasty_id, data) "
+        "VALUES ('ev1', 'GAME', 0, 'g1', ?, ?)",
+        (DYNASTY, json.dumps({'parameters': {'week': 1}}))
+    )
+    conn.commit()
+
+    yield db
+
+    db.close()
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _count(db, table):
+    """Count committed rows through a separate connection."""
+    conn = sqlite3.connect(db.db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _game(game_id="g1", home_score=24, away_score=17):
+    return {
+        "game_id": game_id, "season": 2025, "week": 1,
+        "home_team_id": 1, "away_team_id": 2,
+        "home_score": home_score, "away_score": away_score,
+        "total_plays": 120, "game_duration_minutes": 180, "overtime_periods": 0,
+    }
+
+
+def _drives():
+    plays = [
+        SimpleNamespace(outcome="run", yards=6, time_elapsed=30, points=0),
+        SimpleNamespace(outcome="touchdown", yards=19, time_elapsed=12, points=6, is_scoring_play=True),
+    ]
+    return [SimpleNamespace(possessing_team_id=1, plays=plays, points_scored=6)]
+
+
+def _injury(player_id=101, team_id=1):
+    return Injury(
+        player_id=player_id,
+        player_name="Lead Back",
+        team_id=team_id,
+        injury_type=InjuryType.ANKLE_SPRAIN,
+        body_part=BodyPart.ANKLE,
+        severity=InjurySeverity.MINOR,
+        weeks_out=1,
+        week_occurred=1,
+        season=2025,
+        occurred_during='game'
+    )
+
+
+@pytest.fixture
+def batch(gc_db):
+    return WeekPersistenceBatch(gc_db, DYNASTY, 2025)
+
+
+class TestFlush:
+    """Every queued row is committed by one flush."""
+
+    def test_writes_all_tables(self, gc_db, batch):
+        batch.add_game_result(_game())
+        batch.add_player_stats("g1", [
+            {"player_id": 101, "team_id": 1, "player_name": "Lead Back", "rushing_yards": 88},
+            {"player_id": 201, "team_id": 2, "player_name": "Other Passer", "passing_yards": 230},
+        ])
+        batch.add_play_by_play("g1", _drives(), home_team_id=1, away_team_id=2)
+        batch.add_box_scores("g1", 1, 2, {"total_yards": 350}, {"total_yards": 290})
+        batch.add_injuries([_injury()])
+
+        counts = batch.flush()
+
+        assert counts["games"] == 1
+        assert _count(gc_db, "games") == 1
+        assert _count(gc_db, "player_game_stats") == 2
+        assert _count(gc_db, "game_drives") == 1
+        assert _count(gc_db, "game_plays") == 2
+        assert _count(gc_db, "box_scores") == 2
+        assert _count(gc_db, "player_injuries") == 1
+
+    def test_batch_emptied_after_flush(self, gc_db, batch):
+        batch.add_game_result(_game())
+        batch.flush()
+
+        assert batch.flush()["games"] == 0
+
+    def test_play_scores_tracked(self, gc_db, batch):
+        batch.add_game_result(_game())
+        batch.add_play_by_play("g1", _drives(), home_team_id=1, away_team_id=2)
+        batch.flush()
+
+        row = gc_db.query_one("SELECT home_score FROM game_plays WHERE play_number = 2")
+        assert row["home_score"] == 6
+
+    def test_event_result_updated(self, gc_db, batch):
+        batch.add_event_result("ev1", 24, 17)
+        batch.flush()
+
+        data = json.loads(gc_db.query_one("SELECT data FROM events WHERE event_id = 'ev1'")["data"])
+        assert data["results"] == {"home_score": 24, "away_score": 17, "completed": True}
+        assert data["parameters"] == {"week": 1}
+
+
+class TestPlayerStats:
+    """Player stat rows follow stats_insert_game_stats() rules."""
+
+    def test_duplicates_keep_last_entry(self, gc_db, batch):
+        batch.add_game_result(_game())
+        queued = batch.add_player_stats("g1", [
+            {"player_id": 101, "team_id": 1, "rushing_yards": 10},
+            {"player_id": 101, "team_id": 1, "rushing_yards": 88},
+        ])
+        batch.flush()
+
+        assert queued == 1
+        assert gc_db.query_one("SELECT rushing_yards FROM player_game_stats")["rushing_yards"] == 88
+
+    def test_entries_without_ids_skipped(self, batch):
+        assert batch.add_player_stats("g1", [{"player_name": "Nobody"}]) == 0
+
+
+class TestTransaction:
+    """The week is committed once, or not at all."""
+
+    def test_deferred_standings_join_transaction(self, gc_db, batch):
+        gc_db.executemany(
+            "INSERT INTO standings (dynasty_id, team_id, season) VALUES (?, ?, 2025)",
+            [(DYNASTY, 1), (DYNASTY, 2)]
+        )
+        batch.add_game_result(_game())
+        batch.defer(
+            StandingsAPI(gc_db).update_from_game,
+            dynasty_id=DYNASTY, season=2025, home_team_id=1, away_team_id=2,
+            home_score=24, away_score=17, is_divisional=True, is_conference=True
+        )
+
+        assert batch.flush()["deferred"] == 1
+        row = gc_db.query_one("SELECT wins, division_wins FROM standings WHERE team_id = 1")
+        assert (row["wins"], row["division_wins"]) == (1, 1)
+
+    def test_failed_deferred_write_rolls_back_week(self, gc_db, batch):
+        def fail():
+            gc_db.execute("UPDATE games SET home_score = 0")
+            raise RuntimeError("standings failed")
+
+        batch.add_game_result(_game())
+        batch.add_injuries([_injury()])
+        batch.defer(fail)
+
+        with pytest.raises(RuntimeError):
+            batch.flush()
+
+        assert _count(gc_db, "games") == 0
+        assert _count(gc_db, "player_injuries") == 0
+
+    def test_nothing_visible_before_commit(self, gc_db, batch):
+        seen = []
+        batch.add_game_result(_game())
+        batch.defer(lambda: seen.append(_count(gc_db, "games")))
+
+        batch.flush()
+
+        assert seen == [0]
+        assert _count(gc_db, "games") == 1
+
+    def test_optional_table_failure_keeps_week(self, gc_db, batch):
+        batch.add_game_result(_game())
+        # team_id is NOT NULL - the stats insert fails
+        batch.add_player_stats("g1", [{"player_id": 101, "team_id": None}])
+
+        counts = batch.flush()
+
+        assert counts["player_game_stats"] == 0
+        assert _count(gc_db, "games") == 1
+        assert _count(gc_db, "player_game_stats") == 0
+
+    def test_bad_row_keeps_rest_of_table(self, gc_db, batch):
+        batch.add_game_result(_game())
+        batch.add_game_result(_game("g2"))
+        batch.add_player_stats("g1", [
+            {"player_id": 101, "team_id": 1},
+            {"player_id": 102, "team_id": None},
+        ])
+        batch.add_player_stats("g2", [{"player_id": 201, "team_id": 2}])
+
+        counts = batch.flush()
+
+        assert counts["player_game_stats"] == 2
+        assert _count(gc_db, "player_game_stats") == 2
@@ -0,0 +1,319 @@
+"""
+Tests for the headless multi-season runner.
+
+Covers:
+- SQL statement / rows written counting across sqlite3 connections
+- Atomic checkpoint files
+- Auto-decision contexts and free agency completion
+- Running whole seasons with a timing line per stage
+- Failures keeping the checkpoint at the failed stage, and --resume
+- Week play phase profiles in the report (--profile-plays)
+- INSTANT score model calibration at Week 1 (--calibrate-instant)
+"""
+
+import json
+import os
+import sqlite3
+
+import pytest
+
+from game_cycle import Stage, StageType
+from game_cycle.stage_controller import StageResult
+import game_cycle.runner as runner_module
+from game_cycle.runner import (
+    AutoDecisions,
+    HeadlessRunner,
+    RunCheckpoint,
+    RunnerError,
+    SQLiteActivityMonitor,
+)
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class FakeController:
+    """StageController stand-in that walks the real stage sequence."""
+
+    start = Stage(StageType.OFFSEASON_ROSTER_CUTS, 2025)
+    fail_on = None  # StageType whose execution fails
+    instances = []
+
+    def __init__(self, db_path, dynasty_id, season=2025):
+        self.executed = []
+        self.previewed = []
+        self.contexts = []
+        self.mode = None
+        self.media_mode = None
+        self.closed = False
+        self._stage = Stage(self.start.stage_type, self.start.season_year)
+        FakeController.instances.append(self)
+
+    def set_simulation_mode(self, mode):
+        self.mode = mode
+
+    def set_media_mode(self, mode):
+        self.media_mode = mode
+
+    def is_initialized(self):
+        return True
+
+    @property
+    def current_stage(self):
+        return self._stage
+
+    def adopt_stage(self, stage):
+        self._stage = Stage(stage.stage_type, stage.season_year, stage.completed)
+
+    def get_stage_preview(self):
+        self.previewed.append(self._stage.stage_type)
+        return {}
+
+    def execute_current_stage(self, extra_context=None, auto_advance=True):
+        stage = self._stage
+        self.executed.append((stage.season_year, stage.stage_type))
+        self.contexts.append(extra_context)
+        if stage.stage_type == FakeController.fail_on:
+            return StageResult(
+                stage=stage, success=False, games_played=[], events_processed=[],
+                errors=["database is locked"], can_advance=False, next_stage=None
+            )
+        games = [{"game_id": "g"}] if stage.stage_type.name.startswith("REGULAR") else []
+        profiled = games and extra_context.get("profile_plays")
+        return StageResult(
+            stage=stage, success=True, games_played=games, events_processed=[],
+            errors=[], can_advance=True, next_stage=stage.next_stage(),
+            handler_data={"play_phase_profile": {"plays": 140}} if profiled else {}
+        )
+
+    def advance_to_next_stage(self):
+        next_stage = self._stage.next_stage()
+        season = self._stage.season_year
+        if self._stage.stage_type == StageType.OFFSEASON_WAIVER_WIRE:
+            season += 1
+        self._stage = Stage(next_stage.stage_type, season)
+        return self._stage
+
+    def drain_media_jobs(self, timeout=None):
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_controller(monkeypatch):
+    FakeController.start = Stage(StageType.OFFSEASON_ROSTER_CUTS, 2025)
+    FakeController.fail_on = None
+    FakeController.instances = []
+    monkeypatch.setattr(runner_module, "StageController", FakeController)
+    monkeypatch.setattr(HeadlessRunner, "_ensure_dynasty", lambda self, team_id, start_season: None)
+    monkeypatch.setattr(AutoDecisions, "prepare", lambda self, stage: {"stage": stage.stage_type.name})
+    return FakeController
+
+
+@pytest.fixture
+def paths(tmp_path):
+    report = str(tmp_path / "run.jsonl")
+    return {"report_path": report, "checkpoint_path": report + ".checkpoint"}
+
+
+def _report(paths):
+    with open(paths["report_path"]) as f:
+        return [json.loads(line) for line in f]
+
+
+# ============================================================================
+# MEASUREMENTS
+# ============================================================================
+
+class TestSQLiteActivityMonitor:
+    """Statements and rows written on connections opened while installed."""
+
+    def test_counts_statements_and_rows(self, tmp_path):
+        monitor = SQLiteActivityMonitor()
+        monitor.install()
+        try:
+            conn = sqlite3.connect(str(tmp_path / "monitor.db"))
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(10)])
+            conn.execute("UPDATE t SET x = x + 1 WHERE x < 3")
+            conn.commit()
+            assert monitor.snapshot()["rows_written"] == 13
+
+            conn.close()
+            totals = monitor.snapshot()
+        finally:
+            monitor.uninstall()
+
+        assert totals["rows_written"] == 13
+        assert totals["statements"] >= 12  # CREATE, 10 INSERTs, UPDATE (+ transaction control)
+
+    def test_uninstall_restores_connect(self, tmp_path):
+        original = sqlite3.connect
+        monitor = SQLiteActivityMonitor()
+        monitor.install()
+        monitor.uninstall()
+
+        assert sqlite3.connect is original
+        conn = sqlite3.connect(str(tmp_path / "plain.db"))
+        conn.execute("SELECT 1")
+        conn.close()
+        assert monitor.snapshot()["statements"] == 0
+
+
+# ============================================================================
+# CHECKPOINTS AND DECISIONS
+# ============================================================================
+
+class TestRunCheckpoint:
+    """Checkpoint files round-trip and are replaced atomically."""
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "run.checkpoint")
+        checkpoint = RunCheckpoint(
+            db_path="game_cycle.db", dynasty_id="soak", mode="instant", final_season=2031,
+            season=2031, stage="REGULAR_WEEK_12", completed=True, stages_run=200, seed=3
+        )
+        checkpoint.save(path)
+
+        loaded = RunCheckpoint.load(path)
+        assert loaded == checkpoint
+        assert loaded.to_stage() == Stage(StageType.REGULAR_WEEK_12, 2031, completed=True)
+        assert not os.path.exists(path + ".tmp")
+        assert RunCheckpoint.load(str(tmp_path / "missing")) is None
+
+
+class TestAutoDecisions:
+    """Contexts the UI would have built for the user team."""
+
+    def test_stage_contexts(self):
+        decisions = AutoDecisions("unused.db", "soak")
+        assert decisions.prepare(Stage(StageType.OFFSEASON_DRAFT, 2025)) == {"auto_complete": True}
+        assert decisions.prepare(Stage(StageType.OFFSEASON_FREE_AGENCY, 2025)) == {
+            "wave_control": {"advance_wave": True}
+        }
+        assert decisions.prepare(Stage(StageType.REGULAR_WEEK_3, 2025)) == {}
+
+    def test_free_agency_finishes_after_wave_three(self):
+        def fa_result(wave, complete):
+            return StageResult(
+                stage=Stage(StageType.OFFSEASON_FREE_AGENCY, 2025), success=True, games_played=[],
+                events_processed=[], errors=[], can_advance=False, next_stage=None,
+                handler_data={"wave_state": {"wave": wave, "wave_complete": complete}}
+            )
+
+        assert not AutoDecisions.is_finished(fa_result(2, True))
+        assert not AutoDecisions.is_finished(fa_result(3, False))
+        assert AutoDecisions.is_finished(fa_result(3, True))
+
+
+# ============================================================================
+# RUNS
+# ============================================================================
+
+class TestHeadlessRunner:
+    """Whole seasons, timing report and resumable checkpoints."""
+
+    def test_runs_whole_seasons(self, fake_controller, paths):
+        timings = HeadlessRunner("soak.db", "soak", mode="full", **paths).run(seasons=2)
+
+        controller = fake_controller.instances[0]
+        assert controller.mode == "full"
+        assert controller.closed
+        # Rest of the 2025 cycle, all of 2026, stopped at Week 1 of 2027
+        assert controller.executed[0] == (2025, StageType.OFFSEASON_ROSTER_CUTS)
+        assert controller.executed[-1] == (2026, StageType.OFFSEASON_WAIVER_WIRE)
+        assert controller.current_stage == Stage(StageType.REGULAR_WEEK_1, 2027)
+        assert controller.contexts[0] == {"stage": "OFFSEASON_ROSTER_CUTS"}
+        # Offseason stages are entered like the UI does (training camp schedules the next season)
+        assert StageType.OFFSEASON_TRAINING_CAMP in controller.previewed
+        assert StageType.REGULAR_WEEK_1 not in controller.previewed
+
+        lines = _report(paths)
+        assert len(lines) == len(timings) == len(controller.executed)
+        assert lines[2]["stage"] == "REGULAR_WEEK_1"
+        assert lines[2]["games_played"] == 1
+        assert set(lines[0]) >= {"wall_time_s", "db_statements", "rows_written", "peak_rss_mb"}
+
+        checkpoint = RunCheckpoint.load(paths["checkpoint_path"])
+        assert (checkpoint.season, checkpoint.stage, checkpoint.completed) == (2027, "REGULAR_WEEK_1", False)
+        assert checkpoint.final_season == 2026
+
+    def test_profile_plays_reported_for_weeks(self, fake_controller, paths):
+        FakeController.start = Stage(StageType.REGULAR_WEEK_18, 2025)
+        HeadlessRunner("soak.db", "soak", mode="full", profile_plays=True, **paths).run(seasons=1)
+
+        controller = fake_controller.instances[0]
+        assert controller.contexts[0] == {"stage": "REGULAR_WEEK_18", "profile_plays": True}
+        lines = _report(paths)
+        assert lines[0]["play_phases"] == {"plays": 140}
+        assert lines[1]["stage"] == "WILD_CARD"
+        assert lines[1]["play_phases"] is None
+
+    def test_calibrate_instant_at_week_one(self, fake_controller, paths, monkeypatch):
+        import game_cycle.services.instant_score_model as score_model
+
+        calibrated = []
+        stored = {2025: None, 2026: "stored"}
+        monkeypatch.setattr(
+            score_model, "get_score_model_calibration",
+            lambda db_path, dynasty_id, season: stored[season]
+        )
+        monkeypatch.setattr(
+            score_model, "calibrate_score_model",
+            lambda db_path, dynasty_id, season, games, seed: calibrated.append((season, games))
+            or score_model.DEFAULT_PARAMETERS
+        )
+        FakeController.start = Stage(StageType.REGULAR_WEEK_1, 2025)
+
+        HeadlessRunner("soak.db", "soak", calibrate_instant=32, **paths).run(seasons=2)
+        HeadlessRunner("soak.db", "soak", mode="full", calibrate_instant=32, **paths).run(seasons=1)
+
+        # 2026 already has a stored calibration; FULL runs never calibrate
+        assert calibrated == [(2025, 32)]
+
+    def test_failure_keeps_checkpoint_and_resume_continues(self, fake_controller, paths):
+        FakeController.start = Stage(StageType.REGULAR_WEEK_11, 2025)
+        FakeController.fail_on = StageType.REGULAR_WEEK_12
+
+        with pytest.raises(RunnerError, match="Week 12"):
+            HeadlessRunner("soak.db", "soak", seed=5, **paths).run(seasons=1)
+
+        checkpoint = RunCheckpoint.load(paths["checkpoint_path"])
+        assert (checkpoint.stage, checkpoint.completed) == ("REGULAR_WEEK_12", False)
+        assert checkpoint.seed == 5
+
+        # The fresh controller would start elsewhere; the checkpoint's stage wins
+        FakeController.fail_on = None
+        FakeController.start = Stage(StageType.REGULAR_WEEK_1, 2025)
+        HeadlessRunner("soak.db", "soak", **paths).run(resume=True)
+
+        resumed = fake_controller.instances[-1]
+        assert resumed.executed[0] == (2025, StageType.REGULAR_WEEK_12)
+        assert resumed.current_stage == Stage(StageType.REGULAR_WEEK_1, 2026)
+        assert [line["stage"] for line in _report(paths)][:2] == ["REGULAR_WEEK_11", "REGULAR_WEEK_12"]
+
+    def test_resume_skips_completed_stage(self, fake_controller, paths):
+        RunCheckpoint(
+            db_path="soak.db", dynasty_id="soak", mode="instant", final_season=2025,
+            season=2025, stage="OFFSEASON_ROSTER_CUTS", completed=True
+        ).save(paths["checkpoint_path"])
+
+        HeadlessRunner("soak.db", "soak", **paths).run(resume=True)
+
+        controller = fake_controller.instances[0]
+        assert controller.executed == [(2025, StageType.OFFSEASON_WAIVER_WIRE)]
+        assert _report(paths)[0]["executions"] == 0
+
+    def test_resume_requires_matching_checkpoint(self, fake_controller, paths):
+        with pytest.raises(RunnerError, match="No checkpoint"):
+            HeadlessRunner("soak.db", "soak", **paths).run(resume=True)
+
+        RunCheckpoint(
+            db_path="soak.db", dynasty_id="other", mode="instant", final_season=2025,
+            season=2025, stage="OFFSEASON_ROSTER_CUTS", completed=False
+        ).save(paths["checkpoint_path"])
+        with pytest.raises(RunnerError, match="other"):
+            HeadlessRunner("soak.db", "soak", **paths).run(resume=True)
@@ -0,0 +1,333 @@
+"""
+Tests for LeagueAssetIndex
+
+Covers:
+- Loading rostered players under contract in one query (cap hit, years
+  remaining, trade value)
+- Position/overall range lookups and filters, trade value ranges
+- Incremental updates (move, apply_trade, add/remove, refresh)
+- Staleness detection for changes made outside the index
+- TradeProposalGenerator finding the same targets as the roster scan
+- TransactionAIManager trade window lifecycle
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from src.game_cycle.database.connection import GameCycleDatabase
+from transactions.league_asset_index import LeagueAsset, LeagueAssetIndex
+from transactions.trade_proposal_generator import TradeProposalGenerator
+from transactions.trade_value_calculator import TradeValueCalculator
+from transactions.transaction_ai_manager import TransactionAIManager
+
+
+DYNASTY = "asset_index_test"
+SEASON = 2025
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def _add_player(
+    conn,
+    player_id,
+    team_id,
+    position,
+    overall,
+    end_year=SEASON + 1,
+    cap_hit=None,
+    depth=None,
+    contract=True,
+    birthdate="1998-01-01"
+):
+    """Insert a rostered player, optionally with an active contract."""
+    conn.execute(
+        """
+        INSERT INTO players (dynasty_id, player_id, first_name, last_name, number, team_id,
+                             positions, attributes, birthdate)
+        VALUES (?, ?, 'Player', ?, ?, ?, ?, ?, ?)
+        """,
+        (DYNASTY, player_id, str(player_id), player_id % 100, team_id,
+         json.dumps([position]), json.dumps({"overall": overall}), birthdate)
+    )
+    conn.execute(
+        "INSERT INTO team_rosters (dynasty_id, team_id, player_id, depth_chart_order) VALUES (?, ?, ?, ?)",
+        (DYNASTY, team_id, player_id, depth if depth is not None else player_id)
+    )
+    if contract:
+        cursor = conn.execute(
+            """
+            INSERT INTO player_contracts (player_id, team_id, dynasty_id, start_year, end_year,
+                                          contract_years, contract_type, total_value, signed_date)
+            VALUES (?, ?, ?, ?, ?, ?, 'VETERAN', ?, '2024-03-15')
+            """,
+            (player_id, team_id, DYNASTY, SEASON - 1, end_year, end_year - SEASON + 2,
+             4_000_000 * (end_year - SEASON + 2))
+        )
+        if cap_hit is not None:
+            conn.execute(
+                """
+                INSERT INTO contract_year_details (contract_id, contract_year, season_year,
+                                                   base_salary, total_cap_hit, cash_paid)
+                VALUES (?, 2, ?, ?, ?, ?)
+                """,
+                (cursor.lastrowid, SEASON, cap_hit, cap_hit, cap_hit)
+            )
+
+
+@pytest.fixture
+def db_path():
+    """Game cycle database with three teams of players."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    db = GameCycleDatabase(path)
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO teams (team_id, name, abbreviation, conference, division) VALUES (?, ?, ?, 'AFC', 'East')",
+        [(1, 'Team One', 'ONE'), (2, 'Team Two', 'TWO'), (3, 'Team Three', 'THR')]
+    )
+    conn.execute(
+        "INSERT INTO dynasties (dynasty_id, dynasty_name, team_id) VALUES (?, 'Index', 1)",
+        (DYNASTY,)
+    )
+
+    _add_player(conn, 101, 1, "wide_receiver", 88, cap_hit=12_000_000, depth=1)
+    _add_player(conn, 102, 1, "wide_receiver", 72, depth=2)
+    _add_player(conn, 103, 1, "cornerback", 80, end_year=SEASON, depth=1)
+    _add_player(conn, 201, 2, "wide_receiver", 84, cap_hit=6_000_000, depth=1, birthdate="1990-01-01")
+    _add_player(conn, 202, 2, "wide_receiver", 84, cap_hit=3_000_000, depth=2)
+    _add_player(conn, 203, 2, "quarterback", 91, end_year=SEASON + 3, depth=1)
+    _add_player(conn, 301, 3, "wide_receiver", 78, depth=1)
+    _add_player(conn, 302, 3, "cornerback", 86, depth=1)
+    _add_player(conn, 303, 3, "cornerback", 65, depth=2, contract=False)  # Unsigned
+    conn.commit()
+    db.close()
+
+    yield path
+
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@pytest.fixture
+def calculator():
+    """Trade value calculator without database lookups."""
+    return TradeValueCalculator(current_year=SEASON, dynasty_id=DYNASTY)
+
+
+@pytest.fixture
+def index(db_path, calculator):
+    """Index loaded from the test database."""
+    return LeagueAssetIndex.load(db_path, DYNASTY, SEASON, calculator)
+
+
+def _ids(assets):
+    return [asset.player_id for asset in assets]
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+class TestLoad:
+    """One query builds an asset per rostered player under contract."""
+
+    def test_only_players_under_contract(self, index):
+        assert len(index) == 8
+        assert 303 not in index
+        assert sorted(index.positions()) == ["cornerback", "quarterback", "wide_receiver"]
+
+    def test_contract_fields(self, index):
+        star = index.get(101)
+        assert star.team_id == 1
+        assert star.position == "wide_receiver"
+        assert star.overall == 88
+        assert star.cap_hit == 12_000_000  # contract_year_details
+        assert star.years_remaining == 2  # This season and next
+        assert star.contract["aav"] == 4_000_000
+
+        expiring = index.get(103)
+        assert expiring.years_remaining == 1
+        assert expiring.cap_hit == 4_000_000  # No year details: AAV
+
+    def test_player_dict_matches_roster_format(self, index):
+        player = index.get(201).player
+        assert player["positions"] == ["wide_receiver"]
+        assert player["attributes"]["overall"] == 84
+        assert player["team_id"] == 2
+        assert player["depth_chart_order"] == 1
+
+    def test_trade_value_from_calculator(self, index, calculator):
+        asset = index.get(203)
+        expected = calculator.calculate_player_value(
+            overall_rating=91,
+            position="quarterback",
+            age=asset.age,
+            contract_years_remaining=4,
+            annual_cap_hit=asset.contract["aav"]
+        )
+        assert asset.trade_value == expected > 0
+
+
+# ============================================================================
+# LOOKUPS
+# ============================================================================
+
+class TestLookups:
+    """Range lookups replace roster scans."""
+
+    def test_find_by_position_and_overall(self, index):
+        assert _ids(index.find(["wide_receiver"], min_overall=80)) == [101, 202, 201]
+        assert _ids(index.find(["wide_receiver"], min_overall=75, max_overall=84)) == [202, 201, 301]
+        assert index.find(["tight_end"], min_overall=0) == []
+
+    def test_find_filters(self, index):
+        assert _ids(index.find(["wide_receiver"], min_overall=80, exclude_team_id=1)) == [202, 201]
+        assert _ids(index.find(["wide_receiver"], min_overall=80, max_cap_hit=6_000_000)) == [202, 201]
+        assert _ids(index.find(["wide_receiver"], min_overall=80, max_age=30)) == [101, 202]
+        assert _ids(index.find(["cornerback"], min_years_remaining=2)) == [302]
+
+    def test_find_multiple_positions(self, index):
+        assert _ids(index.find(["cornerback", "wide_receiver"], min_overall=84)) == [101, 302, 202, 201]
+
+    def test_by_value(self, index):
+        values = [asset.trade_value for asset in index.by_value()]
+        assert values == sorted(values, reverse=True)
+        assert len(values) == 8
+
+        top = index.by_value(min_value=values[1])
+        assert len(top) == 2
+        assert all(asset.team_id != 2 for asset in index.by_value(exclude_team_id=2))
+
+    def test_team_assets(self, index):
+        assert _ids(index.team_assets(2)) == [203, 201, 202]
+        assert index.team_assets(9) == []
+
+
+# ============================================================================
+# INCREMENTAL UPDATES
+# ============================================================================
+
+class TestUpdates:
+    """Trades, signings and cuts update the index in place."""
+
+    def test_apply_trade(self, index):
+        index.apply_trade(1, [101], 2, [202, 203])
+
+        assert _ids(index.team_assets(1)) == [203, 202, 103, 102]
+        assert _ids(index.team_assets(2)) == [101, 201]
+        assert index.get(101).player["team_id"] == 2
+        assert index.get(101).contract["team_id"] == 2
+        assert _ids(index.find(["wide_receiver"], min_overall=80, exclude_team_id=2)) == [202]
+
+    def test_add_and_remove(self, index):
+        removed = index.remove(302)
+        assert removed.player_id == 302
+        assert index.remove(302) is None
+        assert _ids(index.find(["cornerback"])) == [103]
+        assert 302 not in _ids(index.by_value())
+
+        index.add(LeagueAsset(player_id=900, team_id=3, position="cornerback", overall=90, age=24))
+        assert _ids(index.find(["cornerback"], min_overall=85)) == [900]
+
+        # Re-adding replaces the old entry
+        index.add(LeagueAsset(player_id=900, team_id=3, position="safety", overall=70, age=24))
+        assert index.find(["cornerback"], min_overall=85) == []
+        assert len(index) == 8
+
+    def test_refresh_rereads_players(self, db_path, index):
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE players SET team_id = 3 WHERE player_id = 101")
+        conn.execute("UPDATE team_rosters SET team_id = 3 WHERE player_id = 101")
+        conn.execute("UPDATE player_contracts SET team_id = 3 WHERE player_id = 101")
+        conn.execute("UPDATE player_contracts SET is_active = 0 WHERE player_id = 102")  # Released
+        conn.commit()
+        conn.close()
+
+        assert index.is_stale()
+        index.refresh([101, 102])
+
+        assert index.get(101).team_id == 3
+        assert 102 not in index
+        assert not index.is_stale()
+
+    def test_refresh_requires_loader(self):
+        with pytest.raises(RuntimeError):
+            LeagueAssetIndex().refresh([1])
+
+    def test_stale_after_signing(self, db_path, index):
+        assert not index.is_stale()
+
+        conn = sqlite3.connect(db_path)
+        _add_player(conn, 304, 3, "safety", 74)
+        conn.commit()
+        conn.close()
+
+        assert index.is_stale()
+        assert not LeagueAssetIndex().is_stale()  # Not loaded: never stale
+
+    def test_stale_after_out_of_band_trade(self, db_path, index):
+        # Two players swap teams without any count or contract ID changing
+        conn = sqlite3.connect(db_path)
+        for player_id, team_id in ((101, 3), (301, 1)):
+            conn.execute("UPDATE players SET team_id = ? WHERE player_id = ?", (team_id, player_id))
+            conn.execute(
+                "UPDATE player_contracts SET team_id = ? WHERE player_id = ?", (team_id, player_id)
+            )
+        conn.commit()
+        conn.close()
+
+        assert index.is_stale()
+
+
+# ============================================================================
+# INTEGRATION
+# ============================================================================
+
+class TestTradeWindow:
+    """Proposal generation uses the index for the open trade window."""
+
+    NEEDS = [
+        {'position': 'wide_receiver', 'urgency_score': 5},
+        {'position': 'cornerback', 'urgency_score': 4},
+    ]
+
+    def test_generator_targets_match_roster_scan(self, db_path, calculator, index):
+        generator = TradeProposalGenerator(db_path, DYNASTY, calculator)
+        generator.current_season = SEASON
+        scanned = generator._scan_league_for_targets(1, self.NEEDS, SEASON)
+
+        generator.asset_index = index
+        indexed = generator._scan_league_for_targets(1, self.NEEDS, SEASON)
+
+        assert [t['player']['player_id'] for t in indexed] == [t['player']['player_id'] for t in scanned]
+        assert [t['player']['player_id'] for t in indexed] == [201, 202, 302]
+        assert all(t['contract']['team_id'] == t['player']['team_id'] for t in indexed)
+
+    def test_window_lifecycle(self, db_path, calculator):
+        manager = TransactionAIManager(db_path, DYNASTY, calculator=calculator)
+
+        index = manager.begin_trade_window(SEASON)
+        assert manager.proposal_generator.asset_index is index
+        assert manager.begin_trade_window(SEASON) is index  # Reused while unchanged
+
+        conn = sqlite3.connect(db_path)
+        _add_player(conn, 304, 3, "safety", 74)
+        conn.commit()
+        conn.close()
+
+        rebuilt = manager.begin_trade_window(SEASON)
+        assert rebuilt is not index
+        assert 304 in rebuilt
+
+        manager.end_trade_window()
+        assert manager.asset_index is None
+        assert manager.proposal_generator.asset_index is None